@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+from typing import Any, Hashable, Optional, Sequence
+
+from backend.graph_utils import CompactGraph, bits
+
+
+class CanonicalForm:
+    """
+    Canonical form of a multigraph, found by individualization-refinement
+    search. CanonicalForm.key is equal for two graphs iff they are
+    isomorphic (respecting vertex labels and edge colors).
+    CanonicalForm.vertex_order and CanonicalForm.edge_order give the
+    canonical labeling: vertex_order[i] is the vertex at position i,
+    edge_order[i] is the edge at position i.
+    CanonicalForm.automorphisms are vertex permutations found during
+    the search (perm[v] is the image of v)
+    """
+    __slots__ = ("key", "vertex_order", "edge_order", "automorphisms")
+
+    def __init__(self, key: tuple, vertex_order: list[int],
+                 edge_order: list[int], automorphisms: list[list[int]]):
+        self.key = key
+        self.vertex_order = vertex_order
+        self.edge_order = edge_order
+        self.automorphisms = automorphisms
+
+
+def refine(colors: list[int], adjacency: list[list[tuple[int, Any]]]) -> list[int]:
+    """
+    Color refinement: split vertex classes by colors of neighbours until
+    the partition is equitable. New colors are ranks of sorted
+    signatures, so they do not depend on vertex numbering
+    :param colors: vertex colors
+    :param adjacency: adjacency[v] is a list of (neighbour, edge color)
+    :return: refined vertex colors, 0..k-1
+    """
+    num_colors = len(set(colors))
+    while True:
+        signatures = [
+            (colors[v], tuple(sorted((colors[w], c) for w, c in adjacency[v])))
+            for v in range(len(colors))
+        ]
+        ranks = {sig: i for i, sig in enumerate(sorted(set(signatures)))}
+        colors = [ranks[sig] for sig in signatures]
+        if len(ranks) == num_colors:
+            return colors
+        num_colors = len(ranks)
+
+
+def individualize(colors: list[int], v: int) -> list[int]:
+    """
+    Give vertex v a color of its own, just before the rest of its class
+    :param colors: vertex colors
+    :param v: vertex to individualize
+    :return: new vertex colors
+    """
+    return [
+        2 * c + (1 if c == colors[v] and u != v else 0)
+        for u, c in enumerate(colors)
+    ]
+
+
+def orbit(v: int, generators: list[list[int]]) -> set[int]:
+    """
+    Get orbit of vertex under a group
+    :param v: vertex
+    :param generators: group generators, as vertex permutations
+    :return: set of vertices in the orbit of v
+    """
+    res = {v}
+    stack = [v]
+    while stack:
+        u = stack.pop()
+        for perm in generators:
+            if perm[u] not in res:
+                res.add(perm[u])
+                stack.append(perm[u])
+    return res
+
+
+def canonical_form(n: int, edges: Sequence[tuple[int, int]],
+                   vertex_labels: Optional[Sequence[Hashable]] = None,
+                   edge_colors: Optional[Sequence[Hashable]] = None
+                   ) -> CanonicalForm:
+    """
+    Compute canonical form of a multigraph with loops. Search tree is
+    pruned with automorphisms found on the way
+    :param n: number of vertices
+    :param edges: edges as pairs of vertices
+    :param vertex_labels: sortable labels, which isomorphism must keep
+    (e.g. root flag). None for unlabeled vertices
+    :param edge_colors: sortable edge colors, which isomorphism must keep
+    (e.g. edge lengths). None for uncolored edges
+    :return: canonical form of graph
+    """
+    if vertex_labels is None:
+        vertex_labels = [0] * n
+    if edge_colors is None:
+        edge_colors = [0] * len(edges)
+    adjacency: list[list[tuple[int, Any]]] = [[] for _ in range(n)]
+    loops: list[list[Any]] = [[] for _ in range(n)]
+    for (u, v), c in zip(edges, edge_colors):
+        if u == v:
+            loops[u].append(c)
+        else:
+            adjacency[u].append((v, c))
+            adjacency[v].append((u, c))
+    labels = [
+        (vertex_labels[v], tuple(sorted(loops[v]))) for v in range(n)
+    ]
+    label_ranks = {label: i for i, label in enumerate(sorted(set(labels)))}
+
+    best: Optional[tuple] = None
+    best_position: list[int] = []
+    first: Optional[tuple] = None
+    first_position: list[int] = []
+    automorphisms: list[list[int]] = []
+
+    def leaf(colors: list[int]) -> None:
+        nonlocal best, best_position, first, first_position
+        # Colors are discrete here, color is the position of vertex
+        key = (
+            tuple(labels[v] for v in sorted(range(n), key=colors.__getitem__)),
+            tuple(sorted(
+                (min(colors[u], colors[v]), max(colors[u], colors[v]), c)
+                for (u, v), c in zip(edges, edge_colors)
+            )),
+        )
+        for other_key, other_position in ((first, first_position),
+                                          (best, best_position)):
+            if key == other_key:
+                # Vertex at same position in both leaves is its image
+                at = [0] * n
+                for v in range(n):
+                    at[other_position[v]] = v
+                automorphisms.append([at[colors[v]] for v in range(n)])
+                return
+        if first is None:
+            first, first_position = key, colors
+        if best is None or key < best:
+            best, best_position = key, colors
+
+    def search(colors: list[int], prefix: list[int]) -> None:
+        colors = refine(colors, adjacency)
+        cells: dict[int, list[int]] = {}
+        for v, c in enumerate(colors):
+            cells.setdefault(c, []).append(v)
+        cell = next(
+            (cells[c] for c in sorted(cells) if len(cells[c]) > 1), None
+        )
+        if cell is None:
+            leaf(colors)
+            return
+        tried: set[int] = set()
+        for v in cell:
+            if v in tried:
+                continue
+            search(individualize(colors, v), prefix + [v])
+            stabilizer = [
+                perm for perm in automorphisms
+                if all(perm[u] == u for u in prefix)
+            ]
+            tried |= orbit(v, stabilizer)
+
+    search([label_ranks[label] for label in labels], [])
+
+    vertex_order = sorted(range(n), key=best_position.__getitem__)
+    edge_order = sorted(
+        range(len(edges)),
+        key=lambda eid: (
+            min(best_position[edges[eid][0]], best_position[edges[eid][1]]),
+            max(best_position[edges[eid][0]], best_position[edges[eid][1]]),
+            edge_colors[eid],
+        ),
+    )
+    return CanonicalForm(best, vertex_order, edge_order, automorphisms)
+
+
+def graph_form(cg: CompactGraph, mask: Optional[int] = None,
+               root: Optional[int] = None,
+               vertex_labels: Optional[Sequence[Hashable]] = None,
+               edge_colors: Optional[Sequence[Hashable]] = None
+               ) -> CanonicalForm:
+    """
+    Compute canonical form of a CompactGraph or its subgraph. Only
+    vertices touched by subgraph edges are kept, and the root
+    :param cg: graph representation
+    :param mask: subgraph edge mask, whole graph if None
+    :param root: vertex, which is kept and marked, None for no root
+    :param vertex_labels: labels of cg vertices, see canonical_form
+    :param edge_colors: colors of cg edges, see canonical_form
+    :return: canonical form, vertex_order and edge_order are in
+    terms of cg vertices and edges
+    """
+    if mask is None:
+        mask = cg.full_mask
+    eids = list(bits(mask))
+    vertex_mask = 0 if root is None else 1 << root
+    for eid in eids:
+        vertex_mask |= (1 << cg.edges[eid].begin) | (1 << cg.edges[eid].end)
+    vertices = list(bits(vertex_mask))
+    index = {v: i for i, v in enumerate(vertices)}
+    form = canonical_form(
+        len(vertices),
+        [(index[cg.edges[eid].begin], index[cg.edges[eid].end]) for eid in eids],
+        [
+            (v == root, None if vertex_labels is None else vertex_labels[v])
+            for v in vertices
+        ],
+        None if edge_colors is None else [edge_colors[eid] for eid in eids],
+    )
+    return CanonicalForm(
+        form.key,
+        [vertices[v] for v in form.vertex_order],
+        [eids[eid] for eid in form.edge_order],
+        [
+            [vertices[perm[index[v]]] if v in index else v
+             for v in range(len(cg.vertices))]
+            for perm in form.automorphisms
+        ],
+    )
+
+
+def edge_automorphisms(cg: CompactGraph, root: Optional[int] = None,
+                       edge_colors: Optional[Sequence[Hashable]] = None
+                       ) -> list[list[int]]:
+    """
+    Find generators of a group of multigraph automorphisms, acting on
+    edges. Vertex automorphisms found by canonical form search are
+    extended to edges, and edges with the same ends and color are
+    permuted freely
+    :param cg: graph representation
+    :param root: vertex fixed by automorphisms, None for no root
+    :param edge_colors: colors of cg edges, kept by automorphisms
+    :return: edge permutations, perm[eid] is the image of edge eid
+    """
+    if edge_colors is None:
+        edge_colors = [0] * len(cg.edges)
+
+    def ends(eid: int, perm: Optional[list[int]] = None) -> tuple:
+        u, v = cg.edges[eid].begin, cg.edges[eid].end
+        if perm is not None:
+            u, v = perm[u], perm[v]
+        return min(u, v), max(u, v), edge_colors[eid]
+
+    classes: dict[tuple, list[int]] = {}
+    for eid in range(len(cg.edges)):
+        classes.setdefault(ends(eid), []).append(eid)
+
+    res = []
+    form = graph_form(cg, root=root, edge_colors=edge_colors)
+    for perm in form.automorphisms:
+        # i-th edge of a class goes to i-th edge of the image class
+        edge_perm = [0] * len(cg.edges)
+        for eids in classes.values():
+            for eid, image in zip(eids, classes[ends(eids[0], perm)]):
+                edge_perm[eid] = image
+        res.append(edge_perm)
+    for eids in classes.values():
+        if len(eids) < 2:
+            continue
+        # Transposition and cycle generate all permutations of a class
+        swap = list(range(len(cg.edges)))
+        swap[eids[0]], swap[eids[1]] = eids[1], eids[0]
+        cycle = list(range(len(cg.edges)))
+        for eid, image in zip(eids, eids[1:] + eids[:1]):
+            cycle[eid] = image
+        res.append(swap)
+        if len(eids) > 2:
+            res.append(cycle)
+    return res
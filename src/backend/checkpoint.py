@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from backend import config
+
+# Default directory for checkpoints of long computations
+CHECKPOINT_DIR = config.CACHE_DIR / "checkpoints"
+
+# Version of checkpoint files, checkpoints of other versions are ignored
+CHECKPOINT_VERSION = 1
+
+# Checkpoints not updated for this number of seconds are removed,
+# e.g. of builds cancelled by editing the graph
+CHECKPOINT_MAX_AGE = 7 * 24 * 60 * 60
+
+
+def fingerprint(job: Any) -> str:
+    """
+    Get stable identifier of a computation
+    :param job: description of computation with deterministic repr,
+    e.g. tuple of graph edges and edge lengths
+    :return: hex digest
+    """
+    return hashlib.sha256(
+        repr((CHECKPOINT_VERSION, job)).encode()
+    ).hexdigest()
+
+
+class Checkpoint:
+    """
+    Periodically saved state of a long computation. Computations are
+    identified by fingerprints, so a restarted computation on the same
+    input finds its state, and checkpoints of different inputs may
+    share a directory. Checkpoints of cancelled computations are kept,
+    as closing the application cancels them, and are removed when they
+    are older than max_age
+    """
+    def __init__(self, directory: Optional[Path] = None, interval: float = 60.0,
+                 max_age: float = CHECKPOINT_MAX_AGE):
+        """
+        Constructor for checkpoint. Removes outdated checkpoint files
+        :param directory: directory for checkpoint files, default is
+        checkpoints directory in backend cache
+        :param interval: minimal number of seconds between saves
+        :param max_age: number of seconds after the last save when
+        a checkpoint file is outdated
+        """
+        self.directory = Path(directory) if directory is not None else CHECKPOINT_DIR
+        self.interval = interval
+        self.last_save = time.monotonic()
+        self.prune(max_age)
+
+    def prune(self, max_age: float) -> None:
+        """
+        Remove checkpoint files and leftover temporary files not
+        modified for max_age seconds
+        :param max_age: age in seconds
+        :return: None
+        """
+        config.prune_older_than(self.directory, max_age, (".ckpt",))
+
+    def path(self, key: str) -> Path:
+        """
+        Get file name for checkpoint
+        :param key: fingerprint of computation
+        :return: path to checkpoint file
+        """
+        return self.directory / f"{key}.ckpt"
+
+    def load(self, key: str) -> Optional[Any]:
+        """
+        Load saved state of computation. Unreadable checkpoints, e.g.
+        truncated or referring to classes which no longer exist, are removed
+        :param key: fingerprint of computation
+        :return: saved state, or None if there is no valid checkpoint
+        """
+        try:
+            file = open(self.path(key), "rb")
+        except OSError:
+            return None
+        try:
+            with file:
+                saved_key, state = pickle.load(file)
+        except Exception:
+            # Checkpoints are our own cache, anything in them may be stale
+            self.remove(key)
+            return None
+        if saved_key != key:
+            return None
+        return state
+
+    def save(self, key: str, state: Any, force: bool = False) -> None:
+        """
+        Save state of computation, if Checkpoint.interval seconds passed
+        since the last save. File is replaced atomically, so an
+        interrupted save keeps the previous checkpoint. Failing to write
+        a checkpoint does not stop the computation
+        :param key: fingerprint of computation
+        :param state: picklable state
+        :param force: save regardless of interval
+        :return: None
+        """
+        now = time.monotonic()
+        if not force and now - self.last_save < self.interval:
+            return
+        self.last_save = now
+        config.atomic_write(
+            self.path(key),
+            pickle.dumps((key, state), protocol=pickle.HIGHEST_PROTOCOL),
+        )
+
+    def remove(self, key: str) -> None:
+        """
+        Remove checkpoint of a finished computation
+        :param key: fingerprint of computation
+        :return: None
+        """
+        try:
+            os.remove(self.path(key))
+        except OSError:
+            pass
@@ -0,0 +1,58 @@
+import os
+import time
+from pathlib import Path
+from typing import Union
+
+# Root directory for on-disk caches of the backend
+CACHE_DIR = Path(
+    os.environ.get(
+        "POLYNOMIALS_CACHE_DIR", Path.home() / ".cache" / "polynomials"
+    )
+)
+
+
+def atomic_write(path: Path, data: Union[str, bytes]) -> None:
+    """
+    Write a cache file. Data goes to a temporary file, which then
+    replaces path, so an interrupted write keeps the previous file.
+    On-disk caches are only an optimization, so failing to write
+    is not an error
+    :param path: path to file
+    :param data: file contents
+    :return: None
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def prune_older_than(directory: Path, max_age: float,
+                     suffixes: tuple[str, ...]) -> None:
+    """
+    Remove cache files and leftover temporary files of atomic_write
+    not modified for max_age seconds
+    :param directory: cache directory
+    :param max_age: age in seconds
+    :param suffixes: suffixes of cache files
+    :return: None
+    """
+    deadline = time.time() - max_age
+    try:
+        paths = list(directory.iterdir())
+    except OSError:
+        return
+    for path in paths:
+        if path.suffix not in suffixes + (".tmp",):
+            continue
+        try:
+            if path.stat().st_mtime < deadline:
+                path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from backend.graph_utils import Edge, Graph, get_symbols
+
+# Drawn graph: nodes as (x, y, name), edges as (source index, target index, name)
+NodeRecord = tuple[float, float, str]
+EdgeRecord = tuple[int, int, str]
+Layout = tuple[list[NodeRecord], list[EdgeRecord]]
+
+# Compact binary variant of .graph format
+BINARY_SUFFIX = ".bgraph"
+BINARY_MAGIC = b"PGRB"
+BINARY_VERSION = 1
+# Magic, version, number of nodes, number of edges
+BINARY_HEADER = struct.Struct("<4sBII")
+BINARY_LENGTH = struct.Struct("<I")
+
+
+def parse_layout(lines: Iterable[str]) -> Layout:
+    """
+    Parse drawn graph in .graph format: "n m" line, then n lines
+    "x y name" for nodes, then m lines "source target name" for edges,
+    where source and target are node names. Lines are consumed one
+    by one, so a file object may be passed without reading it whole
+    :param lines: lines of file
+    :return: nodes and edges
+    """
+    lines = iter(lines)
+    try:
+        n, m = map(int, next(lines).split())
+        nodes = []
+        node_name_to_index = {}
+        for i in range(n):
+            x, y, name = next(lines).split()
+            nodes.append((float(x), float(y), name))
+            node_name_to_index[name] = i
+        edges = []
+        for _ in range(m):
+            source, target, name = next(lines).split()
+            edges.append(
+                (node_name_to_index[source], node_name_to_index[target], name)
+            )
+    except StopIteration:
+        raise ValueError("unexpected end of graph file") from None
+    except KeyError as e:
+        raise ValueError(f"edge refers to unknown node {e.args[0]}") from None
+    return nodes, edges
+
+
+def format_layout(nodes: list[NodeRecord], edges: list[EdgeRecord]) -> Iterator[str]:
+    """
+    Format drawn graph in .graph format, see parse_layout
+    :param nodes: nodes (x, y, name)
+    :param edges: edges (source index, target index, name)
+    :return: lines of file
+    """
+    yield f"{len(nodes)} {len(edges)}\n"
+    for x, y, name in nodes:
+        yield f"{x} {y} {name}\n"
+    for source, target, name in edges:
+        yield f"{nodes[source][2]} {nodes[target][2]} {name}\n"
+
+
+def pack_names(names: list[str]) -> bytes:
+    """
+    Pack names for binary format. Names have no whitespace, so they
+    are joined by newlines
+    :param names: names
+    :return: length-prefixed UTF-8 block
+    """
+    block = "\n".join(names).encode()
+    return BINARY_LENGTH.pack(len(block)) + block
+
+
+def unpack_names(data: memoryview, offset: int, count: int) -> tuple[list[str], int]:
+    """
+    Unpack names written by pack_names
+    :param data: file contents
+    :param offset: position of block
+    :param count: expected number of names
+    :return: names and position after block
+    """
+    (length,) = BINARY_LENGTH.unpack_from(data, offset)
+    offset += BINARY_LENGTH.size
+    if offset + length > len(data):
+        raise ValueError("corrupted binary graph file")
+    block = bytes(data[offset:offset + length]).decode()
+    names = block.split("\n") if count else []
+    if len(names) != count:
+        raise ValueError("corrupted binary graph file")
+    return names, offset + length
+
+
+def pack_layout(nodes: list[NodeRecord], edges: list[EdgeRecord]) -> bytes:
+    """
+    Encode drawn graph in binary format: header, node coordinates as
+    little-endian doubles, edge ends as little-endian 32-bit node
+    indices, then node names and edge names
+    :param nodes: nodes (x, y, name)
+    :param edges: edges (source index, target index, name)
+    :return: file contents
+    """
+    coordinates = array("d", (c for x, y, _ in nodes for c in (x, y)))
+    ends = array("I", (e for source, target, _ in edges for e in (source, target)))
+    if sys.byteorder == "big":
+        coordinates.byteswap()
+        ends.byteswap()
+    return b"".join((
+        BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, len(nodes), len(edges)),
+        coordinates.tobytes(),
+        ends.tobytes(),
+        pack_names([name for _, _, name in nodes]),
+        pack_names([name for _, _, name in edges]),
+    ))
+
+
+def unpack_layout(data: bytes) -> Layout:
+    """
+    Decode drawn graph written by pack_layout
+    :param data: file contents
+    :return: nodes and edges
+    """
+    data = memoryview(data)
+    try:
+        magic, version, n, m = BINARY_HEADER.unpack_from(data)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError("unsupported binary graph file")
+        offset = BINARY_HEADER.size
+        coordinates = array("d")
+        coordinates.frombytes(data[offset:offset + 16 * n])
+        offset += 16 * n
+        ends = array("I")
+        ends.frombytes(data[offset:offset + 8 * m])
+        offset += 8 * m
+        if len(coordinates) != 2 * n or len(ends) != 2 * m:
+            raise ValueError("corrupted binary graph file")
+        node_names, offset = unpack_names(data, offset, n)
+        edge_names, offset = unpack_names(data, offset, m)
+    except struct.error:
+        raise ValueError("corrupted binary graph file") from None
+    if sys.byteorder == "big":
+        coordinates.byteswap()
+        ends.byteswap()
+    if ends and max(ends) >= n:
+        raise ValueError("edge refers to unknown node")
+    nodes = list(zip(coordinates[::2], coordinates[1::2], node_names))
+    edges = list(zip(ends[::2], ends[1::2], edge_names))
+    return nodes, edges
+
+
+def is_binary(path: Union[str, Path]) -> bool:
+    """
+    Check whether graph should be saved in binary format
+    :param path: path to file
+    :return: True for BINARY_SUFFIX files
+    """
+    return Path(path).suffix == BINARY_SUFFIX
+
+
+def read_layout(path: Union[str, Path]) -> Layout:
+    """
+    Read drawn graph from file in text or binary format, format is
+    detected by contents
+    :param path: path to file
+    :return: nodes and edges
+    """
+    with open(path, "rb") as file:
+        if file.read(len(BINARY_MAGIC)) == BINARY_MAGIC:
+            file.seek(0)
+            return unpack_layout(file.read())
+    with open(path, "r", encoding="utf-8") as file:
+        return parse_layout(file)
+
+
+def write_layout(path: Union[str, Path], nodes: list[NodeRecord],
+                 edges: list[EdgeRecord], binary: Optional[bool] = None) -> None:
+    """
+    Write drawn graph to file
+    :param path: path to file
+    :param nodes: nodes (x, y, name)
+    :param edges: edges (source index, target index, name)
+    :param binary: use binary format, default is chosen by file suffix
+    :return: None
+    """
+    if binary is None:
+        binary = is_binary(path)
+    if binary:
+        with open(path, "wb") as file:
+            file.write(pack_layout(nodes, edges))
+    else:
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(format_layout(nodes, edges))
+
+
+def layout_to_graph(nodes: list[NodeRecord], edges: list[EdgeRecord]) -> tuple[int, int, Graph]:
+    """
+    Build graph representation of drawn graph. Edge lengths are
+    t_0, ..., t_{m-1} in order of edges, as in the graphical interface
+    :param nodes: nodes (x, y, name)
+    :param edges: edges (source index, target index, name)
+    :return:
+    n (int): number of vertex
+    m (int): number of edges
+    g (Graph): graph representation
+    """
+    g = Graph()
+    ts = get_symbols(len(edges))
+    for (source, target, _), t in zip(edges, ts):
+        g.add_edge(Edge(source, target, t))
+    return len(nodes), len(edges), g
+
+
+def parse_graph(text: str) -> tuple[int, int, Graph]:
+    """
+    Parse graph in .graph format, see parse_layout and layout_to_graph
+    :param text: file contents
+    :return: n, m and graph representation
+    """
+    return layout_to_graph(*parse_layout(text.splitlines()))
+
+
+def read_graph(path: Union[str, Path]) -> tuple[int, int, Graph]:
+    """
+    Read graph from .graph or binary graph file, see read_layout
+    :param path: path to file
+    :return: n, m and graph representation
+    """
+    return layout_to_graph(*read_layout(path))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import random
-from typing import Union, Optional
+from typing import Union, Optional, Iterator
 
 import sympy
 import networkx as nx
@@ -131,6 +131,118 @@ class Graph:
         return G
 
 
+def bits(mask: int) -> Iterator[int]:
+    """
+    Iterate through indices of set bits of a mask
+    :param mask: bitmask, e.g. a subgraph edge mask
+    :return: iterator over bit indices, in increasing order
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class CompactEdge:
+    """
+    Edge representation in CompactGraph.
+    Edge id, eid, is the index of the edge in CompactGraph.edges and
+    the bit of the edge in subgraph masks. begin and end are
+    vertex indices in CompactGraph
+    """
+    __slots__ = ("eid", "begin", "end", "t")
+
+    def __init__(self, eid: int, begin: int, end: int,
+                 t: Union[float, int, sympy.Symbol]):
+        self.eid = eid
+        self.begin = begin
+        self.end = end
+        self.t = t
+
+    def other(self, v: int) -> int:
+        """
+        Get the other end of edge
+        :param v: one end of edge
+        :return: vertex at the other end (v itself for a loop)
+        """
+        return self.end if self.begin == v else self.begin
+
+    def __str__(self) -> str:
+        return f"{self.begin} -> {self.end} ({self.t})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class CompactGraph:
+    """
+    Immutable graph representation for enumeration-heavy computing.
+    Vertices and edges are numbered with consecutive integers, so that
+    any subgraph is represented as an integer mask of its edges.
+    CompactGraph.vertices maps vertex index to vertex name of the source
+    Graph, CompactGraph.index is the inverse mapping,
+    CompactGraph.incident[v] is the mask of edges incident to vertex v
+    """
+    __slots__ = ("vertices", "index", "edges", "incident", "full_mask")
+
+    def __init__(self, vertices: list[int], edges: list[CompactEdge]):
+        """
+        Constructor for compact graph
+        :param vertices: vertex names, vertex i is named vertices[i]
+        :param edges: edges, edges[i].eid must be equal to i
+        """
+        incident = [0] * len(vertices)
+        for edge in edges:
+            incident[edge.begin] |= 1 << edge.eid
+            incident[edge.end] |= 1 << edge.eid
+        self.vertices = tuple(vertices)
+        self.index = {name: i for i, name in enumerate(vertices)}
+        self.edges = tuple(edges)
+        self.incident = tuple(incident)
+        self.full_mask = (1 << len(edges)) - 1
+
+    @staticmethod
+    def from_graph(g: Graph) -> CompactGraph:
+        """
+        Build compact representation for a graph. Edge order
+        is the order of Graph.edges
+        :param g: graph to convert
+        :return: CompactGraph instance
+        """
+        vertices = list(g.g)
+        index = {name: i for i, name in enumerate(vertices)}
+        edges = [
+            CompactEdge(eid, index[edge.begin], index[edge.end], edge.t)
+            for eid, edge in enumerate(
+                edges_with_id[0] for edges_with_id in g.edges.values()
+            )
+        ]
+        return CompactGraph(vertices, edges)
+
+    def degree(self, v: int, mask: int) -> int:
+        """
+        Get vertex degree in a subgraph. A loop is counted once,
+        like in Graph.g adjacency lists
+        :param v: vertex index
+        :param mask: subgraph edge mask
+        :return: number of edges of the subgraph incident to v
+        """
+        return (self.incident[v] & mask).bit_count()
+
+    def vertex_mask(self, mask: int, v: int) -> int:
+        """
+        Get vertices of a subgraph
+        :param mask: subgraph edge mask
+        :param v: vertex which is always included (subgraph root)
+        :return: mask of vertices, touched by subgraph edges, and v
+        """
+        res = 1 << v
+        for eid in bits(mask):
+            edge = self.edges[eid]
+            res |= (1 << edge.begin) | (1 << edge.end)
+        return res
+
+
 def get_symbols(num_edges: int) -> list[sympy.Symbol]:
     """
     Generate symbols for edges length
@@ -272,3 +384,100 @@ def get_single_edge() -> tuple[int, int, Graph]:
     n -- graph representation
     """
     return get_multiedge(1)
+
+
+def get_path(k=4) -> tuple[int, int, Graph]:
+    """
+    Graph example family: path
+    k edges in a row, starting at vertex 0
+    List of edges representation:
+    0 1
+    1 2
+    ... (k edges)
+    :param k: number of edges
+    :return:
+    n -- number of vertices
+    m -- number of edges
+    n -- graph representation
+    """
+    n, m = k + 1, k
+    g = Graph()
+    ts = get_symbols(m)
+    for i in range(k):
+        g.add_edge(Edge(i, i + 1, ts[i]))
+    return n, m, g
+
+
+def get_cycle(k=4) -> tuple[int, int, Graph]:
+    """
+    Graph example family: cycle
+    k vertices in a cycle
+    List of edges representation:
+    0 1
+    1 2
+    ...
+    k-1 0
+    :param k: number of edges
+    :return:
+    n -- number of vertices
+    m -- number of edges
+    n -- graph representation
+    """
+    n, m = k, k
+    g = Graph()
+    ts = get_symbols(m)
+    for i in range(k):
+        g.add_edge(Edge(i, (i + 1) % k, ts[i]))
+    return n, m, g
+
+
+def get_wheel(k=4) -> tuple[int, int, Graph]:
+    """
+    Graph example family: wheel
+    Hub vertex 0 connected with every vertex of a cycle 1..k
+    List of edges representation:
+    0 1
+    ... (k spokes)
+    1 2
+    ...
+    k 1
+    :param k: number of spokes
+    :return:
+    n -- number of vertices
+    m -- number of edges
+    n -- graph representation
+    """
+    n, m = k + 1, 2 * k
+    g = Graph()
+    ts = get_symbols(m)
+    for i in range(k):
+        g.add_edge(Edge(0, i + 1, ts[i]))
+    for i in range(k):
+        g.add_edge(Edge(i + 1, (i + 1) % k + 1, ts[k + i]))
+    return n, m, g
+
+
+def get_grid(rows=2, cols=3) -> tuple[int, int, Graph]:
+    """
+    Graph example family: grid
+    rows x cols vertices, vertex r * cols + c is connected
+    with its right and lower neighbours
+    :param rows: number of rows
+    :param cols: number of columns
+    :return:
+    n -- number of vertices
+    m -- number of edges
+    n -- graph representation
+    """
+    n = rows * cols
+    m = rows * (cols - 1) + (rows - 1) * cols
+    g = Graph()
+    ts = iter(get_symbols(m))
+    for r in range(rows):
+        for c in range(cols):
+            v = r * cols + c
+            if c + 1 < cols:
+                g.add_edge(Edge(v, v + 1, next(ts)))
+            if r + 1 < rows:
+                g.add_edge(Edge(v, v + cols, next(ts)))
+    return n, m, g
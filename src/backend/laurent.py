@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import Optional, Union
+
+import sympy
+
+from backend.progress import check_cancelled
+
+Scalar = Union[int, Fraction]
+
+
+class LaurentPoly:
+    """
+    Sparse multivariate Laurent polynomial with exact rational coefficients.
+    A monomial is a tuple of exponents, one per variable, exponents may be
+    negative. Zero coefficients are never stored, so the representation
+    is canonical: equal polynomials have equal LaurentPoly.terms
+    """
+    __slots__ = ("terms",)
+
+    def __init__(self, terms: Optional[dict[tuple[int, ...], Scalar]] = None):
+        """
+        Constructor for Laurent polynomial
+        :param terms: monomial exponents -> coefficient, without zeros
+        """
+        self.terms: dict[tuple[int, ...], Scalar] = (
+            terms if terms is not None else {}
+        )
+
+    @staticmethod
+    def monomial(exps: tuple[int, ...], coefficient: Scalar = 1) -> LaurentPoly:
+        """
+        Build a single-term polynomial
+        :param exps: monomial exponents
+        :param coefficient: monomial coefficient
+        :return: LaurentPoly instance
+        """
+        if coefficient == 0:
+            return LaurentPoly()
+        return LaurentPoly({exps: coefficient})
+
+    def add(self, other: LaurentPoly, factor: Scalar = 1) -> LaurentPoly:
+        """
+        In-place addition of factor * other, used for accumulation
+        :param other: polynomial to add
+        :param factor: scalar multiplier for other
+        :return: self
+        """
+        terms = self.terms
+        for exps, coefficient in other.terms.items():
+            value = terms.get(exps, 0) + factor * coefficient
+            if value:
+                terms[exps] = value
+            else:
+                terms.pop(exps, None)
+        return self
+
+    def copy(self) -> LaurentPoly:
+        return LaurentPoly(dict(self.terms))
+
+    def __add__(self, other: Union[LaurentPoly, Scalar]) -> LaurentPoly:
+        if not isinstance(other, LaurentPoly):
+            if other == 0:
+                return self.copy()
+            return NotImplemented
+        return self.copy().add(other)
+
+    def __radd__(self, other: Scalar) -> LaurentPoly:
+        return self + other
+
+    def __sub__(self, other: LaurentPoly) -> LaurentPoly:
+        return self.copy().add(other, -1)
+
+    def __neg__(self) -> LaurentPoly:
+        return LaurentPoly(
+            {exps: -coefficient for exps, coefficient in self.terms.items()}
+        )
+
+    def __mul__(self, other: Union[LaurentPoly, Scalar]) -> LaurentPoly:
+        if not isinstance(other, LaurentPoly):
+            if other == 0:
+                return LaurentPoly()
+            return LaurentPoly(
+                {exps: c * other for exps, c in self.terms.items()}
+            )
+        res: dict[tuple[int, ...], Scalar] = {}
+        # Longer polynomial goes to the outer loop, which is a cancellation
+        # point, as products of large polynomials may take seconds
+        longer, shorter = (
+            (self, other) if len(self.terms) >= len(other.terms) else (other, self)
+        )
+        for exps1, c1 in longer.terms.items():
+            check_cancelled()
+            for exps2, c2 in shorter.terms.items():
+                exps = tuple(e1 + e2 for e1, e2 in zip(exps1, exps2))
+                res[exps] = res.get(exps, 0) + c1 * c2
+        return LaurentPoly({exps: c for exps, c in res.items() if c})
+
+    def __rmul__(self, other: Scalar) -> LaurentPoly:
+        return self * other
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LaurentPoly):
+            return self.terms == other.terms
+        if other == 0:
+            return not self.terms
+        return NotImplemented
+
+    def __bool__(self) -> bool:
+        return bool(self.terms)
+
+    def __str__(self) -> str:
+        return str(self.terms)
+
+    def __repr__(self) -> str:
+        return f"LaurentPoly({self.terms})"
+
+    def as_expr(self, symbols: list[sympy.Symbol]) -> sympy.Expr:
+        """
+        Convert polynomial into sympy expression
+        :param symbols: polynomial variables, in order
+        :return: sympy expression
+        """
+        return sympy.Add(*[
+            sympy.Rational(coefficient.numerator, coefficient.denominator)
+            * sympy.Mul(*[
+                sympy.sympify(x) ** e for x, e in zip(symbols, exps) if e
+            ])
+            for exps, coefficient in sorted(self.terms.items())
+        ])
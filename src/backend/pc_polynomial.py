@@ -1,11 +1,127 @@
-from itertools import chain, combinations
-from typing import Iterable, List, Tuple, Any, Set, Optional
+from __future__ import annotations
 
-from backend.graph_utils import Edge, Graph
+import cProfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from fractions import Fraction
+from collections import OrderedDict
+from itertools import chain
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from backend.canonical import edge_automorphisms, graph_form
+from backend.checkpoint import Checkpoint, fingerprint
+from backend.graph_utils import Edge, Graph, CompactGraph, bits
+from backend.laurent import LaurentPoly
+from backend.progress import (
+    CancellationToken,
+    Progress,
+    ProgressCallback,
+    cancellable,
+    check_cancelled,
+    tracked,
+)
 
 import sympy
 
-from backend.symplex_counting.todd import build_rk
+from backend.symplex_counting.todd import rk_coefficients, rk_template
+
+# Number of enumeration parts per worker process in parallel build
+PARTS_PER_WORKER = 16
+
+# Minimal number of enumeration parts in checkpointed build, a part
+# is the unit of work lost on restart
+CHECKPOINT_PARTS = 256
+
+# Number of seconds between checks of cancellation token while
+# waiting for worker processes
+CANCEL_POLL_SECONDS = 0.1
+
+# Maximal number of memoized subgraph contributions
+CONTRIBUTION_MEMO_SIZE = 1 << 14
+
+# Contribution memo is turned off if, after this number of lookups, less
+# than MEMO_MIN_HIT_RATE of them are hits: canonical forms of subgraphs
+# of asymmetric graphs cost more than they save
+MEMO_PROBE_LOOKUPS = 512
+MEMO_MIN_HIT_RATE = 0.2
+
+# Routes from s to v in a subgraph: (subgraph mask, weight of v,
+# isthmus of v, stream of routes), see route_patterns
+RoutePattern = tuple[int, int, Optional[int], Iterator[int]]
+
+
+class BuildStats:
+    """
+    Counters and timers of a point counting polynomial build.
+    BuildStats.counters: subgraphs visited, route patterns (subgraph and
+    vertex pairs), routes found, substitutions (Taylor shifts) done,
+    memo hits and misses, orbit representatives, enumeration parts.
+    BuildStats.seconds: time per phase: enumeration of subgraphs, routes
+    (spanning trees, cycle bases, isthmuses), contributions (R_k and
+    Taylor shifts), accumulation of the sum, conversion into sympy
+    polynomial. With worker processes, phases are summed over workers,
+    and only BuildStats.total is wall time
+    """
+    COUNTERS = (
+        "subgraphs", "patterns", "routes", "substitutions",
+        "memo_hits", "memo_misses", "representatives", "parts",
+    )
+    PHASES = ("enumeration", "routes", "contributions", "accumulation", "conversion")
+
+    def __init__(self):
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.seconds = dict.fromkeys(self.PHASES, 0.0)
+        self.total = 0.0
+
+    def merge(self, other: BuildStats) -> None:
+        """
+        Add counters and timers of other build, e.g. of a worker process
+        :param other: stats to add
+        :return: None
+        """
+        for name, value in other.counters.items():
+            self.counters[name] += value
+        for name, value in other.seconds.items():
+            self.seconds[name] += value
+
+    def as_dict(self) -> dict:
+        return {
+            "counters": dict(self.counters),
+            "seconds": dict(self.seconds),
+            "total": self.total,
+        }
+
+    def __str__(self) -> str:
+        lines = [f"{name}: {value}" for name, value in self.counters.items()]
+        lines += [f"{name}: {value:.4f}s" for name, value in self.seconds.items()]
+        lines.append(f"total: {self.total:.4f}s")
+        return "\n".join(lines)
+
+
+def timed_stream(stream: Iterable, stats: BuildStats, phase: str,
+                 counter: Optional[str] = None) -> Iterator:
+    """
+    Pass a stream through, adding time spent in producing its items
+    to a phase of stats. The time includes all upstream stages
+    :param stream: stream to measure
+    :param stats: stats to update
+    :param phase: name of phase
+    :param counter: name of counter of items, None to not count
+    :return: the same stream
+    """
+    it = iter(stream)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(it)
+        except StopIteration:
+            stats.seconds[phase] += time.perf_counter() - start
+            return
+        stats.seconds[phase] += time.perf_counter() - start
+        if counter is not None:
+            stats.counters[counter] += 1
+        yield item
 
 
 def get_graph_from_cl() -> tuple[int, int, Graph]:
@@ -27,231 +143,958 @@ def get_graph_from_cl() -> tuple[int, int, Graph]:
     return n, m, g
 
 
-def powerset(iterable: Iterable) -> Iterable:
+def connected_subgraphs(cg: CompactGraph, v: int,
+                        state: Optional[tuple[int, int, int]] = None
+                        ) -> Iterator[int]:
     """
-    :param iterable: iterator to some container
-    :return: powerset of input iterable
+    Lazily enumerate all connected subgraphs g' of graph cg, such that
+    g' includes vertex v. Subgraphs are grown from v edge by edge: at
+    every step the first edge adjacent to the current subgraph is either
+    taken or banned, so every connected subgraph is produced exactly once
+    and disconnected edge subsets are never built
+    :param cg: graph representation for subgraph listing
+    :param v: vertex index every subgraph must include
+    :param state: enumeration state (chosen edges, adjacent edges,
+    banned edges) to start with, see split_subgraphs.
+    If None, all subgraphs are enumerated
+    :return: iterator over edge masks of all connected subgraphs of cg,
+    that include v
     """
-    s = list(iterable)
-    return chain.from_iterable(combinations(s, r) for r in range(len(s) + 1))
+    def grow(chosen: int, adjacent: int, banned: int) -> Iterator[int]:
+        frontier = adjacent & ~chosen & ~banned
+        if not frontier:
+            yield chosen
+            return
+        bit = frontier & -frontier
+        edge = cg.edges[bit.bit_length() - 1]
+        yield from grow(
+            chosen | bit,
+            adjacent | cg.incident[edge.begin] | cg.incident[edge.end],
+            banned,
+        )
+        yield from grow(chosen, adjacent, banned | bit)
+
+    if state is None:
+        state = (0, cg.incident[v], 0)
+    return grow(*state)
 
 
-def dfs(g: Graph, v: int, used: dict[int, bool]) -> None:
+def split_subgraphs(cg: CompactGraph, v: int, parts: int
+                    ) -> list[tuple[int, int, int]]:
     """
-    :param g: graph representation
-    :param v: current vertex, where dfs is started
-    :param used: list[bool], used[i] <=> vertex is used in dfs
-    :return: None
+    Split enumeration of connected subgraphs into independent parts.
+    Enumeration tree is expanded level by level until there are at
+    least parts states, or every state is a single subgraph
+    :param cg: graph representation for subgraph listing
+    :param v: vertex index every subgraph must include
+    :param parts: desired number of parts
+    :return: enumeration states, see connected_subgraphs. Every connected
+    subgraph is enumerated from exactly one state
     """
-    used[v] = True
-    for edge in g.g[v]:
-        u = edge.end
-        if not used[u]:
-            dfs(g, u, used)
+    states = [(0, cg.incident[v], 0)]
+    while len(states) < parts:
+        new_states = []
+        for chosen, adjacent, banned in states:
+            frontier = adjacent & ~chosen & ~banned
+            if not frontier:
+                new_states.append((chosen, adjacent, banned))
+                continue
+            bit = frontier & -frontier
+            edge = cg.edges[bit.bit_length() - 1]
+            new_states.append((
+                chosen | bit,
+                adjacent | cg.incident[edge.begin] | cg.incident[edge.end],
+                banned,
+            ))
+            new_states.append((chosen, adjacent, banned | bit))
+        if len(new_states) == len(states):
+            break
+        states = new_states
+    return states
 
 
-def is_connected(g: Graph, v: int) -> bool:
+def route_space(cg: CompactGraph, mask: int, s: int) -> tuple[list[int], list[int]]:
     """
-    Check if graph with vertex v g is connected
-    :param g: graph representation
-    :param v: starting vertex for dfs
-    :return: True, if graph g is connected
-    False either
-    """
-    n = len(g.g)
-    used = {i: False for i in g.g}
-    dfs(g, v, used)
-    return sum(used.values()) == n
-
-
-def get_all_subg(g: Graph, v: int) -> set[Graph]:
-    """
-    List all subgraph g' for graph g, such that
-    g' includes vertex v
-    :param g: graph representation for subgraph listing
-    :param v: vert
-    :return: all subgraphs of graph g, that include vertex v
-    """
-    edges = [edges_with_hash[0] for edges_with_hash in g.edges.values()]
-    res = set()
-    for subgraph in powerset(edges):
-        g1 = Graph()
-        g1.add_vertex(v)
-        for e1 in subgraph:
-            g1.add_edge(e1)
-        if is_connected(g1, v):
-            res.add(g1)
+    Describe all routes from s in a connected subgraph at once.
+    A route from s to v that passes every edge no more than two times
+    is determined by the set of edges it passes odd number of times.
+    These sets are exactly the s-v T-joins of the subgraph: the path
+    from s to v in a spanning tree xor any element of the cycle space.
+    Every such set is realised by an Euler route, passing its edges once
+    and all other edges twice
+    :param cg: graph representation
+    :param mask: subgraph edge mask, subgraph must be connected
+    :param s: starting vertex
+    :return:
+    paths -- paths[v] is the edge mask of tree path from s to v
+    (vertices outside the subgraph are left 0),
+    basis -- fundamental cycles of the subgraph, as edge masks,
+    see cycle_space
+    """
+    paths = [0] * len(cg.vertices)
+    reached = 1 << s
+    stack = [s]
+    tree = 0
+    while stack:
+        u = stack.pop()
+        for eid in bits(cg.incident[u] & mask & ~tree):
+            w = cg.edges[eid].other(u)
+            if not reached >> w & 1:
+                reached |= 1 << w
+                tree |= 1 << eid
+                paths[w] = paths[u] | (1 << eid)
+                stack.append(w)
+
+    basis = [
+        (1 << eid) ^ paths[cg.edges[eid].begin] ^ paths[cg.edges[eid].end]
+        for eid in bits(mask & ~tree)
+    ]
+    return paths, basis
+
+
+def cycle_space(basis: list[int]) -> Iterator[int]:
+    """
+    Lazily enumerate all elements of a cycle space in Gray code order,
+    every element differs from the previous one by a basis cycle
+    :param basis: basis cycles, as edge masks
+    :return: all 2^len(basis) elements of the cycle space, as edge masks
+    """
+    cycle = 0
+    yield cycle
+    for i in range(1, 1 << len(basis)):
+        cycle ^= basis[(i & -i).bit_length() - 1]
+        yield cycle
+
+
+def get_isthmuses(cg: CompactGraph, mask: int, s: int) -> list[Optional[int]]:
+    """
+    Get isthmuses for all vertices at once, with starting vertex s.
+    Bridges of the subgraph are found in one depth-first search with
+    low-link values: a tree edge to u is a bridge iff no edge from
+    the subtree of u goes above it. Such a bridge is the only one near u,
+    that separates u from s
+    :param cg: graph representation
+    :param mask: subgraph edge mask
+    :param s: starting vertex
+    :return:
+    list, indexed by vertex: edge id, if there is an isthmus near,
+    connected with vertex, None either
+    """
+    n = len(cg.vertices)
+    disc = [-1] * n
+    low = [0] * n
+    parent_edge = [-1] * n
+    res: list[Optional[int]] = [None] * n
+
+    disc[s] = 0
+    timer = 1
+    stack = [(s, bits(cg.incident[s] & mask))]
+    while stack:
+        u, edges = stack[-1]
+        for eid in edges:
+            if eid == parent_edge[u]:
+                continue
+            w = cg.edges[eid].other(u)
+            if disc[w] == -1:
+                disc[w] = low[w] = timer
+                timer += 1
+                parent_edge[w] = eid
+                stack.append((w, bits(cg.incident[w] & mask)))
+                break
+            low[u] = min(low[u], disc[w])
+        else:
+            stack.pop()
+            if stack:
+                p = stack[-1][0]
+                low[p] = min(low[p], low[u])
+                # Vertex of degree 1 has no isthmus
+                if low[u] > disc[p] and cg.degree(u, mask) != 1:
+                    res[u] = parent_edge[u]
     return res
 
 
-def dfs2(g: Graph, c: int, f: int, used: dict[str, int],
-         cs: list[dict[str, int]]) -> None:
+def taylor_shift(coeffs: list, c) -> list:
     """
-    Dfs-like helping function for finding all routes that passes
-    every edge no more than 2 times. It is helpful to find
-    all even routes from c to f
-    :param g: graph representation
-    :param c: starting vertex
-    :param f: finish vertex
-    :param used: number of times edge is used
-    :param cs: cumulative array for result
-    :return: None
-    """
-    if c == f:
-        cs.append(used.copy())
-    for edge in g.g[c]:
-        u = edge.end
-        if used[edge.eid] < 2:
-            used[edge.eid] += 1
-            dfs2(g, u, f, used, cs)
-            used[edge.eid] -= 1
-
-
-def unique(arr: list[dict[Any, Any]]) -> set[tuple[Any, ...]]:
-    """
-    Return set, containing unique elements from array arr
-    :param arr: input array
-    :return: unique elements from array arr
-    """
-    return set(
-        tuple(celem)
-        for celem in (
-            sorted(cs.items(), key=lambda elem: elem[0]) for cs in arr
-        )
-    )
+    Substitute lambda = T - c into a polynomial in lambda
+    :param coeffs: polynomial coefficients, coeffs[j] is for lambda^j
+    :param c: shift
+    :return: coefficients of resulting polynomial in T
+    """
+    res = list(coeffs)
+    for i in range(len(res) - 1):
+        for j in range(len(res) - 2, i - 1, -1):
+            res[j] -= c * res[j + 1]
+    return res
 
 
-def all_routes(g: Graph, s: int, v: int) -> list[list[tuple[Any, Any]]]:
+def numeric_lengths(ts: list) -> Optional[list[Fraction]]:
     """
-    Compute all routes, that starts with s and finishes at v.
-    Every route passes an edge no more than two times
-    :param g: graph representation
+    Convert edge lengths into exact rationals
+    :param ts: edge lengths
+    :return: list of lengths, or None if some length is not an exact number
+    """
+    res = []
+    for t in ts:
+        if isinstance(t, (int, Fraction)):
+            res.append(Fraction(t))
+        elif isinstance(t, float):
+            res.append(Fraction(str(t)))
+        elif isinstance(t, sympy.Rational):
+            res.append(Fraction(int(t.p), int(t.q)))
+        else:
+            return None
+    return res
+
+
+def route_patterns(cg: CompactGraph, s: int, masks: Iterable[int],
+                   stats: Optional[BuildStats] = None) -> Iterator[RoutePattern]:
+    """
+    Second stage of the pipeline: for every subgraph from the stream
+    and every its vertex v, which contributes to the polynomial, produce
+    the routes from s to v. Nothing is materialized beyond a single
+    subgraph, and routes are produced lazily
+    :param cg: graph representation
     :param s: starting vertex
-    :param v: end vertex
-    :return: all unique routes from s to v
+    :param masks: stream of connected subgraphs, as edge masks
+    :param stats: stats to update, or None
+    :return: stream of (subgraph mask, weight of v, isthmus of v,
+    routes from s to v), see route_space and get_isthmuses
+    """
+    for mask in masks:
+        start = time.perf_counter()
+        paths, basis = route_space(cg, mask, s)
+        isthmuses = get_isthmuses(cg, mask, s)
+        if stats is not None:
+            stats.seconds["routes"] += time.perf_counter() - start
+        # Iterating through all vertex in every subgraph
+        for v in bits(cg.vertex_mask(mask, s)):
+            # Multiplying result with difference in difference between
+            # subgraph vertex degrees
+            weight = cg.degree(v, cg.full_mask) - cg.degree(v, mask)
+            if weight or isthmuses[v] is not None:
+                if stats is not None:
+                    stats.counters["patterns"] += 1
+                    stats.counters["routes"] += 1 << len(basis)
+                yield (
+                    mask, weight, isthmuses[v],
+                    (paths[v] ^ cycle for cycle in cycle_space(basis)),
+                )
+
+
+def numeric_contributions(cg: CompactGraph, lengths: list[Fraction],
+                          patterns: Iterable[RoutePattern],
+                          stats: Optional[BuildStats] = None
+                          ) -> Iterator[tuple[int, list[Fraction]]]:
+    """
+    Third stage of the pipeline for numeric edge lengths: turn every
+    route into shifted R_k coefficients
+    :param cg: graph representation
+    :param lengths: edge lengths, lengths[eid] for edge eid
+    :param patterns: stream of routes, see route_patterns
+    :param stats: stats to update, or None
+    :return: stream of (factor, coefficients in T) to be summed
     """
-    used = {eid: 0 for eid in g.edges}
-    cs = []
-    dfs2(g, s, v, used, cs)
-    res = [{eid: 2 - used[eid] % 2 for eid in g.edges} for used in cs]
-    res = unique(res)
-    res1 = [[(g.edges[eid][0], c) for eid, c in cs] for cs in res]
-    return res1
+    current = None
+    for mask, weight, ism, routes in patterns:
+        # Patterns of a subgraph come together, R_k is computed once
+        if mask != current:
+            current = mask
+            eids = list(bits(mask))
+            Rk = rk_coefficients(len(eids), [lengths[eid] * 2 for eid in eids])
+            # A route passes odd edges once and all other edges twice
+            doubled = sum(lengths[eid] * 2 for eid in eids)
+        if ism is not None:
+            Rk_ism = rk_coefficients(
+                len(eids) - 1, [lengths[eid] * 2 for eid in eids if eid != ism]
+            )
+        for odd in routes:
+            check_cancelled()
+            c = doubled - sum(lengths[eid] for eid in bits(odd))
+            if stats is not None:
+                stats.counters["substitutions"] += bool(weight) + (ism is not None)
+            if weight:
+                yield weight, taylor_shift(Rk, c)
+            # Isthmus separates s and v, so every route passes it once,
+            # and shifts stay the same
+            if ism is not None:
+                yield 1, taylor_shift(Rk_ism, c)
 
 
-def dfs3(g: Graph, v: int, banned: str, used: dict[int, bool]) -> None:
+class ContributionMemo:
     """
-    Dfs-like function for finding an isthmus
-    :param g: graph representation
-    :param v: starting vertex
-    :param banned: edge id for the banned edge
-    :param used: showing if the edge is banned
-    :return: None
-    """
-    used[v] = True
-    for edge in g.g[v]:
-        if edge.eid == banned:
+    Contributions of connected subgraphs to point counting polynomial,
+    shared by subgraphs which are isomorphic as rooted graphs with the
+    same outer degrees (vertex degree in graph minus degree in subgraph)
+    and, for numeric lengths, the same edge lengths. Symbolic contributions
+    are stored as templates, where variable j is the length of edge j of
+    the canonical form, and are relabelled for every subgraph.
+    Entries are evicted in LRU order. The memo turns itself off
+    if few lookups hit, see MEMO_PROBE_LOOKUPS
+    """
+    def __init__(self, cg: CompactGraph, s: int,
+                 lengths: Optional[list[Fraction]],
+                 maxsize: int = CONTRIBUTION_MEMO_SIZE,
+                 stats: Optional[BuildStats] = None):
+        """
+        Constructor for contribution memo
+        :param cg: graph representation
+        :param s: starting vertex
+        :param lengths: numeric edge lengths, or None for symbolic lengths
+        :param maxsize: maximal number of memoized contributions
+        :param stats: stats to update, or None
+        """
+        self.cg = cg
+        self.s = s
+        self.lengths = lengths
+        self.maxsize = maxsize
+        self.stats = stats
+        self.entries: OrderedDict[tuple, list] = OrderedDict()
+        self.degrees = [cg.degree(v, cg.full_mask) for v in range(len(cg.vertices))]
+        self.enabled = True
+        self.lookups = 0
+        self.hits = 0
+
+    def compute(self, mask: int) -> list:
+        """
+        Compute contribution of a connected subgraph without the memo
+        :param mask: subgraph edge mask
+        :return: coefficients of contribution, see build_numeric and
+        build_symbolic
+        """
+        cg = self.cg
+        patterns = route_patterns(cg, self.s, [mask], self.stats)
+        if self.lengths is not None:
+            return accumulate(
+                [Fraction(0)] * (len(cg.edges) + 1),
+                numeric_contributions(cg, self.lengths, patterns, self.stats),
+            )
+        return accumulate(
+            [LaurentPoly() for _ in range(len(cg.edges) + 1)],
+            symbolic_contributions(cg, patterns, self.stats),
+        )
+
+    def contribution(self, mask: int) -> list:
+        """
+        Get contribution of a connected subgraph
+        :param mask: subgraph edge mask
+        :return: coefficients of contribution, see build_numeric and
+        build_symbolic. Numeric coefficients are shared and must not
+        be modified
+        """
+        if not self.enabled:
+            return self.compute(mask)
+        cg = self.cg
+        form = graph_form(
+            cg, mask, root=self.s,
+            vertex_labels=[
+                degree - cg.degree(v, mask) for v, degree in enumerate(self.degrees)
+            ],
+            edge_colors=self.lengths,
+        )
+        template = self.entries.get(form.key)
+        if self.stats is not None:
+            self.stats.counters["memo_misses" if template is None else "memo_hits"] += 1
+        self.lookups += 1
+        self.hits += template is not None
+        if (self.lookups == MEMO_PROBE_LOOKUPS
+                and self.hits < MEMO_MIN_HIT_RATE * self.lookups):
+            self.enabled = False
+            self.entries.clear()
+        if template is not None:
+            self.entries.move_to_end(form.key)
+        else:
+            N = self.compute(mask)
+            if self.lengths is not None:
+                template = N
+            else:
+                template = [
+                    LaurentPoly({
+                        tuple(exps[eid] for eid in form.edge_order): c
+                        for exps, c in poly.terms.items()
+                    })
+                    for poly in N
+                ]
+            if self.enabled:
+                self.entries[form.key] = template
+                if len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+            if self.lengths is None:
+                return N
+        if self.lengths is not None:
+            return template
+        m = len(cg.edges)
+        res = []
+        for poly in template:
+            terms = {}
+            for template_exps, c in poly.terms.items():
+                exps = [0] * m
+                for eid, e in zip(form.edge_order, template_exps):
+                    exps[eid] = e
+                terms[tuple(exps)] = c
+            res.append(LaurentPoly(terms))
+        return res
+
+
+class SubgraphOrbits:
+    """
+    Orbits of edge masks under automorphisms of graph, which fix the
+    starting vertex and edge lengths. Subgraphs in one orbit contribute
+    equally to the polynomial, so only the orbit representative
+    (the smallest mask) is computed, with orbit size as a weight
+    """
+    def __init__(self, cg: CompactGraph, s: int, lengths: list[Fraction]):
+        """
+        Constructor for subgraph orbits. Automorphism group is found once
+        :param cg: graph representation
+        :param s: starting vertex
+        :param lengths: numeric edge lengths
+        """
+        # Generators act on masks byte by byte through lookup tables,
+        # bits past the last edge are never set
+        m = len(cg.edges)
+        self.tables = []
+        for perm in edge_automorphisms(cg, s, lengths):
+            self.tables.append([
+                [
+                    sum(1 << perm[offset + i] for i in bits(byte) if offset + i < m)
+                    for byte in range(256)
+                ]
+                for offset in range(0, m, 8)
+            ])
+
+    def image(self, mask: int, table: list[list[int]]) -> int:
+        """
+        Apply automorphism to edge mask
+        :param mask: edge mask
+        :param table: lookup table of automorphism
+        :return: image of mask
+        """
+        res = 0
+        for chunk in table:
+            res |= chunk[mask & 255]
+            mask >>= 8
+        return res
+
+    def orbit_size(self, mask: int) -> int:
+        """
+        Compute orbit size of a mask, if it is the orbit representative
+        :param mask: edge mask
+        :return: orbit size, or 0 if orbit has a smaller mask
+        """
+        orbit = {mask}
+        stack = [mask]
+        while stack:
+            current = stack.pop()
+            for table in self.tables:
+                image = self.image(current, table)
+                if image < mask:
+                    return 0
+                if image not in orbit:
+                    orbit.add(image)
+                    stack.append(image)
+        return len(orbit)
+
+    def representatives(self, masks: Iterable[int]) -> Iterator[tuple[int, int]]:
+        """
+        Filter stream of subgraphs down to orbit representatives
+        :param masks: stream of edge masks, closed under automorphisms
+        :return: stream of (representative mask, orbit size)
+        """
+        for mask in masks:
+            size = self.orbit_size(mask)
+            if size:
+                yield mask, size
+
+
+def weighted_contributions(cg: CompactGraph, s: int, lengths: list[Fraction],
+                           weighted_masks: Iterable[tuple[int, int]],
+                           memo: Optional[ContributionMemo] = None,
+                           stats: Optional[BuildStats] = None
+                           ) -> Iterator[tuple[int, list[Fraction]]]:
+    """
+    Replacement of the second and third stages of the pipeline for
+    orbit representatives: contributions of whole subgraphs, multiplied
+    by orbit sizes
+    :param cg: graph representation
+    :param s: starting vertex
+    :param lengths: edge lengths, lengths[eid] for edge eid
+    :param weighted_masks: stream of (subgraph mask, weight)
+    :param memo: memo for contributions of isomorphic subgraphs, or None
+    :param stats: stats to update, or None
+    :return: stream of (factor, coefficients in T) to be summed
+    """
+    for mask, weight in weighted_masks:
+        if stats is not None:
+            stats.counters["representatives"] += 1
+        if memo is not None:
+            yield weight, memo.contribution(mask)
             continue
-        if not used[edge.end]:
-            dfs3(g, edge.end, banned, used)
+        patterns = route_patterns(cg, s, [mask], stats)
+        for factor, coeffs in numeric_contributions(cg, lengths, patterns, stats):
+            yield weight * factor, coeffs
 
 
-def get_isthmus(g: Graph, s: int, v: int) -> Optional[Edge]:
+def memoized_contributions(memo: ContributionMemo, masks: Iterable[int]
+                           ) -> Iterator[tuple[int, list]]:
     """
-    Get isthmus for vertex v, with starting vertex s
-    :param g: graph representation
+    Replacement of the second and third stages of the pipeline:
+    contributions of whole subgraphs, memoized on isomorphism classes
+    :param memo: contribution memo
+    :param masks: stream of connected subgraphs, as edge masks
+    :return: stream of (factor, coefficients in T) to be summed
+    """
+    for mask in masks:
+        yield 1, memo.contribution(mask)
+
+
+def accumulate(N: list, contributions: Iterable[tuple[int, list]],
+               stats: Optional[BuildStats] = None) -> list:
+    """
+    Last stage of the pipeline: sum the stream of contributions.
+    With stats, time spent in the stream, except enumeration and routes,
+    is added to contributions phase, and the rest to accumulation phase
+    :param N: coefficients to add to, numbers or Laurent polynomials.
+    Laurent polynomials are updated in place
+    :param contributions: stream of (factor, coefficients)
+    :param stats: stats to update, or None
+    :return: N
+    """
+    if stats is not None:
+        before = dict(stats.seconds)
+        start = time.perf_counter()
+        contributions = timed_stream(contributions, stats, "contributions")
+    if N and isinstance(N[0], LaurentPoly):
+        for factor, coeffs in contributions:
+            for i, a in enumerate(coeffs):
+                N[i].add(a, factor)
+    else:
+        for factor, coeffs in contributions:
+            for i, a in enumerate(coeffs):
+                N[i] += factor * a
+    if stats is not None:
+        elapsed = time.perf_counter() - start
+        delta = {phase: stats.seconds[phase] - before[phase] for phase in before}
+        stats.seconds["contributions"] -= delta["enumeration"] + delta["routes"]
+        stats.seconds["accumulation"] += elapsed - delta["contributions"]
+    return N
+
+
+def build_numeric(cg: CompactGraph, s: int, lengths: list[Fraction],
+                  masks: Optional[Iterable[int]] = None,
+                  memo: Optional[ContributionMemo] = None,
+                  orbits: Optional[SubgraphOrbits] = None,
+                  stats: Optional[BuildStats] = None) -> list[Fraction]:
+    """
+    Compute point counting polynomial for graph with numeric edge
+    lengths. Same as build, but every R_k is a list of exact
+    coefficients, and substitution lambda = T - c is a Taylor shift.
+    Subgraphs, routes and contributions are streamed, so memory does
+    not depend on the number of subgraphs and routes
+    :param cg: graph representation
     :param s: starting vertex
-    :param v: vertex for isthmus finding
-    :return:
-    Edge, if there is an isthmus near, connected with vertex v
-    None either
+    :param lengths: edge lengths, lengths[eid] for edge eid
+    :param masks: connected subgraphs to sum over, all if None
+    :param memo: memo for contributions of isomorphic subgraphs,
+    None to compute every contribution
+    :param orbits: automorphism orbits of subgraphs, None to compute
+    every subgraph. Masks must be closed under automorphisms
+    :param stats: stats to update, or None. Memo should share the stats
+    :return: coefficients of polynomial, list index is the power of T
     """
-    if len(g.g[v]) == 1:
-        return None
-    for elem in g.g[v]:
-        used = {i: False for i in g.g}
-        dfs3(g, s, elem.eid, used)
-        if not used[v]:
-            return elem
-    return None
+    if masks is None:
+        masks = connected_subgraphs(cg, s)
+    if stats is not None:
+        masks = timed_stream(masks, stats, "enumeration", "subgraphs")
+    if orbits is not None:
+        contributions = weighted_contributions(
+            cg, s, lengths, orbits.representatives(masks), memo, stats
+        )
+    elif memo is not None:
+        contributions = memoized_contributions(memo, masks)
+    else:
+        contributions = numeric_contributions(
+            cg, lengths, route_patterns(cg, s, masks, stats), stats
+        )
+    return accumulate([Fraction(0)] * (len(cg.edges) + 1), contributions, stats)
 
 
-def build(n: int, m: int, g: Graph) -> sympy.core.Expr:
+def instantiate_rk(k: int, eids: list[int], m: int) -> list[LaurentPoly]:
     """
-    Compute point counting polynomial for graph g
-    :param n: number of vertex in graph g
-    :param m: number of edges in graph g
-    :param g: graph representation
-    :return:
-    Point counting polynomial for graph g. See more at
-    https://link.springer.com/article/10.1134/S1560354717080032
+    Substitute w_i = 2 * t_{eids[i]} into compiled R_k
+    :param k: number of subgraph edges
+    :param eids: subgraph edge ids
+    :param m: number of edges in graph, number of variables
+    :return: coefficients of R_k as a polynomial in lambda, every
+    coefficient is a Laurent polynomial in t_0..t_{m-1}
     """
-    T = sympy.Symbol("T")
+    res = []
+    for poly in rk_template(k):
+        terms = {}
+        for exps, coefficient in poly.terms.items():
+            new_exps = [0] * m
+            for eid, e in zip(eids, exps):
+                new_exps[eid] = e
+            terms[tuple(new_exps)] = coefficient * Fraction(2) ** sum(exps)
+        res.append(LaurentPoly(terms))
+    return res
 
-    s = 0
-    l = sympy.Symbol("lambda")
-    ws = [sympy.Symbol(f"w_{i}") for i in range(1, m + 2)]
-    Rks = [build_rk(i, l, ws[:i]) for i in range(m + 1)]
 
-    # Computing first part
-    R1 = sympy.S.Zero
-    for sub_g in get_all_subg(g, s):
-        ts2 = [edges[0].t * 2 for eid, edges in sub_g.edges.items()]
-        Rk = Rks[len(ts2)].subs([(w, t2) for w, t2 in zip(ws, ts2)])
-        res1 = sympy.S.Zero
+def symbolic_contributions(cg: CompactGraph,
+                           patterns: Iterable[RoutePattern],
+                           stats: Optional[BuildStats] = None
+                           ) -> Iterator[tuple[int, list[LaurentPoly]]]:
+    """
+    Third stage of the pipeline for symbolic edge lengths: turn every
+    route into shifted R_k coefficients
+    :param cg: graph representation
+    :param patterns: stream of routes, see route_patterns
+    :param stats: stats to update, or None
+    :return: stream of (factor, coefficients in T) to be summed,
+    coefficients are Laurent polynomials in edge lengths
+    """
+    m = len(cg.edges)
+    unit = [tuple(int(i == eid) for i in range(m)) for eid in range(m)]
+    current = None
+    for mask, weight, ism, routes in patterns:
+        # Patterns of a subgraph come together, R_k is instantiated once
+        if mask != current:
+            current = mask
+            eids = list(bits(mask))
+            Rk = instantiate_rk(len(eids), eids, m)
+        if ism is not None:
+            Rk_ism = instantiate_rk(
+                len(eids) - 1, [eid for eid in eids if eid != ism], m
+            )
+        for odd in routes:
+            check_cancelled()
+            # A route passes odd edges once and all other edges twice
+            c = LaurentPoly({
+                unit[eid]: 1 if odd >> eid & 1 else 2 for eid in eids
+            })
+            if stats is not None:
+                stats.counters["substitutions"] += bool(weight) + (ism is not None)
+            if weight:
+                yield weight, taylor_shift(Rk, c)
+            # Isthmus separates s and v, so every route passes it once,
+            # and shifts stay the same
+            if ism is not None:
+                yield 1, taylor_shift(Rk_ism, c)
 
-        # Iterating through all vertex in every subgraph
-        for v in sub_g.g:
-            res2 = sympy.S.Zero
-            for cs in all_routes(sub_g, s, v):
-                res2 += Rk.subs([(l, T - sum(c * edge.t for edge, c in cs))])
-            # Multiplying result with difference in difference between
-            # subgraph vertex degrees
-            res1 += (len(g.g[v]) - len(sub_g.g[v])) * res2
-        R1 += res1
 
-    # Computing first part -- with isthmus
-    R2 = sympy.S.Zero
-    for sub_g in get_all_subg(g, s):
-        res3 = sympy.S.Zero
+def build_symbolic(cg: CompactGraph, s: int,
+                   masks: Optional[Iterable[int]] = None,
+                   memo: Optional[ContributionMemo] = None,
+                   stats: Optional[BuildStats] = None) -> list[LaurentPoly]:
+    """
+    Compute point counting polynomial for graph with symbolic edge
+    lengths. Every R_k is compiled once into a table of coefficients
+    in lambda, and substitution lambda = T - c is a Taylor shift.
+    Subgraphs, routes and contributions are streamed, as in build_numeric
+    :param cg: graph representation
+    :param s: starting vertex
+    :param masks: connected subgraphs to sum over, all if None
+    :param memo: memo for contributions of isomorphic subgraphs,
+    None to compute every contribution
+    :param stats: stats to update, or None. Memo should share the stats
+    :return: coefficients of polynomial, list index is the power of T.
+    Coefficients are Laurent polynomials in edge lengths,
+    variable i is the length of edge i
+    """
+    if masks is None:
+        masks = connected_subgraphs(cg, s)
+    if stats is not None:
+        masks = timed_stream(masks, stats, "enumeration", "subgraphs")
+    if memo is not None:
+        contributions = memoized_contributions(memo, masks)
+    else:
+        contributions = symbolic_contributions(
+            cg, route_patterns(cg, s, masks, stats), stats
+        )
+    return accumulate(
+        [LaurentPoly() for _ in range(len(cg.edges) + 1)], contributions, stats
+    )
 
-        # Iterating through all vertex in every subgraph
-        for v in sub_g.g:
-            ism = get_isthmus(sub_g, s, v)
-            if ism is None:
-                continue
-            ts2 = [
-                edges[0].t * 2
-                for eid, edges in sub_g.edges.items()
-                if eid != ism.eid
-            ]
-            Rk = Rks[len(ts2)].subs([(w, t2) for w, t2 in zip(ws, ts2)])
-            res4 = sympy.S.Zero
-            for cs in all_routes(sub_g, s, v):
-                res4 += Rk.subs(
-                    [
-                        (
-                            l,
-                            T
-                            - sum(
-                                c * edge.t
-                                for edge, c in cs
-                                if edge.eid != ism.eid
-                            )
-                            - ism.t,
-                        )
-                    ]
-                )
-            # Here is isthmus, only +1 point at every time
-            res3 += res4
-        R2 += res3
 
-    R1 = sympy.simplify(R1)
-    R2 = sympy.simplify(R2)
-    N = sympy.simplify(sympy.Poly(R1, T) + sympy.Poly(R2, T))
+def build_part(cg: CompactGraph, s: int, lengths: Optional[list[Fraction]],
+               states: list[tuple[int, int, int]], memoize: bool = True,
+               progress: Optional[Progress] = None,
+               memo: Optional[ContributionMemo] = None
+               ) -> tuple[list, BuildStats]:
+    """
+    Compute partial sum of point counting polynomial over connected
+    subgraphs, enumerated from given states. Used by worker processes
+    :param cg: graph representation
+    :param s: starting vertex
+    :param lengths: numeric edge lengths, or None for symbolic lengths
+    :param states: enumeration states, see split_subgraphs
+    :param memoize: share contributions of isomorphic subgraphs,
+    see ContributionMemo
+    :param progress: progress to advance by every subgraph, or None.
+    Not picklable, so only for parts computed in the current process
+    :param memo: contribution memo shared with other parts computed in
+    the current process, or None to build one for this part
+    :return: coefficients of partial sum, see build_numeric and
+    build_symbolic, and stats of the part
+    """
+    stats = BuildStats()
+    stats.counters["parts"] = 1
+    masks = chain.from_iterable(
+        connected_subgraphs(cg, s, state) for state in states
+    )
+    if progress is not None:
+        masks = tracked(masks, progress)
+    if memo is not None:
+        memo.stats = stats
+    elif memoize:
+        memo = ContributionMemo(cg, s, lengths, stats=stats)
+    if lengths is not None:
+        return build_numeric(cg, s, lengths, masks, memo, stats=stats), stats
+    return build_symbolic(cg, s, masks, memo, stats), stats
+
+
+def merge_sums(N: Optional[list], part: list) -> list:
+    """
+    Merge partial sums of point counting polynomial
+    :param N: accumulated coefficients, None if nothing is accumulated.
+    Symbolic coefficients are updated in place
+    :param part: coefficients of a partial sum
+    :return: coefficients of merged sum
+    """
+    if N is None:
+        return part
+    if part and isinstance(part[0], LaurentPoly):
+        for a, b in zip(N, part):
+            a.add(b)
+        return N
+    return [a + b for a, b in zip(N, part)]
+
+
+def build_parts(cg: CompactGraph, s: int, lengths: Optional[list[Fraction]],
+                workers: int, checkpoint: Optional[Checkpoint] = None,
+                memoize: bool = True,
+                stats: Optional[BuildStats] = None,
+                progress: Optional[Progress] = None) -> list:
+    """
+    Compute point counting polynomial by parts. Enumeration of
+    connected subgraphs is split into parts, partial sums are merged
+    as parts are finished. Parts are computed in a process pool if
+    workers > 1. With checkpoint, finished parts and their merged sum
+    are saved periodically, and a restarted build on the same graph
+    and lengths continues from the saved state
+    :param cg: graph representation
+    :param s: starting vertex
+    :param lengths: numeric edge lengths, or None for symbolic lengths
+    :param workers: number of worker processes
+    :param checkpoint: checkpoint storage, None to keep state in memory only
+    :param memoize: share contributions of isomorphic subgraphs
+    :param stats: stats to add stats of computed parts to, or None
+    :param progress: progress of the build, or None. Its total is set
+    to the number of parts left. Worker processes do not check the
+    cancellation token, so on cancel the running parts are finished
+    and the rest are dropped
+    :return: coefficients of polynomial, see build_numeric and
+    build_symbolic
+    """
+    key = fingerprint((
+        tuple((edge.begin, edge.end) for edge in cg.edges),
+        s,
+        None if lengths is None else tuple(map(str, lengths)),
+    ))
+    saved = checkpoint.load(key) if checkpoint is not None else None
+    if saved is not None:
+        states, done, N = saved
+    else:
+        # More parts than workers, so that unequal parts are balanced
+        parts = workers * PARTS_PER_WORKER
+        if checkpoint is not None:
+            parts = max(parts, CHECKPOINT_PARTS)
+        states, done, N = split_subgraphs(cg, s, parts), set(), None
+    todo = [i for i in range(len(states)) if i not in done]
+    if progress is not None:
+        # Parts are the work units, counting subgraphs in advance would
+        # take another enumeration before the first report
+        progress.total = len(todo)
+
+    def finished(i: int, part: list, part_stats: BuildStats) -> None:
+        nonlocal N
+        N = merge_sums(N, part)
+        if stats is not None:
+            stats.merge(part_stats)
+        done.add(i)
+        if checkpoint is not None:
+            checkpoint.save(key, (states, done, N))
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(build_part, cg, s, lengths, [states[i]], memoize): i
+                for i in todo
+            }
+            pending = set(futures)
+            try:
+                while pending:
+                    done_futures, pending = wait(
+                        pending, CANCEL_POLL_SECONDS, FIRST_COMPLETED
+                    )
+                    for future in done_futures:
+                        i = futures[future]
+                        finished(i, *future.result())
+                        if progress is not None:
+                            progress.advance()
+                    if progress is not None:
+                        progress.check()
+            except BaseException:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+    else:
+        # Isomorphic subgraphs are spread over parts, so parts share the memo
+        memo = ContributionMemo(cg, s, lengths) if memoize else None
+        # Token is still checked after every subgraph
+        subgraphs = Progress(token=progress.token) if progress is not None else None
+        for i in todo:
+            finished(i, *build_part(
+                cg, s, lengths, [states[i]], memoize, subgraphs, memo
+            ))
+            if progress is not None:
+                progress.advance()
+
+    if checkpoint is not None:
+        checkpoint.remove(key)
     return N
 
 
+def build_with_stats(n: int, m: int, g: Graph,
+                     lengths: Optional[list[Union[int, float, Fraction]]] = None,
+                     workers: int = 1,
+                     checkpoint: Optional[Checkpoint] = None,
+                     memoize: bool = True,
+                     symmetry: bool = False,
+                     profile: Optional[Union[str, Path]] = None,
+                     token: Optional[CancellationToken] = None,
+                     progress: Optional[ProgressCallback] = None
+                     ) -> tuple[sympy.Poly, BuildStats]:
+    """
+    Compute point counting polynomial for graph g, with counters and
+    timers of the build. Parameters are the same as in build
+    :param profile: file for cProfile statistics of the build, in pstats
+    format (readable by pstats, snakeviz, flameprof and gprof2dot).
+    Worker processes are not profiled. None to not profile
+    :return: point counting polynomial and BuildStats
+    """
+    stats = BuildStats()
+    profiler = cProfile.Profile() if profile is not None else None
+    start = time.perf_counter()
+    if profiler is not None:
+        profiler.enable()
+    try:
+        T = sympy.Symbol("T")
+
+        cg = CompactGraph.from_graph(g)
+        s = cg.index[0]
+        ts = [edge.t for edge in cg.edges]
+        if lengths is None:
+            lengths = numeric_lengths(ts)
+        else:
+            if len(lengths) != len(cg.edges):
+                raise ValueError(
+                    f"expected {len(cg.edges)} edge lengths, got {len(lengths)}"
+                )
+            lengths = numeric_lengths(lengths)
+            if lengths is None:
+                raise ValueError("edge lengths must be exact numbers")
+        tracker = None
+        if token is not None or progress is not None:
+            tracker = Progress(callback=progress, token=token)
+        # Token is also checked between routes, as a large subgraph
+        # may take long
+        with cancellable(token):
+            if workers > 1 or checkpoint is not None:
+                N = build_parts(
+                    cg, s, lengths, workers, checkpoint, memoize, stats, tracker
+                )
+            else:
+                masks = None
+                if tracker is not None:
+                    if progress is not None:
+                        tracker.total = sum(1 for _ in connected_subgraphs(cg, s))
+                    masks = tracked(connected_subgraphs(cg, s), tracker)
+                memo = ContributionMemo(cg, s, lengths, stats=stats) if memoize else None
+                if lengths is not None:
+                    orbits = SubgraphOrbits(cg, s, lengths) if symmetry else None
+                    N = build_numeric(cg, s, lengths, masks, memo, orbits, stats)
+                else:
+                    N = build_symbolic(cg, s, masks, memo, stats)
+
+        conversion_start = time.perf_counter()
+        if lengths is not None:
+            poly = sympy.Poly(
+                [sympy.Rational(c.numerator, c.denominator) for c in reversed(N)],
+                T,
+            )
+        else:
+            poly = sympy.Poly(
+                sympy.Add(*[
+                    T ** power * coefficient.as_expr(ts)
+                    for power, coefficient in enumerate(N)
+                ]),
+                T,
+            )
+        stats.seconds["conversion"] += time.perf_counter() - conversion_start
+        if tracker is not None:
+            tracker.finish()
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile)
+    stats.total = time.perf_counter() - start
+    return poly, stats
+
+
+def build(n: int, m: int, g: Graph,
+          lengths: Optional[list[Union[int, float, Fraction]]] = None,
+          workers: int = 1,
+          checkpoint: Optional[Checkpoint] = None,
+          memoize: bool = True,
+          symmetry: bool = False,
+          token: Optional[CancellationToken] = None,
+          progress: Optional[ProgressCallback] = None) -> sympy.Poly:
+    """
+    Compute point counting polynomial for graph g.
+    If all edge lengths are exact numbers, or lengths are given,
+    polynomial is computed with exact rational coefficients, without
+    building symbolic expressions
+    :param n: number of vertex in graph g
+    :param m: number of edges in graph g
+    :param g: graph representation
+    :param lengths: numeric edge lengths, in order of g.edges, converted
+    as in numeric_lengths. If None, lengths are taken from the graph
+    edges. ValueError is raised if lengths are not numbers or their
+    number differs from the number of edges
+    :param workers: number of worker processes, 1 to compute
+    in the current process
+    :param checkpoint: checkpoint storage for long builds, see build_parts.
+    None to compute without checkpoints
+    :param memoize: compute contributions of isomorphic rooted subgraphs
+    once, see ContributionMemo
+    :param symmetry: for numeric lengths, compute only one subgraph from
+    every orbit of the automorphism group fixing the starting vertex,
+    see SubgraphOrbits. Pays off for graphs with many symmetries.
+    Ignored with workers or checkpoint, as parts of enumeration are not
+    closed under automorphisms
+    :param token: cancellation token, checked after every subgraph.
+    Cancelled build raises backend.progress.Cancelled
+    :param progress: callback for fraction of subgraphs processed and
+    estimated remaining time, see backend.progress.ProgressCallback
+    :return:
+    Point counting polynomial for graph g. See more at
+    https://link.springer.com/article/10.1134/S1560354717080032
+    """
+    return build_with_stats(
+        n, m, g, lengths, workers, checkpoint, memoize, symmetry,
+        token=token, progress=progress,
+    )[0]
+
+
 def prepare_for_showing(polynomial: sympy.Poly) -> str:
     """
     Generate string for polynomial showing
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+# Progress callback: fraction of work done (None if unknown) and
+# estimated number of seconds remaining (None if unknown)
+ProgressCallback = Callable[[Optional[float], Optional[float]], None]
+
+# Minimal number of seconds between progress reports
+REPORT_INTERVAL = 0.2
+
+Item = TypeVar("Item")
+
+
+class Cancelled(Exception):
+    """
+    Raised inside a computation whose cancellation token was cancelled
+    """
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag. The computation checks the token at
+    safe points and stops with Cancelled, the token may be cancelled
+    from any thread
+    """
+    def __init__(self):
+        """
+        Constructor for token, not cancelled
+        """
+        self.event = threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Request cancellation
+        :return: None
+        """
+        self.event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.event.is_set()
+
+    def check(self) -> None:
+        """
+        Stop computation if cancellation was requested
+        :return: None
+        """
+        if self.event.is_set():
+            raise Cancelled()
+
+
+class Progress:
+    """
+    Counter of done work units. Reports fraction of work done and an
+    estimate of remaining time to callback, at most once per
+    REPORT_INTERVAL seconds, and checks cancellation token on every unit
+    """
+    def __init__(self, total: Optional[int] = None,
+                 callback: Optional[ProgressCallback] = None,
+                 token: Optional[CancellationToken] = None):
+        """
+        Constructor for progress
+        :param total: number of work units, None if unknown
+        :param callback: progress callback, or None
+        :param token: cancellation token, or None
+        """
+        self.total = total
+        self.callback = callback
+        self.token = token
+        self.done = 0
+        self.start = time.monotonic()
+        self.last_report = self.start
+
+    def check(self) -> None:
+        """
+        Stop computation if its token was cancelled
+        :return: None
+        """
+        if self.token is not None:
+            self.token.check()
+
+    def advance(self, units: int = 1) -> None:
+        """
+        Mark work units as done
+        :param units: number of units
+        :return: None
+        """
+        self.check()
+        self.done += units
+        if self.callback is not None:
+            now = time.monotonic()
+            if now - self.last_report >= REPORT_INTERVAL:
+                self.last_report = now
+                self.report(now)
+
+    def report(self, now: Optional[float] = None) -> None:
+        """
+        Report progress to callback regardless of interval
+        :param now: current time.monotonic(), if known
+        :return: None
+        """
+        if self.callback is None:
+            return
+        if not self.total:
+            self.callback(None, None)
+            return
+        if now is None:
+            now = time.monotonic()
+        fraction = min(1.0, self.done / self.total)
+        # Remaining work is assumed to go at the average speed so far
+        remaining = (
+            (now - self.start) * (1 - fraction) / fraction if fraction else None
+        )
+        self.callback(fraction, remaining)
+
+    def finish(self) -> None:
+        """
+        Report that all work is done
+        :return: None
+        """
+        if self.total is not None:
+            self.done = self.total
+        if self.callback is not None:
+            self.callback(1.0, 0.0)
+
+
+# Cancellation token of the computation running in the current thread,
+# for inner loops and memoized recursion, which can not take it as an argument
+current_token: ContextVar[Optional[CancellationToken]] = ContextVar(
+    "current_token", default=None
+)
+
+
+def check_cancelled() -> None:
+    """
+    Stop computation running in the current thread, if its token
+    was cancelled, see cancellable
+    :return: None
+    """
+    token = current_token.get()
+    if token is not None:
+        token.check()
+
+
+@contextmanager
+def cancellable(token: Optional[CancellationToken]) -> Iterator[None]:
+    """
+    Make token current for check_cancelled within the block
+    :param token: cancellation token, or None
+    :return: context manager
+    """
+    reset = current_token.set(token)
+    try:
+        yield
+    finally:
+        current_token.reset(reset)
+
+
+def tracked(stream: Iterable[Item], progress: Progress) -> Iterator[Item]:
+    """
+    Pass stream through, counting every item as a work unit. An item is
+    counted when the next one is requested, that is when the
+    following stages are done with it
+    :param stream: stream of work units
+    :param progress: progress to advance
+    :return: the same stream
+    """
+    for item in stream:
+        yield item
+        progress.advance()
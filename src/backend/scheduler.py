@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Optional
+
+from backend import critical, ehrhart, pc_polynomial, tutte
+from backend.canonical import graph_form
+from backend.checkpoint import Checkpoint
+from backend.graph_utils import CompactGraph, Graph
+from backend.progress import CancellationToken, Cancelled, ProgressCallback
+
+# Seconds between polls of a cancellation event shared between
+# processes, every poll is a round trip to the manager process
+TOKEN_POLL_SECONDS = 0.05
+
+# Number of finished results kept for repeated requests
+RESULT_CACHE_SIZE = 128
+
+# Seconds given to running jobs on shutdown to stop at a cancellation
+# check, before their worker processes are terminated
+SHUTDOWN_GRACE_SECONDS = 1.0
+
+# Result callback: True and result, or False and exception
+ResultCallback = Callable[[bool, Any], None]
+
+
+def build_pc(n: int, m: int, g: Graph,
+             token: Optional[CancellationToken] = None,
+             progress: Optional[ProgressCallback] = None):
+    """
+    Build PC polynomial with checkpoints, see pc_polynomial.build
+    """
+    # Long builds survive restarts of the application
+    return pc_polynomial.build(
+        n, m, g, checkpoint=Checkpoint(), token=token, progress=progress
+    )
+
+
+# Polynomial kind -> builder, builders accept token and progress
+BUILDERS: dict[str, Callable] = {
+    "pc": build_pc,
+    "critical": critical.build,
+    "ehrhart": ehrhart.build,
+}
+
+
+def job_key(kind: str, g: Graph) -> Hashable:
+    """
+    Identify computation of a polynomial up to renaming of vertices.
+    PC polynomial depends on lengths of edges and on the starting
+    vertex 0, Tutte specializations depend on isomorphism class only
+    :param kind: polynomial kind, key of BUILDERS
+    :param g: graph representation
+    :return: hashable key, equal for computations with equal results
+    """
+    cg = CompactGraph.from_graph(g)
+    if kind == "pc":
+        form = graph_form(
+            cg, root=cg.index[0], edge_colors=[str(edge.t) for edge in cg.edges]
+        )
+    else:
+        form = graph_form(cg)
+    return kind, form.key
+
+
+class SharedToken(CancellationToken):
+    """
+    Cancellation token of a job in a worker process, backed by an event
+    of the manager process. The event is polled at most once per
+    TOKEN_POLL_SECONDS
+    """
+    def __init__(self, event):
+        """
+        Constructor for shared token
+        :param event: manager Event proxy
+        """
+        self.event = event
+        self.last_poll = time.monotonic()
+
+    def check(self) -> None:
+        now = time.monotonic()
+        if now - self.last_poll >= TOKEN_POLL_SECONDS:
+            self.last_poll = now
+            super().check()
+
+
+def run_job(kind: str, n: int, m: int, g: Graph, job_id: int, event, queue) -> Any:
+    """
+    Compute polynomial in a worker process
+    :param kind: polynomial kind, key of BUILDERS
+    :param n: number of vertex in graph g
+    :param m: number of edges in graph g
+    :param g: graph representation
+    :param job_id: job identifier for progress messages
+    :param event: manager Event, set to cancel the job
+    :param queue: manager Queue for progress messages
+    (job_id, fraction, remaining)
+    :return: polynomial
+    """
+    def progress(fraction: Optional[float], remaining: Optional[float]) -> None:
+        queue.put((job_id, fraction, remaining))
+
+    return BUILDERS[kind](n, m, g, token=SharedToken(event), progress=progress)
+
+
+class Subscription:
+    """
+    Interest of one window in a job. Many subscriptions may share a job.
+    The job is None until the key of the request is computed
+    """
+    def __init__(self, scheduler: Scheduler,
+                 on_result: ResultCallback,
+                 on_progress: Optional[ProgressCallback]):
+        self.scheduler = scheduler
+        self.job: Optional[Job] = None
+        self.on_result = on_result
+        self.on_progress = on_progress
+
+    def cancel(self) -> None:
+        """
+        Stop waiting for the result, see Scheduler.unsubscribe
+        :return: None
+        """
+        self.scheduler.unsubscribe(self)
+
+
+class Job:
+    """
+    Computation in flight, shared by all subscriptions with equal keys
+    """
+    def __init__(self, job_id: int, key: Hashable, event):
+        self.id = job_id
+        self.key = key
+        self.event = event
+        self.future: Optional[Future] = None
+        self.subscribers: list[Subscription] = []
+        # Last reported fraction and remaining seconds, for late subscribers
+        self.progress: tuple[Optional[float], Optional[float]] = (None, None)
+
+
+class Scheduler:
+    """
+    Application-wide executor of polynomial builds. Requests are keyed
+    by polynomial kind and canonical graph, see job_key: a request
+    equal to a computation in flight joins it instead of starting
+    another one, and a request equal to a recently finished computation
+    gets its result at once. Keys are computed in a scheduler thread,
+    canonical forms of large graphs take a while. Jobs run in a bounded
+    pool of worker processes, so they do not compete with the interface
+    for the GIL. Callbacks are called from scheduler threads
+    """
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Constructor for scheduler. Processes are started on first submit
+        :param workers: number of worker processes, default is number of CPUs
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.lock = threading.Lock()
+        self.jobs: dict[Hashable, Job] = {}
+        self.jobs_by_id: dict[int, Job] = {}
+        # Key -> result of finished job, least recently used first
+        self.results: OrderedDict[Hashable, Any] = OrderedDict()
+        self.ids = itertools.count()
+        # Subscriptions whose keys are being computed
+        self.keying: set[Subscription] = set()
+        self.keyer = ThreadPoolExecutor(1, thread_name_prefix="scheduler-key")
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.manager = None
+        self.queue = None
+        self.listener: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Start worker processes, manager process for cancellation events
+        and progress queue, and progress listener. Called under lock
+        :return: None
+        """
+        # Forking a process with interface threads is unsafe
+        context = multiprocessing.get_context("spawn")
+        self.manager = context.Manager()
+        self.queue = self.manager.Queue()
+        # Every worker has its own memory, Tutte polynomials are shared
+        # between workers and sessions on disk
+        self.executor = ProcessPoolExecutor(
+            self.workers, mp_context=context, initializer=tutte.enable_disk_cache
+        )
+        self.listener = threading.Thread(target=self.listen, daemon=True)
+        self.listener.start()
+
+    def submit(self, kind: str, n: int, m: int, g: Graph,
+               on_result: ResultCallback,
+               on_progress: Optional[ProgressCallback] = None
+               ) -> Subscription:
+        """
+        Request a polynomial. Callbacks are called for the job computing
+        it, which may be shared with earlier requests
+        :param kind: polynomial kind, key of BUILDERS
+        :param n: number of vertex in graph g
+        :param m: number of edges in graph g
+        :param g: graph representation
+        :param on_result: called once with the result or exception.
+        A cancelled request gets backend.progress.Cancelled
+        :param on_progress: called with fraction done and remaining
+        seconds, or None
+        :return: subscription to cancel the request
+        """
+        subscription = Subscription(self, on_result, on_progress)
+        with self.lock:
+            self.keying.add(subscription)
+        self.keyer.submit(self.attach, subscription, kind, n, m, g)
+        return subscription
+
+    def attach(self, subscription: Subscription, kind: str, n: int, m: int,
+               g: Graph) -> None:
+        """
+        Compute key of a request, then deliver cached result, join the
+        job in flight or start a new one. Called in the key thread
+        :param subscription: subscription returned by submit
+        :param kind: polynomial kind, key of BUILDERS
+        :param n: number of vertex in graph g
+        :param m: number of edges in graph g
+        :param g: graph representation
+        :return: None
+        """
+        try:
+            key = job_key(kind, g)
+        except Exception as e:
+            with self.lock:
+                if subscription not in self.keying:
+                    return
+                self.keying.remove(subscription)
+            subscription.on_result(False, e)
+            return
+        with self.lock:
+            # Cancelled while its key was computed
+            if subscription not in self.keying:
+                return
+            self.keying.remove(subscription)
+            cached = key in self.results
+            if cached:
+                self.results.move_to_end(key)
+                result = self.results[key]
+            else:
+                job = self.jobs.get(key)
+                new = job is None
+                if new:
+                    if self.executor is None:
+                        self.start()
+                    job = Job(next(self.ids), key, self.manager.Event())
+                    self.jobs[key] = job
+                    self.jobs_by_id[job.id] = job
+                subscription.job = job
+                job.subscribers.append(subscription)
+                if new:
+                    job.future = self.executor.submit(
+                        run_job, kind, n, m, g, job.id, job.event, self.queue
+                    )
+                fraction, remaining = job.progress
+        if cached:
+            if subscription.on_progress is not None:
+                subscription.on_progress(1.0, 0.0)
+            subscription.on_result(True, result)
+        elif new:
+            # Called at once if the job is already done, so outside the lock
+            job.future.add_done_callback(lambda _, job=job: self.finished(job))
+        elif subscription.on_progress is not None:
+            subscription.on_progress(fraction, remaining)
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Cancel a request. The job is cancelled when no requests are
+        left, later requests for the same key start a new job
+        :param subscription: subscription returned by submit
+        :return: None
+        """
+        with self.lock:
+            job = subscription.job
+            if job is None:
+                if subscription not in self.keying:
+                    return
+                self.keying.remove(subscription)
+            else:
+                if subscription not in job.subscribers:
+                    return
+                job.subscribers.remove(subscription)
+                if not job.subscribers:
+                    job.event.set()
+                    job.future.cancel()
+                    if self.jobs.get(job.key) is job:
+                        del self.jobs[job.key]
+        subscription.on_result(False, Cancelled())
+
+    def finished(self, job: Job) -> None:
+        """
+        Deliver result of a finished job to all its subscribers
+        :param job: finished job
+        :return: None
+        """
+        with self.lock:
+            if self.jobs.get(job.key) is job:
+                del self.jobs[job.key]
+            self.jobs_by_id.pop(job.id, None)
+            subscribers, job.subscribers = job.subscribers, []
+            future = job.future
+            if future.cancelled():
+                ok, result = False, Cancelled()
+            elif future.exception() is not None:
+                ok, result = False, future.exception()
+            else:
+                ok, result = True, future.result()
+                self.results[job.key] = result
+                if len(self.results) > RESULT_CACHE_SIZE:
+                    self.results.popitem(last=False)
+        for subscription in subscribers:
+            subscription.on_result(ok, result)
+
+    def listen(self) -> None:
+        """
+        Forward progress messages of worker processes to subscribers,
+        until None is received
+        :return: None
+        """
+        while True:
+            message = self.queue.get()
+            if message is None:
+                return
+            job_id, fraction, remaining = message
+            with self.lock:
+                job = self.jobs_by_id.get(job_id)
+                if job is None:
+                    continue
+                job.progress = (fraction, remaining)
+                callbacks = [
+                    subscription.on_progress for subscription in job.subscribers
+                    if subscription.on_progress is not None
+                ]
+            for callback in callbacks:
+                callback(fraction, remaining)
+
+    def shutdown(self, grace: float = SHUTDOWN_GRACE_SECONDS) -> None:
+        """
+        Cancel all jobs and stop processes. Running jobs are given grace
+        seconds to stop at their next cancellation check, then their
+        worker processes are terminated, so the call is bounded in time.
+        All waiting requests get backend.progress.Cancelled
+        :param grace: number of seconds to wait for running jobs
+        :return: None
+        """
+        with self.lock:
+            executor, self.executor = self.executor, None
+            jobs = list(self.jobs_by_id.values())
+            self.jobs.clear()
+            subscriptions = list(self.keying)
+            self.keying = set()
+            for job in jobs:
+                subscriptions.extend(job.subscribers)
+                job.subscribers = []
+        self.keyer.shutdown(wait=False, cancel_futures=True)
+        for subscription in subscriptions:
+            subscription.on_result(False, Cancelled())
+        if executor is None:
+            return
+        for job in jobs:
+            job.event.set()
+        # Worker processes are not public, _processes is an internal
+        # attribute of ProcessPoolExecutor, a dict of pid -> process
+        # (None after shutdown, which drops it, so it is taken before)
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        deadline = time.monotonic() + grace
+        for process in processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+        self.queue.put(None)
+        self.listener.join()
+        self.manager.shutdown()
@@ -1,52 +1,193 @@
+from fractions import Fraction
+from functools import lru_cache
 from math import factorial
-from typing import Union
+from typing import Union, Optional, Iterator
 
 import sympy as sym
-from sympy import bernoulli
+from sympy.utilities.iterables import multiset_permutations
 
-from pre_calc import pre_calc
+from backend.laurent import LaurentPoly
+from backend.progress import check_cancelled
+from backend.symplex_counting import todd_precalc
 
+# Maximal number of memoized R_k templates. A template has about
+# C(2k, k) terms, so symbolic builds with more edges are out of reach
+RK_TEMPLATE_CACHE_SIZE = 16
+
+# Todd classes of already requested sizes, keyed by (s, n)
+_coefficients: dict[tuple[int, int], dict[tuple[int, ...], Fraction]] = {}
+
+
+@lru_cache(maxsize=None)
+def todd_series(n: int) -> tuple[Fraction, ...]:
+    """
+    Coefficients of Todd series x / (1 - e^(-x)) up to x^n,
+    i.e. B_i / i! with B_1 = 1/2. Computed by inverting the series
+    (1 - e^(-x)) / x
+    :param n: maximal power of x
+    :return: tuple of n + 1 exact coefficients
+    """
+    inverse = [Fraction((-1) ** j, factorial(j + 1)) for j in range(n + 1)]
+    res = [Fraction(1)]
+    for i in range(1, n + 1):
+        res.append(-sum(res[j] * inverse[i - j] for j in range(i)))
+    return tuple(res)
+
+
+@lru_cache(maxsize=None)
+def log_todd_series(n: int) -> tuple[Fraction, ...]:
+    """
+    Coefficients of log(x / (1 - e^(-x))) up to x^n. With them
+    td(w_1 x) * ... * td(w_n x) = exp(sum_k c_k * p_k(w) * x^k),
+    where p_k is k-th power sum
+    :param n: maximal power of x
+    :return: tuple of n + 1 exact coefficients, c_0 = 0
+    """
+    series = todd_series(n)
+    res = [Fraction(0)]
+    for k in range(1, n + 1):
+        res.append(
+            series[k]
+            - sum((j * res[j] * series[k - j] for j in range(1, k)),
+                  Fraction(0)) / k
+        )
+    return tuple(res)
 
-def td(s: int, ws: list[Union[float, int, sym.Symbol]]):
-    res = pre_calc(s, len(ws))
-    if res is not None:
-        return res
-    x = sym.Symbol("x")
-    res = sym.Poly(1, x)
 
-    for i in range(len(ws)):
-        cp = charpoly(s + 1, x, ws[i])
-        res *= cp
-        res = drop_order_higher_than(s, x, res)
+def partitions(s: int, max_len: int, max_part: Optional[int] = None
+               ) -> Iterator[tuple[int, ...]]:
+    """
+    Generate partitions of s with parts in non-increasing order
+    :param s: number to split
+    :param max_len: maximal number of parts
+    :param max_part: maximal part, s if None
+    :return: iterator over partitions
+    """
+    if max_part is None:
+        max_part = s
+    if s == 0:
+        yield ()
+        return
+    if max_len == 0:
+        return
+    for part in range(min(s, max_part), 0, -1):
+        for rest in partitions(s - part, max_len - 1, part):
+            yield (part,) + rest
 
-    cfs = res.all_coeffs()
 
-    if s + 1 > len(cfs):
-        return sym.S.Zero
+def compute_td(s: int, n: int) -> dict[tuple[int, ...], Fraction]:
+    """
+    Compute Todd class td(s, n), the degree s part of product of
+    Todd series td(w_1 x) * ... * td(w_n x), as a symmetric polynomial.
+    Coefficient of monomial symmetric polynomial m_mu is the product of
+    Todd series coefficients over parts of mu
+    :param s: degree
+    :param n: number of variables
+    :return: partition mu -> coefficient of m_mu(w_1, ..., w_n)
+    """
+    series = todd_series(s)
+    res = {}
+    for mu in partitions(s, n):
+        coefficient = Fraction(1)
+        for part in mu:
+            coefficient *= series[part]
+        if coefficient != 0:
+            res[mu] = coefficient
+    return res
 
-    return cfs[-s - 1]
 
+def td_coefficients(s: int, n: int) -> dict[tuple[int, ...], Fraction]:
+    """
+    Get Todd class td(s, n) in monomial symmetric basis. Classes are
+    computed on the first request and stored in on-disk cache, which
+    is consulted lazily
+    :param s: degree
+    :param n: number of variables
+    :return: partition mu -> coefficient of m_mu(w_1, ..., w_n)
+    """
+    key = (s, n)
+    if key not in _coefficients:
+        res = todd_precalc.load(s, n)
+        if res is None:
+            res = compute_td(s, n)
+            todd_precalc.store(s, n, res)
+        _coefficients[key] = res
+    return _coefficients[key]
 
-def charpoly(n: int, x, gam):
-    if n == 0:
-        return sym.Poly(sym.S.One, x)
-    else:
-        res = sym.Poly(sym.S.One + gam * x, x)
-        for i in range(1, n + 1):
-            res += bernoulli(i) / factorial(i) * gam ** i * x ** i
-        return res
 
+def expand_td(s: int, n: int) -> Iterator[tuple[tuple[int, ...], Fraction]]:
+    """
+    Expand Todd class td(s, n) into monomials. Every monomial is
+    a cancellation point, see backend.progress.check_cancelled
+    :param s: degree
+    :param n: number of variables
+    :return: iterator over pairs (exponents of w_1..w_n, coefficient)
+    """
+    for mu, coefficient in td_coefficients(s, n).items():
+        for exps in multiset_permutations(mu + (0,) * (n - len(mu))):
+            check_cancelled()
+            yield tuple(exps), coefficient
 
-def drop_order_higher_than(k: int, x: sym.Symbol, polynom: sym.Poly):
-    return sym.Poly(sum(c * x ** i for i, c in enumerate(polynom.all_coeffs()[::-1]) if i <= k), x)
 
+def td_values(s: int, ws: list[Union[Fraction, int]]) -> list[Fraction]:
+    """
+    Evaluate Todd classes td(0), ..., td(s) at numeric point ws.
+    Power sums of ws are plugged into exp(sum_k c_k * p_k * x^k),
+    so the work is polynomial in s and len(ws)
+    :param s: maximal degree
+    :param ws: numeric values of w_1..w_n
+    :return: list of s + 1 exact values
+    """
+    c = log_todd_series(s)
+    powers = [Fraction(1)] * len(ws)
+    g = [Fraction(0)]
+    for k in range(1, s + 1):
+        powers = [p * w for p, w in zip(powers, ws)]
+        g.append(k * c[k] * sum(powers))
+    res = [Fraction(1)]
+    for i in range(1, s + 1):
+        res.append(sum(g[k] * res[i - k] for k in range(1, i + 1)) / i)
+    return res
 
-def build_rk(k: int, l: Union[float, int, sym.Symbol], ws: list[Union[float, sym.Symbol]]):
-    p1 = 1
+
+def td(s: int, ws: list[Union[float, int, sym.Symbol]]):
+    if all(isinstance(w, (int, Fraction)) for w in ws):
+        return td_values(s, ws)[s]
+    return sym.Add(*[
+        sym.Rational(coefficient.numerator, coefficient.denominator)
+        * sym.Mul(*[w ** e for w, e in zip(ws, exps)])
+        for exps, coefficient in expand_td(s, len(ws))
+    ])
+
+
+def rk_coefficients(k: int, ws: list[Union[Fraction, int]]) -> list[Fraction]:
+    """
+    Coefficients of R_k = (sum_s lambda^s / s! * td(k - s)) / (w_1 ... w_k)
+    as a polynomial in lambda, for numeric w_1..w_k
+    :param k: number of variables
+    :param ws: numeric values of w_1..w_k
+    :return: list of k + 1 exact coefficients, for lambda^0..lambda^k
+    """
+    p1 = Fraction(1)
     for wi in ws:
         p1 /= wi
-    s1 = 0
+    values = td_values(k, ws)
+    return [p1 * values[k - s] / factorial(s) for s in range(k + 1)]
+
+
+@lru_cache(maxsize=RK_TEMPLATE_CACHE_SIZE)
+def rk_template(k: int) -> tuple[LaurentPoly, ...]:
+    """
+    Symbolic version of rk_coefficients: coefficients of R_k as
+    a polynomial in lambda, every coefficient is a Laurent polynomial
+    in w_1..w_k. Returned polynomials are shared and must not be modified
+    :param k: number of variables
+    :return: tuple of k + 1 coefficients, for lambda^0..lambda^k
+    """
+    res = []
     for s in range(k + 1):
-        to_add = l ** s / factorial(s) * td(k - s, ws)
-        s1 += to_add
-    return p1 * s1
+        res.append(LaurentPoly({
+            tuple(e - 1 for e in exps): coefficient / factorial(s)
+            for exps, coefficient in expand_td(k - s, k)
+        }))
+    return tuple(res)
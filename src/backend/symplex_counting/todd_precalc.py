@@ -1,924 +1,54 @@
-import sympy as sym
+from __future__ import annotations
 
+from fractions import Fraction
+from pathlib import Path
+from typing import Optional
 
-def pre_calc(s: int, ln: int):
-    if s == 0 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return 1
-    if s == 0 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return 1
-    if s == 1 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return w_1 / 2
-    if s == 0 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return 1
-    if s == 1 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return w_1 / 2 + w_2 / 2
-    if s == 2 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return w_1 ** 2 / 12
-    if s == 0 and ln == 4:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        return 1
-    if s == 1 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return w_1 / 2 + w_2 / 2 + w_3 / 2
-    if s == 2 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return w_1 ** 2 / 12 + w_1 * w_2 / 4 + w_2 ** 2 / 12
-    if s == 3 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return 0
-    if s == 0 and ln == 5:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        return 1
-    if s == 1 and ln == 4:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        return w_1 / 2 + w_2 / 2 + w_3 / 2 + w_4 / 2
-    if s == 2 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return w_1 ** 2 / 12 + w_1 * w_2 / 4 + w_1 * w_3 / 4 + w_2 ** 2 / 12 + w_2 * w_3 / 4 + w_3 ** 2 / 12
-    if s == 3 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return w_1 ** 2 * w_2 / 24 + w_1 * w_2 ** 2 / 24
-    if s == 4 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return -w_1 ** 4 / 720
-    if s == 0 and ln == 6:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        return 1
-    if s == 1 and ln == 5:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        return w_1 / 2 + w_2 / 2 + w_3 / 2 + w_4 / 2 + w_5 / 2
-    if s == 2 and ln == 4:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        return w_1 ** 2 / 12 + w_1 * w_2 / 4 + w_1 * w_3 / 4 + w_1 * w_4 / 4 + w_2 ** 2 / 12 + w_2 * w_3 / 4 + w_2 * w_4 / 4 + w_3 ** 2 / 12 + w_3 * w_4 / 4 + w_4 ** 2 / 12
-    if s == 3 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return w_1 ** 2 * w_2 / 24 + w_1 ** 2 * w_3 / 24 + w_1 * w_2 ** 2 / 24 + w_1 * w_2 * w_3 / 8 + w_1 * w_3 ** 2 / 24 + w_2 ** 2 * w_3 / 24 + w_2 * w_3 ** 2 / 24
-    if s == 4 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return -w_1 ** 4 / 720 + w_1 ** 2 * w_2 ** 2 / 144 - w_2 ** 4 / 720
-    if s == 5 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return 0
-    if s == 0 and ln == 7:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        return 1
-    if s == 1 and ln == 6:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        return w_1 / 2 + w_2 / 2 + w_3 / 2 + w_4 / 2 + w_5 / 2 + w_6 / 2
-    if s == 2 and ln == 5:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        return w_1 ** 2 / 12 + w_1 * w_2 / 4 + w_1 * w_3 / 4 + w_1 * w_4 / 4 + w_1 * w_5 / 4 + w_2 ** 2 / 12 + w_2 * w_3 / 4 + w_2 * w_4 / 4 + w_2 * w_5 / 4 + w_3 ** 2 / 12 + w_3 * w_4 / 4 + w_3 * w_5 / 4 + w_4 ** 2 / 12 + w_4 * w_5 / 4 + w_5 ** 2 / 12
-    if s == 3 and ln == 4:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        return w_1 ** 2 * w_2 / 24 + w_1 ** 2 * w_3 / 24 + w_1 ** 2 * w_4 / 24 + w_1 * w_2 ** 2 / 24 + w_1 * w_2 * w_3 / 8 + w_1 * w_2 * w_4 / 8 + w_1 * w_3 ** 2 / 24 + w_1 * w_3 * w_4 / 8 + w_1 * w_4 ** 2 / 24 + w_2 ** 2 * w_3 / 24 + w_2 ** 2 * w_4 / 24 + w_2 * w_3 ** 2 / 24 + w_2 * w_3 * w_4 / 8 + w_2 * w_4 ** 2 / 24 + w_3 ** 2 * w_4 / 24 + w_3 * w_4 ** 2 / 24
-    if s == 4 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return -w_1 ** 4 / 720 + w_1 ** 2 * w_2 ** 2 / 144 + w_1 ** 2 * w_2 * w_3 / 48 + w_1 ** 2 * w_3 ** 2 / 144 + w_1 * w_2 ** 2 * w_3 / 48 + w_1 * w_2 * w_3 ** 2 / 48 - w_2 ** 4 / 720 + w_2 ** 2 * w_3 ** 2 / 144 - w_3 ** 4 / 720
-    if s == 5 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return -w_1 ** 4 * w_2 / 1440 - w_1 * w_2 ** 4 / 1440
-    if s == 6 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return w_1 ** 6 / 30240
-    if s == 0 and ln == 8:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        return 1
-    if s == 1 and ln == 7:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        return w_1 / 2 + w_2 / 2 + w_3 / 2 + w_4 / 2 + w_5 / 2 + w_6 / 2 + w_7 / 2
-    if s == 2 and ln == 6:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        return w_1 ** 2 / 12 + w_1 * w_2 / 4 + w_1 * w_3 / 4 + w_1 * w_4 / 4 + w_1 * w_5 / 4 + w_1 * w_6 / 4 + w_2 ** 2 / 12 + w_2 * w_3 / 4 + w_2 * w_4 / 4 + w_2 * w_5 / 4 + w_2 * w_6 / 4 + w_3 ** 2 / 12 + w_3 * w_4 / 4 + w_3 * w_5 / 4 + w_3 * w_6 / 4 + w_4 ** 2 / 12 + w_4 * w_5 / 4 + w_4 * w_6 / 4 + w_5 ** 2 / 12 + w_5 * w_6 / 4 + w_6 ** 2 / 12
-    if s == 3 and ln == 5:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        return w_1 ** 2 * w_2 / 24 + w_1 ** 2 * w_3 / 24 + w_1 ** 2 * w_4 / 24 + w_1 ** 2 * w_5 / 24 + w_1 * w_2 ** 2 / 24 + w_1 * w_2 * w_3 / 8 + w_1 * w_2 * w_4 / 8 + w_1 * w_2 * w_5 / 8 + w_1 * w_3 ** 2 / 24 + w_1 * w_3 * w_4 / 8 + w_1 * w_3 * w_5 / 8 + w_1 * w_4 ** 2 / 24 + w_1 * w_4 * w_5 / 8 + w_1 * w_5 ** 2 / 24 + w_2 ** 2 * w_3 / 24 + w_2 ** 2 * w_4 / 24 + w_2 ** 2 * w_5 / 24 + w_2 * w_3 ** 2 / 24 + w_2 * w_3 * w_4 / 8 + w_2 * w_3 * w_5 / 8 + w_2 * w_4 ** 2 / 24 + w_2 * w_4 * w_5 / 8 + w_2 * w_5 ** 2 / 24 + w_3 ** 2 * w_4 / 24 + w_3 ** 2 * w_5 / 24 + w_3 * w_4 ** 2 / 24 + w_3 * w_4 * w_5 / 8 + w_3 * w_5 ** 2 / 24 + w_4 ** 2 * w_5 / 24 + w_4 * w_5 ** 2 / 24
-    if s == 4 and ln == 4:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        return -w_1 ** 4 / 720 + w_1 ** 2 * w_2 ** 2 / 144 + w_1 ** 2 * w_2 * w_3 / 48 + w_1 ** 2 * w_2 * w_4 / 48 + w_1 ** 2 * w_3 ** 2 / 144 + w_1 ** 2 * w_3 * w_4 / 48 + w_1 ** 2 * w_4 ** 2 / 144 + w_1 * w_2 ** 2 * w_3 / 48 + w_1 * w_2 ** 2 * w_4 / 48 + w_1 * w_2 * w_3 ** 2 / 48 + w_1 * w_2 * w_3 * w_4 / 16 + w_1 * w_2 * w_4 ** 2 / 48 + w_1 * w_3 ** 2 * w_4 / 48 + w_1 * w_3 * w_4 ** 2 / 48 - w_2 ** 4 / 720 + w_2 ** 2 * w_3 ** 2 / 144 + w_2 ** 2 * w_3 * w_4 / 48 + w_2 ** 2 * w_4 ** 2 / 144 + w_2 * w_3 ** 2 * w_4 / 48 + w_2 * w_3 * w_4 ** 2 / 48 - w_3 ** 4 / 720 + w_3 ** 2 * w_4 ** 2 / 144 - w_4 ** 4 / 720
-    if s == 5 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return -w_1 ** 4 * w_2 / 1440 - w_1 ** 4 * w_3 / 1440 + w_1 ** 2 * w_2 ** 2 * w_3 / 288 + w_1 ** 2 * w_2 * w_3 ** 2 / 288 - w_1 * w_2 ** 4 / 1440 + w_1 * w_2 ** 2 * w_3 ** 2 / 288 - w_1 * w_3 ** 4 / 1440 - w_2 ** 4 * w_3 / 1440 - w_2 * w_3 ** 4 / 1440
-    if s == 6 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return w_1 ** 6 / 30240 - w_1 ** 4 * w_2 ** 2 / 8640 - w_1 ** 2 * w_2 ** 4 / 8640 + w_2 ** 6 / 30240
-    if s == 7 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return 0
-    if s == 0 and ln == 9:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        return 1
-    if s == 1 and ln == 8:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        return w_1 / 2 + w_2 / 2 + w_3 / 2 + w_4 / 2 + w_5 / 2 + w_6 / 2 + w_7 / 2 + w_8 / 2
-    if s == 2 and ln == 7:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        return w_1 ** 2 / 12 + w_1 * w_2 / 4 + w_1 * w_3 / 4 + w_1 * w_4 / 4 + w_1 * w_5 / 4 + w_1 * w_6 / 4 + w_1 * w_7 / 4 + w_2 ** 2 / 12 + w_2 * w_3 / 4 + w_2 * w_4 / 4 + w_2 * w_5 / 4 + w_2 * w_6 / 4 + w_2 * w_7 / 4 + w_3 ** 2 / 12 + w_3 * w_4 / 4 + w_3 * w_5 / 4 + w_3 * w_6 / 4 + w_3 * w_7 / 4 + w_4 ** 2 / 12 + w_4 * w_5 / 4 + w_4 * w_6 / 4 + w_4 * w_7 / 4 + w_5 ** 2 / 12 + w_5 * w_6 / 4 + w_5 * w_7 / 4 + w_6 ** 2 / 12 + w_6 * w_7 / 4 + w_7 ** 2 / 12
-    if s == 3 and ln == 6:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        return w_1 ** 2 * w_2 / 24 + w_1 ** 2 * w_3 / 24 + w_1 ** 2 * w_4 / 24 + w_1 ** 2 * w_5 / 24 + w_1 ** 2 * w_6 / 24 + w_1 * w_2 ** 2 / 24 + w_1 * w_2 * w_3 / 8 + w_1 * w_2 * w_4 / 8 + w_1 * w_2 * w_5 / 8 + w_1 * w_2 * w_6 / 8 + w_1 * w_3 ** 2 / 24 + w_1 * w_3 * w_4 / 8 + w_1 * w_3 * w_5 / 8 + w_1 * w_3 * w_6 / 8 + w_1 * w_4 ** 2 / 24 + w_1 * w_4 * w_5 / 8 + w_1 * w_4 * w_6 / 8 + w_1 * w_5 ** 2 / 24 + w_1 * w_5 * w_6 / 8 + w_1 * w_6 ** 2 / 24 + w_2 ** 2 * w_3 / 24 + w_2 ** 2 * w_4 / 24 + w_2 ** 2 * w_5 / 24 + w_2 ** 2 * w_6 / 24 + w_2 * w_3 ** 2 / 24 + w_2 * w_3 * w_4 / 8 + w_2 * w_3 * w_5 / 8 + w_2 * w_3 * w_6 / 8 + w_2 * w_4 ** 2 / 24 + w_2 * w_4 * w_5 / 8 + w_2 * w_4 * w_6 / 8 + w_2 * w_5 ** 2 / 24 + w_2 * w_5 * w_6 / 8 + w_2 * w_6 ** 2 / 24 + w_3 ** 2 * w_4 / 24 + w_3 ** 2 * w_5 / 24 + w_3 ** 2 * w_6 / 24 + w_3 * w_4 ** 2 / 24 + w_3 * w_4 * w_5 / 8 + w_3 * w_4 * w_6 / 8 + w_3 * w_5 ** 2 / 24 + w_3 * w_5 * w_6 / 8 + w_3 * w_6 ** 2 / 24 + w_4 ** 2 * w_5 / 24 + w_4 ** 2 * w_6 / 24 + w_4 * w_5 ** 2 / 24 + w_4 * w_5 * w_6 / 8 + w_4 * w_6 ** 2 / 24 + w_5 ** 2 * w_6 / 24 + w_5 * w_6 ** 2 / 24
-    if s == 4 and ln == 5:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        return -w_1 ** 4 / 720 + w_1 ** 2 * w_2 ** 2 / 144 + w_1 ** 2 * w_2 * w_3 / 48 + w_1 ** 2 * w_2 * w_4 / 48 + w_1 ** 2 * w_2 * w_5 / 48 + w_1 ** 2 * w_3 ** 2 / 144 + w_1 ** 2 * w_3 * w_4 / 48 + w_1 ** 2 * w_3 * w_5 / 48 + w_1 ** 2 * w_4 ** 2 / 144 + w_1 ** 2 * w_4 * w_5 / 48 + w_1 ** 2 * w_5 ** 2 / 144 + w_1 * w_2 ** 2 * w_3 / 48 + w_1 * w_2 ** 2 * w_4 / 48 + w_1 * w_2 ** 2 * w_5 / 48 + w_1 * w_2 * w_3 ** 2 / 48 + w_1 * w_2 * w_3 * w_4 / 16 + w_1 * w_2 * w_3 * w_5 / 16 + w_1 * w_2 * w_4 ** 2 / 48 + w_1 * w_2 * w_4 * w_5 / 16 + w_1 * w_2 * w_5 ** 2 / 48 + w_1 * w_3 ** 2 * w_4 / 48 + w_1 * w_3 ** 2 * w_5 / 48 + w_1 * w_3 * w_4 ** 2 / 48 + w_1 * w_3 * w_4 * w_5 / 16 + w_1 * w_3 * w_5 ** 2 / 48 + w_1 * w_4 ** 2 * w_5 / 48 + w_1 * w_4 * w_5 ** 2 / 48 - w_2 ** 4 / 720 + w_2 ** 2 * w_3 ** 2 / 144 + w_2 ** 2 * w_3 * w_4 / 48 + w_2 ** 2 * w_3 * w_5 / 48 + w_2 ** 2 * w_4 ** 2 / 144 + w_2 ** 2 * w_4 * w_5 / 48 + w_2 ** 2 * w_5 ** 2 / 144 + w_2 * w_3 ** 2 * w_4 / 48 + w_2 * w_3 ** 2 * w_5 / 48 + w_2 * w_3 * w_4 ** 2 / 48 + w_2 * w_3 * w_4 * w_5 / 16 + w_2 * w_3 * w_5 ** 2 / 48 + w_2 * w_4 ** 2 * w_5 / 48 + w_2 * w_4 * w_5 ** 2 / 48 - w_3 ** 4 / 720 + w_3 ** 2 * w_4 ** 2 / 144 + w_3 ** 2 * w_4 * w_5 / 48 + w_3 ** 2 * w_5 ** 2 / 144 + w_3 * w_4 ** 2 * w_5 / 48 + w_3 * w_4 * w_5 ** 2 / 48 - w_4 ** 4 / 720 + w_4 ** 2 * w_5 ** 2 / 144 - w_5 ** 4 / 720
-    if s == 5 and ln == 4:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        return -w_1 ** 4 * w_2 / 1440 - w_1 ** 4 * w_3 / 1440 - w_1 ** 4 * w_4 / 1440 + w_1 ** 2 * w_2 ** 2 * w_3 / 288 + w_1 ** 2 * w_2 ** 2 * w_4 / 288 + w_1 ** 2 * w_2 * w_3 ** 2 / 288 + w_1 ** 2 * w_2 * w_3 * w_4 / 96 + w_1 ** 2 * w_2 * w_4 ** 2 / 288 + w_1 ** 2 * w_3 ** 2 * w_4 / 288 + w_1 ** 2 * w_3 * w_4 ** 2 / 288 - w_1 * w_2 ** 4 / 1440 + w_1 * w_2 ** 2 * w_3 ** 2 / 288 + w_1 * w_2 ** 2 * w_3 * w_4 / 96 + w_1 * w_2 ** 2 * w_4 ** 2 / 288 + w_1 * w_2 * w_3 ** 2 * w_4 / 96 + w_1 * w_2 * w_3 * w_4 ** 2 / 96 - w_1 * w_3 ** 4 / 1440 + w_1 * w_3 ** 2 * w_4 ** 2 / 288 - w_1 * w_4 ** 4 / 1440 - w_2 ** 4 * w_3 / 1440 - w_2 ** 4 * w_4 / 1440 + w_2 ** 2 * w_3 ** 2 * w_4 / 288 + w_2 ** 2 * w_3 * w_4 ** 2 / 288 - w_2 * w_3 ** 4 / 1440 + w_2 * w_3 ** 2 * w_4 ** 2 / 288 - w_2 * w_4 ** 4 / 1440 - w_3 ** 4 * w_4 / 1440 - w_3 * w_4 ** 4 / 1440
-    if s == 6 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return w_1 ** 6 / 30240 - w_1 ** 4 * w_2 ** 2 / 8640 - w_1 ** 4 * w_2 * w_3 / 2880 - w_1 ** 4 * w_3 ** 2 / 8640 - w_1 ** 2 * w_2 ** 4 / 8640 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 / 1728 - w_1 ** 2 * w_3 ** 4 / 8640 - w_1 * w_2 ** 4 * w_3 / 2880 - w_1 * w_2 * w_3 ** 4 / 2880 + w_2 ** 6 / 30240 - w_2 ** 4 * w_3 ** 2 / 8640 - w_2 ** 2 * w_3 ** 4 / 8640 + w_3 ** 6 / 30240
-    if s == 7 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return w_1 ** 6 * w_2 / 60480 + w_1 * w_2 ** 6 / 60480
-    if s == 8 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return -w_1 ** 8 / 1209600
-    if s == 0 and ln == 10:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        return 1
-    if s == 1 and ln == 9:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        return w_1 / 2 + w_2 / 2 + w_3 / 2 + w_4 / 2 + w_5 / 2 + w_6 / 2 + w_7 / 2 + w_8 / 2 + w_9 / 2
-    if s == 2 and ln == 8:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        return w_1 ** 2 / 12 + w_1 * w_2 / 4 + w_1 * w_3 / 4 + w_1 * w_4 / 4 + w_1 * w_5 / 4 + w_1 * w_6 / 4 + w_1 * w_7 / 4 + w_1 * w_8 / 4 + w_2 ** 2 / 12 + w_2 * w_3 / 4 + w_2 * w_4 / 4 + w_2 * w_5 / 4 + w_2 * w_6 / 4 + w_2 * w_7 / 4 + w_2 * w_8 / 4 + w_3 ** 2 / 12 + w_3 * w_4 / 4 + w_3 * w_5 / 4 + w_3 * w_6 / 4 + w_3 * w_7 / 4 + w_3 * w_8 / 4 + w_4 ** 2 / 12 + w_4 * w_5 / 4 + w_4 * w_6 / 4 + w_4 * w_7 / 4 + w_4 * w_8 / 4 + w_5 ** 2 / 12 + w_5 * w_6 / 4 + w_5 * w_7 / 4 + w_5 * w_8 / 4 + w_6 ** 2 / 12 + w_6 * w_7 / 4 + w_6 * w_8 / 4 + w_7 ** 2 / 12 + w_7 * w_8 / 4 + w_8 ** 2 / 12
-    if s == 3 and ln == 7:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        return w_1 ** 2 * w_2 / 24 + w_1 ** 2 * w_3 / 24 + w_1 ** 2 * w_4 / 24 + w_1 ** 2 * w_5 / 24 + w_1 ** 2 * w_6 / 24 + w_1 ** 2 * w_7 / 24 + w_1 * w_2 ** 2 / 24 + w_1 * w_2 * w_3 / 8 + w_1 * w_2 * w_4 / 8 + w_1 * w_2 * w_5 / 8 + w_1 * w_2 * w_6 / 8 + w_1 * w_2 * w_7 / 8 + w_1 * w_3 ** 2 / 24 + w_1 * w_3 * w_4 / 8 + w_1 * w_3 * w_5 / 8 + w_1 * w_3 * w_6 / 8 + w_1 * w_3 * w_7 / 8 + w_1 * w_4 ** 2 / 24 + w_1 * w_4 * w_5 / 8 + w_1 * w_4 * w_6 / 8 + w_1 * w_4 * w_7 / 8 + w_1 * w_5 ** 2 / 24 + w_1 * w_5 * w_6 / 8 + w_1 * w_5 * w_7 / 8 + w_1 * w_6 ** 2 / 24 + w_1 * w_6 * w_7 / 8 + w_1 * w_7 ** 2 / 24 + w_2 ** 2 * w_3 / 24 + w_2 ** 2 * w_4 / 24 + w_2 ** 2 * w_5 / 24 + w_2 ** 2 * w_6 / 24 + w_2 ** 2 * w_7 / 24 + w_2 * w_3 ** 2 / 24 + w_2 * w_3 * w_4 / 8 + w_2 * w_3 * w_5 / 8 + w_2 * w_3 * w_6 / 8 + w_2 * w_3 * w_7 / 8 + w_2 * w_4 ** 2 / 24 + w_2 * w_4 * w_5 / 8 + w_2 * w_4 * w_6 / 8 + w_2 * w_4 * w_7 / 8 + w_2 * w_5 ** 2 / 24 + w_2 * w_5 * w_6 / 8 + w_2 * w_5 * w_7 / 8 + w_2 * w_6 ** 2 / 24 + w_2 * w_6 * w_7 / 8 + w_2 * w_7 ** 2 / 24 + w_3 ** 2 * w_4 / 24 + w_3 ** 2 * w_5 / 24 + w_3 ** 2 * w_6 / 24 + w_3 ** 2 * w_7 / 24 + w_3 * w_4 ** 2 / 24 + w_3 * w_4 * w_5 / 8 + w_3 * w_4 * w_6 / 8 + w_3 * w_4 * w_7 / 8 + w_3 * w_5 ** 2 / 24 + w_3 * w_5 * w_6 / 8 + w_3 * w_5 * w_7 / 8 + w_3 * w_6 ** 2 / 24 + w_3 * w_6 * w_7 / 8 + w_3 * w_7 ** 2 / 24 + w_4 ** 2 * w_5 / 24 + w_4 ** 2 * w_6 / 24 + w_4 ** 2 * w_7 / 24 + w_4 * w_5 ** 2 / 24 + w_4 * w_5 * w_6 / 8 + w_4 * w_5 * w_7 / 8 + w_4 * w_6 ** 2 / 24 + w_4 * w_6 * w_7 / 8 + w_4 * w_7 ** 2 / 24 + w_5 ** 2 * w_6 / 24 + w_5 ** 2 * w_7 / 24 + w_5 * w_6 ** 2 / 24 + w_5 * w_6 * w_7 / 8 + w_5 * w_7 ** 2 / 24 + w_6 ** 2 * w_7 / 24 + w_6 * w_7 ** 2 / 24
-    if s == 4 and ln == 6:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        return -w_1 ** 4 / 720 + w_1 ** 2 * w_2 ** 2 / 144 + w_1 ** 2 * w_2 * w_3 / 48 + w_1 ** 2 * w_2 * w_4 / 48 + w_1 ** 2 * w_2 * w_5 / 48 + w_1 ** 2 * w_2 * w_6 / 48 + w_1 ** 2 * w_3 ** 2 / 144 + w_1 ** 2 * w_3 * w_4 / 48 + w_1 ** 2 * w_3 * w_5 / 48 + w_1 ** 2 * w_3 * w_6 / 48 + w_1 ** 2 * w_4 ** 2 / 144 + w_1 ** 2 * w_4 * w_5 / 48 + w_1 ** 2 * w_4 * w_6 / 48 + w_1 ** 2 * w_5 ** 2 / 144 + w_1 ** 2 * w_5 * w_6 / 48 + w_1 ** 2 * w_6 ** 2 / 144 + w_1 * w_2 ** 2 * w_3 / 48 + w_1 * w_2 ** 2 * w_4 / 48 + w_1 * w_2 ** 2 * w_5 / 48 + w_1 * w_2 ** 2 * w_6 / 48 + w_1 * w_2 * w_3 ** 2 / 48 + w_1 * w_2 * w_3 * w_4 / 16 + w_1 * w_2 * w_3 * w_5 / 16 + w_1 * w_2 * w_3 * w_6 / 16 + w_1 * w_2 * w_4 ** 2 / 48 + w_1 * w_2 * w_4 * w_5 / 16 + w_1 * w_2 * w_4 * w_6 / 16 + w_1 * w_2 * w_5 ** 2 / 48 + w_1 * w_2 * w_5 * w_6 / 16 + w_1 * w_2 * w_6 ** 2 / 48 + w_1 * w_3 ** 2 * w_4 / 48 + w_1 * w_3 ** 2 * w_5 / 48 + w_1 * w_3 ** 2 * w_6 / 48 + w_1 * w_3 * w_4 ** 2 / 48 + w_1 * w_3 * w_4 * w_5 / 16 + w_1 * w_3 * w_4 * w_6 / 16 + w_1 * w_3 * w_5 ** 2 / 48 + w_1 * w_3 * w_5 * w_6 / 16 + w_1 * w_3 * w_6 ** 2 / 48 + w_1 * w_4 ** 2 * w_5 / 48 + w_1 * w_4 ** 2 * w_6 / 48 + w_1 * w_4 * w_5 ** 2 / 48 + w_1 * w_4 * w_5 * w_6 / 16 + w_1 * w_4 * w_6 ** 2 / 48 + w_1 * w_5 ** 2 * w_6 / 48 + w_1 * w_5 * w_6 ** 2 / 48 - w_2 ** 4 / 720 + w_2 ** 2 * w_3 ** 2 / 144 + w_2 ** 2 * w_3 * w_4 / 48 + w_2 ** 2 * w_3 * w_5 / 48 + w_2 ** 2 * w_3 * w_6 / 48 + w_2 ** 2 * w_4 ** 2 / 144 + w_2 ** 2 * w_4 * w_5 / 48 + w_2 ** 2 * w_4 * w_6 / 48 + w_2 ** 2 * w_5 ** 2 / 144 + w_2 ** 2 * w_5 * w_6 / 48 + w_2 ** 2 * w_6 ** 2 / 144 + w_2 * w_3 ** 2 * w_4 / 48 + w_2 * w_3 ** 2 * w_5 / 48 + w_2 * w_3 ** 2 * w_6 / 48 + w_2 * w_3 * w_4 ** 2 / 48 + w_2 * w_3 * w_4 * w_5 / 16 + w_2 * w_3 * w_4 * w_6 / 16 + w_2 * w_3 * w_5 ** 2 / 48 + w_2 * w_3 * w_5 * w_6 / 16 + w_2 * w_3 * w_6 ** 2 / 48 + w_2 * w_4 ** 2 * w_5 / 48 + w_2 * w_4 ** 2 * w_6 / 48 + w_2 * w_4 * w_5 ** 2 / 48 + w_2 * w_4 * w_5 * w_6 / 16 + w_2 * w_4 * w_6 ** 2 / 48 + w_2 * w_5 ** 2 * w_6 / 48 + w_2 * w_5 * w_6 ** 2 / 48 - w_3 ** 4 / 720 + w_3 ** 2 * w_4 ** 2 / 144 + w_3 ** 2 * w_4 * w_5 / 48 + w_3 ** 2 * w_4 * w_6 / 48 + w_3 ** 2 * w_5 ** 2 / 144 + w_3 ** 2 * w_5 * w_6 / 48 + w_3 ** 2 * w_6 ** 2 / 144 + w_3 * w_4 ** 2 * w_5 / 48 + w_3 * w_4 ** 2 * w_6 / 48 + w_3 * w_4 * w_5 ** 2 / 48 + w_3 * w_4 * w_5 * w_6 / 16 + w_3 * w_4 * w_6 ** 2 / 48 + w_3 * w_5 ** 2 * w_6 / 48 + w_3 * w_5 * w_6 ** 2 / 48 - w_4 ** 4 / 720 + w_4 ** 2 * w_5 ** 2 / 144 + w_4 ** 2 * w_5 * w_6 / 48 + w_4 ** 2 * w_6 ** 2 / 144 + w_4 * w_5 ** 2 * w_6 / 48 + w_4 * w_5 * w_6 ** 2 / 48 - w_5 ** 4 / 720 + w_5 ** 2 * w_6 ** 2 / 144 - w_6 ** 4 / 720
-    if s == 5 and ln == 5:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        return -w_1 ** 4 * w_2 / 1440 - w_1 ** 4 * w_3 / 1440 - w_1 ** 4 * w_4 / 1440 - w_1 ** 4 * w_5 / 1440 + w_1 ** 2 * w_2 ** 2 * w_3 / 288 + w_1 ** 2 * w_2 ** 2 * w_4 / 288 + w_1 ** 2 * w_2 ** 2 * w_5 / 288 + w_1 ** 2 * w_2 * w_3 ** 2 / 288 + w_1 ** 2 * w_2 * w_3 * w_4 / 96 + w_1 ** 2 * w_2 * w_3 * w_5 / 96 + w_1 ** 2 * w_2 * w_4 ** 2 / 288 + w_1 ** 2 * w_2 * w_4 * w_5 / 96 + w_1 ** 2 * w_2 * w_5 ** 2 / 288 + w_1 ** 2 * w_3 ** 2 * w_4 / 288 + w_1 ** 2 * w_3 ** 2 * w_5 / 288 + w_1 ** 2 * w_3 * w_4 ** 2 / 288 + w_1 ** 2 * w_3 * w_4 * w_5 / 96 + w_1 ** 2 * w_3 * w_5 ** 2 / 288 + w_1 ** 2 * w_4 ** 2 * w_5 / 288 + w_1 ** 2 * w_4 * w_5 ** 2 / 288 - w_1 * w_2 ** 4 / 1440 + w_1 * w_2 ** 2 * w_3 ** 2 / 288 + w_1 * w_2 ** 2 * w_3 * w_4 / 96 + w_1 * w_2 ** 2 * w_3 * w_5 / 96 + w_1 * w_2 ** 2 * w_4 ** 2 / 288 + w_1 * w_2 ** 2 * w_4 * w_5 / 96 + w_1 * w_2 ** 2 * w_5 ** 2 / 288 + w_1 * w_2 * w_3 ** 2 * w_4 / 96 + w_1 * w_2 * w_3 ** 2 * w_5 / 96 + w_1 * w_2 * w_3 * w_4 ** 2 / 96 + w_1 * w_2 * w_3 * w_4 * w_5 / 32 + w_1 * w_2 * w_3 * w_5 ** 2 / 96 + w_1 * w_2 * w_4 ** 2 * w_5 / 96 + w_1 * w_2 * w_4 * w_5 ** 2 / 96 - w_1 * w_3 ** 4 / 1440 + w_1 * w_3 ** 2 * w_4 ** 2 / 288 + w_1 * w_3 ** 2 * w_4 * w_5 / 96 + w_1 * w_3 ** 2 * w_5 ** 2 / 288 + w_1 * w_3 * w_4 ** 2 * w_5 / 96 + w_1 * w_3 * w_4 * w_5 ** 2 / 96 - w_1 * w_4 ** 4 / 1440 + w_1 * w_4 ** 2 * w_5 ** 2 / 288 - w_1 * w_5 ** 4 / 1440 - w_2 ** 4 * w_3 / 1440 - w_2 ** 4 * w_4 / 1440 - w_2 ** 4 * w_5 / 1440 + w_2 ** 2 * w_3 ** 2 * w_4 / 288 + w_2 ** 2 * w_3 ** 2 * w_5 / 288 + w_2 ** 2 * w_3 * w_4 ** 2 / 288 + w_2 ** 2 * w_3 * w_4 * w_5 / 96 + w_2 ** 2 * w_3 * w_5 ** 2 / 288 + w_2 ** 2 * w_4 ** 2 * w_5 / 288 + w_2 ** 2 * w_4 * w_5 ** 2 / 288 - w_2 * w_3 ** 4 / 1440 + w_2 * w_3 ** 2 * w_4 ** 2 / 288 + w_2 * w_3 ** 2 * w_4 * w_5 / 96 + w_2 * w_3 ** 2 * w_5 ** 2 / 288 + w_2 * w_3 * w_4 ** 2 * w_5 / 96 + w_2 * w_3 * w_4 * w_5 ** 2 / 96 - w_2 * w_4 ** 4 / 1440 + w_2 * w_4 ** 2 * w_5 ** 2 / 288 - w_2 * w_5 ** 4 / 1440 - w_3 ** 4 * w_4 / 1440 - w_3 ** 4 * w_5 / 1440 + w_3 ** 2 * w_4 ** 2 * w_5 / 288 + w_3 ** 2 * w_4 * w_5 ** 2 / 288 - w_3 * w_4 ** 4 / 1440 + w_3 * w_4 ** 2 * w_5 ** 2 / 288 - w_3 * w_5 ** 4 / 1440 - w_4 ** 4 * w_5 / 1440 - w_4 * w_5 ** 4 / 1440
-    if s == 6 and ln == 4:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        return w_1 ** 6 / 30240 - w_1 ** 4 * w_2 ** 2 / 8640 - w_1 ** 4 * w_2 * w_3 / 2880 - w_1 ** 4 * w_2 * w_4 / 2880 - w_1 ** 4 * w_3 ** 2 / 8640 - w_1 ** 4 * w_3 * w_4 / 2880 - w_1 ** 4 * w_4 ** 2 / 8640 - w_1 ** 2 * w_2 ** 4 / 8640 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 / 1728 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 / 576 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 / 576 - w_1 ** 2 * w_3 ** 4 / 8640 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 / 1728 - w_1 ** 2 * w_4 ** 4 / 8640 - w_1 * w_2 ** 4 * w_3 / 2880 - w_1 * w_2 ** 4 * w_4 / 2880 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 / 576 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 / 576 - w_1 * w_2 * w_3 ** 4 / 2880 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 / 576 - w_1 * w_2 * w_4 ** 4 / 2880 - w_1 * w_3 ** 4 * w_4 / 2880 - w_1 * w_3 * w_4 ** 4 / 2880 + w_2 ** 6 / 30240 - w_2 ** 4 * w_3 ** 2 / 8640 - w_2 ** 4 * w_3 * w_4 / 2880 - w_2 ** 4 * w_4 ** 2 / 8640 - w_2 ** 2 * w_3 ** 4 / 8640 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 1728 - w_2 ** 2 * w_4 ** 4 / 8640 - w_2 * w_3 ** 4 * w_4 / 2880 - w_2 * w_3 * w_4 ** 4 / 2880 + w_3 ** 6 / 30240 - w_3 ** 4 * w_4 ** 2 / 8640 - w_3 ** 2 * w_4 ** 4 / 8640 + w_4 ** 6 / 30240
-    if s == 7 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return w_1 ** 6 * w_2 / 60480 + w_1 ** 6 * w_3 / 60480 - w_1 ** 4 * w_2 ** 2 * w_3 / 17280 - w_1 ** 4 * w_2 * w_3 ** 2 / 17280 - w_1 ** 2 * w_2 ** 4 * w_3 / 17280 - w_1 ** 2 * w_2 * w_3 ** 4 / 17280 + w_1 * w_2 ** 6 / 60480 - w_1 * w_2 ** 4 * w_3 ** 2 / 17280 - w_1 * w_2 ** 2 * w_3 ** 4 / 17280 + w_1 * w_3 ** 6 / 60480 + w_2 ** 6 * w_3 / 60480 + w_2 * w_3 ** 6 / 60480
-    if s == 8 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return -w_1 ** 8 / 1209600 + w_1 ** 6 * w_2 ** 2 / 362880 + w_1 ** 4 * w_2 ** 4 / 518400 + w_1 ** 2 * w_2 ** 6 / 362880 - w_2 ** 8 / 1209600
-    if s == 9 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return 0
-    if s == 0 and ln == 11:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        return 1
-    if s == 1 and ln == 10:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        return w_1 / 2 + w_10 / 2 + w_2 / 2 + w_3 / 2 + w_4 / 2 + w_5 / 2 + w_6 / 2 + w_7 / 2 + w_8 / 2 + w_9 / 2
-    if s == 2 and ln == 9:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        return w_1 ** 2 / 12 + w_1 * w_2 / 4 + w_1 * w_3 / 4 + w_1 * w_4 / 4 + w_1 * w_5 / 4 + w_1 * w_6 / 4 + w_1 * w_7 / 4 + w_1 * w_8 / 4 + w_1 * w_9 / 4 + w_2 ** 2 / 12 + w_2 * w_3 / 4 + w_2 * w_4 / 4 + w_2 * w_5 / 4 + w_2 * w_6 / 4 + w_2 * w_7 / 4 + w_2 * w_8 / 4 + w_2 * w_9 / 4 + w_3 ** 2 / 12 + w_3 * w_4 / 4 + w_3 * w_5 / 4 + w_3 * w_6 / 4 + w_3 * w_7 / 4 + w_3 * w_8 / 4 + w_3 * w_9 / 4 + w_4 ** 2 / 12 + w_4 * w_5 / 4 + w_4 * w_6 / 4 + w_4 * w_7 / 4 + w_4 * w_8 / 4 + w_4 * w_9 / 4 + w_5 ** 2 / 12 + w_5 * w_6 / 4 + w_5 * w_7 / 4 + w_5 * w_8 / 4 + w_5 * w_9 / 4 + w_6 ** 2 / 12 + w_6 * w_7 / 4 + w_6 * w_8 / 4 + w_6 * w_9 / 4 + w_7 ** 2 / 12 + w_7 * w_8 / 4 + w_7 * w_9 / 4 + w_8 ** 2 / 12 + w_8 * w_9 / 4 + w_9 ** 2 / 12
-    if s == 3 and ln == 8:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        return w_1 ** 2 * w_2 / 24 + w_1 ** 2 * w_3 / 24 + w_1 ** 2 * w_4 / 24 + w_1 ** 2 * w_5 / 24 + w_1 ** 2 * w_6 / 24 + w_1 ** 2 * w_7 / 24 + w_1 ** 2 * w_8 / 24 + w_1 * w_2 ** 2 / 24 + w_1 * w_2 * w_3 / 8 + w_1 * w_2 * w_4 / 8 + w_1 * w_2 * w_5 / 8 + w_1 * w_2 * w_6 / 8 + w_1 * w_2 * w_7 / 8 + w_1 * w_2 * w_8 / 8 + w_1 * w_3 ** 2 / 24 + w_1 * w_3 * w_4 / 8 + w_1 * w_3 * w_5 / 8 + w_1 * w_3 * w_6 / 8 + w_1 * w_3 * w_7 / 8 + w_1 * w_3 * w_8 / 8 + w_1 * w_4 ** 2 / 24 + w_1 * w_4 * w_5 / 8 + w_1 * w_4 * w_6 / 8 + w_1 * w_4 * w_7 / 8 + w_1 * w_4 * w_8 / 8 + w_1 * w_5 ** 2 / 24 + w_1 * w_5 * w_6 / 8 + w_1 * w_5 * w_7 / 8 + w_1 * w_5 * w_8 / 8 + w_1 * w_6 ** 2 / 24 + w_1 * w_6 * w_7 / 8 + w_1 * w_6 * w_8 / 8 + w_1 * w_7 ** 2 / 24 + w_1 * w_7 * w_8 / 8 + w_1 * w_8 ** 2 / 24 + w_2 ** 2 * w_3 / 24 + w_2 ** 2 * w_4 / 24 + w_2 ** 2 * w_5 / 24 + w_2 ** 2 * w_6 / 24 + w_2 ** 2 * w_7 / 24 + w_2 ** 2 * w_8 / 24 + w_2 * w_3 ** 2 / 24 + w_2 * w_3 * w_4 / 8 + w_2 * w_3 * w_5 / 8 + w_2 * w_3 * w_6 / 8 + w_2 * w_3 * w_7 / 8 + w_2 * w_3 * w_8 / 8 + w_2 * w_4 ** 2 / 24 + w_2 * w_4 * w_5 / 8 + w_2 * w_4 * w_6 / 8 + w_2 * w_4 * w_7 / 8 + w_2 * w_4 * w_8 / 8 + w_2 * w_5 ** 2 / 24 + w_2 * w_5 * w_6 / 8 + w_2 * w_5 * w_7 / 8 + w_2 * w_5 * w_8 / 8 + w_2 * w_6 ** 2 / 24 + w_2 * w_6 * w_7 / 8 + w_2 * w_6 * w_8 / 8 + w_2 * w_7 ** 2 / 24 + w_2 * w_7 * w_8 / 8 + w_2 * w_8 ** 2 / 24 + w_3 ** 2 * w_4 / 24 + w_3 ** 2 * w_5 / 24 + w_3 ** 2 * w_6 / 24 + w_3 ** 2 * w_7 / 24 + w_3 ** 2 * w_8 / 24 + w_3 * w_4 ** 2 / 24 + w_3 * w_4 * w_5 / 8 + w_3 * w_4 * w_6 / 8 + w_3 * w_4 * w_7 / 8 + w_3 * w_4 * w_8 / 8 + w_3 * w_5 ** 2 / 24 + w_3 * w_5 * w_6 / 8 + w_3 * w_5 * w_7 / 8 + w_3 * w_5 * w_8 / 8 + w_3 * w_6 ** 2 / 24 + w_3 * w_6 * w_7 / 8 + w_3 * w_6 * w_8 / 8 + w_3 * w_7 ** 2 / 24 + w_3 * w_7 * w_8 / 8 + w_3 * w_8 ** 2 / 24 + w_4 ** 2 * w_5 / 24 + w_4 ** 2 * w_6 / 24 + w_4 ** 2 * w_7 / 24 + w_4 ** 2 * w_8 / 24 + w_4 * w_5 ** 2 / 24 + w_4 * w_5 * w_6 / 8 + w_4 * w_5 * w_7 / 8 + w_4 * w_5 * w_8 / 8 + w_4 * w_6 ** 2 / 24 + w_4 * w_6 * w_7 / 8 + w_4 * w_6 * w_8 / 8 + w_4 * w_7 ** 2 / 24 + w_4 * w_7 * w_8 / 8 + w_4 * w_8 ** 2 / 24 + w_5 ** 2 * w_6 / 24 + w_5 ** 2 * w_7 / 24 + w_5 ** 2 * w_8 / 24 + w_5 * w_6 ** 2 / 24 + w_5 * w_6 * w_7 / 8 + w_5 * w_6 * w_8 / 8 + w_5 * w_7 ** 2 / 24 + w_5 * w_7 * w_8 / 8 + w_5 * w_8 ** 2 / 24 + w_6 ** 2 * w_7 / 24 + w_6 ** 2 * w_8 / 24 + w_6 * w_7 ** 2 / 24 + w_6 * w_7 * w_8 / 8 + w_6 * w_8 ** 2 / 24 + w_7 ** 2 * w_8 / 24 + w_7 * w_8 ** 2 / 24
-    if s == 4 and ln == 7:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        return -w_1 ** 4 / 720 + w_1 ** 2 * w_2 ** 2 / 144 + w_1 ** 2 * w_2 * w_3 / 48 + w_1 ** 2 * w_2 * w_4 / 48 + w_1 ** 2 * w_2 * w_5 / 48 + w_1 ** 2 * w_2 * w_6 / 48 + w_1 ** 2 * w_2 * w_7 / 48 + w_1 ** 2 * w_3 ** 2 / 144 + w_1 ** 2 * w_3 * w_4 / 48 + w_1 ** 2 * w_3 * w_5 / 48 + w_1 ** 2 * w_3 * w_6 / 48 + w_1 ** 2 * w_3 * w_7 / 48 + w_1 ** 2 * w_4 ** 2 / 144 + w_1 ** 2 * w_4 * w_5 / 48 + w_1 ** 2 * w_4 * w_6 / 48 + w_1 ** 2 * w_4 * w_7 / 48 + w_1 ** 2 * w_5 ** 2 / 144 + w_1 ** 2 * w_5 * w_6 / 48 + w_1 ** 2 * w_5 * w_7 / 48 + w_1 ** 2 * w_6 ** 2 / 144 + w_1 ** 2 * w_6 * w_7 / 48 + w_1 ** 2 * w_7 ** 2 / 144 + w_1 * w_2 ** 2 * w_3 / 48 + w_1 * w_2 ** 2 * w_4 / 48 + w_1 * w_2 ** 2 * w_5 / 48 + w_1 * w_2 ** 2 * w_6 / 48 + w_1 * w_2 ** 2 * w_7 / 48 + w_1 * w_2 * w_3 ** 2 / 48 + w_1 * w_2 * w_3 * w_4 / 16 + w_1 * w_2 * w_3 * w_5 / 16 + w_1 * w_2 * w_3 * w_6 / 16 + w_1 * w_2 * w_3 * w_7 / 16 + w_1 * w_2 * w_4 ** 2 / 48 + w_1 * w_2 * w_4 * w_5 / 16 + w_1 * w_2 * w_4 * w_6 / 16 + w_1 * w_2 * w_4 * w_7 / 16 + w_1 * w_2 * w_5 ** 2 / 48 + w_1 * w_2 * w_5 * w_6 / 16 + w_1 * w_2 * w_5 * w_7 / 16 + w_1 * w_2 * w_6 ** 2 / 48 + w_1 * w_2 * w_6 * w_7 / 16 + w_1 * w_2 * w_7 ** 2 / 48 + w_1 * w_3 ** 2 * w_4 / 48 + w_1 * w_3 ** 2 * w_5 / 48 + w_1 * w_3 ** 2 * w_6 / 48 + w_1 * w_3 ** 2 * w_7 / 48 + w_1 * w_3 * w_4 ** 2 / 48 + w_1 * w_3 * w_4 * w_5 / 16 + w_1 * w_3 * w_4 * w_6 / 16 + w_1 * w_3 * w_4 * w_7 / 16 + w_1 * w_3 * w_5 ** 2 / 48 + w_1 * w_3 * w_5 * w_6 / 16 + w_1 * w_3 * w_5 * w_7 / 16 + w_1 * w_3 * w_6 ** 2 / 48 + w_1 * w_3 * w_6 * w_7 / 16 + w_1 * w_3 * w_7 ** 2 / 48 + w_1 * w_4 ** 2 * w_5 / 48 + w_1 * w_4 ** 2 * w_6 / 48 + w_1 * w_4 ** 2 * w_7 / 48 + w_1 * w_4 * w_5 ** 2 / 48 + w_1 * w_4 * w_5 * w_6 / 16 + w_1 * w_4 * w_5 * w_7 / 16 + w_1 * w_4 * w_6 ** 2 / 48 + w_1 * w_4 * w_6 * w_7 / 16 + w_1 * w_4 * w_7 ** 2 / 48 + w_1 * w_5 ** 2 * w_6 / 48 + w_1 * w_5 ** 2 * w_7 / 48 + w_1 * w_5 * w_6 ** 2 / 48 + w_1 * w_5 * w_6 * w_7 / 16 + w_1 * w_5 * w_7 ** 2 / 48 + w_1 * w_6 ** 2 * w_7 / 48 + w_1 * w_6 * w_7 ** 2 / 48 - w_2 ** 4 / 720 + w_2 ** 2 * w_3 ** 2 / 144 + w_2 ** 2 * w_3 * w_4 / 48 + w_2 ** 2 * w_3 * w_5 / 48 + w_2 ** 2 * w_3 * w_6 / 48 + w_2 ** 2 * w_3 * w_7 / 48 + w_2 ** 2 * w_4 ** 2 / 144 + w_2 ** 2 * w_4 * w_5 / 48 + w_2 ** 2 * w_4 * w_6 / 48 + w_2 ** 2 * w_4 * w_7 / 48 + w_2 ** 2 * w_5 ** 2 / 144 + w_2 ** 2 * w_5 * w_6 / 48 + w_2 ** 2 * w_5 * w_7 / 48 + w_2 ** 2 * w_6 ** 2 / 144 + w_2 ** 2 * w_6 * w_7 / 48 + w_2 ** 2 * w_7 ** 2 / 144 + w_2 * w_3 ** 2 * w_4 / 48 + w_2 * w_3 ** 2 * w_5 / 48 + w_2 * w_3 ** 2 * w_6 / 48 + w_2 * w_3 ** 2 * w_7 / 48 + w_2 * w_3 * w_4 ** 2 / 48 + w_2 * w_3 * w_4 * w_5 / 16 + w_2 * w_3 * w_4 * w_6 / 16 + w_2 * w_3 * w_4 * w_7 / 16 + w_2 * w_3 * w_5 ** 2 / 48 + w_2 * w_3 * w_5 * w_6 / 16 + w_2 * w_3 * w_5 * w_7 / 16 + w_2 * w_3 * w_6 ** 2 / 48 + w_2 * w_3 * w_6 * w_7 / 16 + w_2 * w_3 * w_7 ** 2 / 48 + w_2 * w_4 ** 2 * w_5 / 48 + w_2 * w_4 ** 2 * w_6 / 48 + w_2 * w_4 ** 2 * w_7 / 48 + w_2 * w_4 * w_5 ** 2 / 48 + w_2 * w_4 * w_5 * w_6 / 16 + w_2 * w_4 * w_5 * w_7 / 16 + w_2 * w_4 * w_6 ** 2 / 48 + w_2 * w_4 * w_6 * w_7 / 16 + w_2 * w_4 * w_7 ** 2 / 48 + w_2 * w_5 ** 2 * w_6 / 48 + w_2 * w_5 ** 2 * w_7 / 48 + w_2 * w_5 * w_6 ** 2 / 48 + w_2 * w_5 * w_6 * w_7 / 16 + w_2 * w_5 * w_7 ** 2 / 48 + w_2 * w_6 ** 2 * w_7 / 48 + w_2 * w_6 * w_7 ** 2 / 48 - w_3 ** 4 / 720 + w_3 ** 2 * w_4 ** 2 / 144 + w_3 ** 2 * w_4 * w_5 / 48 + w_3 ** 2 * w_4 * w_6 / 48 + w_3 ** 2 * w_4 * w_7 / 48 + w_3 ** 2 * w_5 ** 2 / 144 + w_3 ** 2 * w_5 * w_6 / 48 + w_3 ** 2 * w_5 * w_7 / 48 + w_3 ** 2 * w_6 ** 2 / 144 + w_3 ** 2 * w_6 * w_7 / 48 + w_3 ** 2 * w_7 ** 2 / 144 + w_3 * w_4 ** 2 * w_5 / 48 + w_3 * w_4 ** 2 * w_6 / 48 + w_3 * w_4 ** 2 * w_7 / 48 + w_3 * w_4 * w_5 ** 2 / 48 + w_3 * w_4 * w_5 * w_6 / 16 + w_3 * w_4 * w_5 * w_7 / 16 + w_3 * w_4 * w_6 ** 2 / 48 + w_3 * w_4 * w_6 * w_7 / 16 + w_3 * w_4 * w_7 ** 2 / 48 + w_3 * w_5 ** 2 * w_6 / 48 + w_3 * w_5 ** 2 * w_7 / 48 + w_3 * w_5 * w_6 ** 2 / 48 + w_3 * w_5 * w_6 * w_7 / 16 + w_3 * w_5 * w_7 ** 2 / 48 + w_3 * w_6 ** 2 * w_7 / 48 + w_3 * w_6 * w_7 ** 2 / 48 - w_4 ** 4 / 720 + w_4 ** 2 * w_5 ** 2 / 144 + w_4 ** 2 * w_5 * w_6 / 48 + w_4 ** 2 * w_5 * w_7 / 48 + w_4 ** 2 * w_6 ** 2 / 144 + w_4 ** 2 * w_6 * w_7 / 48 + w_4 ** 2 * w_7 ** 2 / 144 + w_4 * w_5 ** 2 * w_6 / 48 + w_4 * w_5 ** 2 * w_7 / 48 + w_4 * w_5 * w_6 ** 2 / 48 + w_4 * w_5 * w_6 * w_7 / 16 + w_4 * w_5 * w_7 ** 2 / 48 + w_4 * w_6 ** 2 * w_7 / 48 + w_4 * w_6 * w_7 ** 2 / 48 - w_5 ** 4 / 720 + w_5 ** 2 * w_6 ** 2 / 144 + w_5 ** 2 * w_6 * w_7 / 48 + w_5 ** 2 * w_7 ** 2 / 144 + w_5 * w_6 ** 2 * w_7 / 48 + w_5 * w_6 * w_7 ** 2 / 48 - w_6 ** 4 / 720 + w_6 ** 2 * w_7 ** 2 / 144 - w_7 ** 4 / 720
-    if s == 5 and ln == 6:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        return -w_1 ** 4 * w_2 / 1440 - w_1 ** 4 * w_3 / 1440 - w_1 ** 4 * w_4 / 1440 - w_1 ** 4 * w_5 / 1440 - w_1 ** 4 * w_6 / 1440 + w_1 ** 2 * w_2 ** 2 * w_3 / 288 + w_1 ** 2 * w_2 ** 2 * w_4 / 288 + w_1 ** 2 * w_2 ** 2 * w_5 / 288 + w_1 ** 2 * w_2 ** 2 * w_6 / 288 + w_1 ** 2 * w_2 * w_3 ** 2 / 288 + w_1 ** 2 * w_2 * w_3 * w_4 / 96 + w_1 ** 2 * w_2 * w_3 * w_5 / 96 + w_1 ** 2 * w_2 * w_3 * w_6 / 96 + w_1 ** 2 * w_2 * w_4 ** 2 / 288 + w_1 ** 2 * w_2 * w_4 * w_5 / 96 + w_1 ** 2 * w_2 * w_4 * w_6 / 96 + w_1 ** 2 * w_2 * w_5 ** 2 / 288 + w_1 ** 2 * w_2 * w_5 * w_6 / 96 + w_1 ** 2 * w_2 * w_6 ** 2 / 288 + w_1 ** 2 * w_3 ** 2 * w_4 / 288 + w_1 ** 2 * w_3 ** 2 * w_5 / 288 + w_1 ** 2 * w_3 ** 2 * w_6 / 288 + w_1 ** 2 * w_3 * w_4 ** 2 / 288 + w_1 ** 2 * w_3 * w_4 * w_5 / 96 + w_1 ** 2 * w_3 * w_4 * w_6 / 96 + w_1 ** 2 * w_3 * w_5 ** 2 / 288 + w_1 ** 2 * w_3 * w_5 * w_6 / 96 + w_1 ** 2 * w_3 * w_6 ** 2 / 288 + w_1 ** 2 * w_4 ** 2 * w_5 / 288 + w_1 ** 2 * w_4 ** 2 * w_6 / 288 + w_1 ** 2 * w_4 * w_5 ** 2 / 288 + w_1 ** 2 * w_4 * w_5 * w_6 / 96 + w_1 ** 2 * w_4 * w_6 ** 2 / 288 + w_1 ** 2 * w_5 ** 2 * w_6 / 288 + w_1 ** 2 * w_5 * w_6 ** 2 / 288 - w_1 * w_2 ** 4 / 1440 + w_1 * w_2 ** 2 * w_3 ** 2 / 288 + w_1 * w_2 ** 2 * w_3 * w_4 / 96 + w_1 * w_2 ** 2 * w_3 * w_5 / 96 + w_1 * w_2 ** 2 * w_3 * w_6 / 96 + w_1 * w_2 ** 2 * w_4 ** 2 / 288 + w_1 * w_2 ** 2 * w_4 * w_5 / 96 + w_1 * w_2 ** 2 * w_4 * w_6 / 96 + w_1 * w_2 ** 2 * w_5 ** 2 / 288 + w_1 * w_2 ** 2 * w_5 * w_6 / 96 + w_1 * w_2 ** 2 * w_6 ** 2 / 288 + w_1 * w_2 * w_3 ** 2 * w_4 / 96 + w_1 * w_2 * w_3 ** 2 * w_5 / 96 + w_1 * w_2 * w_3 ** 2 * w_6 / 96 + w_1 * w_2 * w_3 * w_4 ** 2 / 96 + w_1 * w_2 * w_3 * w_4 * w_5 / 32 + w_1 * w_2 * w_3 * w_4 * w_6 / 32 + w_1 * w_2 * w_3 * w_5 ** 2 / 96 + w_1 * w_2 * w_3 * w_5 * w_6 / 32 + w_1 * w_2 * w_3 * w_6 ** 2 / 96 + w_1 * w_2 * w_4 ** 2 * w_5 / 96 + w_1 * w_2 * w_4 ** 2 * w_6 / 96 + w_1 * w_2 * w_4 * w_5 ** 2 / 96 + w_1 * w_2 * w_4 * w_5 * w_6 / 32 + w_1 * w_2 * w_4 * w_6 ** 2 / 96 + w_1 * w_2 * w_5 ** 2 * w_6 / 96 + w_1 * w_2 * w_5 * w_6 ** 2 / 96 - w_1 * w_3 ** 4 / 1440 + w_1 * w_3 ** 2 * w_4 ** 2 / 288 + w_1 * w_3 ** 2 * w_4 * w_5 / 96 + w_1 * w_3 ** 2 * w_4 * w_6 / 96 + w_1 * w_3 ** 2 * w_5 ** 2 / 288 + w_1 * w_3 ** 2 * w_5 * w_6 / 96 + w_1 * w_3 ** 2 * w_6 ** 2 / 288 + w_1 * w_3 * w_4 ** 2 * w_5 / 96 + w_1 * w_3 * w_4 ** 2 * w_6 / 96 + w_1 * w_3 * w_4 * w_5 ** 2 / 96 + w_1 * w_3 * w_4 * w_5 * w_6 / 32 + w_1 * w_3 * w_4 * w_6 ** 2 / 96 + w_1 * w_3 * w_5 ** 2 * w_6 / 96 + w_1 * w_3 * w_5 * w_6 ** 2 / 96 - w_1 * w_4 ** 4 / 1440 + w_1 * w_4 ** 2 * w_5 ** 2 / 288 + w_1 * w_4 ** 2 * w_5 * w_6 / 96 + w_1 * w_4 ** 2 * w_6 ** 2 / 288 + w_1 * w_4 * w_5 ** 2 * w_6 / 96 + w_1 * w_4 * w_5 * w_6 ** 2 / 96 - w_1 * w_5 ** 4 / 1440 + w_1 * w_5 ** 2 * w_6 ** 2 / 288 - w_1 * w_6 ** 4 / 1440 - w_2 ** 4 * w_3 / 1440 - w_2 ** 4 * w_4 / 1440 - w_2 ** 4 * w_5 / 1440 - w_2 ** 4 * w_6 / 1440 + w_2 ** 2 * w_3 ** 2 * w_4 / 288 + w_2 ** 2 * w_3 ** 2 * w_5 / 288 + w_2 ** 2 * w_3 ** 2 * w_6 / 288 + w_2 ** 2 * w_3 * w_4 ** 2 / 288 + w_2 ** 2 * w_3 * w_4 * w_5 / 96 + w_2 ** 2 * w_3 * w_4 * w_6 / 96 + w_2 ** 2 * w_3 * w_5 ** 2 / 288 + w_2 ** 2 * w_3 * w_5 * w_6 / 96 + w_2 ** 2 * w_3 * w_6 ** 2 / 288 + w_2 ** 2 * w_4 ** 2 * w_5 / 288 + w_2 ** 2 * w_4 ** 2 * w_6 / 288 + w_2 ** 2 * w_4 * w_5 ** 2 / 288 + w_2 ** 2 * w_4 * w_5 * w_6 / 96 + w_2 ** 2 * w_4 * w_6 ** 2 / 288 + w_2 ** 2 * w_5 ** 2 * w_6 / 288 + w_2 ** 2 * w_5 * w_6 ** 2 / 288 - w_2 * w_3 ** 4 / 1440 + w_2 * w_3 ** 2 * w_4 ** 2 / 288 + w_2 * w_3 ** 2 * w_4 * w_5 / 96 + w_2 * w_3 ** 2 * w_4 * w_6 / 96 + w_2 * w_3 ** 2 * w_5 ** 2 / 288 + w_2 * w_3 ** 2 * w_5 * w_6 / 96 + w_2 * w_3 ** 2 * w_6 ** 2 / 288 + w_2 * w_3 * w_4 ** 2 * w_5 / 96 + w_2 * w_3 * w_4 ** 2 * w_6 / 96 + w_2 * w_3 * w_4 * w_5 ** 2 / 96 + w_2 * w_3 * w_4 * w_5 * w_6 / 32 + w_2 * w_3 * w_4 * w_6 ** 2 / 96 + w_2 * w_3 * w_5 ** 2 * w_6 / 96 + w_2 * w_3 * w_5 * w_6 ** 2 / 96 - w_2 * w_4 ** 4 / 1440 + w_2 * w_4 ** 2 * w_5 ** 2 / 288 + w_2 * w_4 ** 2 * w_5 * w_6 / 96 + w_2 * w_4 ** 2 * w_6 ** 2 / 288 + w_2 * w_4 * w_5 ** 2 * w_6 / 96 + w_2 * w_4 * w_5 * w_6 ** 2 / 96 - w_2 * w_5 ** 4 / 1440 + w_2 * w_5 ** 2 * w_6 ** 2 / 288 - w_2 * w_6 ** 4 / 1440 - w_3 ** 4 * w_4 / 1440 - w_3 ** 4 * w_5 / 1440 - w_3 ** 4 * w_6 / 1440 + w_3 ** 2 * w_4 ** 2 * w_5 / 288 + w_3 ** 2 * w_4 ** 2 * w_6 / 288 + w_3 ** 2 * w_4 * w_5 ** 2 / 288 + w_3 ** 2 * w_4 * w_5 * w_6 / 96 + w_3 ** 2 * w_4 * w_6 ** 2 / 288 + w_3 ** 2 * w_5 ** 2 * w_6 / 288 + w_3 ** 2 * w_5 * w_6 ** 2 / 288 - w_3 * w_4 ** 4 / 1440 + w_3 * w_4 ** 2 * w_5 ** 2 / 288 + w_3 * w_4 ** 2 * w_5 * w_6 / 96 + w_3 * w_4 ** 2 * w_6 ** 2 / 288 + w_3 * w_4 * w_5 ** 2 * w_6 / 96 + w_3 * w_4 * w_5 * w_6 ** 2 / 96 - w_3 * w_5 ** 4 / 1440 + w_3 * w_5 ** 2 * w_6 ** 2 / 288 - w_3 * w_6 ** 4 / 1440 - w_4 ** 4 * w_5 / 1440 - w_4 ** 4 * w_6 / 1440 + w_4 ** 2 * w_5 ** 2 * w_6 / 288 + w_4 ** 2 * w_5 * w_6 ** 2 / 288 - w_4 * w_5 ** 4 / 1440 + w_4 * w_5 ** 2 * w_6 ** 2 / 288 - w_4 * w_6 ** 4 / 1440 - w_5 ** 4 * w_6 / 1440 - w_5 * w_6 ** 4 / 1440
-    if s == 6 and ln == 5:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        return w_1 ** 6 / 30240 - w_1 ** 4 * w_2 ** 2 / 8640 - w_1 ** 4 * w_2 * w_3 / 2880 - w_1 ** 4 * w_2 * w_4 / 2880 - w_1 ** 4 * w_2 * w_5 / 2880 - w_1 ** 4 * w_3 ** 2 / 8640 - w_1 ** 4 * w_3 * w_4 / 2880 - w_1 ** 4 * w_3 * w_5 / 2880 - w_1 ** 4 * w_4 ** 2 / 8640 - w_1 ** 4 * w_4 * w_5 / 2880 - w_1 ** 4 * w_5 ** 2 / 8640 - w_1 ** 2 * w_2 ** 4 / 8640 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 / 576 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 / 576 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 / 192 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 / 576 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 / 576 - w_1 ** 2 * w_3 ** 4 / 8640 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 / 576 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 / 576 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 / 576 - w_1 ** 2 * w_4 ** 4 / 8640 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 - w_1 ** 2 * w_5 ** 4 / 8640 - w_1 * w_2 ** 4 * w_3 / 2880 - w_1 * w_2 ** 4 * w_4 / 2880 - w_1 * w_2 ** 4 * w_5 / 2880 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 / 576 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 / 192 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 / 576 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 / 576 - w_1 * w_2 * w_3 ** 4 / 2880 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 / 192 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 / 576 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 / 192 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 / 192 - w_1 * w_2 * w_4 ** 4 / 2880 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 / 576 - w_1 * w_2 * w_5 ** 4 / 2880 - w_1 * w_3 ** 4 * w_4 / 2880 - w_1 * w_3 ** 4 * w_5 / 2880 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 / 576 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 / 576 - w_1 * w_3 * w_4 ** 4 / 2880 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 / 576 - w_1 * w_3 * w_5 ** 4 / 2880 - w_1 * w_4 ** 4 * w_5 / 2880 - w_1 * w_4 * w_5 ** 4 / 2880 + w_2 ** 6 / 30240 - w_2 ** 4 * w_3 ** 2 / 8640 - w_2 ** 4 * w_3 * w_4 / 2880 - w_2 ** 4 * w_3 * w_5 / 2880 - w_2 ** 4 * w_4 ** 2 / 8640 - w_2 ** 4 * w_4 * w_5 / 2880 - w_2 ** 4 * w_5 ** 2 / 8640 - w_2 ** 2 * w_3 ** 4 / 8640 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 576 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 1728 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 576 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 576 - w_2 ** 2 * w_4 ** 4 / 8640 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 - w_2 ** 2 * w_5 ** 4 / 8640 - w_2 * w_3 ** 4 * w_4 / 2880 - w_2 * w_3 ** 4 * w_5 / 2880 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 576 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 576 - w_2 * w_3 * w_4 ** 4 / 2880 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 576 - w_2 * w_3 * w_5 ** 4 / 2880 - w_2 * w_4 ** 4 * w_5 / 2880 - w_2 * w_4 * w_5 ** 4 / 2880 + w_3 ** 6 / 30240 - w_3 ** 4 * w_4 ** 2 / 8640 - w_3 ** 4 * w_4 * w_5 / 2880 - w_3 ** 4 * w_5 ** 2 / 8640 - w_3 ** 2 * w_4 ** 4 / 8640 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 - w_3 ** 2 * w_5 ** 4 / 8640 - w_3 * w_4 ** 4 * w_5 / 2880 - w_3 * w_4 * w_5 ** 4 / 2880 + w_4 ** 6 / 30240 - w_4 ** 4 * w_5 ** 2 / 8640 - w_4 ** 2 * w_5 ** 4 / 8640 + w_5 ** 6 / 30240
-    if s == 7 and ln == 4:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        return w_1 ** 6 * w_2 / 60480 + w_1 ** 6 * w_3 / 60480 + w_1 ** 6 * w_4 / 60480 - w_1 ** 4 * w_2 ** 2 * w_3 / 17280 - w_1 ** 4 * w_2 ** 2 * w_4 / 17280 - w_1 ** 4 * w_2 * w_3 ** 2 / 17280 - w_1 ** 4 * w_2 * w_3 * w_4 / 5760 - w_1 ** 4 * w_2 * w_4 ** 2 / 17280 - w_1 ** 4 * w_3 ** 2 * w_4 / 17280 - w_1 ** 4 * w_3 * w_4 ** 2 / 17280 - w_1 ** 2 * w_2 ** 4 * w_3 / 17280 - w_1 ** 2 * w_2 ** 4 * w_4 / 17280 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 / 3456 - w_1 ** 2 * w_2 * w_3 ** 4 / 17280 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 / 3456 - w_1 ** 2 * w_2 * w_4 ** 4 / 17280 - w_1 ** 2 * w_3 ** 4 * w_4 / 17280 - w_1 ** 2 * w_3 * w_4 ** 4 / 17280 + w_1 * w_2 ** 6 / 60480 - w_1 * w_2 ** 4 * w_3 ** 2 / 17280 - w_1 * w_2 ** 4 * w_3 * w_4 / 5760 - w_1 * w_2 ** 4 * w_4 ** 2 / 17280 - w_1 * w_2 ** 2 * w_3 ** 4 / 17280 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 3456 - w_1 * w_2 ** 2 * w_4 ** 4 / 17280 - w_1 * w_2 * w_3 ** 4 * w_4 / 5760 - w_1 * w_2 * w_3 * w_4 ** 4 / 5760 + w_1 * w_3 ** 6 / 60480 - w_1 * w_3 ** 4 * w_4 ** 2 / 17280 - w_1 * w_3 ** 2 * w_4 ** 4 / 17280 + w_1 * w_4 ** 6 / 60480 + w_2 ** 6 * w_3 / 60480 + w_2 ** 6 * w_4 / 60480 - w_2 ** 4 * w_3 ** 2 * w_4 / 17280 - w_2 ** 4 * w_3 * w_4 ** 2 / 17280 - w_2 ** 2 * w_3 ** 4 * w_4 / 17280 - w_2 ** 2 * w_3 * w_4 ** 4 / 17280 + w_2 * w_3 ** 6 / 60480 - w_2 * w_3 ** 4 * w_4 ** 2 / 17280 - w_2 * w_3 ** 2 * w_4 ** 4 / 17280 + w_2 * w_4 ** 6 / 60480 + w_3 ** 6 * w_4 / 60480 + w_3 * w_4 ** 6 / 60480
-    if s == 8 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return -w_1 ** 8 / 1209600 + w_1 ** 6 * w_2 ** 2 / 362880 + w_1 ** 6 * w_2 * w_3 / 120960 + w_1 ** 6 * w_3 ** 2 / 362880 + w_1 ** 4 * w_2 ** 4 / 518400 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 / 103680 + w_1 ** 4 * w_3 ** 4 / 518400 + w_1 ** 2 * w_2 ** 6 / 362880 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 / 103680 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 / 103680 + w_1 ** 2 * w_3 ** 6 / 362880 + w_1 * w_2 ** 6 * w_3 / 120960 + w_1 * w_2 * w_3 ** 6 / 120960 - w_2 ** 8 / 1209600 + w_2 ** 6 * w_3 ** 2 / 362880 + w_2 ** 4 * w_3 ** 4 / 518400 + w_2 ** 2 * w_3 ** 6 / 362880 - w_3 ** 8 / 1209600
-    if s == 9 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return -w_1 ** 8 * w_2 / 2419200 - w_1 * w_2 ** 8 / 2419200
-    if s == 10 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return w_1 ** 10 / 47900160
-    if s == 0 and ln == 12:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        w_12 = sym.Symbol("w_12")
-        return 1
-    if s == 1 and ln == 11:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        return w_1 / 2 + w_10 / 2 + w_11 / 2 + w_2 / 2 + w_3 / 2 + w_4 / 2 + w_5 / 2 + w_6 / 2 + w_7 / 2 + w_8 / 2 + w_9 / 2
-    if s == 2 and ln == 10:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        return w_1 ** 2 / 12 + w_1 * w_10 / 4 + w_1 * w_2 / 4 + w_1 * w_3 / 4 + w_1 * w_4 / 4 + w_1 * w_5 / 4 + w_1 * w_6 / 4 + w_1 * w_7 / 4 + w_1 * w_8 / 4 + w_1 * w_9 / 4 + w_10 ** 2 / 12 + w_10 * w_2 / 4 + w_10 * w_3 / 4 + w_10 * w_4 / 4 + w_10 * w_5 / 4 + w_10 * w_6 / 4 + w_10 * w_7 / 4 + w_10 * w_8 / 4 + w_10 * w_9 / 4 + w_2 ** 2 / 12 + w_2 * w_3 / 4 + w_2 * w_4 / 4 + w_2 * w_5 / 4 + w_2 * w_6 / 4 + w_2 * w_7 / 4 + w_2 * w_8 / 4 + w_2 * w_9 / 4 + w_3 ** 2 / 12 + w_3 * w_4 / 4 + w_3 * w_5 / 4 + w_3 * w_6 / 4 + w_3 * w_7 / 4 + w_3 * w_8 / 4 + w_3 * w_9 / 4 + w_4 ** 2 / 12 + w_4 * w_5 / 4 + w_4 * w_6 / 4 + w_4 * w_7 / 4 + w_4 * w_8 / 4 + w_4 * w_9 / 4 + w_5 ** 2 / 12 + w_5 * w_6 / 4 + w_5 * w_7 / 4 + w_5 * w_8 / 4 + w_5 * w_9 / 4 + w_6 ** 2 / 12 + w_6 * w_7 / 4 + w_6 * w_8 / 4 + w_6 * w_9 / 4 + w_7 ** 2 / 12 + w_7 * w_8 / 4 + w_7 * w_9 / 4 + w_8 ** 2 / 12 + w_8 * w_9 / 4 + w_9 ** 2 / 12
-    if s == 3 and ln == 9:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        return w_1 ** 2 * w_2 / 24 + w_1 ** 2 * w_3 / 24 + w_1 ** 2 * w_4 / 24 + w_1 ** 2 * w_5 / 24 + w_1 ** 2 * w_6 / 24 + w_1 ** 2 * w_7 / 24 + w_1 ** 2 * w_8 / 24 + w_1 ** 2 * w_9 / 24 + w_1 * w_2 ** 2 / 24 + w_1 * w_2 * w_3 / 8 + w_1 * w_2 * w_4 / 8 + w_1 * w_2 * w_5 / 8 + w_1 * w_2 * w_6 / 8 + w_1 * w_2 * w_7 / 8 + w_1 * w_2 * w_8 / 8 + w_1 * w_2 * w_9 / 8 + w_1 * w_3 ** 2 / 24 + w_1 * w_3 * w_4 / 8 + w_1 * w_3 * w_5 / 8 + w_1 * w_3 * w_6 / 8 + w_1 * w_3 * w_7 / 8 + w_1 * w_3 * w_8 / 8 + w_1 * w_3 * w_9 / 8 + w_1 * w_4 ** 2 / 24 + w_1 * w_4 * w_5 / 8 + w_1 * w_4 * w_6 / 8 + w_1 * w_4 * w_7 / 8 + w_1 * w_4 * w_8 / 8 + w_1 * w_4 * w_9 / 8 + w_1 * w_5 ** 2 / 24 + w_1 * w_5 * w_6 / 8 + w_1 * w_5 * w_7 / 8 + w_1 * w_5 * w_8 / 8 + w_1 * w_5 * w_9 / 8 + w_1 * w_6 ** 2 / 24 + w_1 * w_6 * w_7 / 8 + w_1 * w_6 * w_8 / 8 + w_1 * w_6 * w_9 / 8 + w_1 * w_7 ** 2 / 24 + w_1 * w_7 * w_8 / 8 + w_1 * w_7 * w_9 / 8 + w_1 * w_8 ** 2 / 24 + w_1 * w_8 * w_9 / 8 + w_1 * w_9 ** 2 / 24 + w_2 ** 2 * w_3 / 24 + w_2 ** 2 * w_4 / 24 + w_2 ** 2 * w_5 / 24 + w_2 ** 2 * w_6 / 24 + w_2 ** 2 * w_7 / 24 + w_2 ** 2 * w_8 / 24 + w_2 ** 2 * w_9 / 24 + w_2 * w_3 ** 2 / 24 + w_2 * w_3 * w_4 / 8 + w_2 * w_3 * w_5 / 8 + w_2 * w_3 * w_6 / 8 + w_2 * w_3 * w_7 / 8 + w_2 * w_3 * w_8 / 8 + w_2 * w_3 * w_9 / 8 + w_2 * w_4 ** 2 / 24 + w_2 * w_4 * w_5 / 8 + w_2 * w_4 * w_6 / 8 + w_2 * w_4 * w_7 / 8 + w_2 * w_4 * w_8 / 8 + w_2 * w_4 * w_9 / 8 + w_2 * w_5 ** 2 / 24 + w_2 * w_5 * w_6 / 8 + w_2 * w_5 * w_7 / 8 + w_2 * w_5 * w_8 / 8 + w_2 * w_5 * w_9 / 8 + w_2 * w_6 ** 2 / 24 + w_2 * w_6 * w_7 / 8 + w_2 * w_6 * w_8 / 8 + w_2 * w_6 * w_9 / 8 + w_2 * w_7 ** 2 / 24 + w_2 * w_7 * w_8 / 8 + w_2 * w_7 * w_9 / 8 + w_2 * w_8 ** 2 / 24 + w_2 * w_8 * w_9 / 8 + w_2 * w_9 ** 2 / 24 + w_3 ** 2 * w_4 / 24 + w_3 ** 2 * w_5 / 24 + w_3 ** 2 * w_6 / 24 + w_3 ** 2 * w_7 / 24 + w_3 ** 2 * w_8 / 24 + w_3 ** 2 * w_9 / 24 + w_3 * w_4 ** 2 / 24 + w_3 * w_4 * w_5 / 8 + w_3 * w_4 * w_6 / 8 + w_3 * w_4 * w_7 / 8 + w_3 * w_4 * w_8 / 8 + w_3 * w_4 * w_9 / 8 + w_3 * w_5 ** 2 / 24 + w_3 * w_5 * w_6 / 8 + w_3 * w_5 * w_7 / 8 + w_3 * w_5 * w_8 / 8 + w_3 * w_5 * w_9 / 8 + w_3 * w_6 ** 2 / 24 + w_3 * w_6 * w_7 / 8 + w_3 * w_6 * w_8 / 8 + w_3 * w_6 * w_9 / 8 + w_3 * w_7 ** 2 / 24 + w_3 * w_7 * w_8 / 8 + w_3 * w_7 * w_9 / 8 + w_3 * w_8 ** 2 / 24 + w_3 * w_8 * w_9 / 8 + w_3 * w_9 ** 2 / 24 + w_4 ** 2 * w_5 / 24 + w_4 ** 2 * w_6 / 24 + w_4 ** 2 * w_7 / 24 + w_4 ** 2 * w_8 / 24 + w_4 ** 2 * w_9 / 24 + w_4 * w_5 ** 2 / 24 + w_4 * w_5 * w_6 / 8 + w_4 * w_5 * w_7 / 8 + w_4 * w_5 * w_8 / 8 + w_4 * w_5 * w_9 / 8 + w_4 * w_6 ** 2 / 24 + w_4 * w_6 * w_7 / 8 + w_4 * w_6 * w_8 / 8 + w_4 * w_6 * w_9 / 8 + w_4 * w_7 ** 2 / 24 + w_4 * w_7 * w_8 / 8 + w_4 * w_7 * w_9 / 8 + w_4 * w_8 ** 2 / 24 + w_4 * w_8 * w_9 / 8 + w_4 * w_9 ** 2 / 24 + w_5 ** 2 * w_6 / 24 + w_5 ** 2 * w_7 / 24 + w_5 ** 2 * w_8 / 24 + w_5 ** 2 * w_9 / 24 + w_5 * w_6 ** 2 / 24 + w_5 * w_6 * w_7 / 8 + w_5 * w_6 * w_8 / 8 + w_5 * w_6 * w_9 / 8 + w_5 * w_7 ** 2 / 24 + w_5 * w_7 * w_8 / 8 + w_5 * w_7 * w_9 / 8 + w_5 * w_8 ** 2 / 24 + w_5 * w_8 * w_9 / 8 + w_5 * w_9 ** 2 / 24 + w_6 ** 2 * w_7 / 24 + w_6 ** 2 * w_8 / 24 + w_6 ** 2 * w_9 / 24 + w_6 * w_7 ** 2 / 24 + w_6 * w_7 * w_8 / 8 + w_6 * w_7 * w_9 / 8 + w_6 * w_8 ** 2 / 24 + w_6 * w_8 * w_9 / 8 + w_6 * w_9 ** 2 / 24 + w_7 ** 2 * w_8 / 24 + w_7 ** 2 * w_9 / 24 + w_7 * w_8 ** 2 / 24 + w_7 * w_8 * w_9 / 8 + w_7 * w_9 ** 2 / 24 + w_8 ** 2 * w_9 / 24 + w_8 * w_9 ** 2 / 24
-    if s == 4 and ln == 8:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        return -w_1 ** 4 / 720 + w_1 ** 2 * w_2 ** 2 / 144 + w_1 ** 2 * w_2 * w_3 / 48 + w_1 ** 2 * w_2 * w_4 / 48 + w_1 ** 2 * w_2 * w_5 / 48 + w_1 ** 2 * w_2 * w_6 / 48 + w_1 ** 2 * w_2 * w_7 / 48 + w_1 ** 2 * w_2 * w_8 / 48 + w_1 ** 2 * w_3 ** 2 / 144 + w_1 ** 2 * w_3 * w_4 / 48 + w_1 ** 2 * w_3 * w_5 / 48 + w_1 ** 2 * w_3 * w_6 / 48 + w_1 ** 2 * w_3 * w_7 / 48 + w_1 ** 2 * w_3 * w_8 / 48 + w_1 ** 2 * w_4 ** 2 / 144 + w_1 ** 2 * w_4 * w_5 / 48 + w_1 ** 2 * w_4 * w_6 / 48 + w_1 ** 2 * w_4 * w_7 / 48 + w_1 ** 2 * w_4 * w_8 / 48 + w_1 ** 2 * w_5 ** 2 / 144 + w_1 ** 2 * w_5 * w_6 / 48 + w_1 ** 2 * w_5 * w_7 / 48 + w_1 ** 2 * w_5 * w_8 / 48 + w_1 ** 2 * w_6 ** 2 / 144 + w_1 ** 2 * w_6 * w_7 / 48 + w_1 ** 2 * w_6 * w_8 / 48 + w_1 ** 2 * w_7 ** 2 / 144 + w_1 ** 2 * w_7 * w_8 / 48 + w_1 ** 2 * w_8 ** 2 / 144 + w_1 * w_2 ** 2 * w_3 / 48 + w_1 * w_2 ** 2 * w_4 / 48 + w_1 * w_2 ** 2 * w_5 / 48 + w_1 * w_2 ** 2 * w_6 / 48 + w_1 * w_2 ** 2 * w_7 / 48 + w_1 * w_2 ** 2 * w_8 / 48 + w_1 * w_2 * w_3 ** 2 / 48 + w_1 * w_2 * w_3 * w_4 / 16 + w_1 * w_2 * w_3 * w_5 / 16 + w_1 * w_2 * w_3 * w_6 / 16 + w_1 * w_2 * w_3 * w_7 / 16 + w_1 * w_2 * w_3 * w_8 / 16 + w_1 * w_2 * w_4 ** 2 / 48 + w_1 * w_2 * w_4 * w_5 / 16 + w_1 * w_2 * w_4 * w_6 / 16 + w_1 * w_2 * w_4 * w_7 / 16 + w_1 * w_2 * w_4 * w_8 / 16 + w_1 * w_2 * w_5 ** 2 / 48 + w_1 * w_2 * w_5 * w_6 / 16 + w_1 * w_2 * w_5 * w_7 / 16 + w_1 * w_2 * w_5 * w_8 / 16 + w_1 * w_2 * w_6 ** 2 / 48 + w_1 * w_2 * w_6 * w_7 / 16 + w_1 * w_2 * w_6 * w_8 / 16 + w_1 * w_2 * w_7 ** 2 / 48 + w_1 * w_2 * w_7 * w_8 / 16 + w_1 * w_2 * w_8 ** 2 / 48 + w_1 * w_3 ** 2 * w_4 / 48 + w_1 * w_3 ** 2 * w_5 / 48 + w_1 * w_3 ** 2 * w_6 / 48 + w_1 * w_3 ** 2 * w_7 / 48 + w_1 * w_3 ** 2 * w_8 / 48 + w_1 * w_3 * w_4 ** 2 / 48 + w_1 * w_3 * w_4 * w_5 / 16 + w_1 * w_3 * w_4 * w_6 / 16 + w_1 * w_3 * w_4 * w_7 / 16 + w_1 * w_3 * w_4 * w_8 / 16 + w_1 * w_3 * w_5 ** 2 / 48 + w_1 * w_3 * w_5 * w_6 / 16 + w_1 * w_3 * w_5 * w_7 / 16 + w_1 * w_3 * w_5 * w_8 / 16 + w_1 * w_3 * w_6 ** 2 / 48 + w_1 * w_3 * w_6 * w_7 / 16 + w_1 * w_3 * w_6 * w_8 / 16 + w_1 * w_3 * w_7 ** 2 / 48 + w_1 * w_3 * w_7 * w_8 / 16 + w_1 * w_3 * w_8 ** 2 / 48 + w_1 * w_4 ** 2 * w_5 / 48 + w_1 * w_4 ** 2 * w_6 / 48 + w_1 * w_4 ** 2 * w_7 / 48 + w_1 * w_4 ** 2 * w_8 / 48 + w_1 * w_4 * w_5 ** 2 / 48 + w_1 * w_4 * w_5 * w_6 / 16 + w_1 * w_4 * w_5 * w_7 / 16 + w_1 * w_4 * w_5 * w_8 / 16 + w_1 * w_4 * w_6 ** 2 / 48 + w_1 * w_4 * w_6 * w_7 / 16 + w_1 * w_4 * w_6 * w_8 / 16 + w_1 * w_4 * w_7 ** 2 / 48 + w_1 * w_4 * w_7 * w_8 / 16 + w_1 * w_4 * w_8 ** 2 / 48 + w_1 * w_5 ** 2 * w_6 / 48 + w_1 * w_5 ** 2 * w_7 / 48 + w_1 * w_5 ** 2 * w_8 / 48 + w_1 * w_5 * w_6 ** 2 / 48 + w_1 * w_5 * w_6 * w_7 / 16 + w_1 * w_5 * w_6 * w_8 / 16 + w_1 * w_5 * w_7 ** 2 / 48 + w_1 * w_5 * w_7 * w_8 / 16 + w_1 * w_5 * w_8 ** 2 / 48 + w_1 * w_6 ** 2 * w_7 / 48 + w_1 * w_6 ** 2 * w_8 / 48 + w_1 * w_6 * w_7 ** 2 / 48 + w_1 * w_6 * w_7 * w_8 / 16 + w_1 * w_6 * w_8 ** 2 / 48 + w_1 * w_7 ** 2 * w_8 / 48 + w_1 * w_7 * w_8 ** 2 / 48 - w_2 ** 4 / 720 + w_2 ** 2 * w_3 ** 2 / 144 + w_2 ** 2 * w_3 * w_4 / 48 + w_2 ** 2 * w_3 * w_5 / 48 + w_2 ** 2 * w_3 * w_6 / 48 + w_2 ** 2 * w_3 * w_7 / 48 + w_2 ** 2 * w_3 * w_8 / 48 + w_2 ** 2 * w_4 ** 2 / 144 + w_2 ** 2 * w_4 * w_5 / 48 + w_2 ** 2 * w_4 * w_6 / 48 + w_2 ** 2 * w_4 * w_7 / 48 + w_2 ** 2 * w_4 * w_8 / 48 + w_2 ** 2 * w_5 ** 2 / 144 + w_2 ** 2 * w_5 * w_6 / 48 + w_2 ** 2 * w_5 * w_7 / 48 + w_2 ** 2 * w_5 * w_8 / 48 + w_2 ** 2 * w_6 ** 2 / 144 + w_2 ** 2 * w_6 * w_7 / 48 + w_2 ** 2 * w_6 * w_8 / 48 + w_2 ** 2 * w_7 ** 2 / 144 + w_2 ** 2 * w_7 * w_8 / 48 + w_2 ** 2 * w_8 ** 2 / 144 + w_2 * w_3 ** 2 * w_4 / 48 + w_2 * w_3 ** 2 * w_5 / 48 + w_2 * w_3 ** 2 * w_6 / 48 + w_2 * w_3 ** 2 * w_7 / 48 + w_2 * w_3 ** 2 * w_8 / 48 + w_2 * w_3 * w_4 ** 2 / 48 + w_2 * w_3 * w_4 * w_5 / 16 + w_2 * w_3 * w_4 * w_6 / 16 + w_2 * w_3 * w_4 * w_7 / 16 + w_2 * w_3 * w_4 * w_8 / 16 + w_2 * w_3 * w_5 ** 2 / 48 + w_2 * w_3 * w_5 * w_6 / 16 + w_2 * w_3 * w_5 * w_7 / 16 + w_2 * w_3 * w_5 * w_8 / 16 + w_2 * w_3 * w_6 ** 2 / 48 + w_2 * w_3 * w_6 * w_7 / 16 + w_2 * w_3 * w_6 * w_8 / 16 + w_2 * w_3 * w_7 ** 2 / 48 + w_2 * w_3 * w_7 * w_8 / 16 + w_2 * w_3 * w_8 ** 2 / 48 + w_2 * w_4 ** 2 * w_5 / 48 + w_2 * w_4 ** 2 * w_6 / 48 + w_2 * w_4 ** 2 * w_7 / 48 + w_2 * w_4 ** 2 * w_8 / 48 + w_2 * w_4 * w_5 ** 2 / 48 + w_2 * w_4 * w_5 * w_6 / 16 + w_2 * w_4 * w_5 * w_7 / 16 + w_2 * w_4 * w_5 * w_8 / 16 + w_2 * w_4 * w_6 ** 2 / 48 + w_2 * w_4 * w_6 * w_7 / 16 + w_2 * w_4 * w_6 * w_8 / 16 + w_2 * w_4 * w_7 ** 2 / 48 + w_2 * w_4 * w_7 * w_8 / 16 + w_2 * w_4 * w_8 ** 2 / 48 + w_2 * w_5 ** 2 * w_6 / 48 + w_2 * w_5 ** 2 * w_7 / 48 + w_2 * w_5 ** 2 * w_8 / 48 + w_2 * w_5 * w_6 ** 2 / 48 + w_2 * w_5 * w_6 * w_7 / 16 + w_2 * w_5 * w_6 * w_8 / 16 + w_2 * w_5 * w_7 ** 2 / 48 + w_2 * w_5 * w_7 * w_8 / 16 + w_2 * w_5 * w_8 ** 2 / 48 + w_2 * w_6 ** 2 * w_7 / 48 + w_2 * w_6 ** 2 * w_8 / 48 + w_2 * w_6 * w_7 ** 2 / 48 + w_2 * w_6 * w_7 * w_8 / 16 + w_2 * w_6 * w_8 ** 2 / 48 + w_2 * w_7 ** 2 * w_8 / 48 + w_2 * w_7 * w_8 ** 2 / 48 - w_3 ** 4 / 720 + w_3 ** 2 * w_4 ** 2 / 144 + w_3 ** 2 * w_4 * w_5 / 48 + w_3 ** 2 * w_4 * w_6 / 48 + w_3 ** 2 * w_4 * w_7 / 48 + w_3 ** 2 * w_4 * w_8 / 48 + w_3 ** 2 * w_5 ** 2 / 144 + w_3 ** 2 * w_5 * w_6 / 48 + w_3 ** 2 * w_5 * w_7 / 48 + w_3 ** 2 * w_5 * w_8 / 48 + w_3 ** 2 * w_6 ** 2 / 144 + w_3 ** 2 * w_6 * w_7 / 48 + w_3 ** 2 * w_6 * w_8 / 48 + w_3 ** 2 * w_7 ** 2 / 144 + w_3 ** 2 * w_7 * w_8 / 48 + w_3 ** 2 * w_8 ** 2 / 144 + w_3 * w_4 ** 2 * w_5 / 48 + w_3 * w_4 ** 2 * w_6 / 48 + w_3 * w_4 ** 2 * w_7 / 48 + w_3 * w_4 ** 2 * w_8 / 48 + w_3 * w_4 * w_5 ** 2 / 48 + w_3 * w_4 * w_5 * w_6 / 16 + w_3 * w_4 * w_5 * w_7 / 16 + w_3 * w_4 * w_5 * w_8 / 16 + w_3 * w_4 * w_6 ** 2 / 48 + w_3 * w_4 * w_6 * w_7 / 16 + w_3 * w_4 * w_6 * w_8 / 16 + w_3 * w_4 * w_7 ** 2 / 48 + w_3 * w_4 * w_7 * w_8 / 16 + w_3 * w_4 * w_8 ** 2 / 48 + w_3 * w_5 ** 2 * w_6 / 48 + w_3 * w_5 ** 2 * w_7 / 48 + w_3 * w_5 ** 2 * w_8 / 48 + w_3 * w_5 * w_6 ** 2 / 48 + w_3 * w_5 * w_6 * w_7 / 16 + w_3 * w_5 * w_6 * w_8 / 16 + w_3 * w_5 * w_7 ** 2 / 48 + w_3 * w_5 * w_7 * w_8 / 16 + w_3 * w_5 * w_8 ** 2 / 48 + w_3 * w_6 ** 2 * w_7 / 48 + w_3 * w_6 ** 2 * w_8 / 48 + w_3 * w_6 * w_7 ** 2 / 48 + w_3 * w_6 * w_7 * w_8 / 16 + w_3 * w_6 * w_8 ** 2 / 48 + w_3 * w_7 ** 2 * w_8 / 48 + w_3 * w_7 * w_8 ** 2 / 48 - w_4 ** 4 / 720 + w_4 ** 2 * w_5 ** 2 / 144 + w_4 ** 2 * w_5 * w_6 / 48 + w_4 ** 2 * w_5 * w_7 / 48 + w_4 ** 2 * w_5 * w_8 / 48 + w_4 ** 2 * w_6 ** 2 / 144 + w_4 ** 2 * w_6 * w_7 / 48 + w_4 ** 2 * w_6 * w_8 / 48 + w_4 ** 2 * w_7 ** 2 / 144 + w_4 ** 2 * w_7 * w_8 / 48 + w_4 ** 2 * w_8 ** 2 / 144 + w_4 * w_5 ** 2 * w_6 / 48 + w_4 * w_5 ** 2 * w_7 / 48 + w_4 * w_5 ** 2 * w_8 / 48 + w_4 * w_5 * w_6 ** 2 / 48 + w_4 * w_5 * w_6 * w_7 / 16 + w_4 * w_5 * w_6 * w_8 / 16 + w_4 * w_5 * w_7 ** 2 / 48 + w_4 * w_5 * w_7 * w_8 / 16 + w_4 * w_5 * w_8 ** 2 / 48 + w_4 * w_6 ** 2 * w_7 / 48 + w_4 * w_6 ** 2 * w_8 / 48 + w_4 * w_6 * w_7 ** 2 / 48 + w_4 * w_6 * w_7 * w_8 / 16 + w_4 * w_6 * w_8 ** 2 / 48 + w_4 * w_7 ** 2 * w_8 / 48 + w_4 * w_7 * w_8 ** 2 / 48 - w_5 ** 4 / 720 + w_5 ** 2 * w_6 ** 2 / 144 + w_5 ** 2 * w_6 * w_7 / 48 + w_5 ** 2 * w_6 * w_8 / 48 + w_5 ** 2 * w_7 ** 2 / 144 + w_5 ** 2 * w_7 * w_8 / 48 + w_5 ** 2 * w_8 ** 2 / 144 + w_5 * w_6 ** 2 * w_7 / 48 + w_5 * w_6 ** 2 * w_8 / 48 + w_5 * w_6 * w_7 ** 2 / 48 + w_5 * w_6 * w_7 * w_8 / 16 + w_5 * w_6 * w_8 ** 2 / 48 + w_5 * w_7 ** 2 * w_8 / 48 + w_5 * w_7 * w_8 ** 2 / 48 - w_6 ** 4 / 720 + w_6 ** 2 * w_7 ** 2 / 144 + w_6 ** 2 * w_7 * w_8 / 48 + w_6 ** 2 * w_8 ** 2 / 144 + w_6 * w_7 ** 2 * w_8 / 48 + w_6 * w_7 * w_8 ** 2 / 48 - w_7 ** 4 / 720 + w_7 ** 2 * w_8 ** 2 / 144 - w_8 ** 4 / 720
-    if s == 5 and ln == 7:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        return -w_1 ** 4 * w_2 / 1440 - w_1 ** 4 * w_3 / 1440 - w_1 ** 4 * w_4 / 1440 - w_1 ** 4 * w_5 / 1440 - w_1 ** 4 * w_6 / 1440 - w_1 ** 4 * w_7 / 1440 + w_1 ** 2 * w_2 ** 2 * w_3 / 288 + w_1 ** 2 * w_2 ** 2 * w_4 / 288 + w_1 ** 2 * w_2 ** 2 * w_5 / 288 + w_1 ** 2 * w_2 ** 2 * w_6 / 288 + w_1 ** 2 * w_2 ** 2 * w_7 / 288 + w_1 ** 2 * w_2 * w_3 ** 2 / 288 + w_1 ** 2 * w_2 * w_3 * w_4 / 96 + w_1 ** 2 * w_2 * w_3 * w_5 / 96 + w_1 ** 2 * w_2 * w_3 * w_6 / 96 + w_1 ** 2 * w_2 * w_3 * w_7 / 96 + w_1 ** 2 * w_2 * w_4 ** 2 / 288 + w_1 ** 2 * w_2 * w_4 * w_5 / 96 + w_1 ** 2 * w_2 * w_4 * w_6 / 96 + w_1 ** 2 * w_2 * w_4 * w_7 / 96 + w_1 ** 2 * w_2 * w_5 ** 2 / 288 + w_1 ** 2 * w_2 * w_5 * w_6 / 96 + w_1 ** 2 * w_2 * w_5 * w_7 / 96 + w_1 ** 2 * w_2 * w_6 ** 2 / 288 + w_1 ** 2 * w_2 * w_6 * w_7 / 96 + w_1 ** 2 * w_2 * w_7 ** 2 / 288 + w_1 ** 2 * w_3 ** 2 * w_4 / 288 + w_1 ** 2 * w_3 ** 2 * w_5 / 288 + w_1 ** 2 * w_3 ** 2 * w_6 / 288 + w_1 ** 2 * w_3 ** 2 * w_7 / 288 + w_1 ** 2 * w_3 * w_4 ** 2 / 288 + w_1 ** 2 * w_3 * w_4 * w_5 / 96 + w_1 ** 2 * w_3 * w_4 * w_6 / 96 + w_1 ** 2 * w_3 * w_4 * w_7 / 96 + w_1 ** 2 * w_3 * w_5 ** 2 / 288 + w_1 ** 2 * w_3 * w_5 * w_6 / 96 + w_1 ** 2 * w_3 * w_5 * w_7 / 96 + w_1 ** 2 * w_3 * w_6 ** 2 / 288 + w_1 ** 2 * w_3 * w_6 * w_7 / 96 + w_1 ** 2 * w_3 * w_7 ** 2 / 288 + w_1 ** 2 * w_4 ** 2 * w_5 / 288 + w_1 ** 2 * w_4 ** 2 * w_6 / 288 + w_1 ** 2 * w_4 ** 2 * w_7 / 288 + w_1 ** 2 * w_4 * w_5 ** 2 / 288 + w_1 ** 2 * w_4 * w_5 * w_6 / 96 + w_1 ** 2 * w_4 * w_5 * w_7 / 96 + w_1 ** 2 * w_4 * w_6 ** 2 / 288 + w_1 ** 2 * w_4 * w_6 * w_7 / 96 + w_1 ** 2 * w_4 * w_7 ** 2 / 288 + w_1 ** 2 * w_5 ** 2 * w_6 / 288 + w_1 ** 2 * w_5 ** 2 * w_7 / 288 + w_1 ** 2 * w_5 * w_6 ** 2 / 288 + w_1 ** 2 * w_5 * w_6 * w_7 / 96 + w_1 ** 2 * w_5 * w_7 ** 2 / 288 + w_1 ** 2 * w_6 ** 2 * w_7 / 288 + w_1 ** 2 * w_6 * w_7 ** 2 / 288 - w_1 * w_2 ** 4 / 1440 + w_1 * w_2 ** 2 * w_3 ** 2 / 288 + w_1 * w_2 ** 2 * w_3 * w_4 / 96 + w_1 * w_2 ** 2 * w_3 * w_5 / 96 + w_1 * w_2 ** 2 * w_3 * w_6 / 96 + w_1 * w_2 ** 2 * w_3 * w_7 / 96 + w_1 * w_2 ** 2 * w_4 ** 2 / 288 + w_1 * w_2 ** 2 * w_4 * w_5 / 96 + w_1 * w_2 ** 2 * w_4 * w_6 / 96 + w_1 * w_2 ** 2 * w_4 * w_7 / 96 + w_1 * w_2 ** 2 * w_5 ** 2 / 288 + w_1 * w_2 ** 2 * w_5 * w_6 / 96 + w_1 * w_2 ** 2 * w_5 * w_7 / 96 + w_1 * w_2 ** 2 * w_6 ** 2 / 288 + w_1 * w_2 ** 2 * w_6 * w_7 / 96 + w_1 * w_2 ** 2 * w_7 ** 2 / 288 + w_1 * w_2 * w_3 ** 2 * w_4 / 96 + w_1 * w_2 * w_3 ** 2 * w_5 / 96 + w_1 * w_2 * w_3 ** 2 * w_6 / 96 + w_1 * w_2 * w_3 ** 2 * w_7 / 96 + w_1 * w_2 * w_3 * w_4 ** 2 / 96 + w_1 * w_2 * w_3 * w_4 * w_5 / 32 + w_1 * w_2 * w_3 * w_4 * w_6 / 32 + w_1 * w_2 * w_3 * w_4 * w_7 / 32 + w_1 * w_2 * w_3 * w_5 ** 2 / 96 + w_1 * w_2 * w_3 * w_5 * w_6 / 32 + w_1 * w_2 * w_3 * w_5 * w_7 / 32 + w_1 * w_2 * w_3 * w_6 ** 2 / 96 + w_1 * w_2 * w_3 * w_6 * w_7 / 32 + w_1 * w_2 * w_3 * w_7 ** 2 / 96 + w_1 * w_2 * w_4 ** 2 * w_5 / 96 + w_1 * w_2 * w_4 ** 2 * w_6 / 96 + w_1 * w_2 * w_4 ** 2 * w_7 / 96 + w_1 * w_2 * w_4 * w_5 ** 2 / 96 + w_1 * w_2 * w_4 * w_5 * w_6 / 32 + w_1 * w_2 * w_4 * w_5 * w_7 / 32 + w_1 * w_2 * w_4 * w_6 ** 2 / 96 + w_1 * w_2 * w_4 * w_6 * w_7 / 32 + w_1 * w_2 * w_4 * w_7 ** 2 / 96 + w_1 * w_2 * w_5 ** 2 * w_6 / 96 + w_1 * w_2 * w_5 ** 2 * w_7 / 96 + w_1 * w_2 * w_5 * w_6 ** 2 / 96 + w_1 * w_2 * w_5 * w_6 * w_7 / 32 + w_1 * w_2 * w_5 * w_7 ** 2 / 96 + w_1 * w_2 * w_6 ** 2 * w_7 / 96 + w_1 * w_2 * w_6 * w_7 ** 2 / 96 - w_1 * w_3 ** 4 / 1440 + w_1 * w_3 ** 2 * w_4 ** 2 / 288 + w_1 * w_3 ** 2 * w_4 * w_5 / 96 + w_1 * w_3 ** 2 * w_4 * w_6 / 96 + w_1 * w_3 ** 2 * w_4 * w_7 / 96 + w_1 * w_3 ** 2 * w_5 ** 2 / 288 + w_1 * w_3 ** 2 * w_5 * w_6 / 96 + w_1 * w_3 ** 2 * w_5 * w_7 / 96 + w_1 * w_3 ** 2 * w_6 ** 2 / 288 + w_1 * w_3 ** 2 * w_6 * w_7 / 96 + w_1 * w_3 ** 2 * w_7 ** 2 / 288 + w_1 * w_3 * w_4 ** 2 * w_5 / 96 + w_1 * w_3 * w_4 ** 2 * w_6 / 96 + w_1 * w_3 * w_4 ** 2 * w_7 / 96 + w_1 * w_3 * w_4 * w_5 ** 2 / 96 + w_1 * w_3 * w_4 * w_5 * w_6 / 32 + w_1 * w_3 * w_4 * w_5 * w_7 / 32 + w_1 * w_3 * w_4 * w_6 ** 2 / 96 + w_1 * w_3 * w_4 * w_6 * w_7 / 32 + w_1 * w_3 * w_4 * w_7 ** 2 / 96 + w_1 * w_3 * w_5 ** 2 * w_6 / 96 + w_1 * w_3 * w_5 ** 2 * w_7 / 96 + w_1 * w_3 * w_5 * w_6 ** 2 / 96 + w_1 * w_3 * w_5 * w_6 * w_7 / 32 + w_1 * w_3 * w_5 * w_7 ** 2 / 96 + w_1 * w_3 * w_6 ** 2 * w_7 / 96 + w_1 * w_3 * w_6 * w_7 ** 2 / 96 - w_1 * w_4 ** 4 / 1440 + w_1 * w_4 ** 2 * w_5 ** 2 / 288 + w_1 * w_4 ** 2 * w_5 * w_6 / 96 + w_1 * w_4 ** 2 * w_5 * w_7 / 96 + w_1 * w_4 ** 2 * w_6 ** 2 / 288 + w_1 * w_4 ** 2 * w_6 * w_7 / 96 + w_1 * w_4 ** 2 * w_7 ** 2 / 288 + w_1 * w_4 * w_5 ** 2 * w_6 / 96 + w_1 * w_4 * w_5 ** 2 * w_7 / 96 + w_1 * w_4 * w_5 * w_6 ** 2 / 96 + w_1 * w_4 * w_5 * w_6 * w_7 / 32 + w_1 * w_4 * w_5 * w_7 ** 2 / 96 + w_1 * w_4 * w_6 ** 2 * w_7 / 96 + w_1 * w_4 * w_6 * w_7 ** 2 / 96 - w_1 * w_5 ** 4 / 1440 + w_1 * w_5 ** 2 * w_6 ** 2 / 288 + w_1 * w_5 ** 2 * w_6 * w_7 / 96 + w_1 * w_5 ** 2 * w_7 ** 2 / 288 + w_1 * w_5 * w_6 ** 2 * w_7 / 96 + w_1 * w_5 * w_6 * w_7 ** 2 / 96 - w_1 * w_6 ** 4 / 1440 + w_1 * w_6 ** 2 * w_7 ** 2 / 288 - w_1 * w_7 ** 4 / 1440 - w_2 ** 4 * w_3 / 1440 - w_2 ** 4 * w_4 / 1440 - w_2 ** 4 * w_5 / 1440 - w_2 ** 4 * w_6 / 1440 - w_2 ** 4 * w_7 / 1440 + w_2 ** 2 * w_3 ** 2 * w_4 / 288 + w_2 ** 2 * w_3 ** 2 * w_5 / 288 + w_2 ** 2 * w_3 ** 2 * w_6 / 288 + w_2 ** 2 * w_3 ** 2 * w_7 / 288 + w_2 ** 2 * w_3 * w_4 ** 2 / 288 + w_2 ** 2 * w_3 * w_4 * w_5 / 96 + w_2 ** 2 * w_3 * w_4 * w_6 / 96 + w_2 ** 2 * w_3 * w_4 * w_7 / 96 + w_2 ** 2 * w_3 * w_5 ** 2 / 288 + w_2 ** 2 * w_3 * w_5 * w_6 / 96 + w_2 ** 2 * w_3 * w_5 * w_7 / 96 + w_2 ** 2 * w_3 * w_6 ** 2 / 288 + w_2 ** 2 * w_3 * w_6 * w_7 / 96 + w_2 ** 2 * w_3 * w_7 ** 2 / 288 + w_2 ** 2 * w_4 ** 2 * w_5 / 288 + w_2 ** 2 * w_4 ** 2 * w_6 / 288 + w_2 ** 2 * w_4 ** 2 * w_7 / 288 + w_2 ** 2 * w_4 * w_5 ** 2 / 288 + w_2 ** 2 * w_4 * w_5 * w_6 / 96 + w_2 ** 2 * w_4 * w_5 * w_7 / 96 + w_2 ** 2 * w_4 * w_6 ** 2 / 288 + w_2 ** 2 * w_4 * w_6 * w_7 / 96 + w_2 ** 2 * w_4 * w_7 ** 2 / 288 + w_2 ** 2 * w_5 ** 2 * w_6 / 288 + w_2 ** 2 * w_5 ** 2 * w_7 / 288 + w_2 ** 2 * w_5 * w_6 ** 2 / 288 + w_2 ** 2 * w_5 * w_6 * w_7 / 96 + w_2 ** 2 * w_5 * w_7 ** 2 / 288 + w_2 ** 2 * w_6 ** 2 * w_7 / 288 + w_2 ** 2 * w_6 * w_7 ** 2 / 288 - w_2 * w_3 ** 4 / 1440 + w_2 * w_3 ** 2 * w_4 ** 2 / 288 + w_2 * w_3 ** 2 * w_4 * w_5 / 96 + w_2 * w_3 ** 2 * w_4 * w_6 / 96 + w_2 * w_3 ** 2 * w_4 * w_7 / 96 + w_2 * w_3 ** 2 * w_5 ** 2 / 288 + w_2 * w_3 ** 2 * w_5 * w_6 / 96 + w_2 * w_3 ** 2 * w_5 * w_7 / 96 + w_2 * w_3 ** 2 * w_6 ** 2 / 288 + w_2 * w_3 ** 2 * w_6 * w_7 / 96 + w_2 * w_3 ** 2 * w_7 ** 2 / 288 + w_2 * w_3 * w_4 ** 2 * w_5 / 96 + w_2 * w_3 * w_4 ** 2 * w_6 / 96 + w_2 * w_3 * w_4 ** 2 * w_7 / 96 + w_2 * w_3 * w_4 * w_5 ** 2 / 96 + w_2 * w_3 * w_4 * w_5 * w_6 / 32 + w_2 * w_3 * w_4 * w_5 * w_7 / 32 + w_2 * w_3 * w_4 * w_6 ** 2 / 96 + w_2 * w_3 * w_4 * w_6 * w_7 / 32 + w_2 * w_3 * w_4 * w_7 ** 2 / 96 + w_2 * w_3 * w_5 ** 2 * w_6 / 96 + w_2 * w_3 * w_5 ** 2 * w_7 / 96 + w_2 * w_3 * w_5 * w_6 ** 2 / 96 + w_2 * w_3 * w_5 * w_6 * w_7 / 32 + w_2 * w_3 * w_5 * w_7 ** 2 / 96 + w_2 * w_3 * w_6 ** 2 * w_7 / 96 + w_2 * w_3 * w_6 * w_7 ** 2 / 96 - w_2 * w_4 ** 4 / 1440 + w_2 * w_4 ** 2 * w_5 ** 2 / 288 + w_2 * w_4 ** 2 * w_5 * w_6 / 96 + w_2 * w_4 ** 2 * w_5 * w_7 / 96 + w_2 * w_4 ** 2 * w_6 ** 2 / 288 + w_2 * w_4 ** 2 * w_6 * w_7 / 96 + w_2 * w_4 ** 2 * w_7 ** 2 / 288 + w_2 * w_4 * w_5 ** 2 * w_6 / 96 + w_2 * w_4 * w_5 ** 2 * w_7 / 96 + w_2 * w_4 * w_5 * w_6 ** 2 / 96 + w_2 * w_4 * w_5 * w_6 * w_7 / 32 + w_2 * w_4 * w_5 * w_7 ** 2 / 96 + w_2 * w_4 * w_6 ** 2 * w_7 / 96 + w_2 * w_4 * w_6 * w_7 ** 2 / 96 - w_2 * w_5 ** 4 / 1440 + w_2 * w_5 ** 2 * w_6 ** 2 / 288 + w_2 * w_5 ** 2 * w_6 * w_7 / 96 + w_2 * w_5 ** 2 * w_7 ** 2 / 288 + w_2 * w_5 * w_6 ** 2 * w_7 / 96 + w_2 * w_5 * w_6 * w_7 ** 2 / 96 - w_2 * w_6 ** 4 / 1440 + w_2 * w_6 ** 2 * w_7 ** 2 / 288 - w_2 * w_7 ** 4 / 1440 - w_3 ** 4 * w_4 / 1440 - w_3 ** 4 * w_5 / 1440 - w_3 ** 4 * w_6 / 1440 - w_3 ** 4 * w_7 / 1440 + w_3 ** 2 * w_4 ** 2 * w_5 / 288 + w_3 ** 2 * w_4 ** 2 * w_6 / 288 + w_3 ** 2 * w_4 ** 2 * w_7 / 288 + w_3 ** 2 * w_4 * w_5 ** 2 / 288 + w_3 ** 2 * w_4 * w_5 * w_6 / 96 + w_3 ** 2 * w_4 * w_5 * w_7 / 96 + w_3 ** 2 * w_4 * w_6 ** 2 / 288 + w_3 ** 2 * w_4 * w_6 * w_7 / 96 + w_3 ** 2 * w_4 * w_7 ** 2 / 288 + w_3 ** 2 * w_5 ** 2 * w_6 / 288 + w_3 ** 2 * w_5 ** 2 * w_7 / 288 + w_3 ** 2 * w_5 * w_6 ** 2 / 288 + w_3 ** 2 * w_5 * w_6 * w_7 / 96 + w_3 ** 2 * w_5 * w_7 ** 2 / 288 + w_3 ** 2 * w_6 ** 2 * w_7 / 288 + w_3 ** 2 * w_6 * w_7 ** 2 / 288 - w_3 * w_4 ** 4 / 1440 + w_3 * w_4 ** 2 * w_5 ** 2 / 288 + w_3 * w_4 ** 2 * w_5 * w_6 / 96 + w_3 * w_4 ** 2 * w_5 * w_7 / 96 + w_3 * w_4 ** 2 * w_6 ** 2 / 288 + w_3 * w_4 ** 2 * w_6 * w_7 / 96 + w_3 * w_4 ** 2 * w_7 ** 2 / 288 + w_3 * w_4 * w_5 ** 2 * w_6 / 96 + w_3 * w_4 * w_5 ** 2 * w_7 / 96 + w_3 * w_4 * w_5 * w_6 ** 2 / 96 + w_3 * w_4 * w_5 * w_6 * w_7 / 32 + w_3 * w_4 * w_5 * w_7 ** 2 / 96 + w_3 * w_4 * w_6 ** 2 * w_7 / 96 + w_3 * w_4 * w_6 * w_7 ** 2 / 96 - w_3 * w_5 ** 4 / 1440 + w_3 * w_5 ** 2 * w_6 ** 2 / 288 + w_3 * w_5 ** 2 * w_6 * w_7 / 96 + w_3 * w_5 ** 2 * w_7 ** 2 / 288 + w_3 * w_5 * w_6 ** 2 * w_7 / 96 + w_3 * w_5 * w_6 * w_7 ** 2 / 96 - w_3 * w_6 ** 4 / 1440 + w_3 * w_6 ** 2 * w_7 ** 2 / 288 - w_3 * w_7 ** 4 / 1440 - w_4 ** 4 * w_5 / 1440 - w_4 ** 4 * w_6 / 1440 - w_4 ** 4 * w_7 / 1440 + w_4 ** 2 * w_5 ** 2 * w_6 / 288 + w_4 ** 2 * w_5 ** 2 * w_7 / 288 + w_4 ** 2 * w_5 * w_6 ** 2 / 288 + w_4 ** 2 * w_5 * w_6 * w_7 / 96 + w_4 ** 2 * w_5 * w_7 ** 2 / 288 + w_4 ** 2 * w_6 ** 2 * w_7 / 288 + w_4 ** 2 * w_6 * w_7 ** 2 / 288 - w_4 * w_5 ** 4 / 1440 + w_4 * w_5 ** 2 * w_6 ** 2 / 288 + w_4 * w_5 ** 2 * w_6 * w_7 / 96 + w_4 * w_5 ** 2 * w_7 ** 2 / 288 + w_4 * w_5 * w_6 ** 2 * w_7 / 96 + w_4 * w_5 * w_6 * w_7 ** 2 / 96 - w_4 * w_6 ** 4 / 1440 + w_4 * w_6 ** 2 * w_7 ** 2 / 288 - w_4 * w_7 ** 4 / 1440 - w_5 ** 4 * w_6 / 1440 - w_5 ** 4 * w_7 / 1440 + w_5 ** 2 * w_6 ** 2 * w_7 / 288 + w_5 ** 2 * w_6 * w_7 ** 2 / 288 - w_5 * w_6 ** 4 / 1440 + w_5 * w_6 ** 2 * w_7 ** 2 / 288 - w_5 * w_7 ** 4 / 1440 - w_6 ** 4 * w_7 / 1440 - w_6 * w_7 ** 4 / 1440
-    if s == 6 and ln == 6:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        return w_1 ** 6 / 30240 - w_1 ** 4 * w_2 ** 2 / 8640 - w_1 ** 4 * w_2 * w_3 / 2880 - w_1 ** 4 * w_2 * w_4 / 2880 - w_1 ** 4 * w_2 * w_5 / 2880 - w_1 ** 4 * w_2 * w_6 / 2880 - w_1 ** 4 * w_3 ** 2 / 8640 - w_1 ** 4 * w_3 * w_4 / 2880 - w_1 ** 4 * w_3 * w_5 / 2880 - w_1 ** 4 * w_3 * w_6 / 2880 - w_1 ** 4 * w_4 ** 2 / 8640 - w_1 ** 4 * w_4 * w_5 / 2880 - w_1 ** 4 * w_4 * w_6 / 2880 - w_1 ** 4 * w_5 ** 2 / 8640 - w_1 ** 4 * w_5 * w_6 / 2880 - w_1 ** 4 * w_6 ** 2 / 8640 - w_1 ** 2 * w_2 ** 4 / 8640 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_6 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 * w_6 / 576 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_5 * w_6 / 576 + w_1 ** 2 * w_2 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_6 / 576 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 / 192 + w_1 ** 2 * w_2 * w_3 * w_4 * w_6 / 192 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_5 * w_6 / 192 + w_1 ** 2 * w_2 * w_3 * w_6 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_6 / 576 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 * w_5 * w_6 / 192 + w_1 ** 2 * w_2 * w_4 * w_6 ** 2 / 576 + w_1 ** 2 * w_2 * w_5 ** 2 * w_6 / 576 + w_1 ** 2 * w_2 * w_5 * w_6 ** 2 / 576 - w_1 ** 2 * w_3 ** 4 / 8640 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 / 576 + w_1 ** 2 * w_3 ** 2 * w_4 * w_6 / 576 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_5 * w_6 / 576 + w_1 ** 2 * w_3 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 / 576 + w_1 ** 2 * w_3 * w_4 ** 2 * w_6 / 576 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 / 576 + w_1 ** 2 * w_3 * w_4 * w_5 * w_6 / 192 + w_1 ** 2 * w_3 * w_4 * w_6 ** 2 / 576 + w_1 ** 2 * w_3 * w_5 ** 2 * w_6 / 576 + w_1 ** 2 * w_3 * w_5 * w_6 ** 2 / 576 - w_1 ** 2 * w_4 ** 4 / 8640 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_4 ** 2 * w_5 * w_6 / 576 + w_1 ** 2 * w_4 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_4 * w_5 ** 2 * w_6 / 576 + w_1 ** 2 * w_4 * w_5 * w_6 ** 2 / 576 - w_1 ** 2 * w_5 ** 4 / 8640 + w_1 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 - w_1 ** 2 * w_6 ** 4 / 8640 - w_1 * w_2 ** 4 * w_3 / 2880 - w_1 * w_2 ** 4 * w_4 / 2880 - w_1 * w_2 ** 4 * w_5 / 2880 - w_1 * w_2 ** 4 * w_6 / 2880 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_6 / 576 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 / 192 + w_1 * w_2 ** 2 * w_3 * w_4 * w_6 / 192 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_5 * w_6 / 192 + w_1 * w_2 ** 2 * w_3 * w_6 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_6 / 576 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 * w_5 * w_6 / 192 + w_1 * w_2 ** 2 * w_4 * w_6 ** 2 / 576 + w_1 * w_2 ** 2 * w_5 ** 2 * w_6 / 576 + w_1 * w_2 ** 2 * w_5 * w_6 ** 2 / 576 - w_1 * w_2 * w_3 ** 4 / 2880 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 / 192 + w_1 * w_2 * w_3 ** 2 * w_4 * w_6 / 192 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_5 * w_6 / 192 + w_1 * w_2 * w_3 ** 2 * w_6 ** 2 / 576 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 / 192 + w_1 * w_2 * w_3 * w_4 ** 2 * w_6 / 192 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 / 192 + w_1 * w_2 * w_3 * w_4 * w_5 * w_6 / 64 + w_1 * w_2 * w_3 * w_4 * w_6 ** 2 / 192 + w_1 * w_2 * w_3 * w_5 ** 2 * w_6 / 192 + w_1 * w_2 * w_3 * w_5 * w_6 ** 2 / 192 - w_1 * w_2 * w_4 ** 4 / 2880 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 / 576 + w_1 * w_2 * w_4 ** 2 * w_5 * w_6 / 192 + w_1 * w_2 * w_4 ** 2 * w_6 ** 2 / 576 + w_1 * w_2 * w_4 * w_5 ** 2 * w_6 / 192 + w_1 * w_2 * w_4 * w_5 * w_6 ** 2 / 192 - w_1 * w_2 * w_5 ** 4 / 2880 + w_1 * w_2 * w_5 ** 2 * w_6 ** 2 / 576 - w_1 * w_2 * w_6 ** 4 / 2880 - w_1 * w_3 ** 4 * w_4 / 2880 - w_1 * w_3 ** 4 * w_5 / 2880 - w_1 * w_3 ** 4 * w_6 / 2880 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 / 576 + w_1 * w_3 ** 2 * w_4 ** 2 * w_6 / 576 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 / 576 + w_1 * w_3 ** 2 * w_4 * w_5 * w_6 / 192 + w_1 * w_3 ** 2 * w_4 * w_6 ** 2 / 576 + w_1 * w_3 ** 2 * w_5 ** 2 * w_6 / 576 + w_1 * w_3 ** 2 * w_5 * w_6 ** 2 / 576 - w_1 * w_3 * w_4 ** 4 / 2880 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 / 576 + w_1 * w_3 * w_4 ** 2 * w_5 * w_6 / 192 + w_1 * w_3 * w_4 ** 2 * w_6 ** 2 / 576 + w_1 * w_3 * w_4 * w_5 ** 2 * w_6 / 192 + w_1 * w_3 * w_4 * w_5 * w_6 ** 2 / 192 - w_1 * w_3 * w_5 ** 4 / 2880 + w_1 * w_3 * w_5 ** 2 * w_6 ** 2 / 576 - w_1 * w_3 * w_6 ** 4 / 2880 - w_1 * w_4 ** 4 * w_5 / 2880 - w_1 * w_4 ** 4 * w_6 / 2880 + w_1 * w_4 ** 2 * w_5 ** 2 * w_6 / 576 + w_1 * w_4 ** 2 * w_5 * w_6 ** 2 / 576 - w_1 * w_4 * w_5 ** 4 / 2880 + w_1 * w_4 * w_5 ** 2 * w_6 ** 2 / 576 - w_1 * w_4 * w_6 ** 4 / 2880 - w_1 * w_5 ** 4 * w_6 / 2880 - w_1 * w_5 * w_6 ** 4 / 2880 + w_2 ** 6 / 30240 - w_2 ** 4 * w_3 ** 2 / 8640 - w_2 ** 4 * w_3 * w_4 / 2880 - w_2 ** 4 * w_3 * w_5 / 2880 - w_2 ** 4 * w_3 * w_6 / 2880 - w_2 ** 4 * w_4 ** 2 / 8640 - w_2 ** 4 * w_4 * w_5 / 2880 - w_2 ** 4 * w_4 * w_6 / 2880 - w_2 ** 4 * w_5 ** 2 / 8640 - w_2 ** 4 * w_5 * w_6 / 2880 - w_2 ** 4 * w_6 ** 2 / 8640 - w_2 ** 2 * w_3 ** 4 / 8640 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 576 + w_2 ** 2 * w_3 ** 2 * w_4 * w_6 / 576 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_5 * w_6 / 576 + w_2 ** 2 * w_3 ** 2 * w_6 ** 2 / 1728 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 576 + w_2 ** 2 * w_3 * w_4 ** 2 * w_6 / 576 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 576 + w_2 ** 2 * w_3 * w_4 * w_5 * w_6 / 192 + w_2 ** 2 * w_3 * w_4 * w_6 ** 2 / 576 + w_2 ** 2 * w_3 * w_5 ** 2 * w_6 / 576 + w_2 ** 2 * w_3 * w_5 * w_6 ** 2 / 576 - w_2 ** 2 * w_4 ** 4 / 8640 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 + w_2 ** 2 * w_4 ** 2 * w_5 * w_6 / 576 + w_2 ** 2 * w_4 ** 2 * w_6 ** 2 / 1728 + w_2 ** 2 * w_4 * w_5 ** 2 * w_6 / 576 + w_2 ** 2 * w_4 * w_5 * w_6 ** 2 / 576 - w_2 ** 2 * w_5 ** 4 / 8640 + w_2 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 - w_2 ** 2 * w_6 ** 4 / 8640 - w_2 * w_3 ** 4 * w_4 / 2880 - w_2 * w_3 ** 4 * w_5 / 2880 - w_2 * w_3 ** 4 * w_6 / 2880 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 576 + w_2 * w_3 ** 2 * w_4 ** 2 * w_6 / 576 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 576 + w_2 * w_3 ** 2 * w_4 * w_5 * w_6 / 192 + w_2 * w_3 ** 2 * w_4 * w_6 ** 2 / 576 + w_2 * w_3 ** 2 * w_5 ** 2 * w_6 / 576 + w_2 * w_3 ** 2 * w_5 * w_6 ** 2 / 576 - w_2 * w_3 * w_4 ** 4 / 2880 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 576 + w_2 * w_3 * w_4 ** 2 * w_5 * w_6 / 192 + w_2 * w_3 * w_4 ** 2 * w_6 ** 2 / 576 + w_2 * w_3 * w_4 * w_5 ** 2 * w_6 / 192 + w_2 * w_3 * w_4 * w_5 * w_6 ** 2 / 192 - w_2 * w_3 * w_5 ** 4 / 2880 + w_2 * w_3 * w_5 ** 2 * w_6 ** 2 / 576 - w_2 * w_3 * w_6 ** 4 / 2880 - w_2 * w_4 ** 4 * w_5 / 2880 - w_2 * w_4 ** 4 * w_6 / 2880 + w_2 * w_4 ** 2 * w_5 ** 2 * w_6 / 576 + w_2 * w_4 ** 2 * w_5 * w_6 ** 2 / 576 - w_2 * w_4 * w_5 ** 4 / 2880 + w_2 * w_4 * w_5 ** 2 * w_6 ** 2 / 576 - w_2 * w_4 * w_6 ** 4 / 2880 - w_2 * w_5 ** 4 * w_6 / 2880 - w_2 * w_5 * w_6 ** 4 / 2880 + w_3 ** 6 / 30240 - w_3 ** 4 * w_4 ** 2 / 8640 - w_3 ** 4 * w_4 * w_5 / 2880 - w_3 ** 4 * w_4 * w_6 / 2880 - w_3 ** 4 * w_5 ** 2 / 8640 - w_3 ** 4 * w_5 * w_6 / 2880 - w_3 ** 4 * w_6 ** 2 / 8640 - w_3 ** 2 * w_4 ** 4 / 8640 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 + w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 576 + w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 1728 + w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 576 + w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 576 - w_3 ** 2 * w_5 ** 4 / 8640 + w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 - w_3 ** 2 * w_6 ** 4 / 8640 - w_3 * w_4 ** 4 * w_5 / 2880 - w_3 * w_4 ** 4 * w_6 / 2880 + w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 576 + w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 576 - w_3 * w_4 * w_5 ** 4 / 2880 + w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 576 - w_3 * w_4 * w_6 ** 4 / 2880 - w_3 * w_5 ** 4 * w_6 / 2880 - w_3 * w_5 * w_6 ** 4 / 2880 + w_4 ** 6 / 30240 - w_4 ** 4 * w_5 ** 2 / 8640 - w_4 ** 4 * w_5 * w_6 / 2880 - w_4 ** 4 * w_6 ** 2 / 8640 - w_4 ** 2 * w_5 ** 4 / 8640 + w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 - w_4 ** 2 * w_6 ** 4 / 8640 - w_4 * w_5 ** 4 * w_6 / 2880 - w_4 * w_5 * w_6 ** 4 / 2880 + w_5 ** 6 / 30240 - w_5 ** 4 * w_6 ** 2 / 8640 - w_5 ** 2 * w_6 ** 4 / 8640 + w_6 ** 6 / 30240
-    if s == 7 and ln == 5:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        return w_1 ** 6 * w_2 / 60480 + w_1 ** 6 * w_3 / 60480 + w_1 ** 6 * w_4 / 60480 + w_1 ** 6 * w_5 / 60480 - w_1 ** 4 * w_2 ** 2 * w_3 / 17280 - w_1 ** 4 * w_2 ** 2 * w_4 / 17280 - w_1 ** 4 * w_2 ** 2 * w_5 / 17280 - w_1 ** 4 * w_2 * w_3 ** 2 / 17280 - w_1 ** 4 * w_2 * w_3 * w_4 / 5760 - w_1 ** 4 * w_2 * w_3 * w_5 / 5760 - w_1 ** 4 * w_2 * w_4 ** 2 / 17280 - w_1 ** 4 * w_2 * w_4 * w_5 / 5760 - w_1 ** 4 * w_2 * w_5 ** 2 / 17280 - w_1 ** 4 * w_3 ** 2 * w_4 / 17280 - w_1 ** 4 * w_3 ** 2 * w_5 / 17280 - w_1 ** 4 * w_3 * w_4 ** 2 / 17280 - w_1 ** 4 * w_3 * w_4 * w_5 / 5760 - w_1 ** 4 * w_3 * w_5 ** 2 / 17280 - w_1 ** 4 * w_4 ** 2 * w_5 / 17280 - w_1 ** 4 * w_4 * w_5 ** 2 / 17280 - w_1 ** 2 * w_2 ** 4 * w_3 / 17280 - w_1 ** 2 * w_2 ** 4 * w_4 / 17280 - w_1 ** 2 * w_2 ** 4 * w_5 / 17280 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 ** 2 / 3456 - w_1 ** 2 * w_2 * w_3 ** 4 / 17280 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 ** 2 / 1152 - w_1 ** 2 * w_2 * w_4 ** 4 / 17280 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 ** 2 / 3456 - w_1 ** 2 * w_2 * w_5 ** 4 / 17280 - w_1 ** 2 * w_3 ** 4 * w_4 / 17280 - w_1 ** 2 * w_3 ** 4 * w_5 / 17280 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 3456 - w_1 ** 2 * w_3 * w_4 ** 4 / 17280 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 3456 - w_1 ** 2 * w_3 * w_5 ** 4 / 17280 - w_1 ** 2 * w_4 ** 4 * w_5 / 17280 - w_1 ** 2 * w_4 * w_5 ** 4 / 17280 + w_1 * w_2 ** 6 / 60480 - w_1 * w_2 ** 4 * w_3 ** 2 / 17280 - w_1 * w_2 ** 4 * w_3 * w_4 / 5760 - w_1 * w_2 ** 4 * w_3 * w_5 / 5760 - w_1 * w_2 ** 4 * w_4 ** 2 / 17280 - w_1 * w_2 ** 4 * w_4 * w_5 / 5760 - w_1 * w_2 ** 4 * w_5 ** 2 / 17280 - w_1 * w_2 ** 2 * w_3 ** 4 / 17280 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 1152 - w_1 * w_2 ** 2 * w_4 ** 4 / 17280 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 3456 - w_1 * w_2 ** 2 * w_5 ** 4 / 17280 - w_1 * w_2 * w_3 ** 4 * w_4 / 5760 - w_1 * w_2 * w_3 ** 4 * w_5 / 5760 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 1152 - w_1 * w_2 * w_3 * w_4 ** 4 / 5760 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 1152 - w_1 * w_2 * w_3 * w_5 ** 4 / 5760 - w_1 * w_2 * w_4 ** 4 * w_5 / 5760 - w_1 * w_2 * w_4 * w_5 ** 4 / 5760 + w_1 * w_3 ** 6 / 60480 - w_1 * w_3 ** 4 * w_4 ** 2 / 17280 - w_1 * w_3 ** 4 * w_4 * w_5 / 5760 - w_1 * w_3 ** 4 * w_5 ** 2 / 17280 - w_1 * w_3 ** 2 * w_4 ** 4 / 17280 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 3456 - w_1 * w_3 ** 2 * w_5 ** 4 / 17280 - w_1 * w_3 * w_4 ** 4 * w_5 / 5760 - w_1 * w_3 * w_4 * w_5 ** 4 / 5760 + w_1 * w_4 ** 6 / 60480 - w_1 * w_4 ** 4 * w_5 ** 2 / 17280 - w_1 * w_4 ** 2 * w_5 ** 4 / 17280 + w_1 * w_5 ** 6 / 60480 + w_2 ** 6 * w_3 / 60480 + w_2 ** 6 * w_4 / 60480 + w_2 ** 6 * w_5 / 60480 - w_2 ** 4 * w_3 ** 2 * w_4 / 17280 - w_2 ** 4 * w_3 ** 2 * w_5 / 17280 - w_2 ** 4 * w_3 * w_4 ** 2 / 17280 - w_2 ** 4 * w_3 * w_4 * w_5 / 5760 - w_2 ** 4 * w_3 * w_5 ** 2 / 17280 - w_2 ** 4 * w_4 ** 2 * w_5 / 17280 - w_2 ** 4 * w_4 * w_5 ** 2 / 17280 - w_2 ** 2 * w_3 ** 4 * w_4 / 17280 - w_2 ** 2 * w_3 ** 4 * w_5 / 17280 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 3456 - w_2 ** 2 * w_3 * w_4 ** 4 / 17280 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 3456 - w_2 ** 2 * w_3 * w_5 ** 4 / 17280 - w_2 ** 2 * w_4 ** 4 * w_5 / 17280 - w_2 ** 2 * w_4 * w_5 ** 4 / 17280 + w_2 * w_3 ** 6 / 60480 - w_2 * w_3 ** 4 * w_4 ** 2 / 17280 - w_2 * w_3 ** 4 * w_4 * w_5 / 5760 - w_2 * w_3 ** 4 * w_5 ** 2 / 17280 - w_2 * w_3 ** 2 * w_4 ** 4 / 17280 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 3456 - w_2 * w_3 ** 2 * w_5 ** 4 / 17280 - w_2 * w_3 * w_4 ** 4 * w_5 / 5760 - w_2 * w_3 * w_4 * w_5 ** 4 / 5760 + w_2 * w_4 ** 6 / 60480 - w_2 * w_4 ** 4 * w_5 ** 2 / 17280 - w_2 * w_4 ** 2 * w_5 ** 4 / 17280 + w_2 * w_5 ** 6 / 60480 + w_3 ** 6 * w_4 / 60480 + w_3 ** 6 * w_5 / 60480 - w_3 ** 4 * w_4 ** 2 * w_5 / 17280 - w_3 ** 4 * w_4 * w_5 ** 2 / 17280 - w_3 ** 2 * w_4 ** 4 * w_5 / 17280 - w_3 ** 2 * w_4 * w_5 ** 4 / 17280 + w_3 * w_4 ** 6 / 60480 - w_3 * w_4 ** 4 * w_5 ** 2 / 17280 - w_3 * w_4 ** 2 * w_5 ** 4 / 17280 + w_3 * w_5 ** 6 / 60480 + w_4 ** 6 * w_5 / 60480 + w_4 * w_5 ** 6 / 60480
-    if s == 8 and ln == 4:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        return -w_1 ** 8 / 1209600 + w_1 ** 6 * w_2 ** 2 / 362880 + w_1 ** 6 * w_2 * w_3 / 120960 + w_1 ** 6 * w_2 * w_4 / 120960 + w_1 ** 6 * w_3 ** 2 / 362880 + w_1 ** 6 * w_3 * w_4 / 120960 + w_1 ** 6 * w_4 ** 2 / 362880 + w_1 ** 4 * w_2 ** 4 / 518400 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 / 103680 - w_1 ** 4 * w_2 ** 2 * w_3 * w_4 / 34560 - w_1 ** 4 * w_2 ** 2 * w_4 ** 2 / 103680 - w_1 ** 4 * w_2 * w_3 ** 2 * w_4 / 34560 - w_1 ** 4 * w_2 * w_3 * w_4 ** 2 / 34560 + w_1 ** 4 * w_3 ** 4 / 518400 - w_1 ** 4 * w_3 ** 2 * w_4 ** 2 / 103680 + w_1 ** 4 * w_4 ** 4 / 518400 + w_1 ** 2 * w_2 ** 6 / 362880 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 / 103680 - w_1 ** 2 * w_2 ** 4 * w_3 * w_4 / 34560 - w_1 ** 2 * w_2 ** 4 * w_4 ** 2 / 103680 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 / 103680 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 20736 - w_1 ** 2 * w_2 ** 2 * w_4 ** 4 / 103680 - w_1 ** 2 * w_2 * w_3 ** 4 * w_4 / 34560 - w_1 ** 2 * w_2 * w_3 * w_4 ** 4 / 34560 + w_1 ** 2 * w_3 ** 6 / 362880 - w_1 ** 2 * w_3 ** 4 * w_4 ** 2 / 103680 - w_1 ** 2 * w_3 ** 2 * w_4 ** 4 / 103680 + w_1 ** 2 * w_4 ** 6 / 362880 + w_1 * w_2 ** 6 * w_3 / 120960 + w_1 * w_2 ** 6 * w_4 / 120960 - w_1 * w_2 ** 4 * w_3 ** 2 * w_4 / 34560 - w_1 * w_2 ** 4 * w_3 * w_4 ** 2 / 34560 - w_1 * w_2 ** 2 * w_3 ** 4 * w_4 / 34560 - w_1 * w_2 ** 2 * w_3 * w_4 ** 4 / 34560 + w_1 * w_2 * w_3 ** 6 / 120960 - w_1 * w_2 * w_3 ** 4 * w_4 ** 2 / 34560 - w_1 * w_2 * w_3 ** 2 * w_4 ** 4 / 34560 + w_1 * w_2 * w_4 ** 6 / 120960 + w_1 * w_3 ** 6 * w_4 / 120960 + w_1 * w_3 * w_4 ** 6 / 120960 - w_2 ** 8 / 1209600 + w_2 ** 6 * w_3 ** 2 / 362880 + w_2 ** 6 * w_3 * w_4 / 120960 + w_2 ** 6 * w_4 ** 2 / 362880 + w_2 ** 4 * w_3 ** 4 / 518400 - w_2 ** 4 * w_3 ** 2 * w_4 ** 2 / 103680 + w_2 ** 4 * w_4 ** 4 / 518400 + w_2 ** 2 * w_3 ** 6 / 362880 - w_2 ** 2 * w_3 ** 4 * w_4 ** 2 / 103680 - w_2 ** 2 * w_3 ** 2 * w_4 ** 4 / 103680 + w_2 ** 2 * w_4 ** 6 / 362880 + w_2 * w_3 ** 6 * w_4 / 120960 + w_2 * w_3 * w_4 ** 6 / 120960 - w_3 ** 8 / 1209600 + w_3 ** 6 * w_4 ** 2 / 362880 + w_3 ** 4 * w_4 ** 4 / 518400 + w_3 ** 2 * w_4 ** 6 / 362880 - w_4 ** 8 / 1209600
-    if s == 9 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return -w_1 ** 8 * w_2 / 2419200 - w_1 ** 8 * w_3 / 2419200 + w_1 ** 6 * w_2 ** 2 * w_3 / 725760 + w_1 ** 6 * w_2 * w_3 ** 2 / 725760 + w_1 ** 4 * w_2 ** 4 * w_3 / 1036800 + w_1 ** 4 * w_2 * w_3 ** 4 / 1036800 + w_1 ** 2 * w_2 ** 6 * w_3 / 725760 + w_1 ** 2 * w_2 * w_3 ** 6 / 725760 - w_1 * w_2 ** 8 / 2419200 + w_1 * w_2 ** 6 * w_3 ** 2 / 725760 + w_1 * w_2 ** 4 * w_3 ** 4 / 1036800 + w_1 * w_2 ** 2 * w_3 ** 6 / 725760 - w_1 * w_3 ** 8 / 2419200 - w_2 ** 8 * w_3 / 2419200 - w_2 * w_3 ** 8 / 2419200
-    if s == 10 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return w_1 ** 10 / 47900160 - w_1 ** 8 * w_2 ** 2 / 14515200 - w_1 ** 6 * w_2 ** 4 / 21772800 - w_1 ** 4 * w_2 ** 6 / 21772800 - w_1 ** 2 * w_2 ** 8 / 14515200 + w_2 ** 10 / 47900160
-    if s == 11 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return 0
-    if s == 0 and ln == 13:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        w_12 = sym.Symbol("w_12")
-        w_13 = sym.Symbol("w_13")
-        return 1
-    if s == 1 and ln == 12:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        w_12 = sym.Symbol("w_12")
-        return w_1 / 2 + w_10 / 2 + w_11 / 2 + w_12 / 2 + w_2 / 2 + w_3 / 2 + w_4 / 2 + w_5 / 2 + w_6 / 2 + w_7 / 2 + w_8 / 2 + w_9 / 2
-    if s == 2 and ln == 11:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        return w_1 ** 2 / 12 + w_1 * w_10 / 4 + w_1 * w_11 / 4 + w_1 * w_2 / 4 + w_1 * w_3 / 4 + w_1 * w_4 / 4 + w_1 * w_5 / 4 + w_1 * w_6 / 4 + w_1 * w_7 / 4 + w_1 * w_8 / 4 + w_1 * w_9 / 4 + w_10 ** 2 / 12 + w_10 * w_11 / 4 + w_10 * w_2 / 4 + w_10 * w_3 / 4 + w_10 * w_4 / 4 + w_10 * w_5 / 4 + w_10 * w_6 / 4 + w_10 * w_7 / 4 + w_10 * w_8 / 4 + w_10 * w_9 / 4 + w_11 ** 2 / 12 + w_11 * w_2 / 4 + w_11 * w_3 / 4 + w_11 * w_4 / 4 + w_11 * w_5 / 4 + w_11 * w_6 / 4 + w_11 * w_7 / 4 + w_11 * w_8 / 4 + w_11 * w_9 / 4 + w_2 ** 2 / 12 + w_2 * w_3 / 4 + w_2 * w_4 / 4 + w_2 * w_5 / 4 + w_2 * w_6 / 4 + w_2 * w_7 / 4 + w_2 * w_8 / 4 + w_2 * w_9 / 4 + w_3 ** 2 / 12 + w_3 * w_4 / 4 + w_3 * w_5 / 4 + w_3 * w_6 / 4 + w_3 * w_7 / 4 + w_3 * w_8 / 4 + w_3 * w_9 / 4 + w_4 ** 2 / 12 + w_4 * w_5 / 4 + w_4 * w_6 / 4 + w_4 * w_7 / 4 + w_4 * w_8 / 4 + w_4 * w_9 / 4 + w_5 ** 2 / 12 + w_5 * w_6 / 4 + w_5 * w_7 / 4 + w_5 * w_8 / 4 + w_5 * w_9 / 4 + w_6 ** 2 / 12 + w_6 * w_7 / 4 + w_6 * w_8 / 4 + w_6 * w_9 / 4 + w_7 ** 2 / 12 + w_7 * w_8 / 4 + w_7 * w_9 / 4 + w_8 ** 2 / 12 + w_8 * w_9 / 4 + w_9 ** 2 / 12
-    if s == 3 and ln == 10:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        return w_1 ** 2 * w_10 / 24 + w_1 ** 2 * w_2 / 24 + w_1 ** 2 * w_3 / 24 + w_1 ** 2 * w_4 / 24 + w_1 ** 2 * w_5 / 24 + w_1 ** 2 * w_6 / 24 + w_1 ** 2 * w_7 / 24 + w_1 ** 2 * w_8 / 24 + w_1 ** 2 * w_9 / 24 + w_1 * w_10 ** 2 / 24 + w_1 * w_10 * w_2 / 8 + w_1 * w_10 * w_3 / 8 + w_1 * w_10 * w_4 / 8 + w_1 * w_10 * w_5 / 8 + w_1 * w_10 * w_6 / 8 + w_1 * w_10 * w_7 / 8 + w_1 * w_10 * w_8 / 8 + w_1 * w_10 * w_9 / 8 + w_1 * w_2 ** 2 / 24 + w_1 * w_2 * w_3 / 8 + w_1 * w_2 * w_4 / 8 + w_1 * w_2 * w_5 / 8 + w_1 * w_2 * w_6 / 8 + w_1 * w_2 * w_7 / 8 + w_1 * w_2 * w_8 / 8 + w_1 * w_2 * w_9 / 8 + w_1 * w_3 ** 2 / 24 + w_1 * w_3 * w_4 / 8 + w_1 * w_3 * w_5 / 8 + w_1 * w_3 * w_6 / 8 + w_1 * w_3 * w_7 / 8 + w_1 * w_3 * w_8 / 8 + w_1 * w_3 * w_9 / 8 + w_1 * w_4 ** 2 / 24 + w_1 * w_4 * w_5 / 8 + w_1 * w_4 * w_6 / 8 + w_1 * w_4 * w_7 / 8 + w_1 * w_4 * w_8 / 8 + w_1 * w_4 * w_9 / 8 + w_1 * w_5 ** 2 / 24 + w_1 * w_5 * w_6 / 8 + w_1 * w_5 * w_7 / 8 + w_1 * w_5 * w_8 / 8 + w_1 * w_5 * w_9 / 8 + w_1 * w_6 ** 2 / 24 + w_1 * w_6 * w_7 / 8 + w_1 * w_6 * w_8 / 8 + w_1 * w_6 * w_9 / 8 + w_1 * w_7 ** 2 / 24 + w_1 * w_7 * w_8 / 8 + w_1 * w_7 * w_9 / 8 + w_1 * w_8 ** 2 / 24 + w_1 * w_8 * w_9 / 8 + w_1 * w_9 ** 2 / 24 + w_10 ** 2 * w_2 / 24 + w_10 ** 2 * w_3 / 24 + w_10 ** 2 * w_4 / 24 + w_10 ** 2 * w_5 / 24 + w_10 ** 2 * w_6 / 24 + w_10 ** 2 * w_7 / 24 + w_10 ** 2 * w_8 / 24 + w_10 ** 2 * w_9 / 24 + w_10 * w_2 ** 2 / 24 + w_10 * w_2 * w_3 / 8 + w_10 * w_2 * w_4 / 8 + w_10 * w_2 * w_5 / 8 + w_10 * w_2 * w_6 / 8 + w_10 * w_2 * w_7 / 8 + w_10 * w_2 * w_8 / 8 + w_10 * w_2 * w_9 / 8 + w_10 * w_3 ** 2 / 24 + w_10 * w_3 * w_4 / 8 + w_10 * w_3 * w_5 / 8 + w_10 * w_3 * w_6 / 8 + w_10 * w_3 * w_7 / 8 + w_10 * w_3 * w_8 / 8 + w_10 * w_3 * w_9 / 8 + w_10 * w_4 ** 2 / 24 + w_10 * w_4 * w_5 / 8 + w_10 * w_4 * w_6 / 8 + w_10 * w_4 * w_7 / 8 + w_10 * w_4 * w_8 / 8 + w_10 * w_4 * w_9 / 8 + w_10 * w_5 ** 2 / 24 + w_10 * w_5 * w_6 / 8 + w_10 * w_5 * w_7 / 8 + w_10 * w_5 * w_8 / 8 + w_10 * w_5 * w_9 / 8 + w_10 * w_6 ** 2 / 24 + w_10 * w_6 * w_7 / 8 + w_10 * w_6 * w_8 / 8 + w_10 * w_6 * w_9 / 8 + w_10 * w_7 ** 2 / 24 + w_10 * w_7 * w_8 / 8 + w_10 * w_7 * w_9 / 8 + w_10 * w_8 ** 2 / 24 + w_10 * w_8 * w_9 / 8 + w_10 * w_9 ** 2 / 24 + w_2 ** 2 * w_3 / 24 + w_2 ** 2 * w_4 / 24 + w_2 ** 2 * w_5 / 24 + w_2 ** 2 * w_6 / 24 + w_2 ** 2 * w_7 / 24 + w_2 ** 2 * w_8 / 24 + w_2 ** 2 * w_9 / 24 + w_2 * w_3 ** 2 / 24 + w_2 * w_3 * w_4 / 8 + w_2 * w_3 * w_5 / 8 + w_2 * w_3 * w_6 / 8 + w_2 * w_3 * w_7 / 8 + w_2 * w_3 * w_8 / 8 + w_2 * w_3 * w_9 / 8 + w_2 * w_4 ** 2 / 24 + w_2 * w_4 * w_5 / 8 + w_2 * w_4 * w_6 / 8 + w_2 * w_4 * w_7 / 8 + w_2 * w_4 * w_8 / 8 + w_2 * w_4 * w_9 / 8 + w_2 * w_5 ** 2 / 24 + w_2 * w_5 * w_6 / 8 + w_2 * w_5 * w_7 / 8 + w_2 * w_5 * w_8 / 8 + w_2 * w_5 * w_9 / 8 + w_2 * w_6 ** 2 / 24 + w_2 * w_6 * w_7 / 8 + w_2 * w_6 * w_8 / 8 + w_2 * w_6 * w_9 / 8 + w_2 * w_7 ** 2 / 24 + w_2 * w_7 * w_8 / 8 + w_2 * w_7 * w_9 / 8 + w_2 * w_8 ** 2 / 24 + w_2 * w_8 * w_9 / 8 + w_2 * w_9 ** 2 / 24 + w_3 ** 2 * w_4 / 24 + w_3 ** 2 * w_5 / 24 + w_3 ** 2 * w_6 / 24 + w_3 ** 2 * w_7 / 24 + w_3 ** 2 * w_8 / 24 + w_3 ** 2 * w_9 / 24 + w_3 * w_4 ** 2 / 24 + w_3 * w_4 * w_5 / 8 + w_3 * w_4 * w_6 / 8 + w_3 * w_4 * w_7 / 8 + w_3 * w_4 * w_8 / 8 + w_3 * w_4 * w_9 / 8 + w_3 * w_5 ** 2 / 24 + w_3 * w_5 * w_6 / 8 + w_3 * w_5 * w_7 / 8 + w_3 * w_5 * w_8 / 8 + w_3 * w_5 * w_9 / 8 + w_3 * w_6 ** 2 / 24 + w_3 * w_6 * w_7 / 8 + w_3 * w_6 * w_8 / 8 + w_3 * w_6 * w_9 / 8 + w_3 * w_7 ** 2 / 24 + w_3 * w_7 * w_8 / 8 + w_3 * w_7 * w_9 / 8 + w_3 * w_8 ** 2 / 24 + w_3 * w_8 * w_9 / 8 + w_3 * w_9 ** 2 / 24 + w_4 ** 2 * w_5 / 24 + w_4 ** 2 * w_6 / 24 + w_4 ** 2 * w_7 / 24 + w_4 ** 2 * w_8 / 24 + w_4 ** 2 * w_9 / 24 + w_4 * w_5 ** 2 / 24 + w_4 * w_5 * w_6 / 8 + w_4 * w_5 * w_7 / 8 + w_4 * w_5 * w_8 / 8 + w_4 * w_5 * w_9 / 8 + w_4 * w_6 ** 2 / 24 + w_4 * w_6 * w_7 / 8 + w_4 * w_6 * w_8 / 8 + w_4 * w_6 * w_9 / 8 + w_4 * w_7 ** 2 / 24 + w_4 * w_7 * w_8 / 8 + w_4 * w_7 * w_9 / 8 + w_4 * w_8 ** 2 / 24 + w_4 * w_8 * w_9 / 8 + w_4 * w_9 ** 2 / 24 + w_5 ** 2 * w_6 / 24 + w_5 ** 2 * w_7 / 24 + w_5 ** 2 * w_8 / 24 + w_5 ** 2 * w_9 / 24 + w_5 * w_6 ** 2 / 24 + w_5 * w_6 * w_7 / 8 + w_5 * w_6 * w_8 / 8 + w_5 * w_6 * w_9 / 8 + w_5 * w_7 ** 2 / 24 + w_5 * w_7 * w_8 / 8 + w_5 * w_7 * w_9 / 8 + w_5 * w_8 ** 2 / 24 + w_5 * w_8 * w_9 / 8 + w_5 * w_9 ** 2 / 24 + w_6 ** 2 * w_7 / 24 + w_6 ** 2 * w_8 / 24 + w_6 ** 2 * w_9 / 24 + w_6 * w_7 ** 2 / 24 + w_6 * w_7 * w_8 / 8 + w_6 * w_7 * w_9 / 8 + w_6 * w_8 ** 2 / 24 + w_6 * w_8 * w_9 / 8 + w_6 * w_9 ** 2 / 24 + w_7 ** 2 * w_8 / 24 + w_7 ** 2 * w_9 / 24 + w_7 * w_8 ** 2 / 24 + w_7 * w_8 * w_9 / 8 + w_7 * w_9 ** 2 / 24 + w_8 ** 2 * w_9 / 24 + w_8 * w_9 ** 2 / 24
-    if s == 4 and ln == 9:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        return -w_1 ** 4 / 720 + w_1 ** 2 * w_2 ** 2 / 144 + w_1 ** 2 * w_2 * w_3 / 48 + w_1 ** 2 * w_2 * w_4 / 48 + w_1 ** 2 * w_2 * w_5 / 48 + w_1 ** 2 * w_2 * w_6 / 48 + w_1 ** 2 * w_2 * w_7 / 48 + w_1 ** 2 * w_2 * w_8 / 48 + w_1 ** 2 * w_2 * w_9 / 48 + w_1 ** 2 * w_3 ** 2 / 144 + w_1 ** 2 * w_3 * w_4 / 48 + w_1 ** 2 * w_3 * w_5 / 48 + w_1 ** 2 * w_3 * w_6 / 48 + w_1 ** 2 * w_3 * w_7 / 48 + w_1 ** 2 * w_3 * w_8 / 48 + w_1 ** 2 * w_3 * w_9 / 48 + w_1 ** 2 * w_4 ** 2 / 144 + w_1 ** 2 * w_4 * w_5 / 48 + w_1 ** 2 * w_4 * w_6 / 48 + w_1 ** 2 * w_4 * w_7 / 48 + w_1 ** 2 * w_4 * w_8 / 48 + w_1 ** 2 * w_4 * w_9 / 48 + w_1 ** 2 * w_5 ** 2 / 144 + w_1 ** 2 * w_5 * w_6 / 48 + w_1 ** 2 * w_5 * w_7 / 48 + w_1 ** 2 * w_5 * w_8 / 48 + w_1 ** 2 * w_5 * w_9 / 48 + w_1 ** 2 * w_6 ** 2 / 144 + w_1 ** 2 * w_6 * w_7 / 48 + w_1 ** 2 * w_6 * w_8 / 48 + w_1 ** 2 * w_6 * w_9 / 48 + w_1 ** 2 * w_7 ** 2 / 144 + w_1 ** 2 * w_7 * w_8 / 48 + w_1 ** 2 * w_7 * w_9 / 48 + w_1 ** 2 * w_8 ** 2 / 144 + w_1 ** 2 * w_8 * w_9 / 48 + w_1 ** 2 * w_9 ** 2 / 144 + w_1 * w_2 ** 2 * w_3 / 48 + w_1 * w_2 ** 2 * w_4 / 48 + w_1 * w_2 ** 2 * w_5 / 48 + w_1 * w_2 ** 2 * w_6 / 48 + w_1 * w_2 ** 2 * w_7 / 48 + w_1 * w_2 ** 2 * w_8 / 48 + w_1 * w_2 ** 2 * w_9 / 48 + w_1 * w_2 * w_3 ** 2 / 48 + w_1 * w_2 * w_3 * w_4 / 16 + w_1 * w_2 * w_3 * w_5 / 16 + w_1 * w_2 * w_3 * w_6 / 16 + w_1 * w_2 * w_3 * w_7 / 16 + w_1 * w_2 * w_3 * w_8 / 16 + w_1 * w_2 * w_3 * w_9 / 16 + w_1 * w_2 * w_4 ** 2 / 48 + w_1 * w_2 * w_4 * w_5 / 16 + w_1 * w_2 * w_4 * w_6 / 16 + w_1 * w_2 * w_4 * w_7 / 16 + w_1 * w_2 * w_4 * w_8 / 16 + w_1 * w_2 * w_4 * w_9 / 16 + w_1 * w_2 * w_5 ** 2 / 48 + w_1 * w_2 * w_5 * w_6 / 16 + w_1 * w_2 * w_5 * w_7 / 16 + w_1 * w_2 * w_5 * w_8 / 16 + w_1 * w_2 * w_5 * w_9 / 16 + w_1 * w_2 * w_6 ** 2 / 48 + w_1 * w_2 * w_6 * w_7 / 16 + w_1 * w_2 * w_6 * w_8 / 16 + w_1 * w_2 * w_6 * w_9 / 16 + w_1 * w_2 * w_7 ** 2 / 48 + w_1 * w_2 * w_7 * w_8 / 16 + w_1 * w_2 * w_7 * w_9 / 16 + w_1 * w_2 * w_8 ** 2 / 48 + w_1 * w_2 * w_8 * w_9 / 16 + w_1 * w_2 * w_9 ** 2 / 48 + w_1 * w_3 ** 2 * w_4 / 48 + w_1 * w_3 ** 2 * w_5 / 48 + w_1 * w_3 ** 2 * w_6 / 48 + w_1 * w_3 ** 2 * w_7 / 48 + w_1 * w_3 ** 2 * w_8 / 48 + w_1 * w_3 ** 2 * w_9 / 48 + w_1 * w_3 * w_4 ** 2 / 48 + w_1 * w_3 * w_4 * w_5 / 16 + w_1 * w_3 * w_4 * w_6 / 16 + w_1 * w_3 * w_4 * w_7 / 16 + w_1 * w_3 * w_4 * w_8 / 16 + w_1 * w_3 * w_4 * w_9 / 16 + w_1 * w_3 * w_5 ** 2 / 48 + w_1 * w_3 * w_5 * w_6 / 16 + w_1 * w_3 * w_5 * w_7 / 16 + w_1 * w_3 * w_5 * w_8 / 16 + w_1 * w_3 * w_5 * w_9 / 16 + w_1 * w_3 * w_6 ** 2 / 48 + w_1 * w_3 * w_6 * w_7 / 16 + w_1 * w_3 * w_6 * w_8 / 16 + w_1 * w_3 * w_6 * w_9 / 16 + w_1 * w_3 * w_7 ** 2 / 48 + w_1 * w_3 * w_7 * w_8 / 16 + w_1 * w_3 * w_7 * w_9 / 16 + w_1 * w_3 * w_8 ** 2 / 48 + w_1 * w_3 * w_8 * w_9 / 16 + w_1 * w_3 * w_9 ** 2 / 48 + w_1 * w_4 ** 2 * w_5 / 48 + w_1 * w_4 ** 2 * w_6 / 48 + w_1 * w_4 ** 2 * w_7 / 48 + w_1 * w_4 ** 2 * w_8 / 48 + w_1 * w_4 ** 2 * w_9 / 48 + w_1 * w_4 * w_5 ** 2 / 48 + w_1 * w_4 * w_5 * w_6 / 16 + w_1 * w_4 * w_5 * w_7 / 16 + w_1 * w_4 * w_5 * w_8 / 16 + w_1 * w_4 * w_5 * w_9 / 16 + w_1 * w_4 * w_6 ** 2 / 48 + w_1 * w_4 * w_6 * w_7 / 16 + w_1 * w_4 * w_6 * w_8 / 16 + w_1 * w_4 * w_6 * w_9 / 16 + w_1 * w_4 * w_7 ** 2 / 48 + w_1 * w_4 * w_7 * w_8 / 16 + w_1 * w_4 * w_7 * w_9 / 16 + w_1 * w_4 * w_8 ** 2 / 48 + w_1 * w_4 * w_8 * w_9 / 16 + w_1 * w_4 * w_9 ** 2 / 48 + w_1 * w_5 ** 2 * w_6 / 48 + w_1 * w_5 ** 2 * w_7 / 48 + w_1 * w_5 ** 2 * w_8 / 48 + w_1 * w_5 ** 2 * w_9 / 48 + w_1 * w_5 * w_6 ** 2 / 48 + w_1 * w_5 * w_6 * w_7 / 16 + w_1 * w_5 * w_6 * w_8 / 16 + w_1 * w_5 * w_6 * w_9 / 16 + w_1 * w_5 * w_7 ** 2 / 48 + w_1 * w_5 * w_7 * w_8 / 16 + w_1 * w_5 * w_7 * w_9 / 16 + w_1 * w_5 * w_8 ** 2 / 48 + w_1 * w_5 * w_8 * w_9 / 16 + w_1 * w_5 * w_9 ** 2 / 48 + w_1 * w_6 ** 2 * w_7 / 48 + w_1 * w_6 ** 2 * w_8 / 48 + w_1 * w_6 ** 2 * w_9 / 48 + w_1 * w_6 * w_7 ** 2 / 48 + w_1 * w_6 * w_7 * w_8 / 16 + w_1 * w_6 * w_7 * w_9 / 16 + w_1 * w_6 * w_8 ** 2 / 48 + w_1 * w_6 * w_8 * w_9 / 16 + w_1 * w_6 * w_9 ** 2 / 48 + w_1 * w_7 ** 2 * w_8 / 48 + w_1 * w_7 ** 2 * w_9 / 48 + w_1 * w_7 * w_8 ** 2 / 48 + w_1 * w_7 * w_8 * w_9 / 16 + w_1 * w_7 * w_9 ** 2 / 48 + w_1 * w_8 ** 2 * w_9 / 48 + w_1 * w_8 * w_9 ** 2 / 48 - w_2 ** 4 / 720 + w_2 ** 2 * w_3 ** 2 / 144 + w_2 ** 2 * w_3 * w_4 / 48 + w_2 ** 2 * w_3 * w_5 / 48 + w_2 ** 2 * w_3 * w_6 / 48 + w_2 ** 2 * w_3 * w_7 / 48 + w_2 ** 2 * w_3 * w_8 / 48 + w_2 ** 2 * w_3 * w_9 / 48 + w_2 ** 2 * w_4 ** 2 / 144 + w_2 ** 2 * w_4 * w_5 / 48 + w_2 ** 2 * w_4 * w_6 / 48 + w_2 ** 2 * w_4 * w_7 / 48 + w_2 ** 2 * w_4 * w_8 / 48 + w_2 ** 2 * w_4 * w_9 / 48 + w_2 ** 2 * w_5 ** 2 / 144 + w_2 ** 2 * w_5 * w_6 / 48 + w_2 ** 2 * w_5 * w_7 / 48 + w_2 ** 2 * w_5 * w_8 / 48 + w_2 ** 2 * w_5 * w_9 / 48 + w_2 ** 2 * w_6 ** 2 / 144 + w_2 ** 2 * w_6 * w_7 / 48 + w_2 ** 2 * w_6 * w_8 / 48 + w_2 ** 2 * w_6 * w_9 / 48 + w_2 ** 2 * w_7 ** 2 / 144 + w_2 ** 2 * w_7 * w_8 / 48 + w_2 ** 2 * w_7 * w_9 / 48 + w_2 ** 2 * w_8 ** 2 / 144 + w_2 ** 2 * w_8 * w_9 / 48 + w_2 ** 2 * w_9 ** 2 / 144 + w_2 * w_3 ** 2 * w_4 / 48 + w_2 * w_3 ** 2 * w_5 / 48 + w_2 * w_3 ** 2 * w_6 / 48 + w_2 * w_3 ** 2 * w_7 / 48 + w_2 * w_3 ** 2 * w_8 / 48 + w_2 * w_3 ** 2 * w_9 / 48 + w_2 * w_3 * w_4 ** 2 / 48 + w_2 * w_3 * w_4 * w_5 / 16 + w_2 * w_3 * w_4 * w_6 / 16 + w_2 * w_3 * w_4 * w_7 / 16 + w_2 * w_3 * w_4 * w_8 / 16 + w_2 * w_3 * w_4 * w_9 / 16 + w_2 * w_3 * w_5 ** 2 / 48 + w_2 * w_3 * w_5 * w_6 / 16 + w_2 * w_3 * w_5 * w_7 / 16 + w_2 * w_3 * w_5 * w_8 / 16 + w_2 * w_3 * w_5 * w_9 / 16 + w_2 * w_3 * w_6 ** 2 / 48 + w_2 * w_3 * w_6 * w_7 / 16 + w_2 * w_3 * w_6 * w_8 / 16 + w_2 * w_3 * w_6 * w_9 / 16 + w_2 * w_3 * w_7 ** 2 / 48 + w_2 * w_3 * w_7 * w_8 / 16 + w_2 * w_3 * w_7 * w_9 / 16 + w_2 * w_3 * w_8 ** 2 / 48 + w_2 * w_3 * w_8 * w_9 / 16 + w_2 * w_3 * w_9 ** 2 / 48 + w_2 * w_4 ** 2 * w_5 / 48 + w_2 * w_4 ** 2 * w_6 / 48 + w_2 * w_4 ** 2 * w_7 / 48 + w_2 * w_4 ** 2 * w_8 / 48 + w_2 * w_4 ** 2 * w_9 / 48 + w_2 * w_4 * w_5 ** 2 / 48 + w_2 * w_4 * w_5 * w_6 / 16 + w_2 * w_4 * w_5 * w_7 / 16 + w_2 * w_4 * w_5 * w_8 / 16 + w_2 * w_4 * w_5 * w_9 / 16 + w_2 * w_4 * w_6 ** 2 / 48 + w_2 * w_4 * w_6 * w_7 / 16 + w_2 * w_4 * w_6 * w_8 / 16 + w_2 * w_4 * w_6 * w_9 / 16 + w_2 * w_4 * w_7 ** 2 / 48 + w_2 * w_4 * w_7 * w_8 / 16 + w_2 * w_4 * w_7 * w_9 / 16 + w_2 * w_4 * w_8 ** 2 / 48 + w_2 * w_4 * w_8 * w_9 / 16 + w_2 * w_4 * w_9 ** 2 / 48 + w_2 * w_5 ** 2 * w_6 / 48 + w_2 * w_5 ** 2 * w_7 / 48 + w_2 * w_5 ** 2 * w_8 / 48 + w_2 * w_5 ** 2 * w_9 / 48 + w_2 * w_5 * w_6 ** 2 / 48 + w_2 * w_5 * w_6 * w_7 / 16 + w_2 * w_5 * w_6 * w_8 / 16 + w_2 * w_5 * w_6 * w_9 / 16 + w_2 * w_5 * w_7 ** 2 / 48 + w_2 * w_5 * w_7 * w_8 / 16 + w_2 * w_5 * w_7 * w_9 / 16 + w_2 * w_5 * w_8 ** 2 / 48 + w_2 * w_5 * w_8 * w_9 / 16 + w_2 * w_5 * w_9 ** 2 / 48 + w_2 * w_6 ** 2 * w_7 / 48 + w_2 * w_6 ** 2 * w_8 / 48 + w_2 * w_6 ** 2 * w_9 / 48 + w_2 * w_6 * w_7 ** 2 / 48 + w_2 * w_6 * w_7 * w_8 / 16 + w_2 * w_6 * w_7 * w_9 / 16 + w_2 * w_6 * w_8 ** 2 / 48 + w_2 * w_6 * w_8 * w_9 / 16 + w_2 * w_6 * w_9 ** 2 / 48 + w_2 * w_7 ** 2 * w_8 / 48 + w_2 * w_7 ** 2 * w_9 / 48 + w_2 * w_7 * w_8 ** 2 / 48 + w_2 * w_7 * w_8 * w_9 / 16 + w_2 * w_7 * w_9 ** 2 / 48 + w_2 * w_8 ** 2 * w_9 / 48 + w_2 * w_8 * w_9 ** 2 / 48 - w_3 ** 4 / 720 + w_3 ** 2 * w_4 ** 2 / 144 + w_3 ** 2 * w_4 * w_5 / 48 + w_3 ** 2 * w_4 * w_6 / 48 + w_3 ** 2 * w_4 * w_7 / 48 + w_3 ** 2 * w_4 * w_8 / 48 + w_3 ** 2 * w_4 * w_9 / 48 + w_3 ** 2 * w_5 ** 2 / 144 + w_3 ** 2 * w_5 * w_6 / 48 + w_3 ** 2 * w_5 * w_7 / 48 + w_3 ** 2 * w_5 * w_8 / 48 + w_3 ** 2 * w_5 * w_9 / 48 + w_3 ** 2 * w_6 ** 2 / 144 + w_3 ** 2 * w_6 * w_7 / 48 + w_3 ** 2 * w_6 * w_8 / 48 + w_3 ** 2 * w_6 * w_9 / 48 + w_3 ** 2 * w_7 ** 2 / 144 + w_3 ** 2 * w_7 * w_8 / 48 + w_3 ** 2 * w_7 * w_9 / 48 + w_3 ** 2 * w_8 ** 2 / 144 + w_3 ** 2 * w_8 * w_9 / 48 + w_3 ** 2 * w_9 ** 2 / 144 + w_3 * w_4 ** 2 * w_5 / 48 + w_3 * w_4 ** 2 * w_6 / 48 + w_3 * w_4 ** 2 * w_7 / 48 + w_3 * w_4 ** 2 * w_8 / 48 + w_3 * w_4 ** 2 * w_9 / 48 + w_3 * w_4 * w_5 ** 2 / 48 + w_3 * w_4 * w_5 * w_6 / 16 + w_3 * w_4 * w_5 * w_7 / 16 + w_3 * w_4 * w_5 * w_8 / 16 + w_3 * w_4 * w_5 * w_9 / 16 + w_3 * w_4 * w_6 ** 2 / 48 + w_3 * w_4 * w_6 * w_7 / 16 + w_3 * w_4 * w_6 * w_8 / 16 + w_3 * w_4 * w_6 * w_9 / 16 + w_3 * w_4 * w_7 ** 2 / 48 + w_3 * w_4 * w_7 * w_8 / 16 + w_3 * w_4 * w_7 * w_9 / 16 + w_3 * w_4 * w_8 ** 2 / 48 + w_3 * w_4 * w_8 * w_9 / 16 + w_3 * w_4 * w_9 ** 2 / 48 + w_3 * w_5 ** 2 * w_6 / 48 + w_3 * w_5 ** 2 * w_7 / 48 + w_3 * w_5 ** 2 * w_8 / 48 + w_3 * w_5 ** 2 * w_9 / 48 + w_3 * w_5 * w_6 ** 2 / 48 + w_3 * w_5 * w_6 * w_7 / 16 + w_3 * w_5 * w_6 * w_8 / 16 + w_3 * w_5 * w_6 * w_9 / 16 + w_3 * w_5 * w_7 ** 2 / 48 + w_3 * w_5 * w_7 * w_8 / 16 + w_3 * w_5 * w_7 * w_9 / 16 + w_3 * w_5 * w_8 ** 2 / 48 + w_3 * w_5 * w_8 * w_9 / 16 + w_3 * w_5 * w_9 ** 2 / 48 + w_3 * w_6 ** 2 * w_7 / 48 + w_3 * w_6 ** 2 * w_8 / 48 + w_3 * w_6 ** 2 * w_9 / 48 + w_3 * w_6 * w_7 ** 2 / 48 + w_3 * w_6 * w_7 * w_8 / 16 + w_3 * w_6 * w_7 * w_9 / 16 + w_3 * w_6 * w_8 ** 2 / 48 + w_3 * w_6 * w_8 * w_9 / 16 + w_3 * w_6 * w_9 ** 2 / 48 + w_3 * w_7 ** 2 * w_8 / 48 + w_3 * w_7 ** 2 * w_9 / 48 + w_3 * w_7 * w_8 ** 2 / 48 + w_3 * w_7 * w_8 * w_9 / 16 + w_3 * w_7 * w_9 ** 2 / 48 + w_3 * w_8 ** 2 * w_9 / 48 + w_3 * w_8 * w_9 ** 2 / 48 - w_4 ** 4 / 720 + w_4 ** 2 * w_5 ** 2 / 144 + w_4 ** 2 * w_5 * w_6 / 48 + w_4 ** 2 * w_5 * w_7 / 48 + w_4 ** 2 * w_5 * w_8 / 48 + w_4 ** 2 * w_5 * w_9 / 48 + w_4 ** 2 * w_6 ** 2 / 144 + w_4 ** 2 * w_6 * w_7 / 48 + w_4 ** 2 * w_6 * w_8 / 48 + w_4 ** 2 * w_6 * w_9 / 48 + w_4 ** 2 * w_7 ** 2 / 144 + w_4 ** 2 * w_7 * w_8 / 48 + w_4 ** 2 * w_7 * w_9 / 48 + w_4 ** 2 * w_8 ** 2 / 144 + w_4 ** 2 * w_8 * w_9 / 48 + w_4 ** 2 * w_9 ** 2 / 144 + w_4 * w_5 ** 2 * w_6 / 48 + w_4 * w_5 ** 2 * w_7 / 48 + w_4 * w_5 ** 2 * w_8 / 48 + w_4 * w_5 ** 2 * w_9 / 48 + w_4 * w_5 * w_6 ** 2 / 48 + w_4 * w_5 * w_6 * w_7 / 16 + w_4 * w_5 * w_6 * w_8 / 16 + w_4 * w_5 * w_6 * w_9 / 16 + w_4 * w_5 * w_7 ** 2 / 48 + w_4 * w_5 * w_7 * w_8 / 16 + w_4 * w_5 * w_7 * w_9 / 16 + w_4 * w_5 * w_8 ** 2 / 48 + w_4 * w_5 * w_8 * w_9 / 16 + w_4 * w_5 * w_9 ** 2 / 48 + w_4 * w_6 ** 2 * w_7 / 48 + w_4 * w_6 ** 2 * w_8 / 48 + w_4 * w_6 ** 2 * w_9 / 48 + w_4 * w_6 * w_7 ** 2 / 48 + w_4 * w_6 * w_7 * w_8 / 16 + w_4 * w_6 * w_7 * w_9 / 16 + w_4 * w_6 * w_8 ** 2 / 48 + w_4 * w_6 * w_8 * w_9 / 16 + w_4 * w_6 * w_9 ** 2 / 48 + w_4 * w_7 ** 2 * w_8 / 48 + w_4 * w_7 ** 2 * w_9 / 48 + w_4 * w_7 * w_8 ** 2 / 48 + w_4 * w_7 * w_8 * w_9 / 16 + w_4 * w_7 * w_9 ** 2 / 48 + w_4 * w_8 ** 2 * w_9 / 48 + w_4 * w_8 * w_9 ** 2 / 48 - w_5 ** 4 / 720 + w_5 ** 2 * w_6 ** 2 / 144 + w_5 ** 2 * w_6 * w_7 / 48 + w_5 ** 2 * w_6 * w_8 / 48 + w_5 ** 2 * w_6 * w_9 / 48 + w_5 ** 2 * w_7 ** 2 / 144 + w_5 ** 2 * w_7 * w_8 / 48 + w_5 ** 2 * w_7 * w_9 / 48 + w_5 ** 2 * w_8 ** 2 / 144 + w_5 ** 2 * w_8 * w_9 / 48 + w_5 ** 2 * w_9 ** 2 / 144 + w_5 * w_6 ** 2 * w_7 / 48 + w_5 * w_6 ** 2 * w_8 / 48 + w_5 * w_6 ** 2 * w_9 / 48 + w_5 * w_6 * w_7 ** 2 / 48 + w_5 * w_6 * w_7 * w_8 / 16 + w_5 * w_6 * w_7 * w_9 / 16 + w_5 * w_6 * w_8 ** 2 / 48 + w_5 * w_6 * w_8 * w_9 / 16 + w_5 * w_6 * w_9 ** 2 / 48 + w_5 * w_7 ** 2 * w_8 / 48 + w_5 * w_7 ** 2 * w_9 / 48 + w_5 * w_7 * w_8 ** 2 / 48 + w_5 * w_7 * w_8 * w_9 / 16 + w_5 * w_7 * w_9 ** 2 / 48 + w_5 * w_8 ** 2 * w_9 / 48 + w_5 * w_8 * w_9 ** 2 / 48 - w_6 ** 4 / 720 + w_6 ** 2 * w_7 ** 2 / 144 + w_6 ** 2 * w_7 * w_8 / 48 + w_6 ** 2 * w_7 * w_9 / 48 + w_6 ** 2 * w_8 ** 2 / 144 + w_6 ** 2 * w_8 * w_9 / 48 + w_6 ** 2 * w_9 ** 2 / 144 + w_6 * w_7 ** 2 * w_8 / 48 + w_6 * w_7 ** 2 * w_9 / 48 + w_6 * w_7 * w_8 ** 2 / 48 + w_6 * w_7 * w_8 * w_9 / 16 + w_6 * w_7 * w_9 ** 2 / 48 + w_6 * w_8 ** 2 * w_9 / 48 + w_6 * w_8 * w_9 ** 2 / 48 - w_7 ** 4 / 720 + w_7 ** 2 * w_8 ** 2 / 144 + w_7 ** 2 * w_8 * w_9 / 48 + w_7 ** 2 * w_9 ** 2 / 144 + w_7 * w_8 ** 2 * w_9 / 48 + w_7 * w_8 * w_9 ** 2 / 48 - w_8 ** 4 / 720 + w_8 ** 2 * w_9 ** 2 / 144 - w_9 ** 4 / 720
-    if s == 5 and ln == 8:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        return -w_1 ** 4 * w_2 / 1440 - w_1 ** 4 * w_3 / 1440 - w_1 ** 4 * w_4 / 1440 - w_1 ** 4 * w_5 / 1440 - w_1 ** 4 * w_6 / 1440 - w_1 ** 4 * w_7 / 1440 - w_1 ** 4 * w_8 / 1440 + w_1 ** 2 * w_2 ** 2 * w_3 / 288 + w_1 ** 2 * w_2 ** 2 * w_4 / 288 + w_1 ** 2 * w_2 ** 2 * w_5 / 288 + w_1 ** 2 * w_2 ** 2 * w_6 / 288 + w_1 ** 2 * w_2 ** 2 * w_7 / 288 + w_1 ** 2 * w_2 ** 2 * w_8 / 288 + w_1 ** 2 * w_2 * w_3 ** 2 / 288 + w_1 ** 2 * w_2 * w_3 * w_4 / 96 + w_1 ** 2 * w_2 * w_3 * w_5 / 96 + w_1 ** 2 * w_2 * w_3 * w_6 / 96 + w_1 ** 2 * w_2 * w_3 * w_7 / 96 + w_1 ** 2 * w_2 * w_3 * w_8 / 96 + w_1 ** 2 * w_2 * w_4 ** 2 / 288 + w_1 ** 2 * w_2 * w_4 * w_5 / 96 + w_1 ** 2 * w_2 * w_4 * w_6 / 96 + w_1 ** 2 * w_2 * w_4 * w_7 / 96 + w_1 ** 2 * w_2 * w_4 * w_8 / 96 + w_1 ** 2 * w_2 * w_5 ** 2 / 288 + w_1 ** 2 * w_2 * w_5 * w_6 / 96 + w_1 ** 2 * w_2 * w_5 * w_7 / 96 + w_1 ** 2 * w_2 * w_5 * w_8 / 96 + w_1 ** 2 * w_2 * w_6 ** 2 / 288 + w_1 ** 2 * w_2 * w_6 * w_7 / 96 + w_1 ** 2 * w_2 * w_6 * w_8 / 96 + w_1 ** 2 * w_2 * w_7 ** 2 / 288 + w_1 ** 2 * w_2 * w_7 * w_8 / 96 + w_1 ** 2 * w_2 * w_8 ** 2 / 288 + w_1 ** 2 * w_3 ** 2 * w_4 / 288 + w_1 ** 2 * w_3 ** 2 * w_5 / 288 + w_1 ** 2 * w_3 ** 2 * w_6 / 288 + w_1 ** 2 * w_3 ** 2 * w_7 / 288 + w_1 ** 2 * w_3 ** 2 * w_8 / 288 + w_1 ** 2 * w_3 * w_4 ** 2 / 288 + w_1 ** 2 * w_3 * w_4 * w_5 / 96 + w_1 ** 2 * w_3 * w_4 * w_6 / 96 + w_1 ** 2 * w_3 * w_4 * w_7 / 96 + w_1 ** 2 * w_3 * w_4 * w_8 / 96 + w_1 ** 2 * w_3 * w_5 ** 2 / 288 + w_1 ** 2 * w_3 * w_5 * w_6 / 96 + w_1 ** 2 * w_3 * w_5 * w_7 / 96 + w_1 ** 2 * w_3 * w_5 * w_8 / 96 + w_1 ** 2 * w_3 * w_6 ** 2 / 288 + w_1 ** 2 * w_3 * w_6 * w_7 / 96 + w_1 ** 2 * w_3 * w_6 * w_8 / 96 + w_1 ** 2 * w_3 * w_7 ** 2 / 288 + w_1 ** 2 * w_3 * w_7 * w_8 / 96 + w_1 ** 2 * w_3 * w_8 ** 2 / 288 + w_1 ** 2 * w_4 ** 2 * w_5 / 288 + w_1 ** 2 * w_4 ** 2 * w_6 / 288 + w_1 ** 2 * w_4 ** 2 * w_7 / 288 + w_1 ** 2 * w_4 ** 2 * w_8 / 288 + w_1 ** 2 * w_4 * w_5 ** 2 / 288 + w_1 ** 2 * w_4 * w_5 * w_6 / 96 + w_1 ** 2 * w_4 * w_5 * w_7 / 96 + w_1 ** 2 * w_4 * w_5 * w_8 / 96 + w_1 ** 2 * w_4 * w_6 ** 2 / 288 + w_1 ** 2 * w_4 * w_6 * w_7 / 96 + w_1 ** 2 * w_4 * w_6 * w_8 / 96 + w_1 ** 2 * w_4 * w_7 ** 2 / 288 + w_1 ** 2 * w_4 * w_7 * w_8 / 96 + w_1 ** 2 * w_4 * w_8 ** 2 / 288 + w_1 ** 2 * w_5 ** 2 * w_6 / 288 + w_1 ** 2 * w_5 ** 2 * w_7 / 288 + w_1 ** 2 * w_5 ** 2 * w_8 / 288 + w_1 ** 2 * w_5 * w_6 ** 2 / 288 + w_1 ** 2 * w_5 * w_6 * w_7 / 96 + w_1 ** 2 * w_5 * w_6 * w_8 / 96 + w_1 ** 2 * w_5 * w_7 ** 2 / 288 + w_1 ** 2 * w_5 * w_7 * w_8 / 96 + w_1 ** 2 * w_5 * w_8 ** 2 / 288 + w_1 ** 2 * w_6 ** 2 * w_7 / 288 + w_1 ** 2 * w_6 ** 2 * w_8 / 288 + w_1 ** 2 * w_6 * w_7 ** 2 / 288 + w_1 ** 2 * w_6 * w_7 * w_8 / 96 + w_1 ** 2 * w_6 * w_8 ** 2 / 288 + w_1 ** 2 * w_7 ** 2 * w_8 / 288 + w_1 ** 2 * w_7 * w_8 ** 2 / 288 - w_1 * w_2 ** 4 / 1440 + w_1 * w_2 ** 2 * w_3 ** 2 / 288 + w_1 * w_2 ** 2 * w_3 * w_4 / 96 + w_1 * w_2 ** 2 * w_3 * w_5 / 96 + w_1 * w_2 ** 2 * w_3 * w_6 / 96 + w_1 * w_2 ** 2 * w_3 * w_7 / 96 + w_1 * w_2 ** 2 * w_3 * w_8 / 96 + w_1 * w_2 ** 2 * w_4 ** 2 / 288 + w_1 * w_2 ** 2 * w_4 * w_5 / 96 + w_1 * w_2 ** 2 * w_4 * w_6 / 96 + w_1 * w_2 ** 2 * w_4 * w_7 / 96 + w_1 * w_2 ** 2 * w_4 * w_8 / 96 + w_1 * w_2 ** 2 * w_5 ** 2 / 288 + w_1 * w_2 ** 2 * w_5 * w_6 / 96 + w_1 * w_2 ** 2 * w_5 * w_7 / 96 + w_1 * w_2 ** 2 * w_5 * w_8 / 96 + w_1 * w_2 ** 2 * w_6 ** 2 / 288 + w_1 * w_2 ** 2 * w_6 * w_7 / 96 + w_1 * w_2 ** 2 * w_6 * w_8 / 96 + w_1 * w_2 ** 2 * w_7 ** 2 / 288 + w_1 * w_2 ** 2 * w_7 * w_8 / 96 + w_1 * w_2 ** 2 * w_8 ** 2 / 288 + w_1 * w_2 * w_3 ** 2 * w_4 / 96 + w_1 * w_2 * w_3 ** 2 * w_5 / 96 + w_1 * w_2 * w_3 ** 2 * w_6 / 96 + w_1 * w_2 * w_3 ** 2 * w_7 / 96 + w_1 * w_2 * w_3 ** 2 * w_8 / 96 + w_1 * w_2 * w_3 * w_4 ** 2 / 96 + w_1 * w_2 * w_3 * w_4 * w_5 / 32 + w_1 * w_2 * w_3 * w_4 * w_6 / 32 + w_1 * w_2 * w_3 * w_4 * w_7 / 32 + w_1 * w_2 * w_3 * w_4 * w_8 / 32 + w_1 * w_2 * w_3 * w_5 ** 2 / 96 + w_1 * w_2 * w_3 * w_5 * w_6 / 32 + w_1 * w_2 * w_3 * w_5 * w_7 / 32 + w_1 * w_2 * w_3 * w_5 * w_8 / 32 + w_1 * w_2 * w_3 * w_6 ** 2 / 96 + w_1 * w_2 * w_3 * w_6 * w_7 / 32 + w_1 * w_2 * w_3 * w_6 * w_8 / 32 + w_1 * w_2 * w_3 * w_7 ** 2 / 96 + w_1 * w_2 * w_3 * w_7 * w_8 / 32 + w_1 * w_2 * w_3 * w_8 ** 2 / 96 + w_1 * w_2 * w_4 ** 2 * w_5 / 96 + w_1 * w_2 * w_4 ** 2 * w_6 / 96 + w_1 * w_2 * w_4 ** 2 * w_7 / 96 + w_1 * w_2 * w_4 ** 2 * w_8 / 96 + w_1 * w_2 * w_4 * w_5 ** 2 / 96 + w_1 * w_2 * w_4 * w_5 * w_6 / 32 + w_1 * w_2 * w_4 * w_5 * w_7 / 32 + w_1 * w_2 * w_4 * w_5 * w_8 / 32 + w_1 * w_2 * w_4 * w_6 ** 2 / 96 + w_1 * w_2 * w_4 * w_6 * w_7 / 32 + w_1 * w_2 * w_4 * w_6 * w_8 / 32 + w_1 * w_2 * w_4 * w_7 ** 2 / 96 + w_1 * w_2 * w_4 * w_7 * w_8 / 32 + w_1 * w_2 * w_4 * w_8 ** 2 / 96 + w_1 * w_2 * w_5 ** 2 * w_6 / 96 + w_1 * w_2 * w_5 ** 2 * w_7 / 96 + w_1 * w_2 * w_5 ** 2 * w_8 / 96 + w_1 * w_2 * w_5 * w_6 ** 2 / 96 + w_1 * w_2 * w_5 * w_6 * w_7 / 32 + w_1 * w_2 * w_5 * w_6 * w_8 / 32 + w_1 * w_2 * w_5 * w_7 ** 2 / 96 + w_1 * w_2 * w_5 * w_7 * w_8 / 32 + w_1 * w_2 * w_5 * w_8 ** 2 / 96 + w_1 * w_2 * w_6 ** 2 * w_7 / 96 + w_1 * w_2 * w_6 ** 2 * w_8 / 96 + w_1 * w_2 * w_6 * w_7 ** 2 / 96 + w_1 * w_2 * w_6 * w_7 * w_8 / 32 + w_1 * w_2 * w_6 * w_8 ** 2 / 96 + w_1 * w_2 * w_7 ** 2 * w_8 / 96 + w_1 * w_2 * w_7 * w_8 ** 2 / 96 - w_1 * w_3 ** 4 / 1440 + w_1 * w_3 ** 2 * w_4 ** 2 / 288 + w_1 * w_3 ** 2 * w_4 * w_5 / 96 + w_1 * w_3 ** 2 * w_4 * w_6 / 96 + w_1 * w_3 ** 2 * w_4 * w_7 / 96 + w_1 * w_3 ** 2 * w_4 * w_8 / 96 + w_1 * w_3 ** 2 * w_5 ** 2 / 288 + w_1 * w_3 ** 2 * w_5 * w_6 / 96 + w_1 * w_3 ** 2 * w_5 * w_7 / 96 + w_1 * w_3 ** 2 * w_5 * w_8 / 96 + w_1 * w_3 ** 2 * w_6 ** 2 / 288 + w_1 * w_3 ** 2 * w_6 * w_7 / 96 + w_1 * w_3 ** 2 * w_6 * w_8 / 96 + w_1 * w_3 ** 2 * w_7 ** 2 / 288 + w_1 * w_3 ** 2 * w_7 * w_8 / 96 + w_1 * w_3 ** 2 * w_8 ** 2 / 288 + w_1 * w_3 * w_4 ** 2 * w_5 / 96 + w_1 * w_3 * w_4 ** 2 * w_6 / 96 + w_1 * w_3 * w_4 ** 2 * w_7 / 96 + w_1 * w_3 * w_4 ** 2 * w_8 / 96 + w_1 * w_3 * w_4 * w_5 ** 2 / 96 + w_1 * w_3 * w_4 * w_5 * w_6 / 32 + w_1 * w_3 * w_4 * w_5 * w_7 / 32 + w_1 * w_3 * w_4 * w_5 * w_8 / 32 + w_1 * w_3 * w_4 * w_6 ** 2 / 96 + w_1 * w_3 * w_4 * w_6 * w_7 / 32 + w_1 * w_3 * w_4 * w_6 * w_8 / 32 + w_1 * w_3 * w_4 * w_7 ** 2 / 96 + w_1 * w_3 * w_4 * w_7 * w_8 / 32 + w_1 * w_3 * w_4 * w_8 ** 2 / 96 + w_1 * w_3 * w_5 ** 2 * w_6 / 96 + w_1 * w_3 * w_5 ** 2 * w_7 / 96 + w_1 * w_3 * w_5 ** 2 * w_8 / 96 + w_1 * w_3 * w_5 * w_6 ** 2 / 96 + w_1 * w_3 * w_5 * w_6 * w_7 / 32 + w_1 * w_3 * w_5 * w_6 * w_8 / 32 + w_1 * w_3 * w_5 * w_7 ** 2 / 96 + w_1 * w_3 * w_5 * w_7 * w_8 / 32 + w_1 * w_3 * w_5 * w_8 ** 2 / 96 + w_1 * w_3 * w_6 ** 2 * w_7 / 96 + w_1 * w_3 * w_6 ** 2 * w_8 / 96 + w_1 * w_3 * w_6 * w_7 ** 2 / 96 + w_1 * w_3 * w_6 * w_7 * w_8 / 32 + w_1 * w_3 * w_6 * w_8 ** 2 / 96 + w_1 * w_3 * w_7 ** 2 * w_8 / 96 + w_1 * w_3 * w_7 * w_8 ** 2 / 96 - w_1 * w_4 ** 4 / 1440 + w_1 * w_4 ** 2 * w_5 ** 2 / 288 + w_1 * w_4 ** 2 * w_5 * w_6 / 96 + w_1 * w_4 ** 2 * w_5 * w_7 / 96 + w_1 * w_4 ** 2 * w_5 * w_8 / 96 + w_1 * w_4 ** 2 * w_6 ** 2 / 288 + w_1 * w_4 ** 2 * w_6 * w_7 / 96 + w_1 * w_4 ** 2 * w_6 * w_8 / 96 + w_1 * w_4 ** 2 * w_7 ** 2 / 288 + w_1 * w_4 ** 2 * w_7 * w_8 / 96 + w_1 * w_4 ** 2 * w_8 ** 2 / 288 + w_1 * w_4 * w_5 ** 2 * w_6 / 96 + w_1 * w_4 * w_5 ** 2 * w_7 / 96 + w_1 * w_4 * w_5 ** 2 * w_8 / 96 + w_1 * w_4 * w_5 * w_6 ** 2 / 96 + w_1 * w_4 * w_5 * w_6 * w_7 / 32 + w_1 * w_4 * w_5 * w_6 * w_8 / 32 + w_1 * w_4 * w_5 * w_7 ** 2 / 96 + w_1 * w_4 * w_5 * w_7 * w_8 / 32 + w_1 * w_4 * w_5 * w_8 ** 2 / 96 + w_1 * w_4 * w_6 ** 2 * w_7 / 96 + w_1 * w_4 * w_6 ** 2 * w_8 / 96 + w_1 * w_4 * w_6 * w_7 ** 2 / 96 + w_1 * w_4 * w_6 * w_7 * w_8 / 32 + w_1 * w_4 * w_6 * w_8 ** 2 / 96 + w_1 * w_4 * w_7 ** 2 * w_8 / 96 + w_1 * w_4 * w_7 * w_8 ** 2 / 96 - w_1 * w_5 ** 4 / 1440 + w_1 * w_5 ** 2 * w_6 ** 2 / 288 + w_1 * w_5 ** 2 * w_6 * w_7 / 96 + w_1 * w_5 ** 2 * w_6 * w_8 / 96 + w_1 * w_5 ** 2 * w_7 ** 2 / 288 + w_1 * w_5 ** 2 * w_7 * w_8 / 96 + w_1 * w_5 ** 2 * w_8 ** 2 / 288 + w_1 * w_5 * w_6 ** 2 * w_7 / 96 + w_1 * w_5 * w_6 ** 2 * w_8 / 96 + w_1 * w_5 * w_6 * w_7 ** 2 / 96 + w_1 * w_5 * w_6 * w_7 * w_8 / 32 + w_1 * w_5 * w_6 * w_8 ** 2 / 96 + w_1 * w_5 * w_7 ** 2 * w_8 / 96 + w_1 * w_5 * w_7 * w_8 ** 2 / 96 - w_1 * w_6 ** 4 / 1440 + w_1 * w_6 ** 2 * w_7 ** 2 / 288 + w_1 * w_6 ** 2 * w_7 * w_8 / 96 + w_1 * w_6 ** 2 * w_8 ** 2 / 288 + w_1 * w_6 * w_7 ** 2 * w_8 / 96 + w_1 * w_6 * w_7 * w_8 ** 2 / 96 - w_1 * w_7 ** 4 / 1440 + w_1 * w_7 ** 2 * w_8 ** 2 / 288 - w_1 * w_8 ** 4 / 1440 - w_2 ** 4 * w_3 / 1440 - w_2 ** 4 * w_4 / 1440 - w_2 ** 4 * w_5 / 1440 - w_2 ** 4 * w_6 / 1440 - w_2 ** 4 * w_7 / 1440 - w_2 ** 4 * w_8 / 1440 + w_2 ** 2 * w_3 ** 2 * w_4 / 288 + w_2 ** 2 * w_3 ** 2 * w_5 / 288 + w_2 ** 2 * w_3 ** 2 * w_6 / 288 + w_2 ** 2 * w_3 ** 2 * w_7 / 288 + w_2 ** 2 * w_3 ** 2 * w_8 / 288 + w_2 ** 2 * w_3 * w_4 ** 2 / 288 + w_2 ** 2 * w_3 * w_4 * w_5 / 96 + w_2 ** 2 * w_3 * w_4 * w_6 / 96 + w_2 ** 2 * w_3 * w_4 * w_7 / 96 + w_2 ** 2 * w_3 * w_4 * w_8 / 96 + w_2 ** 2 * w_3 * w_5 ** 2 / 288 + w_2 ** 2 * w_3 * w_5 * w_6 / 96 + w_2 ** 2 * w_3 * w_5 * w_7 / 96 + w_2 ** 2 * w_3 * w_5 * w_8 / 96 + w_2 ** 2 * w_3 * w_6 ** 2 / 288 + w_2 ** 2 * w_3 * w_6 * w_7 / 96 + w_2 ** 2 * w_3 * w_6 * w_8 / 96 + w_2 ** 2 * w_3 * w_7 ** 2 / 288 + w_2 ** 2 * w_3 * w_7 * w_8 / 96 + w_2 ** 2 * w_3 * w_8 ** 2 / 288 + w_2 ** 2 * w_4 ** 2 * w_5 / 288 + w_2 ** 2 * w_4 ** 2 * w_6 / 288 + w_2 ** 2 * w_4 ** 2 * w_7 / 288 + w_2 ** 2 * w_4 ** 2 * w_8 / 288 + w_2 ** 2 * w_4 * w_5 ** 2 / 288 + w_2 ** 2 * w_4 * w_5 * w_6 / 96 + w_2 ** 2 * w_4 * w_5 * w_7 / 96 + w_2 ** 2 * w_4 * w_5 * w_8 / 96 + w_2 ** 2 * w_4 * w_6 ** 2 / 288 + w_2 ** 2 * w_4 * w_6 * w_7 / 96 + w_2 ** 2 * w_4 * w_6 * w_8 / 96 + w_2 ** 2 * w_4 * w_7 ** 2 / 288 + w_2 ** 2 * w_4 * w_7 * w_8 / 96 + w_2 ** 2 * w_4 * w_8 ** 2 / 288 + w_2 ** 2 * w_5 ** 2 * w_6 / 288 + w_2 ** 2 * w_5 ** 2 * w_7 / 288 + w_2 ** 2 * w_5 ** 2 * w_8 / 288 + w_2 ** 2 * w_5 * w_6 ** 2 / 288 + w_2 ** 2 * w_5 * w_6 * w_7 / 96 + w_2 ** 2 * w_5 * w_6 * w_8 / 96 + w_2 ** 2 * w_5 * w_7 ** 2 / 288 + w_2 ** 2 * w_5 * w_7 * w_8 / 96 + w_2 ** 2 * w_5 * w_8 ** 2 / 288 + w_2 ** 2 * w_6 ** 2 * w_7 / 288 + w_2 ** 2 * w_6 ** 2 * w_8 / 288 + w_2 ** 2 * w_6 * w_7 ** 2 / 288 + w_2 ** 2 * w_6 * w_7 * w_8 / 96 + w_2 ** 2 * w_6 * w_8 ** 2 / 288 + w_2 ** 2 * w_7 ** 2 * w_8 / 288 + w_2 ** 2 * w_7 * w_8 ** 2 / 288 - w_2 * w_3 ** 4 / 1440 + w_2 * w_3 ** 2 * w_4 ** 2 / 288 + w_2 * w_3 ** 2 * w_4 * w_5 / 96 + w_2 * w_3 ** 2 * w_4 * w_6 / 96 + w_2 * w_3 ** 2 * w_4 * w_7 / 96 + w_2 * w_3 ** 2 * w_4 * w_8 / 96 + w_2 * w_3 ** 2 * w_5 ** 2 / 288 + w_2 * w_3 ** 2 * w_5 * w_6 / 96 + w_2 * w_3 ** 2 * w_5 * w_7 / 96 + w_2 * w_3 ** 2 * w_5 * w_8 / 96 + w_2 * w_3 ** 2 * w_6 ** 2 / 288 + w_2 * w_3 ** 2 * w_6 * w_7 / 96 + w_2 * w_3 ** 2 * w_6 * w_8 / 96 + w_2 * w_3 ** 2 * w_7 ** 2 / 288 + w_2 * w_3 ** 2 * w_7 * w_8 / 96 + w_2 * w_3 ** 2 * w_8 ** 2 / 288 + w_2 * w_3 * w_4 ** 2 * w_5 / 96 + w_2 * w_3 * w_4 ** 2 * w_6 / 96 + w_2 * w_3 * w_4 ** 2 * w_7 / 96 + w_2 * w_3 * w_4 ** 2 * w_8 / 96 + w_2 * w_3 * w_4 * w_5 ** 2 / 96 + w_2 * w_3 * w_4 * w_5 * w_6 / 32 + w_2 * w_3 * w_4 * w_5 * w_7 / 32 + w_2 * w_3 * w_4 * w_5 * w_8 / 32 + w_2 * w_3 * w_4 * w_6 ** 2 / 96 + w_2 * w_3 * w_4 * w_6 * w_7 / 32 + w_2 * w_3 * w_4 * w_6 * w_8 / 32 + w_2 * w_3 * w_4 * w_7 ** 2 / 96 + w_2 * w_3 * w_4 * w_7 * w_8 / 32 + w_2 * w_3 * w_4 * w_8 ** 2 / 96 + w_2 * w_3 * w_5 ** 2 * w_6 / 96 + w_2 * w_3 * w_5 ** 2 * w_7 / 96 + w_2 * w_3 * w_5 ** 2 * w_8 / 96 + w_2 * w_3 * w_5 * w_6 ** 2 / 96 + w_2 * w_3 * w_5 * w_6 * w_7 / 32 + w_2 * w_3 * w_5 * w_6 * w_8 / 32 + w_2 * w_3 * w_5 * w_7 ** 2 / 96 + w_2 * w_3 * w_5 * w_7 * w_8 / 32 + w_2 * w_3 * w_5 * w_8 ** 2 / 96 + w_2 * w_3 * w_6 ** 2 * w_7 / 96 + w_2 * w_3 * w_6 ** 2 * w_8 / 96 + w_2 * w_3 * w_6 * w_7 ** 2 / 96 + w_2 * w_3 * w_6 * w_7 * w_8 / 32 + w_2 * w_3 * w_6 * w_8 ** 2 / 96 + w_2 * w_3 * w_7 ** 2 * w_8 / 96 + w_2 * w_3 * w_7 * w_8 ** 2 / 96 - w_2 * w_4 ** 4 / 1440 + w_2 * w_4 ** 2 * w_5 ** 2 / 288 + w_2 * w_4 ** 2 * w_5 * w_6 / 96 + w_2 * w_4 ** 2 * w_5 * w_7 / 96 + w_2 * w_4 ** 2 * w_5 * w_8 / 96 + w_2 * w_4 ** 2 * w_6 ** 2 / 288 + w_2 * w_4 ** 2 * w_6 * w_7 / 96 + w_2 * w_4 ** 2 * w_6 * w_8 / 96 + w_2 * w_4 ** 2 * w_7 ** 2 / 288 + w_2 * w_4 ** 2 * w_7 * w_8 / 96 + w_2 * w_4 ** 2 * w_8 ** 2 / 288 + w_2 * w_4 * w_5 ** 2 * w_6 / 96 + w_2 * w_4 * w_5 ** 2 * w_7 / 96 + w_2 * w_4 * w_5 ** 2 * w_8 / 96 + w_2 * w_4 * w_5 * w_6 ** 2 / 96 + w_2 * w_4 * w_5 * w_6 * w_7 / 32 + w_2 * w_4 * w_5 * w_6 * w_8 / 32 + w_2 * w_4 * w_5 * w_7 ** 2 / 96 + w_2 * w_4 * w_5 * w_7 * w_8 / 32 + w_2 * w_4 * w_5 * w_8 ** 2 / 96 + w_2 * w_4 * w_6 ** 2 * w_7 / 96 + w_2 * w_4 * w_6 ** 2 * w_8 / 96 + w_2 * w_4 * w_6 * w_7 ** 2 / 96 + w_2 * w_4 * w_6 * w_7 * w_8 / 32 + w_2 * w_4 * w_6 * w_8 ** 2 / 96 + w_2 * w_4 * w_7 ** 2 * w_8 / 96 + w_2 * w_4 * w_7 * w_8 ** 2 / 96 - w_2 * w_5 ** 4 / 1440 + w_2 * w_5 ** 2 * w_6 ** 2 / 288 + w_2 * w_5 ** 2 * w_6 * w_7 / 96 + w_2 * w_5 ** 2 * w_6 * w_8 / 96 + w_2 * w_5 ** 2 * w_7 ** 2 / 288 + w_2 * w_5 ** 2 * w_7 * w_8 / 96 + w_2 * w_5 ** 2 * w_8 ** 2 / 288 + w_2 * w_5 * w_6 ** 2 * w_7 / 96 + w_2 * w_5 * w_6 ** 2 * w_8 / 96 + w_2 * w_5 * w_6 * w_7 ** 2 / 96 + w_2 * w_5 * w_6 * w_7 * w_8 / 32 + w_2 * w_5 * w_6 * w_8 ** 2 / 96 + w_2 * w_5 * w_7 ** 2 * w_8 / 96 + w_2 * w_5 * w_7 * w_8 ** 2 / 96 - w_2 * w_6 ** 4 / 1440 + w_2 * w_6 ** 2 * w_7 ** 2 / 288 + w_2 * w_6 ** 2 * w_7 * w_8 / 96 + w_2 * w_6 ** 2 * w_8 ** 2 / 288 + w_2 * w_6 * w_7 ** 2 * w_8 / 96 + w_2 * w_6 * w_7 * w_8 ** 2 / 96 - w_2 * w_7 ** 4 / 1440 + w_2 * w_7 ** 2 * w_8 ** 2 / 288 - w_2 * w_8 ** 4 / 1440 - w_3 ** 4 * w_4 / 1440 - w_3 ** 4 * w_5 / 1440 - w_3 ** 4 * w_6 / 1440 - w_3 ** 4 * w_7 / 1440 - w_3 ** 4 * w_8 / 1440 + w_3 ** 2 * w_4 ** 2 * w_5 / 288 + w_3 ** 2 * w_4 ** 2 * w_6 / 288 + w_3 ** 2 * w_4 ** 2 * w_7 / 288 + w_3 ** 2 * w_4 ** 2 * w_8 / 288 + w_3 ** 2 * w_4 * w_5 ** 2 / 288 + w_3 ** 2 * w_4 * w_5 * w_6 / 96 + w_3 ** 2 * w_4 * w_5 * w_7 / 96 + w_3 ** 2 * w_4 * w_5 * w_8 / 96 + w_3 ** 2 * w_4 * w_6 ** 2 / 288 + w_3 ** 2 * w_4 * w_6 * w_7 / 96 + w_3 ** 2 * w_4 * w_6 * w_8 / 96 + w_3 ** 2 * w_4 * w_7 ** 2 / 288 + w_3 ** 2 * w_4 * w_7 * w_8 / 96 + w_3 ** 2 * w_4 * w_8 ** 2 / 288 + w_3 ** 2 * w_5 ** 2 * w_6 / 288 + w_3 ** 2 * w_5 ** 2 * w_7 / 288 + w_3 ** 2 * w_5 ** 2 * w_8 / 288 + w_3 ** 2 * w_5 * w_6 ** 2 / 288 + w_3 ** 2 * w_5 * w_6 * w_7 / 96 + w_3 ** 2 * w_5 * w_6 * w_8 / 96 + w_3 ** 2 * w_5 * w_7 ** 2 / 288 + w_3 ** 2 * w_5 * w_7 * w_8 / 96 + w_3 ** 2 * w_5 * w_8 ** 2 / 288 + w_3 ** 2 * w_6 ** 2 * w_7 / 288 + w_3 ** 2 * w_6 ** 2 * w_8 / 288 + w_3 ** 2 * w_6 * w_7 ** 2 / 288 + w_3 ** 2 * w_6 * w_7 * w_8 / 96 + w_3 ** 2 * w_6 * w_8 ** 2 / 288 + w_3 ** 2 * w_7 ** 2 * w_8 / 288 + w_3 ** 2 * w_7 * w_8 ** 2 / 288 - w_3 * w_4 ** 4 / 1440 + w_3 * w_4 ** 2 * w_5 ** 2 / 288 + w_3 * w_4 ** 2 * w_5 * w_6 / 96 + w_3 * w_4 ** 2 * w_5 * w_7 / 96 + w_3 * w_4 ** 2 * w_5 * w_8 / 96 + w_3 * w_4 ** 2 * w_6 ** 2 / 288 + w_3 * w_4 ** 2 * w_6 * w_7 / 96 + w_3 * w_4 ** 2 * w_6 * w_8 / 96 + w_3 * w_4 ** 2 * w_7 ** 2 / 288 + w_3 * w_4 ** 2 * w_7 * w_8 / 96 + w_3 * w_4 ** 2 * w_8 ** 2 / 288 + w_3 * w_4 * w_5 ** 2 * w_6 / 96 + w_3 * w_4 * w_5 ** 2 * w_7 / 96 + w_3 * w_4 * w_5 ** 2 * w_8 / 96 + w_3 * w_4 * w_5 * w_6 ** 2 / 96 + w_3 * w_4 * w_5 * w_6 * w_7 / 32 + w_3 * w_4 * w_5 * w_6 * w_8 / 32 + w_3 * w_4 * w_5 * w_7 ** 2 / 96 + w_3 * w_4 * w_5 * w_7 * w_8 / 32 + w_3 * w_4 * w_5 * w_8 ** 2 / 96 + w_3 * w_4 * w_6 ** 2 * w_7 / 96 + w_3 * w_4 * w_6 ** 2 * w_8 / 96 + w_3 * w_4 * w_6 * w_7 ** 2 / 96 + w_3 * w_4 * w_6 * w_7 * w_8 / 32 + w_3 * w_4 * w_6 * w_8 ** 2 / 96 + w_3 * w_4 * w_7 ** 2 * w_8 / 96 + w_3 * w_4 * w_7 * w_8 ** 2 / 96 - w_3 * w_5 ** 4 / 1440 + w_3 * w_5 ** 2 * w_6 ** 2 / 288 + w_3 * w_5 ** 2 * w_6 * w_7 / 96 + w_3 * w_5 ** 2 * w_6 * w_8 / 96 + w_3 * w_5 ** 2 * w_7 ** 2 / 288 + w_3 * w_5 ** 2 * w_7 * w_8 / 96 + w_3 * w_5 ** 2 * w_8 ** 2 / 288 + w_3 * w_5 * w_6 ** 2 * w_7 / 96 + w_3 * w_5 * w_6 ** 2 * w_8 / 96 + w_3 * w_5 * w_6 * w_7 ** 2 / 96 + w_3 * w_5 * w_6 * w_7 * w_8 / 32 + w_3 * w_5 * w_6 * w_8 ** 2 / 96 + w_3 * w_5 * w_7 ** 2 * w_8 / 96 + w_3 * w_5 * w_7 * w_8 ** 2 / 96 - w_3 * w_6 ** 4 / 1440 + w_3 * w_6 ** 2 * w_7 ** 2 / 288 + w_3 * w_6 ** 2 * w_7 * w_8 / 96 + w_3 * w_6 ** 2 * w_8 ** 2 / 288 + w_3 * w_6 * w_7 ** 2 * w_8 / 96 + w_3 * w_6 * w_7 * w_8 ** 2 / 96 - w_3 * w_7 ** 4 / 1440 + w_3 * w_7 ** 2 * w_8 ** 2 / 288 - w_3 * w_8 ** 4 / 1440 - w_4 ** 4 * w_5 / 1440 - w_4 ** 4 * w_6 / 1440 - w_4 ** 4 * w_7 / 1440 - w_4 ** 4 * w_8 / 1440 + w_4 ** 2 * w_5 ** 2 * w_6 / 288 + w_4 ** 2 * w_5 ** 2 * w_7 / 288 + w_4 ** 2 * w_5 ** 2 * w_8 / 288 + w_4 ** 2 * w_5 * w_6 ** 2 / 288 + w_4 ** 2 * w_5 * w_6 * w_7 / 96 + w_4 ** 2 * w_5 * w_6 * w_8 / 96 + w_4 ** 2 * w_5 * w_7 ** 2 / 288 + w_4 ** 2 * w_5 * w_7 * w_8 / 96 + w_4 ** 2 * w_5 * w_8 ** 2 / 288 + w_4 ** 2 * w_6 ** 2 * w_7 / 288 + w_4 ** 2 * w_6 ** 2 * w_8 / 288 + w_4 ** 2 * w_6 * w_7 ** 2 / 288 + w_4 ** 2 * w_6 * w_7 * w_8 / 96 + w_4 ** 2 * w_6 * w_8 ** 2 / 288 + w_4 ** 2 * w_7 ** 2 * w_8 / 288 + w_4 ** 2 * w_7 * w_8 ** 2 / 288 - w_4 * w_5 ** 4 / 1440 + w_4 * w_5 ** 2 * w_6 ** 2 / 288 + w_4 * w_5 ** 2 * w_6 * w_7 / 96 + w_4 * w_5 ** 2 * w_6 * w_8 / 96 + w_4 * w_5 ** 2 * w_7 ** 2 / 288 + w_4 * w_5 ** 2 * w_7 * w_8 / 96 + w_4 * w_5 ** 2 * w_8 ** 2 / 288 + w_4 * w_5 * w_6 ** 2 * w_7 / 96 + w_4 * w_5 * w_6 ** 2 * w_8 / 96 + w_4 * w_5 * w_6 * w_7 ** 2 / 96 + w_4 * w_5 * w_6 * w_7 * w_8 / 32 + w_4 * w_5 * w_6 * w_8 ** 2 / 96 + w_4 * w_5 * w_7 ** 2 * w_8 / 96 + w_4 * w_5 * w_7 * w_8 ** 2 / 96 - w_4 * w_6 ** 4 / 1440 + w_4 * w_6 ** 2 * w_7 ** 2 / 288 + w_4 * w_6 ** 2 * w_7 * w_8 / 96 + w_4 * w_6 ** 2 * w_8 ** 2 / 288 + w_4 * w_6 * w_7 ** 2 * w_8 / 96 + w_4 * w_6 * w_7 * w_8 ** 2 / 96 - w_4 * w_7 ** 4 / 1440 + w_4 * w_7 ** 2 * w_8 ** 2 / 288 - w_4 * w_8 ** 4 / 1440 - w_5 ** 4 * w_6 / 1440 - w_5 ** 4 * w_7 / 1440 - w_5 ** 4 * w_8 / 1440 + w_5 ** 2 * w_6 ** 2 * w_7 / 288 + w_5 ** 2 * w_6 ** 2 * w_8 / 288 + w_5 ** 2 * w_6 * w_7 ** 2 / 288 + w_5 ** 2 * w_6 * w_7 * w_8 / 96 + w_5 ** 2 * w_6 * w_8 ** 2 / 288 + w_5 ** 2 * w_7 ** 2 * w_8 / 288 + w_5 ** 2 * w_7 * w_8 ** 2 / 288 - w_5 * w_6 ** 4 / 1440 + w_5 * w_6 ** 2 * w_7 ** 2 / 288 + w_5 * w_6 ** 2 * w_7 * w_8 / 96 + w_5 * w_6 ** 2 * w_8 ** 2 / 288 + w_5 * w_6 * w_7 ** 2 * w_8 / 96 + w_5 * w_6 * w_7 * w_8 ** 2 / 96 - w_5 * w_7 ** 4 / 1440 + w_5 * w_7 ** 2 * w_8 ** 2 / 288 - w_5 * w_8 ** 4 / 1440 - w_6 ** 4 * w_7 / 1440 - w_6 ** 4 * w_8 / 1440 + w_6 ** 2 * w_7 ** 2 * w_8 / 288 + w_6 ** 2 * w_7 * w_8 ** 2 / 288 - w_6 * w_7 ** 4 / 1440 + w_6 * w_7 ** 2 * w_8 ** 2 / 288 - w_6 * w_8 ** 4 / 1440 - w_7 ** 4 * w_8 / 1440 - w_7 * w_8 ** 4 / 1440
-    if s == 6 and ln == 7:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        return w_1 ** 6 / 30240 - w_1 ** 4 * w_2 ** 2 / 8640 - w_1 ** 4 * w_2 * w_3 / 2880 - w_1 ** 4 * w_2 * w_4 / 2880 - w_1 ** 4 * w_2 * w_5 / 2880 - w_1 ** 4 * w_2 * w_6 / 2880 - w_1 ** 4 * w_2 * w_7 / 2880 - w_1 ** 4 * w_3 ** 2 / 8640 - w_1 ** 4 * w_3 * w_4 / 2880 - w_1 ** 4 * w_3 * w_5 / 2880 - w_1 ** 4 * w_3 * w_6 / 2880 - w_1 ** 4 * w_3 * w_7 / 2880 - w_1 ** 4 * w_4 ** 2 / 8640 - w_1 ** 4 * w_4 * w_5 / 2880 - w_1 ** 4 * w_4 * w_6 / 2880 - w_1 ** 4 * w_4 * w_7 / 2880 - w_1 ** 4 * w_5 ** 2 / 8640 - w_1 ** 4 * w_5 * w_6 / 2880 - w_1 ** 4 * w_5 * w_7 / 2880 - w_1 ** 4 * w_6 ** 2 / 8640 - w_1 ** 4 * w_6 * w_7 / 2880 - w_1 ** 4 * w_7 ** 2 / 8640 - w_1 ** 2 * w_2 ** 4 / 8640 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_6 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_7 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 * w_6 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 * w_7 / 576 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_5 * w_6 / 576 + w_1 ** 2 * w_2 ** 2 * w_5 * w_7 / 576 + w_1 ** 2 * w_2 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_6 * w_7 / 576 + w_1 ** 2 * w_2 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_6 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_7 / 576 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 / 192 + w_1 ** 2 * w_2 * w_3 * w_4 * w_6 / 192 + w_1 ** 2 * w_2 * w_3 * w_4 * w_7 / 192 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_5 * w_6 / 192 + w_1 ** 2 * w_2 * w_3 * w_5 * w_7 / 192 + w_1 ** 2 * w_2 * w_3 * w_6 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_6 * w_7 / 192 + w_1 ** 2 * w_2 * w_3 * w_7 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_6 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_7 / 576 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 * w_5 * w_6 / 192 + w_1 ** 2 * w_2 * w_4 * w_5 * w_7 / 192 + w_1 ** 2 * w_2 * w_4 * w_6 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 * w_6 * w_7 / 192 + w_1 ** 2 * w_2 * w_4 * w_7 ** 2 / 576 + w_1 ** 2 * w_2 * w_5 ** 2 * w_6 / 576 + w_1 ** 2 * w_2 * w_5 ** 2 * w_7 / 576 + w_1 ** 2 * w_2 * w_5 * w_6 ** 2 / 576 + w_1 ** 2 * w_2 * w_5 * w_6 * w_7 / 192 + w_1 ** 2 * w_2 * w_5 * w_7 ** 2 / 576 + w_1 ** 2 * w_2 * w_6 ** 2 * w_7 / 576 + w_1 ** 2 * w_2 * w_6 * w_7 ** 2 / 576 - w_1 ** 2 * w_3 ** 4 / 8640 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 / 576 + w_1 ** 2 * w_3 ** 2 * w_4 * w_6 / 576 + w_1 ** 2 * w_3 ** 2 * w_4 * w_7 / 576 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_5 * w_6 / 576 + w_1 ** 2 * w_3 ** 2 * w_5 * w_7 / 576 + w_1 ** 2 * w_3 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_6 * w_7 / 576 + w_1 ** 2 * w_3 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 / 576 + w_1 ** 2 * w_3 * w_4 ** 2 * w_6 / 576 + w_1 ** 2 * w_3 * w_4 ** 2 * w_7 / 576 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 / 576 + w_1 ** 2 * w_3 * w_4 * w_5 * w_6 / 192 + w_1 ** 2 * w_3 * w_4 * w_5 * w_7 / 192 + w_1 ** 2 * w_3 * w_4 * w_6 ** 2 / 576 + w_1 ** 2 * w_3 * w_4 * w_6 * w_7 / 192 + w_1 ** 2 * w_3 * w_4 * w_7 ** 2 / 576 + w_1 ** 2 * w_3 * w_5 ** 2 * w_6 / 576 + w_1 ** 2 * w_3 * w_5 ** 2 * w_7 / 576 + w_1 ** 2 * w_3 * w_5 * w_6 ** 2 / 576 + w_1 ** 2 * w_3 * w_5 * w_6 * w_7 / 192 + w_1 ** 2 * w_3 * w_5 * w_7 ** 2 / 576 + w_1 ** 2 * w_3 * w_6 ** 2 * w_7 / 576 + w_1 ** 2 * w_3 * w_6 * w_7 ** 2 / 576 - w_1 ** 2 * w_4 ** 4 / 8640 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_4 ** 2 * w_5 * w_6 / 576 + w_1 ** 2 * w_4 ** 2 * w_5 * w_7 / 576 + w_1 ** 2 * w_4 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_4 ** 2 * w_6 * w_7 / 576 + w_1 ** 2 * w_4 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_4 * w_5 ** 2 * w_6 / 576 + w_1 ** 2 * w_4 * w_5 ** 2 * w_7 / 576 + w_1 ** 2 * w_4 * w_5 * w_6 ** 2 / 576 + w_1 ** 2 * w_4 * w_5 * w_6 * w_7 / 192 + w_1 ** 2 * w_4 * w_5 * w_7 ** 2 / 576 + w_1 ** 2 * w_4 * w_6 ** 2 * w_7 / 576 + w_1 ** 2 * w_4 * w_6 * w_7 ** 2 / 576 - w_1 ** 2 * w_5 ** 4 / 8640 + w_1 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_5 ** 2 * w_6 * w_7 / 576 + w_1 ** 2 * w_5 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_5 * w_6 ** 2 * w_7 / 576 + w_1 ** 2 * w_5 * w_6 * w_7 ** 2 / 576 - w_1 ** 2 * w_6 ** 4 / 8640 + w_1 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 - w_1 ** 2 * w_7 ** 4 / 8640 - w_1 * w_2 ** 4 * w_3 / 2880 - w_1 * w_2 ** 4 * w_4 / 2880 - w_1 * w_2 ** 4 * w_5 / 2880 - w_1 * w_2 ** 4 * w_6 / 2880 - w_1 * w_2 ** 4 * w_7 / 2880 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_6 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_7 / 576 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 / 192 + w_1 * w_2 ** 2 * w_3 * w_4 * w_6 / 192 + w_1 * w_2 ** 2 * w_3 * w_4 * w_7 / 192 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_5 * w_6 / 192 + w_1 * w_2 ** 2 * w_3 * w_5 * w_7 / 192 + w_1 * w_2 ** 2 * w_3 * w_6 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_6 * w_7 / 192 + w_1 * w_2 ** 2 * w_3 * w_7 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_6 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_7 / 576 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 * w_5 * w_6 / 192 + w_1 * w_2 ** 2 * w_4 * w_5 * w_7 / 192 + w_1 * w_2 ** 2 * w_4 * w_6 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 * w_6 * w_7 / 192 + w_1 * w_2 ** 2 * w_4 * w_7 ** 2 / 576 + w_1 * w_2 ** 2 * w_5 ** 2 * w_6 / 576 + w_1 * w_2 ** 2 * w_5 ** 2 * w_7 / 576 + w_1 * w_2 ** 2 * w_5 * w_6 ** 2 / 576 + w_1 * w_2 ** 2 * w_5 * w_6 * w_7 / 192 + w_1 * w_2 ** 2 * w_5 * w_7 ** 2 / 576 + w_1 * w_2 ** 2 * w_6 ** 2 * w_7 / 576 + w_1 * w_2 ** 2 * w_6 * w_7 ** 2 / 576 - w_1 * w_2 * w_3 ** 4 / 2880 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 / 192 + w_1 * w_2 * w_3 ** 2 * w_4 * w_6 / 192 + w_1 * w_2 * w_3 ** 2 * w_4 * w_7 / 192 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_5 * w_6 / 192 + w_1 * w_2 * w_3 ** 2 * w_5 * w_7 / 192 + w_1 * w_2 * w_3 ** 2 * w_6 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_6 * w_7 / 192 + w_1 * w_2 * w_3 ** 2 * w_7 ** 2 / 576 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 / 192 + w_1 * w_2 * w_3 * w_4 ** 2 * w_6 / 192 + w_1 * w_2 * w_3 * w_4 ** 2 * w_7 / 192 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 / 192 + w_1 * w_2 * w_3 * w_4 * w_5 * w_6 / 64 + w_1 * w_2 * w_3 * w_4 * w_5 * w_7 / 64 + w_1 * w_2 * w_3 * w_4 * w_6 ** 2 / 192 + w_1 * w_2 * w_3 * w_4 * w_6 * w_7 / 64 + w_1 * w_2 * w_3 * w_4 * w_7 ** 2 / 192 + w_1 * w_2 * w_3 * w_5 ** 2 * w_6 / 192 + w_1 * w_2 * w_3 * w_5 ** 2 * w_7 / 192 + w_1 * w_2 * w_3 * w_5 * w_6 ** 2 / 192 + w_1 * w_2 * w_3 * w_5 * w_6 * w_7 / 64 + w_1 * w_2 * w_3 * w_5 * w_7 ** 2 / 192 + w_1 * w_2 * w_3 * w_6 ** 2 * w_7 / 192 + w_1 * w_2 * w_3 * w_6 * w_7 ** 2 / 192 - w_1 * w_2 * w_4 ** 4 / 2880 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 / 576 + w_1 * w_2 * w_4 ** 2 * w_5 * w_6 / 192 + w_1 * w_2 * w_4 ** 2 * w_5 * w_7 / 192 + w_1 * w_2 * w_4 ** 2 * w_6 ** 2 / 576 + w_1 * w_2 * w_4 ** 2 * w_6 * w_7 / 192 + w_1 * w_2 * w_4 ** 2 * w_7 ** 2 / 576 + w_1 * w_2 * w_4 * w_5 ** 2 * w_6 / 192 + w_1 * w_2 * w_4 * w_5 ** 2 * w_7 / 192 + w_1 * w_2 * w_4 * w_5 * w_6 ** 2 / 192 + w_1 * w_2 * w_4 * w_5 * w_6 * w_7 / 64 + w_1 * w_2 * w_4 * w_5 * w_7 ** 2 / 192 + w_1 * w_2 * w_4 * w_6 ** 2 * w_7 / 192 + w_1 * w_2 * w_4 * w_6 * w_7 ** 2 / 192 - w_1 * w_2 * w_5 ** 4 / 2880 + w_1 * w_2 * w_5 ** 2 * w_6 ** 2 / 576 + w_1 * w_2 * w_5 ** 2 * w_6 * w_7 / 192 + w_1 * w_2 * w_5 ** 2 * w_7 ** 2 / 576 + w_1 * w_2 * w_5 * w_6 ** 2 * w_7 / 192 + w_1 * w_2 * w_5 * w_6 * w_7 ** 2 / 192 - w_1 * w_2 * w_6 ** 4 / 2880 + w_1 * w_2 * w_6 ** 2 * w_7 ** 2 / 576 - w_1 * w_2 * w_7 ** 4 / 2880 - w_1 * w_3 ** 4 * w_4 / 2880 - w_1 * w_3 ** 4 * w_5 / 2880 - w_1 * w_3 ** 4 * w_6 / 2880 - w_1 * w_3 ** 4 * w_7 / 2880 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 / 576 + w_1 * w_3 ** 2 * w_4 ** 2 * w_6 / 576 + w_1 * w_3 ** 2 * w_4 ** 2 * w_7 / 576 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 / 576 + w_1 * w_3 ** 2 * w_4 * w_5 * w_6 / 192 + w_1 * w_3 ** 2 * w_4 * w_5 * w_7 / 192 + w_1 * w_3 ** 2 * w_4 * w_6 ** 2 / 576 + w_1 * w_3 ** 2 * w_4 * w_6 * w_7 / 192 + w_1 * w_3 ** 2 * w_4 * w_7 ** 2 / 576 + w_1 * w_3 ** 2 * w_5 ** 2 * w_6 / 576 + w_1 * w_3 ** 2 * w_5 ** 2 * w_7 / 576 + w_1 * w_3 ** 2 * w_5 * w_6 ** 2 / 576 + w_1 * w_3 ** 2 * w_5 * w_6 * w_7 / 192 + w_1 * w_3 ** 2 * w_5 * w_7 ** 2 / 576 + w_1 * w_3 ** 2 * w_6 ** 2 * w_7 / 576 + w_1 * w_3 ** 2 * w_6 * w_7 ** 2 / 576 - w_1 * w_3 * w_4 ** 4 / 2880 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 / 576 + w_1 * w_3 * w_4 ** 2 * w_5 * w_6 / 192 + w_1 * w_3 * w_4 ** 2 * w_5 * w_7 / 192 + w_1 * w_3 * w_4 ** 2 * w_6 ** 2 / 576 + w_1 * w_3 * w_4 ** 2 * w_6 * w_7 / 192 + w_1 * w_3 * w_4 ** 2 * w_7 ** 2 / 576 + w_1 * w_3 * w_4 * w_5 ** 2 * w_6 / 192 + w_1 * w_3 * w_4 * w_5 ** 2 * w_7 / 192 + w_1 * w_3 * w_4 * w_5 * w_6 ** 2 / 192 + w_1 * w_3 * w_4 * w_5 * w_6 * w_7 / 64 + w_1 * w_3 * w_4 * w_5 * w_7 ** 2 / 192 + w_1 * w_3 * w_4 * w_6 ** 2 * w_7 / 192 + w_1 * w_3 * w_4 * w_6 * w_7 ** 2 / 192 - w_1 * w_3 * w_5 ** 4 / 2880 + w_1 * w_3 * w_5 ** 2 * w_6 ** 2 / 576 + w_1 * w_3 * w_5 ** 2 * w_6 * w_7 / 192 + w_1 * w_3 * w_5 ** 2 * w_7 ** 2 / 576 + w_1 * w_3 * w_5 * w_6 ** 2 * w_7 / 192 + w_1 * w_3 * w_5 * w_6 * w_7 ** 2 / 192 - w_1 * w_3 * w_6 ** 4 / 2880 + w_1 * w_3 * w_6 ** 2 * w_7 ** 2 / 576 - w_1 * w_3 * w_7 ** 4 / 2880 - w_1 * w_4 ** 4 * w_5 / 2880 - w_1 * w_4 ** 4 * w_6 / 2880 - w_1 * w_4 ** 4 * w_7 / 2880 + w_1 * w_4 ** 2 * w_5 ** 2 * w_6 / 576 + w_1 * w_4 ** 2 * w_5 ** 2 * w_7 / 576 + w_1 * w_4 ** 2 * w_5 * w_6 ** 2 / 576 + w_1 * w_4 ** 2 * w_5 * w_6 * w_7 / 192 + w_1 * w_4 ** 2 * w_5 * w_7 ** 2 / 576 + w_1 * w_4 ** 2 * w_6 ** 2 * w_7 / 576 + w_1 * w_4 ** 2 * w_6 * w_7 ** 2 / 576 - w_1 * w_4 * w_5 ** 4 / 2880 + w_1 * w_4 * w_5 ** 2 * w_6 ** 2 / 576 + w_1 * w_4 * w_5 ** 2 * w_6 * w_7 / 192 + w_1 * w_4 * w_5 ** 2 * w_7 ** 2 / 576 + w_1 * w_4 * w_5 * w_6 ** 2 * w_7 / 192 + w_1 * w_4 * w_5 * w_6 * w_7 ** 2 / 192 - w_1 * w_4 * w_6 ** 4 / 2880 + w_1 * w_4 * w_6 ** 2 * w_7 ** 2 / 576 - w_1 * w_4 * w_7 ** 4 / 2880 - w_1 * w_5 ** 4 * w_6 / 2880 - w_1 * w_5 ** 4 * w_7 / 2880 + w_1 * w_5 ** 2 * w_6 ** 2 * w_7 / 576 + w_1 * w_5 ** 2 * w_6 * w_7 ** 2 / 576 - w_1 * w_5 * w_6 ** 4 / 2880 + w_1 * w_5 * w_6 ** 2 * w_7 ** 2 / 576 - w_1 * w_5 * w_7 ** 4 / 2880 - w_1 * w_6 ** 4 * w_7 / 2880 - w_1 * w_6 * w_7 ** 4 / 2880 + w_2 ** 6 / 30240 - w_2 ** 4 * w_3 ** 2 / 8640 - w_2 ** 4 * w_3 * w_4 / 2880 - w_2 ** 4 * w_3 * w_5 / 2880 - w_2 ** 4 * w_3 * w_6 / 2880 - w_2 ** 4 * w_3 * w_7 / 2880 - w_2 ** 4 * w_4 ** 2 / 8640 - w_2 ** 4 * w_4 * w_5 / 2880 - w_2 ** 4 * w_4 * w_6 / 2880 - w_2 ** 4 * w_4 * w_7 / 2880 - w_2 ** 4 * w_5 ** 2 / 8640 - w_2 ** 4 * w_5 * w_6 / 2880 - w_2 ** 4 * w_5 * w_7 / 2880 - w_2 ** 4 * w_6 ** 2 / 8640 - w_2 ** 4 * w_6 * w_7 / 2880 - w_2 ** 4 * w_7 ** 2 / 8640 - w_2 ** 2 * w_3 ** 4 / 8640 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 576 + w_2 ** 2 * w_3 ** 2 * w_4 * w_6 / 576 + w_2 ** 2 * w_3 ** 2 * w_4 * w_7 / 576 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_5 * w_6 / 576 + w_2 ** 2 * w_3 ** 2 * w_5 * w_7 / 576 + w_2 ** 2 * w_3 ** 2 * w_6 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_6 * w_7 / 576 + w_2 ** 2 * w_3 ** 2 * w_7 ** 2 / 1728 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 576 + w_2 ** 2 * w_3 * w_4 ** 2 * w_6 / 576 + w_2 ** 2 * w_3 * w_4 ** 2 * w_7 / 576 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 576 + w_2 ** 2 * w_3 * w_4 * w_5 * w_6 / 192 + w_2 ** 2 * w_3 * w_4 * w_5 * w_7 / 192 + w_2 ** 2 * w_3 * w_4 * w_6 ** 2 / 576 + w_2 ** 2 * w_3 * w_4 * w_6 * w_7 / 192 + w_2 ** 2 * w_3 * w_4 * w_7 ** 2 / 576 + w_2 ** 2 * w_3 * w_5 ** 2 * w_6 / 576 + w_2 ** 2 * w_3 * w_5 ** 2 * w_7 / 576 + w_2 ** 2 * w_3 * w_5 * w_6 ** 2 / 576 + w_2 ** 2 * w_3 * w_5 * w_6 * w_7 / 192 + w_2 ** 2 * w_3 * w_5 * w_7 ** 2 / 576 + w_2 ** 2 * w_3 * w_6 ** 2 * w_7 / 576 + w_2 ** 2 * w_3 * w_6 * w_7 ** 2 / 576 - w_2 ** 2 * w_4 ** 4 / 8640 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 + w_2 ** 2 * w_4 ** 2 * w_5 * w_6 / 576 + w_2 ** 2 * w_4 ** 2 * w_5 * w_7 / 576 + w_2 ** 2 * w_4 ** 2 * w_6 ** 2 / 1728 + w_2 ** 2 * w_4 ** 2 * w_6 * w_7 / 576 + w_2 ** 2 * w_4 ** 2 * w_7 ** 2 / 1728 + w_2 ** 2 * w_4 * w_5 ** 2 * w_6 / 576 + w_2 ** 2 * w_4 * w_5 ** 2 * w_7 / 576 + w_2 ** 2 * w_4 * w_5 * w_6 ** 2 / 576 + w_2 ** 2 * w_4 * w_5 * w_6 * w_7 / 192 + w_2 ** 2 * w_4 * w_5 * w_7 ** 2 / 576 + w_2 ** 2 * w_4 * w_6 ** 2 * w_7 / 576 + w_2 ** 2 * w_4 * w_6 * w_7 ** 2 / 576 - w_2 ** 2 * w_5 ** 4 / 8640 + w_2 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 + w_2 ** 2 * w_5 ** 2 * w_6 * w_7 / 576 + w_2 ** 2 * w_5 ** 2 * w_7 ** 2 / 1728 + w_2 ** 2 * w_5 * w_6 ** 2 * w_7 / 576 + w_2 ** 2 * w_5 * w_6 * w_7 ** 2 / 576 - w_2 ** 2 * w_6 ** 4 / 8640 + w_2 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 - w_2 ** 2 * w_7 ** 4 / 8640 - w_2 * w_3 ** 4 * w_4 / 2880 - w_2 * w_3 ** 4 * w_5 / 2880 - w_2 * w_3 ** 4 * w_6 / 2880 - w_2 * w_3 ** 4 * w_7 / 2880 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 576 + w_2 * w_3 ** 2 * w_4 ** 2 * w_6 / 576 + w_2 * w_3 ** 2 * w_4 ** 2 * w_7 / 576 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 576 + w_2 * w_3 ** 2 * w_4 * w_5 * w_6 / 192 + w_2 * w_3 ** 2 * w_4 * w_5 * w_7 / 192 + w_2 * w_3 ** 2 * w_4 * w_6 ** 2 / 576 + w_2 * w_3 ** 2 * w_4 * w_6 * w_7 / 192 + w_2 * w_3 ** 2 * w_4 * w_7 ** 2 / 576 + w_2 * w_3 ** 2 * w_5 ** 2 * w_6 / 576 + w_2 * w_3 ** 2 * w_5 ** 2 * w_7 / 576 + w_2 * w_3 ** 2 * w_5 * w_6 ** 2 / 576 + w_2 * w_3 ** 2 * w_5 * w_6 * w_7 / 192 + w_2 * w_3 ** 2 * w_5 * w_7 ** 2 / 576 + w_2 * w_3 ** 2 * w_6 ** 2 * w_7 / 576 + w_2 * w_3 ** 2 * w_6 * w_7 ** 2 / 576 - w_2 * w_3 * w_4 ** 4 / 2880 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 576 + w_2 * w_3 * w_4 ** 2 * w_5 * w_6 / 192 + w_2 * w_3 * w_4 ** 2 * w_5 * w_7 / 192 + w_2 * w_3 * w_4 ** 2 * w_6 ** 2 / 576 + w_2 * w_3 * w_4 ** 2 * w_6 * w_7 / 192 + w_2 * w_3 * w_4 ** 2 * w_7 ** 2 / 576 + w_2 * w_3 * w_4 * w_5 ** 2 * w_6 / 192 + w_2 * w_3 * w_4 * w_5 ** 2 * w_7 / 192 + w_2 * w_3 * w_4 * w_5 * w_6 ** 2 / 192 + w_2 * w_3 * w_4 * w_5 * w_6 * w_7 / 64 + w_2 * w_3 * w_4 * w_5 * w_7 ** 2 / 192 + w_2 * w_3 * w_4 * w_6 ** 2 * w_7 / 192 + w_2 * w_3 * w_4 * w_6 * w_7 ** 2 / 192 - w_2 * w_3 * w_5 ** 4 / 2880 + w_2 * w_3 * w_5 ** 2 * w_6 ** 2 / 576 + w_2 * w_3 * w_5 ** 2 * w_6 * w_7 / 192 + w_2 * w_3 * w_5 ** 2 * w_7 ** 2 / 576 + w_2 * w_3 * w_5 * w_6 ** 2 * w_7 / 192 + w_2 * w_3 * w_5 * w_6 * w_7 ** 2 / 192 - w_2 * w_3 * w_6 ** 4 / 2880 + w_2 * w_3 * w_6 ** 2 * w_7 ** 2 / 576 - w_2 * w_3 * w_7 ** 4 / 2880 - w_2 * w_4 ** 4 * w_5 / 2880 - w_2 * w_4 ** 4 * w_6 / 2880 - w_2 * w_4 ** 4 * w_7 / 2880 + w_2 * w_4 ** 2 * w_5 ** 2 * w_6 / 576 + w_2 * w_4 ** 2 * w_5 ** 2 * w_7 / 576 + w_2 * w_4 ** 2 * w_5 * w_6 ** 2 / 576 + w_2 * w_4 ** 2 * w_5 * w_6 * w_7 / 192 + w_2 * w_4 ** 2 * w_5 * w_7 ** 2 / 576 + w_2 * w_4 ** 2 * w_6 ** 2 * w_7 / 576 + w_2 * w_4 ** 2 * w_6 * w_7 ** 2 / 576 - w_2 * w_4 * w_5 ** 4 / 2880 + w_2 * w_4 * w_5 ** 2 * w_6 ** 2 / 576 + w_2 * w_4 * w_5 ** 2 * w_6 * w_7 / 192 + w_2 * w_4 * w_5 ** 2 * w_7 ** 2 / 576 + w_2 * w_4 * w_5 * w_6 ** 2 * w_7 / 192 + w_2 * w_4 * w_5 * w_6 * w_7 ** 2 / 192 - w_2 * w_4 * w_6 ** 4 / 2880 + w_2 * w_4 * w_6 ** 2 * w_7 ** 2 / 576 - w_2 * w_4 * w_7 ** 4 / 2880 - w_2 * w_5 ** 4 * w_6 / 2880 - w_2 * w_5 ** 4 * w_7 / 2880 + w_2 * w_5 ** 2 * w_6 ** 2 * w_7 / 576 + w_2 * w_5 ** 2 * w_6 * w_7 ** 2 / 576 - w_2 * w_5 * w_6 ** 4 / 2880 + w_2 * w_5 * w_6 ** 2 * w_7 ** 2 / 576 - w_2 * w_5 * w_7 ** 4 / 2880 - w_2 * w_6 ** 4 * w_7 / 2880 - w_2 * w_6 * w_7 ** 4 / 2880 + w_3 ** 6 / 30240 - w_3 ** 4 * w_4 ** 2 / 8640 - w_3 ** 4 * w_4 * w_5 / 2880 - w_3 ** 4 * w_4 * w_6 / 2880 - w_3 ** 4 * w_4 * w_7 / 2880 - w_3 ** 4 * w_5 ** 2 / 8640 - w_3 ** 4 * w_5 * w_6 / 2880 - w_3 ** 4 * w_5 * w_7 / 2880 - w_3 ** 4 * w_6 ** 2 / 8640 - w_3 ** 4 * w_6 * w_7 / 2880 - w_3 ** 4 * w_7 ** 2 / 8640 - w_3 ** 2 * w_4 ** 4 / 8640 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 + w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 576 + w_3 ** 2 * w_4 ** 2 * w_5 * w_7 / 576 + w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 1728 + w_3 ** 2 * w_4 ** 2 * w_6 * w_7 / 576 + w_3 ** 2 * w_4 ** 2 * w_7 ** 2 / 1728 + w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 576 + w_3 ** 2 * w_4 * w_5 ** 2 * w_7 / 576 + w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 576 + w_3 ** 2 * w_4 * w_5 * w_6 * w_7 / 192 + w_3 ** 2 * w_4 * w_5 * w_7 ** 2 / 576 + w_3 ** 2 * w_4 * w_6 ** 2 * w_7 / 576 + w_3 ** 2 * w_4 * w_6 * w_7 ** 2 / 576 - w_3 ** 2 * w_5 ** 4 / 8640 + w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 + w_3 ** 2 * w_5 ** 2 * w_6 * w_7 / 576 + w_3 ** 2 * w_5 ** 2 * w_7 ** 2 / 1728 + w_3 ** 2 * w_5 * w_6 ** 2 * w_7 / 576 + w_3 ** 2 * w_5 * w_6 * w_7 ** 2 / 576 - w_3 ** 2 * w_6 ** 4 / 8640 + w_3 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 - w_3 ** 2 * w_7 ** 4 / 8640 - w_3 * w_4 ** 4 * w_5 / 2880 - w_3 * w_4 ** 4 * w_6 / 2880 - w_3 * w_4 ** 4 * w_7 / 2880 + w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 576 + w_3 * w_4 ** 2 * w_5 ** 2 * w_7 / 576 + w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 576 + w_3 * w_4 ** 2 * w_5 * w_6 * w_7 / 192 + w_3 * w_4 ** 2 * w_5 * w_7 ** 2 / 576 + w_3 * w_4 ** 2 * w_6 ** 2 * w_7 / 576 + w_3 * w_4 ** 2 * w_6 * w_7 ** 2 / 576 - w_3 * w_4 * w_5 ** 4 / 2880 + w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 576 + w_3 * w_4 * w_5 ** 2 * w_6 * w_7 / 192 + w_3 * w_4 * w_5 ** 2 * w_7 ** 2 / 576 + w_3 * w_4 * w_5 * w_6 ** 2 * w_7 / 192 + w_3 * w_4 * w_5 * w_6 * w_7 ** 2 / 192 - w_3 * w_4 * w_6 ** 4 / 2880 + w_3 * w_4 * w_6 ** 2 * w_7 ** 2 / 576 - w_3 * w_4 * w_7 ** 4 / 2880 - w_3 * w_5 ** 4 * w_6 / 2880 - w_3 * w_5 ** 4 * w_7 / 2880 + w_3 * w_5 ** 2 * w_6 ** 2 * w_7 / 576 + w_3 * w_5 ** 2 * w_6 * w_7 ** 2 / 576 - w_3 * w_5 * w_6 ** 4 / 2880 + w_3 * w_5 * w_6 ** 2 * w_7 ** 2 / 576 - w_3 * w_5 * w_7 ** 4 / 2880 - w_3 * w_6 ** 4 * w_7 / 2880 - w_3 * w_6 * w_7 ** 4 / 2880 + w_4 ** 6 / 30240 - w_4 ** 4 * w_5 ** 2 / 8640 - w_4 ** 4 * w_5 * w_6 / 2880 - w_4 ** 4 * w_5 * w_7 / 2880 - w_4 ** 4 * w_6 ** 2 / 8640 - w_4 ** 4 * w_6 * w_7 / 2880 - w_4 ** 4 * w_7 ** 2 / 8640 - w_4 ** 2 * w_5 ** 4 / 8640 + w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 + w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 576 + w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 1728 + w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 576 + w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 576 - w_4 ** 2 * w_6 ** 4 / 8640 + w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 - w_4 ** 2 * w_7 ** 4 / 8640 - w_4 * w_5 ** 4 * w_6 / 2880 - w_4 * w_5 ** 4 * w_7 / 2880 + w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 576 + w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 576 - w_4 * w_5 * w_6 ** 4 / 2880 + w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 576 - w_4 * w_5 * w_7 ** 4 / 2880 - w_4 * w_6 ** 4 * w_7 / 2880 - w_4 * w_6 * w_7 ** 4 / 2880 + w_5 ** 6 / 30240 - w_5 ** 4 * w_6 ** 2 / 8640 - w_5 ** 4 * w_6 * w_7 / 2880 - w_5 ** 4 * w_7 ** 2 / 8640 - w_5 ** 2 * w_6 ** 4 / 8640 + w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 - w_5 ** 2 * w_7 ** 4 / 8640 - w_5 * w_6 ** 4 * w_7 / 2880 - w_5 * w_6 * w_7 ** 4 / 2880 + w_6 ** 6 / 30240 - w_6 ** 4 * w_7 ** 2 / 8640 - w_6 ** 2 * w_7 ** 4 / 8640 + w_7 ** 6 / 30240
-    if s == 7 and ln == 6:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        return w_1 ** 6 * w_2 / 60480 + w_1 ** 6 * w_3 / 60480 + w_1 ** 6 * w_4 / 60480 + w_1 ** 6 * w_5 / 60480 + w_1 ** 6 * w_6 / 60480 - w_1 ** 4 * w_2 ** 2 * w_3 / 17280 - w_1 ** 4 * w_2 ** 2 * w_4 / 17280 - w_1 ** 4 * w_2 ** 2 * w_5 / 17280 - w_1 ** 4 * w_2 ** 2 * w_6 / 17280 - w_1 ** 4 * w_2 * w_3 ** 2 / 17280 - w_1 ** 4 * w_2 * w_3 * w_4 / 5760 - w_1 ** 4 * w_2 * w_3 * w_5 / 5760 - w_1 ** 4 * w_2 * w_3 * w_6 / 5760 - w_1 ** 4 * w_2 * w_4 ** 2 / 17280 - w_1 ** 4 * w_2 * w_4 * w_5 / 5760 - w_1 ** 4 * w_2 * w_4 * w_6 / 5760 - w_1 ** 4 * w_2 * w_5 ** 2 / 17280 - w_1 ** 4 * w_2 * w_5 * w_6 / 5760 - w_1 ** 4 * w_2 * w_6 ** 2 / 17280 - w_1 ** 4 * w_3 ** 2 * w_4 / 17280 - w_1 ** 4 * w_3 ** 2 * w_5 / 17280 - w_1 ** 4 * w_3 ** 2 * w_6 / 17280 - w_1 ** 4 * w_3 * w_4 ** 2 / 17280 - w_1 ** 4 * w_3 * w_4 * w_5 / 5760 - w_1 ** 4 * w_3 * w_4 * w_6 / 5760 - w_1 ** 4 * w_3 * w_5 ** 2 / 17280 - w_1 ** 4 * w_3 * w_5 * w_6 / 5760 - w_1 ** 4 * w_3 * w_6 ** 2 / 17280 - w_1 ** 4 * w_4 ** 2 * w_5 / 17280 - w_1 ** 4 * w_4 ** 2 * w_6 / 17280 - w_1 ** 4 * w_4 * w_5 ** 2 / 17280 - w_1 ** 4 * w_4 * w_5 * w_6 / 5760 - w_1 ** 4 * w_4 * w_6 ** 2 / 17280 - w_1 ** 4 * w_5 ** 2 * w_6 / 17280 - w_1 ** 4 * w_5 * w_6 ** 2 / 17280 - w_1 ** 2 * w_2 ** 4 * w_3 / 17280 - w_1 ** 2 * w_2 ** 4 * w_4 / 17280 - w_1 ** 2 * w_2 ** 4 * w_5 / 17280 - w_1 ** 2 * w_2 ** 4 * w_6 / 17280 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_6 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_6 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 * w_6 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_6 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 * w_6 / 1152 + w_1 ** 2 * w_2 ** 2 * w_4 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 * w_6 / 3456 + w_1 ** 2 * w_2 ** 2 * w_5 * w_6 ** 2 / 3456 - w_1 ** 2 * w_2 * w_3 ** 4 / 17280 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_6 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 * w_6 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_6 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 * w_6 / 384 + w_1 ** 2 * w_2 * w_3 * w_4 * w_6 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 * w_6 / 1152 + w_1 ** 2 * w_2 * w_3 * w_5 * w_6 ** 2 / 1152 - w_1 ** 2 * w_2 * w_4 ** 4 / 17280 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 * w_6 / 1152 + w_1 ** 2 * w_2 * w_4 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 * w_6 / 1152 + w_1 ** 2 * w_2 * w_4 * w_5 * w_6 ** 2 / 1152 - w_1 ** 2 * w_2 * w_5 ** 4 / 17280 + w_1 ** 2 * w_2 * w_5 ** 2 * w_6 ** 2 / 3456 - w_1 ** 2 * w_2 * w_6 ** 4 / 17280 - w_1 ** 2 * w_3 ** 4 * w_4 / 17280 - w_1 ** 2 * w_3 ** 4 * w_5 / 17280 - w_1 ** 2 * w_3 ** 4 * w_6 / 17280 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 / 1152 + w_1 ** 2 * w_3 ** 2 * w_4 * w_6 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 / 3456 + w_1 ** 2 * w_3 ** 2 * w_5 * w_6 ** 2 / 3456 - w_1 ** 2 * w_3 * w_4 ** 4 / 17280 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 3456 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 / 1152 + w_1 ** 2 * w_3 * w_4 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 / 1152 + w_1 ** 2 * w_3 * w_4 * w_5 * w_6 ** 2 / 1152 - w_1 ** 2 * w_3 * w_5 ** 4 / 17280 + w_1 ** 2 * w_3 * w_5 ** 2 * w_6 ** 2 / 3456 - w_1 ** 2 * w_3 * w_6 ** 4 / 17280 - w_1 ** 2 * w_4 ** 4 * w_5 / 17280 - w_1 ** 2 * w_4 ** 4 * w_6 / 17280 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 3456 + w_1 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 3456 - w_1 ** 2 * w_4 * w_5 ** 4 / 17280 + w_1 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 3456 - w_1 ** 2 * w_4 * w_6 ** 4 / 17280 - w_1 ** 2 * w_5 ** 4 * w_6 / 17280 - w_1 ** 2 * w_5 * w_6 ** 4 / 17280 + w_1 * w_2 ** 6 / 60480 - w_1 * w_2 ** 4 * w_3 ** 2 / 17280 - w_1 * w_2 ** 4 * w_3 * w_4 / 5760 - w_1 * w_2 ** 4 * w_3 * w_5 / 5760 - w_1 * w_2 ** 4 * w_3 * w_6 / 5760 - w_1 * w_2 ** 4 * w_4 ** 2 / 17280 - w_1 * w_2 ** 4 * w_4 * w_5 / 5760 - w_1 * w_2 ** 4 * w_4 * w_6 / 5760 - w_1 * w_2 ** 4 * w_5 ** 2 / 17280 - w_1 * w_2 ** 4 * w_5 * w_6 / 5760 - w_1 * w_2 ** 4 * w_6 ** 2 / 17280 - w_1 * w_2 ** 2 * w_3 ** 4 / 17280 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_6 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 * w_6 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_6 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_6 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 * w_6 / 384 + w_1 * w_2 ** 2 * w_3 * w_4 * w_6 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 * w_6 / 1152 + w_1 * w_2 ** 2 * w_3 * w_5 * w_6 ** 2 / 1152 - w_1 * w_2 ** 2 * w_4 ** 4 / 17280 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 3456 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 * w_6 / 1152 + w_1 * w_2 ** 2 * w_4 ** 2 * w_6 ** 2 / 3456 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 * w_6 / 1152 + w_1 * w_2 ** 2 * w_4 * w_5 * w_6 ** 2 / 1152 - w_1 * w_2 ** 2 * w_5 ** 4 / 17280 + w_1 * w_2 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 - w_1 * w_2 ** 2 * w_6 ** 4 / 17280 - w_1 * w_2 * w_3 ** 4 * w_4 / 5760 - w_1 * w_2 * w_3 ** 4 * w_5 / 5760 - w_1 * w_2 * w_3 ** 4 * w_6 / 5760 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_6 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 * w_6 / 384 + w_1 * w_2 * w_3 ** 2 * w_4 * w_6 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 * w_6 / 1152 + w_1 * w_2 * w_3 ** 2 * w_5 * w_6 ** 2 / 1152 - w_1 * w_2 * w_3 * w_4 ** 4 / 5760 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 1152 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 * w_6 / 384 + w_1 * w_2 * w_3 * w_4 ** 2 * w_6 ** 2 / 1152 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 * w_6 / 384 + w_1 * w_2 * w_3 * w_4 * w_5 * w_6 ** 2 / 384 - w_1 * w_2 * w_3 * w_5 ** 4 / 5760 + w_1 * w_2 * w_3 * w_5 ** 2 * w_6 ** 2 / 1152 - w_1 * w_2 * w_3 * w_6 ** 4 / 5760 - w_1 * w_2 * w_4 ** 4 * w_5 / 5760 - w_1 * w_2 * w_4 ** 4 * w_6 / 5760 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 * w_6 / 1152 + w_1 * w_2 * w_4 ** 2 * w_5 * w_6 ** 2 / 1152 - w_1 * w_2 * w_4 * w_5 ** 4 / 5760 + w_1 * w_2 * w_4 * w_5 ** 2 * w_6 ** 2 / 1152 - w_1 * w_2 * w_4 * w_6 ** 4 / 5760 - w_1 * w_2 * w_5 ** 4 * w_6 / 5760 - w_1 * w_2 * w_5 * w_6 ** 4 / 5760 + w_1 * w_3 ** 6 / 60480 - w_1 * w_3 ** 4 * w_4 ** 2 / 17280 - w_1 * w_3 ** 4 * w_4 * w_5 / 5760 - w_1 * w_3 ** 4 * w_4 * w_6 / 5760 - w_1 * w_3 ** 4 * w_5 ** 2 / 17280 - w_1 * w_3 ** 4 * w_5 * w_6 / 5760 - w_1 * w_3 ** 4 * w_6 ** 2 / 17280 - w_1 * w_3 ** 2 * w_4 ** 4 / 17280 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 3456 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 1152 + w_1 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 3456 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 1152 + w_1 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 1152 - w_1 * w_3 ** 2 * w_5 ** 4 / 17280 + w_1 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 - w_1 * w_3 ** 2 * w_6 ** 4 / 17280 - w_1 * w_3 * w_4 ** 4 * w_5 / 5760 - w_1 * w_3 * w_4 ** 4 * w_6 / 5760 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 1152 + w_1 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 1152 - w_1 * w_3 * w_4 * w_5 ** 4 / 5760 + w_1 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 1152 - w_1 * w_3 * w_4 * w_6 ** 4 / 5760 - w_1 * w_3 * w_5 ** 4 * w_6 / 5760 - w_1 * w_3 * w_5 * w_6 ** 4 / 5760 + w_1 * w_4 ** 6 / 60480 - w_1 * w_4 ** 4 * w_5 ** 2 / 17280 - w_1 * w_4 ** 4 * w_5 * w_6 / 5760 - w_1 * w_4 ** 4 * w_6 ** 2 / 17280 - w_1 * w_4 ** 2 * w_5 ** 4 / 17280 + w_1 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 - w_1 * w_4 ** 2 * w_6 ** 4 / 17280 - w_1 * w_4 * w_5 ** 4 * w_6 / 5760 - w_1 * w_4 * w_5 * w_6 ** 4 / 5760 + w_1 * w_5 ** 6 / 60480 - w_1 * w_5 ** 4 * w_6 ** 2 / 17280 - w_1 * w_5 ** 2 * w_6 ** 4 / 17280 + w_1 * w_6 ** 6 / 60480 + w_2 ** 6 * w_3 / 60480 + w_2 ** 6 * w_4 / 60480 + w_2 ** 6 * w_5 / 60480 + w_2 ** 6 * w_6 / 60480 - w_2 ** 4 * w_3 ** 2 * w_4 / 17280 - w_2 ** 4 * w_3 ** 2 * w_5 / 17280 - w_2 ** 4 * w_3 ** 2 * w_6 / 17280 - w_2 ** 4 * w_3 * w_4 ** 2 / 17280 - w_2 ** 4 * w_3 * w_4 * w_5 / 5760 - w_2 ** 4 * w_3 * w_4 * w_6 / 5760 - w_2 ** 4 * w_3 * w_5 ** 2 / 17280 - w_2 ** 4 * w_3 * w_5 * w_6 / 5760 - w_2 ** 4 * w_3 * w_6 ** 2 / 17280 - w_2 ** 4 * w_4 ** 2 * w_5 / 17280 - w_2 ** 4 * w_4 ** 2 * w_6 / 17280 - w_2 ** 4 * w_4 * w_5 ** 2 / 17280 - w_2 ** 4 * w_4 * w_5 * w_6 / 5760 - w_2 ** 4 * w_4 * w_6 ** 2 / 17280 - w_2 ** 4 * w_5 ** 2 * w_6 / 17280 - w_2 ** 4 * w_5 * w_6 ** 2 / 17280 - w_2 ** 2 * w_3 ** 4 * w_4 / 17280 - w_2 ** 2 * w_3 ** 4 * w_5 / 17280 - w_2 ** 2 * w_3 ** 4 * w_6 / 17280 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 / 1152 + w_2 ** 2 * w_3 ** 2 * w_4 * w_6 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 / 3456 + w_2 ** 2 * w_3 ** 2 * w_5 * w_6 ** 2 / 3456 - w_2 ** 2 * w_3 * w_4 ** 4 / 17280 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 3456 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 / 1152 + w_2 ** 2 * w_3 * w_4 ** 2 * w_6 ** 2 / 3456 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 / 1152 + w_2 ** 2 * w_3 * w_4 * w_5 * w_6 ** 2 / 1152 - w_2 ** 2 * w_3 * w_5 ** 4 / 17280 + w_2 ** 2 * w_3 * w_5 ** 2 * w_6 ** 2 / 3456 - w_2 ** 2 * w_3 * w_6 ** 4 / 17280 - w_2 ** 2 * w_4 ** 4 * w_5 / 17280 - w_2 ** 2 * w_4 ** 4 * w_6 / 17280 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 3456 + w_2 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 3456 - w_2 ** 2 * w_4 * w_5 ** 4 / 17280 + w_2 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 3456 - w_2 ** 2 * w_4 * w_6 ** 4 / 17280 - w_2 ** 2 * w_5 ** 4 * w_6 / 17280 - w_2 ** 2 * w_5 * w_6 ** 4 / 17280 + w_2 * w_3 ** 6 / 60480 - w_2 * w_3 ** 4 * w_4 ** 2 / 17280 - w_2 * w_3 ** 4 * w_4 * w_5 / 5760 - w_2 * w_3 ** 4 * w_4 * w_6 / 5760 - w_2 * w_3 ** 4 * w_5 ** 2 / 17280 - w_2 * w_3 ** 4 * w_5 * w_6 / 5760 - w_2 * w_3 ** 4 * w_6 ** 2 / 17280 - w_2 * w_3 ** 2 * w_4 ** 4 / 17280 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 3456 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 1152 + w_2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 3456 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 1152 + w_2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 1152 - w_2 * w_3 ** 2 * w_5 ** 4 / 17280 + w_2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 - w_2 * w_3 ** 2 * w_6 ** 4 / 17280 - w_2 * w_3 * w_4 ** 4 * w_5 / 5760 - w_2 * w_3 * w_4 ** 4 * w_6 / 5760 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 1152 + w_2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 1152 - w_2 * w_3 * w_4 * w_5 ** 4 / 5760 + w_2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 1152 - w_2 * w_3 * w_4 * w_6 ** 4 / 5760 - w_2 * w_3 * w_5 ** 4 * w_6 / 5760 - w_2 * w_3 * w_5 * w_6 ** 4 / 5760 + w_2 * w_4 ** 6 / 60480 - w_2 * w_4 ** 4 * w_5 ** 2 / 17280 - w_2 * w_4 ** 4 * w_5 * w_6 / 5760 - w_2 * w_4 ** 4 * w_6 ** 2 / 17280 - w_2 * w_4 ** 2 * w_5 ** 4 / 17280 + w_2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 - w_2 * w_4 ** 2 * w_6 ** 4 / 17280 - w_2 * w_4 * w_5 ** 4 * w_6 / 5760 - w_2 * w_4 * w_5 * w_6 ** 4 / 5760 + w_2 * w_5 ** 6 / 60480 - w_2 * w_5 ** 4 * w_6 ** 2 / 17280 - w_2 * w_5 ** 2 * w_6 ** 4 / 17280 + w_2 * w_6 ** 6 / 60480 + w_3 ** 6 * w_4 / 60480 + w_3 ** 6 * w_5 / 60480 + w_3 ** 6 * w_6 / 60480 - w_3 ** 4 * w_4 ** 2 * w_5 / 17280 - w_3 ** 4 * w_4 ** 2 * w_6 / 17280 - w_3 ** 4 * w_4 * w_5 ** 2 / 17280 - w_3 ** 4 * w_4 * w_5 * w_6 / 5760 - w_3 ** 4 * w_4 * w_6 ** 2 / 17280 - w_3 ** 4 * w_5 ** 2 * w_6 / 17280 - w_3 ** 4 * w_5 * w_6 ** 2 / 17280 - w_3 ** 2 * w_4 ** 4 * w_5 / 17280 - w_3 ** 2 * w_4 ** 4 * w_6 / 17280 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 3456 + w_3 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 3456 - w_3 ** 2 * w_4 * w_5 ** 4 / 17280 + w_3 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 3456 - w_3 ** 2 * w_4 * w_6 ** 4 / 17280 - w_3 ** 2 * w_5 ** 4 * w_6 / 17280 - w_3 ** 2 * w_5 * w_6 ** 4 / 17280 + w_3 * w_4 ** 6 / 60480 - w_3 * w_4 ** 4 * w_5 ** 2 / 17280 - w_3 * w_4 ** 4 * w_5 * w_6 / 5760 - w_3 * w_4 ** 4 * w_6 ** 2 / 17280 - w_3 * w_4 ** 2 * w_5 ** 4 / 17280 + w_3 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 - w_3 * w_4 ** 2 * w_6 ** 4 / 17280 - w_3 * w_4 * w_5 ** 4 * w_6 / 5760 - w_3 * w_4 * w_5 * w_6 ** 4 / 5760 + w_3 * w_5 ** 6 / 60480 - w_3 * w_5 ** 4 * w_6 ** 2 / 17280 - w_3 * w_5 ** 2 * w_6 ** 4 / 17280 + w_3 * w_6 ** 6 / 60480 + w_4 ** 6 * w_5 / 60480 + w_4 ** 6 * w_6 / 60480 - w_4 ** 4 * w_5 ** 2 * w_6 / 17280 - w_4 ** 4 * w_5 * w_6 ** 2 / 17280 - w_4 ** 2 * w_5 ** 4 * w_6 / 17280 - w_4 ** 2 * w_5 * w_6 ** 4 / 17280 + w_4 * w_5 ** 6 / 60480 - w_4 * w_5 ** 4 * w_6 ** 2 / 17280 - w_4 * w_5 ** 2 * w_6 ** 4 / 17280 + w_4 * w_6 ** 6 / 60480 + w_5 ** 6 * w_6 / 60480 + w_5 * w_6 ** 6 / 60480
-    if s == 8 and ln == 5:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        return -w_1 ** 8 / 1209600 + w_1 ** 6 * w_2 ** 2 / 362880 + w_1 ** 6 * w_2 * w_3 / 120960 + w_1 ** 6 * w_2 * w_4 / 120960 + w_1 ** 6 * w_2 * w_5 / 120960 + w_1 ** 6 * w_3 ** 2 / 362880 + w_1 ** 6 * w_3 * w_4 / 120960 + w_1 ** 6 * w_3 * w_5 / 120960 + w_1 ** 6 * w_4 ** 2 / 362880 + w_1 ** 6 * w_4 * w_5 / 120960 + w_1 ** 6 * w_5 ** 2 / 362880 + w_1 ** 4 * w_2 ** 4 / 518400 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 / 103680 - w_1 ** 4 * w_2 ** 2 * w_3 * w_4 / 34560 - w_1 ** 4 * w_2 ** 2 * w_3 * w_5 / 34560 - w_1 ** 4 * w_2 ** 2 * w_4 ** 2 / 103680 - w_1 ** 4 * w_2 ** 2 * w_4 * w_5 / 34560 - w_1 ** 4 * w_2 ** 2 * w_5 ** 2 / 103680 - w_1 ** 4 * w_2 * w_3 ** 2 * w_4 / 34560 - w_1 ** 4 * w_2 * w_3 ** 2 * w_5 / 34560 - w_1 ** 4 * w_2 * w_3 * w_4 ** 2 / 34560 - w_1 ** 4 * w_2 * w_3 * w_4 * w_5 / 11520 - w_1 ** 4 * w_2 * w_3 * w_5 ** 2 / 34560 - w_1 ** 4 * w_2 * w_4 ** 2 * w_5 / 34560 - w_1 ** 4 * w_2 * w_4 * w_5 ** 2 / 34560 + w_1 ** 4 * w_3 ** 4 / 518400 - w_1 ** 4 * w_3 ** 2 * w_4 ** 2 / 103680 - w_1 ** 4 * w_3 ** 2 * w_4 * w_5 / 34560 - w_1 ** 4 * w_3 ** 2 * w_5 ** 2 / 103680 - w_1 ** 4 * w_3 * w_4 ** 2 * w_5 / 34560 - w_1 ** 4 * w_3 * w_4 * w_5 ** 2 / 34560 + w_1 ** 4 * w_4 ** 4 / 518400 - w_1 ** 4 * w_4 ** 2 * w_5 ** 2 / 103680 + w_1 ** 4 * w_5 ** 4 / 518400 + w_1 ** 2 * w_2 ** 6 / 362880 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 / 103680 - w_1 ** 2 * w_2 ** 4 * w_3 * w_4 / 34560 - w_1 ** 2 * w_2 ** 4 * w_3 * w_5 / 34560 - w_1 ** 2 * w_2 ** 4 * w_4 ** 2 / 103680 - w_1 ** 2 * w_2 ** 4 * w_4 * w_5 / 34560 - w_1 ** 2 * w_2 ** 4 * w_5 ** 2 / 103680 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 / 103680 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 6912 - w_1 ** 2 * w_2 ** 2 * w_4 ** 4 / 103680 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 20736 - w_1 ** 2 * w_2 ** 2 * w_5 ** 4 / 103680 - w_1 ** 2 * w_2 * w_3 ** 4 * w_4 / 34560 - w_1 ** 2 * w_2 * w_3 ** 4 * w_5 / 34560 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 6912 - w_1 ** 2 * w_2 * w_3 * w_4 ** 4 / 34560 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 6912 - w_1 ** 2 * w_2 * w_3 * w_5 ** 4 / 34560 - w_1 ** 2 * w_2 * w_4 ** 4 * w_5 / 34560 - w_1 ** 2 * w_2 * w_4 * w_5 ** 4 / 34560 + w_1 ** 2 * w_3 ** 6 / 362880 - w_1 ** 2 * w_3 ** 4 * w_4 ** 2 / 103680 - w_1 ** 2 * w_3 ** 4 * w_4 * w_5 / 34560 - w_1 ** 2 * w_3 ** 4 * w_5 ** 2 / 103680 - w_1 ** 2 * w_3 ** 2 * w_4 ** 4 / 103680 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 20736 - w_1 ** 2 * w_3 ** 2 * w_5 ** 4 / 103680 - w_1 ** 2 * w_3 * w_4 ** 4 * w_5 / 34560 - w_1 ** 2 * w_3 * w_4 * w_5 ** 4 / 34560 + w_1 ** 2 * w_4 ** 6 / 362880 - w_1 ** 2 * w_4 ** 4 * w_5 ** 2 / 103680 - w_1 ** 2 * w_4 ** 2 * w_5 ** 4 / 103680 + w_1 ** 2 * w_5 ** 6 / 362880 + w_1 * w_2 ** 6 * w_3 / 120960 + w_1 * w_2 ** 6 * w_4 / 120960 + w_1 * w_2 ** 6 * w_5 / 120960 - w_1 * w_2 ** 4 * w_3 ** 2 * w_4 / 34560 - w_1 * w_2 ** 4 * w_3 ** 2 * w_5 / 34560 - w_1 * w_2 ** 4 * w_3 * w_4 ** 2 / 34560 - w_1 * w_2 ** 4 * w_3 * w_4 * w_5 / 11520 - w_1 * w_2 ** 4 * w_3 * w_5 ** 2 / 34560 - w_1 * w_2 ** 4 * w_4 ** 2 * w_5 / 34560 - w_1 * w_2 ** 4 * w_4 * w_5 ** 2 / 34560 - w_1 * w_2 ** 2 * w_3 ** 4 * w_4 / 34560 - w_1 * w_2 ** 2 * w_3 ** 4 * w_5 / 34560 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 6912 - w_1 * w_2 ** 2 * w_3 * w_4 ** 4 / 34560 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 6912 - w_1 * w_2 ** 2 * w_3 * w_5 ** 4 / 34560 - w_1 * w_2 ** 2 * w_4 ** 4 * w_5 / 34560 - w_1 * w_2 ** 2 * w_4 * w_5 ** 4 / 34560 + w_1 * w_2 * w_3 ** 6 / 120960 - w_1 * w_2 * w_3 ** 4 * w_4 ** 2 / 34560 - w_1 * w_2 * w_3 ** 4 * w_4 * w_5 / 11520 - w_1 * w_2 * w_3 ** 4 * w_5 ** 2 / 34560 - w_1 * w_2 * w_3 ** 2 * w_4 ** 4 / 34560 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 6912 - w_1 * w_2 * w_3 ** 2 * w_5 ** 4 / 34560 - w_1 * w_2 * w_3 * w_4 ** 4 * w_5 / 11520 - w_1 * w_2 * w_3 * w_4 * w_5 ** 4 / 11520 + w_1 * w_2 * w_4 ** 6 / 120960 - w_1 * w_2 * w_4 ** 4 * w_5 ** 2 / 34560 - w_1 * w_2 * w_4 ** 2 * w_5 ** 4 / 34560 + w_1 * w_2 * w_5 ** 6 / 120960 + w_1 * w_3 ** 6 * w_4 / 120960 + w_1 * w_3 ** 6 * w_5 / 120960 - w_1 * w_3 ** 4 * w_4 ** 2 * w_5 / 34560 - w_1 * w_3 ** 4 * w_4 * w_5 ** 2 / 34560 - w_1 * w_3 ** 2 * w_4 ** 4 * w_5 / 34560 - w_1 * w_3 ** 2 * w_4 * w_5 ** 4 / 34560 + w_1 * w_3 * w_4 ** 6 / 120960 - w_1 * w_3 * w_4 ** 4 * w_5 ** 2 / 34560 - w_1 * w_3 * w_4 ** 2 * w_5 ** 4 / 34560 + w_1 * w_3 * w_5 ** 6 / 120960 + w_1 * w_4 ** 6 * w_5 / 120960 + w_1 * w_4 * w_5 ** 6 / 120960 - w_2 ** 8 / 1209600 + w_2 ** 6 * w_3 ** 2 / 362880 + w_2 ** 6 * w_3 * w_4 / 120960 + w_2 ** 6 * w_3 * w_5 / 120960 + w_2 ** 6 * w_4 ** 2 / 362880 + w_2 ** 6 * w_4 * w_5 / 120960 + w_2 ** 6 * w_5 ** 2 / 362880 + w_2 ** 4 * w_3 ** 4 / 518400 - w_2 ** 4 * w_3 ** 2 * w_4 ** 2 / 103680 - w_2 ** 4 * w_3 ** 2 * w_4 * w_5 / 34560 - w_2 ** 4 * w_3 ** 2 * w_5 ** 2 / 103680 - w_2 ** 4 * w_3 * w_4 ** 2 * w_5 / 34560 - w_2 ** 4 * w_3 * w_4 * w_5 ** 2 / 34560 + w_2 ** 4 * w_4 ** 4 / 518400 - w_2 ** 4 * w_4 ** 2 * w_5 ** 2 / 103680 + w_2 ** 4 * w_5 ** 4 / 518400 + w_2 ** 2 * w_3 ** 6 / 362880 - w_2 ** 2 * w_3 ** 4 * w_4 ** 2 / 103680 - w_2 ** 2 * w_3 ** 4 * w_4 * w_5 / 34560 - w_2 ** 2 * w_3 ** 4 * w_5 ** 2 / 103680 - w_2 ** 2 * w_3 ** 2 * w_4 ** 4 / 103680 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 20736 - w_2 ** 2 * w_3 ** 2 * w_5 ** 4 / 103680 - w_2 ** 2 * w_3 * w_4 ** 4 * w_5 / 34560 - w_2 ** 2 * w_3 * w_4 * w_5 ** 4 / 34560 + w_2 ** 2 * w_4 ** 6 / 362880 - w_2 ** 2 * w_4 ** 4 * w_5 ** 2 / 103680 - w_2 ** 2 * w_4 ** 2 * w_5 ** 4 / 103680 + w_2 ** 2 * w_5 ** 6 / 362880 + w_2 * w_3 ** 6 * w_4 / 120960 + w_2 * w_3 ** 6 * w_5 / 120960 - w_2 * w_3 ** 4 * w_4 ** 2 * w_5 / 34560 - w_2 * w_3 ** 4 * w_4 * w_5 ** 2 / 34560 - w_2 * w_3 ** 2 * w_4 ** 4 * w_5 / 34560 - w_2 * w_3 ** 2 * w_4 * w_5 ** 4 / 34560 + w_2 * w_3 * w_4 ** 6 / 120960 - w_2 * w_3 * w_4 ** 4 * w_5 ** 2 / 34560 - w_2 * w_3 * w_4 ** 2 * w_5 ** 4 / 34560 + w_2 * w_3 * w_5 ** 6 / 120960 + w_2 * w_4 ** 6 * w_5 / 120960 + w_2 * w_4 * w_5 ** 6 / 120960 - w_3 ** 8 / 1209600 + w_3 ** 6 * w_4 ** 2 / 362880 + w_3 ** 6 * w_4 * w_5 / 120960 + w_3 ** 6 * w_5 ** 2 / 362880 + w_3 ** 4 * w_4 ** 4 / 518400 - w_3 ** 4 * w_4 ** 2 * w_5 ** 2 / 103680 + w_3 ** 4 * w_5 ** 4 / 518400 + w_3 ** 2 * w_4 ** 6 / 362880 - w_3 ** 2 * w_4 ** 4 * w_5 ** 2 / 103680 - w_3 ** 2 * w_4 ** 2 * w_5 ** 4 / 103680 + w_3 ** 2 * w_5 ** 6 / 362880 + w_3 * w_4 ** 6 * w_5 / 120960 + w_3 * w_4 * w_5 ** 6 / 120960 - w_4 ** 8 / 1209600 + w_4 ** 6 * w_5 ** 2 / 362880 + w_4 ** 4 * w_5 ** 4 / 518400 + w_4 ** 2 * w_5 ** 6 / 362880 - w_5 ** 8 / 1209600
-    if s == 9 and ln == 4:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        return -w_1 ** 8 * w_2 / 2419200 - w_1 ** 8 * w_3 / 2419200 - w_1 ** 8 * w_4 / 2419200 + w_1 ** 6 * w_2 ** 2 * w_3 / 725760 + w_1 ** 6 * w_2 ** 2 * w_4 / 725760 + w_1 ** 6 * w_2 * w_3 ** 2 / 725760 + w_1 ** 6 * w_2 * w_3 * w_4 / 241920 + w_1 ** 6 * w_2 * w_4 ** 2 / 725760 + w_1 ** 6 * w_3 ** 2 * w_4 / 725760 + w_1 ** 6 * w_3 * w_4 ** 2 / 725760 + w_1 ** 4 * w_2 ** 4 * w_3 / 1036800 + w_1 ** 4 * w_2 ** 4 * w_4 / 1036800 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 * w_4 / 207360 - w_1 ** 4 * w_2 ** 2 * w_3 * w_4 ** 2 / 207360 + w_1 ** 4 * w_2 * w_3 ** 4 / 1036800 - w_1 ** 4 * w_2 * w_3 ** 2 * w_4 ** 2 / 207360 + w_1 ** 4 * w_2 * w_4 ** 4 / 1036800 + w_1 ** 4 * w_3 ** 4 * w_4 / 1036800 + w_1 ** 4 * w_3 * w_4 ** 4 / 1036800 + w_1 ** 2 * w_2 ** 6 * w_3 / 725760 + w_1 ** 2 * w_2 ** 6 * w_4 / 725760 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 * w_4 / 207360 - w_1 ** 2 * w_2 ** 4 * w_3 * w_4 ** 2 / 207360 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 * w_4 / 207360 - w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 4 / 207360 + w_1 ** 2 * w_2 * w_3 ** 6 / 725760 - w_1 ** 2 * w_2 * w_3 ** 4 * w_4 ** 2 / 207360 - w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 4 / 207360 + w_1 ** 2 * w_2 * w_4 ** 6 / 725760 + w_1 ** 2 * w_3 ** 6 * w_4 / 725760 + w_1 ** 2 * w_3 * w_4 ** 6 / 725760 - w_1 * w_2 ** 8 / 2419200 + w_1 * w_2 ** 6 * w_3 ** 2 / 725760 + w_1 * w_2 ** 6 * w_3 * w_4 / 241920 + w_1 * w_2 ** 6 * w_4 ** 2 / 725760 + w_1 * w_2 ** 4 * w_3 ** 4 / 1036800 - w_1 * w_2 ** 4 * w_3 ** 2 * w_4 ** 2 / 207360 + w_1 * w_2 ** 4 * w_4 ** 4 / 1036800 + w_1 * w_2 ** 2 * w_3 ** 6 / 725760 - w_1 * w_2 ** 2 * w_3 ** 4 * w_4 ** 2 / 207360 - w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 4 / 207360 + w_1 * w_2 ** 2 * w_4 ** 6 / 725760 + w_1 * w_2 * w_3 ** 6 * w_4 / 241920 + w_1 * w_2 * w_3 * w_4 ** 6 / 241920 - w_1 * w_3 ** 8 / 2419200 + w_1 * w_3 ** 6 * w_4 ** 2 / 725760 + w_1 * w_3 ** 4 * w_4 ** 4 / 1036800 + w_1 * w_3 ** 2 * w_4 ** 6 / 725760 - w_1 * w_4 ** 8 / 2419200 - w_2 ** 8 * w_3 / 2419200 - w_2 ** 8 * w_4 / 2419200 + w_2 ** 6 * w_3 ** 2 * w_4 / 725760 + w_2 ** 6 * w_3 * w_4 ** 2 / 725760 + w_2 ** 4 * w_3 ** 4 * w_4 / 1036800 + w_2 ** 4 * w_3 * w_4 ** 4 / 1036800 + w_2 ** 2 * w_3 ** 6 * w_4 / 725760 + w_2 ** 2 * w_3 * w_4 ** 6 / 725760 - w_2 * w_3 ** 8 / 2419200 + w_2 * w_3 ** 6 * w_4 ** 2 / 725760 + w_2 * w_3 ** 4 * w_4 ** 4 / 1036800 + w_2 * w_3 ** 2 * w_4 ** 6 / 725760 - w_2 * w_4 ** 8 / 2419200 - w_3 ** 8 * w_4 / 2419200 - w_3 * w_4 ** 8 / 2419200
-    if s == 10 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return w_1 ** 10 / 47900160 - w_1 ** 8 * w_2 ** 2 / 14515200 - w_1 ** 8 * w_2 * w_3 / 4838400 - w_1 ** 8 * w_3 ** 2 / 14515200 - w_1 ** 6 * w_2 ** 4 / 21772800 + w_1 ** 6 * w_2 ** 2 * w_3 ** 2 / 4354560 - w_1 ** 6 * w_3 ** 4 / 21772800 - w_1 ** 4 * w_2 ** 6 / 21772800 + w_1 ** 4 * w_2 ** 4 * w_3 ** 2 / 6220800 + w_1 ** 4 * w_2 ** 2 * w_3 ** 4 / 6220800 - w_1 ** 4 * w_3 ** 6 / 21772800 - w_1 ** 2 * w_2 ** 8 / 14515200 + w_1 ** 2 * w_2 ** 6 * w_3 ** 2 / 4354560 + w_1 ** 2 * w_2 ** 4 * w_3 ** 4 / 6220800 + w_1 ** 2 * w_2 ** 2 * w_3 ** 6 / 4354560 - w_1 ** 2 * w_3 ** 8 / 14515200 - w_1 * w_2 ** 8 * w_3 / 4838400 - w_1 * w_2 * w_3 ** 8 / 4838400 + w_2 ** 10 / 47900160 - w_2 ** 8 * w_3 ** 2 / 14515200 - w_2 ** 6 * w_3 ** 4 / 21772800 - w_2 ** 4 * w_3 ** 6 / 21772800 - w_2 ** 2 * w_3 ** 8 / 14515200 + w_3 ** 10 / 47900160
-    if s == 11 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return w_1 ** 10 * w_2 / 95800320 + w_1 * w_2 ** 10 / 95800320
-    if s == 12 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return -691 * w_1 ** 12 / 1307674368000
-    if s == 0 and ln == 14:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        w_12 = sym.Symbol("w_12")
-        w_13 = sym.Symbol("w_13")
-        w_14 = sym.Symbol("w_14")
-        return 1
-    if s == 1 and ln == 13:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        w_12 = sym.Symbol("w_12")
-        w_13 = sym.Symbol("w_13")
-        return w_1 / 2 + w_10 / 2 + w_11 / 2 + w_12 / 2 + w_13 / 2 + w_2 / 2 + w_3 / 2 + w_4 / 2 + w_5 / 2 + w_6 / 2 + w_7 / 2 + w_8 / 2 + w_9 / 2
-    if s == 2 and ln == 12:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        w_12 = sym.Symbol("w_12")
-        return w_1 ** 2 / 12 + w_1 * w_10 / 4 + w_1 * w_11 / 4 + w_1 * w_12 / 4 + w_1 * w_2 / 4 + w_1 * w_3 / 4 + w_1 * w_4 / 4 + w_1 * w_5 / 4 + w_1 * w_6 / 4 + w_1 * w_7 / 4 + w_1 * w_8 / 4 + w_1 * w_9 / 4 + w_10 ** 2 / 12 + w_10 * w_11 / 4 + w_10 * w_12 / 4 + w_10 * w_2 / 4 + w_10 * w_3 / 4 + w_10 * w_4 / 4 + w_10 * w_5 / 4 + w_10 * w_6 / 4 + w_10 * w_7 / 4 + w_10 * w_8 / 4 + w_10 * w_9 / 4 + w_11 ** 2 / 12 + w_11 * w_12 / 4 + w_11 * w_2 / 4 + w_11 * w_3 / 4 + w_11 * w_4 / 4 + w_11 * w_5 / 4 + w_11 * w_6 / 4 + w_11 * w_7 / 4 + w_11 * w_8 / 4 + w_11 * w_9 / 4 + w_12 ** 2 / 12 + w_12 * w_2 / 4 + w_12 * w_3 / 4 + w_12 * w_4 / 4 + w_12 * w_5 / 4 + w_12 * w_6 / 4 + w_12 * w_7 / 4 + w_12 * w_8 / 4 + w_12 * w_9 / 4 + w_2 ** 2 / 12 + w_2 * w_3 / 4 + w_2 * w_4 / 4 + w_2 * w_5 / 4 + w_2 * w_6 / 4 + w_2 * w_7 / 4 + w_2 * w_8 / 4 + w_2 * w_9 / 4 + w_3 ** 2 / 12 + w_3 * w_4 / 4 + w_3 * w_5 / 4 + w_3 * w_6 / 4 + w_3 * w_7 / 4 + w_3 * w_8 / 4 + w_3 * w_9 / 4 + w_4 ** 2 / 12 + w_4 * w_5 / 4 + w_4 * w_6 / 4 + w_4 * w_7 / 4 + w_4 * w_8 / 4 + w_4 * w_9 / 4 + w_5 ** 2 / 12 + w_5 * w_6 / 4 + w_5 * w_7 / 4 + w_5 * w_8 / 4 + w_5 * w_9 / 4 + w_6 ** 2 / 12 + w_6 * w_7 / 4 + w_6 * w_8 / 4 + w_6 * w_9 / 4 + w_7 ** 2 / 12 + w_7 * w_8 / 4 + w_7 * w_9 / 4 + w_8 ** 2 / 12 + w_8 * w_9 / 4 + w_9 ** 2 / 12
-    if s == 3 and ln == 11:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        return w_1 ** 2 * w_10 / 24 + w_1 ** 2 * w_11 / 24 + w_1 ** 2 * w_2 / 24 + w_1 ** 2 * w_3 / 24 + w_1 ** 2 * w_4 / 24 + w_1 ** 2 * w_5 / 24 + w_1 ** 2 * w_6 / 24 + w_1 ** 2 * w_7 / 24 + w_1 ** 2 * w_8 / 24 + w_1 ** 2 * w_9 / 24 + w_1 * w_10 ** 2 / 24 + w_1 * w_10 * w_11 / 8 + w_1 * w_10 * w_2 / 8 + w_1 * w_10 * w_3 / 8 + w_1 * w_10 * w_4 / 8 + w_1 * w_10 * w_5 / 8 + w_1 * w_10 * w_6 / 8 + w_1 * w_10 * w_7 / 8 + w_1 * w_10 * w_8 / 8 + w_1 * w_10 * w_9 / 8 + w_1 * w_11 ** 2 / 24 + w_1 * w_11 * w_2 / 8 + w_1 * w_11 * w_3 / 8 + w_1 * w_11 * w_4 / 8 + w_1 * w_11 * w_5 / 8 + w_1 * w_11 * w_6 / 8 + w_1 * w_11 * w_7 / 8 + w_1 * w_11 * w_8 / 8 + w_1 * w_11 * w_9 / 8 + w_1 * w_2 ** 2 / 24 + w_1 * w_2 * w_3 / 8 + w_1 * w_2 * w_4 / 8 + w_1 * w_2 * w_5 / 8 + w_1 * w_2 * w_6 / 8 + w_1 * w_2 * w_7 / 8 + w_1 * w_2 * w_8 / 8 + w_1 * w_2 * w_9 / 8 + w_1 * w_3 ** 2 / 24 + w_1 * w_3 * w_4 / 8 + w_1 * w_3 * w_5 / 8 + w_1 * w_3 * w_6 / 8 + w_1 * w_3 * w_7 / 8 + w_1 * w_3 * w_8 / 8 + w_1 * w_3 * w_9 / 8 + w_1 * w_4 ** 2 / 24 + w_1 * w_4 * w_5 / 8 + w_1 * w_4 * w_6 / 8 + w_1 * w_4 * w_7 / 8 + w_1 * w_4 * w_8 / 8 + w_1 * w_4 * w_9 / 8 + w_1 * w_5 ** 2 / 24 + w_1 * w_5 * w_6 / 8 + w_1 * w_5 * w_7 / 8 + w_1 * w_5 * w_8 / 8 + w_1 * w_5 * w_9 / 8 + w_1 * w_6 ** 2 / 24 + w_1 * w_6 * w_7 / 8 + w_1 * w_6 * w_8 / 8 + w_1 * w_6 * w_9 / 8 + w_1 * w_7 ** 2 / 24 + w_1 * w_7 * w_8 / 8 + w_1 * w_7 * w_9 / 8 + w_1 * w_8 ** 2 / 24 + w_1 * w_8 * w_9 / 8 + w_1 * w_9 ** 2 / 24 + w_10 ** 2 * w_11 / 24 + w_10 ** 2 * w_2 / 24 + w_10 ** 2 * w_3 / 24 + w_10 ** 2 * w_4 / 24 + w_10 ** 2 * w_5 / 24 + w_10 ** 2 * w_6 / 24 + w_10 ** 2 * w_7 / 24 + w_10 ** 2 * w_8 / 24 + w_10 ** 2 * w_9 / 24 + w_10 * w_11 ** 2 / 24 + w_10 * w_11 * w_2 / 8 + w_10 * w_11 * w_3 / 8 + w_10 * w_11 * w_4 / 8 + w_10 * w_11 * w_5 / 8 + w_10 * w_11 * w_6 / 8 + w_10 * w_11 * w_7 / 8 + w_10 * w_11 * w_8 / 8 + w_10 * w_11 * w_9 / 8 + w_10 * w_2 ** 2 / 24 + w_10 * w_2 * w_3 / 8 + w_10 * w_2 * w_4 / 8 + w_10 * w_2 * w_5 / 8 + w_10 * w_2 * w_6 / 8 + w_10 * w_2 * w_7 / 8 + w_10 * w_2 * w_8 / 8 + w_10 * w_2 * w_9 / 8 + w_10 * w_3 ** 2 / 24 + w_10 * w_3 * w_4 / 8 + w_10 * w_3 * w_5 / 8 + w_10 * w_3 * w_6 / 8 + w_10 * w_3 * w_7 / 8 + w_10 * w_3 * w_8 / 8 + w_10 * w_3 * w_9 / 8 + w_10 * w_4 ** 2 / 24 + w_10 * w_4 * w_5 / 8 + w_10 * w_4 * w_6 / 8 + w_10 * w_4 * w_7 / 8 + w_10 * w_4 * w_8 / 8 + w_10 * w_4 * w_9 / 8 + w_10 * w_5 ** 2 / 24 + w_10 * w_5 * w_6 / 8 + w_10 * w_5 * w_7 / 8 + w_10 * w_5 * w_8 / 8 + w_10 * w_5 * w_9 / 8 + w_10 * w_6 ** 2 / 24 + w_10 * w_6 * w_7 / 8 + w_10 * w_6 * w_8 / 8 + w_10 * w_6 * w_9 / 8 + w_10 * w_7 ** 2 / 24 + w_10 * w_7 * w_8 / 8 + w_10 * w_7 * w_9 / 8 + w_10 * w_8 ** 2 / 24 + w_10 * w_8 * w_9 / 8 + w_10 * w_9 ** 2 / 24 + w_11 ** 2 * w_2 / 24 + w_11 ** 2 * w_3 / 24 + w_11 ** 2 * w_4 / 24 + w_11 ** 2 * w_5 / 24 + w_11 ** 2 * w_6 / 24 + w_11 ** 2 * w_7 / 24 + w_11 ** 2 * w_8 / 24 + w_11 ** 2 * w_9 / 24 + w_11 * w_2 ** 2 / 24 + w_11 * w_2 * w_3 / 8 + w_11 * w_2 * w_4 / 8 + w_11 * w_2 * w_5 / 8 + w_11 * w_2 * w_6 / 8 + w_11 * w_2 * w_7 / 8 + w_11 * w_2 * w_8 / 8 + w_11 * w_2 * w_9 / 8 + w_11 * w_3 ** 2 / 24 + w_11 * w_3 * w_4 / 8 + w_11 * w_3 * w_5 / 8 + w_11 * w_3 * w_6 / 8 + w_11 * w_3 * w_7 / 8 + w_11 * w_3 * w_8 / 8 + w_11 * w_3 * w_9 / 8 + w_11 * w_4 ** 2 / 24 + w_11 * w_4 * w_5 / 8 + w_11 * w_4 * w_6 / 8 + w_11 * w_4 * w_7 / 8 + w_11 * w_4 * w_8 / 8 + w_11 * w_4 * w_9 / 8 + w_11 * w_5 ** 2 / 24 + w_11 * w_5 * w_6 / 8 + w_11 * w_5 * w_7 / 8 + w_11 * w_5 * w_8 / 8 + w_11 * w_5 * w_9 / 8 + w_11 * w_6 ** 2 / 24 + w_11 * w_6 * w_7 / 8 + w_11 * w_6 * w_8 / 8 + w_11 * w_6 * w_9 / 8 + w_11 * w_7 ** 2 / 24 + w_11 * w_7 * w_8 / 8 + w_11 * w_7 * w_9 / 8 + w_11 * w_8 ** 2 / 24 + w_11 * w_8 * w_9 / 8 + w_11 * w_9 ** 2 / 24 + w_2 ** 2 * w_3 / 24 + w_2 ** 2 * w_4 / 24 + w_2 ** 2 * w_5 / 24 + w_2 ** 2 * w_6 / 24 + w_2 ** 2 * w_7 / 24 + w_2 ** 2 * w_8 / 24 + w_2 ** 2 * w_9 / 24 + w_2 * w_3 ** 2 / 24 + w_2 * w_3 * w_4 / 8 + w_2 * w_3 * w_5 / 8 + w_2 * w_3 * w_6 / 8 + w_2 * w_3 * w_7 / 8 + w_2 * w_3 * w_8 / 8 + w_2 * w_3 * w_9 / 8 + w_2 * w_4 ** 2 / 24 + w_2 * w_4 * w_5 / 8 + w_2 * w_4 * w_6 / 8 + w_2 * w_4 * w_7 / 8 + w_2 * w_4 * w_8 / 8 + w_2 * w_4 * w_9 / 8 + w_2 * w_5 ** 2 / 24 + w_2 * w_5 * w_6 / 8 + w_2 * w_5 * w_7 / 8 + w_2 * w_5 * w_8 / 8 + w_2 * w_5 * w_9 / 8 + w_2 * w_6 ** 2 / 24 + w_2 * w_6 * w_7 / 8 + w_2 * w_6 * w_8 / 8 + w_2 * w_6 * w_9 / 8 + w_2 * w_7 ** 2 / 24 + w_2 * w_7 * w_8 / 8 + w_2 * w_7 * w_9 / 8 + w_2 * w_8 ** 2 / 24 + w_2 * w_8 * w_9 / 8 + w_2 * w_9 ** 2 / 24 + w_3 ** 2 * w_4 / 24 + w_3 ** 2 * w_5 / 24 + w_3 ** 2 * w_6 / 24 + w_3 ** 2 * w_7 / 24 + w_3 ** 2 * w_8 / 24 + w_3 ** 2 * w_9 / 24 + w_3 * w_4 ** 2 / 24 + w_3 * w_4 * w_5 / 8 + w_3 * w_4 * w_6 / 8 + w_3 * w_4 * w_7 / 8 + w_3 * w_4 * w_8 / 8 + w_3 * w_4 * w_9 / 8 + w_3 * w_5 ** 2 / 24 + w_3 * w_5 * w_6 / 8 + w_3 * w_5 * w_7 / 8 + w_3 * w_5 * w_8 / 8 + w_3 * w_5 * w_9 / 8 + w_3 * w_6 ** 2 / 24 + w_3 * w_6 * w_7 / 8 + w_3 * w_6 * w_8 / 8 + w_3 * w_6 * w_9 / 8 + w_3 * w_7 ** 2 / 24 + w_3 * w_7 * w_8 / 8 + w_3 * w_7 * w_9 / 8 + w_3 * w_8 ** 2 / 24 + w_3 * w_8 * w_9 / 8 + w_3 * w_9 ** 2 / 24 + w_4 ** 2 * w_5 / 24 + w_4 ** 2 * w_6 / 24 + w_4 ** 2 * w_7 / 24 + w_4 ** 2 * w_8 / 24 + w_4 ** 2 * w_9 / 24 + w_4 * w_5 ** 2 / 24 + w_4 * w_5 * w_6 / 8 + w_4 * w_5 * w_7 / 8 + w_4 * w_5 * w_8 / 8 + w_4 * w_5 * w_9 / 8 + w_4 * w_6 ** 2 / 24 + w_4 * w_6 * w_7 / 8 + w_4 * w_6 * w_8 / 8 + w_4 * w_6 * w_9 / 8 + w_4 * w_7 ** 2 / 24 + w_4 * w_7 * w_8 / 8 + w_4 * w_7 * w_9 / 8 + w_4 * w_8 ** 2 / 24 + w_4 * w_8 * w_9 / 8 + w_4 * w_9 ** 2 / 24 + w_5 ** 2 * w_6 / 24 + w_5 ** 2 * w_7 / 24 + w_5 ** 2 * w_8 / 24 + w_5 ** 2 * w_9 / 24 + w_5 * w_6 ** 2 / 24 + w_5 * w_6 * w_7 / 8 + w_5 * w_6 * w_8 / 8 + w_5 * w_6 * w_9 / 8 + w_5 * w_7 ** 2 / 24 + w_5 * w_7 * w_8 / 8 + w_5 * w_7 * w_9 / 8 + w_5 * w_8 ** 2 / 24 + w_5 * w_8 * w_9 / 8 + w_5 * w_9 ** 2 / 24 + w_6 ** 2 * w_7 / 24 + w_6 ** 2 * w_8 / 24 + w_6 ** 2 * w_9 / 24 + w_6 * w_7 ** 2 / 24 + w_6 * w_7 * w_8 / 8 + w_6 * w_7 * w_9 / 8 + w_6 * w_8 ** 2 / 24 + w_6 * w_8 * w_9 / 8 + w_6 * w_9 ** 2 / 24 + w_7 ** 2 * w_8 / 24 + w_7 ** 2 * w_9 / 24 + w_7 * w_8 ** 2 / 24 + w_7 * w_8 * w_9 / 8 + w_7 * w_9 ** 2 / 24 + w_8 ** 2 * w_9 / 24 + w_8 * w_9 ** 2 / 24
-    if s == 4 and ln == 10:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        return -w_1 ** 4 / 720 + w_1 ** 2 * w_10 ** 2 / 144 + w_1 ** 2 * w_10 * w_2 / 48 + w_1 ** 2 * w_10 * w_3 / 48 + w_1 ** 2 * w_10 * w_4 / 48 + w_1 ** 2 * w_10 * w_5 / 48 + w_1 ** 2 * w_10 * w_6 / 48 + w_1 ** 2 * w_10 * w_7 / 48 + w_1 ** 2 * w_10 * w_8 / 48 + w_1 ** 2 * w_10 * w_9 / 48 + w_1 ** 2 * w_2 ** 2 / 144 + w_1 ** 2 * w_2 * w_3 / 48 + w_1 ** 2 * w_2 * w_4 / 48 + w_1 ** 2 * w_2 * w_5 / 48 + w_1 ** 2 * w_2 * w_6 / 48 + w_1 ** 2 * w_2 * w_7 / 48 + w_1 ** 2 * w_2 * w_8 / 48 + w_1 ** 2 * w_2 * w_9 / 48 + w_1 ** 2 * w_3 ** 2 / 144 + w_1 ** 2 * w_3 * w_4 / 48 + w_1 ** 2 * w_3 * w_5 / 48 + w_1 ** 2 * w_3 * w_6 / 48 + w_1 ** 2 * w_3 * w_7 / 48 + w_1 ** 2 * w_3 * w_8 / 48 + w_1 ** 2 * w_3 * w_9 / 48 + w_1 ** 2 * w_4 ** 2 / 144 + w_1 ** 2 * w_4 * w_5 / 48 + w_1 ** 2 * w_4 * w_6 / 48 + w_1 ** 2 * w_4 * w_7 / 48 + w_1 ** 2 * w_4 * w_8 / 48 + w_1 ** 2 * w_4 * w_9 / 48 + w_1 ** 2 * w_5 ** 2 / 144 + w_1 ** 2 * w_5 * w_6 / 48 + w_1 ** 2 * w_5 * w_7 / 48 + w_1 ** 2 * w_5 * w_8 / 48 + w_1 ** 2 * w_5 * w_9 / 48 + w_1 ** 2 * w_6 ** 2 / 144 + w_1 ** 2 * w_6 * w_7 / 48 + w_1 ** 2 * w_6 * w_8 / 48 + w_1 ** 2 * w_6 * w_9 / 48 + w_1 ** 2 * w_7 ** 2 / 144 + w_1 ** 2 * w_7 * w_8 / 48 + w_1 ** 2 * w_7 * w_9 / 48 + w_1 ** 2 * w_8 ** 2 / 144 + w_1 ** 2 * w_8 * w_9 / 48 + w_1 ** 2 * w_9 ** 2 / 144 + w_1 * w_10 ** 2 * w_2 / 48 + w_1 * w_10 ** 2 * w_3 / 48 + w_1 * w_10 ** 2 * w_4 / 48 + w_1 * w_10 ** 2 * w_5 / 48 + w_1 * w_10 ** 2 * w_6 / 48 + w_1 * w_10 ** 2 * w_7 / 48 + w_1 * w_10 ** 2 * w_8 / 48 + w_1 * w_10 ** 2 * w_9 / 48 + w_1 * w_10 * w_2 ** 2 / 48 + w_1 * w_10 * w_2 * w_3 / 16 + w_1 * w_10 * w_2 * w_4 / 16 + w_1 * w_10 * w_2 * w_5 / 16 + w_1 * w_10 * w_2 * w_6 / 16 + w_1 * w_10 * w_2 * w_7 / 16 + w_1 * w_10 * w_2 * w_8 / 16 + w_1 * w_10 * w_2 * w_9 / 16 + w_1 * w_10 * w_3 ** 2 / 48 + w_1 * w_10 * w_3 * w_4 / 16 + w_1 * w_10 * w_3 * w_5 / 16 + w_1 * w_10 * w_3 * w_6 / 16 + w_1 * w_10 * w_3 * w_7 / 16 + w_1 * w_10 * w_3 * w_8 / 16 + w_1 * w_10 * w_3 * w_9 / 16 + w_1 * w_10 * w_4 ** 2 / 48 + w_1 * w_10 * w_4 * w_5 / 16 + w_1 * w_10 * w_4 * w_6 / 16 + w_1 * w_10 * w_4 * w_7 / 16 + w_1 * w_10 * w_4 * w_8 / 16 + w_1 * w_10 * w_4 * w_9 / 16 + w_1 * w_10 * w_5 ** 2 / 48 + w_1 * w_10 * w_5 * w_6 / 16 + w_1 * w_10 * w_5 * w_7 / 16 + w_1 * w_10 * w_5 * w_8 / 16 + w_1 * w_10 * w_5 * w_9 / 16 + w_1 * w_10 * w_6 ** 2 / 48 + w_1 * w_10 * w_6 * w_7 / 16 + w_1 * w_10 * w_6 * w_8 / 16 + w_1 * w_10 * w_6 * w_9 / 16 + w_1 * w_10 * w_7 ** 2 / 48 + w_1 * w_10 * w_7 * w_8 / 16 + w_1 * w_10 * w_7 * w_9 / 16 + w_1 * w_10 * w_8 ** 2 / 48 + w_1 * w_10 * w_8 * w_9 / 16 + w_1 * w_10 * w_9 ** 2 / 48 + w_1 * w_2 ** 2 * w_3 / 48 + w_1 * w_2 ** 2 * w_4 / 48 + w_1 * w_2 ** 2 * w_5 / 48 + w_1 * w_2 ** 2 * w_6 / 48 + w_1 * w_2 ** 2 * w_7 / 48 + w_1 * w_2 ** 2 * w_8 / 48 + w_1 * w_2 ** 2 * w_9 / 48 + w_1 * w_2 * w_3 ** 2 / 48 + w_1 * w_2 * w_3 * w_4 / 16 + w_1 * w_2 * w_3 * w_5 / 16 + w_1 * w_2 * w_3 * w_6 / 16 + w_1 * w_2 * w_3 * w_7 / 16 + w_1 * w_2 * w_3 * w_8 / 16 + w_1 * w_2 * w_3 * w_9 / 16 + w_1 * w_2 * w_4 ** 2 / 48 + w_1 * w_2 * w_4 * w_5 / 16 + w_1 * w_2 * w_4 * w_6 / 16 + w_1 * w_2 * w_4 * w_7 / 16 + w_1 * w_2 * w_4 * w_8 / 16 + w_1 * w_2 * w_4 * w_9 / 16 + w_1 * w_2 * w_5 ** 2 / 48 + w_1 * w_2 * w_5 * w_6 / 16 + w_1 * w_2 * w_5 * w_7 / 16 + w_1 * w_2 * w_5 * w_8 / 16 + w_1 * w_2 * w_5 * w_9 / 16 + w_1 * w_2 * w_6 ** 2 / 48 + w_1 * w_2 * w_6 * w_7 / 16 + w_1 * w_2 * w_6 * w_8 / 16 + w_1 * w_2 * w_6 * w_9 / 16 + w_1 * w_2 * w_7 ** 2 / 48 + w_1 * w_2 * w_7 * w_8 / 16 + w_1 * w_2 * w_7 * w_9 / 16 + w_1 * w_2 * w_8 ** 2 / 48 + w_1 * w_2 * w_8 * w_9 / 16 + w_1 * w_2 * w_9 ** 2 / 48 + w_1 * w_3 ** 2 * w_4 / 48 + w_1 * w_3 ** 2 * w_5 / 48 + w_1 * w_3 ** 2 * w_6 / 48 + w_1 * w_3 ** 2 * w_7 / 48 + w_1 * w_3 ** 2 * w_8 / 48 + w_1 * w_3 ** 2 * w_9 / 48 + w_1 * w_3 * w_4 ** 2 / 48 + w_1 * w_3 * w_4 * w_5 / 16 + w_1 * w_3 * w_4 * w_6 / 16 + w_1 * w_3 * w_4 * w_7 / 16 + w_1 * w_3 * w_4 * w_8 / 16 + w_1 * w_3 * w_4 * w_9 / 16 + w_1 * w_3 * w_5 ** 2 / 48 + w_1 * w_3 * w_5 * w_6 / 16 + w_1 * w_3 * w_5 * w_7 / 16 + w_1 * w_3 * w_5 * w_8 / 16 + w_1 * w_3 * w_5 * w_9 / 16 + w_1 * w_3 * w_6 ** 2 / 48 + w_1 * w_3 * w_6 * w_7 / 16 + w_1 * w_3 * w_6 * w_8 / 16 + w_1 * w_3 * w_6 * w_9 / 16 + w_1 * w_3 * w_7 ** 2 / 48 + w_1 * w_3 * w_7 * w_8 / 16 + w_1 * w_3 * w_7 * w_9 / 16 + w_1 * w_3 * w_8 ** 2 / 48 + w_1 * w_3 * w_8 * w_9 / 16 + w_1 * w_3 * w_9 ** 2 / 48 + w_1 * w_4 ** 2 * w_5 / 48 + w_1 * w_4 ** 2 * w_6 / 48 + w_1 * w_4 ** 2 * w_7 / 48 + w_1 * w_4 ** 2 * w_8 / 48 + w_1 * w_4 ** 2 * w_9 / 48 + w_1 * w_4 * w_5 ** 2 / 48 + w_1 * w_4 * w_5 * w_6 / 16 + w_1 * w_4 * w_5 * w_7 / 16 + w_1 * w_4 * w_5 * w_8 / 16 + w_1 * w_4 * w_5 * w_9 / 16 + w_1 * w_4 * w_6 ** 2 / 48 + w_1 * w_4 * w_6 * w_7 / 16 + w_1 * w_4 * w_6 * w_8 / 16 + w_1 * w_4 * w_6 * w_9 / 16 + w_1 * w_4 * w_7 ** 2 / 48 + w_1 * w_4 * w_7 * w_8 / 16 + w_1 * w_4 * w_7 * w_9 / 16 + w_1 * w_4 * w_8 ** 2 / 48 + w_1 * w_4 * w_8 * w_9 / 16 + w_1 * w_4 * w_9 ** 2 / 48 + w_1 * w_5 ** 2 * w_6 / 48 + w_1 * w_5 ** 2 * w_7 / 48 + w_1 * w_5 ** 2 * w_8 / 48 + w_1 * w_5 ** 2 * w_9 / 48 + w_1 * w_5 * w_6 ** 2 / 48 + w_1 * w_5 * w_6 * w_7 / 16 + w_1 * w_5 * w_6 * w_8 / 16 + w_1 * w_5 * w_6 * w_9 / 16 + w_1 * w_5 * w_7 ** 2 / 48 + w_1 * w_5 * w_7 * w_8 / 16 + w_1 * w_5 * w_7 * w_9 / 16 + w_1 * w_5 * w_8 ** 2 / 48 + w_1 * w_5 * w_8 * w_9 / 16 + w_1 * w_5 * w_9 ** 2 / 48 + w_1 * w_6 ** 2 * w_7 / 48 + w_1 * w_6 ** 2 * w_8 / 48 + w_1 * w_6 ** 2 * w_9 / 48 + w_1 * w_6 * w_7 ** 2 / 48 + w_1 * w_6 * w_7 * w_8 / 16 + w_1 * w_6 * w_7 * w_9 / 16 + w_1 * w_6 * w_8 ** 2 / 48 + w_1 * w_6 * w_8 * w_9 / 16 + w_1 * w_6 * w_9 ** 2 / 48 + w_1 * w_7 ** 2 * w_8 / 48 + w_1 * w_7 ** 2 * w_9 / 48 + w_1 * w_7 * w_8 ** 2 / 48 + w_1 * w_7 * w_8 * w_9 / 16 + w_1 * w_7 * w_9 ** 2 / 48 + w_1 * w_8 ** 2 * w_9 / 48 + w_1 * w_8 * w_9 ** 2 / 48 - w_10 ** 4 / 720 + w_10 ** 2 * w_2 ** 2 / 144 + w_10 ** 2 * w_2 * w_3 / 48 + w_10 ** 2 * w_2 * w_4 / 48 + w_10 ** 2 * w_2 * w_5 / 48 + w_10 ** 2 * w_2 * w_6 / 48 + w_10 ** 2 * w_2 * w_7 / 48 + w_10 ** 2 * w_2 * w_8 / 48 + w_10 ** 2 * w_2 * w_9 / 48 + w_10 ** 2 * w_3 ** 2 / 144 + w_10 ** 2 * w_3 * w_4 / 48 + w_10 ** 2 * w_3 * w_5 / 48 + w_10 ** 2 * w_3 * w_6 / 48 + w_10 ** 2 * w_3 * w_7 / 48 + w_10 ** 2 * w_3 * w_8 / 48 + w_10 ** 2 * w_3 * w_9 / 48 + w_10 ** 2 * w_4 ** 2 / 144 + w_10 ** 2 * w_4 * w_5 / 48 + w_10 ** 2 * w_4 * w_6 / 48 + w_10 ** 2 * w_4 * w_7 / 48 + w_10 ** 2 * w_4 * w_8 / 48 + w_10 ** 2 * w_4 * w_9 / 48 + w_10 ** 2 * w_5 ** 2 / 144 + w_10 ** 2 * w_5 * w_6 / 48 + w_10 ** 2 * w_5 * w_7 / 48 + w_10 ** 2 * w_5 * w_8 / 48 + w_10 ** 2 * w_5 * w_9 / 48 + w_10 ** 2 * w_6 ** 2 / 144 + w_10 ** 2 * w_6 * w_7 / 48 + w_10 ** 2 * w_6 * w_8 / 48 + w_10 ** 2 * w_6 * w_9 / 48 + w_10 ** 2 * w_7 ** 2 / 144 + w_10 ** 2 * w_7 * w_8 / 48 + w_10 ** 2 * w_7 * w_9 / 48 + w_10 ** 2 * w_8 ** 2 / 144 + w_10 ** 2 * w_8 * w_9 / 48 + w_10 ** 2 * w_9 ** 2 / 144 + w_10 * w_2 ** 2 * w_3 / 48 + w_10 * w_2 ** 2 * w_4 / 48 + w_10 * w_2 ** 2 * w_5 / 48 + w_10 * w_2 ** 2 * w_6 / 48 + w_10 * w_2 ** 2 * w_7 / 48 + w_10 * w_2 ** 2 * w_8 / 48 + w_10 * w_2 ** 2 * w_9 / 48 + w_10 * w_2 * w_3 ** 2 / 48 + w_10 * w_2 * w_3 * w_4 / 16 + w_10 * w_2 * w_3 * w_5 / 16 + w_10 * w_2 * w_3 * w_6 / 16 + w_10 * w_2 * w_3 * w_7 / 16 + w_10 * w_2 * w_3 * w_8 / 16 + w_10 * w_2 * w_3 * w_9 / 16 + w_10 * w_2 * w_4 ** 2 / 48 + w_10 * w_2 * w_4 * w_5 / 16 + w_10 * w_2 * w_4 * w_6 / 16 + w_10 * w_2 * w_4 * w_7 / 16 + w_10 * w_2 * w_4 * w_8 / 16 + w_10 * w_2 * w_4 * w_9 / 16 + w_10 * w_2 * w_5 ** 2 / 48 + w_10 * w_2 * w_5 * w_6 / 16 + w_10 * w_2 * w_5 * w_7 / 16 + w_10 * w_2 * w_5 * w_8 / 16 + w_10 * w_2 * w_5 * w_9 / 16 + w_10 * w_2 * w_6 ** 2 / 48 + w_10 * w_2 * w_6 * w_7 / 16 + w_10 * w_2 * w_6 * w_8 / 16 + w_10 * w_2 * w_6 * w_9 / 16 + w_10 * w_2 * w_7 ** 2 / 48 + w_10 * w_2 * w_7 * w_8 / 16 + w_10 * w_2 * w_7 * w_9 / 16 + w_10 * w_2 * w_8 ** 2 / 48 + w_10 * w_2 * w_8 * w_9 / 16 + w_10 * w_2 * w_9 ** 2 / 48 + w_10 * w_3 ** 2 * w_4 / 48 + w_10 * w_3 ** 2 * w_5 / 48 + w_10 * w_3 ** 2 * w_6 / 48 + w_10 * w_3 ** 2 * w_7 / 48 + w_10 * w_3 ** 2 * w_8 / 48 + w_10 * w_3 ** 2 * w_9 / 48 + w_10 * w_3 * w_4 ** 2 / 48 + w_10 * w_3 * w_4 * w_5 / 16 + w_10 * w_3 * w_4 * w_6 / 16 + w_10 * w_3 * w_4 * w_7 / 16 + w_10 * w_3 * w_4 * w_8 / 16 + w_10 * w_3 * w_4 * w_9 / 16 + w_10 * w_3 * w_5 ** 2 / 48 + w_10 * w_3 * w_5 * w_6 / 16 + w_10 * w_3 * w_5 * w_7 / 16 + w_10 * w_3 * w_5 * w_8 / 16 + w_10 * w_3 * w_5 * w_9 / 16 + w_10 * w_3 * w_6 ** 2 / 48 + w_10 * w_3 * w_6 * w_7 / 16 + w_10 * w_3 * w_6 * w_8 / 16 + w_10 * w_3 * w_6 * w_9 / 16 + w_10 * w_3 * w_7 ** 2 / 48 + w_10 * w_3 * w_7 * w_8 / 16 + w_10 * w_3 * w_7 * w_9 / 16 + w_10 * w_3 * w_8 ** 2 / 48 + w_10 * w_3 * w_8 * w_9 / 16 + w_10 * w_3 * w_9 ** 2 / 48 + w_10 * w_4 ** 2 * w_5 / 48 + w_10 * w_4 ** 2 * w_6 / 48 + w_10 * w_4 ** 2 * w_7 / 48 + w_10 * w_4 ** 2 * w_8 / 48 + w_10 * w_4 ** 2 * w_9 / 48 + w_10 * w_4 * w_5 ** 2 / 48 + w_10 * w_4 * w_5 * w_6 / 16 + w_10 * w_4 * w_5 * w_7 / 16 + w_10 * w_4 * w_5 * w_8 / 16 + w_10 * w_4 * w_5 * w_9 / 16 + w_10 * w_4 * w_6 ** 2 / 48 + w_10 * w_4 * w_6 * w_7 / 16 + w_10 * w_4 * w_6 * w_8 / 16 + w_10 * w_4 * w_6 * w_9 / 16 + w_10 * w_4 * w_7 ** 2 / 48 + w_10 * w_4 * w_7 * w_8 / 16 + w_10 * w_4 * w_7 * w_9 / 16 + w_10 * w_4 * w_8 ** 2 / 48 + w_10 * w_4 * w_8 * w_9 / 16 + w_10 * w_4 * w_9 ** 2 / 48 + w_10 * w_5 ** 2 * w_6 / 48 + w_10 * w_5 ** 2 * w_7 / 48 + w_10 * w_5 ** 2 * w_8 / 48 + w_10 * w_5 ** 2 * w_9 / 48 + w_10 * w_5 * w_6 ** 2 / 48 + w_10 * w_5 * w_6 * w_7 / 16 + w_10 * w_5 * w_6 * w_8 / 16 + w_10 * w_5 * w_6 * w_9 / 16 + w_10 * w_5 * w_7 ** 2 / 48 + w_10 * w_5 * w_7 * w_8 / 16 + w_10 * w_5 * w_7 * w_9 / 16 + w_10 * w_5 * w_8 ** 2 / 48 + w_10 * w_5 * w_8 * w_9 / 16 + w_10 * w_5 * w_9 ** 2 / 48 + w_10 * w_6 ** 2 * w_7 / 48 + w_10 * w_6 ** 2 * w_8 / 48 + w_10 * w_6 ** 2 * w_9 / 48 + w_10 * w_6 * w_7 ** 2 / 48 + w_10 * w_6 * w_7 * w_8 / 16 + w_10 * w_6 * w_7 * w_9 / 16 + w_10 * w_6 * w_8 ** 2 / 48 + w_10 * w_6 * w_8 * w_9 / 16 + w_10 * w_6 * w_9 ** 2 / 48 + w_10 * w_7 ** 2 * w_8 / 48 + w_10 * w_7 ** 2 * w_9 / 48 + w_10 * w_7 * w_8 ** 2 / 48 + w_10 * w_7 * w_8 * w_9 / 16 + w_10 * w_7 * w_9 ** 2 / 48 + w_10 * w_8 ** 2 * w_9 / 48 + w_10 * w_8 * w_9 ** 2 / 48 - w_2 ** 4 / 720 + w_2 ** 2 * w_3 ** 2 / 144 + w_2 ** 2 * w_3 * w_4 / 48 + w_2 ** 2 * w_3 * w_5 / 48 + w_2 ** 2 * w_3 * w_6 / 48 + w_2 ** 2 * w_3 * w_7 / 48 + w_2 ** 2 * w_3 * w_8 / 48 + w_2 ** 2 * w_3 * w_9 / 48 + w_2 ** 2 * w_4 ** 2 / 144 + w_2 ** 2 * w_4 * w_5 / 48 + w_2 ** 2 * w_4 * w_6 / 48 + w_2 ** 2 * w_4 * w_7 / 48 + w_2 ** 2 * w_4 * w_8 / 48 + w_2 ** 2 * w_4 * w_9 / 48 + w_2 ** 2 * w_5 ** 2 / 144 + w_2 ** 2 * w_5 * w_6 / 48 + w_2 ** 2 * w_5 * w_7 / 48 + w_2 ** 2 * w_5 * w_8 / 48 + w_2 ** 2 * w_5 * w_9 / 48 + w_2 ** 2 * w_6 ** 2 / 144 + w_2 ** 2 * w_6 * w_7 / 48 + w_2 ** 2 * w_6 * w_8 / 48 + w_2 ** 2 * w_6 * w_9 / 48 + w_2 ** 2 * w_7 ** 2 / 144 + w_2 ** 2 * w_7 * w_8 / 48 + w_2 ** 2 * w_7 * w_9 / 48 + w_2 ** 2 * w_8 ** 2 / 144 + w_2 ** 2 * w_8 * w_9 / 48 + w_2 ** 2 * w_9 ** 2 / 144 + w_2 * w_3 ** 2 * w_4 / 48 + w_2 * w_3 ** 2 * w_5 / 48 + w_2 * w_3 ** 2 * w_6 / 48 + w_2 * w_3 ** 2 * w_7 / 48 + w_2 * w_3 ** 2 * w_8 / 48 + w_2 * w_3 ** 2 * w_9 / 48 + w_2 * w_3 * w_4 ** 2 / 48 + w_2 * w_3 * w_4 * w_5 / 16 + w_2 * w_3 * w_4 * w_6 / 16 + w_2 * w_3 * w_4 * w_7 / 16 + w_2 * w_3 * w_4 * w_8 / 16 + w_2 * w_3 * w_4 * w_9 / 16 + w_2 * w_3 * w_5 ** 2 / 48 + w_2 * w_3 * w_5 * w_6 / 16 + w_2 * w_3 * w_5 * w_7 / 16 + w_2 * w_3 * w_5 * w_8 / 16 + w_2 * w_3 * w_5 * w_9 / 16 + w_2 * w_3 * w_6 ** 2 / 48 + w_2 * w_3 * w_6 * w_7 / 16 + w_2 * w_3 * w_6 * w_8 / 16 + w_2 * w_3 * w_6 * w_9 / 16 + w_2 * w_3 * w_7 ** 2 / 48 + w_2 * w_3 * w_7 * w_8 / 16 + w_2 * w_3 * w_7 * w_9 / 16 + w_2 * w_3 * w_8 ** 2 / 48 + w_2 * w_3 * w_8 * w_9 / 16 + w_2 * w_3 * w_9 ** 2 / 48 + w_2 * w_4 ** 2 * w_5 / 48 + w_2 * w_4 ** 2 * w_6 / 48 + w_2 * w_4 ** 2 * w_7 / 48 + w_2 * w_4 ** 2 * w_8 / 48 + w_2 * w_4 ** 2 * w_9 / 48 + w_2 * w_4 * w_5 ** 2 / 48 + w_2 * w_4 * w_5 * w_6 / 16 + w_2 * w_4 * w_5 * w_7 / 16 + w_2 * w_4 * w_5 * w_8 / 16 + w_2 * w_4 * w_5 * w_9 / 16 + w_2 * w_4 * w_6 ** 2 / 48 + w_2 * w_4 * w_6 * w_7 / 16 + w_2 * w_4 * w_6 * w_8 / 16 + w_2 * w_4 * w_6 * w_9 / 16 + w_2 * w_4 * w_7 ** 2 / 48 + w_2 * w_4 * w_7 * w_8 / 16 + w_2 * w_4 * w_7 * w_9 / 16 + w_2 * w_4 * w_8 ** 2 / 48 + w_2 * w_4 * w_8 * w_9 / 16 + w_2 * w_4 * w_9 ** 2 / 48 + w_2 * w_5 ** 2 * w_6 / 48 + w_2 * w_5 ** 2 * w_7 / 48 + w_2 * w_5 ** 2 * w_8 / 48 + w_2 * w_5 ** 2 * w_9 / 48 + w_2 * w_5 * w_6 ** 2 / 48 + w_2 * w_5 * w_6 * w_7 / 16 + w_2 * w_5 * w_6 * w_8 / 16 + w_2 * w_5 * w_6 * w_9 / 16 + w_2 * w_5 * w_7 ** 2 / 48 + w_2 * w_5 * w_7 * w_8 / 16 + w_2 * w_5 * w_7 * w_9 / 16 + w_2 * w_5 * w_8 ** 2 / 48 + w_2 * w_5 * w_8 * w_9 / 16 + w_2 * w_5 * w_9 ** 2 / 48 + w_2 * w_6 ** 2 * w_7 / 48 + w_2 * w_6 ** 2 * w_8 / 48 + w_2 * w_6 ** 2 * w_9 / 48 + w_2 * w_6 * w_7 ** 2 / 48 + w_2 * w_6 * w_7 * w_8 / 16 + w_2 * w_6 * w_7 * w_9 / 16 + w_2 * w_6 * w_8 ** 2 / 48 + w_2 * w_6 * w_8 * w_9 / 16 + w_2 * w_6 * w_9 ** 2 / 48 + w_2 * w_7 ** 2 * w_8 / 48 + w_2 * w_7 ** 2 * w_9 / 48 + w_2 * w_7 * w_8 ** 2 / 48 + w_2 * w_7 * w_8 * w_9 / 16 + w_2 * w_7 * w_9 ** 2 / 48 + w_2 * w_8 ** 2 * w_9 / 48 + w_2 * w_8 * w_9 ** 2 / 48 - w_3 ** 4 / 720 + w_3 ** 2 * w_4 ** 2 / 144 + w_3 ** 2 * w_4 * w_5 / 48 + w_3 ** 2 * w_4 * w_6 / 48 + w_3 ** 2 * w_4 * w_7 / 48 + w_3 ** 2 * w_4 * w_8 / 48 + w_3 ** 2 * w_4 * w_9 / 48 + w_3 ** 2 * w_5 ** 2 / 144 + w_3 ** 2 * w_5 * w_6 / 48 + w_3 ** 2 * w_5 * w_7 / 48 + w_3 ** 2 * w_5 * w_8 / 48 + w_3 ** 2 * w_5 * w_9 / 48 + w_3 ** 2 * w_6 ** 2 / 144 + w_3 ** 2 * w_6 * w_7 / 48 + w_3 ** 2 * w_6 * w_8 / 48 + w_3 ** 2 * w_6 * w_9 / 48 + w_3 ** 2 * w_7 ** 2 / 144 + w_3 ** 2 * w_7 * w_8 / 48 + w_3 ** 2 * w_7 * w_9 / 48 + w_3 ** 2 * w_8 ** 2 / 144 + w_3 ** 2 * w_8 * w_9 / 48 + w_3 ** 2 * w_9 ** 2 / 144 + w_3 * w_4 ** 2 * w_5 / 48 + w_3 * w_4 ** 2 * w_6 / 48 + w_3 * w_4 ** 2 * w_7 / 48 + w_3 * w_4 ** 2 * w_8 / 48 + w_3 * w_4 ** 2 * w_9 / 48 + w_3 * w_4 * w_5 ** 2 / 48 + w_3 * w_4 * w_5 * w_6 / 16 + w_3 * w_4 * w_5 * w_7 / 16 + w_3 * w_4 * w_5 * w_8 / 16 + w_3 * w_4 * w_5 * w_9 / 16 + w_3 * w_4 * w_6 ** 2 / 48 + w_3 * w_4 * w_6 * w_7 / 16 + w_3 * w_4 * w_6 * w_8 / 16 + w_3 * w_4 * w_6 * w_9 / 16 + w_3 * w_4 * w_7 ** 2 / 48 + w_3 * w_4 * w_7 * w_8 / 16 + w_3 * w_4 * w_7 * w_9 / 16 + w_3 * w_4 * w_8 ** 2 / 48 + w_3 * w_4 * w_8 * w_9 / 16 + w_3 * w_4 * w_9 ** 2 / 48 + w_3 * w_5 ** 2 * w_6 / 48 + w_3 * w_5 ** 2 * w_7 / 48 + w_3 * w_5 ** 2 * w_8 / 48 + w_3 * w_5 ** 2 * w_9 / 48 + w_3 * w_5 * w_6 ** 2 / 48 + w_3 * w_5 * w_6 * w_7 / 16 + w_3 * w_5 * w_6 * w_8 / 16 + w_3 * w_5 * w_6 * w_9 / 16 + w_3 * w_5 * w_7 ** 2 / 48 + w_3 * w_5 * w_7 * w_8 / 16 + w_3 * w_5 * w_7 * w_9 / 16 + w_3 * w_5 * w_8 ** 2 / 48 + w_3 * w_5 * w_8 * w_9 / 16 + w_3 * w_5 * w_9 ** 2 / 48 + w_3 * w_6 ** 2 * w_7 / 48 + w_3 * w_6 ** 2 * w_8 / 48 + w_3 * w_6 ** 2 * w_9 / 48 + w_3 * w_6 * w_7 ** 2 / 48 + w_3 * w_6 * w_7 * w_8 / 16 + w_3 * w_6 * w_7 * w_9 / 16 + w_3 * w_6 * w_8 ** 2 / 48 + w_3 * w_6 * w_8 * w_9 / 16 + w_3 * w_6 * w_9 ** 2 / 48 + w_3 * w_7 ** 2 * w_8 / 48 + w_3 * w_7 ** 2 * w_9 / 48 + w_3 * w_7 * w_8 ** 2 / 48 + w_3 * w_7 * w_8 * w_9 / 16 + w_3 * w_7 * w_9 ** 2 / 48 + w_3 * w_8 ** 2 * w_9 / 48 + w_3 * w_8 * w_9 ** 2 / 48 - w_4 ** 4 / 720 + w_4 ** 2 * w_5 ** 2 / 144 + w_4 ** 2 * w_5 * w_6 / 48 + w_4 ** 2 * w_5 * w_7 / 48 + w_4 ** 2 * w_5 * w_8 / 48 + w_4 ** 2 * w_5 * w_9 / 48 + w_4 ** 2 * w_6 ** 2 / 144 + w_4 ** 2 * w_6 * w_7 / 48 + w_4 ** 2 * w_6 * w_8 / 48 + w_4 ** 2 * w_6 * w_9 / 48 + w_4 ** 2 * w_7 ** 2 / 144 + w_4 ** 2 * w_7 * w_8 / 48 + w_4 ** 2 * w_7 * w_9 / 48 + w_4 ** 2 * w_8 ** 2 / 144 + w_4 ** 2 * w_8 * w_9 / 48 + w_4 ** 2 * w_9 ** 2 / 144 + w_4 * w_5 ** 2 * w_6 / 48 + w_4 * w_5 ** 2 * w_7 / 48 + w_4 * w_5 ** 2 * w_8 / 48 + w_4 * w_5 ** 2 * w_9 / 48 + w_4 * w_5 * w_6 ** 2 / 48 + w_4 * w_5 * w_6 * w_7 / 16 + w_4 * w_5 * w_6 * w_8 / 16 + w_4 * w_5 * w_6 * w_9 / 16 + w_4 * w_5 * w_7 ** 2 / 48 + w_4 * w_5 * w_7 * w_8 / 16 + w_4 * w_5 * w_7 * w_9 / 16 + w_4 * w_5 * w_8 ** 2 / 48 + w_4 * w_5 * w_8 * w_9 / 16 + w_4 * w_5 * w_9 ** 2 / 48 + w_4 * w_6 ** 2 * w_7 / 48 + w_4 * w_6 ** 2 * w_8 / 48 + w_4 * w_6 ** 2 * w_9 / 48 + w_4 * w_6 * w_7 ** 2 / 48 + w_4 * w_6 * w_7 * w_8 / 16 + w_4 * w_6 * w_7 * w_9 / 16 + w_4 * w_6 * w_8 ** 2 / 48 + w_4 * w_6 * w_8 * w_9 / 16 + w_4 * w_6 * w_9 ** 2 / 48 + w_4 * w_7 ** 2 * w_8 / 48 + w_4 * w_7 ** 2 * w_9 / 48 + w_4 * w_7 * w_8 ** 2 / 48 + w_4 * w_7 * w_8 * w_9 / 16 + w_4 * w_7 * w_9 ** 2 / 48 + w_4 * w_8 ** 2 * w_9 / 48 + w_4 * w_8 * w_9 ** 2 / 48 - w_5 ** 4 / 720 + w_5 ** 2 * w_6 ** 2 / 144 + w_5 ** 2 * w_6 * w_7 / 48 + w_5 ** 2 * w_6 * w_8 / 48 + w_5 ** 2 * w_6 * w_9 / 48 + w_5 ** 2 * w_7 ** 2 / 144 + w_5 ** 2 * w_7 * w_8 / 48 + w_5 ** 2 * w_7 * w_9 / 48 + w_5 ** 2 * w_8 ** 2 / 144 + w_5 ** 2 * w_8 * w_9 / 48 + w_5 ** 2 * w_9 ** 2 / 144 + w_5 * w_6 ** 2 * w_7 / 48 + w_5 * w_6 ** 2 * w_8 / 48 + w_5 * w_6 ** 2 * w_9 / 48 + w_5 * w_6 * w_7 ** 2 / 48 + w_5 * w_6 * w_7 * w_8 / 16 + w_5 * w_6 * w_7 * w_9 / 16 + w_5 * w_6 * w_8 ** 2 / 48 + w_5 * w_6 * w_8 * w_9 / 16 + w_5 * w_6 * w_9 ** 2 / 48 + w_5 * w_7 ** 2 * w_8 / 48 + w_5 * w_7 ** 2 * w_9 / 48 + w_5 * w_7 * w_8 ** 2 / 48 + w_5 * w_7 * w_8 * w_9 / 16 + w_5 * w_7 * w_9 ** 2 / 48 + w_5 * w_8 ** 2 * w_9 / 48 + w_5 * w_8 * w_9 ** 2 / 48 - w_6 ** 4 / 720 + w_6 ** 2 * w_7 ** 2 / 144 + w_6 ** 2 * w_7 * w_8 / 48 + w_6 ** 2 * w_7 * w_9 / 48 + w_6 ** 2 * w_8 ** 2 / 144 + w_6 ** 2 * w_8 * w_9 / 48 + w_6 ** 2 * w_9 ** 2 / 144 + w_6 * w_7 ** 2 * w_8 / 48 + w_6 * w_7 ** 2 * w_9 / 48 + w_6 * w_7 * w_8 ** 2 / 48 + w_6 * w_7 * w_8 * w_9 / 16 + w_6 * w_7 * w_9 ** 2 / 48 + w_6 * w_8 ** 2 * w_9 / 48 + w_6 * w_8 * w_9 ** 2 / 48 - w_7 ** 4 / 720 + w_7 ** 2 * w_8 ** 2 / 144 + w_7 ** 2 * w_8 * w_9 / 48 + w_7 ** 2 * w_9 ** 2 / 144 + w_7 * w_8 ** 2 * w_9 / 48 + w_7 * w_8 * w_9 ** 2 / 48 - w_8 ** 4 / 720 + w_8 ** 2 * w_9 ** 2 / 144 - w_9 ** 4 / 720
-    if s == 5 and ln == 9:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        return -w_1 ** 4 * w_2 / 1440 - w_1 ** 4 * w_3 / 1440 - w_1 ** 4 * w_4 / 1440 - w_1 ** 4 * w_5 / 1440 - w_1 ** 4 * w_6 / 1440 - w_1 ** 4 * w_7 / 1440 - w_1 ** 4 * w_8 / 1440 - w_1 ** 4 * w_9 / 1440 + w_1 ** 2 * w_2 ** 2 * w_3 / 288 + w_1 ** 2 * w_2 ** 2 * w_4 / 288 + w_1 ** 2 * w_2 ** 2 * w_5 / 288 + w_1 ** 2 * w_2 ** 2 * w_6 / 288 + w_1 ** 2 * w_2 ** 2 * w_7 / 288 + w_1 ** 2 * w_2 ** 2 * w_8 / 288 + w_1 ** 2 * w_2 ** 2 * w_9 / 288 + w_1 ** 2 * w_2 * w_3 ** 2 / 288 + w_1 ** 2 * w_2 * w_3 * w_4 / 96 + w_1 ** 2 * w_2 * w_3 * w_5 / 96 + w_1 ** 2 * w_2 * w_3 * w_6 / 96 + w_1 ** 2 * w_2 * w_3 * w_7 / 96 + w_1 ** 2 * w_2 * w_3 * w_8 / 96 + w_1 ** 2 * w_2 * w_3 * w_9 / 96 + w_1 ** 2 * w_2 * w_4 ** 2 / 288 + w_1 ** 2 * w_2 * w_4 * w_5 / 96 + w_1 ** 2 * w_2 * w_4 * w_6 / 96 + w_1 ** 2 * w_2 * w_4 * w_7 / 96 + w_1 ** 2 * w_2 * w_4 * w_8 / 96 + w_1 ** 2 * w_2 * w_4 * w_9 / 96 + w_1 ** 2 * w_2 * w_5 ** 2 / 288 + w_1 ** 2 * w_2 * w_5 * w_6 / 96 + w_1 ** 2 * w_2 * w_5 * w_7 / 96 + w_1 ** 2 * w_2 * w_5 * w_8 / 96 + w_1 ** 2 * w_2 * w_5 * w_9 / 96 + w_1 ** 2 * w_2 * w_6 ** 2 / 288 + w_1 ** 2 * w_2 * w_6 * w_7 / 96 + w_1 ** 2 * w_2 * w_6 * w_8 / 96 + w_1 ** 2 * w_2 * w_6 * w_9 / 96 + w_1 ** 2 * w_2 * w_7 ** 2 / 288 + w_1 ** 2 * w_2 * w_7 * w_8 / 96 + w_1 ** 2 * w_2 * w_7 * w_9 / 96 + w_1 ** 2 * w_2 * w_8 ** 2 / 288 + w_1 ** 2 * w_2 * w_8 * w_9 / 96 + w_1 ** 2 * w_2 * w_9 ** 2 / 288 + w_1 ** 2 * w_3 ** 2 * w_4 / 288 + w_1 ** 2 * w_3 ** 2 * w_5 / 288 + w_1 ** 2 * w_3 ** 2 * w_6 / 288 + w_1 ** 2 * w_3 ** 2 * w_7 / 288 + w_1 ** 2 * w_3 ** 2 * w_8 / 288 + w_1 ** 2 * w_3 ** 2 * w_9 / 288 + w_1 ** 2 * w_3 * w_4 ** 2 / 288 + w_1 ** 2 * w_3 * w_4 * w_5 / 96 + w_1 ** 2 * w_3 * w_4 * w_6 / 96 + w_1 ** 2 * w_3 * w_4 * w_7 / 96 + w_1 ** 2 * w_3 * w_4 * w_8 / 96 + w_1 ** 2 * w_3 * w_4 * w_9 / 96 + w_1 ** 2 * w_3 * w_5 ** 2 / 288 + w_1 ** 2 * w_3 * w_5 * w_6 / 96 + w_1 ** 2 * w_3 * w_5 * w_7 / 96 + w_1 ** 2 * w_3 * w_5 * w_8 / 96 + w_1 ** 2 * w_3 * w_5 * w_9 / 96 + w_1 ** 2 * w_3 * w_6 ** 2 / 288 + w_1 ** 2 * w_3 * w_6 * w_7 / 96 + w_1 ** 2 * w_3 * w_6 * w_8 / 96 + w_1 ** 2 * w_3 * w_6 * w_9 / 96 + w_1 ** 2 * w_3 * w_7 ** 2 / 288 + w_1 ** 2 * w_3 * w_7 * w_8 / 96 + w_1 ** 2 * w_3 * w_7 * w_9 / 96 + w_1 ** 2 * w_3 * w_8 ** 2 / 288 + w_1 ** 2 * w_3 * w_8 * w_9 / 96 + w_1 ** 2 * w_3 * w_9 ** 2 / 288 + w_1 ** 2 * w_4 ** 2 * w_5 / 288 + w_1 ** 2 * w_4 ** 2 * w_6 / 288 + w_1 ** 2 * w_4 ** 2 * w_7 / 288 + w_1 ** 2 * w_4 ** 2 * w_8 / 288 + w_1 ** 2 * w_4 ** 2 * w_9 / 288 + w_1 ** 2 * w_4 * w_5 ** 2 / 288 + w_1 ** 2 * w_4 * w_5 * w_6 / 96 + w_1 ** 2 * w_4 * w_5 * w_7 / 96 + w_1 ** 2 * w_4 * w_5 * w_8 / 96 + w_1 ** 2 * w_4 * w_5 * w_9 / 96 + w_1 ** 2 * w_4 * w_6 ** 2 / 288 + w_1 ** 2 * w_4 * w_6 * w_7 / 96 + w_1 ** 2 * w_4 * w_6 * w_8 / 96 + w_1 ** 2 * w_4 * w_6 * w_9 / 96 + w_1 ** 2 * w_4 * w_7 ** 2 / 288 + w_1 ** 2 * w_4 * w_7 * w_8 / 96 + w_1 ** 2 * w_4 * w_7 * w_9 / 96 + w_1 ** 2 * w_4 * w_8 ** 2 / 288 + w_1 ** 2 * w_4 * w_8 * w_9 / 96 + w_1 ** 2 * w_4 * w_9 ** 2 / 288 + w_1 ** 2 * w_5 ** 2 * w_6 / 288 + w_1 ** 2 * w_5 ** 2 * w_7 / 288 + w_1 ** 2 * w_5 ** 2 * w_8 / 288 + w_1 ** 2 * w_5 ** 2 * w_9 / 288 + w_1 ** 2 * w_5 * w_6 ** 2 / 288 + w_1 ** 2 * w_5 * w_6 * w_7 / 96 + w_1 ** 2 * w_5 * w_6 * w_8 / 96 + w_1 ** 2 * w_5 * w_6 * w_9 / 96 + w_1 ** 2 * w_5 * w_7 ** 2 / 288 + w_1 ** 2 * w_5 * w_7 * w_8 / 96 + w_1 ** 2 * w_5 * w_7 * w_9 / 96 + w_1 ** 2 * w_5 * w_8 ** 2 / 288 + w_1 ** 2 * w_5 * w_8 * w_9 / 96 + w_1 ** 2 * w_5 * w_9 ** 2 / 288 + w_1 ** 2 * w_6 ** 2 * w_7 / 288 + w_1 ** 2 * w_6 ** 2 * w_8 / 288 + w_1 ** 2 * w_6 ** 2 * w_9 / 288 + w_1 ** 2 * w_6 * w_7 ** 2 / 288 + w_1 ** 2 * w_6 * w_7 * w_8 / 96 + w_1 ** 2 * w_6 * w_7 * w_9 / 96 + w_1 ** 2 * w_6 * w_8 ** 2 / 288 + w_1 ** 2 * w_6 * w_8 * w_9 / 96 + w_1 ** 2 * w_6 * w_9 ** 2 / 288 + w_1 ** 2 * w_7 ** 2 * w_8 / 288 + w_1 ** 2 * w_7 ** 2 * w_9 / 288 + w_1 ** 2 * w_7 * w_8 ** 2 / 288 + w_1 ** 2 * w_7 * w_8 * w_9 / 96 + w_1 ** 2 * w_7 * w_9 ** 2 / 288 + w_1 ** 2 * w_8 ** 2 * w_9 / 288 + w_1 ** 2 * w_8 * w_9 ** 2 / 288 - w_1 * w_2 ** 4 / 1440 + w_1 * w_2 ** 2 * w_3 ** 2 / 288 + w_1 * w_2 ** 2 * w_3 * w_4 / 96 + w_1 * w_2 ** 2 * w_3 * w_5 / 96 + w_1 * w_2 ** 2 * w_3 * w_6 / 96 + w_1 * w_2 ** 2 * w_3 * w_7 / 96 + w_1 * w_2 ** 2 * w_3 * w_8 / 96 + w_1 * w_2 ** 2 * w_3 * w_9 / 96 + w_1 * w_2 ** 2 * w_4 ** 2 / 288 + w_1 * w_2 ** 2 * w_4 * w_5 / 96 + w_1 * w_2 ** 2 * w_4 * w_6 / 96 + w_1 * w_2 ** 2 * w_4 * w_7 / 96 + w_1 * w_2 ** 2 * w_4 * w_8 / 96 + w_1 * w_2 ** 2 * w_4 * w_9 / 96 + w_1 * w_2 ** 2 * w_5 ** 2 / 288 + w_1 * w_2 ** 2 * w_5 * w_6 / 96 + w_1 * w_2 ** 2 * w_5 * w_7 / 96 + w_1 * w_2 ** 2 * w_5 * w_8 / 96 + w_1 * w_2 ** 2 * w_5 * w_9 / 96 + w_1 * w_2 ** 2 * w_6 ** 2 / 288 + w_1 * w_2 ** 2 * w_6 * w_7 / 96 + w_1 * w_2 ** 2 * w_6 * w_8 / 96 + w_1 * w_2 ** 2 * w_6 * w_9 / 96 + w_1 * w_2 ** 2 * w_7 ** 2 / 288 + w_1 * w_2 ** 2 * w_7 * w_8 / 96 + w_1 * w_2 ** 2 * w_7 * w_9 / 96 + w_1 * w_2 ** 2 * w_8 ** 2 / 288 + w_1 * w_2 ** 2 * w_8 * w_9 / 96 + w_1 * w_2 ** 2 * w_9 ** 2 / 288 + w_1 * w_2 * w_3 ** 2 * w_4 / 96 + w_1 * w_2 * w_3 ** 2 * w_5 / 96 + w_1 * w_2 * w_3 ** 2 * w_6 / 96 + w_1 * w_2 * w_3 ** 2 * w_7 / 96 + w_1 * w_2 * w_3 ** 2 * w_8 / 96 + w_1 * w_2 * w_3 ** 2 * w_9 / 96 + w_1 * w_2 * w_3 * w_4 ** 2 / 96 + w_1 * w_2 * w_3 * w_4 * w_5 / 32 + w_1 * w_2 * w_3 * w_4 * w_6 / 32 + w_1 * w_2 * w_3 * w_4 * w_7 / 32 + w_1 * w_2 * w_3 * w_4 * w_8 / 32 + w_1 * w_2 * w_3 * w_4 * w_9 / 32 + w_1 * w_2 * w_3 * w_5 ** 2 / 96 + w_1 * w_2 * w_3 * w_5 * w_6 / 32 + w_1 * w_2 * w_3 * w_5 * w_7 / 32 + w_1 * w_2 * w_3 * w_5 * w_8 / 32 + w_1 * w_2 * w_3 * w_5 * w_9 / 32 + w_1 * w_2 * w_3 * w_6 ** 2 / 96 + w_1 * w_2 * w_3 * w_6 * w_7 / 32 + w_1 * w_2 * w_3 * w_6 * w_8 / 32 + w_1 * w_2 * w_3 * w_6 * w_9 / 32 + w_1 * w_2 * w_3 * w_7 ** 2 / 96 + w_1 * w_2 * w_3 * w_7 * w_8 / 32 + w_1 * w_2 * w_3 * w_7 * w_9 / 32 + w_1 * w_2 * w_3 * w_8 ** 2 / 96 + w_1 * w_2 * w_3 * w_8 * w_9 / 32 + w_1 * w_2 * w_3 * w_9 ** 2 / 96 + w_1 * w_2 * w_4 ** 2 * w_5 / 96 + w_1 * w_2 * w_4 ** 2 * w_6 / 96 + w_1 * w_2 * w_4 ** 2 * w_7 / 96 + w_1 * w_2 * w_4 ** 2 * w_8 / 96 + w_1 * w_2 * w_4 ** 2 * w_9 / 96 + w_1 * w_2 * w_4 * w_5 ** 2 / 96 + w_1 * w_2 * w_4 * w_5 * w_6 / 32 + w_1 * w_2 * w_4 * w_5 * w_7 / 32 + w_1 * w_2 * w_4 * w_5 * w_8 / 32 + w_1 * w_2 * w_4 * w_5 * w_9 / 32 + w_1 * w_2 * w_4 * w_6 ** 2 / 96 + w_1 * w_2 * w_4 * w_6 * w_7 / 32 + w_1 * w_2 * w_4 * w_6 * w_8 / 32 + w_1 * w_2 * w_4 * w_6 * w_9 / 32 + w_1 * w_2 * w_4 * w_7 ** 2 / 96 + w_1 * w_2 * w_4 * w_7 * w_8 / 32 + w_1 * w_2 * w_4 * w_7 * w_9 / 32 + w_1 * w_2 * w_4 * w_8 ** 2 / 96 + w_1 * w_2 * w_4 * w_8 * w_9 / 32 + w_1 * w_2 * w_4 * w_9 ** 2 / 96 + w_1 * w_2 * w_5 ** 2 * w_6 / 96 + w_1 * w_2 * w_5 ** 2 * w_7 / 96 + w_1 * w_2 * w_5 ** 2 * w_8 / 96 + w_1 * w_2 * w_5 ** 2 * w_9 / 96 + w_1 * w_2 * w_5 * w_6 ** 2 / 96 + w_1 * w_2 * w_5 * w_6 * w_7 / 32 + w_1 * w_2 * w_5 * w_6 * w_8 / 32 + w_1 * w_2 * w_5 * w_6 * w_9 / 32 + w_1 * w_2 * w_5 * w_7 ** 2 / 96 + w_1 * w_2 * w_5 * w_7 * w_8 / 32 + w_1 * w_2 * w_5 * w_7 * w_9 / 32 + w_1 * w_2 * w_5 * w_8 ** 2 / 96 + w_1 * w_2 * w_5 * w_8 * w_9 / 32 + w_1 * w_2 * w_5 * w_9 ** 2 / 96 + w_1 * w_2 * w_6 ** 2 * w_7 / 96 + w_1 * w_2 * w_6 ** 2 * w_8 / 96 + w_1 * w_2 * w_6 ** 2 * w_9 / 96 + w_1 * w_2 * w_6 * w_7 ** 2 / 96 + w_1 * w_2 * w_6 * w_7 * w_8 / 32 + w_1 * w_2 * w_6 * w_7 * w_9 / 32 + w_1 * w_2 * w_6 * w_8 ** 2 / 96 + w_1 * w_2 * w_6 * w_8 * w_9 / 32 + w_1 * w_2 * w_6 * w_9 ** 2 / 96 + w_1 * w_2 * w_7 ** 2 * w_8 / 96 + w_1 * w_2 * w_7 ** 2 * w_9 / 96 + w_1 * w_2 * w_7 * w_8 ** 2 / 96 + w_1 * w_2 * w_7 * w_8 * w_9 / 32 + w_1 * w_2 * w_7 * w_9 ** 2 / 96 + w_1 * w_2 * w_8 ** 2 * w_9 / 96 + w_1 * w_2 * w_8 * w_9 ** 2 / 96 - w_1 * w_3 ** 4 / 1440 + w_1 * w_3 ** 2 * w_4 ** 2 / 288 + w_1 * w_3 ** 2 * w_4 * w_5 / 96 + w_1 * w_3 ** 2 * w_4 * w_6 / 96 + w_1 * w_3 ** 2 * w_4 * w_7 / 96 + w_1 * w_3 ** 2 * w_4 * w_8 / 96 + w_1 * w_3 ** 2 * w_4 * w_9 / 96 + w_1 * w_3 ** 2 * w_5 ** 2 / 288 + w_1 * w_3 ** 2 * w_5 * w_6 / 96 + w_1 * w_3 ** 2 * w_5 * w_7 / 96 + w_1 * w_3 ** 2 * w_5 * w_8 / 96 + w_1 * w_3 ** 2 * w_5 * w_9 / 96 + w_1 * w_3 ** 2 * w_6 ** 2 / 288 + w_1 * w_3 ** 2 * w_6 * w_7 / 96 + w_1 * w_3 ** 2 * w_6 * w_8 / 96 + w_1 * w_3 ** 2 * w_6 * w_9 / 96 + w_1 * w_3 ** 2 * w_7 ** 2 / 288 + w_1 * w_3 ** 2 * w_7 * w_8 / 96 + w_1 * w_3 ** 2 * w_7 * w_9 / 96 + w_1 * w_3 ** 2 * w_8 ** 2 / 288 + w_1 * w_3 ** 2 * w_8 * w_9 / 96 + w_1 * w_3 ** 2 * w_9 ** 2 / 288 + w_1 * w_3 * w_4 ** 2 * w_5 / 96 + w_1 * w_3 * w_4 ** 2 * w_6 / 96 + w_1 * w_3 * w_4 ** 2 * w_7 / 96 + w_1 * w_3 * w_4 ** 2 * w_8 / 96 + w_1 * w_3 * w_4 ** 2 * w_9 / 96 + w_1 * w_3 * w_4 * w_5 ** 2 / 96 + w_1 * w_3 * w_4 * w_5 * w_6 / 32 + w_1 * w_3 * w_4 * w_5 * w_7 / 32 + w_1 * w_3 * w_4 * w_5 * w_8 / 32 + w_1 * w_3 * w_4 * w_5 * w_9 / 32 + w_1 * w_3 * w_4 * w_6 ** 2 / 96 + w_1 * w_3 * w_4 * w_6 * w_7 / 32 + w_1 * w_3 * w_4 * w_6 * w_8 / 32 + w_1 * w_3 * w_4 * w_6 * w_9 / 32 + w_1 * w_3 * w_4 * w_7 ** 2 / 96 + w_1 * w_3 * w_4 * w_7 * w_8 / 32 + w_1 * w_3 * w_4 * w_7 * w_9 / 32 + w_1 * w_3 * w_4 * w_8 ** 2 / 96 + w_1 * w_3 * w_4 * w_8 * w_9 / 32 + w_1 * w_3 * w_4 * w_9 ** 2 / 96 + w_1 * w_3 * w_5 ** 2 * w_6 / 96 + w_1 * w_3 * w_5 ** 2 * w_7 / 96 + w_1 * w_3 * w_5 ** 2 * w_8 / 96 + w_1 * w_3 * w_5 ** 2 * w_9 / 96 + w_1 * w_3 * w_5 * w_6 ** 2 / 96 + w_1 * w_3 * w_5 * w_6 * w_7 / 32 + w_1 * w_3 * w_5 * w_6 * w_8 / 32 + w_1 * w_3 * w_5 * w_6 * w_9 / 32 + w_1 * w_3 * w_5 * w_7 ** 2 / 96 + w_1 * w_3 * w_5 * w_7 * w_8 / 32 + w_1 * w_3 * w_5 * w_7 * w_9 / 32 + w_1 * w_3 * w_5 * w_8 ** 2 / 96 + w_1 * w_3 * w_5 * w_8 * w_9 / 32 + w_1 * w_3 * w_5 * w_9 ** 2 / 96 + w_1 * w_3 * w_6 ** 2 * w_7 / 96 + w_1 * w_3 * w_6 ** 2 * w_8 / 96 + w_1 * w_3 * w_6 ** 2 * w_9 / 96 + w_1 * w_3 * w_6 * w_7 ** 2 / 96 + w_1 * w_3 * w_6 * w_7 * w_8 / 32 + w_1 * w_3 * w_6 * w_7 * w_9 / 32 + w_1 * w_3 * w_6 * w_8 ** 2 / 96 + w_1 * w_3 * w_6 * w_8 * w_9 / 32 + w_1 * w_3 * w_6 * w_9 ** 2 / 96 + w_1 * w_3 * w_7 ** 2 * w_8 / 96 + w_1 * w_3 * w_7 ** 2 * w_9 / 96 + w_1 * w_3 * w_7 * w_8 ** 2 / 96 + w_1 * w_3 * w_7 * w_8 * w_9 / 32 + w_1 * w_3 * w_7 * w_9 ** 2 / 96 + w_1 * w_3 * w_8 ** 2 * w_9 / 96 + w_1 * w_3 * w_8 * w_9 ** 2 / 96 - w_1 * w_4 ** 4 / 1440 + w_1 * w_4 ** 2 * w_5 ** 2 / 288 + w_1 * w_4 ** 2 * w_5 * w_6 / 96 + w_1 * w_4 ** 2 * w_5 * w_7 / 96 + w_1 * w_4 ** 2 * w_5 * w_8 / 96 + w_1 * w_4 ** 2 * w_5 * w_9 / 96 + w_1 * w_4 ** 2 * w_6 ** 2 / 288 + w_1 * w_4 ** 2 * w_6 * w_7 / 96 + w_1 * w_4 ** 2 * w_6 * w_8 / 96 + w_1 * w_4 ** 2 * w_6 * w_9 / 96 + w_1 * w_4 ** 2 * w_7 ** 2 / 288 + w_1 * w_4 ** 2 * w_7 * w_8 / 96 + w_1 * w_4 ** 2 * w_7 * w_9 / 96 + w_1 * w_4 ** 2 * w_8 ** 2 / 288 + w_1 * w_4 ** 2 * w_8 * w_9 / 96 + w_1 * w_4 ** 2 * w_9 ** 2 / 288 + w_1 * w_4 * w_5 ** 2 * w_6 / 96 + w_1 * w_4 * w_5 ** 2 * w_7 / 96 + w_1 * w_4 * w_5 ** 2 * w_8 / 96 + w_1 * w_4 * w_5 ** 2 * w_9 / 96 + w_1 * w_4 * w_5 * w_6 ** 2 / 96 + w_1 * w_4 * w_5 * w_6 * w_7 / 32 + w_1 * w_4 * w_5 * w_6 * w_8 / 32 + w_1 * w_4 * w_5 * w_6 * w_9 / 32 + w_1 * w_4 * w_5 * w_7 ** 2 / 96 + w_1 * w_4 * w_5 * w_7 * w_8 / 32 + w_1 * w_4 * w_5 * w_7 * w_9 / 32 + w_1 * w_4 * w_5 * w_8 ** 2 / 96 + w_1 * w_4 * w_5 * w_8 * w_9 / 32 + w_1 * w_4 * w_5 * w_9 ** 2 / 96 + w_1 * w_4 * w_6 ** 2 * w_7 / 96 + w_1 * w_4 * w_6 ** 2 * w_8 / 96 + w_1 * w_4 * w_6 ** 2 * w_9 / 96 + w_1 * w_4 * w_6 * w_7 ** 2 / 96 + w_1 * w_4 * w_6 * w_7 * w_8 / 32 + w_1 * w_4 * w_6 * w_7 * w_9 / 32 + w_1 * w_4 * w_6 * w_8 ** 2 / 96 + w_1 * w_4 * w_6 * w_8 * w_9 / 32 + w_1 * w_4 * w_6 * w_9 ** 2 / 96 + w_1 * w_4 * w_7 ** 2 * w_8 / 96 + w_1 * w_4 * w_7 ** 2 * w_9 / 96 + w_1 * w_4 * w_7 * w_8 ** 2 / 96 + w_1 * w_4 * w_7 * w_8 * w_9 / 32 + w_1 * w_4 * w_7 * w_9 ** 2 / 96 + w_1 * w_4 * w_8 ** 2 * w_9 / 96 + w_1 * w_4 * w_8 * w_9 ** 2 / 96 - w_1 * w_5 ** 4 / 1440 + w_1 * w_5 ** 2 * w_6 ** 2 / 288 + w_1 * w_5 ** 2 * w_6 * w_7 / 96 + w_1 * w_5 ** 2 * w_6 * w_8 / 96 + w_1 * w_5 ** 2 * w_6 * w_9 / 96 + w_1 * w_5 ** 2 * w_7 ** 2 / 288 + w_1 * w_5 ** 2 * w_7 * w_8 / 96 + w_1 * w_5 ** 2 * w_7 * w_9 / 96 + w_1 * w_5 ** 2 * w_8 ** 2 / 288 + w_1 * w_5 ** 2 * w_8 * w_9 / 96 + w_1 * w_5 ** 2 * w_9 ** 2 / 288 + w_1 * w_5 * w_6 ** 2 * w_7 / 96 + w_1 * w_5 * w_6 ** 2 * w_8 / 96 + w_1 * w_5 * w_6 ** 2 * w_9 / 96 + w_1 * w_5 * w_6 * w_7 ** 2 / 96 + w_1 * w_5 * w_6 * w_7 * w_8 / 32 + w_1 * w_5 * w_6 * w_7 * w_9 / 32 + w_1 * w_5 * w_6 * w_8 ** 2 / 96 + w_1 * w_5 * w_6 * w_8 * w_9 / 32 + w_1 * w_5 * w_6 * w_9 ** 2 / 96 + w_1 * w_5 * w_7 ** 2 * w_8 / 96 + w_1 * w_5 * w_7 ** 2 * w_9 / 96 + w_1 * w_5 * w_7 * w_8 ** 2 / 96 + w_1 * w_5 * w_7 * w_8 * w_9 / 32 + w_1 * w_5 * w_7 * w_9 ** 2 / 96 + w_1 * w_5 * w_8 ** 2 * w_9 / 96 + w_1 * w_5 * w_8 * w_9 ** 2 / 96 - w_1 * w_6 ** 4 / 1440 + w_1 * w_6 ** 2 * w_7 ** 2 / 288 + w_1 * w_6 ** 2 * w_7 * w_8 / 96 + w_1 * w_6 ** 2 * w_7 * w_9 / 96 + w_1 * w_6 ** 2 * w_8 ** 2 / 288 + w_1 * w_6 ** 2 * w_8 * w_9 / 96 + w_1 * w_6 ** 2 * w_9 ** 2 / 288 + w_1 * w_6 * w_7 ** 2 * w_8 / 96 + w_1 * w_6 * w_7 ** 2 * w_9 / 96 + w_1 * w_6 * w_7 * w_8 ** 2 / 96 + w_1 * w_6 * w_7 * w_8 * w_9 / 32 + w_1 * w_6 * w_7 * w_9 ** 2 / 96 + w_1 * w_6 * w_8 ** 2 * w_9 / 96 + w_1 * w_6 * w_8 * w_9 ** 2 / 96 - w_1 * w_7 ** 4 / 1440 + w_1 * w_7 ** 2 * w_8 ** 2 / 288 + w_1 * w_7 ** 2 * w_8 * w_9 / 96 + w_1 * w_7 ** 2 * w_9 ** 2 / 288 + w_1 * w_7 * w_8 ** 2 * w_9 / 96 + w_1 * w_7 * w_8 * w_9 ** 2 / 96 - w_1 * w_8 ** 4 / 1440 + w_1 * w_8 ** 2 * w_9 ** 2 / 288 - w_1 * w_9 ** 4 / 1440 - w_2 ** 4 * w_3 / 1440 - w_2 ** 4 * w_4 / 1440 - w_2 ** 4 * w_5 / 1440 - w_2 ** 4 * w_6 / 1440 - w_2 ** 4 * w_7 / 1440 - w_2 ** 4 * w_8 / 1440 - w_2 ** 4 * w_9 / 1440 + w_2 ** 2 * w_3 ** 2 * w_4 / 288 + w_2 ** 2 * w_3 ** 2 * w_5 / 288 + w_2 ** 2 * w_3 ** 2 * w_6 / 288 + w_2 ** 2 * w_3 ** 2 * w_7 / 288 + w_2 ** 2 * w_3 ** 2 * w_8 / 288 + w_2 ** 2 * w_3 ** 2 * w_9 / 288 + w_2 ** 2 * w_3 * w_4 ** 2 / 288 + w_2 ** 2 * w_3 * w_4 * w_5 / 96 + w_2 ** 2 * w_3 * w_4 * w_6 / 96 + w_2 ** 2 * w_3 * w_4 * w_7 / 96 + w_2 ** 2 * w_3 * w_4 * w_8 / 96 + w_2 ** 2 * w_3 * w_4 * w_9 / 96 + w_2 ** 2 * w_3 * w_5 ** 2 / 288 + w_2 ** 2 * w_3 * w_5 * w_6 / 96 + w_2 ** 2 * w_3 * w_5 * w_7 / 96 + w_2 ** 2 * w_3 * w_5 * w_8 / 96 + w_2 ** 2 * w_3 * w_5 * w_9 / 96 + w_2 ** 2 * w_3 * w_6 ** 2 / 288 + w_2 ** 2 * w_3 * w_6 * w_7 / 96 + w_2 ** 2 * w_3 * w_6 * w_8 / 96 + w_2 ** 2 * w_3 * w_6 * w_9 / 96 + w_2 ** 2 * w_3 * w_7 ** 2 / 288 + w_2 ** 2 * w_3 * w_7 * w_8 / 96 + w_2 ** 2 * w_3 * w_7 * w_9 / 96 + w_2 ** 2 * w_3 * w_8 ** 2 / 288 + w_2 ** 2 * w_3 * w_8 * w_9 / 96 + w_2 ** 2 * w_3 * w_9 ** 2 / 288 + w_2 ** 2 * w_4 ** 2 * w_5 / 288 + w_2 ** 2 * w_4 ** 2 * w_6 / 288 + w_2 ** 2 * w_4 ** 2 * w_7 / 288 + w_2 ** 2 * w_4 ** 2 * w_8 / 288 + w_2 ** 2 * w_4 ** 2 * w_9 / 288 + w_2 ** 2 * w_4 * w_5 ** 2 / 288 + w_2 ** 2 * w_4 * w_5 * w_6 / 96 + w_2 ** 2 * w_4 * w_5 * w_7 / 96 + w_2 ** 2 * w_4 * w_5 * w_8 / 96 + w_2 ** 2 * w_4 * w_5 * w_9 / 96 + w_2 ** 2 * w_4 * w_6 ** 2 / 288 + w_2 ** 2 * w_4 * w_6 * w_7 / 96 + w_2 ** 2 * w_4 * w_6 * w_8 / 96 + w_2 ** 2 * w_4 * w_6 * w_9 / 96 + w_2 ** 2 * w_4 * w_7 ** 2 / 288 + w_2 ** 2 * w_4 * w_7 * w_8 / 96 + w_2 ** 2 * w_4 * w_7 * w_9 / 96 + w_2 ** 2 * w_4 * w_8 ** 2 / 288 + w_2 ** 2 * w_4 * w_8 * w_9 / 96 + w_2 ** 2 * w_4 * w_9 ** 2 / 288 + w_2 ** 2 * w_5 ** 2 * w_6 / 288 + w_2 ** 2 * w_5 ** 2 * w_7 / 288 + w_2 ** 2 * w_5 ** 2 * w_8 / 288 + w_2 ** 2 * w_5 ** 2 * w_9 / 288 + w_2 ** 2 * w_5 * w_6 ** 2 / 288 + w_2 ** 2 * w_5 * w_6 * w_7 / 96 + w_2 ** 2 * w_5 * w_6 * w_8 / 96 + w_2 ** 2 * w_5 * w_6 * w_9 / 96 + w_2 ** 2 * w_5 * w_7 ** 2 / 288 + w_2 ** 2 * w_5 * w_7 * w_8 / 96 + w_2 ** 2 * w_5 * w_7 * w_9 / 96 + w_2 ** 2 * w_5 * w_8 ** 2 / 288 + w_2 ** 2 * w_5 * w_8 * w_9 / 96 + w_2 ** 2 * w_5 * w_9 ** 2 / 288 + w_2 ** 2 * w_6 ** 2 * w_7 / 288 + w_2 ** 2 * w_6 ** 2 * w_8 / 288 + w_2 ** 2 * w_6 ** 2 * w_9 / 288 + w_2 ** 2 * w_6 * w_7 ** 2 / 288 + w_2 ** 2 * w_6 * w_7 * w_8 / 96 + w_2 ** 2 * w_6 * w_7 * w_9 / 96 + w_2 ** 2 * w_6 * w_8 ** 2 / 288 + w_2 ** 2 * w_6 * w_8 * w_9 / 96 + w_2 ** 2 * w_6 * w_9 ** 2 / 288 + w_2 ** 2 * w_7 ** 2 * w_8 / 288 + w_2 ** 2 * w_7 ** 2 * w_9 / 288 + w_2 ** 2 * w_7 * w_8 ** 2 / 288 + w_2 ** 2 * w_7 * w_8 * w_9 / 96 + w_2 ** 2 * w_7 * w_9 ** 2 / 288 + w_2 ** 2 * w_8 ** 2 * w_9 / 288 + w_2 ** 2 * w_8 * w_9 ** 2 / 288 - w_2 * w_3 ** 4 / 1440 + w_2 * w_3 ** 2 * w_4 ** 2 / 288 + w_2 * w_3 ** 2 * w_4 * w_5 / 96 + w_2 * w_3 ** 2 * w_4 * w_6 / 96 + w_2 * w_3 ** 2 * w_4 * w_7 / 96 + w_2 * w_3 ** 2 * w_4 * w_8 / 96 + w_2 * w_3 ** 2 * w_4 * w_9 / 96 + w_2 * w_3 ** 2 * w_5 ** 2 / 288 + w_2 * w_3 ** 2 * w_5 * w_6 / 96 + w_2 * w_3 ** 2 * w_5 * w_7 / 96 + w_2 * w_3 ** 2 * w_5 * w_8 / 96 + w_2 * w_3 ** 2 * w_5 * w_9 / 96 + w_2 * w_3 ** 2 * w_6 ** 2 / 288 + w_2 * w_3 ** 2 * w_6 * w_7 / 96 + w_2 * w_3 ** 2 * w_6 * w_8 / 96 + w_2 * w_3 ** 2 * w_6 * w_9 / 96 + w_2 * w_3 ** 2 * w_7 ** 2 / 288 + w_2 * w_3 ** 2 * w_7 * w_8 / 96 + w_2 * w_3 ** 2 * w_7 * w_9 / 96 + w_2 * w_3 ** 2 * w_8 ** 2 / 288 + w_2 * w_3 ** 2 * w_8 * w_9 / 96 + w_2 * w_3 ** 2 * w_9 ** 2 / 288 + w_2 * w_3 * w_4 ** 2 * w_5 / 96 + w_2 * w_3 * w_4 ** 2 * w_6 / 96 + w_2 * w_3 * w_4 ** 2 * w_7 / 96 + w_2 * w_3 * w_4 ** 2 * w_8 / 96 + w_2 * w_3 * w_4 ** 2 * w_9 / 96 + w_2 * w_3 * w_4 * w_5 ** 2 / 96 + w_2 * w_3 * w_4 * w_5 * w_6 / 32 + w_2 * w_3 * w_4 * w_5 * w_7 / 32 + w_2 * w_3 * w_4 * w_5 * w_8 / 32 + w_2 * w_3 * w_4 * w_5 * w_9 / 32 + w_2 * w_3 * w_4 * w_6 ** 2 / 96 + w_2 * w_3 * w_4 * w_6 * w_7 / 32 + w_2 * w_3 * w_4 * w_6 * w_8 / 32 + w_2 * w_3 * w_4 * w_6 * w_9 / 32 + w_2 * w_3 * w_4 * w_7 ** 2 / 96 + w_2 * w_3 * w_4 * w_7 * w_8 / 32 + w_2 * w_3 * w_4 * w_7 * w_9 / 32 + w_2 * w_3 * w_4 * w_8 ** 2 / 96 + w_2 * w_3 * w_4 * w_8 * w_9 / 32 + w_2 * w_3 * w_4 * w_9 ** 2 / 96 + w_2 * w_3 * w_5 ** 2 * w_6 / 96 + w_2 * w_3 * w_5 ** 2 * w_7 / 96 + w_2 * w_3 * w_5 ** 2 * w_8 / 96 + w_2 * w_3 * w_5 ** 2 * w_9 / 96 + w_2 * w_3 * w_5 * w_6 ** 2 / 96 + w_2 * w_3 * w_5 * w_6 * w_7 / 32 + w_2 * w_3 * w_5 * w_6 * w_8 / 32 + w_2 * w_3 * w_5 * w_6 * w_9 / 32 + w_2 * w_3 * w_5 * w_7 ** 2 / 96 + w_2 * w_3 * w_5 * w_7 * w_8 / 32 + w_2 * w_3 * w_5 * w_7 * w_9 / 32 + w_2 * w_3 * w_5 * w_8 ** 2 / 96 + w_2 * w_3 * w_5 * w_8 * w_9 / 32 + w_2 * w_3 * w_5 * w_9 ** 2 / 96 + w_2 * w_3 * w_6 ** 2 * w_7 / 96 + w_2 * w_3 * w_6 ** 2 * w_8 / 96 + w_2 * w_3 * w_6 ** 2 * w_9 / 96 + w_2 * w_3 * w_6 * w_7 ** 2 / 96 + w_2 * w_3 * w_6 * w_7 * w_8 / 32 + w_2 * w_3 * w_6 * w_7 * w_9 / 32 + w_2 * w_3 * w_6 * w_8 ** 2 / 96 + w_2 * w_3 * w_6 * w_8 * w_9 / 32 + w_2 * w_3 * w_6 * w_9 ** 2 / 96 + w_2 * w_3 * w_7 ** 2 * w_8 / 96 + w_2 * w_3 * w_7 ** 2 * w_9 / 96 + w_2 * w_3 * w_7 * w_8 ** 2 / 96 + w_2 * w_3 * w_7 * w_8 * w_9 / 32 + w_2 * w_3 * w_7 * w_9 ** 2 / 96 + w_2 * w_3 * w_8 ** 2 * w_9 / 96 + w_2 * w_3 * w_8 * w_9 ** 2 / 96 - w_2 * w_4 ** 4 / 1440 + w_2 * w_4 ** 2 * w_5 ** 2 / 288 + w_2 * w_4 ** 2 * w_5 * w_6 / 96 + w_2 * w_4 ** 2 * w_5 * w_7 / 96 + w_2 * w_4 ** 2 * w_5 * w_8 / 96 + w_2 * w_4 ** 2 * w_5 * w_9 / 96 + w_2 * w_4 ** 2 * w_6 ** 2 / 288 + w_2 * w_4 ** 2 * w_6 * w_7 / 96 + w_2 * w_4 ** 2 * w_6 * w_8 / 96 + w_2 * w_4 ** 2 * w_6 * w_9 / 96 + w_2 * w_4 ** 2 * w_7 ** 2 / 288 + w_2 * w_4 ** 2 * w_7 * w_8 / 96 + w_2 * w_4 ** 2 * w_7 * w_9 / 96 + w_2 * w_4 ** 2 * w_8 ** 2 / 288 + w_2 * w_4 ** 2 * w_8 * w_9 / 96 + w_2 * w_4 ** 2 * w_9 ** 2 / 288 + w_2 * w_4 * w_5 ** 2 * w_6 / 96 + w_2 * w_4 * w_5 ** 2 * w_7 / 96 + w_2 * w_4 * w_5 ** 2 * w_8 / 96 + w_2 * w_4 * w_5 ** 2 * w_9 / 96 + w_2 * w_4 * w_5 * w_6 ** 2 / 96 + w_2 * w_4 * w_5 * w_6 * w_7 / 32 + w_2 * w_4 * w_5 * w_6 * w_8 / 32 + w_2 * w_4 * w_5 * w_6 * w_9 / 32 + w_2 * w_4 * w_5 * w_7 ** 2 / 96 + w_2 * w_4 * w_5 * w_7 * w_8 / 32 + w_2 * w_4 * w_5 * w_7 * w_9 / 32 + w_2 * w_4 * w_5 * w_8 ** 2 / 96 + w_2 * w_4 * w_5 * w_8 * w_9 / 32 + w_2 * w_4 * w_5 * w_9 ** 2 / 96 + w_2 * w_4 * w_6 ** 2 * w_7 / 96 + w_2 * w_4 * w_6 ** 2 * w_8 / 96 + w_2 * w_4 * w_6 ** 2 * w_9 / 96 + w_2 * w_4 * w_6 * w_7 ** 2 / 96 + w_2 * w_4 * w_6 * w_7 * w_8 / 32 + w_2 * w_4 * w_6 * w_7 * w_9 / 32 + w_2 * w_4 * w_6 * w_8 ** 2 / 96 + w_2 * w_4 * w_6 * w_8 * w_9 / 32 + w_2 * w_4 * w_6 * w_9 ** 2 / 96 + w_2 * w_4 * w_7 ** 2 * w_8 / 96 + w_2 * w_4 * w_7 ** 2 * w_9 / 96 + w_2 * w_4 * w_7 * w_8 ** 2 / 96 + w_2 * w_4 * w_7 * w_8 * w_9 / 32 + w_2 * w_4 * w_7 * w_9 ** 2 / 96 + w_2 * w_4 * w_8 ** 2 * w_9 / 96 + w_2 * w_4 * w_8 * w_9 ** 2 / 96 - w_2 * w_5 ** 4 / 1440 + w_2 * w_5 ** 2 * w_6 ** 2 / 288 + w_2 * w_5 ** 2 * w_6 * w_7 / 96 + w_2 * w_5 ** 2 * w_6 * w_8 / 96 + w_2 * w_5 ** 2 * w_6 * w_9 / 96 + w_2 * w_5 ** 2 * w_7 ** 2 / 288 + w_2 * w_5 ** 2 * w_7 * w_8 / 96 + w_2 * w_5 ** 2 * w_7 * w_9 / 96 + w_2 * w_5 ** 2 * w_8 ** 2 / 288 + w_2 * w_5 ** 2 * w_8 * w_9 / 96 + w_2 * w_5 ** 2 * w_9 ** 2 / 288 + w_2 * w_5 * w_6 ** 2 * w_7 / 96 + w_2 * w_5 * w_6 ** 2 * w_8 / 96 + w_2 * w_5 * w_6 ** 2 * w_9 / 96 + w_2 * w_5 * w_6 * w_7 ** 2 / 96 + w_2 * w_5 * w_6 * w_7 * w_8 / 32 + w_2 * w_5 * w_6 * w_7 * w_9 / 32 + w_2 * w_5 * w_6 * w_8 ** 2 / 96 + w_2 * w_5 * w_6 * w_8 * w_9 / 32 + w_2 * w_5 * w_6 * w_9 ** 2 / 96 + w_2 * w_5 * w_7 ** 2 * w_8 / 96 + w_2 * w_5 * w_7 ** 2 * w_9 / 96 + w_2 * w_5 * w_7 * w_8 ** 2 / 96 + w_2 * w_5 * w_7 * w_8 * w_9 / 32 + w_2 * w_5 * w_7 * w_9 ** 2 / 96 + w_2 * w_5 * w_8 ** 2 * w_9 / 96 + w_2 * w_5 * w_8 * w_9 ** 2 / 96 - w_2 * w_6 ** 4 / 1440 + w_2 * w_6 ** 2 * w_7 ** 2 / 288 + w_2 * w_6 ** 2 * w_7 * w_8 / 96 + w_2 * w_6 ** 2 * w_7 * w_9 / 96 + w_2 * w_6 ** 2 * w_8 ** 2 / 288 + w_2 * w_6 ** 2 * w_8 * w_9 / 96 + w_2 * w_6 ** 2 * w_9 ** 2 / 288 + w_2 * w_6 * w_7 ** 2 * w_8 / 96 + w_2 * w_6 * w_7 ** 2 * w_9 / 96 + w_2 * w_6 * w_7 * w_8 ** 2 / 96 + w_2 * w_6 * w_7 * w_8 * w_9 / 32 + w_2 * w_6 * w_7 * w_9 ** 2 / 96 + w_2 * w_6 * w_8 ** 2 * w_9 / 96 + w_2 * w_6 * w_8 * w_9 ** 2 / 96 - w_2 * w_7 ** 4 / 1440 + w_2 * w_7 ** 2 * w_8 ** 2 / 288 + w_2 * w_7 ** 2 * w_8 * w_9 / 96 + w_2 * w_7 ** 2 * w_9 ** 2 / 288 + w_2 * w_7 * w_8 ** 2 * w_9 / 96 + w_2 * w_7 * w_8 * w_9 ** 2 / 96 - w_2 * w_8 ** 4 / 1440 + w_2 * w_8 ** 2 * w_9 ** 2 / 288 - w_2 * w_9 ** 4 / 1440 - w_3 ** 4 * w_4 / 1440 - w_3 ** 4 * w_5 / 1440 - w_3 ** 4 * w_6 / 1440 - w_3 ** 4 * w_7 / 1440 - w_3 ** 4 * w_8 / 1440 - w_3 ** 4 * w_9 / 1440 + w_3 ** 2 * w_4 ** 2 * w_5 / 288 + w_3 ** 2 * w_4 ** 2 * w_6 / 288 + w_3 ** 2 * w_4 ** 2 * w_7 / 288 + w_3 ** 2 * w_4 ** 2 * w_8 / 288 + w_3 ** 2 * w_4 ** 2 * w_9 / 288 + w_3 ** 2 * w_4 * w_5 ** 2 / 288 + w_3 ** 2 * w_4 * w_5 * w_6 / 96 + w_3 ** 2 * w_4 * w_5 * w_7 / 96 + w_3 ** 2 * w_4 * w_5 * w_8 / 96 + w_3 ** 2 * w_4 * w_5 * w_9 / 96 + w_3 ** 2 * w_4 * w_6 ** 2 / 288 + w_3 ** 2 * w_4 * w_6 * w_7 / 96 + w_3 ** 2 * w_4 * w_6 * w_8 / 96 + w_3 ** 2 * w_4 * w_6 * w_9 / 96 + w_3 ** 2 * w_4 * w_7 ** 2 / 288 + w_3 ** 2 * w_4 * w_7 * w_8 / 96 + w_3 ** 2 * w_4 * w_7 * w_9 / 96 + w_3 ** 2 * w_4 * w_8 ** 2 / 288 + w_3 ** 2 * w_4 * w_8 * w_9 / 96 + w_3 ** 2 * w_4 * w_9 ** 2 / 288 + w_3 ** 2 * w_5 ** 2 * w_6 / 288 + w_3 ** 2 * w_5 ** 2 * w_7 / 288 + w_3 ** 2 * w_5 ** 2 * w_8 / 288 + w_3 ** 2 * w_5 ** 2 * w_9 / 288 + w_3 ** 2 * w_5 * w_6 ** 2 / 288 + w_3 ** 2 * w_5 * w_6 * w_7 / 96 + w_3 ** 2 * w_5 * w_6 * w_8 / 96 + w_3 ** 2 * w_5 * w_6 * w_9 / 96 + w_3 ** 2 * w_5 * w_7 ** 2 / 288 + w_3 ** 2 * w_5 * w_7 * w_8 / 96 + w_3 ** 2 * w_5 * w_7 * w_9 / 96 + w_3 ** 2 * w_5 * w_8 ** 2 / 288 + w_3 ** 2 * w_5 * w_8 * w_9 / 96 + w_3 ** 2 * w_5 * w_9 ** 2 / 288 + w_3 ** 2 * w_6 ** 2 * w_7 / 288 + w_3 ** 2 * w_6 ** 2 * w_8 / 288 + w_3 ** 2 * w_6 ** 2 * w_9 / 288 + w_3 ** 2 * w_6 * w_7 ** 2 / 288 + w_3 ** 2 * w_6 * w_7 * w_8 / 96 + w_3 ** 2 * w_6 * w_7 * w_9 / 96 + w_3 ** 2 * w_6 * w_8 ** 2 / 288 + w_3 ** 2 * w_6 * w_8 * w_9 / 96 + w_3 ** 2 * w_6 * w_9 ** 2 / 288 + w_3 ** 2 * w_7 ** 2 * w_8 / 288 + w_3 ** 2 * w_7 ** 2 * w_9 / 288 + w_3 ** 2 * w_7 * w_8 ** 2 / 288 + w_3 ** 2 * w_7 * w_8 * w_9 / 96 + w_3 ** 2 * w_7 * w_9 ** 2 / 288 + w_3 ** 2 * w_8 ** 2 * w_9 / 288 + w_3 ** 2 * w_8 * w_9 ** 2 / 288 - w_3 * w_4 ** 4 / 1440 + w_3 * w_4 ** 2 * w_5 ** 2 / 288 + w_3 * w_4 ** 2 * w_5 * w_6 / 96 + w_3 * w_4 ** 2 * w_5 * w_7 / 96 + w_3 * w_4 ** 2 * w_5 * w_8 / 96 + w_3 * w_4 ** 2 * w_5 * w_9 / 96 + w_3 * w_4 ** 2 * w_6 ** 2 / 288 + w_3 * w_4 ** 2 * w_6 * w_7 / 96 + w_3 * w_4 ** 2 * w_6 * w_8 / 96 + w_3 * w_4 ** 2 * w_6 * w_9 / 96 + w_3 * w_4 ** 2 * w_7 ** 2 / 288 + w_3 * w_4 ** 2 * w_7 * w_8 / 96 + w_3 * w_4 ** 2 * w_7 * w_9 / 96 + w_3 * w_4 ** 2 * w_8 ** 2 / 288 + w_3 * w_4 ** 2 * w_8 * w_9 / 96 + w_3 * w_4 ** 2 * w_9 ** 2 / 288 + w_3 * w_4 * w_5 ** 2 * w_6 / 96 + w_3 * w_4 * w_5 ** 2 * w_7 / 96 + w_3 * w_4 * w_5 ** 2 * w_8 / 96 + w_3 * w_4 * w_5 ** 2 * w_9 / 96 + w_3 * w_4 * w_5 * w_6 ** 2 / 96 + w_3 * w_4 * w_5 * w_6 * w_7 / 32 + w_3 * w_4 * w_5 * w_6 * w_8 / 32 + w_3 * w_4 * w_5 * w_6 * w_9 / 32 + w_3 * w_4 * w_5 * w_7 ** 2 / 96 + w_3 * w_4 * w_5 * w_7 * w_8 / 32 + w_3 * w_4 * w_5 * w_7 * w_9 / 32 + w_3 * w_4 * w_5 * w_8 ** 2 / 96 + w_3 * w_4 * w_5 * w_8 * w_9 / 32 + w_3 * w_4 * w_5 * w_9 ** 2 / 96 + w_3 * w_4 * w_6 ** 2 * w_7 / 96 + w_3 * w_4 * w_6 ** 2 * w_8 / 96 + w_3 * w_4 * w_6 ** 2 * w_9 / 96 + w_3 * w_4 * w_6 * w_7 ** 2 / 96 + w_3 * w_4 * w_6 * w_7 * w_8 / 32 + w_3 * w_4 * w_6 * w_7 * w_9 / 32 + w_3 * w_4 * w_6 * w_8 ** 2 / 96 + w_3 * w_4 * w_6 * w_8 * w_9 / 32 + w_3 * w_4 * w_6 * w_9 ** 2 / 96 + w_3 * w_4 * w_7 ** 2 * w_8 / 96 + w_3 * w_4 * w_7 ** 2 * w_9 / 96 + w_3 * w_4 * w_7 * w_8 ** 2 / 96 + w_3 * w_4 * w_7 * w_8 * w_9 / 32 + w_3 * w_4 * w_7 * w_9 ** 2 / 96 + w_3 * w_4 * w_8 ** 2 * w_9 / 96 + w_3 * w_4 * w_8 * w_9 ** 2 / 96 - w_3 * w_5 ** 4 / 1440 + w_3 * w_5 ** 2 * w_6 ** 2 / 288 + w_3 * w_5 ** 2 * w_6 * w_7 / 96 + w_3 * w_5 ** 2 * w_6 * w_8 / 96 + w_3 * w_5 ** 2 * w_6 * w_9 / 96 + w_3 * w_5 ** 2 * w_7 ** 2 / 288 + w_3 * w_5 ** 2 * w_7 * w_8 / 96 + w_3 * w_5 ** 2 * w_7 * w_9 / 96 + w_3 * w_5 ** 2 * w_8 ** 2 / 288 + w_3 * w_5 ** 2 * w_8 * w_9 / 96 + w_3 * w_5 ** 2 * w_9 ** 2 / 288 + w_3 * w_5 * w_6 ** 2 * w_7 / 96 + w_3 * w_5 * w_6 ** 2 * w_8 / 96 + w_3 * w_5 * w_6 ** 2 * w_9 / 96 + w_3 * w_5 * w_6 * w_7 ** 2 / 96 + w_3 * w_5 * w_6 * w_7 * w_8 / 32 + w_3 * w_5 * w_6 * w_7 * w_9 / 32 + w_3 * w_5 * w_6 * w_8 ** 2 / 96 + w_3 * w_5 * w_6 * w_8 * w_9 / 32 + w_3 * w_5 * w_6 * w_9 ** 2 / 96 + w_3 * w_5 * w_7 ** 2 * w_8 / 96 + w_3 * w_5 * w_7 ** 2 * w_9 / 96 + w_3 * w_5 * w_7 * w_8 ** 2 / 96 + w_3 * w_5 * w_7 * w_8 * w_9 / 32 + w_3 * w_5 * w_7 * w_9 ** 2 / 96 + w_3 * w_5 * w_8 ** 2 * w_9 / 96 + w_3 * w_5 * w_8 * w_9 ** 2 / 96 - w_3 * w_6 ** 4 / 1440 + w_3 * w_6 ** 2 * w_7 ** 2 / 288 + w_3 * w_6 ** 2 * w_7 * w_8 / 96 + w_3 * w_6 ** 2 * w_7 * w_9 / 96 + w_3 * w_6 ** 2 * w_8 ** 2 / 288 + w_3 * w_6 ** 2 * w_8 * w_9 / 96 + w_3 * w_6 ** 2 * w_9 ** 2 / 288 + w_3 * w_6 * w_7 ** 2 * w_8 / 96 + w_3 * w_6 * w_7 ** 2 * w_9 / 96 + w_3 * w_6 * w_7 * w_8 ** 2 / 96 + w_3 * w_6 * w_7 * w_8 * w_9 / 32 + w_3 * w_6 * w_7 * w_9 ** 2 / 96 + w_3 * w_6 * w_8 ** 2 * w_9 / 96 + w_3 * w_6 * w_8 * w_9 ** 2 / 96 - w_3 * w_7 ** 4 / 1440 + w_3 * w_7 ** 2 * w_8 ** 2 / 288 + w_3 * w_7 ** 2 * w_8 * w_9 / 96 + w_3 * w_7 ** 2 * w_9 ** 2 / 288 + w_3 * w_7 * w_8 ** 2 * w_9 / 96 + w_3 * w_7 * w_8 * w_9 ** 2 / 96 - w_3 * w_8 ** 4 / 1440 + w_3 * w_8 ** 2 * w_9 ** 2 / 288 - w_3 * w_9 ** 4 / 1440 - w_4 ** 4 * w_5 / 1440 - w_4 ** 4 * w_6 / 1440 - w_4 ** 4 * w_7 / 1440 - w_4 ** 4 * w_8 / 1440 - w_4 ** 4 * w_9 / 1440 + w_4 ** 2 * w_5 ** 2 * w_6 / 288 + w_4 ** 2 * w_5 ** 2 * w_7 / 288 + w_4 ** 2 * w_5 ** 2 * w_8 / 288 + w_4 ** 2 * w_5 ** 2 * w_9 / 288 + w_4 ** 2 * w_5 * w_6 ** 2 / 288 + w_4 ** 2 * w_5 * w_6 * w_7 / 96 + w_4 ** 2 * w_5 * w_6 * w_8 / 96 + w_4 ** 2 * w_5 * w_6 * w_9 / 96 + w_4 ** 2 * w_5 * w_7 ** 2 / 288 + w_4 ** 2 * w_5 * w_7 * w_8 / 96 + w_4 ** 2 * w_5 * w_7 * w_9 / 96 + w_4 ** 2 * w_5 * w_8 ** 2 / 288 + w_4 ** 2 * w_5 * w_8 * w_9 / 96 + w_4 ** 2 * w_5 * w_9 ** 2 / 288 + w_4 ** 2 * w_6 ** 2 * w_7 / 288 + w_4 ** 2 * w_6 ** 2 * w_8 / 288 + w_4 ** 2 * w_6 ** 2 * w_9 / 288 + w_4 ** 2 * w_6 * w_7 ** 2 / 288 + w_4 ** 2 * w_6 * w_7 * w_8 / 96 + w_4 ** 2 * w_6 * w_7 * w_9 / 96 + w_4 ** 2 * w_6 * w_8 ** 2 / 288 + w_4 ** 2 * w_6 * w_8 * w_9 / 96 + w_4 ** 2 * w_6 * w_9 ** 2 / 288 + w_4 ** 2 * w_7 ** 2 * w_8 / 288 + w_4 ** 2 * w_7 ** 2 * w_9 / 288 + w_4 ** 2 * w_7 * w_8 ** 2 / 288 + w_4 ** 2 * w_7 * w_8 * w_9 / 96 + w_4 ** 2 * w_7 * w_9 ** 2 / 288 + w_4 ** 2 * w_8 ** 2 * w_9 / 288 + w_4 ** 2 * w_8 * w_9 ** 2 / 288 - w_4 * w_5 ** 4 / 1440 + w_4 * w_5 ** 2 * w_6 ** 2 / 288 + w_4 * w_5 ** 2 * w_6 * w_7 / 96 + w_4 * w_5 ** 2 * w_6 * w_8 / 96 + w_4 * w_5 ** 2 * w_6 * w_9 / 96 + w_4 * w_5 ** 2 * w_7 ** 2 / 288 + w_4 * w_5 ** 2 * w_7 * w_8 / 96 + w_4 * w_5 ** 2 * w_7 * w_9 / 96 + w_4 * w_5 ** 2 * w_8 ** 2 / 288 + w_4 * w_5 ** 2 * w_8 * w_9 / 96 + w_4 * w_5 ** 2 * w_9 ** 2 / 288 + w_4 * w_5 * w_6 ** 2 * w_7 / 96 + w_4 * w_5 * w_6 ** 2 * w_8 / 96 + w_4 * w_5 * w_6 ** 2 * w_9 / 96 + w_4 * w_5 * w_6 * w_7 ** 2 / 96 + w_4 * w_5 * w_6 * w_7 * w_8 / 32 + w_4 * w_5 * w_6 * w_7 * w_9 / 32 + w_4 * w_5 * w_6 * w_8 ** 2 / 96 + w_4 * w_5 * w_6 * w_8 * w_9 / 32 + w_4 * w_5 * w_6 * w_9 ** 2 / 96 + w_4 * w_5 * w_7 ** 2 * w_8 / 96 + w_4 * w_5 * w_7 ** 2 * w_9 / 96 + w_4 * w_5 * w_7 * w_8 ** 2 / 96 + w_4 * w_5 * w_7 * w_8 * w_9 / 32 + w_4 * w_5 * w_7 * w_9 ** 2 / 96 + w_4 * w_5 * w_8 ** 2 * w_9 / 96 + w_4 * w_5 * w_8 * w_9 ** 2 / 96 - w_4 * w_6 ** 4 / 1440 + w_4 * w_6 ** 2 * w_7 ** 2 / 288 + w_4 * w_6 ** 2 * w_7 * w_8 / 96 + w_4 * w_6 ** 2 * w_7 * w_9 / 96 + w_4 * w_6 ** 2 * w_8 ** 2 / 288 + w_4 * w_6 ** 2 * w_8 * w_9 / 96 + w_4 * w_6 ** 2 * w_9 ** 2 / 288 + w_4 * w_6 * w_7 ** 2 * w_8 / 96 + w_4 * w_6 * w_7 ** 2 * w_9 / 96 + w_4 * w_6 * w_7 * w_8 ** 2 / 96 + w_4 * w_6 * w_7 * w_8 * w_9 / 32 + w_4 * w_6 * w_7 * w_9 ** 2 / 96 + w_4 * w_6 * w_8 ** 2 * w_9 / 96 + w_4 * w_6 * w_8 * w_9 ** 2 / 96 - w_4 * w_7 ** 4 / 1440 + w_4 * w_7 ** 2 * w_8 ** 2 / 288 + w_4 * w_7 ** 2 * w_8 * w_9 / 96 + w_4 * w_7 ** 2 * w_9 ** 2 / 288 + w_4 * w_7 * w_8 ** 2 * w_9 / 96 + w_4 * w_7 * w_8 * w_9 ** 2 / 96 - w_4 * w_8 ** 4 / 1440 + w_4 * w_8 ** 2 * w_9 ** 2 / 288 - w_4 * w_9 ** 4 / 1440 - w_5 ** 4 * w_6 / 1440 - w_5 ** 4 * w_7 / 1440 - w_5 ** 4 * w_8 / 1440 - w_5 ** 4 * w_9 / 1440 + w_5 ** 2 * w_6 ** 2 * w_7 / 288 + w_5 ** 2 * w_6 ** 2 * w_8 / 288 + w_5 ** 2 * w_6 ** 2 * w_9 / 288 + w_5 ** 2 * w_6 * w_7 ** 2 / 288 + w_5 ** 2 * w_6 * w_7 * w_8 / 96 + w_5 ** 2 * w_6 * w_7 * w_9 / 96 + w_5 ** 2 * w_6 * w_8 ** 2 / 288 + w_5 ** 2 * w_6 * w_8 * w_9 / 96 + w_5 ** 2 * w_6 * w_9 ** 2 / 288 + w_5 ** 2 * w_7 ** 2 * w_8 / 288 + w_5 ** 2 * w_7 ** 2 * w_9 / 288 + w_5 ** 2 * w_7 * w_8 ** 2 / 288 + w_5 ** 2 * w_7 * w_8 * w_9 / 96 + w_5 ** 2 * w_7 * w_9 ** 2 / 288 + w_5 ** 2 * w_8 ** 2 * w_9 / 288 + w_5 ** 2 * w_8 * w_9 ** 2 / 288 - w_5 * w_6 ** 4 / 1440 + w_5 * w_6 ** 2 * w_7 ** 2 / 288 + w_5 * w_6 ** 2 * w_7 * w_8 / 96 + w_5 * w_6 ** 2 * w_7 * w_9 / 96 + w_5 * w_6 ** 2 * w_8 ** 2 / 288 + w_5 * w_6 ** 2 * w_8 * w_9 / 96 + w_5 * w_6 ** 2 * w_9 ** 2 / 288 + w_5 * w_6 * w_7 ** 2 * w_8 / 96 + w_5 * w_6 * w_7 ** 2 * w_9 / 96 + w_5 * w_6 * w_7 * w_8 ** 2 / 96 + w_5 * w_6 * w_7 * w_8 * w_9 / 32 + w_5 * w_6 * w_7 * w_9 ** 2 / 96 + w_5 * w_6 * w_8 ** 2 * w_9 / 96 + w_5 * w_6 * w_8 * w_9 ** 2 / 96 - w_5 * w_7 ** 4 / 1440 + w_5 * w_7 ** 2 * w_8 ** 2 / 288 + w_5 * w_7 ** 2 * w_8 * w_9 / 96 + w_5 * w_7 ** 2 * w_9 ** 2 / 288 + w_5 * w_7 * w_8 ** 2 * w_9 / 96 + w_5 * w_7 * w_8 * w_9 ** 2 / 96 - w_5 * w_8 ** 4 / 1440 + w_5 * w_8 ** 2 * w_9 ** 2 / 288 - w_5 * w_9 ** 4 / 1440 - w_6 ** 4 * w_7 / 1440 - w_6 ** 4 * w_8 / 1440 - w_6 ** 4 * w_9 / 1440 + w_6 ** 2 * w_7 ** 2 * w_8 / 288 + w_6 ** 2 * w_7 ** 2 * w_9 / 288 + w_6 ** 2 * w_7 * w_8 ** 2 / 288 + w_6 ** 2 * w_7 * w_8 * w_9 / 96 + w_6 ** 2 * w_7 * w_9 ** 2 / 288 + w_6 ** 2 * w_8 ** 2 * w_9 / 288 + w_6 ** 2 * w_8 * w_9 ** 2 / 288 - w_6 * w_7 ** 4 / 1440 + w_6 * w_7 ** 2 * w_8 ** 2 / 288 + w_6 * w_7 ** 2 * w_8 * w_9 / 96 + w_6 * w_7 ** 2 * w_9 ** 2 / 288 + w_6 * w_7 * w_8 ** 2 * w_9 / 96 + w_6 * w_7 * w_8 * w_9 ** 2 / 96 - w_6 * w_8 ** 4 / 1440 + w_6 * w_8 ** 2 * w_9 ** 2 / 288 - w_6 * w_9 ** 4 / 1440 - w_7 ** 4 * w_8 / 1440 - w_7 ** 4 * w_9 / 1440 + w_7 ** 2 * w_8 ** 2 * w_9 / 288 + w_7 ** 2 * w_8 * w_9 ** 2 / 288 - w_7 * w_8 ** 4 / 1440 + w_7 * w_8 ** 2 * w_9 ** 2 / 288 - w_7 * w_9 ** 4 / 1440 - w_8 ** 4 * w_9 / 1440 - w_8 * w_9 ** 4 / 1440
-    if s == 6 and ln == 8:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        return w_1 ** 6 / 30240 - w_1 ** 4 * w_2 ** 2 / 8640 - w_1 ** 4 * w_2 * w_3 / 2880 - w_1 ** 4 * w_2 * w_4 / 2880 - w_1 ** 4 * w_2 * w_5 / 2880 - w_1 ** 4 * w_2 * w_6 / 2880 - w_1 ** 4 * w_2 * w_7 / 2880 - w_1 ** 4 * w_2 * w_8 / 2880 - w_1 ** 4 * w_3 ** 2 / 8640 - w_1 ** 4 * w_3 * w_4 / 2880 - w_1 ** 4 * w_3 * w_5 / 2880 - w_1 ** 4 * w_3 * w_6 / 2880 - w_1 ** 4 * w_3 * w_7 / 2880 - w_1 ** 4 * w_3 * w_8 / 2880 - w_1 ** 4 * w_4 ** 2 / 8640 - w_1 ** 4 * w_4 * w_5 / 2880 - w_1 ** 4 * w_4 * w_6 / 2880 - w_1 ** 4 * w_4 * w_7 / 2880 - w_1 ** 4 * w_4 * w_8 / 2880 - w_1 ** 4 * w_5 ** 2 / 8640 - w_1 ** 4 * w_5 * w_6 / 2880 - w_1 ** 4 * w_5 * w_7 / 2880 - w_1 ** 4 * w_5 * w_8 / 2880 - w_1 ** 4 * w_6 ** 2 / 8640 - w_1 ** 4 * w_6 * w_7 / 2880 - w_1 ** 4 * w_6 * w_8 / 2880 - w_1 ** 4 * w_7 ** 2 / 8640 - w_1 ** 4 * w_7 * w_8 / 2880 - w_1 ** 4 * w_8 ** 2 / 8640 - w_1 ** 2 * w_2 ** 4 / 8640 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_6 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_7 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_8 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 * w_6 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 * w_7 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 * w_8 / 576 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_5 * w_6 / 576 + w_1 ** 2 * w_2 ** 2 * w_5 * w_7 / 576 + w_1 ** 2 * w_2 ** 2 * w_5 * w_8 / 576 + w_1 ** 2 * w_2 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_6 * w_7 / 576 + w_1 ** 2 * w_2 ** 2 * w_6 * w_8 / 576 + w_1 ** 2 * w_2 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_7 * w_8 / 576 + w_1 ** 2 * w_2 ** 2 * w_8 ** 2 / 1728 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_6 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_7 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_8 / 576 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 / 192 + w_1 ** 2 * w_2 * w_3 * w_4 * w_6 / 192 + w_1 ** 2 * w_2 * w_3 * w_4 * w_7 / 192 + w_1 ** 2 * w_2 * w_3 * w_4 * w_8 / 192 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_5 * w_6 / 192 + w_1 ** 2 * w_2 * w_3 * w_5 * w_7 / 192 + w_1 ** 2 * w_2 * w_3 * w_5 * w_8 / 192 + w_1 ** 2 * w_2 * w_3 * w_6 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_6 * w_7 / 192 + w_1 ** 2 * w_2 * w_3 * w_6 * w_8 / 192 + w_1 ** 2 * w_2 * w_3 * w_7 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_7 * w_8 / 192 + w_1 ** 2 * w_2 * w_3 * w_8 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_6 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_7 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_8 / 576 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 * w_5 * w_6 / 192 + w_1 ** 2 * w_2 * w_4 * w_5 * w_7 / 192 + w_1 ** 2 * w_2 * w_4 * w_5 * w_8 / 192 + w_1 ** 2 * w_2 * w_4 * w_6 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 * w_6 * w_7 / 192 + w_1 ** 2 * w_2 * w_4 * w_6 * w_8 / 192 + w_1 ** 2 * w_2 * w_4 * w_7 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 * w_7 * w_8 / 192 + w_1 ** 2 * w_2 * w_4 * w_8 ** 2 / 576 + w_1 ** 2 * w_2 * w_5 ** 2 * w_6 / 576 + w_1 ** 2 * w_2 * w_5 ** 2 * w_7 / 576 + w_1 ** 2 * w_2 * w_5 ** 2 * w_8 / 576 + w_1 ** 2 * w_2 * w_5 * w_6 ** 2 / 576 + w_1 ** 2 * w_2 * w_5 * w_6 * w_7 / 192 + w_1 ** 2 * w_2 * w_5 * w_6 * w_8 / 192 + w_1 ** 2 * w_2 * w_5 * w_7 ** 2 / 576 + w_1 ** 2 * w_2 * w_5 * w_7 * w_8 / 192 + w_1 ** 2 * w_2 * w_5 * w_8 ** 2 / 576 + w_1 ** 2 * w_2 * w_6 ** 2 * w_7 / 576 + w_1 ** 2 * w_2 * w_6 ** 2 * w_8 / 576 + w_1 ** 2 * w_2 * w_6 * w_7 ** 2 / 576 + w_1 ** 2 * w_2 * w_6 * w_7 * w_8 / 192 + w_1 ** 2 * w_2 * w_6 * w_8 ** 2 / 576 + w_1 ** 2 * w_2 * w_7 ** 2 * w_8 / 576 + w_1 ** 2 * w_2 * w_7 * w_8 ** 2 / 576 - w_1 ** 2 * w_3 ** 4 / 8640 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 / 576 + w_1 ** 2 * w_3 ** 2 * w_4 * w_6 / 576 + w_1 ** 2 * w_3 ** 2 * w_4 * w_7 / 576 + w_1 ** 2 * w_3 ** 2 * w_4 * w_8 / 576 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_5 * w_6 / 576 + w_1 ** 2 * w_3 ** 2 * w_5 * w_7 / 576 + w_1 ** 2 * w_3 ** 2 * w_5 * w_8 / 576 + w_1 ** 2 * w_3 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_6 * w_7 / 576 + w_1 ** 2 * w_3 ** 2 * w_6 * w_8 / 576 + w_1 ** 2 * w_3 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_7 * w_8 / 576 + w_1 ** 2 * w_3 ** 2 * w_8 ** 2 / 1728 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 / 576 + w_1 ** 2 * w_3 * w_4 ** 2 * w_6 / 576 + w_1 ** 2 * w_3 * w_4 ** 2 * w_7 / 576 + w_1 ** 2 * w_3 * w_4 ** 2 * w_8 / 576 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 / 576 + w_1 ** 2 * w_3 * w_4 * w_5 * w_6 / 192 + w_1 ** 2 * w_3 * w_4 * w_5 * w_7 / 192 + w_1 ** 2 * w_3 * w_4 * w_5 * w_8 / 192 + w_1 ** 2 * w_3 * w_4 * w_6 ** 2 / 576 + w_1 ** 2 * w_3 * w_4 * w_6 * w_7 / 192 + w_1 ** 2 * w_3 * w_4 * w_6 * w_8 / 192 + w_1 ** 2 * w_3 * w_4 * w_7 ** 2 / 576 + w_1 ** 2 * w_3 * w_4 * w_7 * w_8 / 192 + w_1 ** 2 * w_3 * w_4 * w_8 ** 2 / 576 + w_1 ** 2 * w_3 * w_5 ** 2 * w_6 / 576 + w_1 ** 2 * w_3 * w_5 ** 2 * w_7 / 576 + w_1 ** 2 * w_3 * w_5 ** 2 * w_8 / 576 + w_1 ** 2 * w_3 * w_5 * w_6 ** 2 / 576 + w_1 ** 2 * w_3 * w_5 * w_6 * w_7 / 192 + w_1 ** 2 * w_3 * w_5 * w_6 * w_8 / 192 + w_1 ** 2 * w_3 * w_5 * w_7 ** 2 / 576 + w_1 ** 2 * w_3 * w_5 * w_7 * w_8 / 192 + w_1 ** 2 * w_3 * w_5 * w_8 ** 2 / 576 + w_1 ** 2 * w_3 * w_6 ** 2 * w_7 / 576 + w_1 ** 2 * w_3 * w_6 ** 2 * w_8 / 576 + w_1 ** 2 * w_3 * w_6 * w_7 ** 2 / 576 + w_1 ** 2 * w_3 * w_6 * w_7 * w_8 / 192 + w_1 ** 2 * w_3 * w_6 * w_8 ** 2 / 576 + w_1 ** 2 * w_3 * w_7 ** 2 * w_8 / 576 + w_1 ** 2 * w_3 * w_7 * w_8 ** 2 / 576 - w_1 ** 2 * w_4 ** 4 / 8640 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_4 ** 2 * w_5 * w_6 / 576 + w_1 ** 2 * w_4 ** 2 * w_5 * w_7 / 576 + w_1 ** 2 * w_4 ** 2 * w_5 * w_8 / 576 + w_1 ** 2 * w_4 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_4 ** 2 * w_6 * w_7 / 576 + w_1 ** 2 * w_4 ** 2 * w_6 * w_8 / 576 + w_1 ** 2 * w_4 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_4 ** 2 * w_7 * w_8 / 576 + w_1 ** 2 * w_4 ** 2 * w_8 ** 2 / 1728 + w_1 ** 2 * w_4 * w_5 ** 2 * w_6 / 576 + w_1 ** 2 * w_4 * w_5 ** 2 * w_7 / 576 + w_1 ** 2 * w_4 * w_5 ** 2 * w_8 / 576 + w_1 ** 2 * w_4 * w_5 * w_6 ** 2 / 576 + w_1 ** 2 * w_4 * w_5 * w_6 * w_7 / 192 + w_1 ** 2 * w_4 * w_5 * w_6 * w_8 / 192 + w_1 ** 2 * w_4 * w_5 * w_7 ** 2 / 576 + w_1 ** 2 * w_4 * w_5 * w_7 * w_8 / 192 + w_1 ** 2 * w_4 * w_5 * w_8 ** 2 / 576 + w_1 ** 2 * w_4 * w_6 ** 2 * w_7 / 576 + w_1 ** 2 * w_4 * w_6 ** 2 * w_8 / 576 + w_1 ** 2 * w_4 * w_6 * w_7 ** 2 / 576 + w_1 ** 2 * w_4 * w_6 * w_7 * w_8 / 192 + w_1 ** 2 * w_4 * w_6 * w_8 ** 2 / 576 + w_1 ** 2 * w_4 * w_7 ** 2 * w_8 / 576 + w_1 ** 2 * w_4 * w_7 * w_8 ** 2 / 576 - w_1 ** 2 * w_5 ** 4 / 8640 + w_1 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_5 ** 2 * w_6 * w_7 / 576 + w_1 ** 2 * w_5 ** 2 * w_6 * w_8 / 576 + w_1 ** 2 * w_5 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_5 ** 2 * w_7 * w_8 / 576 + w_1 ** 2 * w_5 ** 2 * w_8 ** 2 / 1728 + w_1 ** 2 * w_5 * w_6 ** 2 * w_7 / 576 + w_1 ** 2 * w_5 * w_6 ** 2 * w_8 / 576 + w_1 ** 2 * w_5 * w_6 * w_7 ** 2 / 576 + w_1 ** 2 * w_5 * w_6 * w_7 * w_8 / 192 + w_1 ** 2 * w_5 * w_6 * w_8 ** 2 / 576 + w_1 ** 2 * w_5 * w_7 ** 2 * w_8 / 576 + w_1 ** 2 * w_5 * w_7 * w_8 ** 2 / 576 - w_1 ** 2 * w_6 ** 4 / 8640 + w_1 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_6 ** 2 * w_7 * w_8 / 576 + w_1 ** 2 * w_6 ** 2 * w_8 ** 2 / 1728 + w_1 ** 2 * w_6 * w_7 ** 2 * w_8 / 576 + w_1 ** 2 * w_6 * w_7 * w_8 ** 2 / 576 - w_1 ** 2 * w_7 ** 4 / 8640 + w_1 ** 2 * w_7 ** 2 * w_8 ** 2 / 1728 - w_1 ** 2 * w_8 ** 4 / 8640 - w_1 * w_2 ** 4 * w_3 / 2880 - w_1 * w_2 ** 4 * w_4 / 2880 - w_1 * w_2 ** 4 * w_5 / 2880 - w_1 * w_2 ** 4 * w_6 / 2880 - w_1 * w_2 ** 4 * w_7 / 2880 - w_1 * w_2 ** 4 * w_8 / 2880 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_6 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_7 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_8 / 576 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 / 192 + w_1 * w_2 ** 2 * w_3 * w_4 * w_6 / 192 + w_1 * w_2 ** 2 * w_3 * w_4 * w_7 / 192 + w_1 * w_2 ** 2 * w_3 * w_4 * w_8 / 192 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_5 * w_6 / 192 + w_1 * w_2 ** 2 * w_3 * w_5 * w_7 / 192 + w_1 * w_2 ** 2 * w_3 * w_5 * w_8 / 192 + w_1 * w_2 ** 2 * w_3 * w_6 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_6 * w_7 / 192 + w_1 * w_2 ** 2 * w_3 * w_6 * w_8 / 192 + w_1 * w_2 ** 2 * w_3 * w_7 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_7 * w_8 / 192 + w_1 * w_2 ** 2 * w_3 * w_8 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_6 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_7 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_8 / 576 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 * w_5 * w_6 / 192 + w_1 * w_2 ** 2 * w_4 * w_5 * w_7 / 192 + w_1 * w_2 ** 2 * w_4 * w_5 * w_8 / 192 + w_1 * w_2 ** 2 * w_4 * w_6 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 * w_6 * w_7 / 192 + w_1 * w_2 ** 2 * w_4 * w_6 * w_8 / 192 + w_1 * w_2 ** 2 * w_4 * w_7 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 * w_7 * w_8 / 192 + w_1 * w_2 ** 2 * w_4 * w_8 ** 2 / 576 + w_1 * w_2 ** 2 * w_5 ** 2 * w_6 / 576 + w_1 * w_2 ** 2 * w_5 ** 2 * w_7 / 576 + w_1 * w_2 ** 2 * w_5 ** 2 * w_8 / 576 + w_1 * w_2 ** 2 * w_5 * w_6 ** 2 / 576 + w_1 * w_2 ** 2 * w_5 * w_6 * w_7 / 192 + w_1 * w_2 ** 2 * w_5 * w_6 * w_8 / 192 + w_1 * w_2 ** 2 * w_5 * w_7 ** 2 / 576 + w_1 * w_2 ** 2 * w_5 * w_7 * w_8 / 192 + w_1 * w_2 ** 2 * w_5 * w_8 ** 2 / 576 + w_1 * w_2 ** 2 * w_6 ** 2 * w_7 / 576 + w_1 * w_2 ** 2 * w_6 ** 2 * w_8 / 576 + w_1 * w_2 ** 2 * w_6 * w_7 ** 2 / 576 + w_1 * w_2 ** 2 * w_6 * w_7 * w_8 / 192 + w_1 * w_2 ** 2 * w_6 * w_8 ** 2 / 576 + w_1 * w_2 ** 2 * w_7 ** 2 * w_8 / 576 + w_1 * w_2 ** 2 * w_7 * w_8 ** 2 / 576 - w_1 * w_2 * w_3 ** 4 / 2880 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 / 192 + w_1 * w_2 * w_3 ** 2 * w_4 * w_6 / 192 + w_1 * w_2 * w_3 ** 2 * w_4 * w_7 / 192 + w_1 * w_2 * w_3 ** 2 * w_4 * w_8 / 192 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_5 * w_6 / 192 + w_1 * w_2 * w_3 ** 2 * w_5 * w_7 / 192 + w_1 * w_2 * w_3 ** 2 * w_5 * w_8 / 192 + w_1 * w_2 * w_3 ** 2 * w_6 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_6 * w_7 / 192 + w_1 * w_2 * w_3 ** 2 * w_6 * w_8 / 192 + w_1 * w_2 * w_3 ** 2 * w_7 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_7 * w_8 / 192 + w_1 * w_2 * w_3 ** 2 * w_8 ** 2 / 576 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 / 192 + w_1 * w_2 * w_3 * w_4 ** 2 * w_6 / 192 + w_1 * w_2 * w_3 * w_4 ** 2 * w_7 / 192 + w_1 * w_2 * w_3 * w_4 ** 2 * w_8 / 192 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 / 192 + w_1 * w_2 * w_3 * w_4 * w_5 * w_6 / 64 + w_1 * w_2 * w_3 * w_4 * w_5 * w_7 / 64 + w_1 * w_2 * w_3 * w_4 * w_5 * w_8 / 64 + w_1 * w_2 * w_3 * w_4 * w_6 ** 2 / 192 + w_1 * w_2 * w_3 * w_4 * w_6 * w_7 / 64 + w_1 * w_2 * w_3 * w_4 * w_6 * w_8 / 64 + w_1 * w_2 * w_3 * w_4 * w_7 ** 2 / 192 + w_1 * w_2 * w_3 * w_4 * w_7 * w_8 / 64 + w_1 * w_2 * w_3 * w_4 * w_8 ** 2 / 192 + w_1 * w_2 * w_3 * w_5 ** 2 * w_6 / 192 + w_1 * w_2 * w_3 * w_5 ** 2 * w_7 / 192 + w_1 * w_2 * w_3 * w_5 ** 2 * w_8 / 192 + w_1 * w_2 * w_3 * w_5 * w_6 ** 2 / 192 + w_1 * w_2 * w_3 * w_5 * w_6 * w_7 / 64 + w_1 * w_2 * w_3 * w_5 * w_6 * w_8 / 64 + w_1 * w_2 * w_3 * w_5 * w_7 ** 2 / 192 + w_1 * w_2 * w_3 * w_5 * w_7 * w_8 / 64 + w_1 * w_2 * w_3 * w_5 * w_8 ** 2 / 192 + w_1 * w_2 * w_3 * w_6 ** 2 * w_7 / 192 + w_1 * w_2 * w_3 * w_6 ** 2 * w_8 / 192 + w_1 * w_2 * w_3 * w_6 * w_7 ** 2 / 192 + w_1 * w_2 * w_3 * w_6 * w_7 * w_8 / 64 + w_1 * w_2 * w_3 * w_6 * w_8 ** 2 / 192 + w_1 * w_2 * w_3 * w_7 ** 2 * w_8 / 192 + w_1 * w_2 * w_3 * w_7 * w_8 ** 2 / 192 - w_1 * w_2 * w_4 ** 4 / 2880 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 / 576 + w_1 * w_2 * w_4 ** 2 * w_5 * w_6 / 192 + w_1 * w_2 * w_4 ** 2 * w_5 * w_7 / 192 + w_1 * w_2 * w_4 ** 2 * w_5 * w_8 / 192 + w_1 * w_2 * w_4 ** 2 * w_6 ** 2 / 576 + w_1 * w_2 * w_4 ** 2 * w_6 * w_7 / 192 + w_1 * w_2 * w_4 ** 2 * w_6 * w_8 / 192 + w_1 * w_2 * w_4 ** 2 * w_7 ** 2 / 576 + w_1 * w_2 * w_4 ** 2 * w_7 * w_8 / 192 + w_1 * w_2 * w_4 ** 2 * w_8 ** 2 / 576 + w_1 * w_2 * w_4 * w_5 ** 2 * w_6 / 192 + w_1 * w_2 * w_4 * w_5 ** 2 * w_7 / 192 + w_1 * w_2 * w_4 * w_5 ** 2 * w_8 / 192 + w_1 * w_2 * w_4 * w_5 * w_6 ** 2 / 192 + w_1 * w_2 * w_4 * w_5 * w_6 * w_7 / 64 + w_1 * w_2 * w_4 * w_5 * w_6 * w_8 / 64 + w_1 * w_2 * w_4 * w_5 * w_7 ** 2 / 192 + w_1 * w_2 * w_4 * w_5 * w_7 * w_8 / 64 + w_1 * w_2 * w_4 * w_5 * w_8 ** 2 / 192 + w_1 * w_2 * w_4 * w_6 ** 2 * w_7 / 192 + w_1 * w_2 * w_4 * w_6 ** 2 * w_8 / 192 + w_1 * w_2 * w_4 * w_6 * w_7 ** 2 / 192 + w_1 * w_2 * w_4 * w_6 * w_7 * w_8 / 64 + w_1 * w_2 * w_4 * w_6 * w_8 ** 2 / 192 + w_1 * w_2 * w_4 * w_7 ** 2 * w_8 / 192 + w_1 * w_2 * w_4 * w_7 * w_8 ** 2 / 192 - w_1 * w_2 * w_5 ** 4 / 2880 + w_1 * w_2 * w_5 ** 2 * w_6 ** 2 / 576 + w_1 * w_2 * w_5 ** 2 * w_6 * w_7 / 192 + w_1 * w_2 * w_5 ** 2 * w_6 * w_8 / 192 + w_1 * w_2 * w_5 ** 2 * w_7 ** 2 / 576 + w_1 * w_2 * w_5 ** 2 * w_7 * w_8 / 192 + w_1 * w_2 * w_5 ** 2 * w_8 ** 2 / 576 + w_1 * w_2 * w_5 * w_6 ** 2 * w_7 / 192 + w_1 * w_2 * w_5 * w_6 ** 2 * w_8 / 192 + w_1 * w_2 * w_5 * w_6 * w_7 ** 2 / 192 + w_1 * w_2 * w_5 * w_6 * w_7 * w_8 / 64 + w_1 * w_2 * w_5 * w_6 * w_8 ** 2 / 192 + w_1 * w_2 * w_5 * w_7 ** 2 * w_8 / 192 + w_1 * w_2 * w_5 * w_7 * w_8 ** 2 / 192 - w_1 * w_2 * w_6 ** 4 / 2880 + w_1 * w_2 * w_6 ** 2 * w_7 ** 2 / 576 + w_1 * w_2 * w_6 ** 2 * w_7 * w_8 / 192 + w_1 * w_2 * w_6 ** 2 * w_8 ** 2 / 576 + w_1 * w_2 * w_6 * w_7 ** 2 * w_8 / 192 + w_1 * w_2 * w_6 * w_7 * w_8 ** 2 / 192 - w_1 * w_2 * w_7 ** 4 / 2880 + w_1 * w_2 * w_7 ** 2 * w_8 ** 2 / 576 - w_1 * w_2 * w_8 ** 4 / 2880 - w_1 * w_3 ** 4 * w_4 / 2880 - w_1 * w_3 ** 4 * w_5 / 2880 - w_1 * w_3 ** 4 * w_6 / 2880 - w_1 * w_3 ** 4 * w_7 / 2880 - w_1 * w_3 ** 4 * w_8 / 2880 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 / 576 + w_1 * w_3 ** 2 * w_4 ** 2 * w_6 / 576 + w_1 * w_3 ** 2 * w_4 ** 2 * w_7 / 576 + w_1 * w_3 ** 2 * w_4 ** 2 * w_8 / 576 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 / 576 + w_1 * w_3 ** 2 * w_4 * w_5 * w_6 / 192 + w_1 * w_3 ** 2 * w_4 * w_5 * w_7 / 192 + w_1 * w_3 ** 2 * w_4 * w_5 * w_8 / 192 + w_1 * w_3 ** 2 * w_4 * w_6 ** 2 / 576 + w_1 * w_3 ** 2 * w_4 * w_6 * w_7 / 192 + w_1 * w_3 ** 2 * w_4 * w_6 * w_8 / 192 + w_1 * w_3 ** 2 * w_4 * w_7 ** 2 / 576 + w_1 * w_3 ** 2 * w_4 * w_7 * w_8 / 192 + w_1 * w_3 ** 2 * w_4 * w_8 ** 2 / 576 + w_1 * w_3 ** 2 * w_5 ** 2 * w_6 / 576 + w_1 * w_3 ** 2 * w_5 ** 2 * w_7 / 576 + w_1 * w_3 ** 2 * w_5 ** 2 * w_8 / 576 + w_1 * w_3 ** 2 * w_5 * w_6 ** 2 / 576 + w_1 * w_3 ** 2 * w_5 * w_6 * w_7 / 192 + w_1 * w_3 ** 2 * w_5 * w_6 * w_8 / 192 + w_1 * w_3 ** 2 * w_5 * w_7 ** 2 / 576 + w_1 * w_3 ** 2 * w_5 * w_7 * w_8 / 192 + w_1 * w_3 ** 2 * w_5 * w_8 ** 2 / 576 + w_1 * w_3 ** 2 * w_6 ** 2 * w_7 / 576 + w_1 * w_3 ** 2 * w_6 ** 2 * w_8 / 576 + w_1 * w_3 ** 2 * w_6 * w_7 ** 2 / 576 + w_1 * w_3 ** 2 * w_6 * w_7 * w_8 / 192 + w_1 * w_3 ** 2 * w_6 * w_8 ** 2 / 576 + w_1 * w_3 ** 2 * w_7 ** 2 * w_8 / 576 + w_1 * w_3 ** 2 * w_7 * w_8 ** 2 / 576 - w_1 * w_3 * w_4 ** 4 / 2880 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 / 576 + w_1 * w_3 * w_4 ** 2 * w_5 * w_6 / 192 + w_1 * w_3 * w_4 ** 2 * w_5 * w_7 / 192 + w_1 * w_3 * w_4 ** 2 * w_5 * w_8 / 192 + w_1 * w_3 * w_4 ** 2 * w_6 ** 2 / 576 + w_1 * w_3 * w_4 ** 2 * w_6 * w_7 / 192 + w_1 * w_3 * w_4 ** 2 * w_6 * w_8 / 192 + w_1 * w_3 * w_4 ** 2 * w_7 ** 2 / 576 + w_1 * w_3 * w_4 ** 2 * w_7 * w_8 / 192 + w_1 * w_3 * w_4 ** 2 * w_8 ** 2 / 576 + w_1 * w_3 * w_4 * w_5 ** 2 * w_6 / 192 + w_1 * w_3 * w_4 * w_5 ** 2 * w_7 / 192 + w_1 * w_3 * w_4 * w_5 ** 2 * w_8 / 192 + w_1 * w_3 * w_4 * w_5 * w_6 ** 2 / 192 + w_1 * w_3 * w_4 * w_5 * w_6 * w_7 / 64 + w_1 * w_3 * w_4 * w_5 * w_6 * w_8 / 64 + w_1 * w_3 * w_4 * w_5 * w_7 ** 2 / 192 + w_1 * w_3 * w_4 * w_5 * w_7 * w_8 / 64 + w_1 * w_3 * w_4 * w_5 * w_8 ** 2 / 192 + w_1 * w_3 * w_4 * w_6 ** 2 * w_7 / 192 + w_1 * w_3 * w_4 * w_6 ** 2 * w_8 / 192 + w_1 * w_3 * w_4 * w_6 * w_7 ** 2 / 192 + w_1 * w_3 * w_4 * w_6 * w_7 * w_8 / 64 + w_1 * w_3 * w_4 * w_6 * w_8 ** 2 / 192 + w_1 * w_3 * w_4 * w_7 ** 2 * w_8 / 192 + w_1 * w_3 * w_4 * w_7 * w_8 ** 2 / 192 - w_1 * w_3 * w_5 ** 4 / 2880 + w_1 * w_3 * w_5 ** 2 * w_6 ** 2 / 576 + w_1 * w_3 * w_5 ** 2 * w_6 * w_7 / 192 + w_1 * w_3 * w_5 ** 2 * w_6 * w_8 / 192 + w_1 * w_3 * w_5 ** 2 * w_7 ** 2 / 576 + w_1 * w_3 * w_5 ** 2 * w_7 * w_8 / 192 + w_1 * w_3 * w_5 ** 2 * w_8 ** 2 / 576 + w_1 * w_3 * w_5 * w_6 ** 2 * w_7 / 192 + w_1 * w_3 * w_5 * w_6 ** 2 * w_8 / 192 + w_1 * w_3 * w_5 * w_6 * w_7 ** 2 / 192 + w_1 * w_3 * w_5 * w_6 * w_7 * w_8 / 64 + w_1 * w_3 * w_5 * w_6 * w_8 ** 2 / 192 + w_1 * w_3 * w_5 * w_7 ** 2 * w_8 / 192 + w_1 * w_3 * w_5 * w_7 * w_8 ** 2 / 192 - w_1 * w_3 * w_6 ** 4 / 2880 + w_1 * w_3 * w_6 ** 2 * w_7 ** 2 / 576 + w_1 * w_3 * w_6 ** 2 * w_7 * w_8 / 192 + w_1 * w_3 * w_6 ** 2 * w_8 ** 2 / 576 + w_1 * w_3 * w_6 * w_7 ** 2 * w_8 / 192 + w_1 * w_3 * w_6 * w_7 * w_8 ** 2 / 192 - w_1 * w_3 * w_7 ** 4 / 2880 + w_1 * w_3 * w_7 ** 2 * w_8 ** 2 / 576 - w_1 * w_3 * w_8 ** 4 / 2880 - w_1 * w_4 ** 4 * w_5 / 2880 - w_1 * w_4 ** 4 * w_6 / 2880 - w_1 * w_4 ** 4 * w_7 / 2880 - w_1 * w_4 ** 4 * w_8 / 2880 + w_1 * w_4 ** 2 * w_5 ** 2 * w_6 / 576 + w_1 * w_4 ** 2 * w_5 ** 2 * w_7 / 576 + w_1 * w_4 ** 2 * w_5 ** 2 * w_8 / 576 + w_1 * w_4 ** 2 * w_5 * w_6 ** 2 / 576 + w_1 * w_4 ** 2 * w_5 * w_6 * w_7 / 192 + w_1 * w_4 ** 2 * w_5 * w_6 * w_8 / 192 + w_1 * w_4 ** 2 * w_5 * w_7 ** 2 / 576 + w_1 * w_4 ** 2 * w_5 * w_7 * w_8 / 192 + w_1 * w_4 ** 2 * w_5 * w_8 ** 2 / 576 + w_1 * w_4 ** 2 * w_6 ** 2 * w_7 / 576 + w_1 * w_4 ** 2 * w_6 ** 2 * w_8 / 576 + w_1 * w_4 ** 2 * w_6 * w_7 ** 2 / 576 + w_1 * w_4 ** 2 * w_6 * w_7 * w_8 / 192 + w_1 * w_4 ** 2 * w_6 * w_8 ** 2 / 576 + w_1 * w_4 ** 2 * w_7 ** 2 * w_8 / 576 + w_1 * w_4 ** 2 * w_7 * w_8 ** 2 / 576 - w_1 * w_4 * w_5 ** 4 / 2880 + w_1 * w_4 * w_5 ** 2 * w_6 ** 2 / 576 + w_1 * w_4 * w_5 ** 2 * w_6 * w_7 / 192 + w_1 * w_4 * w_5 ** 2 * w_6 * w_8 / 192 + w_1 * w_4 * w_5 ** 2 * w_7 ** 2 / 576 + w_1 * w_4 * w_5 ** 2 * w_7 * w_8 / 192 + w_1 * w_4 * w_5 ** 2 * w_8 ** 2 / 576 + w_1 * w_4 * w_5 * w_6 ** 2 * w_7 / 192 + w_1 * w_4 * w_5 * w_6 ** 2 * w_8 / 192 + w_1 * w_4 * w_5 * w_6 * w_7 ** 2 / 192 + w_1 * w_4 * w_5 * w_6 * w_7 * w_8 / 64 + w_1 * w_4 * w_5 * w_6 * w_8 ** 2 / 192 + w_1 * w_4 * w_5 * w_7 ** 2 * w_8 / 192 + w_1 * w_4 * w_5 * w_7 * w_8 ** 2 / 192 - w_1 * w_4 * w_6 ** 4 / 2880 + w_1 * w_4 * w_6 ** 2 * w_7 ** 2 / 576 + w_1 * w_4 * w_6 ** 2 * w_7 * w_8 / 192 + w_1 * w_4 * w_6 ** 2 * w_8 ** 2 / 576 + w_1 * w_4 * w_6 * w_7 ** 2 * w_8 / 192 + w_1 * w_4 * w_6 * w_7 * w_8 ** 2 / 192 - w_1 * w_4 * w_7 ** 4 / 2880 + w_1 * w_4 * w_7 ** 2 * w_8 ** 2 / 576 - w_1 * w_4 * w_8 ** 4 / 2880 - w_1 * w_5 ** 4 * w_6 / 2880 - w_1 * w_5 ** 4 * w_7 / 2880 - w_1 * w_5 ** 4 * w_8 / 2880 + w_1 * w_5 ** 2 * w_6 ** 2 * w_7 / 576 + w_1 * w_5 ** 2 * w_6 ** 2 * w_8 / 576 + w_1 * w_5 ** 2 * w_6 * w_7 ** 2 / 576 + w_1 * w_5 ** 2 * w_6 * w_7 * w_8 / 192 + w_1 * w_5 ** 2 * w_6 * w_8 ** 2 / 576 + w_1 * w_5 ** 2 * w_7 ** 2 * w_8 / 576 + w_1 * w_5 ** 2 * w_7 * w_8 ** 2 / 576 - w_1 * w_5 * w_6 ** 4 / 2880 + w_1 * w_5 * w_6 ** 2 * w_7 ** 2 / 576 + w_1 * w_5 * w_6 ** 2 * w_7 * w_8 / 192 + w_1 * w_5 * w_6 ** 2 * w_8 ** 2 / 576 + w_1 * w_5 * w_6 * w_7 ** 2 * w_8 / 192 + w_1 * w_5 * w_6 * w_7 * w_8 ** 2 / 192 - w_1 * w_5 * w_7 ** 4 / 2880 + w_1 * w_5 * w_7 ** 2 * w_8 ** 2 / 576 - w_1 * w_5 * w_8 ** 4 / 2880 - w_1 * w_6 ** 4 * w_7 / 2880 - w_1 * w_6 ** 4 * w_8 / 2880 + w_1 * w_6 ** 2 * w_7 ** 2 * w_8 / 576 + w_1 * w_6 ** 2 * w_7 * w_8 ** 2 / 576 - w_1 * w_6 * w_7 ** 4 / 2880 + w_1 * w_6 * w_7 ** 2 * w_8 ** 2 / 576 - w_1 * w_6 * w_8 ** 4 / 2880 - w_1 * w_7 ** 4 * w_8 / 2880 - w_1 * w_7 * w_8 ** 4 / 2880 + w_2 ** 6 / 30240 - w_2 ** 4 * w_3 ** 2 / 8640 - w_2 ** 4 * w_3 * w_4 / 2880 - w_2 ** 4 * w_3 * w_5 / 2880 - w_2 ** 4 * w_3 * w_6 / 2880 - w_2 ** 4 * w_3 * w_7 / 2880 - w_2 ** 4 * w_3 * w_8 / 2880 - w_2 ** 4 * w_4 ** 2 / 8640 - w_2 ** 4 * w_4 * w_5 / 2880 - w_2 ** 4 * w_4 * w_6 / 2880 - w_2 ** 4 * w_4 * w_7 / 2880 - w_2 ** 4 * w_4 * w_8 / 2880 - w_2 ** 4 * w_5 ** 2 / 8640 - w_2 ** 4 * w_5 * w_6 / 2880 - w_2 ** 4 * w_5 * w_7 / 2880 - w_2 ** 4 * w_5 * w_8 / 2880 - w_2 ** 4 * w_6 ** 2 / 8640 - w_2 ** 4 * w_6 * w_7 / 2880 - w_2 ** 4 * w_6 * w_8 / 2880 - w_2 ** 4 * w_7 ** 2 / 8640 - w_2 ** 4 * w_7 * w_8 / 2880 - w_2 ** 4 * w_8 ** 2 / 8640 - w_2 ** 2 * w_3 ** 4 / 8640 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 576 + w_2 ** 2 * w_3 ** 2 * w_4 * w_6 / 576 + w_2 ** 2 * w_3 ** 2 * w_4 * w_7 / 576 + w_2 ** 2 * w_3 ** 2 * w_4 * w_8 / 576 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_5 * w_6 / 576 + w_2 ** 2 * w_3 ** 2 * w_5 * w_7 / 576 + w_2 ** 2 * w_3 ** 2 * w_5 * w_8 / 576 + w_2 ** 2 * w_3 ** 2 * w_6 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_6 * w_7 / 576 + w_2 ** 2 * w_3 ** 2 * w_6 * w_8 / 576 + w_2 ** 2 * w_3 ** 2 * w_7 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_7 * w_8 / 576 + w_2 ** 2 * w_3 ** 2 * w_8 ** 2 / 1728 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 576 + w_2 ** 2 * w_3 * w_4 ** 2 * w_6 / 576 + w_2 ** 2 * w_3 * w_4 ** 2 * w_7 / 576 + w_2 ** 2 * w_3 * w_4 ** 2 * w_8 / 576 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 576 + w_2 ** 2 * w_3 * w_4 * w_5 * w_6 / 192 + w_2 ** 2 * w_3 * w_4 * w_5 * w_7 / 192 + w_2 ** 2 * w_3 * w_4 * w_5 * w_8 / 192 + w_2 ** 2 * w_3 * w_4 * w_6 ** 2 / 576 + w_2 ** 2 * w_3 * w_4 * w_6 * w_7 / 192 + w_2 ** 2 * w_3 * w_4 * w_6 * w_8 / 192 + w_2 ** 2 * w_3 * w_4 * w_7 ** 2 / 576 + w_2 ** 2 * w_3 * w_4 * w_7 * w_8 / 192 + w_2 ** 2 * w_3 * w_4 * w_8 ** 2 / 576 + w_2 ** 2 * w_3 * w_5 ** 2 * w_6 / 576 + w_2 ** 2 * w_3 * w_5 ** 2 * w_7 / 576 + w_2 ** 2 * w_3 * w_5 ** 2 * w_8 / 576 + w_2 ** 2 * w_3 * w_5 * w_6 ** 2 / 576 + w_2 ** 2 * w_3 * w_5 * w_6 * w_7 / 192 + w_2 ** 2 * w_3 * w_5 * w_6 * w_8 / 192 + w_2 ** 2 * w_3 * w_5 * w_7 ** 2 / 576 + w_2 ** 2 * w_3 * w_5 * w_7 * w_8 / 192 + w_2 ** 2 * w_3 * w_5 * w_8 ** 2 / 576 + w_2 ** 2 * w_3 * w_6 ** 2 * w_7 / 576 + w_2 ** 2 * w_3 * w_6 ** 2 * w_8 / 576 + w_2 ** 2 * w_3 * w_6 * w_7 ** 2 / 576 + w_2 ** 2 * w_3 * w_6 * w_7 * w_8 / 192 + w_2 ** 2 * w_3 * w_6 * w_8 ** 2 / 576 + w_2 ** 2 * w_3 * w_7 ** 2 * w_8 / 576 + w_2 ** 2 * w_3 * w_7 * w_8 ** 2 / 576 - w_2 ** 2 * w_4 ** 4 / 8640 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 + w_2 ** 2 * w_4 ** 2 * w_5 * w_6 / 576 + w_2 ** 2 * w_4 ** 2 * w_5 * w_7 / 576 + w_2 ** 2 * w_4 ** 2 * w_5 * w_8 / 576 + w_2 ** 2 * w_4 ** 2 * w_6 ** 2 / 1728 + w_2 ** 2 * w_4 ** 2 * w_6 * w_7 / 576 + w_2 ** 2 * w_4 ** 2 * w_6 * w_8 / 576 + w_2 ** 2 * w_4 ** 2 * w_7 ** 2 / 1728 + w_2 ** 2 * w_4 ** 2 * w_7 * w_8 / 576 + w_2 ** 2 * w_4 ** 2 * w_8 ** 2 / 1728 + w_2 ** 2 * w_4 * w_5 ** 2 * w_6 / 576 + w_2 ** 2 * w_4 * w_5 ** 2 * w_7 / 576 + w_2 ** 2 * w_4 * w_5 ** 2 * w_8 / 576 + w_2 ** 2 * w_4 * w_5 * w_6 ** 2 / 576 + w_2 ** 2 * w_4 * w_5 * w_6 * w_7 / 192 + w_2 ** 2 * w_4 * w_5 * w_6 * w_8 / 192 + w_2 ** 2 * w_4 * w_5 * w_7 ** 2 / 576 + w_2 ** 2 * w_4 * w_5 * w_7 * w_8 / 192 + w_2 ** 2 * w_4 * w_5 * w_8 ** 2 / 576 + w_2 ** 2 * w_4 * w_6 ** 2 * w_7 / 576 + w_2 ** 2 * w_4 * w_6 ** 2 * w_8 / 576 + w_2 ** 2 * w_4 * w_6 * w_7 ** 2 / 576 + w_2 ** 2 * w_4 * w_6 * w_7 * w_8 / 192 + w_2 ** 2 * w_4 * w_6 * w_8 ** 2 / 576 + w_2 ** 2 * w_4 * w_7 ** 2 * w_8 / 576 + w_2 ** 2 * w_4 * w_7 * w_8 ** 2 / 576 - w_2 ** 2 * w_5 ** 4 / 8640 + w_2 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 + w_2 ** 2 * w_5 ** 2 * w_6 * w_7 / 576 + w_2 ** 2 * w_5 ** 2 * w_6 * w_8 / 576 + w_2 ** 2 * w_5 ** 2 * w_7 ** 2 / 1728 + w_2 ** 2 * w_5 ** 2 * w_7 * w_8 / 576 + w_2 ** 2 * w_5 ** 2 * w_8 ** 2 / 1728 + w_2 ** 2 * w_5 * w_6 ** 2 * w_7 / 576 + w_2 ** 2 * w_5 * w_6 ** 2 * w_8 / 576 + w_2 ** 2 * w_5 * w_6 * w_7 ** 2 / 576 + w_2 ** 2 * w_5 * w_6 * w_7 * w_8 / 192 + w_2 ** 2 * w_5 * w_6 * w_8 ** 2 / 576 + w_2 ** 2 * w_5 * w_7 ** 2 * w_8 / 576 + w_2 ** 2 * w_5 * w_7 * w_8 ** 2 / 576 - w_2 ** 2 * w_6 ** 4 / 8640 + w_2 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 + w_2 ** 2 * w_6 ** 2 * w_7 * w_8 / 576 + w_2 ** 2 * w_6 ** 2 * w_8 ** 2 / 1728 + w_2 ** 2 * w_6 * w_7 ** 2 * w_8 / 576 + w_2 ** 2 * w_6 * w_7 * w_8 ** 2 / 576 - w_2 ** 2 * w_7 ** 4 / 8640 + w_2 ** 2 * w_7 ** 2 * w_8 ** 2 / 1728 - w_2 ** 2 * w_8 ** 4 / 8640 - w_2 * w_3 ** 4 * w_4 / 2880 - w_2 * w_3 ** 4 * w_5 / 2880 - w_2 * w_3 ** 4 * w_6 / 2880 - w_2 * w_3 ** 4 * w_7 / 2880 - w_2 * w_3 ** 4 * w_8 / 2880 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 576 + w_2 * w_3 ** 2 * w_4 ** 2 * w_6 / 576 + w_2 * w_3 ** 2 * w_4 ** 2 * w_7 / 576 + w_2 * w_3 ** 2 * w_4 ** 2 * w_8 / 576 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 576 + w_2 * w_3 ** 2 * w_4 * w_5 * w_6 / 192 + w_2 * w_3 ** 2 * w_4 * w_5 * w_7 / 192 + w_2 * w_3 ** 2 * w_4 * w_5 * w_8 / 192 + w_2 * w_3 ** 2 * w_4 * w_6 ** 2 / 576 + w_2 * w_3 ** 2 * w_4 * w_6 * w_7 / 192 + w_2 * w_3 ** 2 * w_4 * w_6 * w_8 / 192 + w_2 * w_3 ** 2 * w_4 * w_7 ** 2 / 576 + w_2 * w_3 ** 2 * w_4 * w_7 * w_8 / 192 + w_2 * w_3 ** 2 * w_4 * w_8 ** 2 / 576 + w_2 * w_3 ** 2 * w_5 ** 2 * w_6 / 576 + w_2 * w_3 ** 2 * w_5 ** 2 * w_7 / 576 + w_2 * w_3 ** 2 * w_5 ** 2 * w_8 / 576 + w_2 * w_3 ** 2 * w_5 * w_6 ** 2 / 576 + w_2 * w_3 ** 2 * w_5 * w_6 * w_7 / 192 + w_2 * w_3 ** 2 * w_5 * w_6 * w_8 / 192 + w_2 * w_3 ** 2 * w_5 * w_7 ** 2 / 576 + w_2 * w_3 ** 2 * w_5 * w_7 * w_8 / 192 + w_2 * w_3 ** 2 * w_5 * w_8 ** 2 / 576 + w_2 * w_3 ** 2 * w_6 ** 2 * w_7 / 576 + w_2 * w_3 ** 2 * w_6 ** 2 * w_8 / 576 + w_2 * w_3 ** 2 * w_6 * w_7 ** 2 / 576 + w_2 * w_3 ** 2 * w_6 * w_7 * w_8 / 192 + w_2 * w_3 ** 2 * w_6 * w_8 ** 2 / 576 + w_2 * w_3 ** 2 * w_7 ** 2 * w_8 / 576 + w_2 * w_3 ** 2 * w_7 * w_8 ** 2 / 576 - w_2 * w_3 * w_4 ** 4 / 2880 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 576 + w_2 * w_3 * w_4 ** 2 * w_5 * w_6 / 192 + w_2 * w_3 * w_4 ** 2 * w_5 * w_7 / 192 + w_2 * w_3 * w_4 ** 2 * w_5 * w_8 / 192 + w_2 * w_3 * w_4 ** 2 * w_6 ** 2 / 576 + w_2 * w_3 * w_4 ** 2 * w_6 * w_7 / 192 + w_2 * w_3 * w_4 ** 2 * w_6 * w_8 / 192 + w_2 * w_3 * w_4 ** 2 * w_7 ** 2 / 576 + w_2 * w_3 * w_4 ** 2 * w_7 * w_8 / 192 + w_2 * w_3 * w_4 ** 2 * w_8 ** 2 / 576 + w_2 * w_3 * w_4 * w_5 ** 2 * w_6 / 192 + w_2 * w_3 * w_4 * w_5 ** 2 * w_7 / 192 + w_2 * w_3 * w_4 * w_5 ** 2 * w_8 / 192 + w_2 * w_3 * w_4 * w_5 * w_6 ** 2 / 192 + w_2 * w_3 * w_4 * w_5 * w_6 * w_7 / 64 + w_2 * w_3 * w_4 * w_5 * w_6 * w_8 / 64 + w_2 * w_3 * w_4 * w_5 * w_7 ** 2 / 192 + w_2 * w_3 * w_4 * w_5 * w_7 * w_8 / 64 + w_2 * w_3 * w_4 * w_5 * w_8 ** 2 / 192 + w_2 * w_3 * w_4 * w_6 ** 2 * w_7 / 192 + w_2 * w_3 * w_4 * w_6 ** 2 * w_8 / 192 + w_2 * w_3 * w_4 * w_6 * w_7 ** 2 / 192 + w_2 * w_3 * w_4 * w_6 * w_7 * w_8 / 64 + w_2 * w_3 * w_4 * w_6 * w_8 ** 2 / 192 + w_2 * w_3 * w_4 * w_7 ** 2 * w_8 / 192 + w_2 * w_3 * w_4 * w_7 * w_8 ** 2 / 192 - w_2 * w_3 * w_5 ** 4 / 2880 + w_2 * w_3 * w_5 ** 2 * w_6 ** 2 / 576 + w_2 * w_3 * w_5 ** 2 * w_6 * w_7 / 192 + w_2 * w_3 * w_5 ** 2 * w_6 * w_8 / 192 + w_2 * w_3 * w_5 ** 2 * w_7 ** 2 / 576 + w_2 * w_3 * w_5 ** 2 * w_7 * w_8 / 192 + w_2 * w_3 * w_5 ** 2 * w_8 ** 2 / 576 + w_2 * w_3 * w_5 * w_6 ** 2 * w_7 / 192 + w_2 * w_3 * w_5 * w_6 ** 2 * w_8 / 192 + w_2 * w_3 * w_5 * w_6 * w_7 ** 2 / 192 + w_2 * w_3 * w_5 * w_6 * w_7 * w_8 / 64 + w_2 * w_3 * w_5 * w_6 * w_8 ** 2 / 192 + w_2 * w_3 * w_5 * w_7 ** 2 * w_8 / 192 + w_2 * w_3 * w_5 * w_7 * w_8 ** 2 / 192 - w_2 * w_3 * w_6 ** 4 / 2880 + w_2 * w_3 * w_6 ** 2 * w_7 ** 2 / 576 + w_2 * w_3 * w_6 ** 2 * w_7 * w_8 / 192 + w_2 * w_3 * w_6 ** 2 * w_8 ** 2 / 576 + w_2 * w_3 * w_6 * w_7 ** 2 * w_8 / 192 + w_2 * w_3 * w_6 * w_7 * w_8 ** 2 / 192 - w_2 * w_3 * w_7 ** 4 / 2880 + w_2 * w_3 * w_7 ** 2 * w_8 ** 2 / 576 - w_2 * w_3 * w_8 ** 4 / 2880 - w_2 * w_4 ** 4 * w_5 / 2880 - w_2 * w_4 ** 4 * w_6 / 2880 - w_2 * w_4 ** 4 * w_7 / 2880 - w_2 * w_4 ** 4 * w_8 / 2880 + w_2 * w_4 ** 2 * w_5 ** 2 * w_6 / 576 + w_2 * w_4 ** 2 * w_5 ** 2 * w_7 / 576 + w_2 * w_4 ** 2 * w_5 ** 2 * w_8 / 576 + w_2 * w_4 ** 2 * w_5 * w_6 ** 2 / 576 + w_2 * w_4 ** 2 * w_5 * w_6 * w_7 / 192 + w_2 * w_4 ** 2 * w_5 * w_6 * w_8 / 192 + w_2 * w_4 ** 2 * w_5 * w_7 ** 2 / 576 + w_2 * w_4 ** 2 * w_5 * w_7 * w_8 / 192 + w_2 * w_4 ** 2 * w_5 * w_8 ** 2 / 576 + w_2 * w_4 ** 2 * w_6 ** 2 * w_7 / 576 + w_2 * w_4 ** 2 * w_6 ** 2 * w_8 / 576 + w_2 * w_4 ** 2 * w_6 * w_7 ** 2 / 576 + w_2 * w_4 ** 2 * w_6 * w_7 * w_8 / 192 + w_2 * w_4 ** 2 * w_6 * w_8 ** 2 / 576 + w_2 * w_4 ** 2 * w_7 ** 2 * w_8 / 576 + w_2 * w_4 ** 2 * w_7 * w_8 ** 2 / 576 - w_2 * w_4 * w_5 ** 4 / 2880 + w_2 * w_4 * w_5 ** 2 * w_6 ** 2 / 576 + w_2 * w_4 * w_5 ** 2 * w_6 * w_7 / 192 + w_2 * w_4 * w_5 ** 2 * w_6 * w_8 / 192 + w_2 * w_4 * w_5 ** 2 * w_7 ** 2 / 576 + w_2 * w_4 * w_5 ** 2 * w_7 * w_8 / 192 + w_2 * w_4 * w_5 ** 2 * w_8 ** 2 / 576 + w_2 * w_4 * w_5 * w_6 ** 2 * w_7 / 192 + w_2 * w_4 * w_5 * w_6 ** 2 * w_8 / 192 + w_2 * w_4 * w_5 * w_6 * w_7 ** 2 / 192 + w_2 * w_4 * w_5 * w_6 * w_7 * w_8 / 64 + w_2 * w_4 * w_5 * w_6 * w_8 ** 2 / 192 + w_2 * w_4 * w_5 * w_7 ** 2 * w_8 / 192 + w_2 * w_4 * w_5 * w_7 * w_8 ** 2 / 192 - w_2 * w_4 * w_6 ** 4 / 2880 + w_2 * w_4 * w_6 ** 2 * w_7 ** 2 / 576 + w_2 * w_4 * w_6 ** 2 * w_7 * w_8 / 192 + w_2 * w_4 * w_6 ** 2 * w_8 ** 2 / 576 + w_2 * w_4 * w_6 * w_7 ** 2 * w_8 / 192 + w_2 * w_4 * w_6 * w_7 * w_8 ** 2 / 192 - w_2 * w_4 * w_7 ** 4 / 2880 + w_2 * w_4 * w_7 ** 2 * w_8 ** 2 / 576 - w_2 * w_4 * w_8 ** 4 / 2880 - w_2 * w_5 ** 4 * w_6 / 2880 - w_2 * w_5 ** 4 * w_7 / 2880 - w_2 * w_5 ** 4 * w_8 / 2880 + w_2 * w_5 ** 2 * w_6 ** 2 * w_7 / 576 + w_2 * w_5 ** 2 * w_6 ** 2 * w_8 / 576 + w_2 * w_5 ** 2 * w_6 * w_7 ** 2 / 576 + w_2 * w_5 ** 2 * w_6 * w_7 * w_8 / 192 + w_2 * w_5 ** 2 * w_6 * w_8 ** 2 / 576 + w_2 * w_5 ** 2 * w_7 ** 2 * w_8 / 576 + w_2 * w_5 ** 2 * w_7 * w_8 ** 2 / 576 - w_2 * w_5 * w_6 ** 4 / 2880 + w_2 * w_5 * w_6 ** 2 * w_7 ** 2 / 576 + w_2 * w_5 * w_6 ** 2 * w_7 * w_8 / 192 + w_2 * w_5 * w_6 ** 2 * w_8 ** 2 / 576 + w_2 * w_5 * w_6 * w_7 ** 2 * w_8 / 192 + w_2 * w_5 * w_6 * w_7 * w_8 ** 2 / 192 - w_2 * w_5 * w_7 ** 4 / 2880 + w_2 * w_5 * w_7 ** 2 * w_8 ** 2 / 576 - w_2 * w_5 * w_8 ** 4 / 2880 - w_2 * w_6 ** 4 * w_7 / 2880 - w_2 * w_6 ** 4 * w_8 / 2880 + w_2 * w_6 ** 2 * w_7 ** 2 * w_8 / 576 + w_2 * w_6 ** 2 * w_7 * w_8 ** 2 / 576 - w_2 * w_6 * w_7 ** 4 / 2880 + w_2 * w_6 * w_7 ** 2 * w_8 ** 2 / 576 - w_2 * w_6 * w_8 ** 4 / 2880 - w_2 * w_7 ** 4 * w_8 / 2880 - w_2 * w_7 * w_8 ** 4 / 2880 + w_3 ** 6 / 30240 - w_3 ** 4 * w_4 ** 2 / 8640 - w_3 ** 4 * w_4 * w_5 / 2880 - w_3 ** 4 * w_4 * w_6 / 2880 - w_3 ** 4 * w_4 * w_7 / 2880 - w_3 ** 4 * w_4 * w_8 / 2880 - w_3 ** 4 * w_5 ** 2 / 8640 - w_3 ** 4 * w_5 * w_6 / 2880 - w_3 ** 4 * w_5 * w_7 / 2880 - w_3 ** 4 * w_5 * w_8 / 2880 - w_3 ** 4 * w_6 ** 2 / 8640 - w_3 ** 4 * w_6 * w_7 / 2880 - w_3 ** 4 * w_6 * w_8 / 2880 - w_3 ** 4 * w_7 ** 2 / 8640 - w_3 ** 4 * w_7 * w_8 / 2880 - w_3 ** 4 * w_8 ** 2 / 8640 - w_3 ** 2 * w_4 ** 4 / 8640 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 + w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 576 + w_3 ** 2 * w_4 ** 2 * w_5 * w_7 / 576 + w_3 ** 2 * w_4 ** 2 * w_5 * w_8 / 576 + w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 1728 + w_3 ** 2 * w_4 ** 2 * w_6 * w_7 / 576 + w_3 ** 2 * w_4 ** 2 * w_6 * w_8 / 576 + w_3 ** 2 * w_4 ** 2 * w_7 ** 2 / 1728 + w_3 ** 2 * w_4 ** 2 * w_7 * w_8 / 576 + w_3 ** 2 * w_4 ** 2 * w_8 ** 2 / 1728 + w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 576 + w_3 ** 2 * w_4 * w_5 ** 2 * w_7 / 576 + w_3 ** 2 * w_4 * w_5 ** 2 * w_8 / 576 + w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 576 + w_3 ** 2 * w_4 * w_5 * w_6 * w_7 / 192 + w_3 ** 2 * w_4 * w_5 * w_6 * w_8 / 192 + w_3 ** 2 * w_4 * w_5 * w_7 ** 2 / 576 + w_3 ** 2 * w_4 * w_5 * w_7 * w_8 / 192 + w_3 ** 2 * w_4 * w_5 * w_8 ** 2 / 576 + w_3 ** 2 * w_4 * w_6 ** 2 * w_7 / 576 + w_3 ** 2 * w_4 * w_6 ** 2 * w_8 / 576 + w_3 ** 2 * w_4 * w_6 * w_7 ** 2 / 576 + w_3 ** 2 * w_4 * w_6 * w_7 * w_8 / 192 + w_3 ** 2 * w_4 * w_6 * w_8 ** 2 / 576 + w_3 ** 2 * w_4 * w_7 ** 2 * w_8 / 576 + w_3 ** 2 * w_4 * w_7 * w_8 ** 2 / 576 - w_3 ** 2 * w_5 ** 4 / 8640 + w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 + w_3 ** 2 * w_5 ** 2 * w_6 * w_7 / 576 + w_3 ** 2 * w_5 ** 2 * w_6 * w_8 / 576 + w_3 ** 2 * w_5 ** 2 * w_7 ** 2 / 1728 + w_3 ** 2 * w_5 ** 2 * w_7 * w_8 / 576 + w_3 ** 2 * w_5 ** 2 * w_8 ** 2 / 1728 + w_3 ** 2 * w_5 * w_6 ** 2 * w_7 / 576 + w_3 ** 2 * w_5 * w_6 ** 2 * w_8 / 576 + w_3 ** 2 * w_5 * w_6 * w_7 ** 2 / 576 + w_3 ** 2 * w_5 * w_6 * w_7 * w_8 / 192 + w_3 ** 2 * w_5 * w_6 * w_8 ** 2 / 576 + w_3 ** 2 * w_5 * w_7 ** 2 * w_8 / 576 + w_3 ** 2 * w_5 * w_7 * w_8 ** 2 / 576 - w_3 ** 2 * w_6 ** 4 / 8640 + w_3 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 + w_3 ** 2 * w_6 ** 2 * w_7 * w_8 / 576 + w_3 ** 2 * w_6 ** 2 * w_8 ** 2 / 1728 + w_3 ** 2 * w_6 * w_7 ** 2 * w_8 / 576 + w_3 ** 2 * w_6 * w_7 * w_8 ** 2 / 576 - w_3 ** 2 * w_7 ** 4 / 8640 + w_3 ** 2 * w_7 ** 2 * w_8 ** 2 / 1728 - w_3 ** 2 * w_8 ** 4 / 8640 - w_3 * w_4 ** 4 * w_5 / 2880 - w_3 * w_4 ** 4 * w_6 / 2880 - w_3 * w_4 ** 4 * w_7 / 2880 - w_3 * w_4 ** 4 * w_8 / 2880 + w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 576 + w_3 * w_4 ** 2 * w_5 ** 2 * w_7 / 576 + w_3 * w_4 ** 2 * w_5 ** 2 * w_8 / 576 + w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 576 + w_3 * w_4 ** 2 * w_5 * w_6 * w_7 / 192 + w_3 * w_4 ** 2 * w_5 * w_6 * w_8 / 192 + w_3 * w_4 ** 2 * w_5 * w_7 ** 2 / 576 + w_3 * w_4 ** 2 * w_5 * w_7 * w_8 / 192 + w_3 * w_4 ** 2 * w_5 * w_8 ** 2 / 576 + w_3 * w_4 ** 2 * w_6 ** 2 * w_7 / 576 + w_3 * w_4 ** 2 * w_6 ** 2 * w_8 / 576 + w_3 * w_4 ** 2 * w_6 * w_7 ** 2 / 576 + w_3 * w_4 ** 2 * w_6 * w_7 * w_8 / 192 + w_3 * w_4 ** 2 * w_6 * w_8 ** 2 / 576 + w_3 * w_4 ** 2 * w_7 ** 2 * w_8 / 576 + w_3 * w_4 ** 2 * w_7 * w_8 ** 2 / 576 - w_3 * w_4 * w_5 ** 4 / 2880 + w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 576 + w_3 * w_4 * w_5 ** 2 * w_6 * w_7 / 192 + w_3 * w_4 * w_5 ** 2 * w_6 * w_8 / 192 + w_3 * w_4 * w_5 ** 2 * w_7 ** 2 / 576 + w_3 * w_4 * w_5 ** 2 * w_7 * w_8 / 192 + w_3 * w_4 * w_5 ** 2 * w_8 ** 2 / 576 + w_3 * w_4 * w_5 * w_6 ** 2 * w_7 / 192 + w_3 * w_4 * w_5 * w_6 ** 2 * w_8 / 192 + w_3 * w_4 * w_5 * w_6 * w_7 ** 2 / 192 + w_3 * w_4 * w_5 * w_6 * w_7 * w_8 / 64 + w_3 * w_4 * w_5 * w_6 * w_8 ** 2 / 192 + w_3 * w_4 * w_5 * w_7 ** 2 * w_8 / 192 + w_3 * w_4 * w_5 * w_7 * w_8 ** 2 / 192 - w_3 * w_4 * w_6 ** 4 / 2880 + w_3 * w_4 * w_6 ** 2 * w_7 ** 2 / 576 + w_3 * w_4 * w_6 ** 2 * w_7 * w_8 / 192 + w_3 * w_4 * w_6 ** 2 * w_8 ** 2 / 576 + w_3 * w_4 * w_6 * w_7 ** 2 * w_8 / 192 + w_3 * w_4 * w_6 * w_7 * w_8 ** 2 / 192 - w_3 * w_4 * w_7 ** 4 / 2880 + w_3 * w_4 * w_7 ** 2 * w_8 ** 2 / 576 - w_3 * w_4 * w_8 ** 4 / 2880 - w_3 * w_5 ** 4 * w_6 / 2880 - w_3 * w_5 ** 4 * w_7 / 2880 - w_3 * w_5 ** 4 * w_8 / 2880 + w_3 * w_5 ** 2 * w_6 ** 2 * w_7 / 576 + w_3 * w_5 ** 2 * w_6 ** 2 * w_8 / 576 + w_3 * w_5 ** 2 * w_6 * w_7 ** 2 / 576 + w_3 * w_5 ** 2 * w_6 * w_7 * w_8 / 192 + w_3 * w_5 ** 2 * w_6 * w_8 ** 2 / 576 + w_3 * w_5 ** 2 * w_7 ** 2 * w_8 / 576 + w_3 * w_5 ** 2 * w_7 * w_8 ** 2 / 576 - w_3 * w_5 * w_6 ** 4 / 2880 + w_3 * w_5 * w_6 ** 2 * w_7 ** 2 / 576 + w_3 * w_5 * w_6 ** 2 * w_7 * w_8 / 192 + w_3 * w_5 * w_6 ** 2 * w_8 ** 2 / 576 + w_3 * w_5 * w_6 * w_7 ** 2 * w_8 / 192 + w_3 * w_5 * w_6 * w_7 * w_8 ** 2 / 192 - w_3 * w_5 * w_7 ** 4 / 2880 + w_3 * w_5 * w_7 ** 2 * w_8 ** 2 / 576 - w_3 * w_5 * w_8 ** 4 / 2880 - w_3 * w_6 ** 4 * w_7 / 2880 - w_3 * w_6 ** 4 * w_8 / 2880 + w_3 * w_6 ** 2 * w_7 ** 2 * w_8 / 576 + w_3 * w_6 ** 2 * w_7 * w_8 ** 2 / 576 - w_3 * w_6 * w_7 ** 4 / 2880 + w_3 * w_6 * w_7 ** 2 * w_8 ** 2 / 576 - w_3 * w_6 * w_8 ** 4 / 2880 - w_3 * w_7 ** 4 * w_8 / 2880 - w_3 * w_7 * w_8 ** 4 / 2880 + w_4 ** 6 / 30240 - w_4 ** 4 * w_5 ** 2 / 8640 - w_4 ** 4 * w_5 * w_6 / 2880 - w_4 ** 4 * w_5 * w_7 / 2880 - w_4 ** 4 * w_5 * w_8 / 2880 - w_4 ** 4 * w_6 ** 2 / 8640 - w_4 ** 4 * w_6 * w_7 / 2880 - w_4 ** 4 * w_6 * w_8 / 2880 - w_4 ** 4 * w_7 ** 2 / 8640 - w_4 ** 4 * w_7 * w_8 / 2880 - w_4 ** 4 * w_8 ** 2 / 8640 - w_4 ** 2 * w_5 ** 4 / 8640 + w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 + w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 576 + w_4 ** 2 * w_5 ** 2 * w_6 * w_8 / 576 + w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 1728 + w_4 ** 2 * w_5 ** 2 * w_7 * w_8 / 576 + w_4 ** 2 * w_5 ** 2 * w_8 ** 2 / 1728 + w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 576 + w_4 ** 2 * w_5 * w_6 ** 2 * w_8 / 576 + w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 576 + w_4 ** 2 * w_5 * w_6 * w_7 * w_8 / 192 + w_4 ** 2 * w_5 * w_6 * w_8 ** 2 / 576 + w_4 ** 2 * w_5 * w_7 ** 2 * w_8 / 576 + w_4 ** 2 * w_5 * w_7 * w_8 ** 2 / 576 - w_4 ** 2 * w_6 ** 4 / 8640 + w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 + w_4 ** 2 * w_6 ** 2 * w_7 * w_8 / 576 + w_4 ** 2 * w_6 ** 2 * w_8 ** 2 / 1728 + w_4 ** 2 * w_6 * w_7 ** 2 * w_8 / 576 + w_4 ** 2 * w_6 * w_7 * w_8 ** 2 / 576 - w_4 ** 2 * w_7 ** 4 / 8640 + w_4 ** 2 * w_7 ** 2 * w_8 ** 2 / 1728 - w_4 ** 2 * w_8 ** 4 / 8640 - w_4 * w_5 ** 4 * w_6 / 2880 - w_4 * w_5 ** 4 * w_7 / 2880 - w_4 * w_5 ** 4 * w_8 / 2880 + w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 576 + w_4 * w_5 ** 2 * w_6 ** 2 * w_8 / 576 + w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 576 + w_4 * w_5 ** 2 * w_6 * w_7 * w_8 / 192 + w_4 * w_5 ** 2 * w_6 * w_8 ** 2 / 576 + w_4 * w_5 ** 2 * w_7 ** 2 * w_8 / 576 + w_4 * w_5 ** 2 * w_7 * w_8 ** 2 / 576 - w_4 * w_5 * w_6 ** 4 / 2880 + w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 576 + w_4 * w_5 * w_6 ** 2 * w_7 * w_8 / 192 + w_4 * w_5 * w_6 ** 2 * w_8 ** 2 / 576 + w_4 * w_5 * w_6 * w_7 ** 2 * w_8 / 192 + w_4 * w_5 * w_6 * w_7 * w_8 ** 2 / 192 - w_4 * w_5 * w_7 ** 4 / 2880 + w_4 * w_5 * w_7 ** 2 * w_8 ** 2 / 576 - w_4 * w_5 * w_8 ** 4 / 2880 - w_4 * w_6 ** 4 * w_7 / 2880 - w_4 * w_6 ** 4 * w_8 / 2880 + w_4 * w_6 ** 2 * w_7 ** 2 * w_8 / 576 + w_4 * w_6 ** 2 * w_7 * w_8 ** 2 / 576 - w_4 * w_6 * w_7 ** 4 / 2880 + w_4 * w_6 * w_7 ** 2 * w_8 ** 2 / 576 - w_4 * w_6 * w_8 ** 4 / 2880 - w_4 * w_7 ** 4 * w_8 / 2880 - w_4 * w_7 * w_8 ** 4 / 2880 + w_5 ** 6 / 30240 - w_5 ** 4 * w_6 ** 2 / 8640 - w_5 ** 4 * w_6 * w_7 / 2880 - w_5 ** 4 * w_6 * w_8 / 2880 - w_5 ** 4 * w_7 ** 2 / 8640 - w_5 ** 4 * w_7 * w_8 / 2880 - w_5 ** 4 * w_8 ** 2 / 8640 - w_5 ** 2 * w_6 ** 4 / 8640 + w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 + w_5 ** 2 * w_6 ** 2 * w_7 * w_8 / 576 + w_5 ** 2 * w_6 ** 2 * w_8 ** 2 / 1728 + w_5 ** 2 * w_6 * w_7 ** 2 * w_8 / 576 + w_5 ** 2 * w_6 * w_7 * w_8 ** 2 / 576 - w_5 ** 2 * w_7 ** 4 / 8640 + w_5 ** 2 * w_7 ** 2 * w_8 ** 2 / 1728 - w_5 ** 2 * w_8 ** 4 / 8640 - w_5 * w_6 ** 4 * w_7 / 2880 - w_5 * w_6 ** 4 * w_8 / 2880 + w_5 * w_6 ** 2 * w_7 ** 2 * w_8 / 576 + w_5 * w_6 ** 2 * w_7 * w_8 ** 2 / 576 - w_5 * w_6 * w_7 ** 4 / 2880 + w_5 * w_6 * w_7 ** 2 * w_8 ** 2 / 576 - w_5 * w_6 * w_8 ** 4 / 2880 - w_5 * w_7 ** 4 * w_8 / 2880 - w_5 * w_7 * w_8 ** 4 / 2880 + w_6 ** 6 / 30240 - w_6 ** 4 * w_7 ** 2 / 8640 - w_6 ** 4 * w_7 * w_8 / 2880 - w_6 ** 4 * w_8 ** 2 / 8640 - w_6 ** 2 * w_7 ** 4 / 8640 + w_6 ** 2 * w_7 ** 2 * w_8 ** 2 / 1728 - w_6 ** 2 * w_8 ** 4 / 8640 - w_6 * w_7 ** 4 * w_8 / 2880 - w_6 * w_7 * w_8 ** 4 / 2880 + w_7 ** 6 / 30240 - w_7 ** 4 * w_8 ** 2 / 8640 - w_7 ** 2 * w_8 ** 4 / 8640 + w_8 ** 6 / 30240
-    if s == 7 and ln == 7:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        return w_1 ** 6 * w_2 / 60480 + w_1 ** 6 * w_3 / 60480 + w_1 ** 6 * w_4 / 60480 + w_1 ** 6 * w_5 / 60480 + w_1 ** 6 * w_6 / 60480 + w_1 ** 6 * w_7 / 60480 - w_1 ** 4 * w_2 ** 2 * w_3 / 17280 - w_1 ** 4 * w_2 ** 2 * w_4 / 17280 - w_1 ** 4 * w_2 ** 2 * w_5 / 17280 - w_1 ** 4 * w_2 ** 2 * w_6 / 17280 - w_1 ** 4 * w_2 ** 2 * w_7 / 17280 - w_1 ** 4 * w_2 * w_3 ** 2 / 17280 - w_1 ** 4 * w_2 * w_3 * w_4 / 5760 - w_1 ** 4 * w_2 * w_3 * w_5 / 5760 - w_1 ** 4 * w_2 * w_3 * w_6 / 5760 - w_1 ** 4 * w_2 * w_3 * w_7 / 5760 - w_1 ** 4 * w_2 * w_4 ** 2 / 17280 - w_1 ** 4 * w_2 * w_4 * w_5 / 5760 - w_1 ** 4 * w_2 * w_4 * w_6 / 5760 - w_1 ** 4 * w_2 * w_4 * w_7 / 5760 - w_1 ** 4 * w_2 * w_5 ** 2 / 17280 - w_1 ** 4 * w_2 * w_5 * w_6 / 5760 - w_1 ** 4 * w_2 * w_5 * w_7 / 5760 - w_1 ** 4 * w_2 * w_6 ** 2 / 17280 - w_1 ** 4 * w_2 * w_6 * w_7 / 5760 - w_1 ** 4 * w_2 * w_7 ** 2 / 17280 - w_1 ** 4 * w_3 ** 2 * w_4 / 17280 - w_1 ** 4 * w_3 ** 2 * w_5 / 17280 - w_1 ** 4 * w_3 ** 2 * w_6 / 17280 - w_1 ** 4 * w_3 ** 2 * w_7 / 17280 - w_1 ** 4 * w_3 * w_4 ** 2 / 17280 - w_1 ** 4 * w_3 * w_4 * w_5 / 5760 - w_1 ** 4 * w_3 * w_4 * w_6 / 5760 - w_1 ** 4 * w_3 * w_4 * w_7 / 5760 - w_1 ** 4 * w_3 * w_5 ** 2 / 17280 - w_1 ** 4 * w_3 * w_5 * w_6 / 5760 - w_1 ** 4 * w_3 * w_5 * w_7 / 5760 - w_1 ** 4 * w_3 * w_6 ** 2 / 17280 - w_1 ** 4 * w_3 * w_6 * w_7 / 5760 - w_1 ** 4 * w_3 * w_7 ** 2 / 17280 - w_1 ** 4 * w_4 ** 2 * w_5 / 17280 - w_1 ** 4 * w_4 ** 2 * w_6 / 17280 - w_1 ** 4 * w_4 ** 2 * w_7 / 17280 - w_1 ** 4 * w_4 * w_5 ** 2 / 17280 - w_1 ** 4 * w_4 * w_5 * w_6 / 5760 - w_1 ** 4 * w_4 * w_5 * w_7 / 5760 - w_1 ** 4 * w_4 * w_6 ** 2 / 17280 - w_1 ** 4 * w_4 * w_6 * w_7 / 5760 - w_1 ** 4 * w_4 * w_7 ** 2 / 17280 - w_1 ** 4 * w_5 ** 2 * w_6 / 17280 - w_1 ** 4 * w_5 ** 2 * w_7 / 17280 - w_1 ** 4 * w_5 * w_6 ** 2 / 17280 - w_1 ** 4 * w_5 * w_6 * w_7 / 5760 - w_1 ** 4 * w_5 * w_7 ** 2 / 17280 - w_1 ** 4 * w_6 ** 2 * w_7 / 17280 - w_1 ** 4 * w_6 * w_7 ** 2 / 17280 - w_1 ** 2 * w_2 ** 4 * w_3 / 17280 - w_1 ** 2 * w_2 ** 4 * w_4 / 17280 - w_1 ** 2 * w_2 ** 4 * w_5 / 17280 - w_1 ** 2 * w_2 ** 4 * w_6 / 17280 - w_1 ** 2 * w_2 ** 4 * w_7 / 17280 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_6 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_7 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_6 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_7 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 * w_6 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 * w_7 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_6 * w_7 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_6 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_7 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 * w_6 / 1152 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 * w_7 / 1152 + w_1 ** 2 * w_2 ** 2 * w_4 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 * w_6 * w_7 / 1152 + w_1 ** 2 * w_2 ** 2 * w_4 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 * w_6 / 3456 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 * w_7 / 3456 + w_1 ** 2 * w_2 ** 2 * w_5 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_5 * w_6 * w_7 / 1152 + w_1 ** 2 * w_2 ** 2 * w_5 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_6 ** 2 * w_7 / 3456 + w_1 ** 2 * w_2 ** 2 * w_6 * w_7 ** 2 / 3456 - w_1 ** 2 * w_2 * w_3 ** 4 / 17280 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_6 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_7 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 * w_6 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 * w_7 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 ** 2 * w_6 * w_7 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_6 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_7 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 * w_6 / 384 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 * w_7 / 384 + w_1 ** 2 * w_2 * w_3 * w_4 * w_6 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 * w_6 * w_7 / 384 + w_1 ** 2 * w_2 * w_3 * w_4 * w_7 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 * w_6 / 1152 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 * w_7 / 1152 + w_1 ** 2 * w_2 * w_3 * w_5 * w_6 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_5 * w_6 * w_7 / 384 + w_1 ** 2 * w_2 * w_3 * w_5 * w_7 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_6 ** 2 * w_7 / 1152 + w_1 ** 2 * w_2 * w_3 * w_6 * w_7 ** 2 / 1152 - w_1 ** 2 * w_2 * w_4 ** 4 / 17280 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 * w_6 / 1152 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 * w_7 / 1152 + w_1 ** 2 * w_2 * w_4 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 * w_4 ** 2 * w_6 * w_7 / 1152 + w_1 ** 2 * w_2 * w_4 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 * w_6 / 1152 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 * w_7 / 1152 + w_1 ** 2 * w_2 * w_4 * w_5 * w_6 ** 2 / 1152 + w_1 ** 2 * w_2 * w_4 * w_5 * w_6 * w_7 / 384 + w_1 ** 2 * w_2 * w_4 * w_5 * w_7 ** 2 / 1152 + w_1 ** 2 * w_2 * w_4 * w_6 ** 2 * w_7 / 1152 + w_1 ** 2 * w_2 * w_4 * w_6 * w_7 ** 2 / 1152 - w_1 ** 2 * w_2 * w_5 ** 4 / 17280 + w_1 ** 2 * w_2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_1 ** 2 * w_2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_1 ** 2 * w_2 * w_5 * w_6 * w_7 ** 2 / 1152 - w_1 ** 2 * w_2 * w_6 ** 4 / 17280 + w_1 ** 2 * w_2 * w_6 ** 2 * w_7 ** 2 / 3456 - w_1 ** 2 * w_2 * w_7 ** 4 / 17280 - w_1 ** 2 * w_3 ** 4 * w_4 / 17280 - w_1 ** 2 * w_3 ** 4 * w_5 / 17280 - w_1 ** 2 * w_3 ** 4 * w_6 / 17280 - w_1 ** 2 * w_3 ** 4 * w_7 / 17280 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_7 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 / 1152 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 * w_7 / 1152 + w_1 ** 2 * w_3 ** 2 * w_4 * w_6 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 * w_6 * w_7 / 1152 + w_1 ** 2 * w_3 ** 2 * w_4 * w_7 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 / 3456 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 * w_7 / 3456 + w_1 ** 2 * w_3 ** 2 * w_5 * w_6 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_5 * w_6 * w_7 / 1152 + w_1 ** 2 * w_3 ** 2 * w_5 * w_7 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_6 ** 2 * w_7 / 3456 + w_1 ** 2 * w_3 ** 2 * w_6 * w_7 ** 2 / 3456 - w_1 ** 2 * w_3 * w_4 ** 4 / 17280 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 3456 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 / 1152 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 * w_7 / 1152 + w_1 ** 2 * w_3 * w_4 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_3 * w_4 ** 2 * w_6 * w_7 / 1152 + w_1 ** 2 * w_3 * w_4 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 / 1152 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 * w_7 / 1152 + w_1 ** 2 * w_3 * w_4 * w_5 * w_6 ** 2 / 1152 + w_1 ** 2 * w_3 * w_4 * w_5 * w_6 * w_7 / 384 + w_1 ** 2 * w_3 * w_4 * w_5 * w_7 ** 2 / 1152 + w_1 ** 2 * w_3 * w_4 * w_6 ** 2 * w_7 / 1152 + w_1 ** 2 * w_3 * w_4 * w_6 * w_7 ** 2 / 1152 - w_1 ** 2 * w_3 * w_5 ** 4 / 17280 + w_1 ** 2 * w_3 * w_5 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_3 * w_5 ** 2 * w_6 * w_7 / 1152 + w_1 ** 2 * w_3 * w_5 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_3 * w_5 * w_6 ** 2 * w_7 / 1152 + w_1 ** 2 * w_3 * w_5 * w_6 * w_7 ** 2 / 1152 - w_1 ** 2 * w_3 * w_6 ** 4 / 17280 + w_1 ** 2 * w_3 * w_6 ** 2 * w_7 ** 2 / 3456 - w_1 ** 2 * w_3 * w_7 ** 4 / 17280 - w_1 ** 2 * w_4 ** 4 * w_5 / 17280 - w_1 ** 2 * w_4 ** 4 * w_6 / 17280 - w_1 ** 2 * w_4 ** 4 * w_7 / 17280 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 3456 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 * w_7 / 3456 + w_1 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 3456 + w_1 ** 2 * w_4 ** 2 * w_5 * w_6 * w_7 / 1152 + w_1 ** 2 * w_4 ** 2 * w_5 * w_7 ** 2 / 3456 + w_1 ** 2 * w_4 ** 2 * w_6 ** 2 * w_7 / 3456 + w_1 ** 2 * w_4 ** 2 * w_6 * w_7 ** 2 / 3456 - w_1 ** 2 * w_4 * w_5 ** 4 / 17280 + w_1 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_4 * w_5 ** 2 * w_6 * w_7 / 1152 + w_1 ** 2 * w_4 * w_5 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_4 * w_5 * w_6 ** 2 * w_7 / 1152 + w_1 ** 2 * w_4 * w_5 * w_6 * w_7 ** 2 / 1152 - w_1 ** 2 * w_4 * w_6 ** 4 / 17280 + w_1 ** 2 * w_4 * w_6 ** 2 * w_7 ** 2 / 3456 - w_1 ** 2 * w_4 * w_7 ** 4 / 17280 - w_1 ** 2 * w_5 ** 4 * w_6 / 17280 - w_1 ** 2 * w_5 ** 4 * w_7 / 17280 + w_1 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 3456 + w_1 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 3456 - w_1 ** 2 * w_5 * w_6 ** 4 / 17280 + w_1 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 3456 - w_1 ** 2 * w_5 * w_7 ** 4 / 17280 - w_1 ** 2 * w_6 ** 4 * w_7 / 17280 - w_1 ** 2 * w_6 * w_7 ** 4 / 17280 + w_1 * w_2 ** 6 / 60480 - w_1 * w_2 ** 4 * w_3 ** 2 / 17280 - w_1 * w_2 ** 4 * w_3 * w_4 / 5760 - w_1 * w_2 ** 4 * w_3 * w_5 / 5760 - w_1 * w_2 ** 4 * w_3 * w_6 / 5760 - w_1 * w_2 ** 4 * w_3 * w_7 / 5760 - w_1 * w_2 ** 4 * w_4 ** 2 / 17280 - w_1 * w_2 ** 4 * w_4 * w_5 / 5760 - w_1 * w_2 ** 4 * w_4 * w_6 / 5760 - w_1 * w_2 ** 4 * w_4 * w_7 / 5760 - w_1 * w_2 ** 4 * w_5 ** 2 / 17280 - w_1 * w_2 ** 4 * w_5 * w_6 / 5760 - w_1 * w_2 ** 4 * w_5 * w_7 / 5760 - w_1 * w_2 ** 4 * w_6 ** 2 / 17280 - w_1 * w_2 ** 4 * w_6 * w_7 / 5760 - w_1 * w_2 ** 4 * w_7 ** 2 / 17280 - w_1 * w_2 ** 2 * w_3 ** 4 / 17280 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_6 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_7 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 * w_6 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 * w_7 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_6 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 ** 2 * w_6 * w_7 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_7 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_6 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_7 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 * w_6 / 384 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 * w_7 / 384 + w_1 * w_2 ** 2 * w_3 * w_4 * w_6 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 * w_6 * w_7 / 384 + w_1 * w_2 ** 2 * w_3 * w_4 * w_7 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 * w_6 / 1152 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 * w_7 / 1152 + w_1 * w_2 ** 2 * w_3 * w_5 * w_6 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_5 * w_6 * w_7 / 384 + w_1 * w_2 ** 2 * w_3 * w_5 * w_7 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_6 ** 2 * w_7 / 1152 + w_1 * w_2 ** 2 * w_3 * w_6 * w_7 ** 2 / 1152 - w_1 * w_2 ** 2 * w_4 ** 4 / 17280 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 3456 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 * w_6 / 1152 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 * w_7 / 1152 + w_1 * w_2 ** 2 * w_4 ** 2 * w_6 ** 2 / 3456 + w_1 * w_2 ** 2 * w_4 ** 2 * w_6 * w_7 / 1152 + w_1 * w_2 ** 2 * w_4 ** 2 * w_7 ** 2 / 3456 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 * w_6 / 1152 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 * w_7 / 1152 + w_1 * w_2 ** 2 * w_4 * w_5 * w_6 ** 2 / 1152 + w_1 * w_2 ** 2 * w_4 * w_5 * w_6 * w_7 / 384 + w_1 * w_2 ** 2 * w_4 * w_5 * w_7 ** 2 / 1152 + w_1 * w_2 ** 2 * w_4 * w_6 ** 2 * w_7 / 1152 + w_1 * w_2 ** 2 * w_4 * w_6 * w_7 ** 2 / 1152 - w_1 * w_2 ** 2 * w_5 ** 4 / 17280 + w_1 * w_2 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_1 * w_2 ** 2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_1 * w_2 ** 2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_1 * w_2 ** 2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_1 * w_2 ** 2 * w_5 * w_6 * w_7 ** 2 / 1152 - w_1 * w_2 ** 2 * w_6 ** 4 / 17280 + w_1 * w_2 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 - w_1 * w_2 ** 2 * w_7 ** 4 / 17280 - w_1 * w_2 * w_3 ** 4 * w_4 / 5760 - w_1 * w_2 * w_3 ** 4 * w_5 / 5760 - w_1 * w_2 * w_3 ** 4 * w_6 / 5760 - w_1 * w_2 * w_3 ** 4 * w_7 / 5760 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_6 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_7 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 * w_6 / 384 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 * w_7 / 384 + w_1 * w_2 * w_3 ** 2 * w_4 * w_6 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 * w_6 * w_7 / 384 + w_1 * w_2 * w_3 ** 2 * w_4 * w_7 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 * w_6 / 1152 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 * w_7 / 1152 + w_1 * w_2 * w_3 ** 2 * w_5 * w_6 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_5 * w_6 * w_7 / 384 + w_1 * w_2 * w_3 ** 2 * w_5 * w_7 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_6 ** 2 * w_7 / 1152 + w_1 * w_2 * w_3 ** 2 * w_6 * w_7 ** 2 / 1152 - w_1 * w_2 * w_3 * w_4 ** 4 / 5760 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 1152 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 * w_6 / 384 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 * w_7 / 384 + w_1 * w_2 * w_3 * w_4 ** 2 * w_6 ** 2 / 1152 + w_1 * w_2 * w_3 * w_4 ** 2 * w_6 * w_7 / 384 + w_1 * w_2 * w_3 * w_4 ** 2 * w_7 ** 2 / 1152 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 * w_6 / 384 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 * w_7 / 384 + w_1 * w_2 * w_3 * w_4 * w_5 * w_6 ** 2 / 384 + w_1 * w_2 * w_3 * w_4 * w_5 * w_6 * w_7 / 128 + w_1 * w_2 * w_3 * w_4 * w_5 * w_7 ** 2 / 384 + w_1 * w_2 * w_3 * w_4 * w_6 ** 2 * w_7 / 384 + w_1 * w_2 * w_3 * w_4 * w_6 * w_7 ** 2 / 384 - w_1 * w_2 * w_3 * w_5 ** 4 / 5760 + w_1 * w_2 * w_3 * w_5 ** 2 * w_6 ** 2 / 1152 + w_1 * w_2 * w_3 * w_5 ** 2 * w_6 * w_7 / 384 + w_1 * w_2 * w_3 * w_5 ** 2 * w_7 ** 2 / 1152 + w_1 * w_2 * w_3 * w_5 * w_6 ** 2 * w_7 / 384 + w_1 * w_2 * w_3 * w_5 * w_6 * w_7 ** 2 / 384 - w_1 * w_2 * w_3 * w_6 ** 4 / 5760 + w_1 * w_2 * w_3 * w_6 ** 2 * w_7 ** 2 / 1152 - w_1 * w_2 * w_3 * w_7 ** 4 / 5760 - w_1 * w_2 * w_4 ** 4 * w_5 / 5760 - w_1 * w_2 * w_4 ** 4 * w_6 / 5760 - w_1 * w_2 * w_4 ** 4 * w_7 / 5760 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 * w_6 / 1152 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 * w_7 / 1152 + w_1 * w_2 * w_4 ** 2 * w_5 * w_6 ** 2 / 1152 + w_1 * w_2 * w_4 ** 2 * w_5 * w_6 * w_7 / 384 + w_1 * w_2 * w_4 ** 2 * w_5 * w_7 ** 2 / 1152 + w_1 * w_2 * w_4 ** 2 * w_6 ** 2 * w_7 / 1152 + w_1 * w_2 * w_4 ** 2 * w_6 * w_7 ** 2 / 1152 - w_1 * w_2 * w_4 * w_5 ** 4 / 5760 + w_1 * w_2 * w_4 * w_5 ** 2 * w_6 ** 2 / 1152 + w_1 * w_2 * w_4 * w_5 ** 2 * w_6 * w_7 / 384 + w_1 * w_2 * w_4 * w_5 ** 2 * w_7 ** 2 / 1152 + w_1 * w_2 * w_4 * w_5 * w_6 ** 2 * w_7 / 384 + w_1 * w_2 * w_4 * w_5 * w_6 * w_7 ** 2 / 384 - w_1 * w_2 * w_4 * w_6 ** 4 / 5760 + w_1 * w_2 * w_4 * w_6 ** 2 * w_7 ** 2 / 1152 - w_1 * w_2 * w_4 * w_7 ** 4 / 5760 - w_1 * w_2 * w_5 ** 4 * w_6 / 5760 - w_1 * w_2 * w_5 ** 4 * w_7 / 5760 + w_1 * w_2 * w_5 ** 2 * w_6 ** 2 * w_7 / 1152 + w_1 * w_2 * w_5 ** 2 * w_6 * w_7 ** 2 / 1152 - w_1 * w_2 * w_5 * w_6 ** 4 / 5760 + w_1 * w_2 * w_5 * w_6 ** 2 * w_7 ** 2 / 1152 - w_1 * w_2 * w_5 * w_7 ** 4 / 5760 - w_1 * w_2 * w_6 ** 4 * w_7 / 5760 - w_1 * w_2 * w_6 * w_7 ** 4 / 5760 + w_1 * w_3 ** 6 / 60480 - w_1 * w_3 ** 4 * w_4 ** 2 / 17280 - w_1 * w_3 ** 4 * w_4 * w_5 / 5760 - w_1 * w_3 ** 4 * w_4 * w_6 / 5760 - w_1 * w_3 ** 4 * w_4 * w_7 / 5760 - w_1 * w_3 ** 4 * w_5 ** 2 / 17280 - w_1 * w_3 ** 4 * w_5 * w_6 / 5760 - w_1 * w_3 ** 4 * w_5 * w_7 / 5760 - w_1 * w_3 ** 4 * w_6 ** 2 / 17280 - w_1 * w_3 ** 4 * w_6 * w_7 / 5760 - w_1 * w_3 ** 4 * w_7 ** 2 / 17280 - w_1 * w_3 ** 2 * w_4 ** 4 / 17280 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 3456 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 1152 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 * w_7 / 1152 + w_1 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 3456 + w_1 * w_3 ** 2 * w_4 ** 2 * w_6 * w_7 / 1152 + w_1 * w_3 ** 2 * w_4 ** 2 * w_7 ** 2 / 3456 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 1152 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 * w_7 / 1152 + w_1 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 1152 + w_1 * w_3 ** 2 * w_4 * w_5 * w_6 * w_7 / 384 + w_1 * w_3 ** 2 * w_4 * w_5 * w_7 ** 2 / 1152 + w_1 * w_3 ** 2 * w_4 * w_6 ** 2 * w_7 / 1152 + w_1 * w_3 ** 2 * w_4 * w_6 * w_7 ** 2 / 1152 - w_1 * w_3 ** 2 * w_5 ** 4 / 17280 + w_1 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_1 * w_3 ** 2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_1 * w_3 ** 2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_1 * w_3 ** 2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_1 * w_3 ** 2 * w_5 * w_6 * w_7 ** 2 / 1152 - w_1 * w_3 ** 2 * w_6 ** 4 / 17280 + w_1 * w_3 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 - w_1 * w_3 ** 2 * w_7 ** 4 / 17280 - w_1 * w_3 * w_4 ** 4 * w_5 / 5760 - w_1 * w_3 * w_4 ** 4 * w_6 / 5760 - w_1 * w_3 * w_4 ** 4 * w_7 / 5760 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 1152 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 * w_7 / 1152 + w_1 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 1152 + w_1 * w_3 * w_4 ** 2 * w_5 * w_6 * w_7 / 384 + w_1 * w_3 * w_4 ** 2 * w_5 * w_7 ** 2 / 1152 + w_1 * w_3 * w_4 ** 2 * w_6 ** 2 * w_7 / 1152 + w_1 * w_3 * w_4 ** 2 * w_6 * w_7 ** 2 / 1152 - w_1 * w_3 * w_4 * w_5 ** 4 / 5760 + w_1 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 1152 + w_1 * w_3 * w_4 * w_5 ** 2 * w_6 * w_7 / 384 + w_1 * w_3 * w_4 * w_5 ** 2 * w_7 ** 2 / 1152 + w_1 * w_3 * w_4 * w_5 * w_6 ** 2 * w_7 / 384 + w_1 * w_3 * w_4 * w_5 * w_6 * w_7 ** 2 / 384 - w_1 * w_3 * w_4 * w_6 ** 4 / 5760 + w_1 * w_3 * w_4 * w_6 ** 2 * w_7 ** 2 / 1152 - w_1 * w_3 * w_4 * w_7 ** 4 / 5760 - w_1 * w_3 * w_5 ** 4 * w_6 / 5760 - w_1 * w_3 * w_5 ** 4 * w_7 / 5760 + w_1 * w_3 * w_5 ** 2 * w_6 ** 2 * w_7 / 1152 + w_1 * w_3 * w_5 ** 2 * w_6 * w_7 ** 2 / 1152 - w_1 * w_3 * w_5 * w_6 ** 4 / 5760 + w_1 * w_3 * w_5 * w_6 ** 2 * w_7 ** 2 / 1152 - w_1 * w_3 * w_5 * w_7 ** 4 / 5760 - w_1 * w_3 * w_6 ** 4 * w_7 / 5760 - w_1 * w_3 * w_6 * w_7 ** 4 / 5760 + w_1 * w_4 ** 6 / 60480 - w_1 * w_4 ** 4 * w_5 ** 2 / 17280 - w_1 * w_4 ** 4 * w_5 * w_6 / 5760 - w_1 * w_4 ** 4 * w_5 * w_7 / 5760 - w_1 * w_4 ** 4 * w_6 ** 2 / 17280 - w_1 * w_4 ** 4 * w_6 * w_7 / 5760 - w_1 * w_4 ** 4 * w_7 ** 2 / 17280 - w_1 * w_4 ** 2 * w_5 ** 4 / 17280 + w_1 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_1 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_1 * w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_1 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_1 * w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 1152 - w_1 * w_4 ** 2 * w_6 ** 4 / 17280 + w_1 * w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 - w_1 * w_4 ** 2 * w_7 ** 4 / 17280 - w_1 * w_4 * w_5 ** 4 * w_6 / 5760 - w_1 * w_4 * w_5 ** 4 * w_7 / 5760 + w_1 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 1152 + w_1 * w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 1152 - w_1 * w_4 * w_5 * w_6 ** 4 / 5760 + w_1 * w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 1152 - w_1 * w_4 * w_5 * w_7 ** 4 / 5760 - w_1 * w_4 * w_6 ** 4 * w_7 / 5760 - w_1 * w_4 * w_6 * w_7 ** 4 / 5760 + w_1 * w_5 ** 6 / 60480 - w_1 * w_5 ** 4 * w_6 ** 2 / 17280 - w_1 * w_5 ** 4 * w_6 * w_7 / 5760 - w_1 * w_5 ** 4 * w_7 ** 2 / 17280 - w_1 * w_5 ** 2 * w_6 ** 4 / 17280 + w_1 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 - w_1 * w_5 ** 2 * w_7 ** 4 / 17280 - w_1 * w_5 * w_6 ** 4 * w_7 / 5760 - w_1 * w_5 * w_6 * w_7 ** 4 / 5760 + w_1 * w_6 ** 6 / 60480 - w_1 * w_6 ** 4 * w_7 ** 2 / 17280 - w_1 * w_6 ** 2 * w_7 ** 4 / 17280 + w_1 * w_7 ** 6 / 60480 + w_2 ** 6 * w_3 / 60480 + w_2 ** 6 * w_4 / 60480 + w_2 ** 6 * w_5 / 60480 + w_2 ** 6 * w_6 / 60480 + w_2 ** 6 * w_7 / 60480 - w_2 ** 4 * w_3 ** 2 * w_4 / 17280 - w_2 ** 4 * w_3 ** 2 * w_5 / 17280 - w_2 ** 4 * w_3 ** 2 * w_6 / 17280 - w_2 ** 4 * w_3 ** 2 * w_7 / 17280 - w_2 ** 4 * w_3 * w_4 ** 2 / 17280 - w_2 ** 4 * w_3 * w_4 * w_5 / 5760 - w_2 ** 4 * w_3 * w_4 * w_6 / 5760 - w_2 ** 4 * w_3 * w_4 * w_7 / 5760 - w_2 ** 4 * w_3 * w_5 ** 2 / 17280 - w_2 ** 4 * w_3 * w_5 * w_6 / 5760 - w_2 ** 4 * w_3 * w_5 * w_7 / 5760 - w_2 ** 4 * w_3 * w_6 ** 2 / 17280 - w_2 ** 4 * w_3 * w_6 * w_7 / 5760 - w_2 ** 4 * w_3 * w_7 ** 2 / 17280 - w_2 ** 4 * w_4 ** 2 * w_5 / 17280 - w_2 ** 4 * w_4 ** 2 * w_6 / 17280 - w_2 ** 4 * w_4 ** 2 * w_7 / 17280 - w_2 ** 4 * w_4 * w_5 ** 2 / 17280 - w_2 ** 4 * w_4 * w_5 * w_6 / 5760 - w_2 ** 4 * w_4 * w_5 * w_7 / 5760 - w_2 ** 4 * w_4 * w_6 ** 2 / 17280 - w_2 ** 4 * w_4 * w_6 * w_7 / 5760 - w_2 ** 4 * w_4 * w_7 ** 2 / 17280 - w_2 ** 4 * w_5 ** 2 * w_6 / 17280 - w_2 ** 4 * w_5 ** 2 * w_7 / 17280 - w_2 ** 4 * w_5 * w_6 ** 2 / 17280 - w_2 ** 4 * w_5 * w_6 * w_7 / 5760 - w_2 ** 4 * w_5 * w_7 ** 2 / 17280 - w_2 ** 4 * w_6 ** 2 * w_7 / 17280 - w_2 ** 4 * w_6 * w_7 ** 2 / 17280 - w_2 ** 2 * w_3 ** 4 * w_4 / 17280 - w_2 ** 2 * w_3 ** 4 * w_5 / 17280 - w_2 ** 2 * w_3 ** 4 * w_6 / 17280 - w_2 ** 2 * w_3 ** 4 * w_7 / 17280 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_7 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 / 1152 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_7 / 1152 + w_2 ** 2 * w_3 ** 2 * w_4 * w_6 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 * w_6 * w_7 / 1152 + w_2 ** 2 * w_3 ** 2 * w_4 * w_7 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 / 3456 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_7 / 3456 + w_2 ** 2 * w_3 ** 2 * w_5 * w_6 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_5 * w_6 * w_7 / 1152 + w_2 ** 2 * w_3 ** 2 * w_5 * w_7 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_6 ** 2 * w_7 / 3456 + w_2 ** 2 * w_3 ** 2 * w_6 * w_7 ** 2 / 3456 - w_2 ** 2 * w_3 * w_4 ** 4 / 17280 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 3456 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 / 1152 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_7 / 1152 + w_2 ** 2 * w_3 * w_4 ** 2 * w_6 ** 2 / 3456 + w_2 ** 2 * w_3 * w_4 ** 2 * w_6 * w_7 / 1152 + w_2 ** 2 * w_3 * w_4 ** 2 * w_7 ** 2 / 3456 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 / 1152 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_7 / 1152 + w_2 ** 2 * w_3 * w_4 * w_5 * w_6 ** 2 / 1152 + w_2 ** 2 * w_3 * w_4 * w_5 * w_6 * w_7 / 384 + w_2 ** 2 * w_3 * w_4 * w_5 * w_7 ** 2 / 1152 + w_2 ** 2 * w_3 * w_4 * w_6 ** 2 * w_7 / 1152 + w_2 ** 2 * w_3 * w_4 * w_6 * w_7 ** 2 / 1152 - w_2 ** 2 * w_3 * w_5 ** 4 / 17280 + w_2 ** 2 * w_3 * w_5 ** 2 * w_6 ** 2 / 3456 + w_2 ** 2 * w_3 * w_5 ** 2 * w_6 * w_7 / 1152 + w_2 ** 2 * w_3 * w_5 ** 2 * w_7 ** 2 / 3456 + w_2 ** 2 * w_3 * w_5 * w_6 ** 2 * w_7 / 1152 + w_2 ** 2 * w_3 * w_5 * w_6 * w_7 ** 2 / 1152 - w_2 ** 2 * w_3 * w_6 ** 4 / 17280 + w_2 ** 2 * w_3 * w_6 ** 2 * w_7 ** 2 / 3456 - w_2 ** 2 * w_3 * w_7 ** 4 / 17280 - w_2 ** 2 * w_4 ** 4 * w_5 / 17280 - w_2 ** 2 * w_4 ** 4 * w_6 / 17280 - w_2 ** 2 * w_4 ** 4 * w_7 / 17280 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 3456 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_7 / 3456 + w_2 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 3456 + w_2 ** 2 * w_4 ** 2 * w_5 * w_6 * w_7 / 1152 + w_2 ** 2 * w_4 ** 2 * w_5 * w_7 ** 2 / 3456 + w_2 ** 2 * w_4 ** 2 * w_6 ** 2 * w_7 / 3456 + w_2 ** 2 * w_4 ** 2 * w_6 * w_7 ** 2 / 3456 - w_2 ** 2 * w_4 * w_5 ** 4 / 17280 + w_2 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 3456 + w_2 ** 2 * w_4 * w_5 ** 2 * w_6 * w_7 / 1152 + w_2 ** 2 * w_4 * w_5 ** 2 * w_7 ** 2 / 3456 + w_2 ** 2 * w_4 * w_5 * w_6 ** 2 * w_7 / 1152 + w_2 ** 2 * w_4 * w_5 * w_6 * w_7 ** 2 / 1152 - w_2 ** 2 * w_4 * w_6 ** 4 / 17280 + w_2 ** 2 * w_4 * w_6 ** 2 * w_7 ** 2 / 3456 - w_2 ** 2 * w_4 * w_7 ** 4 / 17280 - w_2 ** 2 * w_5 ** 4 * w_6 / 17280 - w_2 ** 2 * w_5 ** 4 * w_7 / 17280 + w_2 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 3456 + w_2 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 3456 - w_2 ** 2 * w_5 * w_6 ** 4 / 17280 + w_2 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 3456 - w_2 ** 2 * w_5 * w_7 ** 4 / 17280 - w_2 ** 2 * w_6 ** 4 * w_7 / 17280 - w_2 ** 2 * w_6 * w_7 ** 4 / 17280 + w_2 * w_3 ** 6 / 60480 - w_2 * w_3 ** 4 * w_4 ** 2 / 17280 - w_2 * w_3 ** 4 * w_4 * w_5 / 5760 - w_2 * w_3 ** 4 * w_4 * w_6 / 5760 - w_2 * w_3 ** 4 * w_4 * w_7 / 5760 - w_2 * w_3 ** 4 * w_5 ** 2 / 17280 - w_2 * w_3 ** 4 * w_5 * w_6 / 5760 - w_2 * w_3 ** 4 * w_5 * w_7 / 5760 - w_2 * w_3 ** 4 * w_6 ** 2 / 17280 - w_2 * w_3 ** 4 * w_6 * w_7 / 5760 - w_2 * w_3 ** 4 * w_7 ** 2 / 17280 - w_2 * w_3 ** 2 * w_4 ** 4 / 17280 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 3456 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 1152 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_7 / 1152 + w_2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 3456 + w_2 * w_3 ** 2 * w_4 ** 2 * w_6 * w_7 / 1152 + w_2 * w_3 ** 2 * w_4 ** 2 * w_7 ** 2 / 3456 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 1152 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_7 / 1152 + w_2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 1152 + w_2 * w_3 ** 2 * w_4 * w_5 * w_6 * w_7 / 384 + w_2 * w_3 ** 2 * w_4 * w_5 * w_7 ** 2 / 1152 + w_2 * w_3 ** 2 * w_4 * w_6 ** 2 * w_7 / 1152 + w_2 * w_3 ** 2 * w_4 * w_6 * w_7 ** 2 / 1152 - w_2 * w_3 ** 2 * w_5 ** 4 / 17280 + w_2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_2 * w_3 ** 2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_2 * w_3 ** 2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_2 * w_3 ** 2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_2 * w_3 ** 2 * w_5 * w_6 * w_7 ** 2 / 1152 - w_2 * w_3 ** 2 * w_6 ** 4 / 17280 + w_2 * w_3 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 - w_2 * w_3 ** 2 * w_7 ** 4 / 17280 - w_2 * w_3 * w_4 ** 4 * w_5 / 5760 - w_2 * w_3 * w_4 ** 4 * w_6 / 5760 - w_2 * w_3 * w_4 ** 4 * w_7 / 5760 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 1152 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_7 / 1152 + w_2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 1152 + w_2 * w_3 * w_4 ** 2 * w_5 * w_6 * w_7 / 384 + w_2 * w_3 * w_4 ** 2 * w_5 * w_7 ** 2 / 1152 + w_2 * w_3 * w_4 ** 2 * w_6 ** 2 * w_7 / 1152 + w_2 * w_3 * w_4 ** 2 * w_6 * w_7 ** 2 / 1152 - w_2 * w_3 * w_4 * w_5 ** 4 / 5760 + w_2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 1152 + w_2 * w_3 * w_4 * w_5 ** 2 * w_6 * w_7 / 384 + w_2 * w_3 * w_4 * w_5 ** 2 * w_7 ** 2 / 1152 + w_2 * w_3 * w_4 * w_5 * w_6 ** 2 * w_7 / 384 + w_2 * w_3 * w_4 * w_5 * w_6 * w_7 ** 2 / 384 - w_2 * w_3 * w_4 * w_6 ** 4 / 5760 + w_2 * w_3 * w_4 * w_6 ** 2 * w_7 ** 2 / 1152 - w_2 * w_3 * w_4 * w_7 ** 4 / 5760 - w_2 * w_3 * w_5 ** 4 * w_6 / 5760 - w_2 * w_3 * w_5 ** 4 * w_7 / 5760 + w_2 * w_3 * w_5 ** 2 * w_6 ** 2 * w_7 / 1152 + w_2 * w_3 * w_5 ** 2 * w_6 * w_7 ** 2 / 1152 - w_2 * w_3 * w_5 * w_6 ** 4 / 5760 + w_2 * w_3 * w_5 * w_6 ** 2 * w_7 ** 2 / 1152 - w_2 * w_3 * w_5 * w_7 ** 4 / 5760 - w_2 * w_3 * w_6 ** 4 * w_7 / 5760 - w_2 * w_3 * w_6 * w_7 ** 4 / 5760 + w_2 * w_4 ** 6 / 60480 - w_2 * w_4 ** 4 * w_5 ** 2 / 17280 - w_2 * w_4 ** 4 * w_5 * w_6 / 5760 - w_2 * w_4 ** 4 * w_5 * w_7 / 5760 - w_2 * w_4 ** 4 * w_6 ** 2 / 17280 - w_2 * w_4 ** 4 * w_6 * w_7 / 5760 - w_2 * w_4 ** 4 * w_7 ** 2 / 17280 - w_2 * w_4 ** 2 * w_5 ** 4 / 17280 + w_2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_2 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_2 * w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_2 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_2 * w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 1152 - w_2 * w_4 ** 2 * w_6 ** 4 / 17280 + w_2 * w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 - w_2 * w_4 ** 2 * w_7 ** 4 / 17280 - w_2 * w_4 * w_5 ** 4 * w_6 / 5760 - w_2 * w_4 * w_5 ** 4 * w_7 / 5760 + w_2 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 1152 + w_2 * w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 1152 - w_2 * w_4 * w_5 * w_6 ** 4 / 5760 + w_2 * w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 1152 - w_2 * w_4 * w_5 * w_7 ** 4 / 5760 - w_2 * w_4 * w_6 ** 4 * w_7 / 5760 - w_2 * w_4 * w_6 * w_7 ** 4 / 5760 + w_2 * w_5 ** 6 / 60480 - w_2 * w_5 ** 4 * w_6 ** 2 / 17280 - w_2 * w_5 ** 4 * w_6 * w_7 / 5760 - w_2 * w_5 ** 4 * w_7 ** 2 / 17280 - w_2 * w_5 ** 2 * w_6 ** 4 / 17280 + w_2 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 - w_2 * w_5 ** 2 * w_7 ** 4 / 17280 - w_2 * w_5 * w_6 ** 4 * w_7 / 5760 - w_2 * w_5 * w_6 * w_7 ** 4 / 5760 + w_2 * w_6 ** 6 / 60480 - w_2 * w_6 ** 4 * w_7 ** 2 / 17280 - w_2 * w_6 ** 2 * w_7 ** 4 / 17280 + w_2 * w_7 ** 6 / 60480 + w_3 ** 6 * w_4 / 60480 + w_3 ** 6 * w_5 / 60480 + w_3 ** 6 * w_6 / 60480 + w_3 ** 6 * w_7 / 60480 - w_3 ** 4 * w_4 ** 2 * w_5 / 17280 - w_3 ** 4 * w_4 ** 2 * w_6 / 17280 - w_3 ** 4 * w_4 ** 2 * w_7 / 17280 - w_3 ** 4 * w_4 * w_5 ** 2 / 17280 - w_3 ** 4 * w_4 * w_5 * w_6 / 5760 - w_3 ** 4 * w_4 * w_5 * w_7 / 5760 - w_3 ** 4 * w_4 * w_6 ** 2 / 17280 - w_3 ** 4 * w_4 * w_6 * w_7 / 5760 - w_3 ** 4 * w_4 * w_7 ** 2 / 17280 - w_3 ** 4 * w_5 ** 2 * w_6 / 17280 - w_3 ** 4 * w_5 ** 2 * w_7 / 17280 - w_3 ** 4 * w_5 * w_6 ** 2 / 17280 - w_3 ** 4 * w_5 * w_6 * w_7 / 5760 - w_3 ** 4 * w_5 * w_7 ** 2 / 17280 - w_3 ** 4 * w_6 ** 2 * w_7 / 17280 - w_3 ** 4 * w_6 * w_7 ** 2 / 17280 - w_3 ** 2 * w_4 ** 4 * w_5 / 17280 - w_3 ** 2 * w_4 ** 4 * w_6 / 17280 - w_3 ** 2 * w_4 ** 4 * w_7 / 17280 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 3456 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_7 / 3456 + w_3 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 3456 + w_3 ** 2 * w_4 ** 2 * w_5 * w_6 * w_7 / 1152 + w_3 ** 2 * w_4 ** 2 * w_5 * w_7 ** 2 / 3456 + w_3 ** 2 * w_4 ** 2 * w_6 ** 2 * w_7 / 3456 + w_3 ** 2 * w_4 ** 2 * w_6 * w_7 ** 2 / 3456 - w_3 ** 2 * w_4 * w_5 ** 4 / 17280 + w_3 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 3456 + w_3 ** 2 * w_4 * w_5 ** 2 * w_6 * w_7 / 1152 + w_3 ** 2 * w_4 * w_5 ** 2 * w_7 ** 2 / 3456 + w_3 ** 2 * w_4 * w_5 * w_6 ** 2 * w_7 / 1152 + w_3 ** 2 * w_4 * w_5 * w_6 * w_7 ** 2 / 1152 - w_3 ** 2 * w_4 * w_6 ** 4 / 17280 + w_3 ** 2 * w_4 * w_6 ** 2 * w_7 ** 2 / 3456 - w_3 ** 2 * w_4 * w_7 ** 4 / 17280 - w_3 ** 2 * w_5 ** 4 * w_6 / 17280 - w_3 ** 2 * w_5 ** 4 * w_7 / 17280 + w_3 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 3456 + w_3 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 3456 - w_3 ** 2 * w_5 * w_6 ** 4 / 17280 + w_3 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 3456 - w_3 ** 2 * w_5 * w_7 ** 4 / 17280 - w_3 ** 2 * w_6 ** 4 * w_7 / 17280 - w_3 ** 2 * w_6 * w_7 ** 4 / 17280 + w_3 * w_4 ** 6 / 60480 - w_3 * w_4 ** 4 * w_5 ** 2 / 17280 - w_3 * w_4 ** 4 * w_5 * w_6 / 5760 - w_3 * w_4 ** 4 * w_5 * w_7 / 5760 - w_3 * w_4 ** 4 * w_6 ** 2 / 17280 - w_3 * w_4 ** 4 * w_6 * w_7 / 5760 - w_3 * w_4 ** 4 * w_7 ** 2 / 17280 - w_3 * w_4 ** 2 * w_5 ** 4 / 17280 + w_3 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_3 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_3 * w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_3 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_3 * w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 1152 - w_3 * w_4 ** 2 * w_6 ** 4 / 17280 + w_3 * w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 - w_3 * w_4 ** 2 * w_7 ** 4 / 17280 - w_3 * w_4 * w_5 ** 4 * w_6 / 5760 - w_3 * w_4 * w_5 ** 4 * w_7 / 5760 + w_3 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 1152 + w_3 * w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 1152 - w_3 * w_4 * w_5 * w_6 ** 4 / 5760 + w_3 * w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 1152 - w_3 * w_4 * w_5 * w_7 ** 4 / 5760 - w_3 * w_4 * w_6 ** 4 * w_7 / 5760 - w_3 * w_4 * w_6 * w_7 ** 4 / 5760 + w_3 * w_5 ** 6 / 60480 - w_3 * w_5 ** 4 * w_6 ** 2 / 17280 - w_3 * w_5 ** 4 * w_6 * w_7 / 5760 - w_3 * w_5 ** 4 * w_7 ** 2 / 17280 - w_3 * w_5 ** 2 * w_6 ** 4 / 17280 + w_3 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 - w_3 * w_5 ** 2 * w_7 ** 4 / 17280 - w_3 * w_5 * w_6 ** 4 * w_7 / 5760 - w_3 * w_5 * w_6 * w_7 ** 4 / 5760 + w_3 * w_6 ** 6 / 60480 - w_3 * w_6 ** 4 * w_7 ** 2 / 17280 - w_3 * w_6 ** 2 * w_7 ** 4 / 17280 + w_3 * w_7 ** 6 / 60480 + w_4 ** 6 * w_5 / 60480 + w_4 ** 6 * w_6 / 60480 + w_4 ** 6 * w_7 / 60480 - w_4 ** 4 * w_5 ** 2 * w_6 / 17280 - w_4 ** 4 * w_5 ** 2 * w_7 / 17280 - w_4 ** 4 * w_5 * w_6 ** 2 / 17280 - w_4 ** 4 * w_5 * w_6 * w_7 / 5760 - w_4 ** 4 * w_5 * w_7 ** 2 / 17280 - w_4 ** 4 * w_6 ** 2 * w_7 / 17280 - w_4 ** 4 * w_6 * w_7 ** 2 / 17280 - w_4 ** 2 * w_5 ** 4 * w_6 / 17280 - w_4 ** 2 * w_5 ** 4 * w_7 / 17280 + w_4 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 3456 + w_4 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 3456 - w_4 ** 2 * w_5 * w_6 ** 4 / 17280 + w_4 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 3456 - w_4 ** 2 * w_5 * w_7 ** 4 / 17280 - w_4 ** 2 * w_6 ** 4 * w_7 / 17280 - w_4 ** 2 * w_6 * w_7 ** 4 / 17280 + w_4 * w_5 ** 6 / 60480 - w_4 * w_5 ** 4 * w_6 ** 2 / 17280 - w_4 * w_5 ** 4 * w_6 * w_7 / 5760 - w_4 * w_5 ** 4 * w_7 ** 2 / 17280 - w_4 * w_5 ** 2 * w_6 ** 4 / 17280 + w_4 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 - w_4 * w_5 ** 2 * w_7 ** 4 / 17280 - w_4 * w_5 * w_6 ** 4 * w_7 / 5760 - w_4 * w_5 * w_6 * w_7 ** 4 / 5760 + w_4 * w_6 ** 6 / 60480 - w_4 * w_6 ** 4 * w_7 ** 2 / 17280 - w_4 * w_6 ** 2 * w_7 ** 4 / 17280 + w_4 * w_7 ** 6 / 60480 + w_5 ** 6 * w_6 / 60480 + w_5 ** 6 * w_7 / 60480 - w_5 ** 4 * w_6 ** 2 * w_7 / 17280 - w_5 ** 4 * w_6 * w_7 ** 2 / 17280 - w_5 ** 2 * w_6 ** 4 * w_7 / 17280 - w_5 ** 2 * w_6 * w_7 ** 4 / 17280 + w_5 * w_6 ** 6 / 60480 - w_5 * w_6 ** 4 * w_7 ** 2 / 17280 - w_5 * w_6 ** 2 * w_7 ** 4 / 17280 + w_5 * w_7 ** 6 / 60480 + w_6 ** 6 * w_7 / 60480 + w_6 * w_7 ** 6 / 60480
-    if s == 8 and ln == 6:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        return -w_1 ** 8 / 1209600 + w_1 ** 6 * w_2 ** 2 / 362880 + w_1 ** 6 * w_2 * w_3 / 120960 + w_1 ** 6 * w_2 * w_4 / 120960 + w_1 ** 6 * w_2 * w_5 / 120960 + w_1 ** 6 * w_2 * w_6 / 120960 + w_1 ** 6 * w_3 ** 2 / 362880 + w_1 ** 6 * w_3 * w_4 / 120960 + w_1 ** 6 * w_3 * w_5 / 120960 + w_1 ** 6 * w_3 * w_6 / 120960 + w_1 ** 6 * w_4 ** 2 / 362880 + w_1 ** 6 * w_4 * w_5 / 120960 + w_1 ** 6 * w_4 * w_6 / 120960 + w_1 ** 6 * w_5 ** 2 / 362880 + w_1 ** 6 * w_5 * w_6 / 120960 + w_1 ** 6 * w_6 ** 2 / 362880 + w_1 ** 4 * w_2 ** 4 / 518400 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 / 103680 - w_1 ** 4 * w_2 ** 2 * w_3 * w_4 / 34560 - w_1 ** 4 * w_2 ** 2 * w_3 * w_5 / 34560 - w_1 ** 4 * w_2 ** 2 * w_3 * w_6 / 34560 - w_1 ** 4 * w_2 ** 2 * w_4 ** 2 / 103680 - w_1 ** 4 * w_2 ** 2 * w_4 * w_5 / 34560 - w_1 ** 4 * w_2 ** 2 * w_4 * w_6 / 34560 - w_1 ** 4 * w_2 ** 2 * w_5 ** 2 / 103680 - w_1 ** 4 * w_2 ** 2 * w_5 * w_6 / 34560 - w_1 ** 4 * w_2 ** 2 * w_6 ** 2 / 103680 - w_1 ** 4 * w_2 * w_3 ** 2 * w_4 / 34560 - w_1 ** 4 * w_2 * w_3 ** 2 * w_5 / 34560 - w_1 ** 4 * w_2 * w_3 ** 2 * w_6 / 34560 - w_1 ** 4 * w_2 * w_3 * w_4 ** 2 / 34560 - w_1 ** 4 * w_2 * w_3 * w_4 * w_5 / 11520 - w_1 ** 4 * w_2 * w_3 * w_4 * w_6 / 11520 - w_1 ** 4 * w_2 * w_3 * w_5 ** 2 / 34560 - w_1 ** 4 * w_2 * w_3 * w_5 * w_6 / 11520 - w_1 ** 4 * w_2 * w_3 * w_6 ** 2 / 34560 - w_1 ** 4 * w_2 * w_4 ** 2 * w_5 / 34560 - w_1 ** 4 * w_2 * w_4 ** 2 * w_6 / 34560 - w_1 ** 4 * w_2 * w_4 * w_5 ** 2 / 34560 - w_1 ** 4 * w_2 * w_4 * w_5 * w_6 / 11520 - w_1 ** 4 * w_2 * w_4 * w_6 ** 2 / 34560 - w_1 ** 4 * w_2 * w_5 ** 2 * w_6 / 34560 - w_1 ** 4 * w_2 * w_5 * w_6 ** 2 / 34560 + w_1 ** 4 * w_3 ** 4 / 518400 - w_1 ** 4 * w_3 ** 2 * w_4 ** 2 / 103680 - w_1 ** 4 * w_3 ** 2 * w_4 * w_5 / 34560 - w_1 ** 4 * w_3 ** 2 * w_4 * w_6 / 34560 - w_1 ** 4 * w_3 ** 2 * w_5 ** 2 / 103680 - w_1 ** 4 * w_3 ** 2 * w_5 * w_6 / 34560 - w_1 ** 4 * w_3 ** 2 * w_6 ** 2 / 103680 - w_1 ** 4 * w_3 * w_4 ** 2 * w_5 / 34560 - w_1 ** 4 * w_3 * w_4 ** 2 * w_6 / 34560 - w_1 ** 4 * w_3 * w_4 * w_5 ** 2 / 34560 - w_1 ** 4 * w_3 * w_4 * w_5 * w_6 / 11520 - w_1 ** 4 * w_3 * w_4 * w_6 ** 2 / 34560 - w_1 ** 4 * w_3 * w_5 ** 2 * w_6 / 34560 - w_1 ** 4 * w_3 * w_5 * w_6 ** 2 / 34560 + w_1 ** 4 * w_4 ** 4 / 518400 - w_1 ** 4 * w_4 ** 2 * w_5 ** 2 / 103680 - w_1 ** 4 * w_4 ** 2 * w_5 * w_6 / 34560 - w_1 ** 4 * w_4 ** 2 * w_6 ** 2 / 103680 - w_1 ** 4 * w_4 * w_5 ** 2 * w_6 / 34560 - w_1 ** 4 * w_4 * w_5 * w_6 ** 2 / 34560 + w_1 ** 4 * w_5 ** 4 / 518400 - w_1 ** 4 * w_5 ** 2 * w_6 ** 2 / 103680 + w_1 ** 4 * w_6 ** 4 / 518400 + w_1 ** 2 * w_2 ** 6 / 362880 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 / 103680 - w_1 ** 2 * w_2 ** 4 * w_3 * w_4 / 34560 - w_1 ** 2 * w_2 ** 4 * w_3 * w_5 / 34560 - w_1 ** 2 * w_2 ** 4 * w_3 * w_6 / 34560 - w_1 ** 2 * w_2 ** 4 * w_4 ** 2 / 103680 - w_1 ** 2 * w_2 ** 4 * w_4 * w_5 / 34560 - w_1 ** 2 * w_2 ** 4 * w_4 * w_6 / 34560 - w_1 ** 2 * w_2 ** 4 * w_5 ** 2 / 103680 - w_1 ** 2 * w_2 ** 4 * w_5 * w_6 / 34560 - w_1 ** 2 * w_2 ** 4 * w_6 ** 2 / 103680 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 / 103680 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 * w_6 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 * w_6 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_6 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 * w_6 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 * w_6 / 2304 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_6 ** 2 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 ** 2 * w_6 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 * w_6 ** 2 / 6912 - w_1 ** 2 * w_2 ** 2 * w_4 ** 4 / 103680 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 * w_6 / 6912 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_6 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 ** 2 * w_6 / 6912 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 * w_6 ** 2 / 6912 - w_1 ** 2 * w_2 ** 2 * w_5 ** 4 / 103680 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 * w_6 ** 2 / 20736 - w_1 ** 2 * w_2 ** 2 * w_6 ** 4 / 103680 - w_1 ** 2 * w_2 * w_3 ** 4 * w_4 / 34560 - w_1 ** 2 * w_2 * w_3 ** 4 * w_5 / 34560 - w_1 ** 2 * w_2 * w_3 ** 4 * w_6 / 34560 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 * w_6 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 * w_6 / 2304 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_6 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 ** 2 * w_6 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 * w_6 ** 2 / 6912 - w_1 ** 2 * w_2 * w_3 * w_4 ** 4 / 34560 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 * w_6 / 2304 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_6 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 ** 2 * w_6 / 2304 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 * w_6 ** 2 / 2304 - w_1 ** 2 * w_2 * w_3 * w_5 ** 4 / 34560 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 * w_6 ** 2 / 6912 - w_1 ** 2 * w_2 * w_3 * w_6 ** 4 / 34560 - w_1 ** 2 * w_2 * w_4 ** 4 * w_5 / 34560 - w_1 ** 2 * w_2 * w_4 ** 4 * w_6 / 34560 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 ** 2 * w_6 / 6912 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 * w_6 ** 2 / 6912 - w_1 ** 2 * w_2 * w_4 * w_5 ** 4 / 34560 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 * w_6 ** 2 / 6912 - w_1 ** 2 * w_2 * w_4 * w_6 ** 4 / 34560 - w_1 ** 2 * w_2 * w_5 ** 4 * w_6 / 34560 - w_1 ** 2 * w_2 * w_5 * w_6 ** 4 / 34560 + w_1 ** 2 * w_3 ** 6 / 362880 - w_1 ** 2 * w_3 ** 4 * w_4 ** 2 / 103680 - w_1 ** 2 * w_3 ** 4 * w_4 * w_5 / 34560 - w_1 ** 2 * w_3 ** 4 * w_4 * w_6 / 34560 - w_1 ** 2 * w_3 ** 4 * w_5 ** 2 / 103680 - w_1 ** 2 * w_3 ** 4 * w_5 * w_6 / 34560 - w_1 ** 2 * w_3 ** 4 * w_6 ** 2 / 103680 - w_1 ** 2 * w_3 ** 2 * w_4 ** 4 / 103680 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 20736 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 6912 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 20736 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 6912 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 6912 - w_1 ** 2 * w_3 ** 2 * w_5 ** 4 / 103680 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 20736 - w_1 ** 2 * w_3 ** 2 * w_6 ** 4 / 103680 - w_1 ** 2 * w_3 * w_4 ** 4 * w_5 / 34560 - w_1 ** 2 * w_3 * w_4 ** 4 * w_6 / 34560 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 6912 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 6912 - w_1 ** 2 * w_3 * w_4 * w_5 ** 4 / 34560 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 6912 - w_1 ** 2 * w_3 * w_4 * w_6 ** 4 / 34560 - w_1 ** 2 * w_3 * w_5 ** 4 * w_6 / 34560 - w_1 ** 2 * w_3 * w_5 * w_6 ** 4 / 34560 + w_1 ** 2 * w_4 ** 6 / 362880 - w_1 ** 2 * w_4 ** 4 * w_5 ** 2 / 103680 - w_1 ** 2 * w_4 ** 4 * w_5 * w_6 / 34560 - w_1 ** 2 * w_4 ** 4 * w_6 ** 2 / 103680 - w_1 ** 2 * w_4 ** 2 * w_5 ** 4 / 103680 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 20736 - w_1 ** 2 * w_4 ** 2 * w_6 ** 4 / 103680 - w_1 ** 2 * w_4 * w_5 ** 4 * w_6 / 34560 - w_1 ** 2 * w_4 * w_5 * w_6 ** 4 / 34560 + w_1 ** 2 * w_5 ** 6 / 362880 - w_1 ** 2 * w_5 ** 4 * w_6 ** 2 / 103680 - w_1 ** 2 * w_5 ** 2 * w_6 ** 4 / 103680 + w_1 ** 2 * w_6 ** 6 / 362880 + w_1 * w_2 ** 6 * w_3 / 120960 + w_1 * w_2 ** 6 * w_4 / 120960 + w_1 * w_2 ** 6 * w_5 / 120960 + w_1 * w_2 ** 6 * w_6 / 120960 - w_1 * w_2 ** 4 * w_3 ** 2 * w_4 / 34560 - w_1 * w_2 ** 4 * w_3 ** 2 * w_5 / 34560 - w_1 * w_2 ** 4 * w_3 ** 2 * w_6 / 34560 - w_1 * w_2 ** 4 * w_3 * w_4 ** 2 / 34560 - w_1 * w_2 ** 4 * w_3 * w_4 * w_5 / 11520 - w_1 * w_2 ** 4 * w_3 * w_4 * w_6 / 11520 - w_1 * w_2 ** 4 * w_3 * w_5 ** 2 / 34560 - w_1 * w_2 ** 4 * w_3 * w_5 * w_6 / 11520 - w_1 * w_2 ** 4 * w_3 * w_6 ** 2 / 34560 - w_1 * w_2 ** 4 * w_4 ** 2 * w_5 / 34560 - w_1 * w_2 ** 4 * w_4 ** 2 * w_6 / 34560 - w_1 * w_2 ** 4 * w_4 * w_5 ** 2 / 34560 - w_1 * w_2 ** 4 * w_4 * w_5 * w_6 / 11520 - w_1 * w_2 ** 4 * w_4 * w_6 ** 2 / 34560 - w_1 * w_2 ** 4 * w_5 ** 2 * w_6 / 34560 - w_1 * w_2 ** 4 * w_5 * w_6 ** 2 / 34560 - w_1 * w_2 ** 2 * w_3 ** 4 * w_4 / 34560 - w_1 * w_2 ** 2 * w_3 ** 4 * w_5 / 34560 - w_1 * w_2 ** 2 * w_3 ** 4 * w_6 / 34560 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 / 2304 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_6 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 * w_6 ** 2 / 6912 - w_1 * w_2 ** 2 * w_3 * w_4 ** 4 / 34560 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 / 2304 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_6 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 / 2304 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 * w_6 ** 2 / 2304 - w_1 * w_2 ** 2 * w_3 * w_5 ** 4 / 34560 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 * w_6 ** 2 / 6912 - w_1 * w_2 ** 2 * w_3 * w_6 ** 4 / 34560 - w_1 * w_2 ** 2 * w_4 ** 4 * w_5 / 34560 - w_1 * w_2 ** 2 * w_4 ** 4 * w_6 / 34560 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 6912 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 6912 - w_1 * w_2 ** 2 * w_4 * w_5 ** 4 / 34560 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 6912 - w_1 * w_2 ** 2 * w_4 * w_6 ** 4 / 34560 - w_1 * w_2 ** 2 * w_5 ** 4 * w_6 / 34560 - w_1 * w_2 ** 2 * w_5 * w_6 ** 4 / 34560 + w_1 * w_2 * w_3 ** 6 / 120960 - w_1 * w_2 * w_3 ** 4 * w_4 ** 2 / 34560 - w_1 * w_2 * w_3 ** 4 * w_4 * w_5 / 11520 - w_1 * w_2 * w_3 ** 4 * w_4 * w_6 / 11520 - w_1 * w_2 * w_3 ** 4 * w_5 ** 2 / 34560 - w_1 * w_2 * w_3 ** 4 * w_5 * w_6 / 11520 - w_1 * w_2 * w_3 ** 4 * w_6 ** 2 / 34560 - w_1 * w_2 * w_3 ** 2 * w_4 ** 4 / 34560 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 6912 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 2304 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 6912 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 2304 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 2304 - w_1 * w_2 * w_3 ** 2 * w_5 ** 4 / 34560 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 6912 - w_1 * w_2 * w_3 ** 2 * w_6 ** 4 / 34560 - w_1 * w_2 * w_3 * w_4 ** 4 * w_5 / 11520 - w_1 * w_2 * w_3 * w_4 ** 4 * w_6 / 11520 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 2304 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 2304 - w_1 * w_2 * w_3 * w_4 * w_5 ** 4 / 11520 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 2304 - w_1 * w_2 * w_3 * w_4 * w_6 ** 4 / 11520 - w_1 * w_2 * w_3 * w_5 ** 4 * w_6 / 11520 - w_1 * w_2 * w_3 * w_5 * w_6 ** 4 / 11520 + w_1 * w_2 * w_4 ** 6 / 120960 - w_1 * w_2 * w_4 ** 4 * w_5 ** 2 / 34560 - w_1 * w_2 * w_4 ** 4 * w_5 * w_6 / 11520 - w_1 * w_2 * w_4 ** 4 * w_6 ** 2 / 34560 - w_1 * w_2 * w_4 ** 2 * w_5 ** 4 / 34560 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 6912 - w_1 * w_2 * w_4 ** 2 * w_6 ** 4 / 34560 - w_1 * w_2 * w_4 * w_5 ** 4 * w_6 / 11520 - w_1 * w_2 * w_4 * w_5 * w_6 ** 4 / 11520 + w_1 * w_2 * w_5 ** 6 / 120960 - w_1 * w_2 * w_5 ** 4 * w_6 ** 2 / 34560 - w_1 * w_2 * w_5 ** 2 * w_6 ** 4 / 34560 + w_1 * w_2 * w_6 ** 6 / 120960 + w_1 * w_3 ** 6 * w_4 / 120960 + w_1 * w_3 ** 6 * w_5 / 120960 + w_1 * w_3 ** 6 * w_6 / 120960 - w_1 * w_3 ** 4 * w_4 ** 2 * w_5 / 34560 - w_1 * w_3 ** 4 * w_4 ** 2 * w_6 / 34560 - w_1 * w_3 ** 4 * w_4 * w_5 ** 2 / 34560 - w_1 * w_3 ** 4 * w_4 * w_5 * w_6 / 11520 - w_1 * w_3 ** 4 * w_4 * w_6 ** 2 / 34560 - w_1 * w_3 ** 4 * w_5 ** 2 * w_6 / 34560 - w_1 * w_3 ** 4 * w_5 * w_6 ** 2 / 34560 - w_1 * w_3 ** 2 * w_4 ** 4 * w_5 / 34560 - w_1 * w_3 ** 2 * w_4 ** 4 * w_6 / 34560 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 6912 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 6912 - w_1 * w_3 ** 2 * w_4 * w_5 ** 4 / 34560 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 6912 - w_1 * w_3 ** 2 * w_4 * w_6 ** 4 / 34560 - w_1 * w_3 ** 2 * w_5 ** 4 * w_6 / 34560 - w_1 * w_3 ** 2 * w_5 * w_6 ** 4 / 34560 + w_1 * w_3 * w_4 ** 6 / 120960 - w_1 * w_3 * w_4 ** 4 * w_5 ** 2 / 34560 - w_1 * w_3 * w_4 ** 4 * w_5 * w_6 / 11520 - w_1 * w_3 * w_4 ** 4 * w_6 ** 2 / 34560 - w_1 * w_3 * w_4 ** 2 * w_5 ** 4 / 34560 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 6912 - w_1 * w_3 * w_4 ** 2 * w_6 ** 4 / 34560 - w_1 * w_3 * w_4 * w_5 ** 4 * w_6 / 11520 - w_1 * w_3 * w_4 * w_5 * w_6 ** 4 / 11520 + w_1 * w_3 * w_5 ** 6 / 120960 - w_1 * w_3 * w_5 ** 4 * w_6 ** 2 / 34560 - w_1 * w_3 * w_5 ** 2 * w_6 ** 4 / 34560 + w_1 * w_3 * w_6 ** 6 / 120960 + w_1 * w_4 ** 6 * w_5 / 120960 + w_1 * w_4 ** 6 * w_6 / 120960 - w_1 * w_4 ** 4 * w_5 ** 2 * w_6 / 34560 - w_1 * w_4 ** 4 * w_5 * w_6 ** 2 / 34560 - w_1 * w_4 ** 2 * w_5 ** 4 * w_6 / 34560 - w_1 * w_4 ** 2 * w_5 * w_6 ** 4 / 34560 + w_1 * w_4 * w_5 ** 6 / 120960 - w_1 * w_4 * w_5 ** 4 * w_6 ** 2 / 34560 - w_1 * w_4 * w_5 ** 2 * w_6 ** 4 / 34560 + w_1 * w_4 * w_6 ** 6 / 120960 + w_1 * w_5 ** 6 * w_6 / 120960 + w_1 * w_5 * w_6 ** 6 / 120960 - w_2 ** 8 / 1209600 + w_2 ** 6 * w_3 ** 2 / 362880 + w_2 ** 6 * w_3 * w_4 / 120960 + w_2 ** 6 * w_3 * w_5 / 120960 + w_2 ** 6 * w_3 * w_6 / 120960 + w_2 ** 6 * w_4 ** 2 / 362880 + w_2 ** 6 * w_4 * w_5 / 120960 + w_2 ** 6 * w_4 * w_6 / 120960 + w_2 ** 6 * w_5 ** 2 / 362880 + w_2 ** 6 * w_5 * w_6 / 120960 + w_2 ** 6 * w_6 ** 2 / 362880 + w_2 ** 4 * w_3 ** 4 / 518400 - w_2 ** 4 * w_3 ** 2 * w_4 ** 2 / 103680 - w_2 ** 4 * w_3 ** 2 * w_4 * w_5 / 34560 - w_2 ** 4 * w_3 ** 2 * w_4 * w_6 / 34560 - w_2 ** 4 * w_3 ** 2 * w_5 ** 2 / 103680 - w_2 ** 4 * w_3 ** 2 * w_5 * w_6 / 34560 - w_2 ** 4 * w_3 ** 2 * w_6 ** 2 / 103680 - w_2 ** 4 * w_3 * w_4 ** 2 * w_5 / 34560 - w_2 ** 4 * w_3 * w_4 ** 2 * w_6 / 34560 - w_2 ** 4 * w_3 * w_4 * w_5 ** 2 / 34560 - w_2 ** 4 * w_3 * w_4 * w_5 * w_6 / 11520 - w_2 ** 4 * w_3 * w_4 * w_6 ** 2 / 34560 - w_2 ** 4 * w_3 * w_5 ** 2 * w_6 / 34560 - w_2 ** 4 * w_3 * w_5 * w_6 ** 2 / 34560 + w_2 ** 4 * w_4 ** 4 / 518400 - w_2 ** 4 * w_4 ** 2 * w_5 ** 2 / 103680 - w_2 ** 4 * w_4 ** 2 * w_5 * w_6 / 34560 - w_2 ** 4 * w_4 ** 2 * w_6 ** 2 / 103680 - w_2 ** 4 * w_4 * w_5 ** 2 * w_6 / 34560 - w_2 ** 4 * w_4 * w_5 * w_6 ** 2 / 34560 + w_2 ** 4 * w_5 ** 4 / 518400 - w_2 ** 4 * w_5 ** 2 * w_6 ** 2 / 103680 + w_2 ** 4 * w_6 ** 4 / 518400 + w_2 ** 2 * w_3 ** 6 / 362880 - w_2 ** 2 * w_3 ** 4 * w_4 ** 2 / 103680 - w_2 ** 2 * w_3 ** 4 * w_4 * w_5 / 34560 - w_2 ** 2 * w_3 ** 4 * w_4 * w_6 / 34560 - w_2 ** 2 * w_3 ** 4 * w_5 ** 2 / 103680 - w_2 ** 2 * w_3 ** 4 * w_5 * w_6 / 34560 - w_2 ** 2 * w_3 ** 4 * w_6 ** 2 / 103680 - w_2 ** 2 * w_3 ** 2 * w_4 ** 4 / 103680 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 20736 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 6912 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 20736 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 6912 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 6912 - w_2 ** 2 * w_3 ** 2 * w_5 ** 4 / 103680 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 20736 - w_2 ** 2 * w_3 ** 2 * w_6 ** 4 / 103680 - w_2 ** 2 * w_3 * w_4 ** 4 * w_5 / 34560 - w_2 ** 2 * w_3 * w_4 ** 4 * w_6 / 34560 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 6912 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 6912 - w_2 ** 2 * w_3 * w_4 * w_5 ** 4 / 34560 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 6912 - w_2 ** 2 * w_3 * w_4 * w_6 ** 4 / 34560 - w_2 ** 2 * w_3 * w_5 ** 4 * w_6 / 34560 - w_2 ** 2 * w_3 * w_5 * w_6 ** 4 / 34560 + w_2 ** 2 * w_4 ** 6 / 362880 - w_2 ** 2 * w_4 ** 4 * w_5 ** 2 / 103680 - w_2 ** 2 * w_4 ** 4 * w_5 * w_6 / 34560 - w_2 ** 2 * w_4 ** 4 * w_6 ** 2 / 103680 - w_2 ** 2 * w_4 ** 2 * w_5 ** 4 / 103680 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 20736 - w_2 ** 2 * w_4 ** 2 * w_6 ** 4 / 103680 - w_2 ** 2 * w_4 * w_5 ** 4 * w_6 / 34560 - w_2 ** 2 * w_4 * w_5 * w_6 ** 4 / 34560 + w_2 ** 2 * w_5 ** 6 / 362880 - w_2 ** 2 * w_5 ** 4 * w_6 ** 2 / 103680 - w_2 ** 2 * w_5 ** 2 * w_6 ** 4 / 103680 + w_2 ** 2 * w_6 ** 6 / 362880 + w_2 * w_3 ** 6 * w_4 / 120960 + w_2 * w_3 ** 6 * w_5 / 120960 + w_2 * w_3 ** 6 * w_6 / 120960 - w_2 * w_3 ** 4 * w_4 ** 2 * w_5 / 34560 - w_2 * w_3 ** 4 * w_4 ** 2 * w_6 / 34560 - w_2 * w_3 ** 4 * w_4 * w_5 ** 2 / 34560 - w_2 * w_3 ** 4 * w_4 * w_5 * w_6 / 11520 - w_2 * w_3 ** 4 * w_4 * w_6 ** 2 / 34560 - w_2 * w_3 ** 4 * w_5 ** 2 * w_6 / 34560 - w_2 * w_3 ** 4 * w_5 * w_6 ** 2 / 34560 - w_2 * w_3 ** 2 * w_4 ** 4 * w_5 / 34560 - w_2 * w_3 ** 2 * w_4 ** 4 * w_6 / 34560 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 6912 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 6912 - w_2 * w_3 ** 2 * w_4 * w_5 ** 4 / 34560 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 6912 - w_2 * w_3 ** 2 * w_4 * w_6 ** 4 / 34560 - w_2 * w_3 ** 2 * w_5 ** 4 * w_6 / 34560 - w_2 * w_3 ** 2 * w_5 * w_6 ** 4 / 34560 + w_2 * w_3 * w_4 ** 6 / 120960 - w_2 * w_3 * w_4 ** 4 * w_5 ** 2 / 34560 - w_2 * w_3 * w_4 ** 4 * w_5 * w_6 / 11520 - w_2 * w_3 * w_4 ** 4 * w_6 ** 2 / 34560 - w_2 * w_3 * w_4 ** 2 * w_5 ** 4 / 34560 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 6912 - w_2 * w_3 * w_4 ** 2 * w_6 ** 4 / 34560 - w_2 * w_3 * w_4 * w_5 ** 4 * w_6 / 11520 - w_2 * w_3 * w_4 * w_5 * w_6 ** 4 / 11520 + w_2 * w_3 * w_5 ** 6 / 120960 - w_2 * w_3 * w_5 ** 4 * w_6 ** 2 / 34560 - w_2 * w_3 * w_5 ** 2 * w_6 ** 4 / 34560 + w_2 * w_3 * w_6 ** 6 / 120960 + w_2 * w_4 ** 6 * w_5 / 120960 + w_2 * w_4 ** 6 * w_6 / 120960 - w_2 * w_4 ** 4 * w_5 ** 2 * w_6 / 34560 - w_2 * w_4 ** 4 * w_5 * w_6 ** 2 / 34560 - w_2 * w_4 ** 2 * w_5 ** 4 * w_6 / 34560 - w_2 * w_4 ** 2 * w_5 * w_6 ** 4 / 34560 + w_2 * w_4 * w_5 ** 6 / 120960 - w_2 * w_4 * w_5 ** 4 * w_6 ** 2 / 34560 - w_2 * w_4 * w_5 ** 2 * w_6 ** 4 / 34560 + w_2 * w_4 * w_6 ** 6 / 120960 + w_2 * w_5 ** 6 * w_6 / 120960 + w_2 * w_5 * w_6 ** 6 / 120960 - w_3 ** 8 / 1209600 + w_3 ** 6 * w_4 ** 2 / 362880 + w_3 ** 6 * w_4 * w_5 / 120960 + w_3 ** 6 * w_4 * w_6 / 120960 + w_3 ** 6 * w_5 ** 2 / 362880 + w_3 ** 6 * w_5 * w_6 / 120960 + w_3 ** 6 * w_6 ** 2 / 362880 + w_3 ** 4 * w_4 ** 4 / 518400 - w_3 ** 4 * w_4 ** 2 * w_5 ** 2 / 103680 - w_3 ** 4 * w_4 ** 2 * w_5 * w_6 / 34560 - w_3 ** 4 * w_4 ** 2 * w_6 ** 2 / 103680 - w_3 ** 4 * w_4 * w_5 ** 2 * w_6 / 34560 - w_3 ** 4 * w_4 * w_5 * w_6 ** 2 / 34560 + w_3 ** 4 * w_5 ** 4 / 518400 - w_3 ** 4 * w_5 ** 2 * w_6 ** 2 / 103680 + w_3 ** 4 * w_6 ** 4 / 518400 + w_3 ** 2 * w_4 ** 6 / 362880 - w_3 ** 2 * w_4 ** 4 * w_5 ** 2 / 103680 - w_3 ** 2 * w_4 ** 4 * w_5 * w_6 / 34560 - w_3 ** 2 * w_4 ** 4 * w_6 ** 2 / 103680 - w_3 ** 2 * w_4 ** 2 * w_5 ** 4 / 103680 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 20736 - w_3 ** 2 * w_4 ** 2 * w_6 ** 4 / 103680 - w_3 ** 2 * w_4 * w_5 ** 4 * w_6 / 34560 - w_3 ** 2 * w_4 * w_5 * w_6 ** 4 / 34560 + w_3 ** 2 * w_5 ** 6 / 362880 - w_3 ** 2 * w_5 ** 4 * w_6 ** 2 / 103680 - w_3 ** 2 * w_5 ** 2 * w_6 ** 4 / 103680 + w_3 ** 2 * w_6 ** 6 / 362880 + w_3 * w_4 ** 6 * w_5 / 120960 + w_3 * w_4 ** 6 * w_6 / 120960 - w_3 * w_4 ** 4 * w_5 ** 2 * w_6 / 34560 - w_3 * w_4 ** 4 * w_5 * w_6 ** 2 / 34560 - w_3 * w_4 ** 2 * w_5 ** 4 * w_6 / 34560 - w_3 * w_4 ** 2 * w_5 * w_6 ** 4 / 34560 + w_3 * w_4 * w_5 ** 6 / 120960 - w_3 * w_4 * w_5 ** 4 * w_6 ** 2 / 34560 - w_3 * w_4 * w_5 ** 2 * w_6 ** 4 / 34560 + w_3 * w_4 * w_6 ** 6 / 120960 + w_3 * w_5 ** 6 * w_6 / 120960 + w_3 * w_5 * w_6 ** 6 / 120960 - w_4 ** 8 / 1209600 + w_4 ** 6 * w_5 ** 2 / 362880 + w_4 ** 6 * w_5 * w_6 / 120960 + w_4 ** 6 * w_6 ** 2 / 362880 + w_4 ** 4 * w_5 ** 4 / 518400 - w_4 ** 4 * w_5 ** 2 * w_6 ** 2 / 103680 + w_4 ** 4 * w_6 ** 4 / 518400 + w_4 ** 2 * w_5 ** 6 / 362880 - w_4 ** 2 * w_5 ** 4 * w_6 ** 2 / 103680 - w_4 ** 2 * w_5 ** 2 * w_6 ** 4 / 103680 + w_4 ** 2 * w_6 ** 6 / 362880 + w_4 * w_5 ** 6 * w_6 / 120960 + w_4 * w_5 * w_6 ** 6 / 120960 - w_5 ** 8 / 1209600 + w_5 ** 6 * w_6 ** 2 / 362880 + w_5 ** 4 * w_6 ** 4 / 518400 + w_5 ** 2 * w_6 ** 6 / 362880 - w_6 ** 8 / 1209600
-    if s == 9 and ln == 5:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        return -w_1 ** 8 * w_2 / 2419200 - w_1 ** 8 * w_3 / 2419200 - w_1 ** 8 * w_4 / 2419200 - w_1 ** 8 * w_5 / 2419200 + w_1 ** 6 * w_2 ** 2 * w_3 / 725760 + w_1 ** 6 * w_2 ** 2 * w_4 / 725760 + w_1 ** 6 * w_2 ** 2 * w_5 / 725760 + w_1 ** 6 * w_2 * w_3 ** 2 / 725760 + w_1 ** 6 * w_2 * w_3 * w_4 / 241920 + w_1 ** 6 * w_2 * w_3 * w_5 / 241920 + w_1 ** 6 * w_2 * w_4 ** 2 / 725760 + w_1 ** 6 * w_2 * w_4 * w_5 / 241920 + w_1 ** 6 * w_2 * w_5 ** 2 / 725760 + w_1 ** 6 * w_3 ** 2 * w_4 / 725760 + w_1 ** 6 * w_3 ** 2 * w_5 / 725760 + w_1 ** 6 * w_3 * w_4 ** 2 / 725760 + w_1 ** 6 * w_3 * w_4 * w_5 / 241920 + w_1 ** 6 * w_3 * w_5 ** 2 / 725760 + w_1 ** 6 * w_4 ** 2 * w_5 / 725760 + w_1 ** 6 * w_4 * w_5 ** 2 / 725760 + w_1 ** 4 * w_2 ** 4 * w_3 / 1036800 + w_1 ** 4 * w_2 ** 4 * w_4 / 1036800 + w_1 ** 4 * w_2 ** 4 * w_5 / 1036800 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 * w_4 / 207360 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 * w_5 / 207360 - w_1 ** 4 * w_2 ** 2 * w_3 * w_4 ** 2 / 207360 - w_1 ** 4 * w_2 ** 2 * w_3 * w_4 * w_5 / 69120 - w_1 ** 4 * w_2 ** 2 * w_3 * w_5 ** 2 / 207360 - w_1 ** 4 * w_2 ** 2 * w_4 ** 2 * w_5 / 207360 - w_1 ** 4 * w_2 ** 2 * w_4 * w_5 ** 2 / 207360 + w_1 ** 4 * w_2 * w_3 ** 4 / 1036800 - w_1 ** 4 * w_2 * w_3 ** 2 * w_4 ** 2 / 207360 - w_1 ** 4 * w_2 * w_3 ** 2 * w_4 * w_5 / 69120 - w_1 ** 4 * w_2 * w_3 ** 2 * w_5 ** 2 / 207360 - w_1 ** 4 * w_2 * w_3 * w_4 ** 2 * w_5 / 69120 - w_1 ** 4 * w_2 * w_3 * w_4 * w_5 ** 2 / 69120 + w_1 ** 4 * w_2 * w_4 ** 4 / 1036800 - w_1 ** 4 * w_2 * w_4 ** 2 * w_5 ** 2 / 207360 + w_1 ** 4 * w_2 * w_5 ** 4 / 1036800 + w_1 ** 4 * w_3 ** 4 * w_4 / 1036800 + w_1 ** 4 * w_3 ** 4 * w_5 / 1036800 - w_1 ** 4 * w_3 ** 2 * w_4 ** 2 * w_5 / 207360 - w_1 ** 4 * w_3 ** 2 * w_4 * w_5 ** 2 / 207360 + w_1 ** 4 * w_3 * w_4 ** 4 / 1036800 - w_1 ** 4 * w_3 * w_4 ** 2 * w_5 ** 2 / 207360 + w_1 ** 4 * w_3 * w_5 ** 4 / 1036800 + w_1 ** 4 * w_4 ** 4 * w_5 / 1036800 + w_1 ** 4 * w_4 * w_5 ** 4 / 1036800 + w_1 ** 2 * w_2 ** 6 * w_3 / 725760 + w_1 ** 2 * w_2 ** 6 * w_4 / 725760 + w_1 ** 2 * w_2 ** 6 * w_5 / 725760 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 * w_4 / 207360 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 * w_5 / 207360 - w_1 ** 2 * w_2 ** 4 * w_3 * w_4 ** 2 / 207360 - w_1 ** 2 * w_2 ** 4 * w_3 * w_4 * w_5 / 69120 - w_1 ** 2 * w_2 ** 4 * w_3 * w_5 ** 2 / 207360 - w_1 ** 2 * w_2 ** 4 * w_4 ** 2 * w_5 / 207360 - w_1 ** 2 * w_2 ** 4 * w_4 * w_5 ** 2 / 207360 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 * w_4 / 207360 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 * w_5 / 207360 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 41472 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 41472 - w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 4 / 207360 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 41472 - w_1 ** 2 * w_2 ** 2 * w_3 * w_5 ** 4 / 207360 - w_1 ** 2 * w_2 ** 2 * w_4 ** 4 * w_5 / 207360 - w_1 ** 2 * w_2 ** 2 * w_4 * w_5 ** 4 / 207360 + w_1 ** 2 * w_2 * w_3 ** 6 / 725760 - w_1 ** 2 * w_2 * w_3 ** 4 * w_4 ** 2 / 207360 - w_1 ** 2 * w_2 * w_3 ** 4 * w_4 * w_5 / 69120 - w_1 ** 2 * w_2 * w_3 ** 4 * w_5 ** 2 / 207360 - w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 4 / 207360 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 41472 - w_1 ** 2 * w_2 * w_3 ** 2 * w_5 ** 4 / 207360 - w_1 ** 2 * w_2 * w_3 * w_4 ** 4 * w_5 / 69120 - w_1 ** 2 * w_2 * w_3 * w_4 * w_5 ** 4 / 69120 + w_1 ** 2 * w_2 * w_4 ** 6 / 725760 - w_1 ** 2 * w_2 * w_4 ** 4 * w_5 ** 2 / 207360 - w_1 ** 2 * w_2 * w_4 ** 2 * w_5 ** 4 / 207360 + w_1 ** 2 * w_2 * w_5 ** 6 / 725760 + w_1 ** 2 * w_3 ** 6 * w_4 / 725760 + w_1 ** 2 * w_3 ** 6 * w_5 / 725760 - w_1 ** 2 * w_3 ** 4 * w_4 ** 2 * w_5 / 207360 - w_1 ** 2 * w_3 ** 4 * w_4 * w_5 ** 2 / 207360 - w_1 ** 2 * w_3 ** 2 * w_4 ** 4 * w_5 / 207360 - w_1 ** 2 * w_3 ** 2 * w_4 * w_5 ** 4 / 207360 + w_1 ** 2 * w_3 * w_4 ** 6 / 725760 - w_1 ** 2 * w_3 * w_4 ** 4 * w_5 ** 2 / 207360 - w_1 ** 2 * w_3 * w_4 ** 2 * w_5 ** 4 / 207360 + w_1 ** 2 * w_3 * w_5 ** 6 / 725760 + w_1 ** 2 * w_4 ** 6 * w_5 / 725760 + w_1 ** 2 * w_4 * w_5 ** 6 / 725760 - w_1 * w_2 ** 8 / 2419200 + w_1 * w_2 ** 6 * w_3 ** 2 / 725760 + w_1 * w_2 ** 6 * w_3 * w_4 / 241920 + w_1 * w_2 ** 6 * w_3 * w_5 / 241920 + w_1 * w_2 ** 6 * w_4 ** 2 / 725760 + w_1 * w_2 ** 6 * w_4 * w_5 / 241920 + w_1 * w_2 ** 6 * w_5 ** 2 / 725760 + w_1 * w_2 ** 4 * w_3 ** 4 / 1036800 - w_1 * w_2 ** 4 * w_3 ** 2 * w_4 ** 2 / 207360 - w_1 * w_2 ** 4 * w_3 ** 2 * w_4 * w_5 / 69120 - w_1 * w_2 ** 4 * w_3 ** 2 * w_5 ** 2 / 207360 - w_1 * w_2 ** 4 * w_3 * w_4 ** 2 * w_5 / 69120 - w_1 * w_2 ** 4 * w_3 * w_4 * w_5 ** 2 / 69120 + w_1 * w_2 ** 4 * w_4 ** 4 / 1036800 - w_1 * w_2 ** 4 * w_4 ** 2 * w_5 ** 2 / 207360 + w_1 * w_2 ** 4 * w_5 ** 4 / 1036800 + w_1 * w_2 ** 2 * w_3 ** 6 / 725760 - w_1 * w_2 ** 2 * w_3 ** 4 * w_4 ** 2 / 207360 - w_1 * w_2 ** 2 * w_3 ** 4 * w_4 * w_5 / 69120 - w_1 * w_2 ** 2 * w_3 ** 4 * w_5 ** 2 / 207360 - w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 4 / 207360 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 41472 - w_1 * w_2 ** 2 * w_3 ** 2 * w_5 ** 4 / 207360 - w_1 * w_2 ** 2 * w_3 * w_4 ** 4 * w_5 / 69120 - w_1 * w_2 ** 2 * w_3 * w_4 * w_5 ** 4 / 69120 + w_1 * w_2 ** 2 * w_4 ** 6 / 725760 - w_1 * w_2 ** 2 * w_4 ** 4 * w_5 ** 2 / 207360 - w_1 * w_2 ** 2 * w_4 ** 2 * w_5 ** 4 / 207360 + w_1 * w_2 ** 2 * w_5 ** 6 / 725760 + w_1 * w_2 * w_3 ** 6 * w_4 / 241920 + w_1 * w_2 * w_3 ** 6 * w_5 / 241920 - w_1 * w_2 * w_3 ** 4 * w_4 ** 2 * w_5 / 69120 - w_1 * w_2 * w_3 ** 4 * w_4 * w_5 ** 2 / 69120 - w_1 * w_2 * w_3 ** 2 * w_4 ** 4 * w_5 / 69120 - w_1 * w_2 * w_3 ** 2 * w_4 * w_5 ** 4 / 69120 + w_1 * w_2 * w_3 * w_4 ** 6 / 241920 - w_1 * w_2 * w_3 * w_4 ** 4 * w_5 ** 2 / 69120 - w_1 * w_2 * w_3 * w_4 ** 2 * w_5 ** 4 / 69120 + w_1 * w_2 * w_3 * w_5 ** 6 / 241920 + w_1 * w_2 * w_4 ** 6 * w_5 / 241920 + w_1 * w_2 * w_4 * w_5 ** 6 / 241920 - w_1 * w_3 ** 8 / 2419200 + w_1 * w_3 ** 6 * w_4 ** 2 / 725760 + w_1 * w_3 ** 6 * w_4 * w_5 / 241920 + w_1 * w_3 ** 6 * w_5 ** 2 / 725760 + w_1 * w_3 ** 4 * w_4 ** 4 / 1036800 - w_1 * w_3 ** 4 * w_4 ** 2 * w_5 ** 2 / 207360 + w_1 * w_3 ** 4 * w_5 ** 4 / 1036800 + w_1 * w_3 ** 2 * w_4 ** 6 / 725760 - w_1 * w_3 ** 2 * w_4 ** 4 * w_5 ** 2 / 207360 - w_1 * w_3 ** 2 * w_4 ** 2 * w_5 ** 4 / 207360 + w_1 * w_3 ** 2 * w_5 ** 6 / 725760 + w_1 * w_3 * w_4 ** 6 * w_5 / 241920 + w_1 * w_3 * w_4 * w_5 ** 6 / 241920 - w_1 * w_4 ** 8 / 2419200 + w_1 * w_4 ** 6 * w_5 ** 2 / 725760 + w_1 * w_4 ** 4 * w_5 ** 4 / 1036800 + w_1 * w_4 ** 2 * w_5 ** 6 / 725760 - w_1 * w_5 ** 8 / 2419200 - w_2 ** 8 * w_3 / 2419200 - w_2 ** 8 * w_4 / 2419200 - w_2 ** 8 * w_5 / 2419200 + w_2 ** 6 * w_3 ** 2 * w_4 / 725760 + w_2 ** 6 * w_3 ** 2 * w_5 / 725760 + w_2 ** 6 * w_3 * w_4 ** 2 / 725760 + w_2 ** 6 * w_3 * w_4 * w_5 / 241920 + w_2 ** 6 * w_3 * w_5 ** 2 / 725760 + w_2 ** 6 * w_4 ** 2 * w_5 / 725760 + w_2 ** 6 * w_4 * w_5 ** 2 / 725760 + w_2 ** 4 * w_3 ** 4 * w_4 / 1036800 + w_2 ** 4 * w_3 ** 4 * w_5 / 1036800 - w_2 ** 4 * w_3 ** 2 * w_4 ** 2 * w_5 / 207360 - w_2 ** 4 * w_3 ** 2 * w_4 * w_5 ** 2 / 207360 + w_2 ** 4 * w_3 * w_4 ** 4 / 1036800 - w_2 ** 4 * w_3 * w_4 ** 2 * w_5 ** 2 / 207360 + w_2 ** 4 * w_3 * w_5 ** 4 / 1036800 + w_2 ** 4 * w_4 ** 4 * w_5 / 1036800 + w_2 ** 4 * w_4 * w_5 ** 4 / 1036800 + w_2 ** 2 * w_3 ** 6 * w_4 / 725760 + w_2 ** 2 * w_3 ** 6 * w_5 / 725760 - w_2 ** 2 * w_3 ** 4 * w_4 ** 2 * w_5 / 207360 - w_2 ** 2 * w_3 ** 4 * w_4 * w_5 ** 2 / 207360 - w_2 ** 2 * w_3 ** 2 * w_4 ** 4 * w_5 / 207360 - w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 4 / 207360 + w_2 ** 2 * w_3 * w_4 ** 6 / 725760 - w_2 ** 2 * w_3 * w_4 ** 4 * w_5 ** 2 / 207360 - w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 4 / 207360 + w_2 ** 2 * w_3 * w_5 ** 6 / 725760 + w_2 ** 2 * w_4 ** 6 * w_5 / 725760 + w_2 ** 2 * w_4 * w_5 ** 6 / 725760 - w_2 * w_3 ** 8 / 2419200 + w_2 * w_3 ** 6 * w_4 ** 2 / 725760 + w_2 * w_3 ** 6 * w_4 * w_5 / 241920 + w_2 * w_3 ** 6 * w_5 ** 2 / 725760 + w_2 * w_3 ** 4 * w_4 ** 4 / 1036800 - w_2 * w_3 ** 4 * w_4 ** 2 * w_5 ** 2 / 207360 + w_2 * w_3 ** 4 * w_5 ** 4 / 1036800 + w_2 * w_3 ** 2 * w_4 ** 6 / 725760 - w_2 * w_3 ** 2 * w_4 ** 4 * w_5 ** 2 / 207360 - w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 4 / 207360 + w_2 * w_3 ** 2 * w_5 ** 6 / 725760 + w_2 * w_3 * w_4 ** 6 * w_5 / 241920 + w_2 * w_3 * w_4 * w_5 ** 6 / 241920 - w_2 * w_4 ** 8 / 2419200 + w_2 * w_4 ** 6 * w_5 ** 2 / 725760 + w_2 * w_4 ** 4 * w_5 ** 4 / 1036800 + w_2 * w_4 ** 2 * w_5 ** 6 / 725760 - w_2 * w_5 ** 8 / 2419200 - w_3 ** 8 * w_4 / 2419200 - w_3 ** 8 * w_5 / 2419200 + w_3 ** 6 * w_4 ** 2 * w_5 / 725760 + w_3 ** 6 * w_4 * w_5 ** 2 / 725760 + w_3 ** 4 * w_4 ** 4 * w_5 / 1036800 + w_3 ** 4 * w_4 * w_5 ** 4 / 1036800 + w_3 ** 2 * w_4 ** 6 * w_5 / 725760 + w_3 ** 2 * w_4 * w_5 ** 6 / 725760 - w_3 * w_4 ** 8 / 2419200 + w_3 * w_4 ** 6 * w_5 ** 2 / 725760 + w_3 * w_4 ** 4 * w_5 ** 4 / 1036800 + w_3 * w_4 ** 2 * w_5 ** 6 / 725760 - w_3 * w_5 ** 8 / 2419200 - w_4 ** 8 * w_5 / 2419200 - w_4 * w_5 ** 8 / 2419200
-    if s == 10 and ln == 4:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        return w_1 ** 10 / 47900160 - w_1 ** 8 * w_2 ** 2 / 14515200 - w_1 ** 8 * w_2 * w_3 / 4838400 - w_1 ** 8 * w_2 * w_4 / 4838400 - w_1 ** 8 * w_3 ** 2 / 14515200 - w_1 ** 8 * w_3 * w_4 / 4838400 - w_1 ** 8 * w_4 ** 2 / 14515200 - w_1 ** 6 * w_2 ** 4 / 21772800 + w_1 ** 6 * w_2 ** 2 * w_3 ** 2 / 4354560 + w_1 ** 6 * w_2 ** 2 * w_3 * w_4 / 1451520 + w_1 ** 6 * w_2 ** 2 * w_4 ** 2 / 4354560 + w_1 ** 6 * w_2 * w_3 ** 2 * w_4 / 1451520 + w_1 ** 6 * w_2 * w_3 * w_4 ** 2 / 1451520 - w_1 ** 6 * w_3 ** 4 / 21772800 + w_1 ** 6 * w_3 ** 2 * w_4 ** 2 / 4354560 - w_1 ** 6 * w_4 ** 4 / 21772800 - w_1 ** 4 * w_2 ** 6 / 21772800 + w_1 ** 4 * w_2 ** 4 * w_3 ** 2 / 6220800 + w_1 ** 4 * w_2 ** 4 * w_3 * w_4 / 2073600 + w_1 ** 4 * w_2 ** 4 * w_4 ** 2 / 6220800 + w_1 ** 4 * w_2 ** 2 * w_3 ** 4 / 6220800 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 1244160 + w_1 ** 4 * w_2 ** 2 * w_4 ** 4 / 6220800 + w_1 ** 4 * w_2 * w_3 ** 4 * w_4 / 2073600 + w_1 ** 4 * w_2 * w_3 * w_4 ** 4 / 2073600 - w_1 ** 4 * w_3 ** 6 / 21772800 + w_1 ** 4 * w_3 ** 4 * w_4 ** 2 / 6220800 + w_1 ** 4 * w_3 ** 2 * w_4 ** 4 / 6220800 - w_1 ** 4 * w_4 ** 6 / 21772800 - w_1 ** 2 * w_2 ** 8 / 14515200 + w_1 ** 2 * w_2 ** 6 * w_3 ** 2 / 4354560 + w_1 ** 2 * w_2 ** 6 * w_3 * w_4 / 1451520 + w_1 ** 2 * w_2 ** 6 * w_4 ** 2 / 4354560 + w_1 ** 2 * w_2 ** 4 * w_3 ** 4 / 6220800 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 * w_4 ** 2 / 1244160 + w_1 ** 2 * w_2 ** 4 * w_4 ** 4 / 6220800 + w_1 ** 2 * w_2 ** 2 * w_3 ** 6 / 4354560 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 * w_4 ** 2 / 1244160 - w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 ** 4 / 1244160 + w_1 ** 2 * w_2 ** 2 * w_4 ** 6 / 4354560 + w_1 ** 2 * w_2 * w_3 ** 6 * w_4 / 1451520 + w_1 ** 2 * w_2 * w_3 * w_4 ** 6 / 1451520 - w_1 ** 2 * w_3 ** 8 / 14515200 + w_1 ** 2 * w_3 ** 6 * w_4 ** 2 / 4354560 + w_1 ** 2 * w_3 ** 4 * w_4 ** 4 / 6220800 + w_1 ** 2 * w_3 ** 2 * w_4 ** 6 / 4354560 - w_1 ** 2 * w_4 ** 8 / 14515200 - w_1 * w_2 ** 8 * w_3 / 4838400 - w_1 * w_2 ** 8 * w_4 / 4838400 + w_1 * w_2 ** 6 * w_3 ** 2 * w_4 / 1451520 + w_1 * w_2 ** 6 * w_3 * w_4 ** 2 / 1451520 + w_1 * w_2 ** 4 * w_3 ** 4 * w_4 / 2073600 + w_1 * w_2 ** 4 * w_3 * w_4 ** 4 / 2073600 + w_1 * w_2 ** 2 * w_3 ** 6 * w_4 / 1451520 + w_1 * w_2 ** 2 * w_3 * w_4 ** 6 / 1451520 - w_1 * w_2 * w_3 ** 8 / 4838400 + w_1 * w_2 * w_3 ** 6 * w_4 ** 2 / 1451520 + w_1 * w_2 * w_3 ** 4 * w_4 ** 4 / 2073600 + w_1 * w_2 * w_3 ** 2 * w_4 ** 6 / 1451520 - w_1 * w_2 * w_4 ** 8 / 4838400 - w_1 * w_3 ** 8 * w_4 / 4838400 - w_1 * w_3 * w_4 ** 8 / 4838400 + w_2 ** 10 / 47900160 - w_2 ** 8 * w_3 ** 2 / 14515200 - w_2 ** 8 * w_3 * w_4 / 4838400 - w_2 ** 8 * w_4 ** 2 / 14515200 - w_2 ** 6 * w_3 ** 4 / 21772800 + w_2 ** 6 * w_3 ** 2 * w_4 ** 2 / 4354560 - w_2 ** 6 * w_4 ** 4 / 21772800 - w_2 ** 4 * w_3 ** 6 / 21772800 + w_2 ** 4 * w_3 ** 4 * w_4 ** 2 / 6220800 + w_2 ** 4 * w_3 ** 2 * w_4 ** 4 / 6220800 - w_2 ** 4 * w_4 ** 6 / 21772800 - w_2 ** 2 * w_3 ** 8 / 14515200 + w_2 ** 2 * w_3 ** 6 * w_4 ** 2 / 4354560 + w_2 ** 2 * w_3 ** 4 * w_4 ** 4 / 6220800 + w_2 ** 2 * w_3 ** 2 * w_4 ** 6 / 4354560 - w_2 ** 2 * w_4 ** 8 / 14515200 - w_2 * w_3 ** 8 * w_4 / 4838400 - w_2 * w_3 * w_4 ** 8 / 4838400 + w_3 ** 10 / 47900160 - w_3 ** 8 * w_4 ** 2 / 14515200 - w_3 ** 6 * w_4 ** 4 / 21772800 - w_3 ** 4 * w_4 ** 6 / 21772800 - w_3 ** 2 * w_4 ** 8 / 14515200 + w_4 ** 10 / 47900160
-    if s == 11 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return w_1 ** 10 * w_2 / 95800320 + w_1 ** 10 * w_3 / 95800320 - w_1 ** 8 * w_2 ** 2 * w_3 / 29030400 - w_1 ** 8 * w_2 * w_3 ** 2 / 29030400 - w_1 ** 6 * w_2 ** 4 * w_3 / 43545600 - w_1 ** 6 * w_2 * w_3 ** 4 / 43545600 - w_1 ** 4 * w_2 ** 6 * w_3 / 43545600 - w_1 ** 4 * w_2 * w_3 ** 6 / 43545600 - w_1 ** 2 * w_2 ** 8 * w_3 / 29030400 - w_1 ** 2 * w_2 * w_3 ** 8 / 29030400 + w_1 * w_2 ** 10 / 95800320 - w_1 * w_2 ** 8 * w_3 ** 2 / 29030400 - w_1 * w_2 ** 6 * w_3 ** 4 / 43545600 - w_1 * w_2 ** 4 * w_3 ** 6 / 43545600 - w_1 * w_2 ** 2 * w_3 ** 8 / 29030400 + w_1 * w_3 ** 10 / 95800320 + w_2 ** 10 * w_3 / 95800320 + w_2 * w_3 ** 10 / 95800320
-    if s == 12 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return -691 * w_1 ** 12 / 1307674368000 + w_1 ** 10 * w_2 ** 2 / 574801920 + w_1 ** 8 * w_2 ** 4 / 870912000 + w_1 ** 6 * w_2 ** 6 / 914457600 + w_1 ** 4 * w_2 ** 8 / 870912000 + w_1 ** 2 * w_2 ** 10 / 574801920 - 691 * w_2 ** 12 / 1307674368000
-    if s == 13 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return 0
-    if s == 0 and ln == 15:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        w_12 = sym.Symbol("w_12")
-        w_13 = sym.Symbol("w_13")
-        w_14 = sym.Symbol("w_14")
-        w_15 = sym.Symbol("w_15")
-        return 1
-    if s == 1 and ln == 14:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        w_12 = sym.Symbol("w_12")
-        w_13 = sym.Symbol("w_13")
-        w_14 = sym.Symbol("w_14")
-        return w_1 / 2 + w_10 / 2 + w_11 / 2 + w_12 / 2 + w_13 / 2 + w_14 / 2 + w_2 / 2 + w_3 / 2 + w_4 / 2 + w_5 / 2 + w_6 / 2 + w_7 / 2 + w_8 / 2 + w_9 / 2
-    if s == 2 and ln == 13:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        w_12 = sym.Symbol("w_12")
-        w_13 = sym.Symbol("w_13")
-        return w_1 ** 2 / 12 + w_1 * w_10 / 4 + w_1 * w_11 / 4 + w_1 * w_12 / 4 + w_1 * w_13 / 4 + w_1 * w_2 / 4 + w_1 * w_3 / 4 + w_1 * w_4 / 4 + w_1 * w_5 / 4 + w_1 * w_6 / 4 + w_1 * w_7 / 4 + w_1 * w_8 / 4 + w_1 * w_9 / 4 + w_10 ** 2 / 12 + w_10 * w_11 / 4 + w_10 * w_12 / 4 + w_10 * w_13 / 4 + w_10 * w_2 / 4 + w_10 * w_3 / 4 + w_10 * w_4 / 4 + w_10 * w_5 / 4 + w_10 * w_6 / 4 + w_10 * w_7 / 4 + w_10 * w_8 / 4 + w_10 * w_9 / 4 + w_11 ** 2 / 12 + w_11 * w_12 / 4 + w_11 * w_13 / 4 + w_11 * w_2 / 4 + w_11 * w_3 / 4 + w_11 * w_4 / 4 + w_11 * w_5 / 4 + w_11 * w_6 / 4 + w_11 * w_7 / 4 + w_11 * w_8 / 4 + w_11 * w_9 / 4 + w_12 ** 2 / 12 + w_12 * w_13 / 4 + w_12 * w_2 / 4 + w_12 * w_3 / 4 + w_12 * w_4 / 4 + w_12 * w_5 / 4 + w_12 * w_6 / 4 + w_12 * w_7 / 4 + w_12 * w_8 / 4 + w_12 * w_9 / 4 + w_13 ** 2 / 12 + w_13 * w_2 / 4 + w_13 * w_3 / 4 + w_13 * w_4 / 4 + w_13 * w_5 / 4 + w_13 * w_6 / 4 + w_13 * w_7 / 4 + w_13 * w_8 / 4 + w_13 * w_9 / 4 + w_2 ** 2 / 12 + w_2 * w_3 / 4 + w_2 * w_4 / 4 + w_2 * w_5 / 4 + w_2 * w_6 / 4 + w_2 * w_7 / 4 + w_2 * w_8 / 4 + w_2 * w_9 / 4 + w_3 ** 2 / 12 + w_3 * w_4 / 4 + w_3 * w_5 / 4 + w_3 * w_6 / 4 + w_3 * w_7 / 4 + w_3 * w_8 / 4 + w_3 * w_9 / 4 + w_4 ** 2 / 12 + w_4 * w_5 / 4 + w_4 * w_6 / 4 + w_4 * w_7 / 4 + w_4 * w_8 / 4 + w_4 * w_9 / 4 + w_5 ** 2 / 12 + w_5 * w_6 / 4 + w_5 * w_7 / 4 + w_5 * w_8 / 4 + w_5 * w_9 / 4 + w_6 ** 2 / 12 + w_6 * w_7 / 4 + w_6 * w_8 / 4 + w_6 * w_9 / 4 + w_7 ** 2 / 12 + w_7 * w_8 / 4 + w_7 * w_9 / 4 + w_8 ** 2 / 12 + w_8 * w_9 / 4 + w_9 ** 2 / 12
-    if s == 3 and ln == 12:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        w_12 = sym.Symbol("w_12")
-        return w_1 ** 2 * w_10 / 24 + w_1 ** 2 * w_11 / 24 + w_1 ** 2 * w_12 / 24 + w_1 ** 2 * w_2 / 24 + w_1 ** 2 * w_3 / 24 + w_1 ** 2 * w_4 / 24 + w_1 ** 2 * w_5 / 24 + w_1 ** 2 * w_6 / 24 + w_1 ** 2 * w_7 / 24 + w_1 ** 2 * w_8 / 24 + w_1 ** 2 * w_9 / 24 + w_1 * w_10 ** 2 / 24 + w_1 * w_10 * w_11 / 8 + w_1 * w_10 * w_12 / 8 + w_1 * w_10 * w_2 / 8 + w_1 * w_10 * w_3 / 8 + w_1 * w_10 * w_4 / 8 + w_1 * w_10 * w_5 / 8 + w_1 * w_10 * w_6 / 8 + w_1 * w_10 * w_7 / 8 + w_1 * w_10 * w_8 / 8 + w_1 * w_10 * w_9 / 8 + w_1 * w_11 ** 2 / 24 + w_1 * w_11 * w_12 / 8 + w_1 * w_11 * w_2 / 8 + w_1 * w_11 * w_3 / 8 + w_1 * w_11 * w_4 / 8 + w_1 * w_11 * w_5 / 8 + w_1 * w_11 * w_6 / 8 + w_1 * w_11 * w_7 / 8 + w_1 * w_11 * w_8 / 8 + w_1 * w_11 * w_9 / 8 + w_1 * w_12 ** 2 / 24 + w_1 * w_12 * w_2 / 8 + w_1 * w_12 * w_3 / 8 + w_1 * w_12 * w_4 / 8 + w_1 * w_12 * w_5 / 8 + w_1 * w_12 * w_6 / 8 + w_1 * w_12 * w_7 / 8 + w_1 * w_12 * w_8 / 8 + w_1 * w_12 * w_9 / 8 + w_1 * w_2 ** 2 / 24 + w_1 * w_2 * w_3 / 8 + w_1 * w_2 * w_4 / 8 + w_1 * w_2 * w_5 / 8 + w_1 * w_2 * w_6 / 8 + w_1 * w_2 * w_7 / 8 + w_1 * w_2 * w_8 / 8 + w_1 * w_2 * w_9 / 8 + w_1 * w_3 ** 2 / 24 + w_1 * w_3 * w_4 / 8 + w_1 * w_3 * w_5 / 8 + w_1 * w_3 * w_6 / 8 + w_1 * w_3 * w_7 / 8 + w_1 * w_3 * w_8 / 8 + w_1 * w_3 * w_9 / 8 + w_1 * w_4 ** 2 / 24 + w_1 * w_4 * w_5 / 8 + w_1 * w_4 * w_6 / 8 + w_1 * w_4 * w_7 / 8 + w_1 * w_4 * w_8 / 8 + w_1 * w_4 * w_9 / 8 + w_1 * w_5 ** 2 / 24 + w_1 * w_5 * w_6 / 8 + w_1 * w_5 * w_7 / 8 + w_1 * w_5 * w_8 / 8 + w_1 * w_5 * w_9 / 8 + w_1 * w_6 ** 2 / 24 + w_1 * w_6 * w_7 / 8 + w_1 * w_6 * w_8 / 8 + w_1 * w_6 * w_9 / 8 + w_1 * w_7 ** 2 / 24 + w_1 * w_7 * w_8 / 8 + w_1 * w_7 * w_9 / 8 + w_1 * w_8 ** 2 / 24 + w_1 * w_8 * w_9 / 8 + w_1 * w_9 ** 2 / 24 + w_10 ** 2 * w_11 / 24 + w_10 ** 2 * w_12 / 24 + w_10 ** 2 * w_2 / 24 + w_10 ** 2 * w_3 / 24 + w_10 ** 2 * w_4 / 24 + w_10 ** 2 * w_5 / 24 + w_10 ** 2 * w_6 / 24 + w_10 ** 2 * w_7 / 24 + w_10 ** 2 * w_8 / 24 + w_10 ** 2 * w_9 / 24 + w_10 * w_11 ** 2 / 24 + w_10 * w_11 * w_12 / 8 + w_10 * w_11 * w_2 / 8 + w_10 * w_11 * w_3 / 8 + w_10 * w_11 * w_4 / 8 + w_10 * w_11 * w_5 / 8 + w_10 * w_11 * w_6 / 8 + w_10 * w_11 * w_7 / 8 + w_10 * w_11 * w_8 / 8 + w_10 * w_11 * w_9 / 8 + w_10 * w_12 ** 2 / 24 + w_10 * w_12 * w_2 / 8 + w_10 * w_12 * w_3 / 8 + w_10 * w_12 * w_4 / 8 + w_10 * w_12 * w_5 / 8 + w_10 * w_12 * w_6 / 8 + w_10 * w_12 * w_7 / 8 + w_10 * w_12 * w_8 / 8 + w_10 * w_12 * w_9 / 8 + w_10 * w_2 ** 2 / 24 + w_10 * w_2 * w_3 / 8 + w_10 * w_2 * w_4 / 8 + w_10 * w_2 * w_5 / 8 + w_10 * w_2 * w_6 / 8 + w_10 * w_2 * w_7 / 8 + w_10 * w_2 * w_8 / 8 + w_10 * w_2 * w_9 / 8 + w_10 * w_3 ** 2 / 24 + w_10 * w_3 * w_4 / 8 + w_10 * w_3 * w_5 / 8 + w_10 * w_3 * w_6 / 8 + w_10 * w_3 * w_7 / 8 + w_10 * w_3 * w_8 / 8 + w_10 * w_3 * w_9 / 8 + w_10 * w_4 ** 2 / 24 + w_10 * w_4 * w_5 / 8 + w_10 * w_4 * w_6 / 8 + w_10 * w_4 * w_7 / 8 + w_10 * w_4 * w_8 / 8 + w_10 * w_4 * w_9 / 8 + w_10 * w_5 ** 2 / 24 + w_10 * w_5 * w_6 / 8 + w_10 * w_5 * w_7 / 8 + w_10 * w_5 * w_8 / 8 + w_10 * w_5 * w_9 / 8 + w_10 * w_6 ** 2 / 24 + w_10 * w_6 * w_7 / 8 + w_10 * w_6 * w_8 / 8 + w_10 * w_6 * w_9 / 8 + w_10 * w_7 ** 2 / 24 + w_10 * w_7 * w_8 / 8 + w_10 * w_7 * w_9 / 8 + w_10 * w_8 ** 2 / 24 + w_10 * w_8 * w_9 / 8 + w_10 * w_9 ** 2 / 24 + w_11 ** 2 * w_12 / 24 + w_11 ** 2 * w_2 / 24 + w_11 ** 2 * w_3 / 24 + w_11 ** 2 * w_4 / 24 + w_11 ** 2 * w_5 / 24 + w_11 ** 2 * w_6 / 24 + w_11 ** 2 * w_7 / 24 + w_11 ** 2 * w_8 / 24 + w_11 ** 2 * w_9 / 24 + w_11 * w_12 ** 2 / 24 + w_11 * w_12 * w_2 / 8 + w_11 * w_12 * w_3 / 8 + w_11 * w_12 * w_4 / 8 + w_11 * w_12 * w_5 / 8 + w_11 * w_12 * w_6 / 8 + w_11 * w_12 * w_7 / 8 + w_11 * w_12 * w_8 / 8 + w_11 * w_12 * w_9 / 8 + w_11 * w_2 ** 2 / 24 + w_11 * w_2 * w_3 / 8 + w_11 * w_2 * w_4 / 8 + w_11 * w_2 * w_5 / 8 + w_11 * w_2 * w_6 / 8 + w_11 * w_2 * w_7 / 8 + w_11 * w_2 * w_8 / 8 + w_11 * w_2 * w_9 / 8 + w_11 * w_3 ** 2 / 24 + w_11 * w_3 * w_4 / 8 + w_11 * w_3 * w_5 / 8 + w_11 * w_3 * w_6 / 8 + w_11 * w_3 * w_7 / 8 + w_11 * w_3 * w_8 / 8 + w_11 * w_3 * w_9 / 8 + w_11 * w_4 ** 2 / 24 + w_11 * w_4 * w_5 / 8 + w_11 * w_4 * w_6 / 8 + w_11 * w_4 * w_7 / 8 + w_11 * w_4 * w_8 / 8 + w_11 * w_4 * w_9 / 8 + w_11 * w_5 ** 2 / 24 + w_11 * w_5 * w_6 / 8 + w_11 * w_5 * w_7 / 8 + w_11 * w_5 * w_8 / 8 + w_11 * w_5 * w_9 / 8 + w_11 * w_6 ** 2 / 24 + w_11 * w_6 * w_7 / 8 + w_11 * w_6 * w_8 / 8 + w_11 * w_6 * w_9 / 8 + w_11 * w_7 ** 2 / 24 + w_11 * w_7 * w_8 / 8 + w_11 * w_7 * w_9 / 8 + w_11 * w_8 ** 2 / 24 + w_11 * w_8 * w_9 / 8 + w_11 * w_9 ** 2 / 24 + w_12 ** 2 * w_2 / 24 + w_12 ** 2 * w_3 / 24 + w_12 ** 2 * w_4 / 24 + w_12 ** 2 * w_5 / 24 + w_12 ** 2 * w_6 / 24 + w_12 ** 2 * w_7 / 24 + w_12 ** 2 * w_8 / 24 + w_12 ** 2 * w_9 / 24 + w_12 * w_2 ** 2 / 24 + w_12 * w_2 * w_3 / 8 + w_12 * w_2 * w_4 / 8 + w_12 * w_2 * w_5 / 8 + w_12 * w_2 * w_6 / 8 + w_12 * w_2 * w_7 / 8 + w_12 * w_2 * w_8 / 8 + w_12 * w_2 * w_9 / 8 + w_12 * w_3 ** 2 / 24 + w_12 * w_3 * w_4 / 8 + w_12 * w_3 * w_5 / 8 + w_12 * w_3 * w_6 / 8 + w_12 * w_3 * w_7 / 8 + w_12 * w_3 * w_8 / 8 + w_12 * w_3 * w_9 / 8 + w_12 * w_4 ** 2 / 24 + w_12 * w_4 * w_5 / 8 + w_12 * w_4 * w_6 / 8 + w_12 * w_4 * w_7 / 8 + w_12 * w_4 * w_8 / 8 + w_12 * w_4 * w_9 / 8 + w_12 * w_5 ** 2 / 24 + w_12 * w_5 * w_6 / 8 + w_12 * w_5 * w_7 / 8 + w_12 * w_5 * w_8 / 8 + w_12 * w_5 * w_9 / 8 + w_12 * w_6 ** 2 / 24 + w_12 * w_6 * w_7 / 8 + w_12 * w_6 * w_8 / 8 + w_12 * w_6 * w_9 / 8 + w_12 * w_7 ** 2 / 24 + w_12 * w_7 * w_8 / 8 + w_12 * w_7 * w_9 / 8 + w_12 * w_8 ** 2 / 24 + w_12 * w_8 * w_9 / 8 + w_12 * w_9 ** 2 / 24 + w_2 ** 2 * w_3 / 24 + w_2 ** 2 * w_4 / 24 + w_2 ** 2 * w_5 / 24 + w_2 ** 2 * w_6 / 24 + w_2 ** 2 * w_7 / 24 + w_2 ** 2 * w_8 / 24 + w_2 ** 2 * w_9 / 24 + w_2 * w_3 ** 2 / 24 + w_2 * w_3 * w_4 / 8 + w_2 * w_3 * w_5 / 8 + w_2 * w_3 * w_6 / 8 + w_2 * w_3 * w_7 / 8 + w_2 * w_3 * w_8 / 8 + w_2 * w_3 * w_9 / 8 + w_2 * w_4 ** 2 / 24 + w_2 * w_4 * w_5 / 8 + w_2 * w_4 * w_6 / 8 + w_2 * w_4 * w_7 / 8 + w_2 * w_4 * w_8 / 8 + w_2 * w_4 * w_9 / 8 + w_2 * w_5 ** 2 / 24 + w_2 * w_5 * w_6 / 8 + w_2 * w_5 * w_7 / 8 + w_2 * w_5 * w_8 / 8 + w_2 * w_5 * w_9 / 8 + w_2 * w_6 ** 2 / 24 + w_2 * w_6 * w_7 / 8 + w_2 * w_6 * w_8 / 8 + w_2 * w_6 * w_9 / 8 + w_2 * w_7 ** 2 / 24 + w_2 * w_7 * w_8 / 8 + w_2 * w_7 * w_9 / 8 + w_2 * w_8 ** 2 / 24 + w_2 * w_8 * w_9 / 8 + w_2 * w_9 ** 2 / 24 + w_3 ** 2 * w_4 / 24 + w_3 ** 2 * w_5 / 24 + w_3 ** 2 * w_6 / 24 + w_3 ** 2 * w_7 / 24 + w_3 ** 2 * w_8 / 24 + w_3 ** 2 * w_9 / 24 + w_3 * w_4 ** 2 / 24 + w_3 * w_4 * w_5 / 8 + w_3 * w_4 * w_6 / 8 + w_3 * w_4 * w_7 / 8 + w_3 * w_4 * w_8 / 8 + w_3 * w_4 * w_9 / 8 + w_3 * w_5 ** 2 / 24 + w_3 * w_5 * w_6 / 8 + w_3 * w_5 * w_7 / 8 + w_3 * w_5 * w_8 / 8 + w_3 * w_5 * w_9 / 8 + w_3 * w_6 ** 2 / 24 + w_3 * w_6 * w_7 / 8 + w_3 * w_6 * w_8 / 8 + w_3 * w_6 * w_9 / 8 + w_3 * w_7 ** 2 / 24 + w_3 * w_7 * w_8 / 8 + w_3 * w_7 * w_9 / 8 + w_3 * w_8 ** 2 / 24 + w_3 * w_8 * w_9 / 8 + w_3 * w_9 ** 2 / 24 + w_4 ** 2 * w_5 / 24 + w_4 ** 2 * w_6 / 24 + w_4 ** 2 * w_7 / 24 + w_4 ** 2 * w_8 / 24 + w_4 ** 2 * w_9 / 24 + w_4 * w_5 ** 2 / 24 + w_4 * w_5 * w_6 / 8 + w_4 * w_5 * w_7 / 8 + w_4 * w_5 * w_8 / 8 + w_4 * w_5 * w_9 / 8 + w_4 * w_6 ** 2 / 24 + w_4 * w_6 * w_7 / 8 + w_4 * w_6 * w_8 / 8 + w_4 * w_6 * w_9 / 8 + w_4 * w_7 ** 2 / 24 + w_4 * w_7 * w_8 / 8 + w_4 * w_7 * w_9 / 8 + w_4 * w_8 ** 2 / 24 + w_4 * w_8 * w_9 / 8 + w_4 * w_9 ** 2 / 24 + w_5 ** 2 * w_6 / 24 + w_5 ** 2 * w_7 / 24 + w_5 ** 2 * w_8 / 24 + w_5 ** 2 * w_9 / 24 + w_5 * w_6 ** 2 / 24 + w_5 * w_6 * w_7 / 8 + w_5 * w_6 * w_8 / 8 + w_5 * w_6 * w_9 / 8 + w_5 * w_7 ** 2 / 24 + w_5 * w_7 * w_8 / 8 + w_5 * w_7 * w_9 / 8 + w_5 * w_8 ** 2 / 24 + w_5 * w_8 * w_9 / 8 + w_5 * w_9 ** 2 / 24 + w_6 ** 2 * w_7 / 24 + w_6 ** 2 * w_8 / 24 + w_6 ** 2 * w_9 / 24 + w_6 * w_7 ** 2 / 24 + w_6 * w_7 * w_8 / 8 + w_6 * w_7 * w_9 / 8 + w_6 * w_8 ** 2 / 24 + w_6 * w_8 * w_9 / 8 + w_6 * w_9 ** 2 / 24 + w_7 ** 2 * w_8 / 24 + w_7 ** 2 * w_9 / 24 + w_7 * w_8 ** 2 / 24 + w_7 * w_8 * w_9 / 8 + w_7 * w_9 ** 2 / 24 + w_8 ** 2 * w_9 / 24 + w_8 * w_9 ** 2 / 24
-    if s == 4 and ln == 11:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        w_11 = sym.Symbol("w_11")
-        return -w_1 ** 4 / 720 + w_1 ** 2 * w_10 ** 2 / 144 + w_1 ** 2 * w_10 * w_11 / 48 + w_1 ** 2 * w_10 * w_2 / 48 + w_1 ** 2 * w_10 * w_3 / 48 + w_1 ** 2 * w_10 * w_4 / 48 + w_1 ** 2 * w_10 * w_5 / 48 + w_1 ** 2 * w_10 * w_6 / 48 + w_1 ** 2 * w_10 * w_7 / 48 + w_1 ** 2 * w_10 * w_8 / 48 + w_1 ** 2 * w_10 * w_9 / 48 + w_1 ** 2 * w_11 ** 2 / 144 + w_1 ** 2 * w_11 * w_2 / 48 + w_1 ** 2 * w_11 * w_3 / 48 + w_1 ** 2 * w_11 * w_4 / 48 + w_1 ** 2 * w_11 * w_5 / 48 + w_1 ** 2 * w_11 * w_6 / 48 + w_1 ** 2 * w_11 * w_7 / 48 + w_1 ** 2 * w_11 * w_8 / 48 + w_1 ** 2 * w_11 * w_9 / 48 + w_1 ** 2 * w_2 ** 2 / 144 + w_1 ** 2 * w_2 * w_3 / 48 + w_1 ** 2 * w_2 * w_4 / 48 + w_1 ** 2 * w_2 * w_5 / 48 + w_1 ** 2 * w_2 * w_6 / 48 + w_1 ** 2 * w_2 * w_7 / 48 + w_1 ** 2 * w_2 * w_8 / 48 + w_1 ** 2 * w_2 * w_9 / 48 + w_1 ** 2 * w_3 ** 2 / 144 + w_1 ** 2 * w_3 * w_4 / 48 + w_1 ** 2 * w_3 * w_5 / 48 + w_1 ** 2 * w_3 * w_6 / 48 + w_1 ** 2 * w_3 * w_7 / 48 + w_1 ** 2 * w_3 * w_8 / 48 + w_1 ** 2 * w_3 * w_9 / 48 + w_1 ** 2 * w_4 ** 2 / 144 + w_1 ** 2 * w_4 * w_5 / 48 + w_1 ** 2 * w_4 * w_6 / 48 + w_1 ** 2 * w_4 * w_7 / 48 + w_1 ** 2 * w_4 * w_8 / 48 + w_1 ** 2 * w_4 * w_9 / 48 + w_1 ** 2 * w_5 ** 2 / 144 + w_1 ** 2 * w_5 * w_6 / 48 + w_1 ** 2 * w_5 * w_7 / 48 + w_1 ** 2 * w_5 * w_8 / 48 + w_1 ** 2 * w_5 * w_9 / 48 + w_1 ** 2 * w_6 ** 2 / 144 + w_1 ** 2 * w_6 * w_7 / 48 + w_1 ** 2 * w_6 * w_8 / 48 + w_1 ** 2 * w_6 * w_9 / 48 + w_1 ** 2 * w_7 ** 2 / 144 + w_1 ** 2 * w_7 * w_8 / 48 + w_1 ** 2 * w_7 * w_9 / 48 + w_1 ** 2 * w_8 ** 2 / 144 + w_1 ** 2 * w_8 * w_9 / 48 + w_1 ** 2 * w_9 ** 2 / 144 + w_1 * w_10 ** 2 * w_11 / 48 + w_1 * w_10 ** 2 * w_2 / 48 + w_1 * w_10 ** 2 * w_3 / 48 + w_1 * w_10 ** 2 * w_4 / 48 + w_1 * w_10 ** 2 * w_5 / 48 + w_1 * w_10 ** 2 * w_6 / 48 + w_1 * w_10 ** 2 * w_7 / 48 + w_1 * w_10 ** 2 * w_8 / 48 + w_1 * w_10 ** 2 * w_9 / 48 + w_1 * w_10 * w_11 ** 2 / 48 + w_1 * w_10 * w_11 * w_2 / 16 + w_1 * w_10 * w_11 * w_3 / 16 + w_1 * w_10 * w_11 * w_4 / 16 + w_1 * w_10 * w_11 * w_5 / 16 + w_1 * w_10 * w_11 * w_6 / 16 + w_1 * w_10 * w_11 * w_7 / 16 + w_1 * w_10 * w_11 * w_8 / 16 + w_1 * w_10 * w_11 * w_9 / 16 + w_1 * w_10 * w_2 ** 2 / 48 + w_1 * w_10 * w_2 * w_3 / 16 + w_1 * w_10 * w_2 * w_4 / 16 + w_1 * w_10 * w_2 * w_5 / 16 + w_1 * w_10 * w_2 * w_6 / 16 + w_1 * w_10 * w_2 * w_7 / 16 + w_1 * w_10 * w_2 * w_8 / 16 + w_1 * w_10 * w_2 * w_9 / 16 + w_1 * w_10 * w_3 ** 2 / 48 + w_1 * w_10 * w_3 * w_4 / 16 + w_1 * w_10 * w_3 * w_5 / 16 + w_1 * w_10 * w_3 * w_6 / 16 + w_1 * w_10 * w_3 * w_7 / 16 + w_1 * w_10 * w_3 * w_8 / 16 + w_1 * w_10 * w_3 * w_9 / 16 + w_1 * w_10 * w_4 ** 2 / 48 + w_1 * w_10 * w_4 * w_5 / 16 + w_1 * w_10 * w_4 * w_6 / 16 + w_1 * w_10 * w_4 * w_7 / 16 + w_1 * w_10 * w_4 * w_8 / 16 + w_1 * w_10 * w_4 * w_9 / 16 + w_1 * w_10 * w_5 ** 2 / 48 + w_1 * w_10 * w_5 * w_6 / 16 + w_1 * w_10 * w_5 * w_7 / 16 + w_1 * w_10 * w_5 * w_8 / 16 + w_1 * w_10 * w_5 * w_9 / 16 + w_1 * w_10 * w_6 ** 2 / 48 + w_1 * w_10 * w_6 * w_7 / 16 + w_1 * w_10 * w_6 * w_8 / 16 + w_1 * w_10 * w_6 * w_9 / 16 + w_1 * w_10 * w_7 ** 2 / 48 + w_1 * w_10 * w_7 * w_8 / 16 + w_1 * w_10 * w_7 * w_9 / 16 + w_1 * w_10 * w_8 ** 2 / 48 + w_1 * w_10 * w_8 * w_9 / 16 + w_1 * w_10 * w_9 ** 2 / 48 + w_1 * w_11 ** 2 * w_2 / 48 + w_1 * w_11 ** 2 * w_3 / 48 + w_1 * w_11 ** 2 * w_4 / 48 + w_1 * w_11 ** 2 * w_5 / 48 + w_1 * w_11 ** 2 * w_6 / 48 + w_1 * w_11 ** 2 * w_7 / 48 + w_1 * w_11 ** 2 * w_8 / 48 + w_1 * w_11 ** 2 * w_9 / 48 + w_1 * w_11 * w_2 ** 2 / 48 + w_1 * w_11 * w_2 * w_3 / 16 + w_1 * w_11 * w_2 * w_4 / 16 + w_1 * w_11 * w_2 * w_5 / 16 + w_1 * w_11 * w_2 * w_6 / 16 + w_1 * w_11 * w_2 * w_7 / 16 + w_1 * w_11 * w_2 * w_8 / 16 + w_1 * w_11 * w_2 * w_9 / 16 + w_1 * w_11 * w_3 ** 2 / 48 + w_1 * w_11 * w_3 * w_4 / 16 + w_1 * w_11 * w_3 * w_5 / 16 + w_1 * w_11 * w_3 * w_6 / 16 + w_1 * w_11 * w_3 * w_7 / 16 + w_1 * w_11 * w_3 * w_8 / 16 + w_1 * w_11 * w_3 * w_9 / 16 + w_1 * w_11 * w_4 ** 2 / 48 + w_1 * w_11 * w_4 * w_5 / 16 + w_1 * w_11 * w_4 * w_6 / 16 + w_1 * w_11 * w_4 * w_7 / 16 + w_1 * w_11 * w_4 * w_8 / 16 + w_1 * w_11 * w_4 * w_9 / 16 + w_1 * w_11 * w_5 ** 2 / 48 + w_1 * w_11 * w_5 * w_6 / 16 + w_1 * w_11 * w_5 * w_7 / 16 + w_1 * w_11 * w_5 * w_8 / 16 + w_1 * w_11 * w_5 * w_9 / 16 + w_1 * w_11 * w_6 ** 2 / 48 + w_1 * w_11 * w_6 * w_7 / 16 + w_1 * w_11 * w_6 * w_8 / 16 + w_1 * w_11 * w_6 * w_9 / 16 + w_1 * w_11 * w_7 ** 2 / 48 + w_1 * w_11 * w_7 * w_8 / 16 + w_1 * w_11 * w_7 * w_9 / 16 + w_1 * w_11 * w_8 ** 2 / 48 + w_1 * w_11 * w_8 * w_9 / 16 + w_1 * w_11 * w_9 ** 2 / 48 + w_1 * w_2 ** 2 * w_3 / 48 + w_1 * w_2 ** 2 * w_4 / 48 + w_1 * w_2 ** 2 * w_5 / 48 + w_1 * w_2 ** 2 * w_6 / 48 + w_1 * w_2 ** 2 * w_7 / 48 + w_1 * w_2 ** 2 * w_8 / 48 + w_1 * w_2 ** 2 * w_9 / 48 + w_1 * w_2 * w_3 ** 2 / 48 + w_1 * w_2 * w_3 * w_4 / 16 + w_1 * w_2 * w_3 * w_5 / 16 + w_1 * w_2 * w_3 * w_6 / 16 + w_1 * w_2 * w_3 * w_7 / 16 + w_1 * w_2 * w_3 * w_8 / 16 + w_1 * w_2 * w_3 * w_9 / 16 + w_1 * w_2 * w_4 ** 2 / 48 + w_1 * w_2 * w_4 * w_5 / 16 + w_1 * w_2 * w_4 * w_6 / 16 + w_1 * w_2 * w_4 * w_7 / 16 + w_1 * w_2 * w_4 * w_8 / 16 + w_1 * w_2 * w_4 * w_9 / 16 + w_1 * w_2 * w_5 ** 2 / 48 + w_1 * w_2 * w_5 * w_6 / 16 + w_1 * w_2 * w_5 * w_7 / 16 + w_1 * w_2 * w_5 * w_8 / 16 + w_1 * w_2 * w_5 * w_9 / 16 + w_1 * w_2 * w_6 ** 2 / 48 + w_1 * w_2 * w_6 * w_7 / 16 + w_1 * w_2 * w_6 * w_8 / 16 + w_1 * w_2 * w_6 * w_9 / 16 + w_1 * w_2 * w_7 ** 2 / 48 + w_1 * w_2 * w_7 * w_8 / 16 + w_1 * w_2 * w_7 * w_9 / 16 + w_1 * w_2 * w_8 ** 2 / 48 + w_1 * w_2 * w_8 * w_9 / 16 + w_1 * w_2 * w_9 ** 2 / 48 + w_1 * w_3 ** 2 * w_4 / 48 + w_1 * w_3 ** 2 * w_5 / 48 + w_1 * w_3 ** 2 * w_6 / 48 + w_1 * w_3 ** 2 * w_7 / 48 + w_1 * w_3 ** 2 * w_8 / 48 + w_1 * w_3 ** 2 * w_9 / 48 + w_1 * w_3 * w_4 ** 2 / 48 + w_1 * w_3 * w_4 * w_5 / 16 + w_1 * w_3 * w_4 * w_6 / 16 + w_1 * w_3 * w_4 * w_7 / 16 + w_1 * w_3 * w_4 * w_8 / 16 + w_1 * w_3 * w_4 * w_9 / 16 + w_1 * w_3 * w_5 ** 2 / 48 + w_1 * w_3 * w_5 * w_6 / 16 + w_1 * w_3 * w_5 * w_7 / 16 + w_1 * w_3 * w_5 * w_8 / 16 + w_1 * w_3 * w_5 * w_9 / 16 + w_1 * w_3 * w_6 ** 2 / 48 + w_1 * w_3 * w_6 * w_7 / 16 + w_1 * w_3 * w_6 * w_8 / 16 + w_1 * w_3 * w_6 * w_9 / 16 + w_1 * w_3 * w_7 ** 2 / 48 + w_1 * w_3 * w_7 * w_8 / 16 + w_1 * w_3 * w_7 * w_9 / 16 + w_1 * w_3 * w_8 ** 2 / 48 + w_1 * w_3 * w_8 * w_9 / 16 + w_1 * w_3 * w_9 ** 2 / 48 + w_1 * w_4 ** 2 * w_5 / 48 + w_1 * w_4 ** 2 * w_6 / 48 + w_1 * w_4 ** 2 * w_7 / 48 + w_1 * w_4 ** 2 * w_8 / 48 + w_1 * w_4 ** 2 * w_9 / 48 + w_1 * w_4 * w_5 ** 2 / 48 + w_1 * w_4 * w_5 * w_6 / 16 + w_1 * w_4 * w_5 * w_7 / 16 + w_1 * w_4 * w_5 * w_8 / 16 + w_1 * w_4 * w_5 * w_9 / 16 + w_1 * w_4 * w_6 ** 2 / 48 + w_1 * w_4 * w_6 * w_7 / 16 + w_1 * w_4 * w_6 * w_8 / 16 + w_1 * w_4 * w_6 * w_9 / 16 + w_1 * w_4 * w_7 ** 2 / 48 + w_1 * w_4 * w_7 * w_8 / 16 + w_1 * w_4 * w_7 * w_9 / 16 + w_1 * w_4 * w_8 ** 2 / 48 + w_1 * w_4 * w_8 * w_9 / 16 + w_1 * w_4 * w_9 ** 2 / 48 + w_1 * w_5 ** 2 * w_6 / 48 + w_1 * w_5 ** 2 * w_7 / 48 + w_1 * w_5 ** 2 * w_8 / 48 + w_1 * w_5 ** 2 * w_9 / 48 + w_1 * w_5 * w_6 ** 2 / 48 + w_1 * w_5 * w_6 * w_7 / 16 + w_1 * w_5 * w_6 * w_8 / 16 + w_1 * w_5 * w_6 * w_9 / 16 + w_1 * w_5 * w_7 ** 2 / 48 + w_1 * w_5 * w_7 * w_8 / 16 + w_1 * w_5 * w_7 * w_9 / 16 + w_1 * w_5 * w_8 ** 2 / 48 + w_1 * w_5 * w_8 * w_9 / 16 + w_1 * w_5 * w_9 ** 2 / 48 + w_1 * w_6 ** 2 * w_7 / 48 + w_1 * w_6 ** 2 * w_8 / 48 + w_1 * w_6 ** 2 * w_9 / 48 + w_1 * w_6 * w_7 ** 2 / 48 + w_1 * w_6 * w_7 * w_8 / 16 + w_1 * w_6 * w_7 * w_9 / 16 + w_1 * w_6 * w_8 ** 2 / 48 + w_1 * w_6 * w_8 * w_9 / 16 + w_1 * w_6 * w_9 ** 2 / 48 + w_1 * w_7 ** 2 * w_8 / 48 + w_1 * w_7 ** 2 * w_9 / 48 + w_1 * w_7 * w_8 ** 2 / 48 + w_1 * w_7 * w_8 * w_9 / 16 + w_1 * w_7 * w_9 ** 2 / 48 + w_1 * w_8 ** 2 * w_9 / 48 + w_1 * w_8 * w_9 ** 2 / 48 - w_10 ** 4 / 720 + w_10 ** 2 * w_11 ** 2 / 144 + w_10 ** 2 * w_11 * w_2 / 48 + w_10 ** 2 * w_11 * w_3 / 48 + w_10 ** 2 * w_11 * w_4 / 48 + w_10 ** 2 * w_11 * w_5 / 48 + w_10 ** 2 * w_11 * w_6 / 48 + w_10 ** 2 * w_11 * w_7 / 48 + w_10 ** 2 * w_11 * w_8 / 48 + w_10 ** 2 * w_11 * w_9 / 48 + w_10 ** 2 * w_2 ** 2 / 144 + w_10 ** 2 * w_2 * w_3 / 48 + w_10 ** 2 * w_2 * w_4 / 48 + w_10 ** 2 * w_2 * w_5 / 48 + w_10 ** 2 * w_2 * w_6 / 48 + w_10 ** 2 * w_2 * w_7 / 48 + w_10 ** 2 * w_2 * w_8 / 48 + w_10 ** 2 * w_2 * w_9 / 48 + w_10 ** 2 * w_3 ** 2 / 144 + w_10 ** 2 * w_3 * w_4 / 48 + w_10 ** 2 * w_3 * w_5 / 48 + w_10 ** 2 * w_3 * w_6 / 48 + w_10 ** 2 * w_3 * w_7 / 48 + w_10 ** 2 * w_3 * w_8 / 48 + w_10 ** 2 * w_3 * w_9 / 48 + w_10 ** 2 * w_4 ** 2 / 144 + w_10 ** 2 * w_4 * w_5 / 48 + w_10 ** 2 * w_4 * w_6 / 48 + w_10 ** 2 * w_4 * w_7 / 48 + w_10 ** 2 * w_4 * w_8 / 48 + w_10 ** 2 * w_4 * w_9 / 48 + w_10 ** 2 * w_5 ** 2 / 144 + w_10 ** 2 * w_5 * w_6 / 48 + w_10 ** 2 * w_5 * w_7 / 48 + w_10 ** 2 * w_5 * w_8 / 48 + w_10 ** 2 * w_5 * w_9 / 48 + w_10 ** 2 * w_6 ** 2 / 144 + w_10 ** 2 * w_6 * w_7 / 48 + w_10 ** 2 * w_6 * w_8 / 48 + w_10 ** 2 * w_6 * w_9 / 48 + w_10 ** 2 * w_7 ** 2 / 144 + w_10 ** 2 * w_7 * w_8 / 48 + w_10 ** 2 * w_7 * w_9 / 48 + w_10 ** 2 * w_8 ** 2 / 144 + w_10 ** 2 * w_8 * w_9 / 48 + w_10 ** 2 * w_9 ** 2 / 144 + w_10 * w_11 ** 2 * w_2 / 48 + w_10 * w_11 ** 2 * w_3 / 48 + w_10 * w_11 ** 2 * w_4 / 48 + w_10 * w_11 ** 2 * w_5 / 48 + w_10 * w_11 ** 2 * w_6 / 48 + w_10 * w_11 ** 2 * w_7 / 48 + w_10 * w_11 ** 2 * w_8 / 48 + w_10 * w_11 ** 2 * w_9 / 48 + w_10 * w_11 * w_2 ** 2 / 48 + w_10 * w_11 * w_2 * w_3 / 16 + w_10 * w_11 * w_2 * w_4 / 16 + w_10 * w_11 * w_2 * w_5 / 16 + w_10 * w_11 * w_2 * w_6 / 16 + w_10 * w_11 * w_2 * w_7 / 16 + w_10 * w_11 * w_2 * w_8 / 16 + w_10 * w_11 * w_2 * w_9 / 16 + w_10 * w_11 * w_3 ** 2 / 48 + w_10 * w_11 * w_3 * w_4 / 16 + w_10 * w_11 * w_3 * w_5 / 16 + w_10 * w_11 * w_3 * w_6 / 16 + w_10 * w_11 * w_3 * w_7 / 16 + w_10 * w_11 * w_3 * w_8 / 16 + w_10 * w_11 * w_3 * w_9 / 16 + w_10 * w_11 * w_4 ** 2 / 48 + w_10 * w_11 * w_4 * w_5 / 16 + w_10 * w_11 * w_4 * w_6 / 16 + w_10 * w_11 * w_4 * w_7 / 16 + w_10 * w_11 * w_4 * w_8 / 16 + w_10 * w_11 * w_4 * w_9 / 16 + w_10 * w_11 * w_5 ** 2 / 48 + w_10 * w_11 * w_5 * w_6 / 16 + w_10 * w_11 * w_5 * w_7 / 16 + w_10 * w_11 * w_5 * w_8 / 16 + w_10 * w_11 * w_5 * w_9 / 16 + w_10 * w_11 * w_6 ** 2 / 48 + w_10 * w_11 * w_6 * w_7 / 16 + w_10 * w_11 * w_6 * w_8 / 16 + w_10 * w_11 * w_6 * w_9 / 16 + w_10 * w_11 * w_7 ** 2 / 48 + w_10 * w_11 * w_7 * w_8 / 16 + w_10 * w_11 * w_7 * w_9 / 16 + w_10 * w_11 * w_8 ** 2 / 48 + w_10 * w_11 * w_8 * w_9 / 16 + w_10 * w_11 * w_9 ** 2 / 48 + w_10 * w_2 ** 2 * w_3 / 48 + w_10 * w_2 ** 2 * w_4 / 48 + w_10 * w_2 ** 2 * w_5 / 48 + w_10 * w_2 ** 2 * w_6 / 48 + w_10 * w_2 ** 2 * w_7 / 48 + w_10 * w_2 ** 2 * w_8 / 48 + w_10 * w_2 ** 2 * w_9 / 48 + w_10 * w_2 * w_3 ** 2 / 48 + w_10 * w_2 * w_3 * w_4 / 16 + w_10 * w_2 * w_3 * w_5 / 16 + w_10 * w_2 * w_3 * w_6 / 16 + w_10 * w_2 * w_3 * w_7 / 16 + w_10 * w_2 * w_3 * w_8 / 16 + w_10 * w_2 * w_3 * w_9 / 16 + w_10 * w_2 * w_4 ** 2 / 48 + w_10 * w_2 * w_4 * w_5 / 16 + w_10 * w_2 * w_4 * w_6 / 16 + w_10 * w_2 * w_4 * w_7 / 16 + w_10 * w_2 * w_4 * w_8 / 16 + w_10 * w_2 * w_4 * w_9 / 16 + w_10 * w_2 * w_5 ** 2 / 48 + w_10 * w_2 * w_5 * w_6 / 16 + w_10 * w_2 * w_5 * w_7 / 16 + w_10 * w_2 * w_5 * w_8 / 16 + w_10 * w_2 * w_5 * w_9 / 16 + w_10 * w_2 * w_6 ** 2 / 48 + w_10 * w_2 * w_6 * w_7 / 16 + w_10 * w_2 * w_6 * w_8 / 16 + w_10 * w_2 * w_6 * w_9 / 16 + w_10 * w_2 * w_7 ** 2 / 48 + w_10 * w_2 * w_7 * w_8 / 16 + w_10 * w_2 * w_7 * w_9 / 16 + w_10 * w_2 * w_8 ** 2 / 48 + w_10 * w_2 * w_8 * w_9 / 16 + w_10 * w_2 * w_9 ** 2 / 48 + w_10 * w_3 ** 2 * w_4 / 48 + w_10 * w_3 ** 2 * w_5 / 48 + w_10 * w_3 ** 2 * w_6 / 48 + w_10 * w_3 ** 2 * w_7 / 48 + w_10 * w_3 ** 2 * w_8 / 48 + w_10 * w_3 ** 2 * w_9 / 48 + w_10 * w_3 * w_4 ** 2 / 48 + w_10 * w_3 * w_4 * w_5 / 16 + w_10 * w_3 * w_4 * w_6 / 16 + w_10 * w_3 * w_4 * w_7 / 16 + w_10 * w_3 * w_4 * w_8 / 16 + w_10 * w_3 * w_4 * w_9 / 16 + w_10 * w_3 * w_5 ** 2 / 48 + w_10 * w_3 * w_5 * w_6 / 16 + w_10 * w_3 * w_5 * w_7 / 16 + w_10 * w_3 * w_5 * w_8 / 16 + w_10 * w_3 * w_5 * w_9 / 16 + w_10 * w_3 * w_6 ** 2 / 48 + w_10 * w_3 * w_6 * w_7 / 16 + w_10 * w_3 * w_6 * w_8 / 16 + w_10 * w_3 * w_6 * w_9 / 16 + w_10 * w_3 * w_7 ** 2 / 48 + w_10 * w_3 * w_7 * w_8 / 16 + w_10 * w_3 * w_7 * w_9 / 16 + w_10 * w_3 * w_8 ** 2 / 48 + w_10 * w_3 * w_8 * w_9 / 16 + w_10 * w_3 * w_9 ** 2 / 48 + w_10 * w_4 ** 2 * w_5 / 48 + w_10 * w_4 ** 2 * w_6 / 48 + w_10 * w_4 ** 2 * w_7 / 48 + w_10 * w_4 ** 2 * w_8 / 48 + w_10 * w_4 ** 2 * w_9 / 48 + w_10 * w_4 * w_5 ** 2 / 48 + w_10 * w_4 * w_5 * w_6 / 16 + w_10 * w_4 * w_5 * w_7 / 16 + w_10 * w_4 * w_5 * w_8 / 16 + w_10 * w_4 * w_5 * w_9 / 16 + w_10 * w_4 * w_6 ** 2 / 48 + w_10 * w_4 * w_6 * w_7 / 16 + w_10 * w_4 * w_6 * w_8 / 16 + w_10 * w_4 * w_6 * w_9 / 16 + w_10 * w_4 * w_7 ** 2 / 48 + w_10 * w_4 * w_7 * w_8 / 16 + w_10 * w_4 * w_7 * w_9 / 16 + w_10 * w_4 * w_8 ** 2 / 48 + w_10 * w_4 * w_8 * w_9 / 16 + w_10 * w_4 * w_9 ** 2 / 48 + w_10 * w_5 ** 2 * w_6 / 48 + w_10 * w_5 ** 2 * w_7 / 48 + w_10 * w_5 ** 2 * w_8 / 48 + w_10 * w_5 ** 2 * w_9 / 48 + w_10 * w_5 * w_6 ** 2 / 48 + w_10 * w_5 * w_6 * w_7 / 16 + w_10 * w_5 * w_6 * w_8 / 16 + w_10 * w_5 * w_6 * w_9 / 16 + w_10 * w_5 * w_7 ** 2 / 48 + w_10 * w_5 * w_7 * w_8 / 16 + w_10 * w_5 * w_7 * w_9 / 16 + w_10 * w_5 * w_8 ** 2 / 48 + w_10 * w_5 * w_8 * w_9 / 16 + w_10 * w_5 * w_9 ** 2 / 48 + w_10 * w_6 ** 2 * w_7 / 48 + w_10 * w_6 ** 2 * w_8 / 48 + w_10 * w_6 ** 2 * w_9 / 48 + w_10 * w_6 * w_7 ** 2 / 48 + w_10 * w_6 * w_7 * w_8 / 16 + w_10 * w_6 * w_7 * w_9 / 16 + w_10 * w_6 * w_8 ** 2 / 48 + w_10 * w_6 * w_8 * w_9 / 16 + w_10 * w_6 * w_9 ** 2 / 48 + w_10 * w_7 ** 2 * w_8 / 48 + w_10 * w_7 ** 2 * w_9 / 48 + w_10 * w_7 * w_8 ** 2 / 48 + w_10 * w_7 * w_8 * w_9 / 16 + w_10 * w_7 * w_9 ** 2 / 48 + w_10 * w_8 ** 2 * w_9 / 48 + w_10 * w_8 * w_9 ** 2 / 48 - w_11 ** 4 / 720 + w_11 ** 2 * w_2 ** 2 / 144 + w_11 ** 2 * w_2 * w_3 / 48 + w_11 ** 2 * w_2 * w_4 / 48 + w_11 ** 2 * w_2 * w_5 / 48 + w_11 ** 2 * w_2 * w_6 / 48 + w_11 ** 2 * w_2 * w_7 / 48 + w_11 ** 2 * w_2 * w_8 / 48 + w_11 ** 2 * w_2 * w_9 / 48 + w_11 ** 2 * w_3 ** 2 / 144 + w_11 ** 2 * w_3 * w_4 / 48 + w_11 ** 2 * w_3 * w_5 / 48 + w_11 ** 2 * w_3 * w_6 / 48 + w_11 ** 2 * w_3 * w_7 / 48 + w_11 ** 2 * w_3 * w_8 / 48 + w_11 ** 2 * w_3 * w_9 / 48 + w_11 ** 2 * w_4 ** 2 / 144 + w_11 ** 2 * w_4 * w_5 / 48 + w_11 ** 2 * w_4 * w_6 / 48 + w_11 ** 2 * w_4 * w_7 / 48 + w_11 ** 2 * w_4 * w_8 / 48 + w_11 ** 2 * w_4 * w_9 / 48 + w_11 ** 2 * w_5 ** 2 / 144 + w_11 ** 2 * w_5 * w_6 / 48 + w_11 ** 2 * w_5 * w_7 / 48 + w_11 ** 2 * w_5 * w_8 / 48 + w_11 ** 2 * w_5 * w_9 / 48 + w_11 ** 2 * w_6 ** 2 / 144 + w_11 ** 2 * w_6 * w_7 / 48 + w_11 ** 2 * w_6 * w_8 / 48 + w_11 ** 2 * w_6 * w_9 / 48 + w_11 ** 2 * w_7 ** 2 / 144 + w_11 ** 2 * w_7 * w_8 / 48 + w_11 ** 2 * w_7 * w_9 / 48 + w_11 ** 2 * w_8 ** 2 / 144 + w_11 ** 2 * w_8 * w_9 / 48 + w_11 ** 2 * w_9 ** 2 / 144 + w_11 * w_2 ** 2 * w_3 / 48 + w_11 * w_2 ** 2 * w_4 / 48 + w_11 * w_2 ** 2 * w_5 / 48 + w_11 * w_2 ** 2 * w_6 / 48 + w_11 * w_2 ** 2 * w_7 / 48 + w_11 * w_2 ** 2 * w_8 / 48 + w_11 * w_2 ** 2 * w_9 / 48 + w_11 * w_2 * w_3 ** 2 / 48 + w_11 * w_2 * w_3 * w_4 / 16 + w_11 * w_2 * w_3 * w_5 / 16 + w_11 * w_2 * w_3 * w_6 / 16 + w_11 * w_2 * w_3 * w_7 / 16 + w_11 * w_2 * w_3 * w_8 / 16 + w_11 * w_2 * w_3 * w_9 / 16 + w_11 * w_2 * w_4 ** 2 / 48 + w_11 * w_2 * w_4 * w_5 / 16 + w_11 * w_2 * w_4 * w_6 / 16 + w_11 * w_2 * w_4 * w_7 / 16 + w_11 * w_2 * w_4 * w_8 / 16 + w_11 * w_2 * w_4 * w_9 / 16 + w_11 * w_2 * w_5 ** 2 / 48 + w_11 * w_2 * w_5 * w_6 / 16 + w_11 * w_2 * w_5 * w_7 / 16 + w_11 * w_2 * w_5 * w_8 / 16 + w_11 * w_2 * w_5 * w_9 / 16 + w_11 * w_2 * w_6 ** 2 / 48 + w_11 * w_2 * w_6 * w_7 / 16 + w_11 * w_2 * w_6 * w_8 / 16 + w_11 * w_2 * w_6 * w_9 / 16 + w_11 * w_2 * w_7 ** 2 / 48 + w_11 * w_2 * w_7 * w_8 / 16 + w_11 * w_2 * w_7 * w_9 / 16 + w_11 * w_2 * w_8 ** 2 / 48 + w_11 * w_2 * w_8 * w_9 / 16 + w_11 * w_2 * w_9 ** 2 / 48 + w_11 * w_3 ** 2 * w_4 / 48 + w_11 * w_3 ** 2 * w_5 / 48 + w_11 * w_3 ** 2 * w_6 / 48 + w_11 * w_3 ** 2 * w_7 / 48 + w_11 * w_3 ** 2 * w_8 / 48 + w_11 * w_3 ** 2 * w_9 / 48 + w_11 * w_3 * w_4 ** 2 / 48 + w_11 * w_3 * w_4 * w_5 / 16 + w_11 * w_3 * w_4 * w_6 / 16 + w_11 * w_3 * w_4 * w_7 / 16 + w_11 * w_3 * w_4 * w_8 / 16 + w_11 * w_3 * w_4 * w_9 / 16 + w_11 * w_3 * w_5 ** 2 / 48 + w_11 * w_3 * w_5 * w_6 / 16 + w_11 * w_3 * w_5 * w_7 / 16 + w_11 * w_3 * w_5 * w_8 / 16 + w_11 * w_3 * w_5 * w_9 / 16 + w_11 * w_3 * w_6 ** 2 / 48 + w_11 * w_3 * w_6 * w_7 / 16 + w_11 * w_3 * w_6 * w_8 / 16 + w_11 * w_3 * w_6 * w_9 / 16 + w_11 * w_3 * w_7 ** 2 / 48 + w_11 * w_3 * w_7 * w_8 / 16 + w_11 * w_3 * w_7 * w_9 / 16 + w_11 * w_3 * w_8 ** 2 / 48 + w_11 * w_3 * w_8 * w_9 / 16 + w_11 * w_3 * w_9 ** 2 / 48 + w_11 * w_4 ** 2 * w_5 / 48 + w_11 * w_4 ** 2 * w_6 / 48 + w_11 * w_4 ** 2 * w_7 / 48 + w_11 * w_4 ** 2 * w_8 / 48 + w_11 * w_4 ** 2 * w_9 / 48 + w_11 * w_4 * w_5 ** 2 / 48 + w_11 * w_4 * w_5 * w_6 / 16 + w_11 * w_4 * w_5 * w_7 / 16 + w_11 * w_4 * w_5 * w_8 / 16 + w_11 * w_4 * w_5 * w_9 / 16 + w_11 * w_4 * w_6 ** 2 / 48 + w_11 * w_4 * w_6 * w_7 / 16 + w_11 * w_4 * w_6 * w_8 / 16 + w_11 * w_4 * w_6 * w_9 / 16 + w_11 * w_4 * w_7 ** 2 / 48 + w_11 * w_4 * w_7 * w_8 / 16 + w_11 * w_4 * w_7 * w_9 / 16 + w_11 * w_4 * w_8 ** 2 / 48 + w_11 * w_4 * w_8 * w_9 / 16 + w_11 * w_4 * w_9 ** 2 / 48 + w_11 * w_5 ** 2 * w_6 / 48 + w_11 * w_5 ** 2 * w_7 / 48 + w_11 * w_5 ** 2 * w_8 / 48 + w_11 * w_5 ** 2 * w_9 / 48 + w_11 * w_5 * w_6 ** 2 / 48 + w_11 * w_5 * w_6 * w_7 / 16 + w_11 * w_5 * w_6 * w_8 / 16 + w_11 * w_5 * w_6 * w_9 / 16 + w_11 * w_5 * w_7 ** 2 / 48 + w_11 * w_5 * w_7 * w_8 / 16 + w_11 * w_5 * w_7 * w_9 / 16 + w_11 * w_5 * w_8 ** 2 / 48 + w_11 * w_5 * w_8 * w_9 / 16 + w_11 * w_5 * w_9 ** 2 / 48 + w_11 * w_6 ** 2 * w_7 / 48 + w_11 * w_6 ** 2 * w_8 / 48 + w_11 * w_6 ** 2 * w_9 / 48 + w_11 * w_6 * w_7 ** 2 / 48 + w_11 * w_6 * w_7 * w_8 / 16 + w_11 * w_6 * w_7 * w_9 / 16 + w_11 * w_6 * w_8 ** 2 / 48 + w_11 * w_6 * w_8 * w_9 / 16 + w_11 * w_6 * w_9 ** 2 / 48 + w_11 * w_7 ** 2 * w_8 / 48 + w_11 * w_7 ** 2 * w_9 / 48 + w_11 * w_7 * w_8 ** 2 / 48 + w_11 * w_7 * w_8 * w_9 / 16 + w_11 * w_7 * w_9 ** 2 / 48 + w_11 * w_8 ** 2 * w_9 / 48 + w_11 * w_8 * w_9 ** 2 / 48 - w_2 ** 4 / 720 + w_2 ** 2 * w_3 ** 2 / 144 + w_2 ** 2 * w_3 * w_4 / 48 + w_2 ** 2 * w_3 * w_5 / 48 + w_2 ** 2 * w_3 * w_6 / 48 + w_2 ** 2 * w_3 * w_7 / 48 + w_2 ** 2 * w_3 * w_8 / 48 + w_2 ** 2 * w_3 * w_9 / 48 + w_2 ** 2 * w_4 ** 2 / 144 + w_2 ** 2 * w_4 * w_5 / 48 + w_2 ** 2 * w_4 * w_6 / 48 + w_2 ** 2 * w_4 * w_7 / 48 + w_2 ** 2 * w_4 * w_8 / 48 + w_2 ** 2 * w_4 * w_9 / 48 + w_2 ** 2 * w_5 ** 2 / 144 + w_2 ** 2 * w_5 * w_6 / 48 + w_2 ** 2 * w_5 * w_7 / 48 + w_2 ** 2 * w_5 * w_8 / 48 + w_2 ** 2 * w_5 * w_9 / 48 + w_2 ** 2 * w_6 ** 2 / 144 + w_2 ** 2 * w_6 * w_7 / 48 + w_2 ** 2 * w_6 * w_8 / 48 + w_2 ** 2 * w_6 * w_9 / 48 + w_2 ** 2 * w_7 ** 2 / 144 + w_2 ** 2 * w_7 * w_8 / 48 + w_2 ** 2 * w_7 * w_9 / 48 + w_2 ** 2 * w_8 ** 2 / 144 + w_2 ** 2 * w_8 * w_9 / 48 + w_2 ** 2 * w_9 ** 2 / 144 + w_2 * w_3 ** 2 * w_4 / 48 + w_2 * w_3 ** 2 * w_5 / 48 + w_2 * w_3 ** 2 * w_6 / 48 + w_2 * w_3 ** 2 * w_7 / 48 + w_2 * w_3 ** 2 * w_8 / 48 + w_2 * w_3 ** 2 * w_9 / 48 + w_2 * w_3 * w_4 ** 2 / 48 + w_2 * w_3 * w_4 * w_5 / 16 + w_2 * w_3 * w_4 * w_6 / 16 + w_2 * w_3 * w_4 * w_7 / 16 + w_2 * w_3 * w_4 * w_8 / 16 + w_2 * w_3 * w_4 * w_9 / 16 + w_2 * w_3 * w_5 ** 2 / 48 + w_2 * w_3 * w_5 * w_6 / 16 + w_2 * w_3 * w_5 * w_7 / 16 + w_2 * w_3 * w_5 * w_8 / 16 + w_2 * w_3 * w_5 * w_9 / 16 + w_2 * w_3 * w_6 ** 2 / 48 + w_2 * w_3 * w_6 * w_7 / 16 + w_2 * w_3 * w_6 * w_8 / 16 + w_2 * w_3 * w_6 * w_9 / 16 + w_2 * w_3 * w_7 ** 2 / 48 + w_2 * w_3 * w_7 * w_8 / 16 + w_2 * w_3 * w_7 * w_9 / 16 + w_2 * w_3 * w_8 ** 2 / 48 + w_2 * w_3 * w_8 * w_9 / 16 + w_2 * w_3 * w_9 ** 2 / 48 + w_2 * w_4 ** 2 * w_5 / 48 + w_2 * w_4 ** 2 * w_6 / 48 + w_2 * w_4 ** 2 * w_7 / 48 + w_2 * w_4 ** 2 * w_8 / 48 + w_2 * w_4 ** 2 * w_9 / 48 + w_2 * w_4 * w_5 ** 2 / 48 + w_2 * w_4 * w_5 * w_6 / 16 + w_2 * w_4 * w_5 * w_7 / 16 + w_2 * w_4 * w_5 * w_8 / 16 + w_2 * w_4 * w_5 * w_9 / 16 + w_2 * w_4 * w_6 ** 2 / 48 + w_2 * w_4 * w_6 * w_7 / 16 + w_2 * w_4 * w_6 * w_8 / 16 + w_2 * w_4 * w_6 * w_9 / 16 + w_2 * w_4 * w_7 ** 2 / 48 + w_2 * w_4 * w_7 * w_8 / 16 + w_2 * w_4 * w_7 * w_9 / 16 + w_2 * w_4 * w_8 ** 2 / 48 + w_2 * w_4 * w_8 * w_9 / 16 + w_2 * w_4 * w_9 ** 2 / 48 + w_2 * w_5 ** 2 * w_6 / 48 + w_2 * w_5 ** 2 * w_7 / 48 + w_2 * w_5 ** 2 * w_8 / 48 + w_2 * w_5 ** 2 * w_9 / 48 + w_2 * w_5 * w_6 ** 2 / 48 + w_2 * w_5 * w_6 * w_7 / 16 + w_2 * w_5 * w_6 * w_8 / 16 + w_2 * w_5 * w_6 * w_9 / 16 + w_2 * w_5 * w_7 ** 2 / 48 + w_2 * w_5 * w_7 * w_8 / 16 + w_2 * w_5 * w_7 * w_9 / 16 + w_2 * w_5 * w_8 ** 2 / 48 + w_2 * w_5 * w_8 * w_9 / 16 + w_2 * w_5 * w_9 ** 2 / 48 + w_2 * w_6 ** 2 * w_7 / 48 + w_2 * w_6 ** 2 * w_8 / 48 + w_2 * w_6 ** 2 * w_9 / 48 + w_2 * w_6 * w_7 ** 2 / 48 + w_2 * w_6 * w_7 * w_8 / 16 + w_2 * w_6 * w_7 * w_9 / 16 + w_2 * w_6 * w_8 ** 2 / 48 + w_2 * w_6 * w_8 * w_9 / 16 + w_2 * w_6 * w_9 ** 2 / 48 + w_2 * w_7 ** 2 * w_8 / 48 + w_2 * w_7 ** 2 * w_9 / 48 + w_2 * w_7 * w_8 ** 2 / 48 + w_2 * w_7 * w_8 * w_9 / 16 + w_2 * w_7 * w_9 ** 2 / 48 + w_2 * w_8 ** 2 * w_9 / 48 + w_2 * w_8 * w_9 ** 2 / 48 - w_3 ** 4 / 720 + w_3 ** 2 * w_4 ** 2 / 144 + w_3 ** 2 * w_4 * w_5 / 48 + w_3 ** 2 * w_4 * w_6 / 48 + w_3 ** 2 * w_4 * w_7 / 48 + w_3 ** 2 * w_4 * w_8 / 48 + w_3 ** 2 * w_4 * w_9 / 48 + w_3 ** 2 * w_5 ** 2 / 144 + w_3 ** 2 * w_5 * w_6 / 48 + w_3 ** 2 * w_5 * w_7 / 48 + w_3 ** 2 * w_5 * w_8 / 48 + w_3 ** 2 * w_5 * w_9 / 48 + w_3 ** 2 * w_6 ** 2 / 144 + w_3 ** 2 * w_6 * w_7 / 48 + w_3 ** 2 * w_6 * w_8 / 48 + w_3 ** 2 * w_6 * w_9 / 48 + w_3 ** 2 * w_7 ** 2 / 144 + w_3 ** 2 * w_7 * w_8 / 48 + w_3 ** 2 * w_7 * w_9 / 48 + w_3 ** 2 * w_8 ** 2 / 144 + w_3 ** 2 * w_8 * w_9 / 48 + w_3 ** 2 * w_9 ** 2 / 144 + w_3 * w_4 ** 2 * w_5 / 48 + w_3 * w_4 ** 2 * w_6 / 48 + w_3 * w_4 ** 2 * w_7 / 48 + w_3 * w_4 ** 2 * w_8 / 48 + w_3 * w_4 ** 2 * w_9 / 48 + w_3 * w_4 * w_5 ** 2 / 48 + w_3 * w_4 * w_5 * w_6 / 16 + w_3 * w_4 * w_5 * w_7 / 16 + w_3 * w_4 * w_5 * w_8 / 16 + w_3 * w_4 * w_5 * w_9 / 16 + w_3 * w_4 * w_6 ** 2 / 48 + w_3 * w_4 * w_6 * w_7 / 16 + w_3 * w_4 * w_6 * w_8 / 16 + w_3 * w_4 * w_6 * w_9 / 16 + w_3 * w_4 * w_7 ** 2 / 48 + w_3 * w_4 * w_7 * w_8 / 16 + w_3 * w_4 * w_7 * w_9 / 16 + w_3 * w_4 * w_8 ** 2 / 48 + w_3 * w_4 * w_8 * w_9 / 16 + w_3 * w_4 * w_9 ** 2 / 48 + w_3 * w_5 ** 2 * w_6 / 48 + w_3 * w_5 ** 2 * w_7 / 48 + w_3 * w_5 ** 2 * w_8 / 48 + w_3 * w_5 ** 2 * w_9 / 48 + w_3 * w_5 * w_6 ** 2 / 48 + w_3 * w_5 * w_6 * w_7 / 16 + w_3 * w_5 * w_6 * w_8 / 16 + w_3 * w_5 * w_6 * w_9 / 16 + w_3 * w_5 * w_7 ** 2 / 48 + w_3 * w_5 * w_7 * w_8 / 16 + w_3 * w_5 * w_7 * w_9 / 16 + w_3 * w_5 * w_8 ** 2 / 48 + w_3 * w_5 * w_8 * w_9 / 16 + w_3 * w_5 * w_9 ** 2 / 48 + w_3 * w_6 ** 2 * w_7 / 48 + w_3 * w_6 ** 2 * w_8 / 48 + w_3 * w_6 ** 2 * w_9 / 48 + w_3 * w_6 * w_7 ** 2 / 48 + w_3 * w_6 * w_7 * w_8 / 16 + w_3 * w_6 * w_7 * w_9 / 16 + w_3 * w_6 * w_8 ** 2 / 48 + w_3 * w_6 * w_8 * w_9 / 16 + w_3 * w_6 * w_9 ** 2 / 48 + w_3 * w_7 ** 2 * w_8 / 48 + w_3 * w_7 ** 2 * w_9 / 48 + w_3 * w_7 * w_8 ** 2 / 48 + w_3 * w_7 * w_8 * w_9 / 16 + w_3 * w_7 * w_9 ** 2 / 48 + w_3 * w_8 ** 2 * w_9 / 48 + w_3 * w_8 * w_9 ** 2 / 48 - w_4 ** 4 / 720 + w_4 ** 2 * w_5 ** 2 / 144 + w_4 ** 2 * w_5 * w_6 / 48 + w_4 ** 2 * w_5 * w_7 / 48 + w_4 ** 2 * w_5 * w_8 / 48 + w_4 ** 2 * w_5 * w_9 / 48 + w_4 ** 2 * w_6 ** 2 / 144 + w_4 ** 2 * w_6 * w_7 / 48 + w_4 ** 2 * w_6 * w_8 / 48 + w_4 ** 2 * w_6 * w_9 / 48 + w_4 ** 2 * w_7 ** 2 / 144 + w_4 ** 2 * w_7 * w_8 / 48 + w_4 ** 2 * w_7 * w_9 / 48 + w_4 ** 2 * w_8 ** 2 / 144 + w_4 ** 2 * w_8 * w_9 / 48 + w_4 ** 2 * w_9 ** 2 / 144 + w_4 * w_5 ** 2 * w_6 / 48 + w_4 * w_5 ** 2 * w_7 / 48 + w_4 * w_5 ** 2 * w_8 / 48 + w_4 * w_5 ** 2 * w_9 / 48 + w_4 * w_5 * w_6 ** 2 / 48 + w_4 * w_5 * w_6 * w_7 / 16 + w_4 * w_5 * w_6 * w_8 / 16 + w_4 * w_5 * w_6 * w_9 / 16 + w_4 * w_5 * w_7 ** 2 / 48 + w_4 * w_5 * w_7 * w_8 / 16 + w_4 * w_5 * w_7 * w_9 / 16 + w_4 * w_5 * w_8 ** 2 / 48 + w_4 * w_5 * w_8 * w_9 / 16 + w_4 * w_5 * w_9 ** 2 / 48 + w_4 * w_6 ** 2 * w_7 / 48 + w_4 * w_6 ** 2 * w_8 / 48 + w_4 * w_6 ** 2 * w_9 / 48 + w_4 * w_6 * w_7 ** 2 / 48 + w_4 * w_6 * w_7 * w_8 / 16 + w_4 * w_6 * w_7 * w_9 / 16 + w_4 * w_6 * w_8 ** 2 / 48 + w_4 * w_6 * w_8 * w_9 / 16 + w_4 * w_6 * w_9 ** 2 / 48 + w_4 * w_7 ** 2 * w_8 / 48 + w_4 * w_7 ** 2 * w_9 / 48 + w_4 * w_7 * w_8 ** 2 / 48 + w_4 * w_7 * w_8 * w_9 / 16 + w_4 * w_7 * w_9 ** 2 / 48 + w_4 * w_8 ** 2 * w_9 / 48 + w_4 * w_8 * w_9 ** 2 / 48 - w_5 ** 4 / 720 + w_5 ** 2 * w_6 ** 2 / 144 + w_5 ** 2 * w_6 * w_7 / 48 + w_5 ** 2 * w_6 * w_8 / 48 + w_5 ** 2 * w_6 * w_9 / 48 + w_5 ** 2 * w_7 ** 2 / 144 + w_5 ** 2 * w_7 * w_8 / 48 + w_5 ** 2 * w_7 * w_9 / 48 + w_5 ** 2 * w_8 ** 2 / 144 + w_5 ** 2 * w_8 * w_9 / 48 + w_5 ** 2 * w_9 ** 2 / 144 + w_5 * w_6 ** 2 * w_7 / 48 + w_5 * w_6 ** 2 * w_8 / 48 + w_5 * w_6 ** 2 * w_9 / 48 + w_5 * w_6 * w_7 ** 2 / 48 + w_5 * w_6 * w_7 * w_8 / 16 + w_5 * w_6 * w_7 * w_9 / 16 + w_5 * w_6 * w_8 ** 2 / 48 + w_5 * w_6 * w_8 * w_9 / 16 + w_5 * w_6 * w_9 ** 2 / 48 + w_5 * w_7 ** 2 * w_8 / 48 + w_5 * w_7 ** 2 * w_9 / 48 + w_5 * w_7 * w_8 ** 2 / 48 + w_5 * w_7 * w_8 * w_9 / 16 + w_5 * w_7 * w_9 ** 2 / 48 + w_5 * w_8 ** 2 * w_9 / 48 + w_5 * w_8 * w_9 ** 2 / 48 - w_6 ** 4 / 720 + w_6 ** 2 * w_7 ** 2 / 144 + w_6 ** 2 * w_7 * w_8 / 48 + w_6 ** 2 * w_7 * w_9 / 48 + w_6 ** 2 * w_8 ** 2 / 144 + w_6 ** 2 * w_8 * w_9 / 48 + w_6 ** 2 * w_9 ** 2 / 144 + w_6 * w_7 ** 2 * w_8 / 48 + w_6 * w_7 ** 2 * w_9 / 48 + w_6 * w_7 * w_8 ** 2 / 48 + w_6 * w_7 * w_8 * w_9 / 16 + w_6 * w_7 * w_9 ** 2 / 48 + w_6 * w_8 ** 2 * w_9 / 48 + w_6 * w_8 * w_9 ** 2 / 48 - w_7 ** 4 / 720 + w_7 ** 2 * w_8 ** 2 / 144 + w_7 ** 2 * w_8 * w_9 / 48 + w_7 ** 2 * w_9 ** 2 / 144 + w_7 * w_8 ** 2 * w_9 / 48 + w_7 * w_8 * w_9 ** 2 / 48 - w_8 ** 4 / 720 + w_8 ** 2 * w_9 ** 2 / 144 - w_9 ** 4 / 720
-    if s == 5 and ln == 10:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        w_10 = sym.Symbol("w_10")
-        return -w_1 ** 4 * w_10 / 1440 - w_1 ** 4 * w_2 / 1440 - w_1 ** 4 * w_3 / 1440 - w_1 ** 4 * w_4 / 1440 - w_1 ** 4 * w_5 / 1440 - w_1 ** 4 * w_6 / 1440 - w_1 ** 4 * w_7 / 1440 - w_1 ** 4 * w_8 / 1440 - w_1 ** 4 * w_9 / 1440 + w_1 ** 2 * w_10 ** 2 * w_2 / 288 + w_1 ** 2 * w_10 ** 2 * w_3 / 288 + w_1 ** 2 * w_10 ** 2 * w_4 / 288 + w_1 ** 2 * w_10 ** 2 * w_5 / 288 + w_1 ** 2 * w_10 ** 2 * w_6 / 288 + w_1 ** 2 * w_10 ** 2 * w_7 / 288 + w_1 ** 2 * w_10 ** 2 * w_8 / 288 + w_1 ** 2 * w_10 ** 2 * w_9 / 288 + w_1 ** 2 * w_10 * w_2 ** 2 / 288 + w_1 ** 2 * w_10 * w_2 * w_3 / 96 + w_1 ** 2 * w_10 * w_2 * w_4 / 96 + w_1 ** 2 * w_10 * w_2 * w_5 / 96 + w_1 ** 2 * w_10 * w_2 * w_6 / 96 + w_1 ** 2 * w_10 * w_2 * w_7 / 96 + w_1 ** 2 * w_10 * w_2 * w_8 / 96 + w_1 ** 2 * w_10 * w_2 * w_9 / 96 + w_1 ** 2 * w_10 * w_3 ** 2 / 288 + w_1 ** 2 * w_10 * w_3 * w_4 / 96 + w_1 ** 2 * w_10 * w_3 * w_5 / 96 + w_1 ** 2 * w_10 * w_3 * w_6 / 96 + w_1 ** 2 * w_10 * w_3 * w_7 / 96 + w_1 ** 2 * w_10 * w_3 * w_8 / 96 + w_1 ** 2 * w_10 * w_3 * w_9 / 96 + w_1 ** 2 * w_10 * w_4 ** 2 / 288 + w_1 ** 2 * w_10 * w_4 * w_5 / 96 + w_1 ** 2 * w_10 * w_4 * w_6 / 96 + w_1 ** 2 * w_10 * w_4 * w_7 / 96 + w_1 ** 2 * w_10 * w_4 * w_8 / 96 + w_1 ** 2 * w_10 * w_4 * w_9 / 96 + w_1 ** 2 * w_10 * w_5 ** 2 / 288 + w_1 ** 2 * w_10 * w_5 * w_6 / 96 + w_1 ** 2 * w_10 * w_5 * w_7 / 96 + w_1 ** 2 * w_10 * w_5 * w_8 / 96 + w_1 ** 2 * w_10 * w_5 * w_9 / 96 + w_1 ** 2 * w_10 * w_6 ** 2 / 288 + w_1 ** 2 * w_10 * w_6 * w_7 / 96 + w_1 ** 2 * w_10 * w_6 * w_8 / 96 + w_1 ** 2 * w_10 * w_6 * w_9 / 96 + w_1 ** 2 * w_10 * w_7 ** 2 / 288 + w_1 ** 2 * w_10 * w_7 * w_8 / 96 + w_1 ** 2 * w_10 * w_7 * w_9 / 96 + w_1 ** 2 * w_10 * w_8 ** 2 / 288 + w_1 ** 2 * w_10 * w_8 * w_9 / 96 + w_1 ** 2 * w_10 * w_9 ** 2 / 288 + w_1 ** 2 * w_2 ** 2 * w_3 / 288 + w_1 ** 2 * w_2 ** 2 * w_4 / 288 + w_1 ** 2 * w_2 ** 2 * w_5 / 288 + w_1 ** 2 * w_2 ** 2 * w_6 / 288 + w_1 ** 2 * w_2 ** 2 * w_7 / 288 + w_1 ** 2 * w_2 ** 2 * w_8 / 288 + w_1 ** 2 * w_2 ** 2 * w_9 / 288 + w_1 ** 2 * w_2 * w_3 ** 2 / 288 + w_1 ** 2 * w_2 * w_3 * w_4 / 96 + w_1 ** 2 * w_2 * w_3 * w_5 / 96 + w_1 ** 2 * w_2 * w_3 * w_6 / 96 + w_1 ** 2 * w_2 * w_3 * w_7 / 96 + w_1 ** 2 * w_2 * w_3 * w_8 / 96 + w_1 ** 2 * w_2 * w_3 * w_9 / 96 + w_1 ** 2 * w_2 * w_4 ** 2 / 288 + w_1 ** 2 * w_2 * w_4 * w_5 / 96 + w_1 ** 2 * w_2 * w_4 * w_6 / 96 + w_1 ** 2 * w_2 * w_4 * w_7 / 96 + w_1 ** 2 * w_2 * w_4 * w_8 / 96 + w_1 ** 2 * w_2 * w_4 * w_9 / 96 + w_1 ** 2 * w_2 * w_5 ** 2 / 288 + w_1 ** 2 * w_2 * w_5 * w_6 / 96 + w_1 ** 2 * w_2 * w_5 * w_7 / 96 + w_1 ** 2 * w_2 * w_5 * w_8 / 96 + w_1 ** 2 * w_2 * w_5 * w_9 / 96 + w_1 ** 2 * w_2 * w_6 ** 2 / 288 + w_1 ** 2 * w_2 * w_6 * w_7 / 96 + w_1 ** 2 * w_2 * w_6 * w_8 / 96 + w_1 ** 2 * w_2 * w_6 * w_9 / 96 + w_1 ** 2 * w_2 * w_7 ** 2 / 288 + w_1 ** 2 * w_2 * w_7 * w_8 / 96 + w_1 ** 2 * w_2 * w_7 * w_9 / 96 + w_1 ** 2 * w_2 * w_8 ** 2 / 288 + w_1 ** 2 * w_2 * w_8 * w_9 / 96 + w_1 ** 2 * w_2 * w_9 ** 2 / 288 + w_1 ** 2 * w_3 ** 2 * w_4 / 288 + w_1 ** 2 * w_3 ** 2 * w_5 / 288 + w_1 ** 2 * w_3 ** 2 * w_6 / 288 + w_1 ** 2 * w_3 ** 2 * w_7 / 288 + w_1 ** 2 * w_3 ** 2 * w_8 / 288 + w_1 ** 2 * w_3 ** 2 * w_9 / 288 + w_1 ** 2 * w_3 * w_4 ** 2 / 288 + w_1 ** 2 * w_3 * w_4 * w_5 / 96 + w_1 ** 2 * w_3 * w_4 * w_6 / 96 + w_1 ** 2 * w_3 * w_4 * w_7 / 96 + w_1 ** 2 * w_3 * w_4 * w_8 / 96 + w_1 ** 2 * w_3 * w_4 * w_9 / 96 + w_1 ** 2 * w_3 * w_5 ** 2 / 288 + w_1 ** 2 * w_3 * w_5 * w_6 / 96 + w_1 ** 2 * w_3 * w_5 * w_7 / 96 + w_1 ** 2 * w_3 * w_5 * w_8 / 96 + w_1 ** 2 * w_3 * w_5 * w_9 / 96 + w_1 ** 2 * w_3 * w_6 ** 2 / 288 + w_1 ** 2 * w_3 * w_6 * w_7 / 96 + w_1 ** 2 * w_3 * w_6 * w_8 / 96 + w_1 ** 2 * w_3 * w_6 * w_9 / 96 + w_1 ** 2 * w_3 * w_7 ** 2 / 288 + w_1 ** 2 * w_3 * w_7 * w_8 / 96 + w_1 ** 2 * w_3 * w_7 * w_9 / 96 + w_1 ** 2 * w_3 * w_8 ** 2 / 288 + w_1 ** 2 * w_3 * w_8 * w_9 / 96 + w_1 ** 2 * w_3 * w_9 ** 2 / 288 + w_1 ** 2 * w_4 ** 2 * w_5 / 288 + w_1 ** 2 * w_4 ** 2 * w_6 / 288 + w_1 ** 2 * w_4 ** 2 * w_7 / 288 + w_1 ** 2 * w_4 ** 2 * w_8 / 288 + w_1 ** 2 * w_4 ** 2 * w_9 / 288 + w_1 ** 2 * w_4 * w_5 ** 2 / 288 + w_1 ** 2 * w_4 * w_5 * w_6 / 96 + w_1 ** 2 * w_4 * w_5 * w_7 / 96 + w_1 ** 2 * w_4 * w_5 * w_8 / 96 + w_1 ** 2 * w_4 * w_5 * w_9 / 96 + w_1 ** 2 * w_4 * w_6 ** 2 / 288 + w_1 ** 2 * w_4 * w_6 * w_7 / 96 + w_1 ** 2 * w_4 * w_6 * w_8 / 96 + w_1 ** 2 * w_4 * w_6 * w_9 / 96 + w_1 ** 2 * w_4 * w_7 ** 2 / 288 + w_1 ** 2 * w_4 * w_7 * w_8 / 96 + w_1 ** 2 * w_4 * w_7 * w_9 / 96 + w_1 ** 2 * w_4 * w_8 ** 2 / 288 + w_1 ** 2 * w_4 * w_8 * w_9 / 96 + w_1 ** 2 * w_4 * w_9 ** 2 / 288 + w_1 ** 2 * w_5 ** 2 * w_6 / 288 + w_1 ** 2 * w_5 ** 2 * w_7 / 288 + w_1 ** 2 * w_5 ** 2 * w_8 / 288 + w_1 ** 2 * w_5 ** 2 * w_9 / 288 + w_1 ** 2 * w_5 * w_6 ** 2 / 288 + w_1 ** 2 * w_5 * w_6 * w_7 / 96 + w_1 ** 2 * w_5 * w_6 * w_8 / 96 + w_1 ** 2 * w_5 * w_6 * w_9 / 96 + w_1 ** 2 * w_5 * w_7 ** 2 / 288 + w_1 ** 2 * w_5 * w_7 * w_8 / 96 + w_1 ** 2 * w_5 * w_7 * w_9 / 96 + w_1 ** 2 * w_5 * w_8 ** 2 / 288 + w_1 ** 2 * w_5 * w_8 * w_9 / 96 + w_1 ** 2 * w_5 * w_9 ** 2 / 288 + w_1 ** 2 * w_6 ** 2 * w_7 / 288 + w_1 ** 2 * w_6 ** 2 * w_8 / 288 + w_1 ** 2 * w_6 ** 2 * w_9 / 288 + w_1 ** 2 * w_6 * w_7 ** 2 / 288 + w_1 ** 2 * w_6 * w_7 * w_8 / 96 + w_1 ** 2 * w_6 * w_7 * w_9 / 96 + w_1 ** 2 * w_6 * w_8 ** 2 / 288 + w_1 ** 2 * w_6 * w_8 * w_9 / 96 + w_1 ** 2 * w_6 * w_9 ** 2 / 288 + w_1 ** 2 * w_7 ** 2 * w_8 / 288 + w_1 ** 2 * w_7 ** 2 * w_9 / 288 + w_1 ** 2 * w_7 * w_8 ** 2 / 288 + w_1 ** 2 * w_7 * w_8 * w_9 / 96 + w_1 ** 2 * w_7 * w_9 ** 2 / 288 + w_1 ** 2 * w_8 ** 2 * w_9 / 288 + w_1 ** 2 * w_8 * w_9 ** 2 / 288 - w_1 * w_10 ** 4 / 1440 + w_1 * w_10 ** 2 * w_2 ** 2 / 288 + w_1 * w_10 ** 2 * w_2 * w_3 / 96 + w_1 * w_10 ** 2 * w_2 * w_4 / 96 + w_1 * w_10 ** 2 * w_2 * w_5 / 96 + w_1 * w_10 ** 2 * w_2 * w_6 / 96 + w_1 * w_10 ** 2 * w_2 * w_7 / 96 + w_1 * w_10 ** 2 * w_2 * w_8 / 96 + w_1 * w_10 ** 2 * w_2 * w_9 / 96 + w_1 * w_10 ** 2 * w_3 ** 2 / 288 + w_1 * w_10 ** 2 * w_3 * w_4 / 96 + w_1 * w_10 ** 2 * w_3 * w_5 / 96 + w_1 * w_10 ** 2 * w_3 * w_6 / 96 + w_1 * w_10 ** 2 * w_3 * w_7 / 96 + w_1 * w_10 ** 2 * w_3 * w_8 / 96 + w_1 * w_10 ** 2 * w_3 * w_9 / 96 + w_1 * w_10 ** 2 * w_4 ** 2 / 288 + w_1 * w_10 ** 2 * w_4 * w_5 / 96 + w_1 * w_10 ** 2 * w_4 * w_6 / 96 + w_1 * w_10 ** 2 * w_4 * w_7 / 96 + w_1 * w_10 ** 2 * w_4 * w_8 / 96 + w_1 * w_10 ** 2 * w_4 * w_9 / 96 + w_1 * w_10 ** 2 * w_5 ** 2 / 288 + w_1 * w_10 ** 2 * w_5 * w_6 / 96 + w_1 * w_10 ** 2 * w_5 * w_7 / 96 + w_1 * w_10 ** 2 * w_5 * w_8 / 96 + w_1 * w_10 ** 2 * w_5 * w_9 / 96 + w_1 * w_10 ** 2 * w_6 ** 2 / 288 + w_1 * w_10 ** 2 * w_6 * w_7 / 96 + w_1 * w_10 ** 2 * w_6 * w_8 / 96 + w_1 * w_10 ** 2 * w_6 * w_9 / 96 + w_1 * w_10 ** 2 * w_7 ** 2 / 288 + w_1 * w_10 ** 2 * w_7 * w_8 / 96 + w_1 * w_10 ** 2 * w_7 * w_9 / 96 + w_1 * w_10 ** 2 * w_8 ** 2 / 288 + w_1 * w_10 ** 2 * w_8 * w_9 / 96 + w_1 * w_10 ** 2 * w_9 ** 2 / 288 + w_1 * w_10 * w_2 ** 2 * w_3 / 96 + w_1 * w_10 * w_2 ** 2 * w_4 / 96 + w_1 * w_10 * w_2 ** 2 * w_5 / 96 + w_1 * w_10 * w_2 ** 2 * w_6 / 96 + w_1 * w_10 * w_2 ** 2 * w_7 / 96 + w_1 * w_10 * w_2 ** 2 * w_8 / 96 + w_1 * w_10 * w_2 ** 2 * w_9 / 96 + w_1 * w_10 * w_2 * w_3 ** 2 / 96 + w_1 * w_10 * w_2 * w_3 * w_4 / 32 + w_1 * w_10 * w_2 * w_3 * w_5 / 32 + w_1 * w_10 * w_2 * w_3 * w_6 / 32 + w_1 * w_10 * w_2 * w_3 * w_7 / 32 + w_1 * w_10 * w_2 * w_3 * w_8 / 32 + w_1 * w_10 * w_2 * w_3 * w_9 / 32 + w_1 * w_10 * w_2 * w_4 ** 2 / 96 + w_1 * w_10 * w_2 * w_4 * w_5 / 32 + w_1 * w_10 * w_2 * w_4 * w_6 / 32 + w_1 * w_10 * w_2 * w_4 * w_7 / 32 + w_1 * w_10 * w_2 * w_4 * w_8 / 32 + w_1 * w_10 * w_2 * w_4 * w_9 / 32 + w_1 * w_10 * w_2 * w_5 ** 2 / 96 + w_1 * w_10 * w_2 * w_5 * w_6 / 32 + w_1 * w_10 * w_2 * w_5 * w_7 / 32 + w_1 * w_10 * w_2 * w_5 * w_8 / 32 + w_1 * w_10 * w_2 * w_5 * w_9 / 32 + w_1 * w_10 * w_2 * w_6 ** 2 / 96 + w_1 * w_10 * w_2 * w_6 * w_7 / 32 + w_1 * w_10 * w_2 * w_6 * w_8 / 32 + w_1 * w_10 * w_2 * w_6 * w_9 / 32 + w_1 * w_10 * w_2 * w_7 ** 2 / 96 + w_1 * w_10 * w_2 * w_7 * w_8 / 32 + w_1 * w_10 * w_2 * w_7 * w_9 / 32 + w_1 * w_10 * w_2 * w_8 ** 2 / 96 + w_1 * w_10 * w_2 * w_8 * w_9 / 32 + w_1 * w_10 * w_2 * w_9 ** 2 / 96 + w_1 * w_10 * w_3 ** 2 * w_4 / 96 + w_1 * w_10 * w_3 ** 2 * w_5 / 96 + w_1 * w_10 * w_3 ** 2 * w_6 / 96 + w_1 * w_10 * w_3 ** 2 * w_7 / 96 + w_1 * w_10 * w_3 ** 2 * w_8 / 96 + w_1 * w_10 * w_3 ** 2 * w_9 / 96 + w_1 * w_10 * w_3 * w_4 ** 2 / 96 + w_1 * w_10 * w_3 * w_4 * w_5 / 32 + w_1 * w_10 * w_3 * w_4 * w_6 / 32 + w_1 * w_10 * w_3 * w_4 * w_7 / 32 + w_1 * w_10 * w_3 * w_4 * w_8 / 32 + w_1 * w_10 * w_3 * w_4 * w_9 / 32 + w_1 * w_10 * w_3 * w_5 ** 2 / 96 + w_1 * w_10 * w_3 * w_5 * w_6 / 32 + w_1 * w_10 * w_3 * w_5 * w_7 / 32 + w_1 * w_10 * w_3 * w_5 * w_8 / 32 + w_1 * w_10 * w_3 * w_5 * w_9 / 32 + w_1 * w_10 * w_3 * w_6 ** 2 / 96 + w_1 * w_10 * w_3 * w_6 * w_7 / 32 + w_1 * w_10 * w_3 * w_6 * w_8 / 32 + w_1 * w_10 * w_3 * w_6 * w_9 / 32 + w_1 * w_10 * w_3 * w_7 ** 2 / 96 + w_1 * w_10 * w_3 * w_7 * w_8 / 32 + w_1 * w_10 * w_3 * w_7 * w_9 / 32 + w_1 * w_10 * w_3 * w_8 ** 2 / 96 + w_1 * w_10 * w_3 * w_8 * w_9 / 32 + w_1 * w_10 * w_3 * w_9 ** 2 / 96 + w_1 * w_10 * w_4 ** 2 * w_5 / 96 + w_1 * w_10 * w_4 ** 2 * w_6 / 96 + w_1 * w_10 * w_4 ** 2 * w_7 / 96 + w_1 * w_10 * w_4 ** 2 * w_8 / 96 + w_1 * w_10 * w_4 ** 2 * w_9 / 96 + w_1 * w_10 * w_4 * w_5 ** 2 / 96 + w_1 * w_10 * w_4 * w_5 * w_6 / 32 + w_1 * w_10 * w_4 * w_5 * w_7 / 32 + w_1 * w_10 * w_4 * w_5 * w_8 / 32 + w_1 * w_10 * w_4 * w_5 * w_9 / 32 + w_1 * w_10 * w_4 * w_6 ** 2 / 96 + w_1 * w_10 * w_4 * w_6 * w_7 / 32 + w_1 * w_10 * w_4 * w_6 * w_8 / 32 + w_1 * w_10 * w_4 * w_6 * w_9 / 32 + w_1 * w_10 * w_4 * w_7 ** 2 / 96 + w_1 * w_10 * w_4 * w_7 * w_8 / 32 + w_1 * w_10 * w_4 * w_7 * w_9 / 32 + w_1 * w_10 * w_4 * w_8 ** 2 / 96 + w_1 * w_10 * w_4 * w_8 * w_9 / 32 + w_1 * w_10 * w_4 * w_9 ** 2 / 96 + w_1 * w_10 * w_5 ** 2 * w_6 / 96 + w_1 * w_10 * w_5 ** 2 * w_7 / 96 + w_1 * w_10 * w_5 ** 2 * w_8 / 96 + w_1 * w_10 * w_5 ** 2 * w_9 / 96 + w_1 * w_10 * w_5 * w_6 ** 2 / 96 + w_1 * w_10 * w_5 * w_6 * w_7 / 32 + w_1 * w_10 * w_5 * w_6 * w_8 / 32 + w_1 * w_10 * w_5 * w_6 * w_9 / 32 + w_1 * w_10 * w_5 * w_7 ** 2 / 96 + w_1 * w_10 * w_5 * w_7 * w_8 / 32 + w_1 * w_10 * w_5 * w_7 * w_9 / 32 + w_1 * w_10 * w_5 * w_8 ** 2 / 96 + w_1 * w_10 * w_5 * w_8 * w_9 / 32 + w_1 * w_10 * w_5 * w_9 ** 2 / 96 + w_1 * w_10 * w_6 ** 2 * w_7 / 96 + w_1 * w_10 * w_6 ** 2 * w_8 / 96 + w_1 * w_10 * w_6 ** 2 * w_9 / 96 + w_1 * w_10 * w_6 * w_7 ** 2 / 96 + w_1 * w_10 * w_6 * w_7 * w_8 / 32 + w_1 * w_10 * w_6 * w_7 * w_9 / 32 + w_1 * w_10 * w_6 * w_8 ** 2 / 96 + w_1 * w_10 * w_6 * w_8 * w_9 / 32 + w_1 * w_10 * w_6 * w_9 ** 2 / 96 + w_1 * w_10 * w_7 ** 2 * w_8 / 96 + w_1 * w_10 * w_7 ** 2 * w_9 / 96 + w_1 * w_10 * w_7 * w_8 ** 2 / 96 + w_1 * w_10 * w_7 * w_8 * w_9 / 32 + w_1 * w_10 * w_7 * w_9 ** 2 / 96 + w_1 * w_10 * w_8 ** 2 * w_9 / 96 + w_1 * w_10 * w_8 * w_9 ** 2 / 96 - w_1 * w_2 ** 4 / 1440 + w_1 * w_2 ** 2 * w_3 ** 2 / 288 + w_1 * w_2 ** 2 * w_3 * w_4 / 96 + w_1 * w_2 ** 2 * w_3 * w_5 / 96 + w_1 * w_2 ** 2 * w_3 * w_6 / 96 + w_1 * w_2 ** 2 * w_3 * w_7 / 96 + w_1 * w_2 ** 2 * w_3 * w_8 / 96 + w_1 * w_2 ** 2 * w_3 * w_9 / 96 + w_1 * w_2 ** 2 * w_4 ** 2 / 288 + w_1 * w_2 ** 2 * w_4 * w_5 / 96 + w_1 * w_2 ** 2 * w_4 * w_6 / 96 + w_1 * w_2 ** 2 * w_4 * w_7 / 96 + w_1 * w_2 ** 2 * w_4 * w_8 / 96 + w_1 * w_2 ** 2 * w_4 * w_9 / 96 + w_1 * w_2 ** 2 * w_5 ** 2 / 288 + w_1 * w_2 ** 2 * w_5 * w_6 / 96 + w_1 * w_2 ** 2 * w_5 * w_7 / 96 + w_1 * w_2 ** 2 * w_5 * w_8 / 96 + w_1 * w_2 ** 2 * w_5 * w_9 / 96 + w_1 * w_2 ** 2 * w_6 ** 2 / 288 + w_1 * w_2 ** 2 * w_6 * w_7 / 96 + w_1 * w_2 ** 2 * w_6 * w_8 / 96 + w_1 * w_2 ** 2 * w_6 * w_9 / 96 + w_1 * w_2 ** 2 * w_7 ** 2 / 288 + w_1 * w_2 ** 2 * w_7 * w_8 / 96 + w_1 * w_2 ** 2 * w_7 * w_9 / 96 + w_1 * w_2 ** 2 * w_8 ** 2 / 288 + w_1 * w_2 ** 2 * w_8 * w_9 / 96 + w_1 * w_2 ** 2 * w_9 ** 2 / 288 + w_1 * w_2 * w_3 ** 2 * w_4 / 96 + w_1 * w_2 * w_3 ** 2 * w_5 / 96 + w_1 * w_2 * w_3 ** 2 * w_6 / 96 + w_1 * w_2 * w_3 ** 2 * w_7 / 96 + w_1 * w_2 * w_3 ** 2 * w_8 / 96 + w_1 * w_2 * w_3 ** 2 * w_9 / 96 + w_1 * w_2 * w_3 * w_4 ** 2 / 96 + w_1 * w_2 * w_3 * w_4 * w_5 / 32 + w_1 * w_2 * w_3 * w_4 * w_6 / 32 + w_1 * w_2 * w_3 * w_4 * w_7 / 32 + w_1 * w_2 * w_3 * w_4 * w_8 / 32 + w_1 * w_2 * w_3 * w_4 * w_9 / 32 + w_1 * w_2 * w_3 * w_5 ** 2 / 96 + w_1 * w_2 * w_3 * w_5 * w_6 / 32 + w_1 * w_2 * w_3 * w_5 * w_7 / 32 + w_1 * w_2 * w_3 * w_5 * w_8 / 32 + w_1 * w_2 * w_3 * w_5 * w_9 / 32 + w_1 * w_2 * w_3 * w_6 ** 2 / 96 + w_1 * w_2 * w_3 * w_6 * w_7 / 32 + w_1 * w_2 * w_3 * w_6 * w_8 / 32 + w_1 * w_2 * w_3 * w_6 * w_9 / 32 + w_1 * w_2 * w_3 * w_7 ** 2 / 96 + w_1 * w_2 * w_3 * w_7 * w_8 / 32 + w_1 * w_2 * w_3 * w_7 * w_9 / 32 + w_1 * w_2 * w_3 * w_8 ** 2 / 96 + w_1 * w_2 * w_3 * w_8 * w_9 / 32 + w_1 * w_2 * w_3 * w_9 ** 2 / 96 + w_1 * w_2 * w_4 ** 2 * w_5 / 96 + w_1 * w_2 * w_4 ** 2 * w_6 / 96 + w_1 * w_2 * w_4 ** 2 * w_7 / 96 + w_1 * w_2 * w_4 ** 2 * w_8 / 96 + w_1 * w_2 * w_4 ** 2 * w_9 / 96 + w_1 * w_2 * w_4 * w_5 ** 2 / 96 + w_1 * w_2 * w_4 * w_5 * w_6 / 32 + w_1 * w_2 * w_4 * w_5 * w_7 / 32 + w_1 * w_2 * w_4 * w_5 * w_8 / 32 + w_1 * w_2 * w_4 * w_5 * w_9 / 32 + w_1 * w_2 * w_4 * w_6 ** 2 / 96 + w_1 * w_2 * w_4 * w_6 * w_7 / 32 + w_1 * w_2 * w_4 * w_6 * w_8 / 32 + w_1 * w_2 * w_4 * w_6 * w_9 / 32 + w_1 * w_2 * w_4 * w_7 ** 2 / 96 + w_1 * w_2 * w_4 * w_7 * w_8 / 32 + w_1 * w_2 * w_4 * w_7 * w_9 / 32 + w_1 * w_2 * w_4 * w_8 ** 2 / 96 + w_1 * w_2 * w_4 * w_8 * w_9 / 32 + w_1 * w_2 * w_4 * w_9 ** 2 / 96 + w_1 * w_2 * w_5 ** 2 * w_6 / 96 + w_1 * w_2 * w_5 ** 2 * w_7 / 96 + w_1 * w_2 * w_5 ** 2 * w_8 / 96 + w_1 * w_2 * w_5 ** 2 * w_9 / 96 + w_1 * w_2 * w_5 * w_6 ** 2 / 96 + w_1 * w_2 * w_5 * w_6 * w_7 / 32 + w_1 * w_2 * w_5 * w_6 * w_8 / 32 + w_1 * w_2 * w_5 * w_6 * w_9 / 32 + w_1 * w_2 * w_5 * w_7 ** 2 / 96 + w_1 * w_2 * w_5 * w_7 * w_8 / 32 + w_1 * w_2 * w_5 * w_7 * w_9 / 32 + w_1 * w_2 * w_5 * w_8 ** 2 / 96 + w_1 * w_2 * w_5 * w_8 * w_9 / 32 + w_1 * w_2 * w_5 * w_9 ** 2 / 96 + w_1 * w_2 * w_6 ** 2 * w_7 / 96 + w_1 * w_2 * w_6 ** 2 * w_8 / 96 + w_1 * w_2 * w_6 ** 2 * w_9 / 96 + w_1 * w_2 * w_6 * w_7 ** 2 / 96 + w_1 * w_2 * w_6 * w_7 * w_8 / 32 + w_1 * w_2 * w_6 * w_7 * w_9 / 32 + w_1 * w_2 * w_6 * w_8 ** 2 / 96 + w_1 * w_2 * w_6 * w_8 * w_9 / 32 + w_1 * w_2 * w_6 * w_9 ** 2 / 96 + w_1 * w_2 * w_7 ** 2 * w_8 / 96 + w_1 * w_2 * w_7 ** 2 * w_9 / 96 + w_1 * w_2 * w_7 * w_8 ** 2 / 96 + w_1 * w_2 * w_7 * w_8 * w_9 / 32 + w_1 * w_2 * w_7 * w_9 ** 2 / 96 + w_1 * w_2 * w_8 ** 2 * w_9 / 96 + w_1 * w_2 * w_8 * w_9 ** 2 / 96 - w_1 * w_3 ** 4 / 1440 + w_1 * w_3 ** 2 * w_4 ** 2 / 288 + w_1 * w_3 ** 2 * w_4 * w_5 / 96 + w_1 * w_3 ** 2 * w_4 * w_6 / 96 + w_1 * w_3 ** 2 * w_4 * w_7 / 96 + w_1 * w_3 ** 2 * w_4 * w_8 / 96 + w_1 * w_3 ** 2 * w_4 * w_9 / 96 + w_1 * w_3 ** 2 * w_5 ** 2 / 288 + w_1 * w_3 ** 2 * w_5 * w_6 / 96 + w_1 * w_3 ** 2 * w_5 * w_7 / 96 + w_1 * w_3 ** 2 * w_5 * w_8 / 96 + w_1 * w_3 ** 2 * w_5 * w_9 / 96 + w_1 * w_3 ** 2 * w_6 ** 2 / 288 + w_1 * w_3 ** 2 * w_6 * w_7 / 96 + w_1 * w_3 ** 2 * w_6 * w_8 / 96 + w_1 * w_3 ** 2 * w_6 * w_9 / 96 + w_1 * w_3 ** 2 * w_7 ** 2 / 288 + w_1 * w_3 ** 2 * w_7 * w_8 / 96 + w_1 * w_3 ** 2 * w_7 * w_9 / 96 + w_1 * w_3 ** 2 * w_8 ** 2 / 288 + w_1 * w_3 ** 2 * w_8 * w_9 / 96 + w_1 * w_3 ** 2 * w_9 ** 2 / 288 + w_1 * w_3 * w_4 ** 2 * w_5 / 96 + w_1 * w_3 * w_4 ** 2 * w_6 / 96 + w_1 * w_3 * w_4 ** 2 * w_7 / 96 + w_1 * w_3 * w_4 ** 2 * w_8 / 96 + w_1 * w_3 * w_4 ** 2 * w_9 / 96 + w_1 * w_3 * w_4 * w_5 ** 2 / 96 + w_1 * w_3 * w_4 * w_5 * w_6 / 32 + w_1 * w_3 * w_4 * w_5 * w_7 / 32 + w_1 * w_3 * w_4 * w_5 * w_8 / 32 + w_1 * w_3 * w_4 * w_5 * w_9 / 32 + w_1 * w_3 * w_4 * w_6 ** 2 / 96 + w_1 * w_3 * w_4 * w_6 * w_7 / 32 + w_1 * w_3 * w_4 * w_6 * w_8 / 32 + w_1 * w_3 * w_4 * w_6 * w_9 / 32 + w_1 * w_3 * w_4 * w_7 ** 2 / 96 + w_1 * w_3 * w_4 * w_7 * w_8 / 32 + w_1 * w_3 * w_4 * w_7 * w_9 / 32 + w_1 * w_3 * w_4 * w_8 ** 2 / 96 + w_1 * w_3 * w_4 * w_8 * w_9 / 32 + w_1 * w_3 * w_4 * w_9 ** 2 / 96 + w_1 * w_3 * w_5 ** 2 * w_6 / 96 + w_1 * w_3 * w_5 ** 2 * w_7 / 96 + w_1 * w_3 * w_5 ** 2 * w_8 / 96 + w_1 * w_3 * w_5 ** 2 * w_9 / 96 + w_1 * w_3 * w_5 * w_6 ** 2 / 96 + w_1 * w_3 * w_5 * w_6 * w_7 / 32 + w_1 * w_3 * w_5 * w_6 * w_8 / 32 + w_1 * w_3 * w_5 * w_6 * w_9 / 32 + w_1 * w_3 * w_5 * w_7 ** 2 / 96 + w_1 * w_3 * w_5 * w_7 * w_8 / 32 + w_1 * w_3 * w_5 * w_7 * w_9 / 32 + w_1 * w_3 * w_5 * w_8 ** 2 / 96 + w_1 * w_3 * w_5 * w_8 * w_9 / 32 + w_1 * w_3 * w_5 * w_9 ** 2 / 96 + w_1 * w_3 * w_6 ** 2 * w_7 / 96 + w_1 * w_3 * w_6 ** 2 * w_8 / 96 + w_1 * w_3 * w_6 ** 2 * w_9 / 96 + w_1 * w_3 * w_6 * w_7 ** 2 / 96 + w_1 * w_3 * w_6 * w_7 * w_8 / 32 + w_1 * w_3 * w_6 * w_7 * w_9 / 32 + w_1 * w_3 * w_6 * w_8 ** 2 / 96 + w_1 * w_3 * w_6 * w_8 * w_9 / 32 + w_1 * w_3 * w_6 * w_9 ** 2 / 96 + w_1 * w_3 * w_7 ** 2 * w_8 / 96 + w_1 * w_3 * w_7 ** 2 * w_9 / 96 + w_1 * w_3 * w_7 * w_8 ** 2 / 96 + w_1 * w_3 * w_7 * w_8 * w_9 / 32 + w_1 * w_3 * w_7 * w_9 ** 2 / 96 + w_1 * w_3 * w_8 ** 2 * w_9 / 96 + w_1 * w_3 * w_8 * w_9 ** 2 / 96 - w_1 * w_4 ** 4 / 1440 + w_1 * w_4 ** 2 * w_5 ** 2 / 288 + w_1 * w_4 ** 2 * w_5 * w_6 / 96 + w_1 * w_4 ** 2 * w_5 * w_7 / 96 + w_1 * w_4 ** 2 * w_5 * w_8 / 96 + w_1 * w_4 ** 2 * w_5 * w_9 / 96 + w_1 * w_4 ** 2 * w_6 ** 2 / 288 + w_1 * w_4 ** 2 * w_6 * w_7 / 96 + w_1 * w_4 ** 2 * w_6 * w_8 / 96 + w_1 * w_4 ** 2 * w_6 * w_9 / 96 + w_1 * w_4 ** 2 * w_7 ** 2 / 288 + w_1 * w_4 ** 2 * w_7 * w_8 / 96 + w_1 * w_4 ** 2 * w_7 * w_9 / 96 + w_1 * w_4 ** 2 * w_8 ** 2 / 288 + w_1 * w_4 ** 2 * w_8 * w_9 / 96 + w_1 * w_4 ** 2 * w_9 ** 2 / 288 + w_1 * w_4 * w_5 ** 2 * w_6 / 96 + w_1 * w_4 * w_5 ** 2 * w_7 / 96 + w_1 * w_4 * w_5 ** 2 * w_8 / 96 + w_1 * w_4 * w_5 ** 2 * w_9 / 96 + w_1 * w_4 * w_5 * w_6 ** 2 / 96 + w_1 * w_4 * w_5 * w_6 * w_7 / 32 + w_1 * w_4 * w_5 * w_6 * w_8 / 32 + w_1 * w_4 * w_5 * w_6 * w_9 / 32 + w_1 * w_4 * w_5 * w_7 ** 2 / 96 + w_1 * w_4 * w_5 * w_7 * w_8 / 32 + w_1 * w_4 * w_5 * w_7 * w_9 / 32 + w_1 * w_4 * w_5 * w_8 ** 2 / 96 + w_1 * w_4 * w_5 * w_8 * w_9 / 32 + w_1 * w_4 * w_5 * w_9 ** 2 / 96 + w_1 * w_4 * w_6 ** 2 * w_7 / 96 + w_1 * w_4 * w_6 ** 2 * w_8 / 96 + w_1 * w_4 * w_6 ** 2 * w_9 / 96 + w_1 * w_4 * w_6 * w_7 ** 2 / 96 + w_1 * w_4 * w_6 * w_7 * w_8 / 32 + w_1 * w_4 * w_6 * w_7 * w_9 / 32 + w_1 * w_4 * w_6 * w_8 ** 2 / 96 + w_1 * w_4 * w_6 * w_8 * w_9 / 32 + w_1 * w_4 * w_6 * w_9 ** 2 / 96 + w_1 * w_4 * w_7 ** 2 * w_8 / 96 + w_1 * w_4 * w_7 ** 2 * w_9 / 96 + w_1 * w_4 * w_7 * w_8 ** 2 / 96 + w_1 * w_4 * w_7 * w_8 * w_9 / 32 + w_1 * w_4 * w_7 * w_9 ** 2 / 96 + w_1 * w_4 * w_8 ** 2 * w_9 / 96 + w_1 * w_4 * w_8 * w_9 ** 2 / 96 - w_1 * w_5 ** 4 / 1440 + w_1 * w_5 ** 2 * w_6 ** 2 / 288 + w_1 * w_5 ** 2 * w_6 * w_7 / 96 + w_1 * w_5 ** 2 * w_6 * w_8 / 96 + w_1 * w_5 ** 2 * w_6 * w_9 / 96 + w_1 * w_5 ** 2 * w_7 ** 2 / 288 + w_1 * w_5 ** 2 * w_7 * w_8 / 96 + w_1 * w_5 ** 2 * w_7 * w_9 / 96 + w_1 * w_5 ** 2 * w_8 ** 2 / 288 + w_1 * w_5 ** 2 * w_8 * w_9 / 96 + w_1 * w_5 ** 2 * w_9 ** 2 / 288 + w_1 * w_5 * w_6 ** 2 * w_7 / 96 + w_1 * w_5 * w_6 ** 2 * w_8 / 96 + w_1 * w_5 * w_6 ** 2 * w_9 / 96 + w_1 * w_5 * w_6 * w_7 ** 2 / 96 + w_1 * w_5 * w_6 * w_7 * w_8 / 32 + w_1 * w_5 * w_6 * w_7 * w_9 / 32 + w_1 * w_5 * w_6 * w_8 ** 2 / 96 + w_1 * w_5 * w_6 * w_8 * w_9 / 32 + w_1 * w_5 * w_6 * w_9 ** 2 / 96 + w_1 * w_5 * w_7 ** 2 * w_8 / 96 + w_1 * w_5 * w_7 ** 2 * w_9 / 96 + w_1 * w_5 * w_7 * w_8 ** 2 / 96 + w_1 * w_5 * w_7 * w_8 * w_9 / 32 + w_1 * w_5 * w_7 * w_9 ** 2 / 96 + w_1 * w_5 * w_8 ** 2 * w_9 / 96 + w_1 * w_5 * w_8 * w_9 ** 2 / 96 - w_1 * w_6 ** 4 / 1440 + w_1 * w_6 ** 2 * w_7 ** 2 / 288 + w_1 * w_6 ** 2 * w_7 * w_8 / 96 + w_1 * w_6 ** 2 * w_7 * w_9 / 96 + w_1 * w_6 ** 2 * w_8 ** 2 / 288 + w_1 * w_6 ** 2 * w_8 * w_9 / 96 + w_1 * w_6 ** 2 * w_9 ** 2 / 288 + w_1 * w_6 * w_7 ** 2 * w_8 / 96 + w_1 * w_6 * w_7 ** 2 * w_9 / 96 + w_1 * w_6 * w_7 * w_8 ** 2 / 96 + w_1 * w_6 * w_7 * w_8 * w_9 / 32 + w_1 * w_6 * w_7 * w_9 ** 2 / 96 + w_1 * w_6 * w_8 ** 2 * w_9 / 96 + w_1 * w_6 * w_8 * w_9 ** 2 / 96 - w_1 * w_7 ** 4 / 1440 + w_1 * w_7 ** 2 * w_8 ** 2 / 288 + w_1 * w_7 ** 2 * w_8 * w_9 / 96 + w_1 * w_7 ** 2 * w_9 ** 2 / 288 + w_1 * w_7 * w_8 ** 2 * w_9 / 96 + w_1 * w_7 * w_8 * w_9 ** 2 / 96 - w_1 * w_8 ** 4 / 1440 + w_1 * w_8 ** 2 * w_9 ** 2 / 288 - w_1 * w_9 ** 4 / 1440 - w_10 ** 4 * w_2 / 1440 - w_10 ** 4 * w_3 / 1440 - w_10 ** 4 * w_4 / 1440 - w_10 ** 4 * w_5 / 1440 - w_10 ** 4 * w_6 / 1440 - w_10 ** 4 * w_7 / 1440 - w_10 ** 4 * w_8 / 1440 - w_10 ** 4 * w_9 / 1440 + w_10 ** 2 * w_2 ** 2 * w_3 / 288 + w_10 ** 2 * w_2 ** 2 * w_4 / 288 + w_10 ** 2 * w_2 ** 2 * w_5 / 288 + w_10 ** 2 * w_2 ** 2 * w_6 / 288 + w_10 ** 2 * w_2 ** 2 * w_7 / 288 + w_10 ** 2 * w_2 ** 2 * w_8 / 288 + w_10 ** 2 * w_2 ** 2 * w_9 / 288 + w_10 ** 2 * w_2 * w_3 ** 2 / 288 + w_10 ** 2 * w_2 * w_3 * w_4 / 96 + w_10 ** 2 * w_2 * w_3 * w_5 / 96 + w_10 ** 2 * w_2 * w_3 * w_6 / 96 + w_10 ** 2 * w_2 * w_3 * w_7 / 96 + w_10 ** 2 * w_2 * w_3 * w_8 / 96 + w_10 ** 2 * w_2 * w_3 * w_9 / 96 + w_10 ** 2 * w_2 * w_4 ** 2 / 288 + w_10 ** 2 * w_2 * w_4 * w_5 / 96 + w_10 ** 2 * w_2 * w_4 * w_6 / 96 + w_10 ** 2 * w_2 * w_4 * w_7 / 96 + w_10 ** 2 * w_2 * w_4 * w_8 / 96 + w_10 ** 2 * w_2 * w_4 * w_9 / 96 + w_10 ** 2 * w_2 * w_5 ** 2 / 288 + w_10 ** 2 * w_2 * w_5 * w_6 / 96 + w_10 ** 2 * w_2 * w_5 * w_7 / 96 + w_10 ** 2 * w_2 * w_5 * w_8 / 96 + w_10 ** 2 * w_2 * w_5 * w_9 / 96 + w_10 ** 2 * w_2 * w_6 ** 2 / 288 + w_10 ** 2 * w_2 * w_6 * w_7 / 96 + w_10 ** 2 * w_2 * w_6 * w_8 / 96 + w_10 ** 2 * w_2 * w_6 * w_9 / 96 + w_10 ** 2 * w_2 * w_7 ** 2 / 288 + w_10 ** 2 * w_2 * w_7 * w_8 / 96 + w_10 ** 2 * w_2 * w_7 * w_9 / 96 + w_10 ** 2 * w_2 * w_8 ** 2 / 288 + w_10 ** 2 * w_2 * w_8 * w_9 / 96 + w_10 ** 2 * w_2 * w_9 ** 2 / 288 + w_10 ** 2 * w_3 ** 2 * w_4 / 288 + w_10 ** 2 * w_3 ** 2 * w_5 / 288 + w_10 ** 2 * w_3 ** 2 * w_6 / 288 + w_10 ** 2 * w_3 ** 2 * w_7 / 288 + w_10 ** 2 * w_3 ** 2 * w_8 / 288 + w_10 ** 2 * w_3 ** 2 * w_9 / 288 + w_10 ** 2 * w_3 * w_4 ** 2 / 288 + w_10 ** 2 * w_3 * w_4 * w_5 / 96 + w_10 ** 2 * w_3 * w_4 * w_6 / 96 + w_10 ** 2 * w_3 * w_4 * w_7 / 96 + w_10 ** 2 * w_3 * w_4 * w_8 / 96 + w_10 ** 2 * w_3 * w_4 * w_9 / 96 + w_10 ** 2 * w_3 * w_5 ** 2 / 288 + w_10 ** 2 * w_3 * w_5 * w_6 / 96 + w_10 ** 2 * w_3 * w_5 * w_7 / 96 + w_10 ** 2 * w_3 * w_5 * w_8 / 96 + w_10 ** 2 * w_3 * w_5 * w_9 / 96 + w_10 ** 2 * w_3 * w_6 ** 2 / 288 + w_10 ** 2 * w_3 * w_6 * w_7 / 96 + w_10 ** 2 * w_3 * w_6 * w_8 / 96 + w_10 ** 2 * w_3 * w_6 * w_9 / 96 + w_10 ** 2 * w_3 * w_7 ** 2 / 288 + w_10 ** 2 * w_3 * w_7 * w_8 / 96 + w_10 ** 2 * w_3 * w_7 * w_9 / 96 + w_10 ** 2 * w_3 * w_8 ** 2 / 288 + w_10 ** 2 * w_3 * w_8 * w_9 / 96 + w_10 ** 2 * w_3 * w_9 ** 2 / 288 + w_10 ** 2 * w_4 ** 2 * w_5 / 288 + w_10 ** 2 * w_4 ** 2 * w_6 / 288 + w_10 ** 2 * w_4 ** 2 * w_7 / 288 + w_10 ** 2 * w_4 ** 2 * w_8 / 288 + w_10 ** 2 * w_4 ** 2 * w_9 / 288 + w_10 ** 2 * w_4 * w_5 ** 2 / 288 + w_10 ** 2 * w_4 * w_5 * w_6 / 96 + w_10 ** 2 * w_4 * w_5 * w_7 / 96 + w_10 ** 2 * w_4 * w_5 * w_8 / 96 + w_10 ** 2 * w_4 * w_5 * w_9 / 96 + w_10 ** 2 * w_4 * w_6 ** 2 / 288 + w_10 ** 2 * w_4 * w_6 * w_7 / 96 + w_10 ** 2 * w_4 * w_6 * w_8 / 96 + w_10 ** 2 * w_4 * w_6 * w_9 / 96 + w_10 ** 2 * w_4 * w_7 ** 2 / 288 + w_10 ** 2 * w_4 * w_7 * w_8 / 96 + w_10 ** 2 * w_4 * w_7 * w_9 / 96 + w_10 ** 2 * w_4 * w_8 ** 2 / 288 + w_10 ** 2 * w_4 * w_8 * w_9 / 96 + w_10 ** 2 * w_4 * w_9 ** 2 / 288 + w_10 ** 2 * w_5 ** 2 * w_6 / 288 + w_10 ** 2 * w_5 ** 2 * w_7 / 288 + w_10 ** 2 * w_5 ** 2 * w_8 / 288 + w_10 ** 2 * w_5 ** 2 * w_9 / 288 + w_10 ** 2 * w_5 * w_6 ** 2 / 288 + w_10 ** 2 * w_5 * w_6 * w_7 / 96 + w_10 ** 2 * w_5 * w_6 * w_8 / 96 + w_10 ** 2 * w_5 * w_6 * w_9 / 96 + w_10 ** 2 * w_5 * w_7 ** 2 / 288 + w_10 ** 2 * w_5 * w_7 * w_8 / 96 + w_10 ** 2 * w_5 * w_7 * w_9 / 96 + w_10 ** 2 * w_5 * w_8 ** 2 / 288 + w_10 ** 2 * w_5 * w_8 * w_9 / 96 + w_10 ** 2 * w_5 * w_9 ** 2 / 288 + w_10 ** 2 * w_6 ** 2 * w_7 / 288 + w_10 ** 2 * w_6 ** 2 * w_8 / 288 + w_10 ** 2 * w_6 ** 2 * w_9 / 288 + w_10 ** 2 * w_6 * w_7 ** 2 / 288 + w_10 ** 2 * w_6 * w_7 * w_8 / 96 + w_10 ** 2 * w_6 * w_7 * w_9 / 96 + w_10 ** 2 * w_6 * w_8 ** 2 / 288 + w_10 ** 2 * w_6 * w_8 * w_9 / 96 + w_10 ** 2 * w_6 * w_9 ** 2 / 288 + w_10 ** 2 * w_7 ** 2 * w_8 / 288 + w_10 ** 2 * w_7 ** 2 * w_9 / 288 + w_10 ** 2 * w_7 * w_8 ** 2 / 288 + w_10 ** 2 * w_7 * w_8 * w_9 / 96 + w_10 ** 2 * w_7 * w_9 ** 2 / 288 + w_10 ** 2 * w_8 ** 2 * w_9 / 288 + w_10 ** 2 * w_8 * w_9 ** 2 / 288 - w_10 * w_2 ** 4 / 1440 + w_10 * w_2 ** 2 * w_3 ** 2 / 288 + w_10 * w_2 ** 2 * w_3 * w_4 / 96 + w_10 * w_2 ** 2 * w_3 * w_5 / 96 + w_10 * w_2 ** 2 * w_3 * w_6 / 96 + w_10 * w_2 ** 2 * w_3 * w_7 / 96 + w_10 * w_2 ** 2 * w_3 * w_8 / 96 + w_10 * w_2 ** 2 * w_3 * w_9 / 96 + w_10 * w_2 ** 2 * w_4 ** 2 / 288 + w_10 * w_2 ** 2 * w_4 * w_5 / 96 + w_10 * w_2 ** 2 * w_4 * w_6 / 96 + w_10 * w_2 ** 2 * w_4 * w_7 / 96 + w_10 * w_2 ** 2 * w_4 * w_8 / 96 + w_10 * w_2 ** 2 * w_4 * w_9 / 96 + w_10 * w_2 ** 2 * w_5 ** 2 / 288 + w_10 * w_2 ** 2 * w_5 * w_6 / 96 + w_10 * w_2 ** 2 * w_5 * w_7 / 96 + w_10 * w_2 ** 2 * w_5 * w_8 / 96 + w_10 * w_2 ** 2 * w_5 * w_9 / 96 + w_10 * w_2 ** 2 * w_6 ** 2 / 288 + w_10 * w_2 ** 2 * w_6 * w_7 / 96 + w_10 * w_2 ** 2 * w_6 * w_8 / 96 + w_10 * w_2 ** 2 * w_6 * w_9 / 96 + w_10 * w_2 ** 2 * w_7 ** 2 / 288 + w_10 * w_2 ** 2 * w_7 * w_8 / 96 + w_10 * w_2 ** 2 * w_7 * w_9 / 96 + w_10 * w_2 ** 2 * w_8 ** 2 / 288 + w_10 * w_2 ** 2 * w_8 * w_9 / 96 + w_10 * w_2 ** 2 * w_9 ** 2 / 288 + w_10 * w_2 * w_3 ** 2 * w_4 / 96 + w_10 * w_2 * w_3 ** 2 * w_5 / 96 + w_10 * w_2 * w_3 ** 2 * w_6 / 96 + w_10 * w_2 * w_3 ** 2 * w_7 / 96 + w_10 * w_2 * w_3 ** 2 * w_8 / 96 + w_10 * w_2 * w_3 ** 2 * w_9 / 96 + w_10 * w_2 * w_3 * w_4 ** 2 / 96 + w_10 * w_2 * w_3 * w_4 * w_5 / 32 + w_10 * w_2 * w_3 * w_4 * w_6 / 32 + w_10 * w_2 * w_3 * w_4 * w_7 / 32 + w_10 * w_2 * w_3 * w_4 * w_8 / 32 + w_10 * w_2 * w_3 * w_4 * w_9 / 32 + w_10 * w_2 * w_3 * w_5 ** 2 / 96 + w_10 * w_2 * w_3 * w_5 * w_6 / 32 + w_10 * w_2 * w_3 * w_5 * w_7 / 32 + w_10 * w_2 * w_3 * w_5 * w_8 / 32 + w_10 * w_2 * w_3 * w_5 * w_9 / 32 + w_10 * w_2 * w_3 * w_6 ** 2 / 96 + w_10 * w_2 * w_3 * w_6 * w_7 / 32 + w_10 * w_2 * w_3 * w_6 * w_8 / 32 + w_10 * w_2 * w_3 * w_6 * w_9 / 32 + w_10 * w_2 * w_3 * w_7 ** 2 / 96 + w_10 * w_2 * w_3 * w_7 * w_8 / 32 + w_10 * w_2 * w_3 * w_7 * w_9 / 32 + w_10 * w_2 * w_3 * w_8 ** 2 / 96 + w_10 * w_2 * w_3 * w_8 * w_9 / 32 + w_10 * w_2 * w_3 * w_9 ** 2 / 96 + w_10 * w_2 * w_4 ** 2 * w_5 / 96 + w_10 * w_2 * w_4 ** 2 * w_6 / 96 + w_10 * w_2 * w_4 ** 2 * w_7 / 96 + w_10 * w_2 * w_4 ** 2 * w_8 / 96 + w_10 * w_2 * w_4 ** 2 * w_9 / 96 + w_10 * w_2 * w_4 * w_5 ** 2 / 96 + w_10 * w_2 * w_4 * w_5 * w_6 / 32 + w_10 * w_2 * w_4 * w_5 * w_7 / 32 + w_10 * w_2 * w_4 * w_5 * w_8 / 32 + w_10 * w_2 * w_4 * w_5 * w_9 / 32 + w_10 * w_2 * w_4 * w_6 ** 2 / 96 + w_10 * w_2 * w_4 * w_6 * w_7 / 32 + w_10 * w_2 * w_4 * w_6 * w_8 / 32 + w_10 * w_2 * w_4 * w_6 * w_9 / 32 + w_10 * w_2 * w_4 * w_7 ** 2 / 96 + w_10 * w_2 * w_4 * w_7 * w_8 / 32 + w_10 * w_2 * w_4 * w_7 * w_9 / 32 + w_10 * w_2 * w_4 * w_8 ** 2 / 96 + w_10 * w_2 * w_4 * w_8 * w_9 / 32 + w_10 * w_2 * w_4 * w_9 ** 2 / 96 + w_10 * w_2 * w_5 ** 2 * w_6 / 96 + w_10 * w_2 * w_5 ** 2 * w_7 / 96 + w_10 * w_2 * w_5 ** 2 * w_8 / 96 + w_10 * w_2 * w_5 ** 2 * w_9 / 96 + w_10 * w_2 * w_5 * w_6 ** 2 / 96 + w_10 * w_2 * w_5 * w_6 * w_7 / 32 + w_10 * w_2 * w_5 * w_6 * w_8 / 32 + w_10 * w_2 * w_5 * w_6 * w_9 / 32 + w_10 * w_2 * w_5 * w_7 ** 2 / 96 + w_10 * w_2 * w_5 * w_7 * w_8 / 32 + w_10 * w_2 * w_5 * w_7 * w_9 / 32 + w_10 * w_2 * w_5 * w_8 ** 2 / 96 + w_10 * w_2 * w_5 * w_8 * w_9 / 32 + w_10 * w_2 * w_5 * w_9 ** 2 / 96 + w_10 * w_2 * w_6 ** 2 * w_7 / 96 + w_10 * w_2 * w_6 ** 2 * w_8 / 96 + w_10 * w_2 * w_6 ** 2 * w_9 / 96 + w_10 * w_2 * w_6 * w_7 ** 2 / 96 + w_10 * w_2 * w_6 * w_7 * w_8 / 32 + w_10 * w_2 * w_6 * w_7 * w_9 / 32 + w_10 * w_2 * w_6 * w_8 ** 2 / 96 + w_10 * w_2 * w_6 * w_8 * w_9 / 32 + w_10 * w_2 * w_6 * w_9 ** 2 / 96 + w_10 * w_2 * w_7 ** 2 * w_8 / 96 + w_10 * w_2 * w_7 ** 2 * w_9 / 96 + w_10 * w_2 * w_7 * w_8 ** 2 / 96 + w_10 * w_2 * w_7 * w_8 * w_9 / 32 + w_10 * w_2 * w_7 * w_9 ** 2 / 96 + w_10 * w_2 * w_8 ** 2 * w_9 / 96 + w_10 * w_2 * w_8 * w_9 ** 2 / 96 - w_10 * w_3 ** 4 / 1440 + w_10 * w_3 ** 2 * w_4 ** 2 / 288 + w_10 * w_3 ** 2 * w_4 * w_5 / 96 + w_10 * w_3 ** 2 * w_4 * w_6 / 96 + w_10 * w_3 ** 2 * w_4 * w_7 / 96 + w_10 * w_3 ** 2 * w_4 * w_8 / 96 + w_10 * w_3 ** 2 * w_4 * w_9 / 96 + w_10 * w_3 ** 2 * w_5 ** 2 / 288 + w_10 * w_3 ** 2 * w_5 * w_6 / 96 + w_10 * w_3 ** 2 * w_5 * w_7 / 96 + w_10 * w_3 ** 2 * w_5 * w_8 / 96 + w_10 * w_3 ** 2 * w_5 * w_9 / 96 + w_10 * w_3 ** 2 * w_6 ** 2 / 288 + w_10 * w_3 ** 2 * w_6 * w_7 / 96 + w_10 * w_3 ** 2 * w_6 * w_8 / 96 + w_10 * w_3 ** 2 * w_6 * w_9 / 96 + w_10 * w_3 ** 2 * w_7 ** 2 / 288 + w_10 * w_3 ** 2 * w_7 * w_8 / 96 + w_10 * w_3 ** 2 * w_7 * w_9 / 96 + w_10 * w_3 ** 2 * w_8 ** 2 / 288 + w_10 * w_3 ** 2 * w_8 * w_9 / 96 + w_10 * w_3 ** 2 * w_9 ** 2 / 288 + w_10 * w_3 * w_4 ** 2 * w_5 / 96 + w_10 * w_3 * w_4 ** 2 * w_6 / 96 + w_10 * w_3 * w_4 ** 2 * w_7 / 96 + w_10 * w_3 * w_4 ** 2 * w_8 / 96 + w_10 * w_3 * w_4 ** 2 * w_9 / 96 + w_10 * w_3 * w_4 * w_5 ** 2 / 96 + w_10 * w_3 * w_4 * w_5 * w_6 / 32 + w_10 * w_3 * w_4 * w_5 * w_7 / 32 + w_10 * w_3 * w_4 * w_5 * w_8 / 32 + w_10 * w_3 * w_4 * w_5 * w_9 / 32 + w_10 * w_3 * w_4 * w_6 ** 2 / 96 + w_10 * w_3 * w_4 * w_6 * w_7 / 32 + w_10 * w_3 * w_4 * w_6 * w_8 / 32 + w_10 * w_3 * w_4 * w_6 * w_9 / 32 + w_10 * w_3 * w_4 * w_7 ** 2 / 96 + w_10 * w_3 * w_4 * w_7 * w_8 / 32 + w_10 * w_3 * w_4 * w_7 * w_9 / 32 + w_10 * w_3 * w_4 * w_8 ** 2 / 96 + w_10 * w_3 * w_4 * w_8 * w_9 / 32 + w_10 * w_3 * w_4 * w_9 ** 2 / 96 + w_10 * w_3 * w_5 ** 2 * w_6 / 96 + w_10 * w_3 * w_5 ** 2 * w_7 / 96 + w_10 * w_3 * w_5 ** 2 * w_8 / 96 + w_10 * w_3 * w_5 ** 2 * w_9 / 96 + w_10 * w_3 * w_5 * w_6 ** 2 / 96 + w_10 * w_3 * w_5 * w_6 * w_7 / 32 + w_10 * w_3 * w_5 * w_6 * w_8 / 32 + w_10 * w_3 * w_5 * w_6 * w_9 / 32 + w_10 * w_3 * w_5 * w_7 ** 2 / 96 + w_10 * w_3 * w_5 * w_7 * w_8 / 32 + w_10 * w_3 * w_5 * w_7 * w_9 / 32 + w_10 * w_3 * w_5 * w_8 ** 2 / 96 + w_10 * w_3 * w_5 * w_8 * w_9 / 32 + w_10 * w_3 * w_5 * w_9 ** 2 / 96 + w_10 * w_3 * w_6 ** 2 * w_7 / 96 + w_10 * w_3 * w_6 ** 2 * w_8 / 96 + w_10 * w_3 * w_6 ** 2 * w_9 / 96 + w_10 * w_3 * w_6 * w_7 ** 2 / 96 + w_10 * w_3 * w_6 * w_7 * w_8 / 32 + w_10 * w_3 * w_6 * w_7 * w_9 / 32 + w_10 * w_3 * w_6 * w_8 ** 2 / 96 + w_10 * w_3 * w_6 * w_8 * w_9 / 32 + w_10 * w_3 * w_6 * w_9 ** 2 / 96 + w_10 * w_3 * w_7 ** 2 * w_8 / 96 + w_10 * w_3 * w_7 ** 2 * w_9 / 96 + w_10 * w_3 * w_7 * w_8 ** 2 / 96 + w_10 * w_3 * w_7 * w_8 * w_9 / 32 + w_10 * w_3 * w_7 * w_9 ** 2 / 96 + w_10 * w_3 * w_8 ** 2 * w_9 / 96 + w_10 * w_3 * w_8 * w_9 ** 2 / 96 - w_10 * w_4 ** 4 / 1440 + w_10 * w_4 ** 2 * w_5 ** 2 / 288 + w_10 * w_4 ** 2 * w_5 * w_6 / 96 + w_10 * w_4 ** 2 * w_5 * w_7 / 96 + w_10 * w_4 ** 2 * w_5 * w_8 / 96 + w_10 * w_4 ** 2 * w_5 * w_9 / 96 + w_10 * w_4 ** 2 * w_6 ** 2 / 288 + w_10 * w_4 ** 2 * w_6 * w_7 / 96 + w_10 * w_4 ** 2 * w_6 * w_8 / 96 + w_10 * w_4 ** 2 * w_6 * w_9 / 96 + w_10 * w_4 ** 2 * w_7 ** 2 / 288 + w_10 * w_4 ** 2 * w_7 * w_8 / 96 + w_10 * w_4 ** 2 * w_7 * w_9 / 96 + w_10 * w_4 ** 2 * w_8 ** 2 / 288 + w_10 * w_4 ** 2 * w_8 * w_9 / 96 + w_10 * w_4 ** 2 * w_9 ** 2 / 288 + w_10 * w_4 * w_5 ** 2 * w_6 / 96 + w_10 * w_4 * w_5 ** 2 * w_7 / 96 + w_10 * w_4 * w_5 ** 2 * w_8 / 96 + w_10 * w_4 * w_5 ** 2 * w_9 / 96 + w_10 * w_4 * w_5 * w_6 ** 2 / 96 + w_10 * w_4 * w_5 * w_6 * w_7 / 32 + w_10 * w_4 * w_5 * w_6 * w_8 / 32 + w_10 * w_4 * w_5 * w_6 * w_9 / 32 + w_10 * w_4 * w_5 * w_7 ** 2 / 96 + w_10 * w_4 * w_5 * w_7 * w_8 / 32 + w_10 * w_4 * w_5 * w_7 * w_9 / 32 + w_10 * w_4 * w_5 * w_8 ** 2 / 96 + w_10 * w_4 * w_5 * w_8 * w_9 / 32 + w_10 * w_4 * w_5 * w_9 ** 2 / 96 + w_10 * w_4 * w_6 ** 2 * w_7 / 96 + w_10 * w_4 * w_6 ** 2 * w_8 / 96 + w_10 * w_4 * w_6 ** 2 * w_9 / 96 + w_10 * w_4 * w_6 * w_7 ** 2 / 96 + w_10 * w_4 * w_6 * w_7 * w_8 / 32 + w_10 * w_4 * w_6 * w_7 * w_9 / 32 + w_10 * w_4 * w_6 * w_8 ** 2 / 96 + w_10 * w_4 * w_6 * w_8 * w_9 / 32 + w_10 * w_4 * w_6 * w_9 ** 2 / 96 + w_10 * w_4 * w_7 ** 2 * w_8 / 96 + w_10 * w_4 * w_7 ** 2 * w_9 / 96 + w_10 * w_4 * w_7 * w_8 ** 2 / 96 + w_10 * w_4 * w_7 * w_8 * w_9 / 32 + w_10 * w_4 * w_7 * w_9 ** 2 / 96 + w_10 * w_4 * w_8 ** 2 * w_9 / 96 + w_10 * w_4 * w_8 * w_9 ** 2 / 96 - w_10 * w_5 ** 4 / 1440 + w_10 * w_5 ** 2 * w_6 ** 2 / 288 + w_10 * w_5 ** 2 * w_6 * w_7 / 96 + w_10 * w_5 ** 2 * w_6 * w_8 / 96 + w_10 * w_5 ** 2 * w_6 * w_9 / 96 + w_10 * w_5 ** 2 * w_7 ** 2 / 288 + w_10 * w_5 ** 2 * w_7 * w_8 / 96 + w_10 * w_5 ** 2 * w_7 * w_9 / 96 + w_10 * w_5 ** 2 * w_8 ** 2 / 288 + w_10 * w_5 ** 2 * w_8 * w_9 / 96 + w_10 * w_5 ** 2 * w_9 ** 2 / 288 + w_10 * w_5 * w_6 ** 2 * w_7 / 96 + w_10 * w_5 * w_6 ** 2 * w_8 / 96 + w_10 * w_5 * w_6 ** 2 * w_9 / 96 + w_10 * w_5 * w_6 * w_7 ** 2 / 96 + w_10 * w_5 * w_6 * w_7 * w_8 / 32 + w_10 * w_5 * w_6 * w_7 * w_9 / 32 + w_10 * w_5 * w_6 * w_8 ** 2 / 96 + w_10 * w_5 * w_6 * w_8 * w_9 / 32 + w_10 * w_5 * w_6 * w_9 ** 2 / 96 + w_10 * w_5 * w_7 ** 2 * w_8 / 96 + w_10 * w_5 * w_7 ** 2 * w_9 / 96 + w_10 * w_5 * w_7 * w_8 ** 2 / 96 + w_10 * w_5 * w_7 * w_8 * w_9 / 32 + w_10 * w_5 * w_7 * w_9 ** 2 / 96 + w_10 * w_5 * w_8 ** 2 * w_9 / 96 + w_10 * w_5 * w_8 * w_9 ** 2 / 96 - w_10 * w_6 ** 4 / 1440 + w_10 * w_6 ** 2 * w_7 ** 2 / 288 + w_10 * w_6 ** 2 * w_7 * w_8 / 96 + w_10 * w_6 ** 2 * w_7 * w_9 / 96 + w_10 * w_6 ** 2 * w_8 ** 2 / 288 + w_10 * w_6 ** 2 * w_8 * w_9 / 96 + w_10 * w_6 ** 2 * w_9 ** 2 / 288 + w_10 * w_6 * w_7 ** 2 * w_8 / 96 + w_10 * w_6 * w_7 ** 2 * w_9 / 96 + w_10 * w_6 * w_7 * w_8 ** 2 / 96 + w_10 * w_6 * w_7 * w_8 * w_9 / 32 + w_10 * w_6 * w_7 * w_9 ** 2 / 96 + w_10 * w_6 * w_8 ** 2 * w_9 / 96 + w_10 * w_6 * w_8 * w_9 ** 2 / 96 - w_10 * w_7 ** 4 / 1440 + w_10 * w_7 ** 2 * w_8 ** 2 / 288 + w_10 * w_7 ** 2 * w_8 * w_9 / 96 + w_10 * w_7 ** 2 * w_9 ** 2 / 288 + w_10 * w_7 * w_8 ** 2 * w_9 / 96 + w_10 * w_7 * w_8 * w_9 ** 2 / 96 - w_10 * w_8 ** 4 / 1440 + w_10 * w_8 ** 2 * w_9 ** 2 / 288 - w_10 * w_9 ** 4 / 1440 - w_2 ** 4 * w_3 / 1440 - w_2 ** 4 * w_4 / 1440 - w_2 ** 4 * w_5 / 1440 - w_2 ** 4 * w_6 / 1440 - w_2 ** 4 * w_7 / 1440 - w_2 ** 4 * w_8 / 1440 - w_2 ** 4 * w_9 / 1440 + w_2 ** 2 * w_3 ** 2 * w_4 / 288 + w_2 ** 2 * w_3 ** 2 * w_5 / 288 + w_2 ** 2 * w_3 ** 2 * w_6 / 288 + w_2 ** 2 * w_3 ** 2 * w_7 / 288 + w_2 ** 2 * w_3 ** 2 * w_8 / 288 + w_2 ** 2 * w_3 ** 2 * w_9 / 288 + w_2 ** 2 * w_3 * w_4 ** 2 / 288 + w_2 ** 2 * w_3 * w_4 * w_5 / 96 + w_2 ** 2 * w_3 * w_4 * w_6 / 96 + w_2 ** 2 * w_3 * w_4 * w_7 / 96 + w_2 ** 2 * w_3 * w_4 * w_8 / 96 + w_2 ** 2 * w_3 * w_4 * w_9 / 96 + w_2 ** 2 * w_3 * w_5 ** 2 / 288 + w_2 ** 2 * w_3 * w_5 * w_6 / 96 + w_2 ** 2 * w_3 * w_5 * w_7 / 96 + w_2 ** 2 * w_3 * w_5 * w_8 / 96 + w_2 ** 2 * w_3 * w_5 * w_9 / 96 + w_2 ** 2 * w_3 * w_6 ** 2 / 288 + w_2 ** 2 * w_3 * w_6 * w_7 / 96 + w_2 ** 2 * w_3 * w_6 * w_8 / 96 + w_2 ** 2 * w_3 * w_6 * w_9 / 96 + w_2 ** 2 * w_3 * w_7 ** 2 / 288 + w_2 ** 2 * w_3 * w_7 * w_8 / 96 + w_2 ** 2 * w_3 * w_7 * w_9 / 96 + w_2 ** 2 * w_3 * w_8 ** 2 / 288 + w_2 ** 2 * w_3 * w_8 * w_9 / 96 + w_2 ** 2 * w_3 * w_9 ** 2 / 288 + w_2 ** 2 * w_4 ** 2 * w_5 / 288 + w_2 ** 2 * w_4 ** 2 * w_6 / 288 + w_2 ** 2 * w_4 ** 2 * w_7 / 288 + w_2 ** 2 * w_4 ** 2 * w_8 / 288 + w_2 ** 2 * w_4 ** 2 * w_9 / 288 + w_2 ** 2 * w_4 * w_5 ** 2 / 288 + w_2 ** 2 * w_4 * w_5 * w_6 / 96 + w_2 ** 2 * w_4 * w_5 * w_7 / 96 + w_2 ** 2 * w_4 * w_5 * w_8 / 96 + w_2 ** 2 * w_4 * w_5 * w_9 / 96 + w_2 ** 2 * w_4 * w_6 ** 2 / 288 + w_2 ** 2 * w_4 * w_6 * w_7 / 96 + w_2 ** 2 * w_4 * w_6 * w_8 / 96 + w_2 ** 2 * w_4 * w_6 * w_9 / 96 + w_2 ** 2 * w_4 * w_7 ** 2 / 288 + w_2 ** 2 * w_4 * w_7 * w_8 / 96 + w_2 ** 2 * w_4 * w_7 * w_9 / 96 + w_2 ** 2 * w_4 * w_8 ** 2 / 288 + w_2 ** 2 * w_4 * w_8 * w_9 / 96 + w_2 ** 2 * w_4 * w_9 ** 2 / 288 + w_2 ** 2 * w_5 ** 2 * w_6 / 288 + w_2 ** 2 * w_5 ** 2 * w_7 / 288 + w_2 ** 2 * w_5 ** 2 * w_8 / 288 + w_2 ** 2 * w_5 ** 2 * w_9 / 288 + w_2 ** 2 * w_5 * w_6 ** 2 / 288 + w_2 ** 2 * w_5 * w_6 * w_7 / 96 + w_2 ** 2 * w_5 * w_6 * w_8 / 96 + w_2 ** 2 * w_5 * w_6 * w_9 / 96 + w_2 ** 2 * w_5 * w_7 ** 2 / 288 + w_2 ** 2 * w_5 * w_7 * w_8 / 96 + w_2 ** 2 * w_5 * w_7 * w_9 / 96 + w_2 ** 2 * w_5 * w_8 ** 2 / 288 + w_2 ** 2 * w_5 * w_8 * w_9 / 96 + w_2 ** 2 * w_5 * w_9 ** 2 / 288 + w_2 ** 2 * w_6 ** 2 * w_7 / 288 + w_2 ** 2 * w_6 ** 2 * w_8 / 288 + w_2 ** 2 * w_6 ** 2 * w_9 / 288 + w_2 ** 2 * w_6 * w_7 ** 2 / 288 + w_2 ** 2 * w_6 * w_7 * w_8 / 96 + w_2 ** 2 * w_6 * w_7 * w_9 / 96 + w_2 ** 2 * w_6 * w_8 ** 2 / 288 + w_2 ** 2 * w_6 * w_8 * w_9 / 96 + w_2 ** 2 * w_6 * w_9 ** 2 / 288 + w_2 ** 2 * w_7 ** 2 * w_8 / 288 + w_2 ** 2 * w_7 ** 2 * w_9 / 288 + w_2 ** 2 * w_7 * w_8 ** 2 / 288 + w_2 ** 2 * w_7 * w_8 * w_9 / 96 + w_2 ** 2 * w_7 * w_9 ** 2 / 288 + w_2 ** 2 * w_8 ** 2 * w_9 / 288 + w_2 ** 2 * w_8 * w_9 ** 2 / 288 - w_2 * w_3 ** 4 / 1440 + w_2 * w_3 ** 2 * w_4 ** 2 / 288 + w_2 * w_3 ** 2 * w_4 * w_5 / 96 + w_2 * w_3 ** 2 * w_4 * w_6 / 96 + w_2 * w_3 ** 2 * w_4 * w_7 / 96 + w_2 * w_3 ** 2 * w_4 * w_8 / 96 + w_2 * w_3 ** 2 * w_4 * w_9 / 96 + w_2 * w_3 ** 2 * w_5 ** 2 / 288 + w_2 * w_3 ** 2 * w_5 * w_6 / 96 + w_2 * w_3 ** 2 * w_5 * w_7 / 96 + w_2 * w_3 ** 2 * w_5 * w_8 / 96 + w_2 * w_3 ** 2 * w_5 * w_9 / 96 + w_2 * w_3 ** 2 * w_6 ** 2 / 288 + w_2 * w_3 ** 2 * w_6 * w_7 / 96 + w_2 * w_3 ** 2 * w_6 * w_8 / 96 + w_2 * w_3 ** 2 * w_6 * w_9 / 96 + w_2 * w_3 ** 2 * w_7 ** 2 / 288 + w_2 * w_3 ** 2 * w_7 * w_8 / 96 + w_2 * w_3 ** 2 * w_7 * w_9 / 96 + w_2 * w_3 ** 2 * w_8 ** 2 / 288 + w_2 * w_3 ** 2 * w_8 * w_9 / 96 + w_2 * w_3 ** 2 * w_9 ** 2 / 288 + w_2 * w_3 * w_4 ** 2 * w_5 / 96 + w_2 * w_3 * w_4 ** 2 * w_6 / 96 + w_2 * w_3 * w_4 ** 2 * w_7 / 96 + w_2 * w_3 * w_4 ** 2 * w_8 / 96 + w_2 * w_3 * w_4 ** 2 * w_9 / 96 + w_2 * w_3 * w_4 * w_5 ** 2 / 96 + w_2 * w_3 * w_4 * w_5 * w_6 / 32 + w_2 * w_3 * w_4 * w_5 * w_7 / 32 + w_2 * w_3 * w_4 * w_5 * w_8 / 32 + w_2 * w_3 * w_4 * w_5 * w_9 / 32 + w_2 * w_3 * w_4 * w_6 ** 2 / 96 + w_2 * w_3 * w_4 * w_6 * w_7 / 32 + w_2 * w_3 * w_4 * w_6 * w_8 / 32 + w_2 * w_3 * w_4 * w_6 * w_9 / 32 + w_2 * w_3 * w_4 * w_7 ** 2 / 96 + w_2 * w_3 * w_4 * w_7 * w_8 / 32 + w_2 * w_3 * w_4 * w_7 * w_9 / 32 + w_2 * w_3 * w_4 * w_8 ** 2 / 96 + w_2 * w_3 * w_4 * w_8 * w_9 / 32 + w_2 * w_3 * w_4 * w_9 ** 2 / 96 + w_2 * w_3 * w_5 ** 2 * w_6 / 96 + w_2 * w_3 * w_5 ** 2 * w_7 / 96 + w_2 * w_3 * w_5 ** 2 * w_8 / 96 + w_2 * w_3 * w_5 ** 2 * w_9 / 96 + w_2 * w_3 * w_5 * w_6 ** 2 / 96 + w_2 * w_3 * w_5 * w_6 * w_7 / 32 + w_2 * w_3 * w_5 * w_6 * w_8 / 32 + w_2 * w_3 * w_5 * w_6 * w_9 / 32 + w_2 * w_3 * w_5 * w_7 ** 2 / 96 + w_2 * w_3 * w_5 * w_7 * w_8 / 32 + w_2 * w_3 * w_5 * w_7 * w_9 / 32 + w_2 * w_3 * w_5 * w_8 ** 2 / 96 + w_2 * w_3 * w_5 * w_8 * w_9 / 32 + w_2 * w_3 * w_5 * w_9 ** 2 / 96 + w_2 * w_3 * w_6 ** 2 * w_7 / 96 + w_2 * w_3 * w_6 ** 2 * w_8 / 96 + w_2 * w_3 * w_6 ** 2 * w_9 / 96 + w_2 * w_3 * w_6 * w_7 ** 2 / 96 + w_2 * w_3 * w_6 * w_7 * w_8 / 32 + w_2 * w_3 * w_6 * w_7 * w_9 / 32 + w_2 * w_3 * w_6 * w_8 ** 2 / 96 + w_2 * w_3 * w_6 * w_8 * w_9 / 32 + w_2 * w_3 * w_6 * w_9 ** 2 / 96 + w_2 * w_3 * w_7 ** 2 * w_8 / 96 + w_2 * w_3 * w_7 ** 2 * w_9 / 96 + w_2 * w_3 * w_7 * w_8 ** 2 / 96 + w_2 * w_3 * w_7 * w_8 * w_9 / 32 + w_2 * w_3 * w_7 * w_9 ** 2 / 96 + w_2 * w_3 * w_8 ** 2 * w_9 / 96 + w_2 * w_3 * w_8 * w_9 ** 2 / 96 - w_2 * w_4 ** 4 / 1440 + w_2 * w_4 ** 2 * w_5 ** 2 / 288 + w_2 * w_4 ** 2 * w_5 * w_6 / 96 + w_2 * w_4 ** 2 * w_5 * w_7 / 96 + w_2 * w_4 ** 2 * w_5 * w_8 / 96 + w_2 * w_4 ** 2 * w_5 * w_9 / 96 + w_2 * w_4 ** 2 * w_6 ** 2 / 288 + w_2 * w_4 ** 2 * w_6 * w_7 / 96 + w_2 * w_4 ** 2 * w_6 * w_8 / 96 + w_2 * w_4 ** 2 * w_6 * w_9 / 96 + w_2 * w_4 ** 2 * w_7 ** 2 / 288 + w_2 * w_4 ** 2 * w_7 * w_8 / 96 + w_2 * w_4 ** 2 * w_7 * w_9 / 96 + w_2 * w_4 ** 2 * w_8 ** 2 / 288 + w_2 * w_4 ** 2 * w_8 * w_9 / 96 + w_2 * w_4 ** 2 * w_9 ** 2 / 288 + w_2 * w_4 * w_5 ** 2 * w_6 / 96 + w_2 * w_4 * w_5 ** 2 * w_7 / 96 + w_2 * w_4 * w_5 ** 2 * w_8 / 96 + w_2 * w_4 * w_5 ** 2 * w_9 / 96 + w_2 * w_4 * w_5 * w_6 ** 2 / 96 + w_2 * w_4 * w_5 * w_6 * w_7 / 32 + w_2 * w_4 * w_5 * w_6 * w_8 / 32 + w_2 * w_4 * w_5 * w_6 * w_9 / 32 + w_2 * w_4 * w_5 * w_7 ** 2 / 96 + w_2 * w_4 * w_5 * w_7 * w_8 / 32 + w_2 * w_4 * w_5 * w_7 * w_9 / 32 + w_2 * w_4 * w_5 * w_8 ** 2 / 96 + w_2 * w_4 * w_5 * w_8 * w_9 / 32 + w_2 * w_4 * w_5 * w_9 ** 2 / 96 + w_2 * w_4 * w_6 ** 2 * w_7 / 96 + w_2 * w_4 * w_6 ** 2 * w_8 / 96 + w_2 * w_4 * w_6 ** 2 * w_9 / 96 + w_2 * w_4 * w_6 * w_7 ** 2 / 96 + w_2 * w_4 * w_6 * w_7 * w_8 / 32 + w_2 * w_4 * w_6 * w_7 * w_9 / 32 + w_2 * w_4 * w_6 * w_8 ** 2 / 96 + w_2 * w_4 * w_6 * w_8 * w_9 / 32 + w_2 * w_4 * w_6 * w_9 ** 2 / 96 + w_2 * w_4 * w_7 ** 2 * w_8 / 96 + w_2 * w_4 * w_7 ** 2 * w_9 / 96 + w_2 * w_4 * w_7 * w_8 ** 2 / 96 + w_2 * w_4 * w_7 * w_8 * w_9 / 32 + w_2 * w_4 * w_7 * w_9 ** 2 / 96 + w_2 * w_4 * w_8 ** 2 * w_9 / 96 + w_2 * w_4 * w_8 * w_9 ** 2 / 96 - w_2 * w_5 ** 4 / 1440 + w_2 * w_5 ** 2 * w_6 ** 2 / 288 + w_2 * w_5 ** 2 * w_6 * w_7 / 96 + w_2 * w_5 ** 2 * w_6 * w_8 / 96 + w_2 * w_5 ** 2 * w_6 * w_9 / 96 + w_2 * w_5 ** 2 * w_7 ** 2 / 288 + w_2 * w_5 ** 2 * w_7 * w_8 / 96 + w_2 * w_5 ** 2 * w_7 * w_9 / 96 + w_2 * w_5 ** 2 * w_8 ** 2 / 288 + w_2 * w_5 ** 2 * w_8 * w_9 / 96 + w_2 * w_5 ** 2 * w_9 ** 2 / 288 + w_2 * w_5 * w_6 ** 2 * w_7 / 96 + w_2 * w_5 * w_6 ** 2 * w_8 / 96 + w_2 * w_5 * w_6 ** 2 * w_9 / 96 + w_2 * w_5 * w_6 * w_7 ** 2 / 96 + w_2 * w_5 * w_6 * w_7 * w_8 / 32 + w_2 * w_5 * w_6 * w_7 * w_9 / 32 + w_2 * w_5 * w_6 * w_8 ** 2 / 96 + w_2 * w_5 * w_6 * w_8 * w_9 / 32 + w_2 * w_5 * w_6 * w_9 ** 2 / 96 + w_2 * w_5 * w_7 ** 2 * w_8 / 96 + w_2 * w_5 * w_7 ** 2 * w_9 / 96 + w_2 * w_5 * w_7 * w_8 ** 2 / 96 + w_2 * w_5 * w_7 * w_8 * w_9 / 32 + w_2 * w_5 * w_7 * w_9 ** 2 / 96 + w_2 * w_5 * w_8 ** 2 * w_9 / 96 + w_2 * w_5 * w_8 * w_9 ** 2 / 96 - w_2 * w_6 ** 4 / 1440 + w_2 * w_6 ** 2 * w_7 ** 2 / 288 + w_2 * w_6 ** 2 * w_7 * w_8 / 96 + w_2 * w_6 ** 2 * w_7 * w_9 / 96 + w_2 * w_6 ** 2 * w_8 ** 2 / 288 + w_2 * w_6 ** 2 * w_8 * w_9 / 96 + w_2 * w_6 ** 2 * w_9 ** 2 / 288 + w_2 * w_6 * w_7 ** 2 * w_8 / 96 + w_2 * w_6 * w_7 ** 2 * w_9 / 96 + w_2 * w_6 * w_7 * w_8 ** 2 / 96 + w_2 * w_6 * w_7 * w_8 * w_9 / 32 + w_2 * w_6 * w_7 * w_9 ** 2 / 96 + w_2 * w_6 * w_8 ** 2 * w_9 / 96 + w_2 * w_6 * w_8 * w_9 ** 2 / 96 - w_2 * w_7 ** 4 / 1440 + w_2 * w_7 ** 2 * w_8 ** 2 / 288 + w_2 * w_7 ** 2 * w_8 * w_9 / 96 + w_2 * w_7 ** 2 * w_9 ** 2 / 288 + w_2 * w_7 * w_8 ** 2 * w_9 / 96 + w_2 * w_7 * w_8 * w_9 ** 2 / 96 - w_2 * w_8 ** 4 / 1440 + w_2 * w_8 ** 2 * w_9 ** 2 / 288 - w_2 * w_9 ** 4 / 1440 - w_3 ** 4 * w_4 / 1440 - w_3 ** 4 * w_5 / 1440 - w_3 ** 4 * w_6 / 1440 - w_3 ** 4 * w_7 / 1440 - w_3 ** 4 * w_8 / 1440 - w_3 ** 4 * w_9 / 1440 + w_3 ** 2 * w_4 ** 2 * w_5 / 288 + w_3 ** 2 * w_4 ** 2 * w_6 / 288 + w_3 ** 2 * w_4 ** 2 * w_7 / 288 + w_3 ** 2 * w_4 ** 2 * w_8 / 288 + w_3 ** 2 * w_4 ** 2 * w_9 / 288 + w_3 ** 2 * w_4 * w_5 ** 2 / 288 + w_3 ** 2 * w_4 * w_5 * w_6 / 96 + w_3 ** 2 * w_4 * w_5 * w_7 / 96 + w_3 ** 2 * w_4 * w_5 * w_8 / 96 + w_3 ** 2 * w_4 * w_5 * w_9 / 96 + w_3 ** 2 * w_4 * w_6 ** 2 / 288 + w_3 ** 2 * w_4 * w_6 * w_7 / 96 + w_3 ** 2 * w_4 * w_6 * w_8 / 96 + w_3 ** 2 * w_4 * w_6 * w_9 / 96 + w_3 ** 2 * w_4 * w_7 ** 2 / 288 + w_3 ** 2 * w_4 * w_7 * w_8 / 96 + w_3 ** 2 * w_4 * w_7 * w_9 / 96 + w_3 ** 2 * w_4 * w_8 ** 2 / 288 + w_3 ** 2 * w_4 * w_8 * w_9 / 96 + w_3 ** 2 * w_4 * w_9 ** 2 / 288 + w_3 ** 2 * w_5 ** 2 * w_6 / 288 + w_3 ** 2 * w_5 ** 2 * w_7 / 288 + w_3 ** 2 * w_5 ** 2 * w_8 / 288 + w_3 ** 2 * w_5 ** 2 * w_9 / 288 + w_3 ** 2 * w_5 * w_6 ** 2 / 288 + w_3 ** 2 * w_5 * w_6 * w_7 / 96 + w_3 ** 2 * w_5 * w_6 * w_8 / 96 + w_3 ** 2 * w_5 * w_6 * w_9 / 96 + w_3 ** 2 * w_5 * w_7 ** 2 / 288 + w_3 ** 2 * w_5 * w_7 * w_8 / 96 + w_3 ** 2 * w_5 * w_7 * w_9 / 96 + w_3 ** 2 * w_5 * w_8 ** 2 / 288 + w_3 ** 2 * w_5 * w_8 * w_9 / 96 + w_3 ** 2 * w_5 * w_9 ** 2 / 288 + w_3 ** 2 * w_6 ** 2 * w_7 / 288 + w_3 ** 2 * w_6 ** 2 * w_8 / 288 + w_3 ** 2 * w_6 ** 2 * w_9 / 288 + w_3 ** 2 * w_6 * w_7 ** 2 / 288 + w_3 ** 2 * w_6 * w_7 * w_8 / 96 + w_3 ** 2 * w_6 * w_7 * w_9 / 96 + w_3 ** 2 * w_6 * w_8 ** 2 / 288 + w_3 ** 2 * w_6 * w_8 * w_9 / 96 + w_3 ** 2 * w_6 * w_9 ** 2 / 288 + w_3 ** 2 * w_7 ** 2 * w_8 / 288 + w_3 ** 2 * w_7 ** 2 * w_9 / 288 + w_3 ** 2 * w_7 * w_8 ** 2 / 288 + w_3 ** 2 * w_7 * w_8 * w_9 / 96 + w_3 ** 2 * w_7 * w_9 ** 2 / 288 + w_3 ** 2 * w_8 ** 2 * w_9 / 288 + w_3 ** 2 * w_8 * w_9 ** 2 / 288 - w_3 * w_4 ** 4 / 1440 + w_3 * w_4 ** 2 * w_5 ** 2 / 288 + w_3 * w_4 ** 2 * w_5 * w_6 / 96 + w_3 * w_4 ** 2 * w_5 * w_7 / 96 + w_3 * w_4 ** 2 * w_5 * w_8 / 96 + w_3 * w_4 ** 2 * w_5 * w_9 / 96 + w_3 * w_4 ** 2 * w_6 ** 2 / 288 + w_3 * w_4 ** 2 * w_6 * w_7 / 96 + w_3 * w_4 ** 2 * w_6 * w_8 / 96 + w_3 * w_4 ** 2 * w_6 * w_9 / 96 + w_3 * w_4 ** 2 * w_7 ** 2 / 288 + w_3 * w_4 ** 2 * w_7 * w_8 / 96 + w_3 * w_4 ** 2 * w_7 * w_9 / 96 + w_3 * w_4 ** 2 * w_8 ** 2 / 288 + w_3 * w_4 ** 2 * w_8 * w_9 / 96 + w_3 * w_4 ** 2 * w_9 ** 2 / 288 + w_3 * w_4 * w_5 ** 2 * w_6 / 96 + w_3 * w_4 * w_5 ** 2 * w_7 / 96 + w_3 * w_4 * w_5 ** 2 * w_8 / 96 + w_3 * w_4 * w_5 ** 2 * w_9 / 96 + w_3 * w_4 * w_5 * w_6 ** 2 / 96 + w_3 * w_4 * w_5 * w_6 * w_7 / 32 + w_3 * w_4 * w_5 * w_6 * w_8 / 32 + w_3 * w_4 * w_5 * w_6 * w_9 / 32 + w_3 * w_4 * w_5 * w_7 ** 2 / 96 + w_3 * w_4 * w_5 * w_7 * w_8 / 32 + w_3 * w_4 * w_5 * w_7 * w_9 / 32 + w_3 * w_4 * w_5 * w_8 ** 2 / 96 + w_3 * w_4 * w_5 * w_8 * w_9 / 32 + w_3 * w_4 * w_5 * w_9 ** 2 / 96 + w_3 * w_4 * w_6 ** 2 * w_7 / 96 + w_3 * w_4 * w_6 ** 2 * w_8 / 96 + w_3 * w_4 * w_6 ** 2 * w_9 / 96 + w_3 * w_4 * w_6 * w_7 ** 2 / 96 + w_3 * w_4 * w_6 * w_7 * w_8 / 32 + w_3 * w_4 * w_6 * w_7 * w_9 / 32 + w_3 * w_4 * w_6 * w_8 ** 2 / 96 + w_3 * w_4 * w_6 * w_8 * w_9 / 32 + w_3 * w_4 * w_6 * w_9 ** 2 / 96 + w_3 * w_4 * w_7 ** 2 * w_8 / 96 + w_3 * w_4 * w_7 ** 2 * w_9 / 96 + w_3 * w_4 * w_7 * w_8 ** 2 / 96 + w_3 * w_4 * w_7 * w_8 * w_9 / 32 + w_3 * w_4 * w_7 * w_9 ** 2 / 96 + w_3 * w_4 * w_8 ** 2 * w_9 / 96 + w_3 * w_4 * w_8 * w_9 ** 2 / 96 - w_3 * w_5 ** 4 / 1440 + w_3 * w_5 ** 2 * w_6 ** 2 / 288 + w_3 * w_5 ** 2 * w_6 * w_7 / 96 + w_3 * w_5 ** 2 * w_6 * w_8 / 96 + w_3 * w_5 ** 2 * w_6 * w_9 / 96 + w_3 * w_5 ** 2 * w_7 ** 2 / 288 + w_3 * w_5 ** 2 * w_7 * w_8 / 96 + w_3 * w_5 ** 2 * w_7 * w_9 / 96 + w_3 * w_5 ** 2 * w_8 ** 2 / 288 + w_3 * w_5 ** 2 * w_8 * w_9 / 96 + w_3 * w_5 ** 2 * w_9 ** 2 / 288 + w_3 * w_5 * w_6 ** 2 * w_7 / 96 + w_3 * w_5 * w_6 ** 2 * w_8 / 96 + w_3 * w_5 * w_6 ** 2 * w_9 / 96 + w_3 * w_5 * w_6 * w_7 ** 2 / 96 + w_3 * w_5 * w_6 * w_7 * w_8 / 32 + w_3 * w_5 * w_6 * w_7 * w_9 / 32 + w_3 * w_5 * w_6 * w_8 ** 2 / 96 + w_3 * w_5 * w_6 * w_8 * w_9 / 32 + w_3 * w_5 * w_6 * w_9 ** 2 / 96 + w_3 * w_5 * w_7 ** 2 * w_8 / 96 + w_3 * w_5 * w_7 ** 2 * w_9 / 96 + w_3 * w_5 * w_7 * w_8 ** 2 / 96 + w_3 * w_5 * w_7 * w_8 * w_9 / 32 + w_3 * w_5 * w_7 * w_9 ** 2 / 96 + w_3 * w_5 * w_8 ** 2 * w_9 / 96 + w_3 * w_5 * w_8 * w_9 ** 2 / 96 - w_3 * w_6 ** 4 / 1440 + w_3 * w_6 ** 2 * w_7 ** 2 / 288 + w_3 * w_6 ** 2 * w_7 * w_8 / 96 + w_3 * w_6 ** 2 * w_7 * w_9 / 96 + w_3 * w_6 ** 2 * w_8 ** 2 / 288 + w_3 * w_6 ** 2 * w_8 * w_9 / 96 + w_3 * w_6 ** 2 * w_9 ** 2 / 288 + w_3 * w_6 * w_7 ** 2 * w_8 / 96 + w_3 * w_6 * w_7 ** 2 * w_9 / 96 + w_3 * w_6 * w_7 * w_8 ** 2 / 96 + w_3 * w_6 * w_7 * w_8 * w_9 / 32 + w_3 * w_6 * w_7 * w_9 ** 2 / 96 + w_3 * w_6 * w_8 ** 2 * w_9 / 96 + w_3 * w_6 * w_8 * w_9 ** 2 / 96 - w_3 * w_7 ** 4 / 1440 + w_3 * w_7 ** 2 * w_8 ** 2 / 288 + w_3 * w_7 ** 2 * w_8 * w_9 / 96 + w_3 * w_7 ** 2 * w_9 ** 2 / 288 + w_3 * w_7 * w_8 ** 2 * w_9 / 96 + w_3 * w_7 * w_8 * w_9 ** 2 / 96 - w_3 * w_8 ** 4 / 1440 + w_3 * w_8 ** 2 * w_9 ** 2 / 288 - w_3 * w_9 ** 4 / 1440 - w_4 ** 4 * w_5 / 1440 - w_4 ** 4 * w_6 / 1440 - w_4 ** 4 * w_7 / 1440 - w_4 ** 4 * w_8 / 1440 - w_4 ** 4 * w_9 / 1440 + w_4 ** 2 * w_5 ** 2 * w_6 / 288 + w_4 ** 2 * w_5 ** 2 * w_7 / 288 + w_4 ** 2 * w_5 ** 2 * w_8 / 288 + w_4 ** 2 * w_5 ** 2 * w_9 / 288 + w_4 ** 2 * w_5 * w_6 ** 2 / 288 + w_4 ** 2 * w_5 * w_6 * w_7 / 96 + w_4 ** 2 * w_5 * w_6 * w_8 / 96 + w_4 ** 2 * w_5 * w_6 * w_9 / 96 + w_4 ** 2 * w_5 * w_7 ** 2 / 288 + w_4 ** 2 * w_5 * w_7 * w_8 / 96 + w_4 ** 2 * w_5 * w_7 * w_9 / 96 + w_4 ** 2 * w_5 * w_8 ** 2 / 288 + w_4 ** 2 * w_5 * w_8 * w_9 / 96 + w_4 ** 2 * w_5 * w_9 ** 2 / 288 + w_4 ** 2 * w_6 ** 2 * w_7 / 288 + w_4 ** 2 * w_6 ** 2 * w_8 / 288 + w_4 ** 2 * w_6 ** 2 * w_9 / 288 + w_4 ** 2 * w_6 * w_7 ** 2 / 288 + w_4 ** 2 * w_6 * w_7 * w_8 / 96 + w_4 ** 2 * w_6 * w_7 * w_9 / 96 + w_4 ** 2 * w_6 * w_8 ** 2 / 288 + w_4 ** 2 * w_6 * w_8 * w_9 / 96 + w_4 ** 2 * w_6 * w_9 ** 2 / 288 + w_4 ** 2 * w_7 ** 2 * w_8 / 288 + w_4 ** 2 * w_7 ** 2 * w_9 / 288 + w_4 ** 2 * w_7 * w_8 ** 2 / 288 + w_4 ** 2 * w_7 * w_8 * w_9 / 96 + w_4 ** 2 * w_7 * w_9 ** 2 / 288 + w_4 ** 2 * w_8 ** 2 * w_9 / 288 + w_4 ** 2 * w_8 * w_9 ** 2 / 288 - w_4 * w_5 ** 4 / 1440 + w_4 * w_5 ** 2 * w_6 ** 2 / 288 + w_4 * w_5 ** 2 * w_6 * w_7 / 96 + w_4 * w_5 ** 2 * w_6 * w_8 / 96 + w_4 * w_5 ** 2 * w_6 * w_9 / 96 + w_4 * w_5 ** 2 * w_7 ** 2 / 288 + w_4 * w_5 ** 2 * w_7 * w_8 / 96 + w_4 * w_5 ** 2 * w_7 * w_9 / 96 + w_4 * w_5 ** 2 * w_8 ** 2 / 288 + w_4 * w_5 ** 2 * w_8 * w_9 / 96 + w_4 * w_5 ** 2 * w_9 ** 2 / 288 + w_4 * w_5 * w_6 ** 2 * w_7 / 96 + w_4 * w_5 * w_6 ** 2 * w_8 / 96 + w_4 * w_5 * w_6 ** 2 * w_9 / 96 + w_4 * w_5 * w_6 * w_7 ** 2 / 96 + w_4 * w_5 * w_6 * w_7 * w_8 / 32 + w_4 * w_5 * w_6 * w_7 * w_9 / 32 + w_4 * w_5 * w_6 * w_8 ** 2 / 96 + w_4 * w_5 * w_6 * w_8 * w_9 / 32 + w_4 * w_5 * w_6 * w_9 ** 2 / 96 + w_4 * w_5 * w_7 ** 2 * w_8 / 96 + w_4 * w_5 * w_7 ** 2 * w_9 / 96 + w_4 * w_5 * w_7 * w_8 ** 2 / 96 + w_4 * w_5 * w_7 * w_8 * w_9 / 32 + w_4 * w_5 * w_7 * w_9 ** 2 / 96 + w_4 * w_5 * w_8 ** 2 * w_9 / 96 + w_4 * w_5 * w_8 * w_9 ** 2 / 96 - w_4 * w_6 ** 4 / 1440 + w_4 * w_6 ** 2 * w_7 ** 2 / 288 + w_4 * w_6 ** 2 * w_7 * w_8 / 96 + w_4 * w_6 ** 2 * w_7 * w_9 / 96 + w_4 * w_6 ** 2 * w_8 ** 2 / 288 + w_4 * w_6 ** 2 * w_8 * w_9 / 96 + w_4 * w_6 ** 2 * w_9 ** 2 / 288 + w_4 * w_6 * w_7 ** 2 * w_8 / 96 + w_4 * w_6 * w_7 ** 2 * w_9 / 96 + w_4 * w_6 * w_7 * w_8 ** 2 / 96 + w_4 * w_6 * w_7 * w_8 * w_9 / 32 + w_4 * w_6 * w_7 * w_9 ** 2 / 96 + w_4 * w_6 * w_8 ** 2 * w_9 / 96 + w_4 * w_6 * w_8 * w_9 ** 2 / 96 - w_4 * w_7 ** 4 / 1440 + w_4 * w_7 ** 2 * w_8 ** 2 / 288 + w_4 * w_7 ** 2 * w_8 * w_9 / 96 + w_4 * w_7 ** 2 * w_9 ** 2 / 288 + w_4 * w_7 * w_8 ** 2 * w_9 / 96 + w_4 * w_7 * w_8 * w_9 ** 2 / 96 - w_4 * w_8 ** 4 / 1440 + w_4 * w_8 ** 2 * w_9 ** 2 / 288 - w_4 * w_9 ** 4 / 1440 - w_5 ** 4 * w_6 / 1440 - w_5 ** 4 * w_7 / 1440 - w_5 ** 4 * w_8 / 1440 - w_5 ** 4 * w_9 / 1440 + w_5 ** 2 * w_6 ** 2 * w_7 / 288 + w_5 ** 2 * w_6 ** 2 * w_8 / 288 + w_5 ** 2 * w_6 ** 2 * w_9 / 288 + w_5 ** 2 * w_6 * w_7 ** 2 / 288 + w_5 ** 2 * w_6 * w_7 * w_8 / 96 + w_5 ** 2 * w_6 * w_7 * w_9 / 96 + w_5 ** 2 * w_6 * w_8 ** 2 / 288 + w_5 ** 2 * w_6 * w_8 * w_9 / 96 + w_5 ** 2 * w_6 * w_9 ** 2 / 288 + w_5 ** 2 * w_7 ** 2 * w_8 / 288 + w_5 ** 2 * w_7 ** 2 * w_9 / 288 + w_5 ** 2 * w_7 * w_8 ** 2 / 288 + w_5 ** 2 * w_7 * w_8 * w_9 / 96 + w_5 ** 2 * w_7 * w_9 ** 2 / 288 + w_5 ** 2 * w_8 ** 2 * w_9 / 288 + w_5 ** 2 * w_8 * w_9 ** 2 / 288 - w_5 * w_6 ** 4 / 1440 + w_5 * w_6 ** 2 * w_7 ** 2 / 288 + w_5 * w_6 ** 2 * w_7 * w_8 / 96 + w_5 * w_6 ** 2 * w_7 * w_9 / 96 + w_5 * w_6 ** 2 * w_8 ** 2 / 288 + w_5 * w_6 ** 2 * w_8 * w_9 / 96 + w_5 * w_6 ** 2 * w_9 ** 2 / 288 + w_5 * w_6 * w_7 ** 2 * w_8 / 96 + w_5 * w_6 * w_7 ** 2 * w_9 / 96 + w_5 * w_6 * w_7 * w_8 ** 2 / 96 + w_5 * w_6 * w_7 * w_8 * w_9 / 32 + w_5 * w_6 * w_7 * w_9 ** 2 / 96 + w_5 * w_6 * w_8 ** 2 * w_9 / 96 + w_5 * w_6 * w_8 * w_9 ** 2 / 96 - w_5 * w_7 ** 4 / 1440 + w_5 * w_7 ** 2 * w_8 ** 2 / 288 + w_5 * w_7 ** 2 * w_8 * w_9 / 96 + w_5 * w_7 ** 2 * w_9 ** 2 / 288 + w_5 * w_7 * w_8 ** 2 * w_9 / 96 + w_5 * w_7 * w_8 * w_9 ** 2 / 96 - w_5 * w_8 ** 4 / 1440 + w_5 * w_8 ** 2 * w_9 ** 2 / 288 - w_5 * w_9 ** 4 / 1440 - w_6 ** 4 * w_7 / 1440 - w_6 ** 4 * w_8 / 1440 - w_6 ** 4 * w_9 / 1440 + w_6 ** 2 * w_7 ** 2 * w_8 / 288 + w_6 ** 2 * w_7 ** 2 * w_9 / 288 + w_6 ** 2 * w_7 * w_8 ** 2 / 288 + w_6 ** 2 * w_7 * w_8 * w_9 / 96 + w_6 ** 2 * w_7 * w_9 ** 2 / 288 + w_6 ** 2 * w_8 ** 2 * w_9 / 288 + w_6 ** 2 * w_8 * w_9 ** 2 / 288 - w_6 * w_7 ** 4 / 1440 + w_6 * w_7 ** 2 * w_8 ** 2 / 288 + w_6 * w_7 ** 2 * w_8 * w_9 / 96 + w_6 * w_7 ** 2 * w_9 ** 2 / 288 + w_6 * w_7 * w_8 ** 2 * w_9 / 96 + w_6 * w_7 * w_8 * w_9 ** 2 / 96 - w_6 * w_8 ** 4 / 1440 + w_6 * w_8 ** 2 * w_9 ** 2 / 288 - w_6 * w_9 ** 4 / 1440 - w_7 ** 4 * w_8 / 1440 - w_7 ** 4 * w_9 / 1440 + w_7 ** 2 * w_8 ** 2 * w_9 / 288 + w_7 ** 2 * w_8 * w_9 ** 2 / 288 - w_7 * w_8 ** 4 / 1440 + w_7 * w_8 ** 2 * w_9 ** 2 / 288 - w_7 * w_9 ** 4 / 1440 - w_8 ** 4 * w_9 / 1440 - w_8 * w_9 ** 4 / 1440
-    if s == 6 and ln == 9:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        w_9 = sym.Symbol("w_9")
-        return w_1 ** 6 / 30240 - w_1 ** 4 * w_2 ** 2 / 8640 - w_1 ** 4 * w_2 * w_3 / 2880 - w_1 ** 4 * w_2 * w_4 / 2880 - w_1 ** 4 * w_2 * w_5 / 2880 - w_1 ** 4 * w_2 * w_6 / 2880 - w_1 ** 4 * w_2 * w_7 / 2880 - w_1 ** 4 * w_2 * w_8 / 2880 - w_1 ** 4 * w_2 * w_9 / 2880 - w_1 ** 4 * w_3 ** 2 / 8640 - w_1 ** 4 * w_3 * w_4 / 2880 - w_1 ** 4 * w_3 * w_5 / 2880 - w_1 ** 4 * w_3 * w_6 / 2880 - w_1 ** 4 * w_3 * w_7 / 2880 - w_1 ** 4 * w_3 * w_8 / 2880 - w_1 ** 4 * w_3 * w_9 / 2880 - w_1 ** 4 * w_4 ** 2 / 8640 - w_1 ** 4 * w_4 * w_5 / 2880 - w_1 ** 4 * w_4 * w_6 / 2880 - w_1 ** 4 * w_4 * w_7 / 2880 - w_1 ** 4 * w_4 * w_8 / 2880 - w_1 ** 4 * w_4 * w_9 / 2880 - w_1 ** 4 * w_5 ** 2 / 8640 - w_1 ** 4 * w_5 * w_6 / 2880 - w_1 ** 4 * w_5 * w_7 / 2880 - w_1 ** 4 * w_5 * w_8 / 2880 - w_1 ** 4 * w_5 * w_9 / 2880 - w_1 ** 4 * w_6 ** 2 / 8640 - w_1 ** 4 * w_6 * w_7 / 2880 - w_1 ** 4 * w_6 * w_8 / 2880 - w_1 ** 4 * w_6 * w_9 / 2880 - w_1 ** 4 * w_7 ** 2 / 8640 - w_1 ** 4 * w_7 * w_8 / 2880 - w_1 ** 4 * w_7 * w_9 / 2880 - w_1 ** 4 * w_8 ** 2 / 8640 - w_1 ** 4 * w_8 * w_9 / 2880 - w_1 ** 4 * w_9 ** 2 / 8640 - w_1 ** 2 * w_2 ** 4 / 8640 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_6 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_7 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_8 / 576 + w_1 ** 2 * w_2 ** 2 * w_3 * w_9 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 * w_6 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 * w_7 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 * w_8 / 576 + w_1 ** 2 * w_2 ** 2 * w_4 * w_9 / 576 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_5 * w_6 / 576 + w_1 ** 2 * w_2 ** 2 * w_5 * w_7 / 576 + w_1 ** 2 * w_2 ** 2 * w_5 * w_8 / 576 + w_1 ** 2 * w_2 ** 2 * w_5 * w_9 / 576 + w_1 ** 2 * w_2 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_6 * w_7 / 576 + w_1 ** 2 * w_2 ** 2 * w_6 * w_8 / 576 + w_1 ** 2 * w_2 ** 2 * w_6 * w_9 / 576 + w_1 ** 2 * w_2 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_7 * w_8 / 576 + w_1 ** 2 * w_2 ** 2 * w_7 * w_9 / 576 + w_1 ** 2 * w_2 ** 2 * w_8 ** 2 / 1728 + w_1 ** 2 * w_2 ** 2 * w_8 * w_9 / 576 + w_1 ** 2 * w_2 ** 2 * w_9 ** 2 / 1728 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_6 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_7 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_8 / 576 + w_1 ** 2 * w_2 * w_3 ** 2 * w_9 / 576 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 / 192 + w_1 ** 2 * w_2 * w_3 * w_4 * w_6 / 192 + w_1 ** 2 * w_2 * w_3 * w_4 * w_7 / 192 + w_1 ** 2 * w_2 * w_3 * w_4 * w_8 / 192 + w_1 ** 2 * w_2 * w_3 * w_4 * w_9 / 192 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_5 * w_6 / 192 + w_1 ** 2 * w_2 * w_3 * w_5 * w_7 / 192 + w_1 ** 2 * w_2 * w_3 * w_5 * w_8 / 192 + w_1 ** 2 * w_2 * w_3 * w_5 * w_9 / 192 + w_1 ** 2 * w_2 * w_3 * w_6 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_6 * w_7 / 192 + w_1 ** 2 * w_2 * w_3 * w_6 * w_8 / 192 + w_1 ** 2 * w_2 * w_3 * w_6 * w_9 / 192 + w_1 ** 2 * w_2 * w_3 * w_7 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_7 * w_8 / 192 + w_1 ** 2 * w_2 * w_3 * w_7 * w_9 / 192 + w_1 ** 2 * w_2 * w_3 * w_8 ** 2 / 576 + w_1 ** 2 * w_2 * w_3 * w_8 * w_9 / 192 + w_1 ** 2 * w_2 * w_3 * w_9 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_6 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_7 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_8 / 576 + w_1 ** 2 * w_2 * w_4 ** 2 * w_9 / 576 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 * w_5 * w_6 / 192 + w_1 ** 2 * w_2 * w_4 * w_5 * w_7 / 192 + w_1 ** 2 * w_2 * w_4 * w_5 * w_8 / 192 + w_1 ** 2 * w_2 * w_4 * w_5 * w_9 / 192 + w_1 ** 2 * w_2 * w_4 * w_6 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 * w_6 * w_7 / 192 + w_1 ** 2 * w_2 * w_4 * w_6 * w_8 / 192 + w_1 ** 2 * w_2 * w_4 * w_6 * w_9 / 192 + w_1 ** 2 * w_2 * w_4 * w_7 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 * w_7 * w_8 / 192 + w_1 ** 2 * w_2 * w_4 * w_7 * w_9 / 192 + w_1 ** 2 * w_2 * w_4 * w_8 ** 2 / 576 + w_1 ** 2 * w_2 * w_4 * w_8 * w_9 / 192 + w_1 ** 2 * w_2 * w_4 * w_9 ** 2 / 576 + w_1 ** 2 * w_2 * w_5 ** 2 * w_6 / 576 + w_1 ** 2 * w_2 * w_5 ** 2 * w_7 / 576 + w_1 ** 2 * w_2 * w_5 ** 2 * w_8 / 576 + w_1 ** 2 * w_2 * w_5 ** 2 * w_9 / 576 + w_1 ** 2 * w_2 * w_5 * w_6 ** 2 / 576 + w_1 ** 2 * w_2 * w_5 * w_6 * w_7 / 192 + w_1 ** 2 * w_2 * w_5 * w_6 * w_8 / 192 + w_1 ** 2 * w_2 * w_5 * w_6 * w_9 / 192 + w_1 ** 2 * w_2 * w_5 * w_7 ** 2 / 576 + w_1 ** 2 * w_2 * w_5 * w_7 * w_8 / 192 + w_1 ** 2 * w_2 * w_5 * w_7 * w_9 / 192 + w_1 ** 2 * w_2 * w_5 * w_8 ** 2 / 576 + w_1 ** 2 * w_2 * w_5 * w_8 * w_9 / 192 + w_1 ** 2 * w_2 * w_5 * w_9 ** 2 / 576 + w_1 ** 2 * w_2 * w_6 ** 2 * w_7 / 576 + w_1 ** 2 * w_2 * w_6 ** 2 * w_8 / 576 + w_1 ** 2 * w_2 * w_6 ** 2 * w_9 / 576 + w_1 ** 2 * w_2 * w_6 * w_7 ** 2 / 576 + w_1 ** 2 * w_2 * w_6 * w_7 * w_8 / 192 + w_1 ** 2 * w_2 * w_6 * w_7 * w_9 / 192 + w_1 ** 2 * w_2 * w_6 * w_8 ** 2 / 576 + w_1 ** 2 * w_2 * w_6 * w_8 * w_9 / 192 + w_1 ** 2 * w_2 * w_6 * w_9 ** 2 / 576 + w_1 ** 2 * w_2 * w_7 ** 2 * w_8 / 576 + w_1 ** 2 * w_2 * w_7 ** 2 * w_9 / 576 + w_1 ** 2 * w_2 * w_7 * w_8 ** 2 / 576 + w_1 ** 2 * w_2 * w_7 * w_8 * w_9 / 192 + w_1 ** 2 * w_2 * w_7 * w_9 ** 2 / 576 + w_1 ** 2 * w_2 * w_8 ** 2 * w_9 / 576 + w_1 ** 2 * w_2 * w_8 * w_9 ** 2 / 576 - w_1 ** 2 * w_3 ** 4 / 8640 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 / 576 + w_1 ** 2 * w_3 ** 2 * w_4 * w_6 / 576 + w_1 ** 2 * w_3 ** 2 * w_4 * w_7 / 576 + w_1 ** 2 * w_3 ** 2 * w_4 * w_8 / 576 + w_1 ** 2 * w_3 ** 2 * w_4 * w_9 / 576 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_5 * w_6 / 576 + w_1 ** 2 * w_3 ** 2 * w_5 * w_7 / 576 + w_1 ** 2 * w_3 ** 2 * w_5 * w_8 / 576 + w_1 ** 2 * w_3 ** 2 * w_5 * w_9 / 576 + w_1 ** 2 * w_3 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_6 * w_7 / 576 + w_1 ** 2 * w_3 ** 2 * w_6 * w_8 / 576 + w_1 ** 2 * w_3 ** 2 * w_6 * w_9 / 576 + w_1 ** 2 * w_3 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_7 * w_8 / 576 + w_1 ** 2 * w_3 ** 2 * w_7 * w_9 / 576 + w_1 ** 2 * w_3 ** 2 * w_8 ** 2 / 1728 + w_1 ** 2 * w_3 ** 2 * w_8 * w_9 / 576 + w_1 ** 2 * w_3 ** 2 * w_9 ** 2 / 1728 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 / 576 + w_1 ** 2 * w_3 * w_4 ** 2 * w_6 / 576 + w_1 ** 2 * w_3 * w_4 ** 2 * w_7 / 576 + w_1 ** 2 * w_3 * w_4 ** 2 * w_8 / 576 + w_1 ** 2 * w_3 * w_4 ** 2 * w_9 / 576 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 / 576 + w_1 ** 2 * w_3 * w_4 * w_5 * w_6 / 192 + w_1 ** 2 * w_3 * w_4 * w_5 * w_7 / 192 + w_1 ** 2 * w_3 * w_4 * w_5 * w_8 / 192 + w_1 ** 2 * w_3 * w_4 * w_5 * w_9 / 192 + w_1 ** 2 * w_3 * w_4 * w_6 ** 2 / 576 + w_1 ** 2 * w_3 * w_4 * w_6 * w_7 / 192 + w_1 ** 2 * w_3 * w_4 * w_6 * w_8 / 192 + w_1 ** 2 * w_3 * w_4 * w_6 * w_9 / 192 + w_1 ** 2 * w_3 * w_4 * w_7 ** 2 / 576 + w_1 ** 2 * w_3 * w_4 * w_7 * w_8 / 192 + w_1 ** 2 * w_3 * w_4 * w_7 * w_9 / 192 + w_1 ** 2 * w_3 * w_4 * w_8 ** 2 / 576 + w_1 ** 2 * w_3 * w_4 * w_8 * w_9 / 192 + w_1 ** 2 * w_3 * w_4 * w_9 ** 2 / 576 + w_1 ** 2 * w_3 * w_5 ** 2 * w_6 / 576 + w_1 ** 2 * w_3 * w_5 ** 2 * w_7 / 576 + w_1 ** 2 * w_3 * w_5 ** 2 * w_8 / 576 + w_1 ** 2 * w_3 * w_5 ** 2 * w_9 / 576 + w_1 ** 2 * w_3 * w_5 * w_6 ** 2 / 576 + w_1 ** 2 * w_3 * w_5 * w_6 * w_7 / 192 + w_1 ** 2 * w_3 * w_5 * w_6 * w_8 / 192 + w_1 ** 2 * w_3 * w_5 * w_6 * w_9 / 192 + w_1 ** 2 * w_3 * w_5 * w_7 ** 2 / 576 + w_1 ** 2 * w_3 * w_5 * w_7 * w_8 / 192 + w_1 ** 2 * w_3 * w_5 * w_7 * w_9 / 192 + w_1 ** 2 * w_3 * w_5 * w_8 ** 2 / 576 + w_1 ** 2 * w_3 * w_5 * w_8 * w_9 / 192 + w_1 ** 2 * w_3 * w_5 * w_9 ** 2 / 576 + w_1 ** 2 * w_3 * w_6 ** 2 * w_7 / 576 + w_1 ** 2 * w_3 * w_6 ** 2 * w_8 / 576 + w_1 ** 2 * w_3 * w_6 ** 2 * w_9 / 576 + w_1 ** 2 * w_3 * w_6 * w_7 ** 2 / 576 + w_1 ** 2 * w_3 * w_6 * w_7 * w_8 / 192 + w_1 ** 2 * w_3 * w_6 * w_7 * w_9 / 192 + w_1 ** 2 * w_3 * w_6 * w_8 ** 2 / 576 + w_1 ** 2 * w_3 * w_6 * w_8 * w_9 / 192 + w_1 ** 2 * w_3 * w_6 * w_9 ** 2 / 576 + w_1 ** 2 * w_3 * w_7 ** 2 * w_8 / 576 + w_1 ** 2 * w_3 * w_7 ** 2 * w_9 / 576 + w_1 ** 2 * w_3 * w_7 * w_8 ** 2 / 576 + w_1 ** 2 * w_3 * w_7 * w_8 * w_9 / 192 + w_1 ** 2 * w_3 * w_7 * w_9 ** 2 / 576 + w_1 ** 2 * w_3 * w_8 ** 2 * w_9 / 576 + w_1 ** 2 * w_3 * w_8 * w_9 ** 2 / 576 - w_1 ** 2 * w_4 ** 4 / 8640 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 + w_1 ** 2 * w_4 ** 2 * w_5 * w_6 / 576 + w_1 ** 2 * w_4 ** 2 * w_5 * w_7 / 576 + w_1 ** 2 * w_4 ** 2 * w_5 * w_8 / 576 + w_1 ** 2 * w_4 ** 2 * w_5 * w_9 / 576 + w_1 ** 2 * w_4 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_4 ** 2 * w_6 * w_7 / 576 + w_1 ** 2 * w_4 ** 2 * w_6 * w_8 / 576 + w_1 ** 2 * w_4 ** 2 * w_6 * w_9 / 576 + w_1 ** 2 * w_4 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_4 ** 2 * w_7 * w_8 / 576 + w_1 ** 2 * w_4 ** 2 * w_7 * w_9 / 576 + w_1 ** 2 * w_4 ** 2 * w_8 ** 2 / 1728 + w_1 ** 2 * w_4 ** 2 * w_8 * w_9 / 576 + w_1 ** 2 * w_4 ** 2 * w_9 ** 2 / 1728 + w_1 ** 2 * w_4 * w_5 ** 2 * w_6 / 576 + w_1 ** 2 * w_4 * w_5 ** 2 * w_7 / 576 + w_1 ** 2 * w_4 * w_5 ** 2 * w_8 / 576 + w_1 ** 2 * w_4 * w_5 ** 2 * w_9 / 576 + w_1 ** 2 * w_4 * w_5 * w_6 ** 2 / 576 + w_1 ** 2 * w_4 * w_5 * w_6 * w_7 / 192 + w_1 ** 2 * w_4 * w_5 * w_6 * w_8 / 192 + w_1 ** 2 * w_4 * w_5 * w_6 * w_9 / 192 + w_1 ** 2 * w_4 * w_5 * w_7 ** 2 / 576 + w_1 ** 2 * w_4 * w_5 * w_7 * w_8 / 192 + w_1 ** 2 * w_4 * w_5 * w_7 * w_9 / 192 + w_1 ** 2 * w_4 * w_5 * w_8 ** 2 / 576 + w_1 ** 2 * w_4 * w_5 * w_8 * w_9 / 192 + w_1 ** 2 * w_4 * w_5 * w_9 ** 2 / 576 + w_1 ** 2 * w_4 * w_6 ** 2 * w_7 / 576 + w_1 ** 2 * w_4 * w_6 ** 2 * w_8 / 576 + w_1 ** 2 * w_4 * w_6 ** 2 * w_9 / 576 + w_1 ** 2 * w_4 * w_6 * w_7 ** 2 / 576 + w_1 ** 2 * w_4 * w_6 * w_7 * w_8 / 192 + w_1 ** 2 * w_4 * w_6 * w_7 * w_9 / 192 + w_1 ** 2 * w_4 * w_6 * w_8 ** 2 / 576 + w_1 ** 2 * w_4 * w_6 * w_8 * w_9 / 192 + w_1 ** 2 * w_4 * w_6 * w_9 ** 2 / 576 + w_1 ** 2 * w_4 * w_7 ** 2 * w_8 / 576 + w_1 ** 2 * w_4 * w_7 ** 2 * w_9 / 576 + w_1 ** 2 * w_4 * w_7 * w_8 ** 2 / 576 + w_1 ** 2 * w_4 * w_7 * w_8 * w_9 / 192 + w_1 ** 2 * w_4 * w_7 * w_9 ** 2 / 576 + w_1 ** 2 * w_4 * w_8 ** 2 * w_9 / 576 + w_1 ** 2 * w_4 * w_8 * w_9 ** 2 / 576 - w_1 ** 2 * w_5 ** 4 / 8640 + w_1 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 + w_1 ** 2 * w_5 ** 2 * w_6 * w_7 / 576 + w_1 ** 2 * w_5 ** 2 * w_6 * w_8 / 576 + w_1 ** 2 * w_5 ** 2 * w_6 * w_9 / 576 + w_1 ** 2 * w_5 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_5 ** 2 * w_7 * w_8 / 576 + w_1 ** 2 * w_5 ** 2 * w_7 * w_9 / 576 + w_1 ** 2 * w_5 ** 2 * w_8 ** 2 / 1728 + w_1 ** 2 * w_5 ** 2 * w_8 * w_9 / 576 + w_1 ** 2 * w_5 ** 2 * w_9 ** 2 / 1728 + w_1 ** 2 * w_5 * w_6 ** 2 * w_7 / 576 + w_1 ** 2 * w_5 * w_6 ** 2 * w_8 / 576 + w_1 ** 2 * w_5 * w_6 ** 2 * w_9 / 576 + w_1 ** 2 * w_5 * w_6 * w_7 ** 2 / 576 + w_1 ** 2 * w_5 * w_6 * w_7 * w_8 / 192 + w_1 ** 2 * w_5 * w_6 * w_7 * w_9 / 192 + w_1 ** 2 * w_5 * w_6 * w_8 ** 2 / 576 + w_1 ** 2 * w_5 * w_6 * w_8 * w_9 / 192 + w_1 ** 2 * w_5 * w_6 * w_9 ** 2 / 576 + w_1 ** 2 * w_5 * w_7 ** 2 * w_8 / 576 + w_1 ** 2 * w_5 * w_7 ** 2 * w_9 / 576 + w_1 ** 2 * w_5 * w_7 * w_8 ** 2 / 576 + w_1 ** 2 * w_5 * w_7 * w_8 * w_9 / 192 + w_1 ** 2 * w_5 * w_7 * w_9 ** 2 / 576 + w_1 ** 2 * w_5 * w_8 ** 2 * w_9 / 576 + w_1 ** 2 * w_5 * w_8 * w_9 ** 2 / 576 - w_1 ** 2 * w_6 ** 4 / 8640 + w_1 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 + w_1 ** 2 * w_6 ** 2 * w_7 * w_8 / 576 + w_1 ** 2 * w_6 ** 2 * w_7 * w_9 / 576 + w_1 ** 2 * w_6 ** 2 * w_8 ** 2 / 1728 + w_1 ** 2 * w_6 ** 2 * w_8 * w_9 / 576 + w_1 ** 2 * w_6 ** 2 * w_9 ** 2 / 1728 + w_1 ** 2 * w_6 * w_7 ** 2 * w_8 / 576 + w_1 ** 2 * w_6 * w_7 ** 2 * w_9 / 576 + w_1 ** 2 * w_6 * w_7 * w_8 ** 2 / 576 + w_1 ** 2 * w_6 * w_7 * w_8 * w_9 / 192 + w_1 ** 2 * w_6 * w_7 * w_9 ** 2 / 576 + w_1 ** 2 * w_6 * w_8 ** 2 * w_9 / 576 + w_1 ** 2 * w_6 * w_8 * w_9 ** 2 / 576 - w_1 ** 2 * w_7 ** 4 / 8640 + w_1 ** 2 * w_7 ** 2 * w_8 ** 2 / 1728 + w_1 ** 2 * w_7 ** 2 * w_8 * w_9 / 576 + w_1 ** 2 * w_7 ** 2 * w_9 ** 2 / 1728 + w_1 ** 2 * w_7 * w_8 ** 2 * w_9 / 576 + w_1 ** 2 * w_7 * w_8 * w_9 ** 2 / 576 - w_1 ** 2 * w_8 ** 4 / 8640 + w_1 ** 2 * w_8 ** 2 * w_9 ** 2 / 1728 - w_1 ** 2 * w_9 ** 4 / 8640 - w_1 * w_2 ** 4 * w_3 / 2880 - w_1 * w_2 ** 4 * w_4 / 2880 - w_1 * w_2 ** 4 * w_5 / 2880 - w_1 * w_2 ** 4 * w_6 / 2880 - w_1 * w_2 ** 4 * w_7 / 2880 - w_1 * w_2 ** 4 * w_8 / 2880 - w_1 * w_2 ** 4 * w_9 / 2880 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_6 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_7 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_8 / 576 + w_1 * w_2 ** 2 * w_3 ** 2 * w_9 / 576 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 / 192 + w_1 * w_2 ** 2 * w_3 * w_4 * w_6 / 192 + w_1 * w_2 ** 2 * w_3 * w_4 * w_7 / 192 + w_1 * w_2 ** 2 * w_3 * w_4 * w_8 / 192 + w_1 * w_2 ** 2 * w_3 * w_4 * w_9 / 192 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_5 * w_6 / 192 + w_1 * w_2 ** 2 * w_3 * w_5 * w_7 / 192 + w_1 * w_2 ** 2 * w_3 * w_5 * w_8 / 192 + w_1 * w_2 ** 2 * w_3 * w_5 * w_9 / 192 + w_1 * w_2 ** 2 * w_3 * w_6 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_6 * w_7 / 192 + w_1 * w_2 ** 2 * w_3 * w_6 * w_8 / 192 + w_1 * w_2 ** 2 * w_3 * w_6 * w_9 / 192 + w_1 * w_2 ** 2 * w_3 * w_7 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_7 * w_8 / 192 + w_1 * w_2 ** 2 * w_3 * w_7 * w_9 / 192 + w_1 * w_2 ** 2 * w_3 * w_8 ** 2 / 576 + w_1 * w_2 ** 2 * w_3 * w_8 * w_9 / 192 + w_1 * w_2 ** 2 * w_3 * w_9 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_6 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_7 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_8 / 576 + w_1 * w_2 ** 2 * w_4 ** 2 * w_9 / 576 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 * w_5 * w_6 / 192 + w_1 * w_2 ** 2 * w_4 * w_5 * w_7 / 192 + w_1 * w_2 ** 2 * w_4 * w_5 * w_8 / 192 + w_1 * w_2 ** 2 * w_4 * w_5 * w_9 / 192 + w_1 * w_2 ** 2 * w_4 * w_6 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 * w_6 * w_7 / 192 + w_1 * w_2 ** 2 * w_4 * w_6 * w_8 / 192 + w_1 * w_2 ** 2 * w_4 * w_6 * w_9 / 192 + w_1 * w_2 ** 2 * w_4 * w_7 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 * w_7 * w_8 / 192 + w_1 * w_2 ** 2 * w_4 * w_7 * w_9 / 192 + w_1 * w_2 ** 2 * w_4 * w_8 ** 2 / 576 + w_1 * w_2 ** 2 * w_4 * w_8 * w_9 / 192 + w_1 * w_2 ** 2 * w_4 * w_9 ** 2 / 576 + w_1 * w_2 ** 2 * w_5 ** 2 * w_6 / 576 + w_1 * w_2 ** 2 * w_5 ** 2 * w_7 / 576 + w_1 * w_2 ** 2 * w_5 ** 2 * w_8 / 576 + w_1 * w_2 ** 2 * w_5 ** 2 * w_9 / 576 + w_1 * w_2 ** 2 * w_5 * w_6 ** 2 / 576 + w_1 * w_2 ** 2 * w_5 * w_6 * w_7 / 192 + w_1 * w_2 ** 2 * w_5 * w_6 * w_8 / 192 + w_1 * w_2 ** 2 * w_5 * w_6 * w_9 / 192 + w_1 * w_2 ** 2 * w_5 * w_7 ** 2 / 576 + w_1 * w_2 ** 2 * w_5 * w_7 * w_8 / 192 + w_1 * w_2 ** 2 * w_5 * w_7 * w_9 / 192 + w_1 * w_2 ** 2 * w_5 * w_8 ** 2 / 576 + w_1 * w_2 ** 2 * w_5 * w_8 * w_9 / 192 + w_1 * w_2 ** 2 * w_5 * w_9 ** 2 / 576 + w_1 * w_2 ** 2 * w_6 ** 2 * w_7 / 576 + w_1 * w_2 ** 2 * w_6 ** 2 * w_8 / 576 + w_1 * w_2 ** 2 * w_6 ** 2 * w_9 / 576 + w_1 * w_2 ** 2 * w_6 * w_7 ** 2 / 576 + w_1 * w_2 ** 2 * w_6 * w_7 * w_8 / 192 + w_1 * w_2 ** 2 * w_6 * w_7 * w_9 / 192 + w_1 * w_2 ** 2 * w_6 * w_8 ** 2 / 576 + w_1 * w_2 ** 2 * w_6 * w_8 * w_9 / 192 + w_1 * w_2 ** 2 * w_6 * w_9 ** 2 / 576 + w_1 * w_2 ** 2 * w_7 ** 2 * w_8 / 576 + w_1 * w_2 ** 2 * w_7 ** 2 * w_9 / 576 + w_1 * w_2 ** 2 * w_7 * w_8 ** 2 / 576 + w_1 * w_2 ** 2 * w_7 * w_8 * w_9 / 192 + w_1 * w_2 ** 2 * w_7 * w_9 ** 2 / 576 + w_1 * w_2 ** 2 * w_8 ** 2 * w_9 / 576 + w_1 * w_2 ** 2 * w_8 * w_9 ** 2 / 576 - w_1 * w_2 * w_3 ** 4 / 2880 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 / 192 + w_1 * w_2 * w_3 ** 2 * w_4 * w_6 / 192 + w_1 * w_2 * w_3 ** 2 * w_4 * w_7 / 192 + w_1 * w_2 * w_3 ** 2 * w_4 * w_8 / 192 + w_1 * w_2 * w_3 ** 2 * w_4 * w_9 / 192 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_5 * w_6 / 192 + w_1 * w_2 * w_3 ** 2 * w_5 * w_7 / 192 + w_1 * w_2 * w_3 ** 2 * w_5 * w_8 / 192 + w_1 * w_2 * w_3 ** 2 * w_5 * w_9 / 192 + w_1 * w_2 * w_3 ** 2 * w_6 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_6 * w_7 / 192 + w_1 * w_2 * w_3 ** 2 * w_6 * w_8 / 192 + w_1 * w_2 * w_3 ** 2 * w_6 * w_9 / 192 + w_1 * w_2 * w_3 ** 2 * w_7 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_7 * w_8 / 192 + w_1 * w_2 * w_3 ** 2 * w_7 * w_9 / 192 + w_1 * w_2 * w_3 ** 2 * w_8 ** 2 / 576 + w_1 * w_2 * w_3 ** 2 * w_8 * w_9 / 192 + w_1 * w_2 * w_3 ** 2 * w_9 ** 2 / 576 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 / 192 + w_1 * w_2 * w_3 * w_4 ** 2 * w_6 / 192 + w_1 * w_2 * w_3 * w_4 ** 2 * w_7 / 192 + w_1 * w_2 * w_3 * w_4 ** 2 * w_8 / 192 + w_1 * w_2 * w_3 * w_4 ** 2 * w_9 / 192 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 / 192 + w_1 * w_2 * w_3 * w_4 * w_5 * w_6 / 64 + w_1 * w_2 * w_3 * w_4 * w_5 * w_7 / 64 + w_1 * w_2 * w_3 * w_4 * w_5 * w_8 / 64 + w_1 * w_2 * w_3 * w_4 * w_5 * w_9 / 64 + w_1 * w_2 * w_3 * w_4 * w_6 ** 2 / 192 + w_1 * w_2 * w_3 * w_4 * w_6 * w_7 / 64 + w_1 * w_2 * w_3 * w_4 * w_6 * w_8 / 64 + w_1 * w_2 * w_3 * w_4 * w_6 * w_9 / 64 + w_1 * w_2 * w_3 * w_4 * w_7 ** 2 / 192 + w_1 * w_2 * w_3 * w_4 * w_7 * w_8 / 64 + w_1 * w_2 * w_3 * w_4 * w_7 * w_9 / 64 + w_1 * w_2 * w_3 * w_4 * w_8 ** 2 / 192 + w_1 * w_2 * w_3 * w_4 * w_8 * w_9 / 64 + w_1 * w_2 * w_3 * w_4 * w_9 ** 2 / 192 + w_1 * w_2 * w_3 * w_5 ** 2 * w_6 / 192 + w_1 * w_2 * w_3 * w_5 ** 2 * w_7 / 192 + w_1 * w_2 * w_3 * w_5 ** 2 * w_8 / 192 + w_1 * w_2 * w_3 * w_5 ** 2 * w_9 / 192 + w_1 * w_2 * w_3 * w_5 * w_6 ** 2 / 192 + w_1 * w_2 * w_3 * w_5 * w_6 * w_7 / 64 + w_1 * w_2 * w_3 * w_5 * w_6 * w_8 / 64 + w_1 * w_2 * w_3 * w_5 * w_6 * w_9 / 64 + w_1 * w_2 * w_3 * w_5 * w_7 ** 2 / 192 + w_1 * w_2 * w_3 * w_5 * w_7 * w_8 / 64 + w_1 * w_2 * w_3 * w_5 * w_7 * w_9 / 64 + w_1 * w_2 * w_3 * w_5 * w_8 ** 2 / 192 + w_1 * w_2 * w_3 * w_5 * w_8 * w_9 / 64 + w_1 * w_2 * w_3 * w_5 * w_9 ** 2 / 192 + w_1 * w_2 * w_3 * w_6 ** 2 * w_7 / 192 + w_1 * w_2 * w_3 * w_6 ** 2 * w_8 / 192 + w_1 * w_2 * w_3 * w_6 ** 2 * w_9 / 192 + w_1 * w_2 * w_3 * w_6 * w_7 ** 2 / 192 + w_1 * w_2 * w_3 * w_6 * w_7 * w_8 / 64 + w_1 * w_2 * w_3 * w_6 * w_7 * w_9 / 64 + w_1 * w_2 * w_3 * w_6 * w_8 ** 2 / 192 + w_1 * w_2 * w_3 * w_6 * w_8 * w_9 / 64 + w_1 * w_2 * w_3 * w_6 * w_9 ** 2 / 192 + w_1 * w_2 * w_3 * w_7 ** 2 * w_8 / 192 + w_1 * w_2 * w_3 * w_7 ** 2 * w_9 / 192 + w_1 * w_2 * w_3 * w_7 * w_8 ** 2 / 192 + w_1 * w_2 * w_3 * w_7 * w_8 * w_9 / 64 + w_1 * w_2 * w_3 * w_7 * w_9 ** 2 / 192 + w_1 * w_2 * w_3 * w_8 ** 2 * w_9 / 192 + w_1 * w_2 * w_3 * w_8 * w_9 ** 2 / 192 - w_1 * w_2 * w_4 ** 4 / 2880 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 / 576 + w_1 * w_2 * w_4 ** 2 * w_5 * w_6 / 192 + w_1 * w_2 * w_4 ** 2 * w_5 * w_7 / 192 + w_1 * w_2 * w_4 ** 2 * w_5 * w_8 / 192 + w_1 * w_2 * w_4 ** 2 * w_5 * w_9 / 192 + w_1 * w_2 * w_4 ** 2 * w_6 ** 2 / 576 + w_1 * w_2 * w_4 ** 2 * w_6 * w_7 / 192 + w_1 * w_2 * w_4 ** 2 * w_6 * w_8 / 192 + w_1 * w_2 * w_4 ** 2 * w_6 * w_9 / 192 + w_1 * w_2 * w_4 ** 2 * w_7 ** 2 / 576 + w_1 * w_2 * w_4 ** 2 * w_7 * w_8 / 192 + w_1 * w_2 * w_4 ** 2 * w_7 * w_9 / 192 + w_1 * w_2 * w_4 ** 2 * w_8 ** 2 / 576 + w_1 * w_2 * w_4 ** 2 * w_8 * w_9 / 192 + w_1 * w_2 * w_4 ** 2 * w_9 ** 2 / 576 + w_1 * w_2 * w_4 * w_5 ** 2 * w_6 / 192 + w_1 * w_2 * w_4 * w_5 ** 2 * w_7 / 192 + w_1 * w_2 * w_4 * w_5 ** 2 * w_8 / 192 + w_1 * w_2 * w_4 * w_5 ** 2 * w_9 / 192 + w_1 * w_2 * w_4 * w_5 * w_6 ** 2 / 192 + w_1 * w_2 * w_4 * w_5 * w_6 * w_7 / 64 + w_1 * w_2 * w_4 * w_5 * w_6 * w_8 / 64 + w_1 * w_2 * w_4 * w_5 * w_6 * w_9 / 64 + w_1 * w_2 * w_4 * w_5 * w_7 ** 2 / 192 + w_1 * w_2 * w_4 * w_5 * w_7 * w_8 / 64 + w_1 * w_2 * w_4 * w_5 * w_7 * w_9 / 64 + w_1 * w_2 * w_4 * w_5 * w_8 ** 2 / 192 + w_1 * w_2 * w_4 * w_5 * w_8 * w_9 / 64 + w_1 * w_2 * w_4 * w_5 * w_9 ** 2 / 192 + w_1 * w_2 * w_4 * w_6 ** 2 * w_7 / 192 + w_1 * w_2 * w_4 * w_6 ** 2 * w_8 / 192 + w_1 * w_2 * w_4 * w_6 ** 2 * w_9 / 192 + w_1 * w_2 * w_4 * w_6 * w_7 ** 2 / 192 + w_1 * w_2 * w_4 * w_6 * w_7 * w_8 / 64 + w_1 * w_2 * w_4 * w_6 * w_7 * w_9 / 64 + w_1 * w_2 * w_4 * w_6 * w_8 ** 2 / 192 + w_1 * w_2 * w_4 * w_6 * w_8 * w_9 / 64 + w_1 * w_2 * w_4 * w_6 * w_9 ** 2 / 192 + w_1 * w_2 * w_4 * w_7 ** 2 * w_8 / 192 + w_1 * w_2 * w_4 * w_7 ** 2 * w_9 / 192 + w_1 * w_2 * w_4 * w_7 * w_8 ** 2 / 192 + w_1 * w_2 * w_4 * w_7 * w_8 * w_9 / 64 + w_1 * w_2 * w_4 * w_7 * w_9 ** 2 / 192 + w_1 * w_2 * w_4 * w_8 ** 2 * w_9 / 192 + w_1 * w_2 * w_4 * w_8 * w_9 ** 2 / 192 - w_1 * w_2 * w_5 ** 4 / 2880 + w_1 * w_2 * w_5 ** 2 * w_6 ** 2 / 576 + w_1 * w_2 * w_5 ** 2 * w_6 * w_7 / 192 + w_1 * w_2 * w_5 ** 2 * w_6 * w_8 / 192 + w_1 * w_2 * w_5 ** 2 * w_6 * w_9 / 192 + w_1 * w_2 * w_5 ** 2 * w_7 ** 2 / 576 + w_1 * w_2 * w_5 ** 2 * w_7 * w_8 / 192 + w_1 * w_2 * w_5 ** 2 * w_7 * w_9 / 192 + w_1 * w_2 * w_5 ** 2 * w_8 ** 2 / 576 + w_1 * w_2 * w_5 ** 2 * w_8 * w_9 / 192 + w_1 * w_2 * w_5 ** 2 * w_9 ** 2 / 576 + w_1 * w_2 * w_5 * w_6 ** 2 * w_7 / 192 + w_1 * w_2 * w_5 * w_6 ** 2 * w_8 / 192 + w_1 * w_2 * w_5 * w_6 ** 2 * w_9 / 192 + w_1 * w_2 * w_5 * w_6 * w_7 ** 2 / 192 + w_1 * w_2 * w_5 * w_6 * w_7 * w_8 / 64 + w_1 * w_2 * w_5 * w_6 * w_7 * w_9 / 64 + w_1 * w_2 * w_5 * w_6 * w_8 ** 2 / 192 + w_1 * w_2 * w_5 * w_6 * w_8 * w_9 / 64 + w_1 * w_2 * w_5 * w_6 * w_9 ** 2 / 192 + w_1 * w_2 * w_5 * w_7 ** 2 * w_8 / 192 + w_1 * w_2 * w_5 * w_7 ** 2 * w_9 / 192 + w_1 * w_2 * w_5 * w_7 * w_8 ** 2 / 192 + w_1 * w_2 * w_5 * w_7 * w_8 * w_9 / 64 + w_1 * w_2 * w_5 * w_7 * w_9 ** 2 / 192 + w_1 * w_2 * w_5 * w_8 ** 2 * w_9 / 192 + w_1 * w_2 * w_5 * w_8 * w_9 ** 2 / 192 - w_1 * w_2 * w_6 ** 4 / 2880 + w_1 * w_2 * w_6 ** 2 * w_7 ** 2 / 576 + w_1 * w_2 * w_6 ** 2 * w_7 * w_8 / 192 + w_1 * w_2 * w_6 ** 2 * w_7 * w_9 / 192 + w_1 * w_2 * w_6 ** 2 * w_8 ** 2 / 576 + w_1 * w_2 * w_6 ** 2 * w_8 * w_9 / 192 + w_1 * w_2 * w_6 ** 2 * w_9 ** 2 / 576 + w_1 * w_2 * w_6 * w_7 ** 2 * w_8 / 192 + w_1 * w_2 * w_6 * w_7 ** 2 * w_9 / 192 + w_1 * w_2 * w_6 * w_7 * w_8 ** 2 / 192 + w_1 * w_2 * w_6 * w_7 * w_8 * w_9 / 64 + w_1 * w_2 * w_6 * w_7 * w_9 ** 2 / 192 + w_1 * w_2 * w_6 * w_8 ** 2 * w_9 / 192 + w_1 * w_2 * w_6 * w_8 * w_9 ** 2 / 192 - w_1 * w_2 * w_7 ** 4 / 2880 + w_1 * w_2 * w_7 ** 2 * w_8 ** 2 / 576 + w_1 * w_2 * w_7 ** 2 * w_8 * w_9 / 192 + w_1 * w_2 * w_7 ** 2 * w_9 ** 2 / 576 + w_1 * w_2 * w_7 * w_8 ** 2 * w_9 / 192 + w_1 * w_2 * w_7 * w_8 * w_9 ** 2 / 192 - w_1 * w_2 * w_8 ** 4 / 2880 + w_1 * w_2 * w_8 ** 2 * w_9 ** 2 / 576 - w_1 * w_2 * w_9 ** 4 / 2880 - w_1 * w_3 ** 4 * w_4 / 2880 - w_1 * w_3 ** 4 * w_5 / 2880 - w_1 * w_3 ** 4 * w_6 / 2880 - w_1 * w_3 ** 4 * w_7 / 2880 - w_1 * w_3 ** 4 * w_8 / 2880 - w_1 * w_3 ** 4 * w_9 / 2880 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 / 576 + w_1 * w_3 ** 2 * w_4 ** 2 * w_6 / 576 + w_1 * w_3 ** 2 * w_4 ** 2 * w_7 / 576 + w_1 * w_3 ** 2 * w_4 ** 2 * w_8 / 576 + w_1 * w_3 ** 2 * w_4 ** 2 * w_9 / 576 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 / 576 + w_1 * w_3 ** 2 * w_4 * w_5 * w_6 / 192 + w_1 * w_3 ** 2 * w_4 * w_5 * w_7 / 192 + w_1 * w_3 ** 2 * w_4 * w_5 * w_8 / 192 + w_1 * w_3 ** 2 * w_4 * w_5 * w_9 / 192 + w_1 * w_3 ** 2 * w_4 * w_6 ** 2 / 576 + w_1 * w_3 ** 2 * w_4 * w_6 * w_7 / 192 + w_1 * w_3 ** 2 * w_4 * w_6 * w_8 / 192 + w_1 * w_3 ** 2 * w_4 * w_6 * w_9 / 192 + w_1 * w_3 ** 2 * w_4 * w_7 ** 2 / 576 + w_1 * w_3 ** 2 * w_4 * w_7 * w_8 / 192 + w_1 * w_3 ** 2 * w_4 * w_7 * w_9 / 192 + w_1 * w_3 ** 2 * w_4 * w_8 ** 2 / 576 + w_1 * w_3 ** 2 * w_4 * w_8 * w_9 / 192 + w_1 * w_3 ** 2 * w_4 * w_9 ** 2 / 576 + w_1 * w_3 ** 2 * w_5 ** 2 * w_6 / 576 + w_1 * w_3 ** 2 * w_5 ** 2 * w_7 / 576 + w_1 * w_3 ** 2 * w_5 ** 2 * w_8 / 576 + w_1 * w_3 ** 2 * w_5 ** 2 * w_9 / 576 + w_1 * w_3 ** 2 * w_5 * w_6 ** 2 / 576 + w_1 * w_3 ** 2 * w_5 * w_6 * w_7 / 192 + w_1 * w_3 ** 2 * w_5 * w_6 * w_8 / 192 + w_1 * w_3 ** 2 * w_5 * w_6 * w_9 / 192 + w_1 * w_3 ** 2 * w_5 * w_7 ** 2 / 576 + w_1 * w_3 ** 2 * w_5 * w_7 * w_8 / 192 + w_1 * w_3 ** 2 * w_5 * w_7 * w_9 / 192 + w_1 * w_3 ** 2 * w_5 * w_8 ** 2 / 576 + w_1 * w_3 ** 2 * w_5 * w_8 * w_9 / 192 + w_1 * w_3 ** 2 * w_5 * w_9 ** 2 / 576 + w_1 * w_3 ** 2 * w_6 ** 2 * w_7 / 576 + w_1 * w_3 ** 2 * w_6 ** 2 * w_8 / 576 + w_1 * w_3 ** 2 * w_6 ** 2 * w_9 / 576 + w_1 * w_3 ** 2 * w_6 * w_7 ** 2 / 576 + w_1 * w_3 ** 2 * w_6 * w_7 * w_8 / 192 + w_1 * w_3 ** 2 * w_6 * w_7 * w_9 / 192 + w_1 * w_3 ** 2 * w_6 * w_8 ** 2 / 576 + w_1 * w_3 ** 2 * w_6 * w_8 * w_9 / 192 + w_1 * w_3 ** 2 * w_6 * w_9 ** 2 / 576 + w_1 * w_3 ** 2 * w_7 ** 2 * w_8 / 576 + w_1 * w_3 ** 2 * w_7 ** 2 * w_9 / 576 + w_1 * w_3 ** 2 * w_7 * w_8 ** 2 / 576 + w_1 * w_3 ** 2 * w_7 * w_8 * w_9 / 192 + w_1 * w_3 ** 2 * w_7 * w_9 ** 2 / 576 + w_1 * w_3 ** 2 * w_8 ** 2 * w_9 / 576 + w_1 * w_3 ** 2 * w_8 * w_9 ** 2 / 576 - w_1 * w_3 * w_4 ** 4 / 2880 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 / 576 + w_1 * w_3 * w_4 ** 2 * w_5 * w_6 / 192 + w_1 * w_3 * w_4 ** 2 * w_5 * w_7 / 192 + w_1 * w_3 * w_4 ** 2 * w_5 * w_8 / 192 + w_1 * w_3 * w_4 ** 2 * w_5 * w_9 / 192 + w_1 * w_3 * w_4 ** 2 * w_6 ** 2 / 576 + w_1 * w_3 * w_4 ** 2 * w_6 * w_7 / 192 + w_1 * w_3 * w_4 ** 2 * w_6 * w_8 / 192 + w_1 * w_3 * w_4 ** 2 * w_6 * w_9 / 192 + w_1 * w_3 * w_4 ** 2 * w_7 ** 2 / 576 + w_1 * w_3 * w_4 ** 2 * w_7 * w_8 / 192 + w_1 * w_3 * w_4 ** 2 * w_7 * w_9 / 192 + w_1 * w_3 * w_4 ** 2 * w_8 ** 2 / 576 + w_1 * w_3 * w_4 ** 2 * w_8 * w_9 / 192 + w_1 * w_3 * w_4 ** 2 * w_9 ** 2 / 576 + w_1 * w_3 * w_4 * w_5 ** 2 * w_6 / 192 + w_1 * w_3 * w_4 * w_5 ** 2 * w_7 / 192 + w_1 * w_3 * w_4 * w_5 ** 2 * w_8 / 192 + w_1 * w_3 * w_4 * w_5 ** 2 * w_9 / 192 + w_1 * w_3 * w_4 * w_5 * w_6 ** 2 / 192 + w_1 * w_3 * w_4 * w_5 * w_6 * w_7 / 64 + w_1 * w_3 * w_4 * w_5 * w_6 * w_8 / 64 + w_1 * w_3 * w_4 * w_5 * w_6 * w_9 / 64 + w_1 * w_3 * w_4 * w_5 * w_7 ** 2 / 192 + w_1 * w_3 * w_4 * w_5 * w_7 * w_8 / 64 + w_1 * w_3 * w_4 * w_5 * w_7 * w_9 / 64 + w_1 * w_3 * w_4 * w_5 * w_8 ** 2 / 192 + w_1 * w_3 * w_4 * w_5 * w_8 * w_9 / 64 + w_1 * w_3 * w_4 * w_5 * w_9 ** 2 / 192 + w_1 * w_3 * w_4 * w_6 ** 2 * w_7 / 192 + w_1 * w_3 * w_4 * w_6 ** 2 * w_8 / 192 + w_1 * w_3 * w_4 * w_6 ** 2 * w_9 / 192 + w_1 * w_3 * w_4 * w_6 * w_7 ** 2 / 192 + w_1 * w_3 * w_4 * w_6 * w_7 * w_8 / 64 + w_1 * w_3 * w_4 * w_6 * w_7 * w_9 / 64 + w_1 * w_3 * w_4 * w_6 * w_8 ** 2 / 192 + w_1 * w_3 * w_4 * w_6 * w_8 * w_9 / 64 + w_1 * w_3 * w_4 * w_6 * w_9 ** 2 / 192 + w_1 * w_3 * w_4 * w_7 ** 2 * w_8 / 192 + w_1 * w_3 * w_4 * w_7 ** 2 * w_9 / 192 + w_1 * w_3 * w_4 * w_7 * w_8 ** 2 / 192 + w_1 * w_3 * w_4 * w_7 * w_8 * w_9 / 64 + w_1 * w_3 * w_4 * w_7 * w_9 ** 2 / 192 + w_1 * w_3 * w_4 * w_8 ** 2 * w_9 / 192 + w_1 * w_3 * w_4 * w_8 * w_9 ** 2 / 192 - w_1 * w_3 * w_5 ** 4 / 2880 + w_1 * w_3 * w_5 ** 2 * w_6 ** 2 / 576 + w_1 * w_3 * w_5 ** 2 * w_6 * w_7 / 192 + w_1 * w_3 * w_5 ** 2 * w_6 * w_8 / 192 + w_1 * w_3 * w_5 ** 2 * w_6 * w_9 / 192 + w_1 * w_3 * w_5 ** 2 * w_7 ** 2 / 576 + w_1 * w_3 * w_5 ** 2 * w_7 * w_8 / 192 + w_1 * w_3 * w_5 ** 2 * w_7 * w_9 / 192 + w_1 * w_3 * w_5 ** 2 * w_8 ** 2 / 576 + w_1 * w_3 * w_5 ** 2 * w_8 * w_9 / 192 + w_1 * w_3 * w_5 ** 2 * w_9 ** 2 / 576 + w_1 * w_3 * w_5 * w_6 ** 2 * w_7 / 192 + w_1 * w_3 * w_5 * w_6 ** 2 * w_8 / 192 + w_1 * w_3 * w_5 * w_6 ** 2 * w_9 / 192 + w_1 * w_3 * w_5 * w_6 * w_7 ** 2 / 192 + w_1 * w_3 * w_5 * w_6 * w_7 * w_8 / 64 + w_1 * w_3 * w_5 * w_6 * w_7 * w_9 / 64 + w_1 * w_3 * w_5 * w_6 * w_8 ** 2 / 192 + w_1 * w_3 * w_5 * w_6 * w_8 * w_9 / 64 + w_1 * w_3 * w_5 * w_6 * w_9 ** 2 / 192 + w_1 * w_3 * w_5 * w_7 ** 2 * w_8 / 192 + w_1 * w_3 * w_5 * w_7 ** 2 * w_9 / 192 + w_1 * w_3 * w_5 * w_7 * w_8 ** 2 / 192 + w_1 * w_3 * w_5 * w_7 * w_8 * w_9 / 64 + w_1 * w_3 * w_5 * w_7 * w_9 ** 2 / 192 + w_1 * w_3 * w_5 * w_8 ** 2 * w_9 / 192 + w_1 * w_3 * w_5 * w_8 * w_9 ** 2 / 192 - w_1 * w_3 * w_6 ** 4 / 2880 + w_1 * w_3 * w_6 ** 2 * w_7 ** 2 / 576 + w_1 * w_3 * w_6 ** 2 * w_7 * w_8 / 192 + w_1 * w_3 * w_6 ** 2 * w_7 * w_9 / 192 + w_1 * w_3 * w_6 ** 2 * w_8 ** 2 / 576 + w_1 * w_3 * w_6 ** 2 * w_8 * w_9 / 192 + w_1 * w_3 * w_6 ** 2 * w_9 ** 2 / 576 + w_1 * w_3 * w_6 * w_7 ** 2 * w_8 / 192 + w_1 * w_3 * w_6 * w_7 ** 2 * w_9 / 192 + w_1 * w_3 * w_6 * w_7 * w_8 ** 2 / 192 + w_1 * w_3 * w_6 * w_7 * w_8 * w_9 / 64 + w_1 * w_3 * w_6 * w_7 * w_9 ** 2 / 192 + w_1 * w_3 * w_6 * w_8 ** 2 * w_9 / 192 + w_1 * w_3 * w_6 * w_8 * w_9 ** 2 / 192 - w_1 * w_3 * w_7 ** 4 / 2880 + w_1 * w_3 * w_7 ** 2 * w_8 ** 2 / 576 + w_1 * w_3 * w_7 ** 2 * w_8 * w_9 / 192 + w_1 * w_3 * w_7 ** 2 * w_9 ** 2 / 576 + w_1 * w_3 * w_7 * w_8 ** 2 * w_9 / 192 + w_1 * w_3 * w_7 * w_8 * w_9 ** 2 / 192 - w_1 * w_3 * w_8 ** 4 / 2880 + w_1 * w_3 * w_8 ** 2 * w_9 ** 2 / 576 - w_1 * w_3 * w_9 ** 4 / 2880 - w_1 * w_4 ** 4 * w_5 / 2880 - w_1 * w_4 ** 4 * w_6 / 2880 - w_1 * w_4 ** 4 * w_7 / 2880 - w_1 * w_4 ** 4 * w_8 / 2880 - w_1 * w_4 ** 4 * w_9 / 2880 + w_1 * w_4 ** 2 * w_5 ** 2 * w_6 / 576 + w_1 * w_4 ** 2 * w_5 ** 2 * w_7 / 576 + w_1 * w_4 ** 2 * w_5 ** 2 * w_8 / 576 + w_1 * w_4 ** 2 * w_5 ** 2 * w_9 / 576 + w_1 * w_4 ** 2 * w_5 * w_6 ** 2 / 576 + w_1 * w_4 ** 2 * w_5 * w_6 * w_7 / 192 + w_1 * w_4 ** 2 * w_5 * w_6 * w_8 / 192 + w_1 * w_4 ** 2 * w_5 * w_6 * w_9 / 192 + w_1 * w_4 ** 2 * w_5 * w_7 ** 2 / 576 + w_1 * w_4 ** 2 * w_5 * w_7 * w_8 / 192 + w_1 * w_4 ** 2 * w_5 * w_7 * w_9 / 192 + w_1 * w_4 ** 2 * w_5 * w_8 ** 2 / 576 + w_1 * w_4 ** 2 * w_5 * w_8 * w_9 / 192 + w_1 * w_4 ** 2 * w_5 * w_9 ** 2 / 576 + w_1 * w_4 ** 2 * w_6 ** 2 * w_7 / 576 + w_1 * w_4 ** 2 * w_6 ** 2 * w_8 / 576 + w_1 * w_4 ** 2 * w_6 ** 2 * w_9 / 576 + w_1 * w_4 ** 2 * w_6 * w_7 ** 2 / 576 + w_1 * w_4 ** 2 * w_6 * w_7 * w_8 / 192 + w_1 * w_4 ** 2 * w_6 * w_7 * w_9 / 192 + w_1 * w_4 ** 2 * w_6 * w_8 ** 2 / 576 + w_1 * w_4 ** 2 * w_6 * w_8 * w_9 / 192 + w_1 * w_4 ** 2 * w_6 * w_9 ** 2 / 576 + w_1 * w_4 ** 2 * w_7 ** 2 * w_8 / 576 + w_1 * w_4 ** 2 * w_7 ** 2 * w_9 / 576 + w_1 * w_4 ** 2 * w_7 * w_8 ** 2 / 576 + w_1 * w_4 ** 2 * w_7 * w_8 * w_9 / 192 + w_1 * w_4 ** 2 * w_7 * w_9 ** 2 / 576 + w_1 * w_4 ** 2 * w_8 ** 2 * w_9 / 576 + w_1 * w_4 ** 2 * w_8 * w_9 ** 2 / 576 - w_1 * w_4 * w_5 ** 4 / 2880 + w_1 * w_4 * w_5 ** 2 * w_6 ** 2 / 576 + w_1 * w_4 * w_5 ** 2 * w_6 * w_7 / 192 + w_1 * w_4 * w_5 ** 2 * w_6 * w_8 / 192 + w_1 * w_4 * w_5 ** 2 * w_6 * w_9 / 192 + w_1 * w_4 * w_5 ** 2 * w_7 ** 2 / 576 + w_1 * w_4 * w_5 ** 2 * w_7 * w_8 / 192 + w_1 * w_4 * w_5 ** 2 * w_7 * w_9 / 192 + w_1 * w_4 * w_5 ** 2 * w_8 ** 2 / 576 + w_1 * w_4 * w_5 ** 2 * w_8 * w_9 / 192 + w_1 * w_4 * w_5 ** 2 * w_9 ** 2 / 576 + w_1 * w_4 * w_5 * w_6 ** 2 * w_7 / 192 + w_1 * w_4 * w_5 * w_6 ** 2 * w_8 / 192 + w_1 * w_4 * w_5 * w_6 ** 2 * w_9 / 192 + w_1 * w_4 * w_5 * w_6 * w_7 ** 2 / 192 + w_1 * w_4 * w_5 * w_6 * w_7 * w_8 / 64 + w_1 * w_4 * w_5 * w_6 * w_7 * w_9 / 64 + w_1 * w_4 * w_5 * w_6 * w_8 ** 2 / 192 + w_1 * w_4 * w_5 * w_6 * w_8 * w_9 / 64 + w_1 * w_4 * w_5 * w_6 * w_9 ** 2 / 192 + w_1 * w_4 * w_5 * w_7 ** 2 * w_8 / 192 + w_1 * w_4 * w_5 * w_7 ** 2 * w_9 / 192 + w_1 * w_4 * w_5 * w_7 * w_8 ** 2 / 192 + w_1 * w_4 * w_5 * w_7 * w_8 * w_9 / 64 + w_1 * w_4 * w_5 * w_7 * w_9 ** 2 / 192 + w_1 * w_4 * w_5 * w_8 ** 2 * w_9 / 192 + w_1 * w_4 * w_5 * w_8 * w_9 ** 2 / 192 - w_1 * w_4 * w_6 ** 4 / 2880 + w_1 * w_4 * w_6 ** 2 * w_7 ** 2 / 576 + w_1 * w_4 * w_6 ** 2 * w_7 * w_8 / 192 + w_1 * w_4 * w_6 ** 2 * w_7 * w_9 / 192 + w_1 * w_4 * w_6 ** 2 * w_8 ** 2 / 576 + w_1 * w_4 * w_6 ** 2 * w_8 * w_9 / 192 + w_1 * w_4 * w_6 ** 2 * w_9 ** 2 / 576 + w_1 * w_4 * w_6 * w_7 ** 2 * w_8 / 192 + w_1 * w_4 * w_6 * w_7 ** 2 * w_9 / 192 + w_1 * w_4 * w_6 * w_7 * w_8 ** 2 / 192 + w_1 * w_4 * w_6 * w_7 * w_8 * w_9 / 64 + w_1 * w_4 * w_6 * w_7 * w_9 ** 2 / 192 + w_1 * w_4 * w_6 * w_8 ** 2 * w_9 / 192 + w_1 * w_4 * w_6 * w_8 * w_9 ** 2 / 192 - w_1 * w_4 * w_7 ** 4 / 2880 + w_1 * w_4 * w_7 ** 2 * w_8 ** 2 / 576 + w_1 * w_4 * w_7 ** 2 * w_8 * w_9 / 192 + w_1 * w_4 * w_7 ** 2 * w_9 ** 2 / 576 + w_1 * w_4 * w_7 * w_8 ** 2 * w_9 / 192 + w_1 * w_4 * w_7 * w_8 * w_9 ** 2 / 192 - w_1 * w_4 * w_8 ** 4 / 2880 + w_1 * w_4 * w_8 ** 2 * w_9 ** 2 / 576 - w_1 * w_4 * w_9 ** 4 / 2880 - w_1 * w_5 ** 4 * w_6 / 2880 - w_1 * w_5 ** 4 * w_7 / 2880 - w_1 * w_5 ** 4 * w_8 / 2880 - w_1 * w_5 ** 4 * w_9 / 2880 + w_1 * w_5 ** 2 * w_6 ** 2 * w_7 / 576 + w_1 * w_5 ** 2 * w_6 ** 2 * w_8 / 576 + w_1 * w_5 ** 2 * w_6 ** 2 * w_9 / 576 + w_1 * w_5 ** 2 * w_6 * w_7 ** 2 / 576 + w_1 * w_5 ** 2 * w_6 * w_7 * w_8 / 192 + w_1 * w_5 ** 2 * w_6 * w_7 * w_9 / 192 + w_1 * w_5 ** 2 * w_6 * w_8 ** 2 / 576 + w_1 * w_5 ** 2 * w_6 * w_8 * w_9 / 192 + w_1 * w_5 ** 2 * w_6 * w_9 ** 2 / 576 + w_1 * w_5 ** 2 * w_7 ** 2 * w_8 / 576 + w_1 * w_5 ** 2 * w_7 ** 2 * w_9 / 576 + w_1 * w_5 ** 2 * w_7 * w_8 ** 2 / 576 + w_1 * w_5 ** 2 * w_7 * w_8 * w_9 / 192 + w_1 * w_5 ** 2 * w_7 * w_9 ** 2 / 576 + w_1 * w_5 ** 2 * w_8 ** 2 * w_9 / 576 + w_1 * w_5 ** 2 * w_8 * w_9 ** 2 / 576 - w_1 * w_5 * w_6 ** 4 / 2880 + w_1 * w_5 * w_6 ** 2 * w_7 ** 2 / 576 + w_1 * w_5 * w_6 ** 2 * w_7 * w_8 / 192 + w_1 * w_5 * w_6 ** 2 * w_7 * w_9 / 192 + w_1 * w_5 * w_6 ** 2 * w_8 ** 2 / 576 + w_1 * w_5 * w_6 ** 2 * w_8 * w_9 / 192 + w_1 * w_5 * w_6 ** 2 * w_9 ** 2 / 576 + w_1 * w_5 * w_6 * w_7 ** 2 * w_8 / 192 + w_1 * w_5 * w_6 * w_7 ** 2 * w_9 / 192 + w_1 * w_5 * w_6 * w_7 * w_8 ** 2 / 192 + w_1 * w_5 * w_6 * w_7 * w_8 * w_9 / 64 + w_1 * w_5 * w_6 * w_7 * w_9 ** 2 / 192 + w_1 * w_5 * w_6 * w_8 ** 2 * w_9 / 192 + w_1 * w_5 * w_6 * w_8 * w_9 ** 2 / 192 - w_1 * w_5 * w_7 ** 4 / 2880 + w_1 * w_5 * w_7 ** 2 * w_8 ** 2 / 576 + w_1 * w_5 * w_7 ** 2 * w_8 * w_9 / 192 + w_1 * w_5 * w_7 ** 2 * w_9 ** 2 / 576 + w_1 * w_5 * w_7 * w_8 ** 2 * w_9 / 192 + w_1 * w_5 * w_7 * w_8 * w_9 ** 2 / 192 - w_1 * w_5 * w_8 ** 4 / 2880 + w_1 * w_5 * w_8 ** 2 * w_9 ** 2 / 576 - w_1 * w_5 * w_9 ** 4 / 2880 - w_1 * w_6 ** 4 * w_7 / 2880 - w_1 * w_6 ** 4 * w_8 / 2880 - w_1 * w_6 ** 4 * w_9 / 2880 + w_1 * w_6 ** 2 * w_7 ** 2 * w_8 / 576 + w_1 * w_6 ** 2 * w_7 ** 2 * w_9 / 576 + w_1 * w_6 ** 2 * w_7 * w_8 ** 2 / 576 + w_1 * w_6 ** 2 * w_7 * w_8 * w_9 / 192 + w_1 * w_6 ** 2 * w_7 * w_9 ** 2 / 576 + w_1 * w_6 ** 2 * w_8 ** 2 * w_9 / 576 + w_1 * w_6 ** 2 * w_8 * w_9 ** 2 / 576 - w_1 * w_6 * w_7 ** 4 / 2880 + w_1 * w_6 * w_7 ** 2 * w_8 ** 2 / 576 + w_1 * w_6 * w_7 ** 2 * w_8 * w_9 / 192 + w_1 * w_6 * w_7 ** 2 * w_9 ** 2 / 576 + w_1 * w_6 * w_7 * w_8 ** 2 * w_9 / 192 + w_1 * w_6 * w_7 * w_8 * w_9 ** 2 / 192 - w_1 * w_6 * w_8 ** 4 / 2880 + w_1 * w_6 * w_8 ** 2 * w_9 ** 2 / 576 - w_1 * w_6 * w_9 ** 4 / 2880 - w_1 * w_7 ** 4 * w_8 / 2880 - w_1 * w_7 ** 4 * w_9 / 2880 + w_1 * w_7 ** 2 * w_8 ** 2 * w_9 / 576 + w_1 * w_7 ** 2 * w_8 * w_9 ** 2 / 576 - w_1 * w_7 * w_8 ** 4 / 2880 + w_1 * w_7 * w_8 ** 2 * w_9 ** 2 / 576 - w_1 * w_7 * w_9 ** 4 / 2880 - w_1 * w_8 ** 4 * w_9 / 2880 - w_1 * w_8 * w_9 ** 4 / 2880 + w_2 ** 6 / 30240 - w_2 ** 4 * w_3 ** 2 / 8640 - w_2 ** 4 * w_3 * w_4 / 2880 - w_2 ** 4 * w_3 * w_5 / 2880 - w_2 ** 4 * w_3 * w_6 / 2880 - w_2 ** 4 * w_3 * w_7 / 2880 - w_2 ** 4 * w_3 * w_8 / 2880 - w_2 ** 4 * w_3 * w_9 / 2880 - w_2 ** 4 * w_4 ** 2 / 8640 - w_2 ** 4 * w_4 * w_5 / 2880 - w_2 ** 4 * w_4 * w_6 / 2880 - w_2 ** 4 * w_4 * w_7 / 2880 - w_2 ** 4 * w_4 * w_8 / 2880 - w_2 ** 4 * w_4 * w_9 / 2880 - w_2 ** 4 * w_5 ** 2 / 8640 - w_2 ** 4 * w_5 * w_6 / 2880 - w_2 ** 4 * w_5 * w_7 / 2880 - w_2 ** 4 * w_5 * w_8 / 2880 - w_2 ** 4 * w_5 * w_9 / 2880 - w_2 ** 4 * w_6 ** 2 / 8640 - w_2 ** 4 * w_6 * w_7 / 2880 - w_2 ** 4 * w_6 * w_8 / 2880 - w_2 ** 4 * w_6 * w_9 / 2880 - w_2 ** 4 * w_7 ** 2 / 8640 - w_2 ** 4 * w_7 * w_8 / 2880 - w_2 ** 4 * w_7 * w_9 / 2880 - w_2 ** 4 * w_8 ** 2 / 8640 - w_2 ** 4 * w_8 * w_9 / 2880 - w_2 ** 4 * w_9 ** 2 / 8640 - w_2 ** 2 * w_3 ** 4 / 8640 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 576 + w_2 ** 2 * w_3 ** 2 * w_4 * w_6 / 576 + w_2 ** 2 * w_3 ** 2 * w_4 * w_7 / 576 + w_2 ** 2 * w_3 ** 2 * w_4 * w_8 / 576 + w_2 ** 2 * w_3 ** 2 * w_4 * w_9 / 576 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_5 * w_6 / 576 + w_2 ** 2 * w_3 ** 2 * w_5 * w_7 / 576 + w_2 ** 2 * w_3 ** 2 * w_5 * w_8 / 576 + w_2 ** 2 * w_3 ** 2 * w_5 * w_9 / 576 + w_2 ** 2 * w_3 ** 2 * w_6 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_6 * w_7 / 576 + w_2 ** 2 * w_3 ** 2 * w_6 * w_8 / 576 + w_2 ** 2 * w_3 ** 2 * w_6 * w_9 / 576 + w_2 ** 2 * w_3 ** 2 * w_7 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_7 * w_8 / 576 + w_2 ** 2 * w_3 ** 2 * w_7 * w_9 / 576 + w_2 ** 2 * w_3 ** 2 * w_8 ** 2 / 1728 + w_2 ** 2 * w_3 ** 2 * w_8 * w_9 / 576 + w_2 ** 2 * w_3 ** 2 * w_9 ** 2 / 1728 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 576 + w_2 ** 2 * w_3 * w_4 ** 2 * w_6 / 576 + w_2 ** 2 * w_3 * w_4 ** 2 * w_7 / 576 + w_2 ** 2 * w_3 * w_4 ** 2 * w_8 / 576 + w_2 ** 2 * w_3 * w_4 ** 2 * w_9 / 576 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 576 + w_2 ** 2 * w_3 * w_4 * w_5 * w_6 / 192 + w_2 ** 2 * w_3 * w_4 * w_5 * w_7 / 192 + w_2 ** 2 * w_3 * w_4 * w_5 * w_8 / 192 + w_2 ** 2 * w_3 * w_4 * w_5 * w_9 / 192 + w_2 ** 2 * w_3 * w_4 * w_6 ** 2 / 576 + w_2 ** 2 * w_3 * w_4 * w_6 * w_7 / 192 + w_2 ** 2 * w_3 * w_4 * w_6 * w_8 / 192 + w_2 ** 2 * w_3 * w_4 * w_6 * w_9 / 192 + w_2 ** 2 * w_3 * w_4 * w_7 ** 2 / 576 + w_2 ** 2 * w_3 * w_4 * w_7 * w_8 / 192 + w_2 ** 2 * w_3 * w_4 * w_7 * w_9 / 192 + w_2 ** 2 * w_3 * w_4 * w_8 ** 2 / 576 + w_2 ** 2 * w_3 * w_4 * w_8 * w_9 / 192 + w_2 ** 2 * w_3 * w_4 * w_9 ** 2 / 576 + w_2 ** 2 * w_3 * w_5 ** 2 * w_6 / 576 + w_2 ** 2 * w_3 * w_5 ** 2 * w_7 / 576 + w_2 ** 2 * w_3 * w_5 ** 2 * w_8 / 576 + w_2 ** 2 * w_3 * w_5 ** 2 * w_9 / 576 + w_2 ** 2 * w_3 * w_5 * w_6 ** 2 / 576 + w_2 ** 2 * w_3 * w_5 * w_6 * w_7 / 192 + w_2 ** 2 * w_3 * w_5 * w_6 * w_8 / 192 + w_2 ** 2 * w_3 * w_5 * w_6 * w_9 / 192 + w_2 ** 2 * w_3 * w_5 * w_7 ** 2 / 576 + w_2 ** 2 * w_3 * w_5 * w_7 * w_8 / 192 + w_2 ** 2 * w_3 * w_5 * w_7 * w_9 / 192 + w_2 ** 2 * w_3 * w_5 * w_8 ** 2 / 576 + w_2 ** 2 * w_3 * w_5 * w_8 * w_9 / 192 + w_2 ** 2 * w_3 * w_5 * w_9 ** 2 / 576 + w_2 ** 2 * w_3 * w_6 ** 2 * w_7 / 576 + w_2 ** 2 * w_3 * w_6 ** 2 * w_8 / 576 + w_2 ** 2 * w_3 * w_6 ** 2 * w_9 / 576 + w_2 ** 2 * w_3 * w_6 * w_7 ** 2 / 576 + w_2 ** 2 * w_3 * w_6 * w_7 * w_8 / 192 + w_2 ** 2 * w_3 * w_6 * w_7 * w_9 / 192 + w_2 ** 2 * w_3 * w_6 * w_8 ** 2 / 576 + w_2 ** 2 * w_3 * w_6 * w_8 * w_9 / 192 + w_2 ** 2 * w_3 * w_6 * w_9 ** 2 / 576 + w_2 ** 2 * w_3 * w_7 ** 2 * w_8 / 576 + w_2 ** 2 * w_3 * w_7 ** 2 * w_9 / 576 + w_2 ** 2 * w_3 * w_7 * w_8 ** 2 / 576 + w_2 ** 2 * w_3 * w_7 * w_8 * w_9 / 192 + w_2 ** 2 * w_3 * w_7 * w_9 ** 2 / 576 + w_2 ** 2 * w_3 * w_8 ** 2 * w_9 / 576 + w_2 ** 2 * w_3 * w_8 * w_9 ** 2 / 576 - w_2 ** 2 * w_4 ** 4 / 8640 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 + w_2 ** 2 * w_4 ** 2 * w_5 * w_6 / 576 + w_2 ** 2 * w_4 ** 2 * w_5 * w_7 / 576 + w_2 ** 2 * w_4 ** 2 * w_5 * w_8 / 576 + w_2 ** 2 * w_4 ** 2 * w_5 * w_9 / 576 + w_2 ** 2 * w_4 ** 2 * w_6 ** 2 / 1728 + w_2 ** 2 * w_4 ** 2 * w_6 * w_7 / 576 + w_2 ** 2 * w_4 ** 2 * w_6 * w_8 / 576 + w_2 ** 2 * w_4 ** 2 * w_6 * w_9 / 576 + w_2 ** 2 * w_4 ** 2 * w_7 ** 2 / 1728 + w_2 ** 2 * w_4 ** 2 * w_7 * w_8 / 576 + w_2 ** 2 * w_4 ** 2 * w_7 * w_9 / 576 + w_2 ** 2 * w_4 ** 2 * w_8 ** 2 / 1728 + w_2 ** 2 * w_4 ** 2 * w_8 * w_9 / 576 + w_2 ** 2 * w_4 ** 2 * w_9 ** 2 / 1728 + w_2 ** 2 * w_4 * w_5 ** 2 * w_6 / 576 + w_2 ** 2 * w_4 * w_5 ** 2 * w_7 / 576 + w_2 ** 2 * w_4 * w_5 ** 2 * w_8 / 576 + w_2 ** 2 * w_4 * w_5 ** 2 * w_9 / 576 + w_2 ** 2 * w_4 * w_5 * w_6 ** 2 / 576 + w_2 ** 2 * w_4 * w_5 * w_6 * w_7 / 192 + w_2 ** 2 * w_4 * w_5 * w_6 * w_8 / 192 + w_2 ** 2 * w_4 * w_5 * w_6 * w_9 / 192 + w_2 ** 2 * w_4 * w_5 * w_7 ** 2 / 576 + w_2 ** 2 * w_4 * w_5 * w_7 * w_8 / 192 + w_2 ** 2 * w_4 * w_5 * w_7 * w_9 / 192 + w_2 ** 2 * w_4 * w_5 * w_8 ** 2 / 576 + w_2 ** 2 * w_4 * w_5 * w_8 * w_9 / 192 + w_2 ** 2 * w_4 * w_5 * w_9 ** 2 / 576 + w_2 ** 2 * w_4 * w_6 ** 2 * w_7 / 576 + w_2 ** 2 * w_4 * w_6 ** 2 * w_8 / 576 + w_2 ** 2 * w_4 * w_6 ** 2 * w_9 / 576 + w_2 ** 2 * w_4 * w_6 * w_7 ** 2 / 576 + w_2 ** 2 * w_4 * w_6 * w_7 * w_8 / 192 + w_2 ** 2 * w_4 * w_6 * w_7 * w_9 / 192 + w_2 ** 2 * w_4 * w_6 * w_8 ** 2 / 576 + w_2 ** 2 * w_4 * w_6 * w_8 * w_9 / 192 + w_2 ** 2 * w_4 * w_6 * w_9 ** 2 / 576 + w_2 ** 2 * w_4 * w_7 ** 2 * w_8 / 576 + w_2 ** 2 * w_4 * w_7 ** 2 * w_9 / 576 + w_2 ** 2 * w_4 * w_7 * w_8 ** 2 / 576 + w_2 ** 2 * w_4 * w_7 * w_8 * w_9 / 192 + w_2 ** 2 * w_4 * w_7 * w_9 ** 2 / 576 + w_2 ** 2 * w_4 * w_8 ** 2 * w_9 / 576 + w_2 ** 2 * w_4 * w_8 * w_9 ** 2 / 576 - w_2 ** 2 * w_5 ** 4 / 8640 + w_2 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 + w_2 ** 2 * w_5 ** 2 * w_6 * w_7 / 576 + w_2 ** 2 * w_5 ** 2 * w_6 * w_8 / 576 + w_2 ** 2 * w_5 ** 2 * w_6 * w_9 / 576 + w_2 ** 2 * w_5 ** 2 * w_7 ** 2 / 1728 + w_2 ** 2 * w_5 ** 2 * w_7 * w_8 / 576 + w_2 ** 2 * w_5 ** 2 * w_7 * w_9 / 576 + w_2 ** 2 * w_5 ** 2 * w_8 ** 2 / 1728 + w_2 ** 2 * w_5 ** 2 * w_8 * w_9 / 576 + w_2 ** 2 * w_5 ** 2 * w_9 ** 2 / 1728 + w_2 ** 2 * w_5 * w_6 ** 2 * w_7 / 576 + w_2 ** 2 * w_5 * w_6 ** 2 * w_8 / 576 + w_2 ** 2 * w_5 * w_6 ** 2 * w_9 / 576 + w_2 ** 2 * w_5 * w_6 * w_7 ** 2 / 576 + w_2 ** 2 * w_5 * w_6 * w_7 * w_8 / 192 + w_2 ** 2 * w_5 * w_6 * w_7 * w_9 / 192 + w_2 ** 2 * w_5 * w_6 * w_8 ** 2 / 576 + w_2 ** 2 * w_5 * w_6 * w_8 * w_9 / 192 + w_2 ** 2 * w_5 * w_6 * w_9 ** 2 / 576 + w_2 ** 2 * w_5 * w_7 ** 2 * w_8 / 576 + w_2 ** 2 * w_5 * w_7 ** 2 * w_9 / 576 + w_2 ** 2 * w_5 * w_7 * w_8 ** 2 / 576 + w_2 ** 2 * w_5 * w_7 * w_8 * w_9 / 192 + w_2 ** 2 * w_5 * w_7 * w_9 ** 2 / 576 + w_2 ** 2 * w_5 * w_8 ** 2 * w_9 / 576 + w_2 ** 2 * w_5 * w_8 * w_9 ** 2 / 576 - w_2 ** 2 * w_6 ** 4 / 8640 + w_2 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 + w_2 ** 2 * w_6 ** 2 * w_7 * w_8 / 576 + w_2 ** 2 * w_6 ** 2 * w_7 * w_9 / 576 + w_2 ** 2 * w_6 ** 2 * w_8 ** 2 / 1728 + w_2 ** 2 * w_6 ** 2 * w_8 * w_9 / 576 + w_2 ** 2 * w_6 ** 2 * w_9 ** 2 / 1728 + w_2 ** 2 * w_6 * w_7 ** 2 * w_8 / 576 + w_2 ** 2 * w_6 * w_7 ** 2 * w_9 / 576 + w_2 ** 2 * w_6 * w_7 * w_8 ** 2 / 576 + w_2 ** 2 * w_6 * w_7 * w_8 * w_9 / 192 + w_2 ** 2 * w_6 * w_7 * w_9 ** 2 / 576 + w_2 ** 2 * w_6 * w_8 ** 2 * w_9 / 576 + w_2 ** 2 * w_6 * w_8 * w_9 ** 2 / 576 - w_2 ** 2 * w_7 ** 4 / 8640 + w_2 ** 2 * w_7 ** 2 * w_8 ** 2 / 1728 + w_2 ** 2 * w_7 ** 2 * w_8 * w_9 / 576 + w_2 ** 2 * w_7 ** 2 * w_9 ** 2 / 1728 + w_2 ** 2 * w_7 * w_8 ** 2 * w_9 / 576 + w_2 ** 2 * w_7 * w_8 * w_9 ** 2 / 576 - w_2 ** 2 * w_8 ** 4 / 8640 + w_2 ** 2 * w_8 ** 2 * w_9 ** 2 / 1728 - w_2 ** 2 * w_9 ** 4 / 8640 - w_2 * w_3 ** 4 * w_4 / 2880 - w_2 * w_3 ** 4 * w_5 / 2880 - w_2 * w_3 ** 4 * w_6 / 2880 - w_2 * w_3 ** 4 * w_7 / 2880 - w_2 * w_3 ** 4 * w_8 / 2880 - w_2 * w_3 ** 4 * w_9 / 2880 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 576 + w_2 * w_3 ** 2 * w_4 ** 2 * w_6 / 576 + w_2 * w_3 ** 2 * w_4 ** 2 * w_7 / 576 + w_2 * w_3 ** 2 * w_4 ** 2 * w_8 / 576 + w_2 * w_3 ** 2 * w_4 ** 2 * w_9 / 576 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 576 + w_2 * w_3 ** 2 * w_4 * w_5 * w_6 / 192 + w_2 * w_3 ** 2 * w_4 * w_5 * w_7 / 192 + w_2 * w_3 ** 2 * w_4 * w_5 * w_8 / 192 + w_2 * w_3 ** 2 * w_4 * w_5 * w_9 / 192 + w_2 * w_3 ** 2 * w_4 * w_6 ** 2 / 576 + w_2 * w_3 ** 2 * w_4 * w_6 * w_7 / 192 + w_2 * w_3 ** 2 * w_4 * w_6 * w_8 / 192 + w_2 * w_3 ** 2 * w_4 * w_6 * w_9 / 192 + w_2 * w_3 ** 2 * w_4 * w_7 ** 2 / 576 + w_2 * w_3 ** 2 * w_4 * w_7 * w_8 / 192 + w_2 * w_3 ** 2 * w_4 * w_7 * w_9 / 192 + w_2 * w_3 ** 2 * w_4 * w_8 ** 2 / 576 + w_2 * w_3 ** 2 * w_4 * w_8 * w_9 / 192 + w_2 * w_3 ** 2 * w_4 * w_9 ** 2 / 576 + w_2 * w_3 ** 2 * w_5 ** 2 * w_6 / 576 + w_2 * w_3 ** 2 * w_5 ** 2 * w_7 / 576 + w_2 * w_3 ** 2 * w_5 ** 2 * w_8 / 576 + w_2 * w_3 ** 2 * w_5 ** 2 * w_9 / 576 + w_2 * w_3 ** 2 * w_5 * w_6 ** 2 / 576 + w_2 * w_3 ** 2 * w_5 * w_6 * w_7 / 192 + w_2 * w_3 ** 2 * w_5 * w_6 * w_8 / 192 + w_2 * w_3 ** 2 * w_5 * w_6 * w_9 / 192 + w_2 * w_3 ** 2 * w_5 * w_7 ** 2 / 576 + w_2 * w_3 ** 2 * w_5 * w_7 * w_8 / 192 + w_2 * w_3 ** 2 * w_5 * w_7 * w_9 / 192 + w_2 * w_3 ** 2 * w_5 * w_8 ** 2 / 576 + w_2 * w_3 ** 2 * w_5 * w_8 * w_9 / 192 + w_2 * w_3 ** 2 * w_5 * w_9 ** 2 / 576 + w_2 * w_3 ** 2 * w_6 ** 2 * w_7 / 576 + w_2 * w_3 ** 2 * w_6 ** 2 * w_8 / 576 + w_2 * w_3 ** 2 * w_6 ** 2 * w_9 / 576 + w_2 * w_3 ** 2 * w_6 * w_7 ** 2 / 576 + w_2 * w_3 ** 2 * w_6 * w_7 * w_8 / 192 + w_2 * w_3 ** 2 * w_6 * w_7 * w_9 / 192 + w_2 * w_3 ** 2 * w_6 * w_8 ** 2 / 576 + w_2 * w_3 ** 2 * w_6 * w_8 * w_9 / 192 + w_2 * w_3 ** 2 * w_6 * w_9 ** 2 / 576 + w_2 * w_3 ** 2 * w_7 ** 2 * w_8 / 576 + w_2 * w_3 ** 2 * w_7 ** 2 * w_9 / 576 + w_2 * w_3 ** 2 * w_7 * w_8 ** 2 / 576 + w_2 * w_3 ** 2 * w_7 * w_8 * w_9 / 192 + w_2 * w_3 ** 2 * w_7 * w_9 ** 2 / 576 + w_2 * w_3 ** 2 * w_8 ** 2 * w_9 / 576 + w_2 * w_3 ** 2 * w_8 * w_9 ** 2 / 576 - w_2 * w_3 * w_4 ** 4 / 2880 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 576 + w_2 * w_3 * w_4 ** 2 * w_5 * w_6 / 192 + w_2 * w_3 * w_4 ** 2 * w_5 * w_7 / 192 + w_2 * w_3 * w_4 ** 2 * w_5 * w_8 / 192 + w_2 * w_3 * w_4 ** 2 * w_5 * w_9 / 192 + w_2 * w_3 * w_4 ** 2 * w_6 ** 2 / 576 + w_2 * w_3 * w_4 ** 2 * w_6 * w_7 / 192 + w_2 * w_3 * w_4 ** 2 * w_6 * w_8 / 192 + w_2 * w_3 * w_4 ** 2 * w_6 * w_9 / 192 + w_2 * w_3 * w_4 ** 2 * w_7 ** 2 / 576 + w_2 * w_3 * w_4 ** 2 * w_7 * w_8 / 192 + w_2 * w_3 * w_4 ** 2 * w_7 * w_9 / 192 + w_2 * w_3 * w_4 ** 2 * w_8 ** 2 / 576 + w_2 * w_3 * w_4 ** 2 * w_8 * w_9 / 192 + w_2 * w_3 * w_4 ** 2 * w_9 ** 2 / 576 + w_2 * w_3 * w_4 * w_5 ** 2 * w_6 / 192 + w_2 * w_3 * w_4 * w_5 ** 2 * w_7 / 192 + w_2 * w_3 * w_4 * w_5 ** 2 * w_8 / 192 + w_2 * w_3 * w_4 * w_5 ** 2 * w_9 / 192 + w_2 * w_3 * w_4 * w_5 * w_6 ** 2 / 192 + w_2 * w_3 * w_4 * w_5 * w_6 * w_7 / 64 + w_2 * w_3 * w_4 * w_5 * w_6 * w_8 / 64 + w_2 * w_3 * w_4 * w_5 * w_6 * w_9 / 64 + w_2 * w_3 * w_4 * w_5 * w_7 ** 2 / 192 + w_2 * w_3 * w_4 * w_5 * w_7 * w_8 / 64 + w_2 * w_3 * w_4 * w_5 * w_7 * w_9 / 64 + w_2 * w_3 * w_4 * w_5 * w_8 ** 2 / 192 + w_2 * w_3 * w_4 * w_5 * w_8 * w_9 / 64 + w_2 * w_3 * w_4 * w_5 * w_9 ** 2 / 192 + w_2 * w_3 * w_4 * w_6 ** 2 * w_7 / 192 + w_2 * w_3 * w_4 * w_6 ** 2 * w_8 / 192 + w_2 * w_3 * w_4 * w_6 ** 2 * w_9 / 192 + w_2 * w_3 * w_4 * w_6 * w_7 ** 2 / 192 + w_2 * w_3 * w_4 * w_6 * w_7 * w_8 / 64 + w_2 * w_3 * w_4 * w_6 * w_7 * w_9 / 64 + w_2 * w_3 * w_4 * w_6 * w_8 ** 2 / 192 + w_2 * w_3 * w_4 * w_6 * w_8 * w_9 / 64 + w_2 * w_3 * w_4 * w_6 * w_9 ** 2 / 192 + w_2 * w_3 * w_4 * w_7 ** 2 * w_8 / 192 + w_2 * w_3 * w_4 * w_7 ** 2 * w_9 / 192 + w_2 * w_3 * w_4 * w_7 * w_8 ** 2 / 192 + w_2 * w_3 * w_4 * w_7 * w_8 * w_9 / 64 + w_2 * w_3 * w_4 * w_7 * w_9 ** 2 / 192 + w_2 * w_3 * w_4 * w_8 ** 2 * w_9 / 192 + w_2 * w_3 * w_4 * w_8 * w_9 ** 2 / 192 - w_2 * w_3 * w_5 ** 4 / 2880 + w_2 * w_3 * w_5 ** 2 * w_6 ** 2 / 576 + w_2 * w_3 * w_5 ** 2 * w_6 * w_7 / 192 + w_2 * w_3 * w_5 ** 2 * w_6 * w_8 / 192 + w_2 * w_3 * w_5 ** 2 * w_6 * w_9 / 192 + w_2 * w_3 * w_5 ** 2 * w_7 ** 2 / 576 + w_2 * w_3 * w_5 ** 2 * w_7 * w_8 / 192 + w_2 * w_3 * w_5 ** 2 * w_7 * w_9 / 192 + w_2 * w_3 * w_5 ** 2 * w_8 ** 2 / 576 + w_2 * w_3 * w_5 ** 2 * w_8 * w_9 / 192 + w_2 * w_3 * w_5 ** 2 * w_9 ** 2 / 576 + w_2 * w_3 * w_5 * w_6 ** 2 * w_7 / 192 + w_2 * w_3 * w_5 * w_6 ** 2 * w_8 / 192 + w_2 * w_3 * w_5 * w_6 ** 2 * w_9 / 192 + w_2 * w_3 * w_5 * w_6 * w_7 ** 2 / 192 + w_2 * w_3 * w_5 * w_6 * w_7 * w_8 / 64 + w_2 * w_3 * w_5 * w_6 * w_7 * w_9 / 64 + w_2 * w_3 * w_5 * w_6 * w_8 ** 2 / 192 + w_2 * w_3 * w_5 * w_6 * w_8 * w_9 / 64 + w_2 * w_3 * w_5 * w_6 * w_9 ** 2 / 192 + w_2 * w_3 * w_5 * w_7 ** 2 * w_8 / 192 + w_2 * w_3 * w_5 * w_7 ** 2 * w_9 / 192 + w_2 * w_3 * w_5 * w_7 * w_8 ** 2 / 192 + w_2 * w_3 * w_5 * w_7 * w_8 * w_9 / 64 + w_2 * w_3 * w_5 * w_7 * w_9 ** 2 / 192 + w_2 * w_3 * w_5 * w_8 ** 2 * w_9 / 192 + w_2 * w_3 * w_5 * w_8 * w_9 ** 2 / 192 - w_2 * w_3 * w_6 ** 4 / 2880 + w_2 * w_3 * w_6 ** 2 * w_7 ** 2 / 576 + w_2 * w_3 * w_6 ** 2 * w_7 * w_8 / 192 + w_2 * w_3 * w_6 ** 2 * w_7 * w_9 / 192 + w_2 * w_3 * w_6 ** 2 * w_8 ** 2 / 576 + w_2 * w_3 * w_6 ** 2 * w_8 * w_9 / 192 + w_2 * w_3 * w_6 ** 2 * w_9 ** 2 / 576 + w_2 * w_3 * w_6 * w_7 ** 2 * w_8 / 192 + w_2 * w_3 * w_6 * w_7 ** 2 * w_9 / 192 + w_2 * w_3 * w_6 * w_7 * w_8 ** 2 / 192 + w_2 * w_3 * w_6 * w_7 * w_8 * w_9 / 64 + w_2 * w_3 * w_6 * w_7 * w_9 ** 2 / 192 + w_2 * w_3 * w_6 * w_8 ** 2 * w_9 / 192 + w_2 * w_3 * w_6 * w_8 * w_9 ** 2 / 192 - w_2 * w_3 * w_7 ** 4 / 2880 + w_2 * w_3 * w_7 ** 2 * w_8 ** 2 / 576 + w_2 * w_3 * w_7 ** 2 * w_8 * w_9 / 192 + w_2 * w_3 * w_7 ** 2 * w_9 ** 2 / 576 + w_2 * w_3 * w_7 * w_8 ** 2 * w_9 / 192 + w_2 * w_3 * w_7 * w_8 * w_9 ** 2 / 192 - w_2 * w_3 * w_8 ** 4 / 2880 + w_2 * w_3 * w_8 ** 2 * w_9 ** 2 / 576 - w_2 * w_3 * w_9 ** 4 / 2880 - w_2 * w_4 ** 4 * w_5 / 2880 - w_2 * w_4 ** 4 * w_6 / 2880 - w_2 * w_4 ** 4 * w_7 / 2880 - w_2 * w_4 ** 4 * w_8 / 2880 - w_2 * w_4 ** 4 * w_9 / 2880 + w_2 * w_4 ** 2 * w_5 ** 2 * w_6 / 576 + w_2 * w_4 ** 2 * w_5 ** 2 * w_7 / 576 + w_2 * w_4 ** 2 * w_5 ** 2 * w_8 / 576 + w_2 * w_4 ** 2 * w_5 ** 2 * w_9 / 576 + w_2 * w_4 ** 2 * w_5 * w_6 ** 2 / 576 + w_2 * w_4 ** 2 * w_5 * w_6 * w_7 / 192 + w_2 * w_4 ** 2 * w_5 * w_6 * w_8 / 192 + w_2 * w_4 ** 2 * w_5 * w_6 * w_9 / 192 + w_2 * w_4 ** 2 * w_5 * w_7 ** 2 / 576 + w_2 * w_4 ** 2 * w_5 * w_7 * w_8 / 192 + w_2 * w_4 ** 2 * w_5 * w_7 * w_9 / 192 + w_2 * w_4 ** 2 * w_5 * w_8 ** 2 / 576 + w_2 * w_4 ** 2 * w_5 * w_8 * w_9 / 192 + w_2 * w_4 ** 2 * w_5 * w_9 ** 2 / 576 + w_2 * w_4 ** 2 * w_6 ** 2 * w_7 / 576 + w_2 * w_4 ** 2 * w_6 ** 2 * w_8 / 576 + w_2 * w_4 ** 2 * w_6 ** 2 * w_9 / 576 + w_2 * w_4 ** 2 * w_6 * w_7 ** 2 / 576 + w_2 * w_4 ** 2 * w_6 * w_7 * w_8 / 192 + w_2 * w_4 ** 2 * w_6 * w_7 * w_9 / 192 + w_2 * w_4 ** 2 * w_6 * w_8 ** 2 / 576 + w_2 * w_4 ** 2 * w_6 * w_8 * w_9 / 192 + w_2 * w_4 ** 2 * w_6 * w_9 ** 2 / 576 + w_2 * w_4 ** 2 * w_7 ** 2 * w_8 / 576 + w_2 * w_4 ** 2 * w_7 ** 2 * w_9 / 576 + w_2 * w_4 ** 2 * w_7 * w_8 ** 2 / 576 + w_2 * w_4 ** 2 * w_7 * w_8 * w_9 / 192 + w_2 * w_4 ** 2 * w_7 * w_9 ** 2 / 576 + w_2 * w_4 ** 2 * w_8 ** 2 * w_9 / 576 + w_2 * w_4 ** 2 * w_8 * w_9 ** 2 / 576 - w_2 * w_4 * w_5 ** 4 / 2880 + w_2 * w_4 * w_5 ** 2 * w_6 ** 2 / 576 + w_2 * w_4 * w_5 ** 2 * w_6 * w_7 / 192 + w_2 * w_4 * w_5 ** 2 * w_6 * w_8 / 192 + w_2 * w_4 * w_5 ** 2 * w_6 * w_9 / 192 + w_2 * w_4 * w_5 ** 2 * w_7 ** 2 / 576 + w_2 * w_4 * w_5 ** 2 * w_7 * w_8 / 192 + w_2 * w_4 * w_5 ** 2 * w_7 * w_9 / 192 + w_2 * w_4 * w_5 ** 2 * w_8 ** 2 / 576 + w_2 * w_4 * w_5 ** 2 * w_8 * w_9 / 192 + w_2 * w_4 * w_5 ** 2 * w_9 ** 2 / 576 + w_2 * w_4 * w_5 * w_6 ** 2 * w_7 / 192 + w_2 * w_4 * w_5 * w_6 ** 2 * w_8 / 192 + w_2 * w_4 * w_5 * w_6 ** 2 * w_9 / 192 + w_2 * w_4 * w_5 * w_6 * w_7 ** 2 / 192 + w_2 * w_4 * w_5 * w_6 * w_7 * w_8 / 64 + w_2 * w_4 * w_5 * w_6 * w_7 * w_9 / 64 + w_2 * w_4 * w_5 * w_6 * w_8 ** 2 / 192 + w_2 * w_4 * w_5 * w_6 * w_8 * w_9 / 64 + w_2 * w_4 * w_5 * w_6 * w_9 ** 2 / 192 + w_2 * w_4 * w_5 * w_7 ** 2 * w_8 / 192 + w_2 * w_4 * w_5 * w_7 ** 2 * w_9 / 192 + w_2 * w_4 * w_5 * w_7 * w_8 ** 2 / 192 + w_2 * w_4 * w_5 * w_7 * w_8 * w_9 / 64 + w_2 * w_4 * w_5 * w_7 * w_9 ** 2 / 192 + w_2 * w_4 * w_5 * w_8 ** 2 * w_9 / 192 + w_2 * w_4 * w_5 * w_8 * w_9 ** 2 / 192 - w_2 * w_4 * w_6 ** 4 / 2880 + w_2 * w_4 * w_6 ** 2 * w_7 ** 2 / 576 + w_2 * w_4 * w_6 ** 2 * w_7 * w_8 / 192 + w_2 * w_4 * w_6 ** 2 * w_7 * w_9 / 192 + w_2 * w_4 * w_6 ** 2 * w_8 ** 2 / 576 + w_2 * w_4 * w_6 ** 2 * w_8 * w_9 / 192 + w_2 * w_4 * w_6 ** 2 * w_9 ** 2 / 576 + w_2 * w_4 * w_6 * w_7 ** 2 * w_8 / 192 + w_2 * w_4 * w_6 * w_7 ** 2 * w_9 / 192 + w_2 * w_4 * w_6 * w_7 * w_8 ** 2 / 192 + w_2 * w_4 * w_6 * w_7 * w_8 * w_9 / 64 + w_2 * w_4 * w_6 * w_7 * w_9 ** 2 / 192 + w_2 * w_4 * w_6 * w_8 ** 2 * w_9 / 192 + w_2 * w_4 * w_6 * w_8 * w_9 ** 2 / 192 - w_2 * w_4 * w_7 ** 4 / 2880 + w_2 * w_4 * w_7 ** 2 * w_8 ** 2 / 576 + w_2 * w_4 * w_7 ** 2 * w_8 * w_9 / 192 + w_2 * w_4 * w_7 ** 2 * w_9 ** 2 / 576 + w_2 * w_4 * w_7 * w_8 ** 2 * w_9 / 192 + w_2 * w_4 * w_7 * w_8 * w_9 ** 2 / 192 - w_2 * w_4 * w_8 ** 4 / 2880 + w_2 * w_4 * w_8 ** 2 * w_9 ** 2 / 576 - w_2 * w_4 * w_9 ** 4 / 2880 - w_2 * w_5 ** 4 * w_6 / 2880 - w_2 * w_5 ** 4 * w_7 / 2880 - w_2 * w_5 ** 4 * w_8 / 2880 - w_2 * w_5 ** 4 * w_9 / 2880 + w_2 * w_5 ** 2 * w_6 ** 2 * w_7 / 576 + w_2 * w_5 ** 2 * w_6 ** 2 * w_8 / 576 + w_2 * w_5 ** 2 * w_6 ** 2 * w_9 / 576 + w_2 * w_5 ** 2 * w_6 * w_7 ** 2 / 576 + w_2 * w_5 ** 2 * w_6 * w_7 * w_8 / 192 + w_2 * w_5 ** 2 * w_6 * w_7 * w_9 / 192 + w_2 * w_5 ** 2 * w_6 * w_8 ** 2 / 576 + w_2 * w_5 ** 2 * w_6 * w_8 * w_9 / 192 + w_2 * w_5 ** 2 * w_6 * w_9 ** 2 / 576 + w_2 * w_5 ** 2 * w_7 ** 2 * w_8 / 576 + w_2 * w_5 ** 2 * w_7 ** 2 * w_9 / 576 + w_2 * w_5 ** 2 * w_7 * w_8 ** 2 / 576 + w_2 * w_5 ** 2 * w_7 * w_8 * w_9 / 192 + w_2 * w_5 ** 2 * w_7 * w_9 ** 2 / 576 + w_2 * w_5 ** 2 * w_8 ** 2 * w_9 / 576 + w_2 * w_5 ** 2 * w_8 * w_9 ** 2 / 576 - w_2 * w_5 * w_6 ** 4 / 2880 + w_2 * w_5 * w_6 ** 2 * w_7 ** 2 / 576 + w_2 * w_5 * w_6 ** 2 * w_7 * w_8 / 192 + w_2 * w_5 * w_6 ** 2 * w_7 * w_9 / 192 + w_2 * w_5 * w_6 ** 2 * w_8 ** 2 / 576 + w_2 * w_5 * w_6 ** 2 * w_8 * w_9 / 192 + w_2 * w_5 * w_6 ** 2 * w_9 ** 2 / 576 + w_2 * w_5 * w_6 * w_7 ** 2 * w_8 / 192 + w_2 * w_5 * w_6 * w_7 ** 2 * w_9 / 192 + w_2 * w_5 * w_6 * w_7 * w_8 ** 2 / 192 + w_2 * w_5 * w_6 * w_7 * w_8 * w_9 / 64 + w_2 * w_5 * w_6 * w_7 * w_9 ** 2 / 192 + w_2 * w_5 * w_6 * w_8 ** 2 * w_9 / 192 + w_2 * w_5 * w_6 * w_8 * w_9 ** 2 / 192 - w_2 * w_5 * w_7 ** 4 / 2880 + w_2 * w_5 * w_7 ** 2 * w_8 ** 2 / 576 + w_2 * w_5 * w_7 ** 2 * w_8 * w_9 / 192 + w_2 * w_5 * w_7 ** 2 * w_9 ** 2 / 576 + w_2 * w_5 * w_7 * w_8 ** 2 * w_9 / 192 + w_2 * w_5 * w_7 * w_8 * w_9 ** 2 / 192 - w_2 * w_5 * w_8 ** 4 / 2880 + w_2 * w_5 * w_8 ** 2 * w_9 ** 2 / 576 - w_2 * w_5 * w_9 ** 4 / 2880 - w_2 * w_6 ** 4 * w_7 / 2880 - w_2 * w_6 ** 4 * w_8 / 2880 - w_2 * w_6 ** 4 * w_9 / 2880 + w_2 * w_6 ** 2 * w_7 ** 2 * w_8 / 576 + w_2 * w_6 ** 2 * w_7 ** 2 * w_9 / 576 + w_2 * w_6 ** 2 * w_7 * w_8 ** 2 / 576 + w_2 * w_6 ** 2 * w_7 * w_8 * w_9 / 192 + w_2 * w_6 ** 2 * w_7 * w_9 ** 2 / 576 + w_2 * w_6 ** 2 * w_8 ** 2 * w_9 / 576 + w_2 * w_6 ** 2 * w_8 * w_9 ** 2 / 576 - w_2 * w_6 * w_7 ** 4 / 2880 + w_2 * w_6 * w_7 ** 2 * w_8 ** 2 / 576 + w_2 * w_6 * w_7 ** 2 * w_8 * w_9 / 192 + w_2 * w_6 * w_7 ** 2 * w_9 ** 2 / 576 + w_2 * w_6 * w_7 * w_8 ** 2 * w_9 / 192 + w_2 * w_6 * w_7 * w_8 * w_9 ** 2 / 192 - w_2 * w_6 * w_8 ** 4 / 2880 + w_2 * w_6 * w_8 ** 2 * w_9 ** 2 / 576 - w_2 * w_6 * w_9 ** 4 / 2880 - w_2 * w_7 ** 4 * w_8 / 2880 - w_2 * w_7 ** 4 * w_9 / 2880 + w_2 * w_7 ** 2 * w_8 ** 2 * w_9 / 576 + w_2 * w_7 ** 2 * w_8 * w_9 ** 2 / 576 - w_2 * w_7 * w_8 ** 4 / 2880 + w_2 * w_7 * w_8 ** 2 * w_9 ** 2 / 576 - w_2 * w_7 * w_9 ** 4 / 2880 - w_2 * w_8 ** 4 * w_9 / 2880 - w_2 * w_8 * w_9 ** 4 / 2880 + w_3 ** 6 / 30240 - w_3 ** 4 * w_4 ** 2 / 8640 - w_3 ** 4 * w_4 * w_5 / 2880 - w_3 ** 4 * w_4 * w_6 / 2880 - w_3 ** 4 * w_4 * w_7 / 2880 - w_3 ** 4 * w_4 * w_8 / 2880 - w_3 ** 4 * w_4 * w_9 / 2880 - w_3 ** 4 * w_5 ** 2 / 8640 - w_3 ** 4 * w_5 * w_6 / 2880 - w_3 ** 4 * w_5 * w_7 / 2880 - w_3 ** 4 * w_5 * w_8 / 2880 - w_3 ** 4 * w_5 * w_9 / 2880 - w_3 ** 4 * w_6 ** 2 / 8640 - w_3 ** 4 * w_6 * w_7 / 2880 - w_3 ** 4 * w_6 * w_8 / 2880 - w_3 ** 4 * w_6 * w_9 / 2880 - w_3 ** 4 * w_7 ** 2 / 8640 - w_3 ** 4 * w_7 * w_8 / 2880 - w_3 ** 4 * w_7 * w_9 / 2880 - w_3 ** 4 * w_8 ** 2 / 8640 - w_3 ** 4 * w_8 * w_9 / 2880 - w_3 ** 4 * w_9 ** 2 / 8640 - w_3 ** 2 * w_4 ** 4 / 8640 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 1728 + w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 576 + w_3 ** 2 * w_4 ** 2 * w_5 * w_7 / 576 + w_3 ** 2 * w_4 ** 2 * w_5 * w_8 / 576 + w_3 ** 2 * w_4 ** 2 * w_5 * w_9 / 576 + w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 1728 + w_3 ** 2 * w_4 ** 2 * w_6 * w_7 / 576 + w_3 ** 2 * w_4 ** 2 * w_6 * w_8 / 576 + w_3 ** 2 * w_4 ** 2 * w_6 * w_9 / 576 + w_3 ** 2 * w_4 ** 2 * w_7 ** 2 / 1728 + w_3 ** 2 * w_4 ** 2 * w_7 * w_8 / 576 + w_3 ** 2 * w_4 ** 2 * w_7 * w_9 / 576 + w_3 ** 2 * w_4 ** 2 * w_8 ** 2 / 1728 + w_3 ** 2 * w_4 ** 2 * w_8 * w_9 / 576 + w_3 ** 2 * w_4 ** 2 * w_9 ** 2 / 1728 + w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 576 + w_3 ** 2 * w_4 * w_5 ** 2 * w_7 / 576 + w_3 ** 2 * w_4 * w_5 ** 2 * w_8 / 576 + w_3 ** 2 * w_4 * w_5 ** 2 * w_9 / 576 + w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 576 + w_3 ** 2 * w_4 * w_5 * w_6 * w_7 / 192 + w_3 ** 2 * w_4 * w_5 * w_6 * w_8 / 192 + w_3 ** 2 * w_4 * w_5 * w_6 * w_9 / 192 + w_3 ** 2 * w_4 * w_5 * w_7 ** 2 / 576 + w_3 ** 2 * w_4 * w_5 * w_7 * w_8 / 192 + w_3 ** 2 * w_4 * w_5 * w_7 * w_9 / 192 + w_3 ** 2 * w_4 * w_5 * w_8 ** 2 / 576 + w_3 ** 2 * w_4 * w_5 * w_8 * w_9 / 192 + w_3 ** 2 * w_4 * w_5 * w_9 ** 2 / 576 + w_3 ** 2 * w_4 * w_6 ** 2 * w_7 / 576 + w_3 ** 2 * w_4 * w_6 ** 2 * w_8 / 576 + w_3 ** 2 * w_4 * w_6 ** 2 * w_9 / 576 + w_3 ** 2 * w_4 * w_6 * w_7 ** 2 / 576 + w_3 ** 2 * w_4 * w_6 * w_7 * w_8 / 192 + w_3 ** 2 * w_4 * w_6 * w_7 * w_9 / 192 + w_3 ** 2 * w_4 * w_6 * w_8 ** 2 / 576 + w_3 ** 2 * w_4 * w_6 * w_8 * w_9 / 192 + w_3 ** 2 * w_4 * w_6 * w_9 ** 2 / 576 + w_3 ** 2 * w_4 * w_7 ** 2 * w_8 / 576 + w_3 ** 2 * w_4 * w_7 ** 2 * w_9 / 576 + w_3 ** 2 * w_4 * w_7 * w_8 ** 2 / 576 + w_3 ** 2 * w_4 * w_7 * w_8 * w_9 / 192 + w_3 ** 2 * w_4 * w_7 * w_9 ** 2 / 576 + w_3 ** 2 * w_4 * w_8 ** 2 * w_9 / 576 + w_3 ** 2 * w_4 * w_8 * w_9 ** 2 / 576 - w_3 ** 2 * w_5 ** 4 / 8640 + w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 + w_3 ** 2 * w_5 ** 2 * w_6 * w_7 / 576 + w_3 ** 2 * w_5 ** 2 * w_6 * w_8 / 576 + w_3 ** 2 * w_5 ** 2 * w_6 * w_9 / 576 + w_3 ** 2 * w_5 ** 2 * w_7 ** 2 / 1728 + w_3 ** 2 * w_5 ** 2 * w_7 * w_8 / 576 + w_3 ** 2 * w_5 ** 2 * w_7 * w_9 / 576 + w_3 ** 2 * w_5 ** 2 * w_8 ** 2 / 1728 + w_3 ** 2 * w_5 ** 2 * w_8 * w_9 / 576 + w_3 ** 2 * w_5 ** 2 * w_9 ** 2 / 1728 + w_3 ** 2 * w_5 * w_6 ** 2 * w_7 / 576 + w_3 ** 2 * w_5 * w_6 ** 2 * w_8 / 576 + w_3 ** 2 * w_5 * w_6 ** 2 * w_9 / 576 + w_3 ** 2 * w_5 * w_6 * w_7 ** 2 / 576 + w_3 ** 2 * w_5 * w_6 * w_7 * w_8 / 192 + w_3 ** 2 * w_5 * w_6 * w_7 * w_9 / 192 + w_3 ** 2 * w_5 * w_6 * w_8 ** 2 / 576 + w_3 ** 2 * w_5 * w_6 * w_8 * w_9 / 192 + w_3 ** 2 * w_5 * w_6 * w_9 ** 2 / 576 + w_3 ** 2 * w_5 * w_7 ** 2 * w_8 / 576 + w_3 ** 2 * w_5 * w_7 ** 2 * w_9 / 576 + w_3 ** 2 * w_5 * w_7 * w_8 ** 2 / 576 + w_3 ** 2 * w_5 * w_7 * w_8 * w_9 / 192 + w_3 ** 2 * w_5 * w_7 * w_9 ** 2 / 576 + w_3 ** 2 * w_5 * w_8 ** 2 * w_9 / 576 + w_3 ** 2 * w_5 * w_8 * w_9 ** 2 / 576 - w_3 ** 2 * w_6 ** 4 / 8640 + w_3 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 + w_3 ** 2 * w_6 ** 2 * w_7 * w_8 / 576 + w_3 ** 2 * w_6 ** 2 * w_7 * w_9 / 576 + w_3 ** 2 * w_6 ** 2 * w_8 ** 2 / 1728 + w_3 ** 2 * w_6 ** 2 * w_8 * w_9 / 576 + w_3 ** 2 * w_6 ** 2 * w_9 ** 2 / 1728 + w_3 ** 2 * w_6 * w_7 ** 2 * w_8 / 576 + w_3 ** 2 * w_6 * w_7 ** 2 * w_9 / 576 + w_3 ** 2 * w_6 * w_7 * w_8 ** 2 / 576 + w_3 ** 2 * w_6 * w_7 * w_8 * w_9 / 192 + w_3 ** 2 * w_6 * w_7 * w_9 ** 2 / 576 + w_3 ** 2 * w_6 * w_8 ** 2 * w_9 / 576 + w_3 ** 2 * w_6 * w_8 * w_9 ** 2 / 576 - w_3 ** 2 * w_7 ** 4 / 8640 + w_3 ** 2 * w_7 ** 2 * w_8 ** 2 / 1728 + w_3 ** 2 * w_7 ** 2 * w_8 * w_9 / 576 + w_3 ** 2 * w_7 ** 2 * w_9 ** 2 / 1728 + w_3 ** 2 * w_7 * w_8 ** 2 * w_9 / 576 + w_3 ** 2 * w_7 * w_8 * w_9 ** 2 / 576 - w_3 ** 2 * w_8 ** 4 / 8640 + w_3 ** 2 * w_8 ** 2 * w_9 ** 2 / 1728 - w_3 ** 2 * w_9 ** 4 / 8640 - w_3 * w_4 ** 4 * w_5 / 2880 - w_3 * w_4 ** 4 * w_6 / 2880 - w_3 * w_4 ** 4 * w_7 / 2880 - w_3 * w_4 ** 4 * w_8 / 2880 - w_3 * w_4 ** 4 * w_9 / 2880 + w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 576 + w_3 * w_4 ** 2 * w_5 ** 2 * w_7 / 576 + w_3 * w_4 ** 2 * w_5 ** 2 * w_8 / 576 + w_3 * w_4 ** 2 * w_5 ** 2 * w_9 / 576 + w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 576 + w_3 * w_4 ** 2 * w_5 * w_6 * w_7 / 192 + w_3 * w_4 ** 2 * w_5 * w_6 * w_8 / 192 + w_3 * w_4 ** 2 * w_5 * w_6 * w_9 / 192 + w_3 * w_4 ** 2 * w_5 * w_7 ** 2 / 576 + w_3 * w_4 ** 2 * w_5 * w_7 * w_8 / 192 + w_3 * w_4 ** 2 * w_5 * w_7 * w_9 / 192 + w_3 * w_4 ** 2 * w_5 * w_8 ** 2 / 576 + w_3 * w_4 ** 2 * w_5 * w_8 * w_9 / 192 + w_3 * w_4 ** 2 * w_5 * w_9 ** 2 / 576 + w_3 * w_4 ** 2 * w_6 ** 2 * w_7 / 576 + w_3 * w_4 ** 2 * w_6 ** 2 * w_8 / 576 + w_3 * w_4 ** 2 * w_6 ** 2 * w_9 / 576 + w_3 * w_4 ** 2 * w_6 * w_7 ** 2 / 576 + w_3 * w_4 ** 2 * w_6 * w_7 * w_8 / 192 + w_3 * w_4 ** 2 * w_6 * w_7 * w_9 / 192 + w_3 * w_4 ** 2 * w_6 * w_8 ** 2 / 576 + w_3 * w_4 ** 2 * w_6 * w_8 * w_9 / 192 + w_3 * w_4 ** 2 * w_6 * w_9 ** 2 / 576 + w_3 * w_4 ** 2 * w_7 ** 2 * w_8 / 576 + w_3 * w_4 ** 2 * w_7 ** 2 * w_9 / 576 + w_3 * w_4 ** 2 * w_7 * w_8 ** 2 / 576 + w_3 * w_4 ** 2 * w_7 * w_8 * w_9 / 192 + w_3 * w_4 ** 2 * w_7 * w_9 ** 2 / 576 + w_3 * w_4 ** 2 * w_8 ** 2 * w_9 / 576 + w_3 * w_4 ** 2 * w_8 * w_9 ** 2 / 576 - w_3 * w_4 * w_5 ** 4 / 2880 + w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 576 + w_3 * w_4 * w_5 ** 2 * w_6 * w_7 / 192 + w_3 * w_4 * w_5 ** 2 * w_6 * w_8 / 192 + w_3 * w_4 * w_5 ** 2 * w_6 * w_9 / 192 + w_3 * w_4 * w_5 ** 2 * w_7 ** 2 / 576 + w_3 * w_4 * w_5 ** 2 * w_7 * w_8 / 192 + w_3 * w_4 * w_5 ** 2 * w_7 * w_9 / 192 + w_3 * w_4 * w_5 ** 2 * w_8 ** 2 / 576 + w_3 * w_4 * w_5 ** 2 * w_8 * w_9 / 192 + w_3 * w_4 * w_5 ** 2 * w_9 ** 2 / 576 + w_3 * w_4 * w_5 * w_6 ** 2 * w_7 / 192 + w_3 * w_4 * w_5 * w_6 ** 2 * w_8 / 192 + w_3 * w_4 * w_5 * w_6 ** 2 * w_9 / 192 + w_3 * w_4 * w_5 * w_6 * w_7 ** 2 / 192 + w_3 * w_4 * w_5 * w_6 * w_7 * w_8 / 64 + w_3 * w_4 * w_5 * w_6 * w_7 * w_9 / 64 + w_3 * w_4 * w_5 * w_6 * w_8 ** 2 / 192 + w_3 * w_4 * w_5 * w_6 * w_8 * w_9 / 64 + w_3 * w_4 * w_5 * w_6 * w_9 ** 2 / 192 + w_3 * w_4 * w_5 * w_7 ** 2 * w_8 / 192 + w_3 * w_4 * w_5 * w_7 ** 2 * w_9 / 192 + w_3 * w_4 * w_5 * w_7 * w_8 ** 2 / 192 + w_3 * w_4 * w_5 * w_7 * w_8 * w_9 / 64 + w_3 * w_4 * w_5 * w_7 * w_9 ** 2 / 192 + w_3 * w_4 * w_5 * w_8 ** 2 * w_9 / 192 + w_3 * w_4 * w_5 * w_8 * w_9 ** 2 / 192 - w_3 * w_4 * w_6 ** 4 / 2880 + w_3 * w_4 * w_6 ** 2 * w_7 ** 2 / 576 + w_3 * w_4 * w_6 ** 2 * w_7 * w_8 / 192 + w_3 * w_4 * w_6 ** 2 * w_7 * w_9 / 192 + w_3 * w_4 * w_6 ** 2 * w_8 ** 2 / 576 + w_3 * w_4 * w_6 ** 2 * w_8 * w_9 / 192 + w_3 * w_4 * w_6 ** 2 * w_9 ** 2 / 576 + w_3 * w_4 * w_6 * w_7 ** 2 * w_8 / 192 + w_3 * w_4 * w_6 * w_7 ** 2 * w_9 / 192 + w_3 * w_4 * w_6 * w_7 * w_8 ** 2 / 192 + w_3 * w_4 * w_6 * w_7 * w_8 * w_9 / 64 + w_3 * w_4 * w_6 * w_7 * w_9 ** 2 / 192 + w_3 * w_4 * w_6 * w_8 ** 2 * w_9 / 192 + w_3 * w_4 * w_6 * w_8 * w_9 ** 2 / 192 - w_3 * w_4 * w_7 ** 4 / 2880 + w_3 * w_4 * w_7 ** 2 * w_8 ** 2 / 576 + w_3 * w_4 * w_7 ** 2 * w_8 * w_9 / 192 + w_3 * w_4 * w_7 ** 2 * w_9 ** 2 / 576 + w_3 * w_4 * w_7 * w_8 ** 2 * w_9 / 192 + w_3 * w_4 * w_7 * w_8 * w_9 ** 2 / 192 - w_3 * w_4 * w_8 ** 4 / 2880 + w_3 * w_4 * w_8 ** 2 * w_9 ** 2 / 576 - w_3 * w_4 * w_9 ** 4 / 2880 - w_3 * w_5 ** 4 * w_6 / 2880 - w_3 * w_5 ** 4 * w_7 / 2880 - w_3 * w_5 ** 4 * w_8 / 2880 - w_3 * w_5 ** 4 * w_9 / 2880 + w_3 * w_5 ** 2 * w_6 ** 2 * w_7 / 576 + w_3 * w_5 ** 2 * w_6 ** 2 * w_8 / 576 + w_3 * w_5 ** 2 * w_6 ** 2 * w_9 / 576 + w_3 * w_5 ** 2 * w_6 * w_7 ** 2 / 576 + w_3 * w_5 ** 2 * w_6 * w_7 * w_8 / 192 + w_3 * w_5 ** 2 * w_6 * w_7 * w_9 / 192 + w_3 * w_5 ** 2 * w_6 * w_8 ** 2 / 576 + w_3 * w_5 ** 2 * w_6 * w_8 * w_9 / 192 + w_3 * w_5 ** 2 * w_6 * w_9 ** 2 / 576 + w_3 * w_5 ** 2 * w_7 ** 2 * w_8 / 576 + w_3 * w_5 ** 2 * w_7 ** 2 * w_9 / 576 + w_3 * w_5 ** 2 * w_7 * w_8 ** 2 / 576 + w_3 * w_5 ** 2 * w_7 * w_8 * w_9 / 192 + w_3 * w_5 ** 2 * w_7 * w_9 ** 2 / 576 + w_3 * w_5 ** 2 * w_8 ** 2 * w_9 / 576 + w_3 * w_5 ** 2 * w_8 * w_9 ** 2 / 576 - w_3 * w_5 * w_6 ** 4 / 2880 + w_3 * w_5 * w_6 ** 2 * w_7 ** 2 / 576 + w_3 * w_5 * w_6 ** 2 * w_7 * w_8 / 192 + w_3 * w_5 * w_6 ** 2 * w_7 * w_9 / 192 + w_3 * w_5 * w_6 ** 2 * w_8 ** 2 / 576 + w_3 * w_5 * w_6 ** 2 * w_8 * w_9 / 192 + w_3 * w_5 * w_6 ** 2 * w_9 ** 2 / 576 + w_3 * w_5 * w_6 * w_7 ** 2 * w_8 / 192 + w_3 * w_5 * w_6 * w_7 ** 2 * w_9 / 192 + w_3 * w_5 * w_6 * w_7 * w_8 ** 2 / 192 + w_3 * w_5 * w_6 * w_7 * w_8 * w_9 / 64 + w_3 * w_5 * w_6 * w_7 * w_9 ** 2 / 192 + w_3 * w_5 * w_6 * w_8 ** 2 * w_9 / 192 + w_3 * w_5 * w_6 * w_8 * w_9 ** 2 / 192 - w_3 * w_5 * w_7 ** 4 / 2880 + w_3 * w_5 * w_7 ** 2 * w_8 ** 2 / 576 + w_3 * w_5 * w_7 ** 2 * w_8 * w_9 / 192 + w_3 * w_5 * w_7 ** 2 * w_9 ** 2 / 576 + w_3 * w_5 * w_7 * w_8 ** 2 * w_9 / 192 + w_3 * w_5 * w_7 * w_8 * w_9 ** 2 / 192 - w_3 * w_5 * w_8 ** 4 / 2880 + w_3 * w_5 * w_8 ** 2 * w_9 ** 2 / 576 - w_3 * w_5 * w_9 ** 4 / 2880 - w_3 * w_6 ** 4 * w_7 / 2880 - w_3 * w_6 ** 4 * w_8 / 2880 - w_3 * w_6 ** 4 * w_9 / 2880 + w_3 * w_6 ** 2 * w_7 ** 2 * w_8 / 576 + w_3 * w_6 ** 2 * w_7 ** 2 * w_9 / 576 + w_3 * w_6 ** 2 * w_7 * w_8 ** 2 / 576 + w_3 * w_6 ** 2 * w_7 * w_8 * w_9 / 192 + w_3 * w_6 ** 2 * w_7 * w_9 ** 2 / 576 + w_3 * w_6 ** 2 * w_8 ** 2 * w_9 / 576 + w_3 * w_6 ** 2 * w_8 * w_9 ** 2 / 576 - w_3 * w_6 * w_7 ** 4 / 2880 + w_3 * w_6 * w_7 ** 2 * w_8 ** 2 / 576 + w_3 * w_6 * w_7 ** 2 * w_8 * w_9 / 192 + w_3 * w_6 * w_7 ** 2 * w_9 ** 2 / 576 + w_3 * w_6 * w_7 * w_8 ** 2 * w_9 / 192 + w_3 * w_6 * w_7 * w_8 * w_9 ** 2 / 192 - w_3 * w_6 * w_8 ** 4 / 2880 + w_3 * w_6 * w_8 ** 2 * w_9 ** 2 / 576 - w_3 * w_6 * w_9 ** 4 / 2880 - w_3 * w_7 ** 4 * w_8 / 2880 - w_3 * w_7 ** 4 * w_9 / 2880 + w_3 * w_7 ** 2 * w_8 ** 2 * w_9 / 576 + w_3 * w_7 ** 2 * w_8 * w_9 ** 2 / 576 - w_3 * w_7 * w_8 ** 4 / 2880 + w_3 * w_7 * w_8 ** 2 * w_9 ** 2 / 576 - w_3 * w_7 * w_9 ** 4 / 2880 - w_3 * w_8 ** 4 * w_9 / 2880 - w_3 * w_8 * w_9 ** 4 / 2880 + w_4 ** 6 / 30240 - w_4 ** 4 * w_5 ** 2 / 8640 - w_4 ** 4 * w_5 * w_6 / 2880 - w_4 ** 4 * w_5 * w_7 / 2880 - w_4 ** 4 * w_5 * w_8 / 2880 - w_4 ** 4 * w_5 * w_9 / 2880 - w_4 ** 4 * w_6 ** 2 / 8640 - w_4 ** 4 * w_6 * w_7 / 2880 - w_4 ** 4 * w_6 * w_8 / 2880 - w_4 ** 4 * w_6 * w_9 / 2880 - w_4 ** 4 * w_7 ** 2 / 8640 - w_4 ** 4 * w_7 * w_8 / 2880 - w_4 ** 4 * w_7 * w_9 / 2880 - w_4 ** 4 * w_8 ** 2 / 8640 - w_4 ** 4 * w_8 * w_9 / 2880 - w_4 ** 4 * w_9 ** 2 / 8640 - w_4 ** 2 * w_5 ** 4 / 8640 + w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 1728 + w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 576 + w_4 ** 2 * w_5 ** 2 * w_6 * w_8 / 576 + w_4 ** 2 * w_5 ** 2 * w_6 * w_9 / 576 + w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 1728 + w_4 ** 2 * w_5 ** 2 * w_7 * w_8 / 576 + w_4 ** 2 * w_5 ** 2 * w_7 * w_9 / 576 + w_4 ** 2 * w_5 ** 2 * w_8 ** 2 / 1728 + w_4 ** 2 * w_5 ** 2 * w_8 * w_9 / 576 + w_4 ** 2 * w_5 ** 2 * w_9 ** 2 / 1728 + w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 576 + w_4 ** 2 * w_5 * w_6 ** 2 * w_8 / 576 + w_4 ** 2 * w_5 * w_6 ** 2 * w_9 / 576 + w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 576 + w_4 ** 2 * w_5 * w_6 * w_7 * w_8 / 192 + w_4 ** 2 * w_5 * w_6 * w_7 * w_9 / 192 + w_4 ** 2 * w_5 * w_6 * w_8 ** 2 / 576 + w_4 ** 2 * w_5 * w_6 * w_8 * w_9 / 192 + w_4 ** 2 * w_5 * w_6 * w_9 ** 2 / 576 + w_4 ** 2 * w_5 * w_7 ** 2 * w_8 / 576 + w_4 ** 2 * w_5 * w_7 ** 2 * w_9 / 576 + w_4 ** 2 * w_5 * w_7 * w_8 ** 2 / 576 + w_4 ** 2 * w_5 * w_7 * w_8 * w_9 / 192 + w_4 ** 2 * w_5 * w_7 * w_9 ** 2 / 576 + w_4 ** 2 * w_5 * w_8 ** 2 * w_9 / 576 + w_4 ** 2 * w_5 * w_8 * w_9 ** 2 / 576 - w_4 ** 2 * w_6 ** 4 / 8640 + w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 + w_4 ** 2 * w_6 ** 2 * w_7 * w_8 / 576 + w_4 ** 2 * w_6 ** 2 * w_7 * w_9 / 576 + w_4 ** 2 * w_6 ** 2 * w_8 ** 2 / 1728 + w_4 ** 2 * w_6 ** 2 * w_8 * w_9 / 576 + w_4 ** 2 * w_6 ** 2 * w_9 ** 2 / 1728 + w_4 ** 2 * w_6 * w_7 ** 2 * w_8 / 576 + w_4 ** 2 * w_6 * w_7 ** 2 * w_9 / 576 + w_4 ** 2 * w_6 * w_7 * w_8 ** 2 / 576 + w_4 ** 2 * w_6 * w_7 * w_8 * w_9 / 192 + w_4 ** 2 * w_6 * w_7 * w_9 ** 2 / 576 + w_4 ** 2 * w_6 * w_8 ** 2 * w_9 / 576 + w_4 ** 2 * w_6 * w_8 * w_9 ** 2 / 576 - w_4 ** 2 * w_7 ** 4 / 8640 + w_4 ** 2 * w_7 ** 2 * w_8 ** 2 / 1728 + w_4 ** 2 * w_7 ** 2 * w_8 * w_9 / 576 + w_4 ** 2 * w_7 ** 2 * w_9 ** 2 / 1728 + w_4 ** 2 * w_7 * w_8 ** 2 * w_9 / 576 + w_4 ** 2 * w_7 * w_8 * w_9 ** 2 / 576 - w_4 ** 2 * w_8 ** 4 / 8640 + w_4 ** 2 * w_8 ** 2 * w_9 ** 2 / 1728 - w_4 ** 2 * w_9 ** 4 / 8640 - w_4 * w_5 ** 4 * w_6 / 2880 - w_4 * w_5 ** 4 * w_7 / 2880 - w_4 * w_5 ** 4 * w_8 / 2880 - w_4 * w_5 ** 4 * w_9 / 2880 + w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 576 + w_4 * w_5 ** 2 * w_6 ** 2 * w_8 / 576 + w_4 * w_5 ** 2 * w_6 ** 2 * w_9 / 576 + w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 576 + w_4 * w_5 ** 2 * w_6 * w_7 * w_8 / 192 + w_4 * w_5 ** 2 * w_6 * w_7 * w_9 / 192 + w_4 * w_5 ** 2 * w_6 * w_8 ** 2 / 576 + w_4 * w_5 ** 2 * w_6 * w_8 * w_9 / 192 + w_4 * w_5 ** 2 * w_6 * w_9 ** 2 / 576 + w_4 * w_5 ** 2 * w_7 ** 2 * w_8 / 576 + w_4 * w_5 ** 2 * w_7 ** 2 * w_9 / 576 + w_4 * w_5 ** 2 * w_7 * w_8 ** 2 / 576 + w_4 * w_5 ** 2 * w_7 * w_8 * w_9 / 192 + w_4 * w_5 ** 2 * w_7 * w_9 ** 2 / 576 + w_4 * w_5 ** 2 * w_8 ** 2 * w_9 / 576 + w_4 * w_5 ** 2 * w_8 * w_9 ** 2 / 576 - w_4 * w_5 * w_6 ** 4 / 2880 + w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 576 + w_4 * w_5 * w_6 ** 2 * w_7 * w_8 / 192 + w_4 * w_5 * w_6 ** 2 * w_7 * w_9 / 192 + w_4 * w_5 * w_6 ** 2 * w_8 ** 2 / 576 + w_4 * w_5 * w_6 ** 2 * w_8 * w_9 / 192 + w_4 * w_5 * w_6 ** 2 * w_9 ** 2 / 576 + w_4 * w_5 * w_6 * w_7 ** 2 * w_8 / 192 + w_4 * w_5 * w_6 * w_7 ** 2 * w_9 / 192 + w_4 * w_5 * w_6 * w_7 * w_8 ** 2 / 192 + w_4 * w_5 * w_6 * w_7 * w_8 * w_9 / 64 + w_4 * w_5 * w_6 * w_7 * w_9 ** 2 / 192 + w_4 * w_5 * w_6 * w_8 ** 2 * w_9 / 192 + w_4 * w_5 * w_6 * w_8 * w_9 ** 2 / 192 - w_4 * w_5 * w_7 ** 4 / 2880 + w_4 * w_5 * w_7 ** 2 * w_8 ** 2 / 576 + w_4 * w_5 * w_7 ** 2 * w_8 * w_9 / 192 + w_4 * w_5 * w_7 ** 2 * w_9 ** 2 / 576 + w_4 * w_5 * w_7 * w_8 ** 2 * w_9 / 192 + w_4 * w_5 * w_7 * w_8 * w_9 ** 2 / 192 - w_4 * w_5 * w_8 ** 4 / 2880 + w_4 * w_5 * w_8 ** 2 * w_9 ** 2 / 576 - w_4 * w_5 * w_9 ** 4 / 2880 - w_4 * w_6 ** 4 * w_7 / 2880 - w_4 * w_6 ** 4 * w_8 / 2880 - w_4 * w_6 ** 4 * w_9 / 2880 + w_4 * w_6 ** 2 * w_7 ** 2 * w_8 / 576 + w_4 * w_6 ** 2 * w_7 ** 2 * w_9 / 576 + w_4 * w_6 ** 2 * w_7 * w_8 ** 2 / 576 + w_4 * w_6 ** 2 * w_7 * w_8 * w_9 / 192 + w_4 * w_6 ** 2 * w_7 * w_9 ** 2 / 576 + w_4 * w_6 ** 2 * w_8 ** 2 * w_9 / 576 + w_4 * w_6 ** 2 * w_8 * w_9 ** 2 / 576 - w_4 * w_6 * w_7 ** 4 / 2880 + w_4 * w_6 * w_7 ** 2 * w_8 ** 2 / 576 + w_4 * w_6 * w_7 ** 2 * w_8 * w_9 / 192 + w_4 * w_6 * w_7 ** 2 * w_9 ** 2 / 576 + w_4 * w_6 * w_7 * w_8 ** 2 * w_9 / 192 + w_4 * w_6 * w_7 * w_8 * w_9 ** 2 / 192 - w_4 * w_6 * w_8 ** 4 / 2880 + w_4 * w_6 * w_8 ** 2 * w_9 ** 2 / 576 - w_4 * w_6 * w_9 ** 4 / 2880 - w_4 * w_7 ** 4 * w_8 / 2880 - w_4 * w_7 ** 4 * w_9 / 2880 + w_4 * w_7 ** 2 * w_8 ** 2 * w_9 / 576 + w_4 * w_7 ** 2 * w_8 * w_9 ** 2 / 576 - w_4 * w_7 * w_8 ** 4 / 2880 + w_4 * w_7 * w_8 ** 2 * w_9 ** 2 / 576 - w_4 * w_7 * w_9 ** 4 / 2880 - w_4 * w_8 ** 4 * w_9 / 2880 - w_4 * w_8 * w_9 ** 4 / 2880 + w_5 ** 6 / 30240 - w_5 ** 4 * w_6 ** 2 / 8640 - w_5 ** 4 * w_6 * w_7 / 2880 - w_5 ** 4 * w_6 * w_8 / 2880 - w_5 ** 4 * w_6 * w_9 / 2880 - w_5 ** 4 * w_7 ** 2 / 8640 - w_5 ** 4 * w_7 * w_8 / 2880 - w_5 ** 4 * w_7 * w_9 / 2880 - w_5 ** 4 * w_8 ** 2 / 8640 - w_5 ** 4 * w_8 * w_9 / 2880 - w_5 ** 4 * w_9 ** 2 / 8640 - w_5 ** 2 * w_6 ** 4 / 8640 + w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 1728 + w_5 ** 2 * w_6 ** 2 * w_7 * w_8 / 576 + w_5 ** 2 * w_6 ** 2 * w_7 * w_9 / 576 + w_5 ** 2 * w_6 ** 2 * w_8 ** 2 / 1728 + w_5 ** 2 * w_6 ** 2 * w_8 * w_9 / 576 + w_5 ** 2 * w_6 ** 2 * w_9 ** 2 / 1728 + w_5 ** 2 * w_6 * w_7 ** 2 * w_8 / 576 + w_5 ** 2 * w_6 * w_7 ** 2 * w_9 / 576 + w_5 ** 2 * w_6 * w_7 * w_8 ** 2 / 576 + w_5 ** 2 * w_6 * w_7 * w_8 * w_9 / 192 + w_5 ** 2 * w_6 * w_7 * w_9 ** 2 / 576 + w_5 ** 2 * w_6 * w_8 ** 2 * w_9 / 576 + w_5 ** 2 * w_6 * w_8 * w_9 ** 2 / 576 - w_5 ** 2 * w_7 ** 4 / 8640 + w_5 ** 2 * w_7 ** 2 * w_8 ** 2 / 1728 + w_5 ** 2 * w_7 ** 2 * w_8 * w_9 / 576 + w_5 ** 2 * w_7 ** 2 * w_9 ** 2 / 1728 + w_5 ** 2 * w_7 * w_8 ** 2 * w_9 / 576 + w_5 ** 2 * w_7 * w_8 * w_9 ** 2 / 576 - w_5 ** 2 * w_8 ** 4 / 8640 + w_5 ** 2 * w_8 ** 2 * w_9 ** 2 / 1728 - w_5 ** 2 * w_9 ** 4 / 8640 - w_5 * w_6 ** 4 * w_7 / 2880 - w_5 * w_6 ** 4 * w_8 / 2880 - w_5 * w_6 ** 4 * w_9 / 2880 + w_5 * w_6 ** 2 * w_7 ** 2 * w_8 / 576 + w_5 * w_6 ** 2 * w_7 ** 2 * w_9 / 576 + w_5 * w_6 ** 2 * w_7 * w_8 ** 2 / 576 + w_5 * w_6 ** 2 * w_7 * w_8 * w_9 / 192 + w_5 * w_6 ** 2 * w_7 * w_9 ** 2 / 576 + w_5 * w_6 ** 2 * w_8 ** 2 * w_9 / 576 + w_5 * w_6 ** 2 * w_8 * w_9 ** 2 / 576 - w_5 * w_6 * w_7 ** 4 / 2880 + w_5 * w_6 * w_7 ** 2 * w_8 ** 2 / 576 + w_5 * w_6 * w_7 ** 2 * w_8 * w_9 / 192 + w_5 * w_6 * w_7 ** 2 * w_9 ** 2 / 576 + w_5 * w_6 * w_7 * w_8 ** 2 * w_9 / 192 + w_5 * w_6 * w_7 * w_8 * w_9 ** 2 / 192 - w_5 * w_6 * w_8 ** 4 / 2880 + w_5 * w_6 * w_8 ** 2 * w_9 ** 2 / 576 - w_5 * w_6 * w_9 ** 4 / 2880 - w_5 * w_7 ** 4 * w_8 / 2880 - w_5 * w_7 ** 4 * w_9 / 2880 + w_5 * w_7 ** 2 * w_8 ** 2 * w_9 / 576 + w_5 * w_7 ** 2 * w_8 * w_9 ** 2 / 576 - w_5 * w_7 * w_8 ** 4 / 2880 + w_5 * w_7 * w_8 ** 2 * w_9 ** 2 / 576 - w_5 * w_7 * w_9 ** 4 / 2880 - w_5 * w_8 ** 4 * w_9 / 2880 - w_5 * w_8 * w_9 ** 4 / 2880 + w_6 ** 6 / 30240 - w_6 ** 4 * w_7 ** 2 / 8640 - w_6 ** 4 * w_7 * w_8 / 2880 - w_6 ** 4 * w_7 * w_9 / 2880 - w_6 ** 4 * w_8 ** 2 / 8640 - w_6 ** 4 * w_8 * w_9 / 2880 - w_6 ** 4 * w_9 ** 2 / 8640 - w_6 ** 2 * w_7 ** 4 / 8640 + w_6 ** 2 * w_7 ** 2 * w_8 ** 2 / 1728 + w_6 ** 2 * w_7 ** 2 * w_8 * w_9 / 576 + w_6 ** 2 * w_7 ** 2 * w_9 ** 2 / 1728 + w_6 ** 2 * w_7 * w_8 ** 2 * w_9 / 576 + w_6 ** 2 * w_7 * w_8 * w_9 ** 2 / 576 - w_6 ** 2 * w_8 ** 4 / 8640 + w_6 ** 2 * w_8 ** 2 * w_9 ** 2 / 1728 - w_6 ** 2 * w_9 ** 4 / 8640 - w_6 * w_7 ** 4 * w_8 / 2880 - w_6 * w_7 ** 4 * w_9 / 2880 + w_6 * w_7 ** 2 * w_8 ** 2 * w_9 / 576 + w_6 * w_7 ** 2 * w_8 * w_9 ** 2 / 576 - w_6 * w_7 * w_8 ** 4 / 2880 + w_6 * w_7 * w_8 ** 2 * w_9 ** 2 / 576 - w_6 * w_7 * w_9 ** 4 / 2880 - w_6 * w_8 ** 4 * w_9 / 2880 - w_6 * w_8 * w_9 ** 4 / 2880 + w_7 ** 6 / 30240 - w_7 ** 4 * w_8 ** 2 / 8640 - w_7 ** 4 * w_8 * w_9 / 2880 - w_7 ** 4 * w_9 ** 2 / 8640 - w_7 ** 2 * w_8 ** 4 / 8640 + w_7 ** 2 * w_8 ** 2 * w_9 ** 2 / 1728 - w_7 ** 2 * w_9 ** 4 / 8640 - w_7 * w_8 ** 4 * w_9 / 2880 - w_7 * w_8 * w_9 ** 4 / 2880 + w_8 ** 6 / 30240 - w_8 ** 4 * w_9 ** 2 / 8640 - w_8 ** 2 * w_9 ** 4 / 8640 + w_9 ** 6 / 30240
-    if s == 7 and ln == 8:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        w_8 = sym.Symbol("w_8")
-        return w_1 ** 6 * w_2 / 60480 + w_1 ** 6 * w_3 / 60480 + w_1 ** 6 * w_4 / 60480 + w_1 ** 6 * w_5 / 60480 + w_1 ** 6 * w_6 / 60480 + w_1 ** 6 * w_7 / 60480 + w_1 ** 6 * w_8 / 60480 - w_1 ** 4 * w_2 ** 2 * w_3 / 17280 - w_1 ** 4 * w_2 ** 2 * w_4 / 17280 - w_1 ** 4 * w_2 ** 2 * w_5 / 17280 - w_1 ** 4 * w_2 ** 2 * w_6 / 17280 - w_1 ** 4 * w_2 ** 2 * w_7 / 17280 - w_1 ** 4 * w_2 ** 2 * w_8 / 17280 - w_1 ** 4 * w_2 * w_3 ** 2 / 17280 - w_1 ** 4 * w_2 * w_3 * w_4 / 5760 - w_1 ** 4 * w_2 * w_3 * w_5 / 5760 - w_1 ** 4 * w_2 * w_3 * w_6 / 5760 - w_1 ** 4 * w_2 * w_3 * w_7 / 5760 - w_1 ** 4 * w_2 * w_3 * w_8 / 5760 - w_1 ** 4 * w_2 * w_4 ** 2 / 17280 - w_1 ** 4 * w_2 * w_4 * w_5 / 5760 - w_1 ** 4 * w_2 * w_4 * w_6 / 5760 - w_1 ** 4 * w_2 * w_4 * w_7 / 5760 - w_1 ** 4 * w_2 * w_4 * w_8 / 5760 - w_1 ** 4 * w_2 * w_5 ** 2 / 17280 - w_1 ** 4 * w_2 * w_5 * w_6 / 5760 - w_1 ** 4 * w_2 * w_5 * w_7 / 5760 - w_1 ** 4 * w_2 * w_5 * w_8 / 5760 - w_1 ** 4 * w_2 * w_6 ** 2 / 17280 - w_1 ** 4 * w_2 * w_6 * w_7 / 5760 - w_1 ** 4 * w_2 * w_6 * w_8 / 5760 - w_1 ** 4 * w_2 * w_7 ** 2 / 17280 - w_1 ** 4 * w_2 * w_7 * w_8 / 5760 - w_1 ** 4 * w_2 * w_8 ** 2 / 17280 - w_1 ** 4 * w_3 ** 2 * w_4 / 17280 - w_1 ** 4 * w_3 ** 2 * w_5 / 17280 - w_1 ** 4 * w_3 ** 2 * w_6 / 17280 - w_1 ** 4 * w_3 ** 2 * w_7 / 17280 - w_1 ** 4 * w_3 ** 2 * w_8 / 17280 - w_1 ** 4 * w_3 * w_4 ** 2 / 17280 - w_1 ** 4 * w_3 * w_4 * w_5 / 5760 - w_1 ** 4 * w_3 * w_4 * w_6 / 5760 - w_1 ** 4 * w_3 * w_4 * w_7 / 5760 - w_1 ** 4 * w_3 * w_4 * w_8 / 5760 - w_1 ** 4 * w_3 * w_5 ** 2 / 17280 - w_1 ** 4 * w_3 * w_5 * w_6 / 5760 - w_1 ** 4 * w_3 * w_5 * w_7 / 5760 - w_1 ** 4 * w_3 * w_5 * w_8 / 5760 - w_1 ** 4 * w_3 * w_6 ** 2 / 17280 - w_1 ** 4 * w_3 * w_6 * w_7 / 5760 - w_1 ** 4 * w_3 * w_6 * w_8 / 5760 - w_1 ** 4 * w_3 * w_7 ** 2 / 17280 - w_1 ** 4 * w_3 * w_7 * w_8 / 5760 - w_1 ** 4 * w_3 * w_8 ** 2 / 17280 - w_1 ** 4 * w_4 ** 2 * w_5 / 17280 - w_1 ** 4 * w_4 ** 2 * w_6 / 17280 - w_1 ** 4 * w_4 ** 2 * w_7 / 17280 - w_1 ** 4 * w_4 ** 2 * w_8 / 17280 - w_1 ** 4 * w_4 * w_5 ** 2 / 17280 - w_1 ** 4 * w_4 * w_5 * w_6 / 5760 - w_1 ** 4 * w_4 * w_5 * w_7 / 5760 - w_1 ** 4 * w_4 * w_5 * w_8 / 5760 - w_1 ** 4 * w_4 * w_6 ** 2 / 17280 - w_1 ** 4 * w_4 * w_6 * w_7 / 5760 - w_1 ** 4 * w_4 * w_6 * w_8 / 5760 - w_1 ** 4 * w_4 * w_7 ** 2 / 17280 - w_1 ** 4 * w_4 * w_7 * w_8 / 5760 - w_1 ** 4 * w_4 * w_8 ** 2 / 17280 - w_1 ** 4 * w_5 ** 2 * w_6 / 17280 - w_1 ** 4 * w_5 ** 2 * w_7 / 17280 - w_1 ** 4 * w_5 ** 2 * w_8 / 17280 - w_1 ** 4 * w_5 * w_6 ** 2 / 17280 - w_1 ** 4 * w_5 * w_6 * w_7 / 5760 - w_1 ** 4 * w_5 * w_6 * w_8 / 5760 - w_1 ** 4 * w_5 * w_7 ** 2 / 17280 - w_1 ** 4 * w_5 * w_7 * w_8 / 5760 - w_1 ** 4 * w_5 * w_8 ** 2 / 17280 - w_1 ** 4 * w_6 ** 2 * w_7 / 17280 - w_1 ** 4 * w_6 ** 2 * w_8 / 17280 - w_1 ** 4 * w_6 * w_7 ** 2 / 17280 - w_1 ** 4 * w_6 * w_7 * w_8 / 5760 - w_1 ** 4 * w_6 * w_8 ** 2 / 17280 - w_1 ** 4 * w_7 ** 2 * w_8 / 17280 - w_1 ** 4 * w_7 * w_8 ** 2 / 17280 - w_1 ** 2 * w_2 ** 4 * w_3 / 17280 - w_1 ** 2 * w_2 ** 4 * w_4 / 17280 - w_1 ** 2 * w_2 ** 4 * w_5 / 17280 - w_1 ** 2 * w_2 ** 4 * w_6 / 17280 - w_1 ** 2 * w_2 ** 4 * w_7 / 17280 - w_1 ** 2 * w_2 ** 4 * w_8 / 17280 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_6 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_7 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_8 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_6 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_7 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_8 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 * w_6 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 * w_7 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 * w_8 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_6 * w_7 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_6 * w_8 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_3 * w_7 * w_8 / 1152 + w_1 ** 2 * w_2 ** 2 * w_3 * w_8 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_6 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_7 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_8 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 * w_6 / 1152 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 * w_7 / 1152 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 * w_8 / 1152 + w_1 ** 2 * w_2 ** 2 * w_4 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 * w_6 * w_7 / 1152 + w_1 ** 2 * w_2 ** 2 * w_4 * w_6 * w_8 / 1152 + w_1 ** 2 * w_2 ** 2 * w_4 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_4 * w_7 * w_8 / 1152 + w_1 ** 2 * w_2 ** 2 * w_4 * w_8 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 * w_6 / 3456 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 * w_7 / 3456 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 * w_8 / 3456 + w_1 ** 2 * w_2 ** 2 * w_5 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_5 * w_6 * w_7 / 1152 + w_1 ** 2 * w_2 ** 2 * w_5 * w_6 * w_8 / 1152 + w_1 ** 2 * w_2 ** 2 * w_5 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_5 * w_7 * w_8 / 1152 + w_1 ** 2 * w_2 ** 2 * w_5 * w_8 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_6 ** 2 * w_7 / 3456 + w_1 ** 2 * w_2 ** 2 * w_6 ** 2 * w_8 / 3456 + w_1 ** 2 * w_2 ** 2 * w_6 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_6 * w_7 * w_8 / 1152 + w_1 ** 2 * w_2 ** 2 * w_6 * w_8 ** 2 / 3456 + w_1 ** 2 * w_2 ** 2 * w_7 ** 2 * w_8 / 3456 + w_1 ** 2 * w_2 ** 2 * w_7 * w_8 ** 2 / 3456 - w_1 ** 2 * w_2 * w_3 ** 4 / 17280 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_6 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_7 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_8 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 * w_6 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 * w_7 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 * w_8 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 ** 2 * w_6 * w_7 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_6 * w_8 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 ** 2 * w_7 * w_8 / 1152 + w_1 ** 2 * w_2 * w_3 ** 2 * w_8 ** 2 / 3456 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_6 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_7 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_8 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 * w_6 / 384 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 * w_7 / 384 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 * w_8 / 384 + w_1 ** 2 * w_2 * w_3 * w_4 * w_6 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 * w_6 * w_7 / 384 + w_1 ** 2 * w_2 * w_3 * w_4 * w_6 * w_8 / 384 + w_1 ** 2 * w_2 * w_3 * w_4 * w_7 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_4 * w_7 * w_8 / 384 + w_1 ** 2 * w_2 * w_3 * w_4 * w_8 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 * w_6 / 1152 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 * w_7 / 1152 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 * w_8 / 1152 + w_1 ** 2 * w_2 * w_3 * w_5 * w_6 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_5 * w_6 * w_7 / 384 + w_1 ** 2 * w_2 * w_3 * w_5 * w_6 * w_8 / 384 + w_1 ** 2 * w_2 * w_3 * w_5 * w_7 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_5 * w_7 * w_8 / 384 + w_1 ** 2 * w_2 * w_3 * w_5 * w_8 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_6 ** 2 * w_7 / 1152 + w_1 ** 2 * w_2 * w_3 * w_6 ** 2 * w_8 / 1152 + w_1 ** 2 * w_2 * w_3 * w_6 * w_7 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_6 * w_7 * w_8 / 384 + w_1 ** 2 * w_2 * w_3 * w_6 * w_8 ** 2 / 1152 + w_1 ** 2 * w_2 * w_3 * w_7 ** 2 * w_8 / 1152 + w_1 ** 2 * w_2 * w_3 * w_7 * w_8 ** 2 / 1152 - w_1 ** 2 * w_2 * w_4 ** 4 / 17280 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 ** 2 / 3456 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 * w_6 / 1152 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 * w_7 / 1152 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 * w_8 / 1152 + w_1 ** 2 * w_2 * w_4 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 * w_4 ** 2 * w_6 * w_7 / 1152 + w_1 ** 2 * w_2 * w_4 ** 2 * w_6 * w_8 / 1152 + w_1 ** 2 * w_2 * w_4 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 * w_4 ** 2 * w_7 * w_8 / 1152 + w_1 ** 2 * w_2 * w_4 ** 2 * w_8 ** 2 / 3456 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 * w_6 / 1152 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 * w_7 / 1152 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 * w_8 / 1152 + w_1 ** 2 * w_2 * w_4 * w_5 * w_6 ** 2 / 1152 + w_1 ** 2 * w_2 * w_4 * w_5 * w_6 * w_7 / 384 + w_1 ** 2 * w_2 * w_4 * w_5 * w_6 * w_8 / 384 + w_1 ** 2 * w_2 * w_4 * w_5 * w_7 ** 2 / 1152 + w_1 ** 2 * w_2 * w_4 * w_5 * w_7 * w_8 / 384 + w_1 ** 2 * w_2 * w_4 * w_5 * w_8 ** 2 / 1152 + w_1 ** 2 * w_2 * w_4 * w_6 ** 2 * w_7 / 1152 + w_1 ** 2 * w_2 * w_4 * w_6 ** 2 * w_8 / 1152 + w_1 ** 2 * w_2 * w_4 * w_6 * w_7 ** 2 / 1152 + w_1 ** 2 * w_2 * w_4 * w_6 * w_7 * w_8 / 384 + w_1 ** 2 * w_2 * w_4 * w_6 * w_8 ** 2 / 1152 + w_1 ** 2 * w_2 * w_4 * w_7 ** 2 * w_8 / 1152 + w_1 ** 2 * w_2 * w_4 * w_7 * w_8 ** 2 / 1152 - w_1 ** 2 * w_2 * w_5 ** 4 / 17280 + w_1 ** 2 * w_2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_1 ** 2 * w_2 * w_5 ** 2 * w_6 * w_8 / 1152 + w_1 ** 2 * w_2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 * w_5 ** 2 * w_7 * w_8 / 1152 + w_1 ** 2 * w_2 * w_5 ** 2 * w_8 ** 2 / 3456 + w_1 ** 2 * w_2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_1 ** 2 * w_2 * w_5 * w_6 ** 2 * w_8 / 1152 + w_1 ** 2 * w_2 * w_5 * w_6 * w_7 ** 2 / 1152 + w_1 ** 2 * w_2 * w_5 * w_6 * w_7 * w_8 / 384 + w_1 ** 2 * w_2 * w_5 * w_6 * w_8 ** 2 / 1152 + w_1 ** 2 * w_2 * w_5 * w_7 ** 2 * w_8 / 1152 + w_1 ** 2 * w_2 * w_5 * w_7 * w_8 ** 2 / 1152 - w_1 ** 2 * w_2 * w_6 ** 4 / 17280 + w_1 ** 2 * w_2 * w_6 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_2 * w_6 ** 2 * w_7 * w_8 / 1152 + w_1 ** 2 * w_2 * w_6 ** 2 * w_8 ** 2 / 3456 + w_1 ** 2 * w_2 * w_6 * w_7 ** 2 * w_8 / 1152 + w_1 ** 2 * w_2 * w_6 * w_7 * w_8 ** 2 / 1152 - w_1 ** 2 * w_2 * w_7 ** 4 / 17280 + w_1 ** 2 * w_2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_1 ** 2 * w_2 * w_8 ** 4 / 17280 - w_1 ** 2 * w_3 ** 4 * w_4 / 17280 - w_1 ** 2 * w_3 ** 4 * w_5 / 17280 - w_1 ** 2 * w_3 ** 4 * w_6 / 17280 - w_1 ** 2 * w_3 ** 4 * w_7 / 17280 - w_1 ** 2 * w_3 ** 4 * w_8 / 17280 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_7 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_8 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 / 1152 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 * w_7 / 1152 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 * w_8 / 1152 + w_1 ** 2 * w_3 ** 2 * w_4 * w_6 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 * w_6 * w_7 / 1152 + w_1 ** 2 * w_3 ** 2 * w_4 * w_6 * w_8 / 1152 + w_1 ** 2 * w_3 ** 2 * w_4 * w_7 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_4 * w_7 * w_8 / 1152 + w_1 ** 2 * w_3 ** 2 * w_4 * w_8 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 / 3456 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 * w_7 / 3456 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 * w_8 / 3456 + w_1 ** 2 * w_3 ** 2 * w_5 * w_6 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_5 * w_6 * w_7 / 1152 + w_1 ** 2 * w_3 ** 2 * w_5 * w_6 * w_8 / 1152 + w_1 ** 2 * w_3 ** 2 * w_5 * w_7 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_5 * w_7 * w_8 / 1152 + w_1 ** 2 * w_3 ** 2 * w_5 * w_8 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_6 ** 2 * w_7 / 3456 + w_1 ** 2 * w_3 ** 2 * w_6 ** 2 * w_8 / 3456 + w_1 ** 2 * w_3 ** 2 * w_6 * w_7 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_6 * w_7 * w_8 / 1152 + w_1 ** 2 * w_3 ** 2 * w_6 * w_8 ** 2 / 3456 + w_1 ** 2 * w_3 ** 2 * w_7 ** 2 * w_8 / 3456 + w_1 ** 2 * w_3 ** 2 * w_7 * w_8 ** 2 / 3456 - w_1 ** 2 * w_3 * w_4 ** 4 / 17280 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 3456 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 / 1152 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 * w_7 / 1152 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 * w_8 / 1152 + w_1 ** 2 * w_3 * w_4 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_3 * w_4 ** 2 * w_6 * w_7 / 1152 + w_1 ** 2 * w_3 * w_4 ** 2 * w_6 * w_8 / 1152 + w_1 ** 2 * w_3 * w_4 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_3 * w_4 ** 2 * w_7 * w_8 / 1152 + w_1 ** 2 * w_3 * w_4 ** 2 * w_8 ** 2 / 3456 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 / 1152 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 * w_7 / 1152 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 * w_8 / 1152 + w_1 ** 2 * w_3 * w_4 * w_5 * w_6 ** 2 / 1152 + w_1 ** 2 * w_3 * w_4 * w_5 * w_6 * w_7 / 384 + w_1 ** 2 * w_3 * w_4 * w_5 * w_6 * w_8 / 384 + w_1 ** 2 * w_3 * w_4 * w_5 * w_7 ** 2 / 1152 + w_1 ** 2 * w_3 * w_4 * w_5 * w_7 * w_8 / 384 + w_1 ** 2 * w_3 * w_4 * w_5 * w_8 ** 2 / 1152 + w_1 ** 2 * w_3 * w_4 * w_6 ** 2 * w_7 / 1152 + w_1 ** 2 * w_3 * w_4 * w_6 ** 2 * w_8 / 1152 + w_1 ** 2 * w_3 * w_4 * w_6 * w_7 ** 2 / 1152 + w_1 ** 2 * w_3 * w_4 * w_6 * w_7 * w_8 / 384 + w_1 ** 2 * w_3 * w_4 * w_6 * w_8 ** 2 / 1152 + w_1 ** 2 * w_3 * w_4 * w_7 ** 2 * w_8 / 1152 + w_1 ** 2 * w_3 * w_4 * w_7 * w_8 ** 2 / 1152 - w_1 ** 2 * w_3 * w_5 ** 4 / 17280 + w_1 ** 2 * w_3 * w_5 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_3 * w_5 ** 2 * w_6 * w_7 / 1152 + w_1 ** 2 * w_3 * w_5 ** 2 * w_6 * w_8 / 1152 + w_1 ** 2 * w_3 * w_5 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_3 * w_5 ** 2 * w_7 * w_8 / 1152 + w_1 ** 2 * w_3 * w_5 ** 2 * w_8 ** 2 / 3456 + w_1 ** 2 * w_3 * w_5 * w_6 ** 2 * w_7 / 1152 + w_1 ** 2 * w_3 * w_5 * w_6 ** 2 * w_8 / 1152 + w_1 ** 2 * w_3 * w_5 * w_6 * w_7 ** 2 / 1152 + w_1 ** 2 * w_3 * w_5 * w_6 * w_7 * w_8 / 384 + w_1 ** 2 * w_3 * w_5 * w_6 * w_8 ** 2 / 1152 + w_1 ** 2 * w_3 * w_5 * w_7 ** 2 * w_8 / 1152 + w_1 ** 2 * w_3 * w_5 * w_7 * w_8 ** 2 / 1152 - w_1 ** 2 * w_3 * w_6 ** 4 / 17280 + w_1 ** 2 * w_3 * w_6 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_3 * w_6 ** 2 * w_7 * w_8 / 1152 + w_1 ** 2 * w_3 * w_6 ** 2 * w_8 ** 2 / 3456 + w_1 ** 2 * w_3 * w_6 * w_7 ** 2 * w_8 / 1152 + w_1 ** 2 * w_3 * w_6 * w_7 * w_8 ** 2 / 1152 - w_1 ** 2 * w_3 * w_7 ** 4 / 17280 + w_1 ** 2 * w_3 * w_7 ** 2 * w_8 ** 2 / 3456 - w_1 ** 2 * w_3 * w_8 ** 4 / 17280 - w_1 ** 2 * w_4 ** 4 * w_5 / 17280 - w_1 ** 2 * w_4 ** 4 * w_6 / 17280 - w_1 ** 2 * w_4 ** 4 * w_7 / 17280 - w_1 ** 2 * w_4 ** 4 * w_8 / 17280 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 3456 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 * w_7 / 3456 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 * w_8 / 3456 + w_1 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 3456 + w_1 ** 2 * w_4 ** 2 * w_5 * w_6 * w_7 / 1152 + w_1 ** 2 * w_4 ** 2 * w_5 * w_6 * w_8 / 1152 + w_1 ** 2 * w_4 ** 2 * w_5 * w_7 ** 2 / 3456 + w_1 ** 2 * w_4 ** 2 * w_5 * w_7 * w_8 / 1152 + w_1 ** 2 * w_4 ** 2 * w_5 * w_8 ** 2 / 3456 + w_1 ** 2 * w_4 ** 2 * w_6 ** 2 * w_7 / 3456 + w_1 ** 2 * w_4 ** 2 * w_6 ** 2 * w_8 / 3456 + w_1 ** 2 * w_4 ** 2 * w_6 * w_7 ** 2 / 3456 + w_1 ** 2 * w_4 ** 2 * w_6 * w_7 * w_8 / 1152 + w_1 ** 2 * w_4 ** 2 * w_6 * w_8 ** 2 / 3456 + w_1 ** 2 * w_4 ** 2 * w_7 ** 2 * w_8 / 3456 + w_1 ** 2 * w_4 ** 2 * w_7 * w_8 ** 2 / 3456 - w_1 ** 2 * w_4 * w_5 ** 4 / 17280 + w_1 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 3456 + w_1 ** 2 * w_4 * w_5 ** 2 * w_6 * w_7 / 1152 + w_1 ** 2 * w_4 * w_5 ** 2 * w_6 * w_8 / 1152 + w_1 ** 2 * w_4 * w_5 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_4 * w_5 ** 2 * w_7 * w_8 / 1152 + w_1 ** 2 * w_4 * w_5 ** 2 * w_8 ** 2 / 3456 + w_1 ** 2 * w_4 * w_5 * w_6 ** 2 * w_7 / 1152 + w_1 ** 2 * w_4 * w_5 * w_6 ** 2 * w_8 / 1152 + w_1 ** 2 * w_4 * w_5 * w_6 * w_7 ** 2 / 1152 + w_1 ** 2 * w_4 * w_5 * w_6 * w_7 * w_8 / 384 + w_1 ** 2 * w_4 * w_5 * w_6 * w_8 ** 2 / 1152 + w_1 ** 2 * w_4 * w_5 * w_7 ** 2 * w_8 / 1152 + w_1 ** 2 * w_4 * w_5 * w_7 * w_8 ** 2 / 1152 - w_1 ** 2 * w_4 * w_6 ** 4 / 17280 + w_1 ** 2 * w_4 * w_6 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_4 * w_6 ** 2 * w_7 * w_8 / 1152 + w_1 ** 2 * w_4 * w_6 ** 2 * w_8 ** 2 / 3456 + w_1 ** 2 * w_4 * w_6 * w_7 ** 2 * w_8 / 1152 + w_1 ** 2 * w_4 * w_6 * w_7 * w_8 ** 2 / 1152 - w_1 ** 2 * w_4 * w_7 ** 4 / 17280 + w_1 ** 2 * w_4 * w_7 ** 2 * w_8 ** 2 / 3456 - w_1 ** 2 * w_4 * w_8 ** 4 / 17280 - w_1 ** 2 * w_5 ** 4 * w_6 / 17280 - w_1 ** 2 * w_5 ** 4 * w_7 / 17280 - w_1 ** 2 * w_5 ** 4 * w_8 / 17280 + w_1 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 3456 + w_1 ** 2 * w_5 ** 2 * w_6 ** 2 * w_8 / 3456 + w_1 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 3456 + w_1 ** 2 * w_5 ** 2 * w_6 * w_7 * w_8 / 1152 + w_1 ** 2 * w_5 ** 2 * w_6 * w_8 ** 2 / 3456 + w_1 ** 2 * w_5 ** 2 * w_7 ** 2 * w_8 / 3456 + w_1 ** 2 * w_5 ** 2 * w_7 * w_8 ** 2 / 3456 - w_1 ** 2 * w_5 * w_6 ** 4 / 17280 + w_1 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 3456 + w_1 ** 2 * w_5 * w_6 ** 2 * w_7 * w_8 / 1152 + w_1 ** 2 * w_5 * w_6 ** 2 * w_8 ** 2 / 3456 + w_1 ** 2 * w_5 * w_6 * w_7 ** 2 * w_8 / 1152 + w_1 ** 2 * w_5 * w_6 * w_7 * w_8 ** 2 / 1152 - w_1 ** 2 * w_5 * w_7 ** 4 / 17280 + w_1 ** 2 * w_5 * w_7 ** 2 * w_8 ** 2 / 3456 - w_1 ** 2 * w_5 * w_8 ** 4 / 17280 - w_1 ** 2 * w_6 ** 4 * w_7 / 17280 - w_1 ** 2 * w_6 ** 4 * w_8 / 17280 + w_1 ** 2 * w_6 ** 2 * w_7 ** 2 * w_8 / 3456 + w_1 ** 2 * w_6 ** 2 * w_7 * w_8 ** 2 / 3456 - w_1 ** 2 * w_6 * w_7 ** 4 / 17280 + w_1 ** 2 * w_6 * w_7 ** 2 * w_8 ** 2 / 3456 - w_1 ** 2 * w_6 * w_8 ** 4 / 17280 - w_1 ** 2 * w_7 ** 4 * w_8 / 17280 - w_1 ** 2 * w_7 * w_8 ** 4 / 17280 + w_1 * w_2 ** 6 / 60480 - w_1 * w_2 ** 4 * w_3 ** 2 / 17280 - w_1 * w_2 ** 4 * w_3 * w_4 / 5760 - w_1 * w_2 ** 4 * w_3 * w_5 / 5760 - w_1 * w_2 ** 4 * w_3 * w_6 / 5760 - w_1 * w_2 ** 4 * w_3 * w_7 / 5760 - w_1 * w_2 ** 4 * w_3 * w_8 / 5760 - w_1 * w_2 ** 4 * w_4 ** 2 / 17280 - w_1 * w_2 ** 4 * w_4 * w_5 / 5760 - w_1 * w_2 ** 4 * w_4 * w_6 / 5760 - w_1 * w_2 ** 4 * w_4 * w_7 / 5760 - w_1 * w_2 ** 4 * w_4 * w_8 / 5760 - w_1 * w_2 ** 4 * w_5 ** 2 / 17280 - w_1 * w_2 ** 4 * w_5 * w_6 / 5760 - w_1 * w_2 ** 4 * w_5 * w_7 / 5760 - w_1 * w_2 ** 4 * w_5 * w_8 / 5760 - w_1 * w_2 ** 4 * w_6 ** 2 / 17280 - w_1 * w_2 ** 4 * w_6 * w_7 / 5760 - w_1 * w_2 ** 4 * w_6 * w_8 / 5760 - w_1 * w_2 ** 4 * w_7 ** 2 / 17280 - w_1 * w_2 ** 4 * w_7 * w_8 / 5760 - w_1 * w_2 ** 4 * w_8 ** 2 / 17280 - w_1 * w_2 ** 2 * w_3 ** 4 / 17280 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_6 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_7 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_8 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 * w_6 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 * w_7 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 * w_8 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_6 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 ** 2 * w_6 * w_7 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_6 * w_8 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_7 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 ** 2 * w_7 * w_8 / 1152 + w_1 * w_2 ** 2 * w_3 ** 2 * w_8 ** 2 / 3456 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_6 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_7 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_8 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 * w_6 / 384 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 * w_7 / 384 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 * w_8 / 384 + w_1 * w_2 ** 2 * w_3 * w_4 * w_6 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 * w_6 * w_7 / 384 + w_1 * w_2 ** 2 * w_3 * w_4 * w_6 * w_8 / 384 + w_1 * w_2 ** 2 * w_3 * w_4 * w_7 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_4 * w_7 * w_8 / 384 + w_1 * w_2 ** 2 * w_3 * w_4 * w_8 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 * w_6 / 1152 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 * w_7 / 1152 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 * w_8 / 1152 + w_1 * w_2 ** 2 * w_3 * w_5 * w_6 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_5 * w_6 * w_7 / 384 + w_1 * w_2 ** 2 * w_3 * w_5 * w_6 * w_8 / 384 + w_1 * w_2 ** 2 * w_3 * w_5 * w_7 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_5 * w_7 * w_8 / 384 + w_1 * w_2 ** 2 * w_3 * w_5 * w_8 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_6 ** 2 * w_7 / 1152 + w_1 * w_2 ** 2 * w_3 * w_6 ** 2 * w_8 / 1152 + w_1 * w_2 ** 2 * w_3 * w_6 * w_7 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_6 * w_7 * w_8 / 384 + w_1 * w_2 ** 2 * w_3 * w_6 * w_8 ** 2 / 1152 + w_1 * w_2 ** 2 * w_3 * w_7 ** 2 * w_8 / 1152 + w_1 * w_2 ** 2 * w_3 * w_7 * w_8 ** 2 / 1152 - w_1 * w_2 ** 2 * w_4 ** 4 / 17280 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 3456 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 * w_6 / 1152 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 * w_7 / 1152 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 * w_8 / 1152 + w_1 * w_2 ** 2 * w_4 ** 2 * w_6 ** 2 / 3456 + w_1 * w_2 ** 2 * w_4 ** 2 * w_6 * w_7 / 1152 + w_1 * w_2 ** 2 * w_4 ** 2 * w_6 * w_8 / 1152 + w_1 * w_2 ** 2 * w_4 ** 2 * w_7 ** 2 / 3456 + w_1 * w_2 ** 2 * w_4 ** 2 * w_7 * w_8 / 1152 + w_1 * w_2 ** 2 * w_4 ** 2 * w_8 ** 2 / 3456 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 * w_6 / 1152 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 * w_7 / 1152 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 * w_8 / 1152 + w_1 * w_2 ** 2 * w_4 * w_5 * w_6 ** 2 / 1152 + w_1 * w_2 ** 2 * w_4 * w_5 * w_6 * w_7 / 384 + w_1 * w_2 ** 2 * w_4 * w_5 * w_6 * w_8 / 384 + w_1 * w_2 ** 2 * w_4 * w_5 * w_7 ** 2 / 1152 + w_1 * w_2 ** 2 * w_4 * w_5 * w_7 * w_8 / 384 + w_1 * w_2 ** 2 * w_4 * w_5 * w_8 ** 2 / 1152 + w_1 * w_2 ** 2 * w_4 * w_6 ** 2 * w_7 / 1152 + w_1 * w_2 ** 2 * w_4 * w_6 ** 2 * w_8 / 1152 + w_1 * w_2 ** 2 * w_4 * w_6 * w_7 ** 2 / 1152 + w_1 * w_2 ** 2 * w_4 * w_6 * w_7 * w_8 / 384 + w_1 * w_2 ** 2 * w_4 * w_6 * w_8 ** 2 / 1152 + w_1 * w_2 ** 2 * w_4 * w_7 ** 2 * w_8 / 1152 + w_1 * w_2 ** 2 * w_4 * w_7 * w_8 ** 2 / 1152 - w_1 * w_2 ** 2 * w_5 ** 4 / 17280 + w_1 * w_2 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_1 * w_2 ** 2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_1 * w_2 ** 2 * w_5 ** 2 * w_6 * w_8 / 1152 + w_1 * w_2 ** 2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_1 * w_2 ** 2 * w_5 ** 2 * w_7 * w_8 / 1152 + w_1 * w_2 ** 2 * w_5 ** 2 * w_8 ** 2 / 3456 + w_1 * w_2 ** 2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_1 * w_2 ** 2 * w_5 * w_6 ** 2 * w_8 / 1152 + w_1 * w_2 ** 2 * w_5 * w_6 * w_7 ** 2 / 1152 + w_1 * w_2 ** 2 * w_5 * w_6 * w_7 * w_8 / 384 + w_1 * w_2 ** 2 * w_5 * w_6 * w_8 ** 2 / 1152 + w_1 * w_2 ** 2 * w_5 * w_7 ** 2 * w_8 / 1152 + w_1 * w_2 ** 2 * w_5 * w_7 * w_8 ** 2 / 1152 - w_1 * w_2 ** 2 * w_6 ** 4 / 17280 + w_1 * w_2 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 + w_1 * w_2 ** 2 * w_6 ** 2 * w_7 * w_8 / 1152 + w_1 * w_2 ** 2 * w_6 ** 2 * w_8 ** 2 / 3456 + w_1 * w_2 ** 2 * w_6 * w_7 ** 2 * w_8 / 1152 + w_1 * w_2 ** 2 * w_6 * w_7 * w_8 ** 2 / 1152 - w_1 * w_2 ** 2 * w_7 ** 4 / 17280 + w_1 * w_2 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_1 * w_2 ** 2 * w_8 ** 4 / 17280 - w_1 * w_2 * w_3 ** 4 * w_4 / 5760 - w_1 * w_2 * w_3 ** 4 * w_5 / 5760 - w_1 * w_2 * w_3 ** 4 * w_6 / 5760 - w_1 * w_2 * w_3 ** 4 * w_7 / 5760 - w_1 * w_2 * w_3 ** 4 * w_8 / 5760 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_6 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_7 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_8 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 * w_6 / 384 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 * w_7 / 384 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 * w_8 / 384 + w_1 * w_2 * w_3 ** 2 * w_4 * w_6 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 * w_6 * w_7 / 384 + w_1 * w_2 * w_3 ** 2 * w_4 * w_6 * w_8 / 384 + w_1 * w_2 * w_3 ** 2 * w_4 * w_7 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_4 * w_7 * w_8 / 384 + w_1 * w_2 * w_3 ** 2 * w_4 * w_8 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 * w_6 / 1152 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 * w_7 / 1152 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 * w_8 / 1152 + w_1 * w_2 * w_3 ** 2 * w_5 * w_6 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_5 * w_6 * w_7 / 384 + w_1 * w_2 * w_3 ** 2 * w_5 * w_6 * w_8 / 384 + w_1 * w_2 * w_3 ** 2 * w_5 * w_7 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_5 * w_7 * w_8 / 384 + w_1 * w_2 * w_3 ** 2 * w_5 * w_8 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_6 ** 2 * w_7 / 1152 + w_1 * w_2 * w_3 ** 2 * w_6 ** 2 * w_8 / 1152 + w_1 * w_2 * w_3 ** 2 * w_6 * w_7 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_6 * w_7 * w_8 / 384 + w_1 * w_2 * w_3 ** 2 * w_6 * w_8 ** 2 / 1152 + w_1 * w_2 * w_3 ** 2 * w_7 ** 2 * w_8 / 1152 + w_1 * w_2 * w_3 ** 2 * w_7 * w_8 ** 2 / 1152 - w_1 * w_2 * w_3 * w_4 ** 4 / 5760 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 1152 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 * w_6 / 384 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 * w_7 / 384 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 * w_8 / 384 + w_1 * w_2 * w_3 * w_4 ** 2 * w_6 ** 2 / 1152 + w_1 * w_2 * w_3 * w_4 ** 2 * w_6 * w_7 / 384 + w_1 * w_2 * w_3 * w_4 ** 2 * w_6 * w_8 / 384 + w_1 * w_2 * w_3 * w_4 ** 2 * w_7 ** 2 / 1152 + w_1 * w_2 * w_3 * w_4 ** 2 * w_7 * w_8 / 384 + w_1 * w_2 * w_3 * w_4 ** 2 * w_8 ** 2 / 1152 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 * w_6 / 384 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 * w_7 / 384 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 * w_8 / 384 + w_1 * w_2 * w_3 * w_4 * w_5 * w_6 ** 2 / 384 + w_1 * w_2 * w_3 * w_4 * w_5 * w_6 * w_7 / 128 + w_1 * w_2 * w_3 * w_4 * w_5 * w_6 * w_8 / 128 + w_1 * w_2 * w_3 * w_4 * w_5 * w_7 ** 2 / 384 + w_1 * w_2 * w_3 * w_4 * w_5 * w_7 * w_8 / 128 + w_1 * w_2 * w_3 * w_4 * w_5 * w_8 ** 2 / 384 + w_1 * w_2 * w_3 * w_4 * w_6 ** 2 * w_7 / 384 + w_1 * w_2 * w_3 * w_4 * w_6 ** 2 * w_8 / 384 + w_1 * w_2 * w_3 * w_4 * w_6 * w_7 ** 2 / 384 + w_1 * w_2 * w_3 * w_4 * w_6 * w_7 * w_8 / 128 + w_1 * w_2 * w_3 * w_4 * w_6 * w_8 ** 2 / 384 + w_1 * w_2 * w_3 * w_4 * w_7 ** 2 * w_8 / 384 + w_1 * w_2 * w_3 * w_4 * w_7 * w_8 ** 2 / 384 - w_1 * w_2 * w_3 * w_5 ** 4 / 5760 + w_1 * w_2 * w_3 * w_5 ** 2 * w_6 ** 2 / 1152 + w_1 * w_2 * w_3 * w_5 ** 2 * w_6 * w_7 / 384 + w_1 * w_2 * w_3 * w_5 ** 2 * w_6 * w_8 / 384 + w_1 * w_2 * w_3 * w_5 ** 2 * w_7 ** 2 / 1152 + w_1 * w_2 * w_3 * w_5 ** 2 * w_7 * w_8 / 384 + w_1 * w_2 * w_3 * w_5 ** 2 * w_8 ** 2 / 1152 + w_1 * w_2 * w_3 * w_5 * w_6 ** 2 * w_7 / 384 + w_1 * w_2 * w_3 * w_5 * w_6 ** 2 * w_8 / 384 + w_1 * w_2 * w_3 * w_5 * w_6 * w_7 ** 2 / 384 + w_1 * w_2 * w_3 * w_5 * w_6 * w_7 * w_8 / 128 + w_1 * w_2 * w_3 * w_5 * w_6 * w_8 ** 2 / 384 + w_1 * w_2 * w_3 * w_5 * w_7 ** 2 * w_8 / 384 + w_1 * w_2 * w_3 * w_5 * w_7 * w_8 ** 2 / 384 - w_1 * w_2 * w_3 * w_6 ** 4 / 5760 + w_1 * w_2 * w_3 * w_6 ** 2 * w_7 ** 2 / 1152 + w_1 * w_2 * w_3 * w_6 ** 2 * w_7 * w_8 / 384 + w_1 * w_2 * w_3 * w_6 ** 2 * w_8 ** 2 / 1152 + w_1 * w_2 * w_3 * w_6 * w_7 ** 2 * w_8 / 384 + w_1 * w_2 * w_3 * w_6 * w_7 * w_8 ** 2 / 384 - w_1 * w_2 * w_3 * w_7 ** 4 / 5760 + w_1 * w_2 * w_3 * w_7 ** 2 * w_8 ** 2 / 1152 - w_1 * w_2 * w_3 * w_8 ** 4 / 5760 - w_1 * w_2 * w_4 ** 4 * w_5 / 5760 - w_1 * w_2 * w_4 ** 4 * w_6 / 5760 - w_1 * w_2 * w_4 ** 4 * w_7 / 5760 - w_1 * w_2 * w_4 ** 4 * w_8 / 5760 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 * w_6 / 1152 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 * w_7 / 1152 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 * w_8 / 1152 + w_1 * w_2 * w_4 ** 2 * w_5 * w_6 ** 2 / 1152 + w_1 * w_2 * w_4 ** 2 * w_5 * w_6 * w_7 / 384 + w_1 * w_2 * w_4 ** 2 * w_5 * w_6 * w_8 / 384 + w_1 * w_2 * w_4 ** 2 * w_5 * w_7 ** 2 / 1152 + w_1 * w_2 * w_4 ** 2 * w_5 * w_7 * w_8 / 384 + w_1 * w_2 * w_4 ** 2 * w_5 * w_8 ** 2 / 1152 + w_1 * w_2 * w_4 ** 2 * w_6 ** 2 * w_7 / 1152 + w_1 * w_2 * w_4 ** 2 * w_6 ** 2 * w_8 / 1152 + w_1 * w_2 * w_4 ** 2 * w_6 * w_7 ** 2 / 1152 + w_1 * w_2 * w_4 ** 2 * w_6 * w_7 * w_8 / 384 + w_1 * w_2 * w_4 ** 2 * w_6 * w_8 ** 2 / 1152 + w_1 * w_2 * w_4 ** 2 * w_7 ** 2 * w_8 / 1152 + w_1 * w_2 * w_4 ** 2 * w_7 * w_8 ** 2 / 1152 - w_1 * w_2 * w_4 * w_5 ** 4 / 5760 + w_1 * w_2 * w_4 * w_5 ** 2 * w_6 ** 2 / 1152 + w_1 * w_2 * w_4 * w_5 ** 2 * w_6 * w_7 / 384 + w_1 * w_2 * w_4 * w_5 ** 2 * w_6 * w_8 / 384 + w_1 * w_2 * w_4 * w_5 ** 2 * w_7 ** 2 / 1152 + w_1 * w_2 * w_4 * w_5 ** 2 * w_7 * w_8 / 384 + w_1 * w_2 * w_4 * w_5 ** 2 * w_8 ** 2 / 1152 + w_1 * w_2 * w_4 * w_5 * w_6 ** 2 * w_7 / 384 + w_1 * w_2 * w_4 * w_5 * w_6 ** 2 * w_8 / 384 + w_1 * w_2 * w_4 * w_5 * w_6 * w_7 ** 2 / 384 + w_1 * w_2 * w_4 * w_5 * w_6 * w_7 * w_8 / 128 + w_1 * w_2 * w_4 * w_5 * w_6 * w_8 ** 2 / 384 + w_1 * w_2 * w_4 * w_5 * w_7 ** 2 * w_8 / 384 + w_1 * w_2 * w_4 * w_5 * w_7 * w_8 ** 2 / 384 - w_1 * w_2 * w_4 * w_6 ** 4 / 5760 + w_1 * w_2 * w_4 * w_6 ** 2 * w_7 ** 2 / 1152 + w_1 * w_2 * w_4 * w_6 ** 2 * w_7 * w_8 / 384 + w_1 * w_2 * w_4 * w_6 ** 2 * w_8 ** 2 / 1152 + w_1 * w_2 * w_4 * w_6 * w_7 ** 2 * w_8 / 384 + w_1 * w_2 * w_4 * w_6 * w_7 * w_8 ** 2 / 384 - w_1 * w_2 * w_4 * w_7 ** 4 / 5760 + w_1 * w_2 * w_4 * w_7 ** 2 * w_8 ** 2 / 1152 - w_1 * w_2 * w_4 * w_8 ** 4 / 5760 - w_1 * w_2 * w_5 ** 4 * w_6 / 5760 - w_1 * w_2 * w_5 ** 4 * w_7 / 5760 - w_1 * w_2 * w_5 ** 4 * w_8 / 5760 + w_1 * w_2 * w_5 ** 2 * w_6 ** 2 * w_7 / 1152 + w_1 * w_2 * w_5 ** 2 * w_6 ** 2 * w_8 / 1152 + w_1 * w_2 * w_5 ** 2 * w_6 * w_7 ** 2 / 1152 + w_1 * w_2 * w_5 ** 2 * w_6 * w_7 * w_8 / 384 + w_1 * w_2 * w_5 ** 2 * w_6 * w_8 ** 2 / 1152 + w_1 * w_2 * w_5 ** 2 * w_7 ** 2 * w_8 / 1152 + w_1 * w_2 * w_5 ** 2 * w_7 * w_8 ** 2 / 1152 - w_1 * w_2 * w_5 * w_6 ** 4 / 5760 + w_1 * w_2 * w_5 * w_6 ** 2 * w_7 ** 2 / 1152 + w_1 * w_2 * w_5 * w_6 ** 2 * w_7 * w_8 / 384 + w_1 * w_2 * w_5 * w_6 ** 2 * w_8 ** 2 / 1152 + w_1 * w_2 * w_5 * w_6 * w_7 ** 2 * w_8 / 384 + w_1 * w_2 * w_5 * w_6 * w_7 * w_8 ** 2 / 384 - w_1 * w_2 * w_5 * w_7 ** 4 / 5760 + w_1 * w_2 * w_5 * w_7 ** 2 * w_8 ** 2 / 1152 - w_1 * w_2 * w_5 * w_8 ** 4 / 5760 - w_1 * w_2 * w_6 ** 4 * w_7 / 5760 - w_1 * w_2 * w_6 ** 4 * w_8 / 5760 + w_1 * w_2 * w_6 ** 2 * w_7 ** 2 * w_8 / 1152 + w_1 * w_2 * w_6 ** 2 * w_7 * w_8 ** 2 / 1152 - w_1 * w_2 * w_6 * w_7 ** 4 / 5760 + w_1 * w_2 * w_6 * w_7 ** 2 * w_8 ** 2 / 1152 - w_1 * w_2 * w_6 * w_8 ** 4 / 5760 - w_1 * w_2 * w_7 ** 4 * w_8 / 5760 - w_1 * w_2 * w_7 * w_8 ** 4 / 5760 + w_1 * w_3 ** 6 / 60480 - w_1 * w_3 ** 4 * w_4 ** 2 / 17280 - w_1 * w_3 ** 4 * w_4 * w_5 / 5760 - w_1 * w_3 ** 4 * w_4 * w_6 / 5760 - w_1 * w_3 ** 4 * w_4 * w_7 / 5760 - w_1 * w_3 ** 4 * w_4 * w_8 / 5760 - w_1 * w_3 ** 4 * w_5 ** 2 / 17280 - w_1 * w_3 ** 4 * w_5 * w_6 / 5760 - w_1 * w_3 ** 4 * w_5 * w_7 / 5760 - w_1 * w_3 ** 4 * w_5 * w_8 / 5760 - w_1 * w_3 ** 4 * w_6 ** 2 / 17280 - w_1 * w_3 ** 4 * w_6 * w_7 / 5760 - w_1 * w_3 ** 4 * w_6 * w_8 / 5760 - w_1 * w_3 ** 4 * w_7 ** 2 / 17280 - w_1 * w_3 ** 4 * w_7 * w_8 / 5760 - w_1 * w_3 ** 4 * w_8 ** 2 / 17280 - w_1 * w_3 ** 2 * w_4 ** 4 / 17280 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 3456 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 1152 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 * w_7 / 1152 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 * w_8 / 1152 + w_1 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 3456 + w_1 * w_3 ** 2 * w_4 ** 2 * w_6 * w_7 / 1152 + w_1 * w_3 ** 2 * w_4 ** 2 * w_6 * w_8 / 1152 + w_1 * w_3 ** 2 * w_4 ** 2 * w_7 ** 2 / 3456 + w_1 * w_3 ** 2 * w_4 ** 2 * w_7 * w_8 / 1152 + w_1 * w_3 ** 2 * w_4 ** 2 * w_8 ** 2 / 3456 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 1152 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 * w_7 / 1152 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 * w_8 / 1152 + w_1 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 1152 + w_1 * w_3 ** 2 * w_4 * w_5 * w_6 * w_7 / 384 + w_1 * w_3 ** 2 * w_4 * w_5 * w_6 * w_8 / 384 + w_1 * w_3 ** 2 * w_4 * w_5 * w_7 ** 2 / 1152 + w_1 * w_3 ** 2 * w_4 * w_5 * w_7 * w_8 / 384 + w_1 * w_3 ** 2 * w_4 * w_5 * w_8 ** 2 / 1152 + w_1 * w_3 ** 2 * w_4 * w_6 ** 2 * w_7 / 1152 + w_1 * w_3 ** 2 * w_4 * w_6 ** 2 * w_8 / 1152 + w_1 * w_3 ** 2 * w_4 * w_6 * w_7 ** 2 / 1152 + w_1 * w_3 ** 2 * w_4 * w_6 * w_7 * w_8 / 384 + w_1 * w_3 ** 2 * w_4 * w_6 * w_8 ** 2 / 1152 + w_1 * w_3 ** 2 * w_4 * w_7 ** 2 * w_8 / 1152 + w_1 * w_3 ** 2 * w_4 * w_7 * w_8 ** 2 / 1152 - w_1 * w_3 ** 2 * w_5 ** 4 / 17280 + w_1 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_1 * w_3 ** 2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_1 * w_3 ** 2 * w_5 ** 2 * w_6 * w_8 / 1152 + w_1 * w_3 ** 2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_1 * w_3 ** 2 * w_5 ** 2 * w_7 * w_8 / 1152 + w_1 * w_3 ** 2 * w_5 ** 2 * w_8 ** 2 / 3456 + w_1 * w_3 ** 2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_1 * w_3 ** 2 * w_5 * w_6 ** 2 * w_8 / 1152 + w_1 * w_3 ** 2 * w_5 * w_6 * w_7 ** 2 / 1152 + w_1 * w_3 ** 2 * w_5 * w_6 * w_7 * w_8 / 384 + w_1 * w_3 ** 2 * w_5 * w_6 * w_8 ** 2 / 1152 + w_1 * w_3 ** 2 * w_5 * w_7 ** 2 * w_8 / 1152 + w_1 * w_3 ** 2 * w_5 * w_7 * w_8 ** 2 / 1152 - w_1 * w_3 ** 2 * w_6 ** 4 / 17280 + w_1 * w_3 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 + w_1 * w_3 ** 2 * w_6 ** 2 * w_7 * w_8 / 1152 + w_1 * w_3 ** 2 * w_6 ** 2 * w_8 ** 2 / 3456 + w_1 * w_3 ** 2 * w_6 * w_7 ** 2 * w_8 / 1152 + w_1 * w_3 ** 2 * w_6 * w_7 * w_8 ** 2 / 1152 - w_1 * w_3 ** 2 * w_7 ** 4 / 17280 + w_1 * w_3 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_1 * w_3 ** 2 * w_8 ** 4 / 17280 - w_1 * w_3 * w_4 ** 4 * w_5 / 5760 - w_1 * w_3 * w_4 ** 4 * w_6 / 5760 - w_1 * w_3 * w_4 ** 4 * w_7 / 5760 - w_1 * w_3 * w_4 ** 4 * w_8 / 5760 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 1152 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 * w_7 / 1152 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 * w_8 / 1152 + w_1 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 1152 + w_1 * w_3 * w_4 ** 2 * w_5 * w_6 * w_7 / 384 + w_1 * w_3 * w_4 ** 2 * w_5 * w_6 * w_8 / 384 + w_1 * w_3 * w_4 ** 2 * w_5 * w_7 ** 2 / 1152 + w_1 * w_3 * w_4 ** 2 * w_5 * w_7 * w_8 / 384 + w_1 * w_3 * w_4 ** 2 * w_5 * w_8 ** 2 / 1152 + w_1 * w_3 * w_4 ** 2 * w_6 ** 2 * w_7 / 1152 + w_1 * w_3 * w_4 ** 2 * w_6 ** 2 * w_8 / 1152 + w_1 * w_3 * w_4 ** 2 * w_6 * w_7 ** 2 / 1152 + w_1 * w_3 * w_4 ** 2 * w_6 * w_7 * w_8 / 384 + w_1 * w_3 * w_4 ** 2 * w_6 * w_8 ** 2 / 1152 + w_1 * w_3 * w_4 ** 2 * w_7 ** 2 * w_8 / 1152 + w_1 * w_3 * w_4 ** 2 * w_7 * w_8 ** 2 / 1152 - w_1 * w_3 * w_4 * w_5 ** 4 / 5760 + w_1 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 1152 + w_1 * w_3 * w_4 * w_5 ** 2 * w_6 * w_7 / 384 + w_1 * w_3 * w_4 * w_5 ** 2 * w_6 * w_8 / 384 + w_1 * w_3 * w_4 * w_5 ** 2 * w_7 ** 2 / 1152 + w_1 * w_3 * w_4 * w_5 ** 2 * w_7 * w_8 / 384 + w_1 * w_3 * w_4 * w_5 ** 2 * w_8 ** 2 / 1152 + w_1 * w_3 * w_4 * w_5 * w_6 ** 2 * w_7 / 384 + w_1 * w_3 * w_4 * w_5 * w_6 ** 2 * w_8 / 384 + w_1 * w_3 * w_4 * w_5 * w_6 * w_7 ** 2 / 384 + w_1 * w_3 * w_4 * w_5 * w_6 * w_7 * w_8 / 128 + w_1 * w_3 * w_4 * w_5 * w_6 * w_8 ** 2 / 384 + w_1 * w_3 * w_4 * w_5 * w_7 ** 2 * w_8 / 384 + w_1 * w_3 * w_4 * w_5 * w_7 * w_8 ** 2 / 384 - w_1 * w_3 * w_4 * w_6 ** 4 / 5760 + w_1 * w_3 * w_4 * w_6 ** 2 * w_7 ** 2 / 1152 + w_1 * w_3 * w_4 * w_6 ** 2 * w_7 * w_8 / 384 + w_1 * w_3 * w_4 * w_6 ** 2 * w_8 ** 2 / 1152 + w_1 * w_3 * w_4 * w_6 * w_7 ** 2 * w_8 / 384 + w_1 * w_3 * w_4 * w_6 * w_7 * w_8 ** 2 / 384 - w_1 * w_3 * w_4 * w_7 ** 4 / 5760 + w_1 * w_3 * w_4 * w_7 ** 2 * w_8 ** 2 / 1152 - w_1 * w_3 * w_4 * w_8 ** 4 / 5760 - w_1 * w_3 * w_5 ** 4 * w_6 / 5760 - w_1 * w_3 * w_5 ** 4 * w_7 / 5760 - w_1 * w_3 * w_5 ** 4 * w_8 / 5760 + w_1 * w_3 * w_5 ** 2 * w_6 ** 2 * w_7 / 1152 + w_1 * w_3 * w_5 ** 2 * w_6 ** 2 * w_8 / 1152 + w_1 * w_3 * w_5 ** 2 * w_6 * w_7 ** 2 / 1152 + w_1 * w_3 * w_5 ** 2 * w_6 * w_7 * w_8 / 384 + w_1 * w_3 * w_5 ** 2 * w_6 * w_8 ** 2 / 1152 + w_1 * w_3 * w_5 ** 2 * w_7 ** 2 * w_8 / 1152 + w_1 * w_3 * w_5 ** 2 * w_7 * w_8 ** 2 / 1152 - w_1 * w_3 * w_5 * w_6 ** 4 / 5760 + w_1 * w_3 * w_5 * w_6 ** 2 * w_7 ** 2 / 1152 + w_1 * w_3 * w_5 * w_6 ** 2 * w_7 * w_8 / 384 + w_1 * w_3 * w_5 * w_6 ** 2 * w_8 ** 2 / 1152 + w_1 * w_3 * w_5 * w_6 * w_7 ** 2 * w_8 / 384 + w_1 * w_3 * w_5 * w_6 * w_7 * w_8 ** 2 / 384 - w_1 * w_3 * w_5 * w_7 ** 4 / 5760 + w_1 * w_3 * w_5 * w_7 ** 2 * w_8 ** 2 / 1152 - w_1 * w_3 * w_5 * w_8 ** 4 / 5760 - w_1 * w_3 * w_6 ** 4 * w_7 / 5760 - w_1 * w_3 * w_6 ** 4 * w_8 / 5760 + w_1 * w_3 * w_6 ** 2 * w_7 ** 2 * w_8 / 1152 + w_1 * w_3 * w_6 ** 2 * w_7 * w_8 ** 2 / 1152 - w_1 * w_3 * w_6 * w_7 ** 4 / 5760 + w_1 * w_3 * w_6 * w_7 ** 2 * w_8 ** 2 / 1152 - w_1 * w_3 * w_6 * w_8 ** 4 / 5760 - w_1 * w_3 * w_7 ** 4 * w_8 / 5760 - w_1 * w_3 * w_7 * w_8 ** 4 / 5760 + w_1 * w_4 ** 6 / 60480 - w_1 * w_4 ** 4 * w_5 ** 2 / 17280 - w_1 * w_4 ** 4 * w_5 * w_6 / 5760 - w_1 * w_4 ** 4 * w_5 * w_7 / 5760 - w_1 * w_4 ** 4 * w_5 * w_8 / 5760 - w_1 * w_4 ** 4 * w_6 ** 2 / 17280 - w_1 * w_4 ** 4 * w_6 * w_7 / 5760 - w_1 * w_4 ** 4 * w_6 * w_8 / 5760 - w_1 * w_4 ** 4 * w_7 ** 2 / 17280 - w_1 * w_4 ** 4 * w_7 * w_8 / 5760 - w_1 * w_4 ** 4 * w_8 ** 2 / 17280 - w_1 * w_4 ** 2 * w_5 ** 4 / 17280 + w_1 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_1 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_1 * w_4 ** 2 * w_5 ** 2 * w_6 * w_8 / 1152 + w_1 * w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_1 * w_4 ** 2 * w_5 ** 2 * w_7 * w_8 / 1152 + w_1 * w_4 ** 2 * w_5 ** 2 * w_8 ** 2 / 3456 + w_1 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_1 * w_4 ** 2 * w_5 * w_6 ** 2 * w_8 / 1152 + w_1 * w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 1152 + w_1 * w_4 ** 2 * w_5 * w_6 * w_7 * w_8 / 384 + w_1 * w_4 ** 2 * w_5 * w_6 * w_8 ** 2 / 1152 + w_1 * w_4 ** 2 * w_5 * w_7 ** 2 * w_8 / 1152 + w_1 * w_4 ** 2 * w_5 * w_7 * w_8 ** 2 / 1152 - w_1 * w_4 ** 2 * w_6 ** 4 / 17280 + w_1 * w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 + w_1 * w_4 ** 2 * w_6 ** 2 * w_7 * w_8 / 1152 + w_1 * w_4 ** 2 * w_6 ** 2 * w_8 ** 2 / 3456 + w_1 * w_4 ** 2 * w_6 * w_7 ** 2 * w_8 / 1152 + w_1 * w_4 ** 2 * w_6 * w_7 * w_8 ** 2 / 1152 - w_1 * w_4 ** 2 * w_7 ** 4 / 17280 + w_1 * w_4 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_1 * w_4 ** 2 * w_8 ** 4 / 17280 - w_1 * w_4 * w_5 ** 4 * w_6 / 5760 - w_1 * w_4 * w_5 ** 4 * w_7 / 5760 - w_1 * w_4 * w_5 ** 4 * w_8 / 5760 + w_1 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 1152 + w_1 * w_4 * w_5 ** 2 * w_6 ** 2 * w_8 / 1152 + w_1 * w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 1152 + w_1 * w_4 * w_5 ** 2 * w_6 * w_7 * w_8 / 384 + w_1 * w_4 * w_5 ** 2 * w_6 * w_8 ** 2 / 1152 + w_1 * w_4 * w_5 ** 2 * w_7 ** 2 * w_8 / 1152 + w_1 * w_4 * w_5 ** 2 * w_7 * w_8 ** 2 / 1152 - w_1 * w_4 * w_5 * w_6 ** 4 / 5760 + w_1 * w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 1152 + w_1 * w_4 * w_5 * w_6 ** 2 * w_7 * w_8 / 384 + w_1 * w_4 * w_5 * w_6 ** 2 * w_8 ** 2 / 1152 + w_1 * w_4 * w_5 * w_6 * w_7 ** 2 * w_8 / 384 + w_1 * w_4 * w_5 * w_6 * w_7 * w_8 ** 2 / 384 - w_1 * w_4 * w_5 * w_7 ** 4 / 5760 + w_1 * w_4 * w_5 * w_7 ** 2 * w_8 ** 2 / 1152 - w_1 * w_4 * w_5 * w_8 ** 4 / 5760 - w_1 * w_4 * w_6 ** 4 * w_7 / 5760 - w_1 * w_4 * w_6 ** 4 * w_8 / 5760 + w_1 * w_4 * w_6 ** 2 * w_7 ** 2 * w_8 / 1152 + w_1 * w_4 * w_6 ** 2 * w_7 * w_8 ** 2 / 1152 - w_1 * w_4 * w_6 * w_7 ** 4 / 5760 + w_1 * w_4 * w_6 * w_7 ** 2 * w_8 ** 2 / 1152 - w_1 * w_4 * w_6 * w_8 ** 4 / 5760 - w_1 * w_4 * w_7 ** 4 * w_8 / 5760 - w_1 * w_4 * w_7 * w_8 ** 4 / 5760 + w_1 * w_5 ** 6 / 60480 - w_1 * w_5 ** 4 * w_6 ** 2 / 17280 - w_1 * w_5 ** 4 * w_6 * w_7 / 5760 - w_1 * w_5 ** 4 * w_6 * w_8 / 5760 - w_1 * w_5 ** 4 * w_7 ** 2 / 17280 - w_1 * w_5 ** 4 * w_7 * w_8 / 5760 - w_1 * w_5 ** 4 * w_8 ** 2 / 17280 - w_1 * w_5 ** 2 * w_6 ** 4 / 17280 + w_1 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 + w_1 * w_5 ** 2 * w_6 ** 2 * w_7 * w_8 / 1152 + w_1 * w_5 ** 2 * w_6 ** 2 * w_8 ** 2 / 3456 + w_1 * w_5 ** 2 * w_6 * w_7 ** 2 * w_8 / 1152 + w_1 * w_5 ** 2 * w_6 * w_7 * w_8 ** 2 / 1152 - w_1 * w_5 ** 2 * w_7 ** 4 / 17280 + w_1 * w_5 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_1 * w_5 ** 2 * w_8 ** 4 / 17280 - w_1 * w_5 * w_6 ** 4 * w_7 / 5760 - w_1 * w_5 * w_6 ** 4 * w_8 / 5760 + w_1 * w_5 * w_6 ** 2 * w_7 ** 2 * w_8 / 1152 + w_1 * w_5 * w_6 ** 2 * w_7 * w_8 ** 2 / 1152 - w_1 * w_5 * w_6 * w_7 ** 4 / 5760 + w_1 * w_5 * w_6 * w_7 ** 2 * w_8 ** 2 / 1152 - w_1 * w_5 * w_6 * w_8 ** 4 / 5760 - w_1 * w_5 * w_7 ** 4 * w_8 / 5760 - w_1 * w_5 * w_7 * w_8 ** 4 / 5760 + w_1 * w_6 ** 6 / 60480 - w_1 * w_6 ** 4 * w_7 ** 2 / 17280 - w_1 * w_6 ** 4 * w_7 * w_8 / 5760 - w_1 * w_6 ** 4 * w_8 ** 2 / 17280 - w_1 * w_6 ** 2 * w_7 ** 4 / 17280 + w_1 * w_6 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_1 * w_6 ** 2 * w_8 ** 4 / 17280 - w_1 * w_6 * w_7 ** 4 * w_8 / 5760 - w_1 * w_6 * w_7 * w_8 ** 4 / 5760 + w_1 * w_7 ** 6 / 60480 - w_1 * w_7 ** 4 * w_8 ** 2 / 17280 - w_1 * w_7 ** 2 * w_8 ** 4 / 17280 + w_1 * w_8 ** 6 / 60480 + w_2 ** 6 * w_3 / 60480 + w_2 ** 6 * w_4 / 60480 + w_2 ** 6 * w_5 / 60480 + w_2 ** 6 * w_6 / 60480 + w_2 ** 6 * w_7 / 60480 + w_2 ** 6 * w_8 / 60480 - w_2 ** 4 * w_3 ** 2 * w_4 / 17280 - w_2 ** 4 * w_3 ** 2 * w_5 / 17280 - w_2 ** 4 * w_3 ** 2 * w_6 / 17280 - w_2 ** 4 * w_3 ** 2 * w_7 / 17280 - w_2 ** 4 * w_3 ** 2 * w_8 / 17280 - w_2 ** 4 * w_3 * w_4 ** 2 / 17280 - w_2 ** 4 * w_3 * w_4 * w_5 / 5760 - w_2 ** 4 * w_3 * w_4 * w_6 / 5760 - w_2 ** 4 * w_3 * w_4 * w_7 / 5760 - w_2 ** 4 * w_3 * w_4 * w_8 / 5760 - w_2 ** 4 * w_3 * w_5 ** 2 / 17280 - w_2 ** 4 * w_3 * w_5 * w_6 / 5760 - w_2 ** 4 * w_3 * w_5 * w_7 / 5760 - w_2 ** 4 * w_3 * w_5 * w_8 / 5760 - w_2 ** 4 * w_3 * w_6 ** 2 / 17280 - w_2 ** 4 * w_3 * w_6 * w_7 / 5760 - w_2 ** 4 * w_3 * w_6 * w_8 / 5760 - w_2 ** 4 * w_3 * w_7 ** 2 / 17280 - w_2 ** 4 * w_3 * w_7 * w_8 / 5760 - w_2 ** 4 * w_3 * w_8 ** 2 / 17280 - w_2 ** 4 * w_4 ** 2 * w_5 / 17280 - w_2 ** 4 * w_4 ** 2 * w_6 / 17280 - w_2 ** 4 * w_4 ** 2 * w_7 / 17280 - w_2 ** 4 * w_4 ** 2 * w_8 / 17280 - w_2 ** 4 * w_4 * w_5 ** 2 / 17280 - w_2 ** 4 * w_4 * w_5 * w_6 / 5760 - w_2 ** 4 * w_4 * w_5 * w_7 / 5760 - w_2 ** 4 * w_4 * w_5 * w_8 / 5760 - w_2 ** 4 * w_4 * w_6 ** 2 / 17280 - w_2 ** 4 * w_4 * w_6 * w_7 / 5760 - w_2 ** 4 * w_4 * w_6 * w_8 / 5760 - w_2 ** 4 * w_4 * w_7 ** 2 / 17280 - w_2 ** 4 * w_4 * w_7 * w_8 / 5760 - w_2 ** 4 * w_4 * w_8 ** 2 / 17280 - w_2 ** 4 * w_5 ** 2 * w_6 / 17280 - w_2 ** 4 * w_5 ** 2 * w_7 / 17280 - w_2 ** 4 * w_5 ** 2 * w_8 / 17280 - w_2 ** 4 * w_5 * w_6 ** 2 / 17280 - w_2 ** 4 * w_5 * w_6 * w_7 / 5760 - w_2 ** 4 * w_5 * w_6 * w_8 / 5760 - w_2 ** 4 * w_5 * w_7 ** 2 / 17280 - w_2 ** 4 * w_5 * w_7 * w_8 / 5760 - w_2 ** 4 * w_5 * w_8 ** 2 / 17280 - w_2 ** 4 * w_6 ** 2 * w_7 / 17280 - w_2 ** 4 * w_6 ** 2 * w_8 / 17280 - w_2 ** 4 * w_6 * w_7 ** 2 / 17280 - w_2 ** 4 * w_6 * w_7 * w_8 / 5760 - w_2 ** 4 * w_6 * w_8 ** 2 / 17280 - w_2 ** 4 * w_7 ** 2 * w_8 / 17280 - w_2 ** 4 * w_7 * w_8 ** 2 / 17280 - w_2 ** 2 * w_3 ** 4 * w_4 / 17280 - w_2 ** 2 * w_3 ** 4 * w_5 / 17280 - w_2 ** 2 * w_3 ** 4 * w_6 / 17280 - w_2 ** 2 * w_3 ** 4 * w_7 / 17280 - w_2 ** 2 * w_3 ** 4 * w_8 / 17280 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_7 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_8 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 / 1152 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_7 / 1152 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_8 / 1152 + w_2 ** 2 * w_3 ** 2 * w_4 * w_6 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 * w_6 * w_7 / 1152 + w_2 ** 2 * w_3 ** 2 * w_4 * w_6 * w_8 / 1152 + w_2 ** 2 * w_3 ** 2 * w_4 * w_7 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_4 * w_7 * w_8 / 1152 + w_2 ** 2 * w_3 ** 2 * w_4 * w_8 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 / 3456 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_7 / 3456 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_8 / 3456 + w_2 ** 2 * w_3 ** 2 * w_5 * w_6 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_5 * w_6 * w_7 / 1152 + w_2 ** 2 * w_3 ** 2 * w_5 * w_6 * w_8 / 1152 + w_2 ** 2 * w_3 ** 2 * w_5 * w_7 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_5 * w_7 * w_8 / 1152 + w_2 ** 2 * w_3 ** 2 * w_5 * w_8 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_6 ** 2 * w_7 / 3456 + w_2 ** 2 * w_3 ** 2 * w_6 ** 2 * w_8 / 3456 + w_2 ** 2 * w_3 ** 2 * w_6 * w_7 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_6 * w_7 * w_8 / 1152 + w_2 ** 2 * w_3 ** 2 * w_6 * w_8 ** 2 / 3456 + w_2 ** 2 * w_3 ** 2 * w_7 ** 2 * w_8 / 3456 + w_2 ** 2 * w_3 ** 2 * w_7 * w_8 ** 2 / 3456 - w_2 ** 2 * w_3 * w_4 ** 4 / 17280 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 3456 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 / 1152 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_7 / 1152 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_8 / 1152 + w_2 ** 2 * w_3 * w_4 ** 2 * w_6 ** 2 / 3456 + w_2 ** 2 * w_3 * w_4 ** 2 * w_6 * w_7 / 1152 + w_2 ** 2 * w_3 * w_4 ** 2 * w_6 * w_8 / 1152 + w_2 ** 2 * w_3 * w_4 ** 2 * w_7 ** 2 / 3456 + w_2 ** 2 * w_3 * w_4 ** 2 * w_7 * w_8 / 1152 + w_2 ** 2 * w_3 * w_4 ** 2 * w_8 ** 2 / 3456 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 / 1152 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_7 / 1152 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_8 / 1152 + w_2 ** 2 * w_3 * w_4 * w_5 * w_6 ** 2 / 1152 + w_2 ** 2 * w_3 * w_4 * w_5 * w_6 * w_7 / 384 + w_2 ** 2 * w_3 * w_4 * w_5 * w_6 * w_8 / 384 + w_2 ** 2 * w_3 * w_4 * w_5 * w_7 ** 2 / 1152 + w_2 ** 2 * w_3 * w_4 * w_5 * w_7 * w_8 / 384 + w_2 ** 2 * w_3 * w_4 * w_5 * w_8 ** 2 / 1152 + w_2 ** 2 * w_3 * w_4 * w_6 ** 2 * w_7 / 1152 + w_2 ** 2 * w_3 * w_4 * w_6 ** 2 * w_8 / 1152 + w_2 ** 2 * w_3 * w_4 * w_6 * w_7 ** 2 / 1152 + w_2 ** 2 * w_3 * w_4 * w_6 * w_7 * w_8 / 384 + w_2 ** 2 * w_3 * w_4 * w_6 * w_8 ** 2 / 1152 + w_2 ** 2 * w_3 * w_4 * w_7 ** 2 * w_8 / 1152 + w_2 ** 2 * w_3 * w_4 * w_7 * w_8 ** 2 / 1152 - w_2 ** 2 * w_3 * w_5 ** 4 / 17280 + w_2 ** 2 * w_3 * w_5 ** 2 * w_6 ** 2 / 3456 + w_2 ** 2 * w_3 * w_5 ** 2 * w_6 * w_7 / 1152 + w_2 ** 2 * w_3 * w_5 ** 2 * w_6 * w_8 / 1152 + w_2 ** 2 * w_3 * w_5 ** 2 * w_7 ** 2 / 3456 + w_2 ** 2 * w_3 * w_5 ** 2 * w_7 * w_8 / 1152 + w_2 ** 2 * w_3 * w_5 ** 2 * w_8 ** 2 / 3456 + w_2 ** 2 * w_3 * w_5 * w_6 ** 2 * w_7 / 1152 + w_2 ** 2 * w_3 * w_5 * w_6 ** 2 * w_8 / 1152 + w_2 ** 2 * w_3 * w_5 * w_6 * w_7 ** 2 / 1152 + w_2 ** 2 * w_3 * w_5 * w_6 * w_7 * w_8 / 384 + w_2 ** 2 * w_3 * w_5 * w_6 * w_8 ** 2 / 1152 + w_2 ** 2 * w_3 * w_5 * w_7 ** 2 * w_8 / 1152 + w_2 ** 2 * w_3 * w_5 * w_7 * w_8 ** 2 / 1152 - w_2 ** 2 * w_3 * w_6 ** 4 / 17280 + w_2 ** 2 * w_3 * w_6 ** 2 * w_7 ** 2 / 3456 + w_2 ** 2 * w_3 * w_6 ** 2 * w_7 * w_8 / 1152 + w_2 ** 2 * w_3 * w_6 ** 2 * w_8 ** 2 / 3456 + w_2 ** 2 * w_3 * w_6 * w_7 ** 2 * w_8 / 1152 + w_2 ** 2 * w_3 * w_6 * w_7 * w_8 ** 2 / 1152 - w_2 ** 2 * w_3 * w_7 ** 4 / 17280 + w_2 ** 2 * w_3 * w_7 ** 2 * w_8 ** 2 / 3456 - w_2 ** 2 * w_3 * w_8 ** 4 / 17280 - w_2 ** 2 * w_4 ** 4 * w_5 / 17280 - w_2 ** 2 * w_4 ** 4 * w_6 / 17280 - w_2 ** 2 * w_4 ** 4 * w_7 / 17280 - w_2 ** 2 * w_4 ** 4 * w_8 / 17280 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 3456 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_7 / 3456 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_8 / 3456 + w_2 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 3456 + w_2 ** 2 * w_4 ** 2 * w_5 * w_6 * w_7 / 1152 + w_2 ** 2 * w_4 ** 2 * w_5 * w_6 * w_8 / 1152 + w_2 ** 2 * w_4 ** 2 * w_5 * w_7 ** 2 / 3456 + w_2 ** 2 * w_4 ** 2 * w_5 * w_7 * w_8 / 1152 + w_2 ** 2 * w_4 ** 2 * w_5 * w_8 ** 2 / 3456 + w_2 ** 2 * w_4 ** 2 * w_6 ** 2 * w_7 / 3456 + w_2 ** 2 * w_4 ** 2 * w_6 ** 2 * w_8 / 3456 + w_2 ** 2 * w_4 ** 2 * w_6 * w_7 ** 2 / 3456 + w_2 ** 2 * w_4 ** 2 * w_6 * w_7 * w_8 / 1152 + w_2 ** 2 * w_4 ** 2 * w_6 * w_8 ** 2 / 3456 + w_2 ** 2 * w_4 ** 2 * w_7 ** 2 * w_8 / 3456 + w_2 ** 2 * w_4 ** 2 * w_7 * w_8 ** 2 / 3456 - w_2 ** 2 * w_4 * w_5 ** 4 / 17280 + w_2 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 3456 + w_2 ** 2 * w_4 * w_5 ** 2 * w_6 * w_7 / 1152 + w_2 ** 2 * w_4 * w_5 ** 2 * w_6 * w_8 / 1152 + w_2 ** 2 * w_4 * w_5 ** 2 * w_7 ** 2 / 3456 + w_2 ** 2 * w_4 * w_5 ** 2 * w_7 * w_8 / 1152 + w_2 ** 2 * w_4 * w_5 ** 2 * w_8 ** 2 / 3456 + w_2 ** 2 * w_4 * w_5 * w_6 ** 2 * w_7 / 1152 + w_2 ** 2 * w_4 * w_5 * w_6 ** 2 * w_8 / 1152 + w_2 ** 2 * w_4 * w_5 * w_6 * w_7 ** 2 / 1152 + w_2 ** 2 * w_4 * w_5 * w_6 * w_7 * w_8 / 384 + w_2 ** 2 * w_4 * w_5 * w_6 * w_8 ** 2 / 1152 + w_2 ** 2 * w_4 * w_5 * w_7 ** 2 * w_8 / 1152 + w_2 ** 2 * w_4 * w_5 * w_7 * w_8 ** 2 / 1152 - w_2 ** 2 * w_4 * w_6 ** 4 / 17280 + w_2 ** 2 * w_4 * w_6 ** 2 * w_7 ** 2 / 3456 + w_2 ** 2 * w_4 * w_6 ** 2 * w_7 * w_8 / 1152 + w_2 ** 2 * w_4 * w_6 ** 2 * w_8 ** 2 / 3456 + w_2 ** 2 * w_4 * w_6 * w_7 ** 2 * w_8 / 1152 + w_2 ** 2 * w_4 * w_6 * w_7 * w_8 ** 2 / 1152 - w_2 ** 2 * w_4 * w_7 ** 4 / 17280 + w_2 ** 2 * w_4 * w_7 ** 2 * w_8 ** 2 / 3456 - w_2 ** 2 * w_4 * w_8 ** 4 / 17280 - w_2 ** 2 * w_5 ** 4 * w_6 / 17280 - w_2 ** 2 * w_5 ** 4 * w_7 / 17280 - w_2 ** 2 * w_5 ** 4 * w_8 / 17280 + w_2 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 3456 + w_2 ** 2 * w_5 ** 2 * w_6 ** 2 * w_8 / 3456 + w_2 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 3456 + w_2 ** 2 * w_5 ** 2 * w_6 * w_7 * w_8 / 1152 + w_2 ** 2 * w_5 ** 2 * w_6 * w_8 ** 2 / 3456 + w_2 ** 2 * w_5 ** 2 * w_7 ** 2 * w_8 / 3456 + w_2 ** 2 * w_5 ** 2 * w_7 * w_8 ** 2 / 3456 - w_2 ** 2 * w_5 * w_6 ** 4 / 17280 + w_2 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 3456 + w_2 ** 2 * w_5 * w_6 ** 2 * w_7 * w_8 / 1152 + w_2 ** 2 * w_5 * w_6 ** 2 * w_8 ** 2 / 3456 + w_2 ** 2 * w_5 * w_6 * w_7 ** 2 * w_8 / 1152 + w_2 ** 2 * w_5 * w_6 * w_7 * w_8 ** 2 / 1152 - w_2 ** 2 * w_5 * w_7 ** 4 / 17280 + w_2 ** 2 * w_5 * w_7 ** 2 * w_8 ** 2 / 3456 - w_2 ** 2 * w_5 * w_8 ** 4 / 17280 - w_2 ** 2 * w_6 ** 4 * w_7 / 17280 - w_2 ** 2 * w_6 ** 4 * w_8 / 17280 + w_2 ** 2 * w_6 ** 2 * w_7 ** 2 * w_8 / 3456 + w_2 ** 2 * w_6 ** 2 * w_7 * w_8 ** 2 / 3456 - w_2 ** 2 * w_6 * w_7 ** 4 / 17280 + w_2 ** 2 * w_6 * w_7 ** 2 * w_8 ** 2 / 3456 - w_2 ** 2 * w_6 * w_8 ** 4 / 17280 - w_2 ** 2 * w_7 ** 4 * w_8 / 17280 - w_2 ** 2 * w_7 * w_8 ** 4 / 17280 + w_2 * w_3 ** 6 / 60480 - w_2 * w_3 ** 4 * w_4 ** 2 / 17280 - w_2 * w_3 ** 4 * w_4 * w_5 / 5760 - w_2 * w_3 ** 4 * w_4 * w_6 / 5760 - w_2 * w_3 ** 4 * w_4 * w_7 / 5760 - w_2 * w_3 ** 4 * w_4 * w_8 / 5760 - w_2 * w_3 ** 4 * w_5 ** 2 / 17280 - w_2 * w_3 ** 4 * w_5 * w_6 / 5760 - w_2 * w_3 ** 4 * w_5 * w_7 / 5760 - w_2 * w_3 ** 4 * w_5 * w_8 / 5760 - w_2 * w_3 ** 4 * w_6 ** 2 / 17280 - w_2 * w_3 ** 4 * w_6 * w_7 / 5760 - w_2 * w_3 ** 4 * w_6 * w_8 / 5760 - w_2 * w_3 ** 4 * w_7 ** 2 / 17280 - w_2 * w_3 ** 4 * w_7 * w_8 / 5760 - w_2 * w_3 ** 4 * w_8 ** 2 / 17280 - w_2 * w_3 ** 2 * w_4 ** 4 / 17280 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 3456 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 1152 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_7 / 1152 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_8 / 1152 + w_2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 3456 + w_2 * w_3 ** 2 * w_4 ** 2 * w_6 * w_7 / 1152 + w_2 * w_3 ** 2 * w_4 ** 2 * w_6 * w_8 / 1152 + w_2 * w_3 ** 2 * w_4 ** 2 * w_7 ** 2 / 3456 + w_2 * w_3 ** 2 * w_4 ** 2 * w_7 * w_8 / 1152 + w_2 * w_3 ** 2 * w_4 ** 2 * w_8 ** 2 / 3456 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 1152 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_7 / 1152 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_8 / 1152 + w_2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 1152 + w_2 * w_3 ** 2 * w_4 * w_5 * w_6 * w_7 / 384 + w_2 * w_3 ** 2 * w_4 * w_5 * w_6 * w_8 / 384 + w_2 * w_3 ** 2 * w_4 * w_5 * w_7 ** 2 / 1152 + w_2 * w_3 ** 2 * w_4 * w_5 * w_7 * w_8 / 384 + w_2 * w_3 ** 2 * w_4 * w_5 * w_8 ** 2 / 1152 + w_2 * w_3 ** 2 * w_4 * w_6 ** 2 * w_7 / 1152 + w_2 * w_3 ** 2 * w_4 * w_6 ** 2 * w_8 / 1152 + w_2 * w_3 ** 2 * w_4 * w_6 * w_7 ** 2 / 1152 + w_2 * w_3 ** 2 * w_4 * w_6 * w_7 * w_8 / 384 + w_2 * w_3 ** 2 * w_4 * w_6 * w_8 ** 2 / 1152 + w_2 * w_3 ** 2 * w_4 * w_7 ** 2 * w_8 / 1152 + w_2 * w_3 ** 2 * w_4 * w_7 * w_8 ** 2 / 1152 - w_2 * w_3 ** 2 * w_5 ** 4 / 17280 + w_2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_2 * w_3 ** 2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_2 * w_3 ** 2 * w_5 ** 2 * w_6 * w_8 / 1152 + w_2 * w_3 ** 2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_2 * w_3 ** 2 * w_5 ** 2 * w_7 * w_8 / 1152 + w_2 * w_3 ** 2 * w_5 ** 2 * w_8 ** 2 / 3456 + w_2 * w_3 ** 2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_2 * w_3 ** 2 * w_5 * w_6 ** 2 * w_8 / 1152 + w_2 * w_3 ** 2 * w_5 * w_6 * w_7 ** 2 / 1152 + w_2 * w_3 ** 2 * w_5 * w_6 * w_7 * w_8 / 384 + w_2 * w_3 ** 2 * w_5 * w_6 * w_8 ** 2 / 1152 + w_2 * w_3 ** 2 * w_5 * w_7 ** 2 * w_8 / 1152 + w_2 * w_3 ** 2 * w_5 * w_7 * w_8 ** 2 / 1152 - w_2 * w_3 ** 2 * w_6 ** 4 / 17280 + w_2 * w_3 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 + w_2 * w_3 ** 2 * w_6 ** 2 * w_7 * w_8 / 1152 + w_2 * w_3 ** 2 * w_6 ** 2 * w_8 ** 2 / 3456 + w_2 * w_3 ** 2 * w_6 * w_7 ** 2 * w_8 / 1152 + w_2 * w_3 ** 2 * w_6 * w_7 * w_8 ** 2 / 1152 - w_2 * w_3 ** 2 * w_7 ** 4 / 17280 + w_2 * w_3 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_2 * w_3 ** 2 * w_8 ** 4 / 17280 - w_2 * w_3 * w_4 ** 4 * w_5 / 5760 - w_2 * w_3 * w_4 ** 4 * w_6 / 5760 - w_2 * w_3 * w_4 ** 4 * w_7 / 5760 - w_2 * w_3 * w_4 ** 4 * w_8 / 5760 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 1152 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_7 / 1152 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_8 / 1152 + w_2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 1152 + w_2 * w_3 * w_4 ** 2 * w_5 * w_6 * w_7 / 384 + w_2 * w_3 * w_4 ** 2 * w_5 * w_6 * w_8 / 384 + w_2 * w_3 * w_4 ** 2 * w_5 * w_7 ** 2 / 1152 + w_2 * w_3 * w_4 ** 2 * w_5 * w_7 * w_8 / 384 + w_2 * w_3 * w_4 ** 2 * w_5 * w_8 ** 2 / 1152 + w_2 * w_3 * w_4 ** 2 * w_6 ** 2 * w_7 / 1152 + w_2 * w_3 * w_4 ** 2 * w_6 ** 2 * w_8 / 1152 + w_2 * w_3 * w_4 ** 2 * w_6 * w_7 ** 2 / 1152 + w_2 * w_3 * w_4 ** 2 * w_6 * w_7 * w_8 / 384 + w_2 * w_3 * w_4 ** 2 * w_6 * w_8 ** 2 / 1152 + w_2 * w_3 * w_4 ** 2 * w_7 ** 2 * w_8 / 1152 + w_2 * w_3 * w_4 ** 2 * w_7 * w_8 ** 2 / 1152 - w_2 * w_3 * w_4 * w_5 ** 4 / 5760 + w_2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 1152 + w_2 * w_3 * w_4 * w_5 ** 2 * w_6 * w_7 / 384 + w_2 * w_3 * w_4 * w_5 ** 2 * w_6 * w_8 / 384 + w_2 * w_3 * w_4 * w_5 ** 2 * w_7 ** 2 / 1152 + w_2 * w_3 * w_4 * w_5 ** 2 * w_7 * w_8 / 384 + w_2 * w_3 * w_4 * w_5 ** 2 * w_8 ** 2 / 1152 + w_2 * w_3 * w_4 * w_5 * w_6 ** 2 * w_7 / 384 + w_2 * w_3 * w_4 * w_5 * w_6 ** 2 * w_8 / 384 + w_2 * w_3 * w_4 * w_5 * w_6 * w_7 ** 2 / 384 + w_2 * w_3 * w_4 * w_5 * w_6 * w_7 * w_8 / 128 + w_2 * w_3 * w_4 * w_5 * w_6 * w_8 ** 2 / 384 + w_2 * w_3 * w_4 * w_5 * w_7 ** 2 * w_8 / 384 + w_2 * w_3 * w_4 * w_5 * w_7 * w_8 ** 2 / 384 - w_2 * w_3 * w_4 * w_6 ** 4 / 5760 + w_2 * w_3 * w_4 * w_6 ** 2 * w_7 ** 2 / 1152 + w_2 * w_3 * w_4 * w_6 ** 2 * w_7 * w_8 / 384 + w_2 * w_3 * w_4 * w_6 ** 2 * w_8 ** 2 / 1152 + w_2 * w_3 * w_4 * w_6 * w_7 ** 2 * w_8 / 384 + w_2 * w_3 * w_4 * w_6 * w_7 * w_8 ** 2 / 384 - w_2 * w_3 * w_4 * w_7 ** 4 / 5760 + w_2 * w_3 * w_4 * w_7 ** 2 * w_8 ** 2 / 1152 - w_2 * w_3 * w_4 * w_8 ** 4 / 5760 - w_2 * w_3 * w_5 ** 4 * w_6 / 5760 - w_2 * w_3 * w_5 ** 4 * w_7 / 5760 - w_2 * w_3 * w_5 ** 4 * w_8 / 5760 + w_2 * w_3 * w_5 ** 2 * w_6 ** 2 * w_7 / 1152 + w_2 * w_3 * w_5 ** 2 * w_6 ** 2 * w_8 / 1152 + w_2 * w_3 * w_5 ** 2 * w_6 * w_7 ** 2 / 1152 + w_2 * w_3 * w_5 ** 2 * w_6 * w_7 * w_8 / 384 + w_2 * w_3 * w_5 ** 2 * w_6 * w_8 ** 2 / 1152 + w_2 * w_3 * w_5 ** 2 * w_7 ** 2 * w_8 / 1152 + w_2 * w_3 * w_5 ** 2 * w_7 * w_8 ** 2 / 1152 - w_2 * w_3 * w_5 * w_6 ** 4 / 5760 + w_2 * w_3 * w_5 * w_6 ** 2 * w_7 ** 2 / 1152 + w_2 * w_3 * w_5 * w_6 ** 2 * w_7 * w_8 / 384 + w_2 * w_3 * w_5 * w_6 ** 2 * w_8 ** 2 / 1152 + w_2 * w_3 * w_5 * w_6 * w_7 ** 2 * w_8 / 384 + w_2 * w_3 * w_5 * w_6 * w_7 * w_8 ** 2 / 384 - w_2 * w_3 * w_5 * w_7 ** 4 / 5760 + w_2 * w_3 * w_5 * w_7 ** 2 * w_8 ** 2 / 1152 - w_2 * w_3 * w_5 * w_8 ** 4 / 5760 - w_2 * w_3 * w_6 ** 4 * w_7 / 5760 - w_2 * w_3 * w_6 ** 4 * w_8 / 5760 + w_2 * w_3 * w_6 ** 2 * w_7 ** 2 * w_8 / 1152 + w_2 * w_3 * w_6 ** 2 * w_7 * w_8 ** 2 / 1152 - w_2 * w_3 * w_6 * w_7 ** 4 / 5760 + w_2 * w_3 * w_6 * w_7 ** 2 * w_8 ** 2 / 1152 - w_2 * w_3 * w_6 * w_8 ** 4 / 5760 - w_2 * w_3 * w_7 ** 4 * w_8 / 5760 - w_2 * w_3 * w_7 * w_8 ** 4 / 5760 + w_2 * w_4 ** 6 / 60480 - w_2 * w_4 ** 4 * w_5 ** 2 / 17280 - w_2 * w_4 ** 4 * w_5 * w_6 / 5760 - w_2 * w_4 ** 4 * w_5 * w_7 / 5760 - w_2 * w_4 ** 4 * w_5 * w_8 / 5760 - w_2 * w_4 ** 4 * w_6 ** 2 / 17280 - w_2 * w_4 ** 4 * w_6 * w_7 / 5760 - w_2 * w_4 ** 4 * w_6 * w_8 / 5760 - w_2 * w_4 ** 4 * w_7 ** 2 / 17280 - w_2 * w_4 ** 4 * w_7 * w_8 / 5760 - w_2 * w_4 ** 4 * w_8 ** 2 / 17280 - w_2 * w_4 ** 2 * w_5 ** 4 / 17280 + w_2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_2 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_2 * w_4 ** 2 * w_5 ** 2 * w_6 * w_8 / 1152 + w_2 * w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_2 * w_4 ** 2 * w_5 ** 2 * w_7 * w_8 / 1152 + w_2 * w_4 ** 2 * w_5 ** 2 * w_8 ** 2 / 3456 + w_2 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_2 * w_4 ** 2 * w_5 * w_6 ** 2 * w_8 / 1152 + w_2 * w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 1152 + w_2 * w_4 ** 2 * w_5 * w_6 * w_7 * w_8 / 384 + w_2 * w_4 ** 2 * w_5 * w_6 * w_8 ** 2 / 1152 + w_2 * w_4 ** 2 * w_5 * w_7 ** 2 * w_8 / 1152 + w_2 * w_4 ** 2 * w_5 * w_7 * w_8 ** 2 / 1152 - w_2 * w_4 ** 2 * w_6 ** 4 / 17280 + w_2 * w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 + w_2 * w_4 ** 2 * w_6 ** 2 * w_7 * w_8 / 1152 + w_2 * w_4 ** 2 * w_6 ** 2 * w_8 ** 2 / 3456 + w_2 * w_4 ** 2 * w_6 * w_7 ** 2 * w_8 / 1152 + w_2 * w_4 ** 2 * w_6 * w_7 * w_8 ** 2 / 1152 - w_2 * w_4 ** 2 * w_7 ** 4 / 17280 + w_2 * w_4 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_2 * w_4 ** 2 * w_8 ** 4 / 17280 - w_2 * w_4 * w_5 ** 4 * w_6 / 5760 - w_2 * w_4 * w_5 ** 4 * w_7 / 5760 - w_2 * w_4 * w_5 ** 4 * w_8 / 5760 + w_2 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 1152 + w_2 * w_4 * w_5 ** 2 * w_6 ** 2 * w_8 / 1152 + w_2 * w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 1152 + w_2 * w_4 * w_5 ** 2 * w_6 * w_7 * w_8 / 384 + w_2 * w_4 * w_5 ** 2 * w_6 * w_8 ** 2 / 1152 + w_2 * w_4 * w_5 ** 2 * w_7 ** 2 * w_8 / 1152 + w_2 * w_4 * w_5 ** 2 * w_7 * w_8 ** 2 / 1152 - w_2 * w_4 * w_5 * w_6 ** 4 / 5760 + w_2 * w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 1152 + w_2 * w_4 * w_5 * w_6 ** 2 * w_7 * w_8 / 384 + w_2 * w_4 * w_5 * w_6 ** 2 * w_8 ** 2 / 1152 + w_2 * w_4 * w_5 * w_6 * w_7 ** 2 * w_8 / 384 + w_2 * w_4 * w_5 * w_6 * w_7 * w_8 ** 2 / 384 - w_2 * w_4 * w_5 * w_7 ** 4 / 5760 + w_2 * w_4 * w_5 * w_7 ** 2 * w_8 ** 2 / 1152 - w_2 * w_4 * w_5 * w_8 ** 4 / 5760 - w_2 * w_4 * w_6 ** 4 * w_7 / 5760 - w_2 * w_4 * w_6 ** 4 * w_8 / 5760 + w_2 * w_4 * w_6 ** 2 * w_7 ** 2 * w_8 / 1152 + w_2 * w_4 * w_6 ** 2 * w_7 * w_8 ** 2 / 1152 - w_2 * w_4 * w_6 * w_7 ** 4 / 5760 + w_2 * w_4 * w_6 * w_7 ** 2 * w_8 ** 2 / 1152 - w_2 * w_4 * w_6 * w_8 ** 4 / 5760 - w_2 * w_4 * w_7 ** 4 * w_8 / 5760 - w_2 * w_4 * w_7 * w_8 ** 4 / 5760 + w_2 * w_5 ** 6 / 60480 - w_2 * w_5 ** 4 * w_6 ** 2 / 17280 - w_2 * w_5 ** 4 * w_6 * w_7 / 5760 - w_2 * w_5 ** 4 * w_6 * w_8 / 5760 - w_2 * w_5 ** 4 * w_7 ** 2 / 17280 - w_2 * w_5 ** 4 * w_7 * w_8 / 5760 - w_2 * w_5 ** 4 * w_8 ** 2 / 17280 - w_2 * w_5 ** 2 * w_6 ** 4 / 17280 + w_2 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 + w_2 * w_5 ** 2 * w_6 ** 2 * w_7 * w_8 / 1152 + w_2 * w_5 ** 2 * w_6 ** 2 * w_8 ** 2 / 3456 + w_2 * w_5 ** 2 * w_6 * w_7 ** 2 * w_8 / 1152 + w_2 * w_5 ** 2 * w_6 * w_7 * w_8 ** 2 / 1152 - w_2 * w_5 ** 2 * w_7 ** 4 / 17280 + w_2 * w_5 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_2 * w_5 ** 2 * w_8 ** 4 / 17280 - w_2 * w_5 * w_6 ** 4 * w_7 / 5760 - w_2 * w_5 * w_6 ** 4 * w_8 / 5760 + w_2 * w_5 * w_6 ** 2 * w_7 ** 2 * w_8 / 1152 + w_2 * w_5 * w_6 ** 2 * w_7 * w_8 ** 2 / 1152 - w_2 * w_5 * w_6 * w_7 ** 4 / 5760 + w_2 * w_5 * w_6 * w_7 ** 2 * w_8 ** 2 / 1152 - w_2 * w_5 * w_6 * w_8 ** 4 / 5760 - w_2 * w_5 * w_7 ** 4 * w_8 / 5760 - w_2 * w_5 * w_7 * w_8 ** 4 / 5760 + w_2 * w_6 ** 6 / 60480 - w_2 * w_6 ** 4 * w_7 ** 2 / 17280 - w_2 * w_6 ** 4 * w_7 * w_8 / 5760 - w_2 * w_6 ** 4 * w_8 ** 2 / 17280 - w_2 * w_6 ** 2 * w_7 ** 4 / 17280 + w_2 * w_6 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_2 * w_6 ** 2 * w_8 ** 4 / 17280 - w_2 * w_6 * w_7 ** 4 * w_8 / 5760 - w_2 * w_6 * w_7 * w_8 ** 4 / 5760 + w_2 * w_7 ** 6 / 60480 - w_2 * w_7 ** 4 * w_8 ** 2 / 17280 - w_2 * w_7 ** 2 * w_8 ** 4 / 17280 + w_2 * w_8 ** 6 / 60480 + w_3 ** 6 * w_4 / 60480 + w_3 ** 6 * w_5 / 60480 + w_3 ** 6 * w_6 / 60480 + w_3 ** 6 * w_7 / 60480 + w_3 ** 6 * w_8 / 60480 - w_3 ** 4 * w_4 ** 2 * w_5 / 17280 - w_3 ** 4 * w_4 ** 2 * w_6 / 17280 - w_3 ** 4 * w_4 ** 2 * w_7 / 17280 - w_3 ** 4 * w_4 ** 2 * w_8 / 17280 - w_3 ** 4 * w_4 * w_5 ** 2 / 17280 - w_3 ** 4 * w_4 * w_5 * w_6 / 5760 - w_3 ** 4 * w_4 * w_5 * w_7 / 5760 - w_3 ** 4 * w_4 * w_5 * w_8 / 5760 - w_3 ** 4 * w_4 * w_6 ** 2 / 17280 - w_3 ** 4 * w_4 * w_6 * w_7 / 5760 - w_3 ** 4 * w_4 * w_6 * w_8 / 5760 - w_3 ** 4 * w_4 * w_7 ** 2 / 17280 - w_3 ** 4 * w_4 * w_7 * w_8 / 5760 - w_3 ** 4 * w_4 * w_8 ** 2 / 17280 - w_3 ** 4 * w_5 ** 2 * w_6 / 17280 - w_3 ** 4 * w_5 ** 2 * w_7 / 17280 - w_3 ** 4 * w_5 ** 2 * w_8 / 17280 - w_3 ** 4 * w_5 * w_6 ** 2 / 17280 - w_3 ** 4 * w_5 * w_6 * w_7 / 5760 - w_3 ** 4 * w_5 * w_6 * w_8 / 5760 - w_3 ** 4 * w_5 * w_7 ** 2 / 17280 - w_3 ** 4 * w_5 * w_7 * w_8 / 5760 - w_3 ** 4 * w_5 * w_8 ** 2 / 17280 - w_3 ** 4 * w_6 ** 2 * w_7 / 17280 - w_3 ** 4 * w_6 ** 2 * w_8 / 17280 - w_3 ** 4 * w_6 * w_7 ** 2 / 17280 - w_3 ** 4 * w_6 * w_7 * w_8 / 5760 - w_3 ** 4 * w_6 * w_8 ** 2 / 17280 - w_3 ** 4 * w_7 ** 2 * w_8 / 17280 - w_3 ** 4 * w_7 * w_8 ** 2 / 17280 - w_3 ** 2 * w_4 ** 4 * w_5 / 17280 - w_3 ** 2 * w_4 ** 4 * w_6 / 17280 - w_3 ** 2 * w_4 ** 4 * w_7 / 17280 - w_3 ** 2 * w_4 ** 4 * w_8 / 17280 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 3456 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_7 / 3456 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_8 / 3456 + w_3 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 3456 + w_3 ** 2 * w_4 ** 2 * w_5 * w_6 * w_7 / 1152 + w_3 ** 2 * w_4 ** 2 * w_5 * w_6 * w_8 / 1152 + w_3 ** 2 * w_4 ** 2 * w_5 * w_7 ** 2 / 3456 + w_3 ** 2 * w_4 ** 2 * w_5 * w_7 * w_8 / 1152 + w_3 ** 2 * w_4 ** 2 * w_5 * w_8 ** 2 / 3456 + w_3 ** 2 * w_4 ** 2 * w_6 ** 2 * w_7 / 3456 + w_3 ** 2 * w_4 ** 2 * w_6 ** 2 * w_8 / 3456 + w_3 ** 2 * w_4 ** 2 * w_6 * w_7 ** 2 / 3456 + w_3 ** 2 * w_4 ** 2 * w_6 * w_7 * w_8 / 1152 + w_3 ** 2 * w_4 ** 2 * w_6 * w_8 ** 2 / 3456 + w_3 ** 2 * w_4 ** 2 * w_7 ** 2 * w_8 / 3456 + w_3 ** 2 * w_4 ** 2 * w_7 * w_8 ** 2 / 3456 - w_3 ** 2 * w_4 * w_5 ** 4 / 17280 + w_3 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 3456 + w_3 ** 2 * w_4 * w_5 ** 2 * w_6 * w_7 / 1152 + w_3 ** 2 * w_4 * w_5 ** 2 * w_6 * w_8 / 1152 + w_3 ** 2 * w_4 * w_5 ** 2 * w_7 ** 2 / 3456 + w_3 ** 2 * w_4 * w_5 ** 2 * w_7 * w_8 / 1152 + w_3 ** 2 * w_4 * w_5 ** 2 * w_8 ** 2 / 3456 + w_3 ** 2 * w_4 * w_5 * w_6 ** 2 * w_7 / 1152 + w_3 ** 2 * w_4 * w_5 * w_6 ** 2 * w_8 / 1152 + w_3 ** 2 * w_4 * w_5 * w_6 * w_7 ** 2 / 1152 + w_3 ** 2 * w_4 * w_5 * w_6 * w_7 * w_8 / 384 + w_3 ** 2 * w_4 * w_5 * w_6 * w_8 ** 2 / 1152 + w_3 ** 2 * w_4 * w_5 * w_7 ** 2 * w_8 / 1152 + w_3 ** 2 * w_4 * w_5 * w_7 * w_8 ** 2 / 1152 - w_3 ** 2 * w_4 * w_6 ** 4 / 17280 + w_3 ** 2 * w_4 * w_6 ** 2 * w_7 ** 2 / 3456 + w_3 ** 2 * w_4 * w_6 ** 2 * w_7 * w_8 / 1152 + w_3 ** 2 * w_4 * w_6 ** 2 * w_8 ** 2 / 3456 + w_3 ** 2 * w_4 * w_6 * w_7 ** 2 * w_8 / 1152 + w_3 ** 2 * w_4 * w_6 * w_7 * w_8 ** 2 / 1152 - w_3 ** 2 * w_4 * w_7 ** 4 / 17280 + w_3 ** 2 * w_4 * w_7 ** 2 * w_8 ** 2 / 3456 - w_3 ** 2 * w_4 * w_8 ** 4 / 17280 - w_3 ** 2 * w_5 ** 4 * w_6 / 17280 - w_3 ** 2 * w_5 ** 4 * w_7 / 17280 - w_3 ** 2 * w_5 ** 4 * w_8 / 17280 + w_3 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 3456 + w_3 ** 2 * w_5 ** 2 * w_6 ** 2 * w_8 / 3456 + w_3 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 3456 + w_3 ** 2 * w_5 ** 2 * w_6 * w_7 * w_8 / 1152 + w_3 ** 2 * w_5 ** 2 * w_6 * w_8 ** 2 / 3456 + w_3 ** 2 * w_5 ** 2 * w_7 ** 2 * w_8 / 3456 + w_3 ** 2 * w_5 ** 2 * w_7 * w_8 ** 2 / 3456 - w_3 ** 2 * w_5 * w_6 ** 4 / 17280 + w_3 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 3456 + w_3 ** 2 * w_5 * w_6 ** 2 * w_7 * w_8 / 1152 + w_3 ** 2 * w_5 * w_6 ** 2 * w_8 ** 2 / 3456 + w_3 ** 2 * w_5 * w_6 * w_7 ** 2 * w_8 / 1152 + w_3 ** 2 * w_5 * w_6 * w_7 * w_8 ** 2 / 1152 - w_3 ** 2 * w_5 * w_7 ** 4 / 17280 + w_3 ** 2 * w_5 * w_7 ** 2 * w_8 ** 2 / 3456 - w_3 ** 2 * w_5 * w_8 ** 4 / 17280 - w_3 ** 2 * w_6 ** 4 * w_7 / 17280 - w_3 ** 2 * w_6 ** 4 * w_8 / 17280 + w_3 ** 2 * w_6 ** 2 * w_7 ** 2 * w_8 / 3456 + w_3 ** 2 * w_6 ** 2 * w_7 * w_8 ** 2 / 3456 - w_3 ** 2 * w_6 * w_7 ** 4 / 17280 + w_3 ** 2 * w_6 * w_7 ** 2 * w_8 ** 2 / 3456 - w_3 ** 2 * w_6 * w_8 ** 4 / 17280 - w_3 ** 2 * w_7 ** 4 * w_8 / 17280 - w_3 ** 2 * w_7 * w_8 ** 4 / 17280 + w_3 * w_4 ** 6 / 60480 - w_3 * w_4 ** 4 * w_5 ** 2 / 17280 - w_3 * w_4 ** 4 * w_5 * w_6 / 5760 - w_3 * w_4 ** 4 * w_5 * w_7 / 5760 - w_3 * w_4 ** 4 * w_5 * w_8 / 5760 - w_3 * w_4 ** 4 * w_6 ** 2 / 17280 - w_3 * w_4 ** 4 * w_6 * w_7 / 5760 - w_3 * w_4 ** 4 * w_6 * w_8 / 5760 - w_3 * w_4 ** 4 * w_7 ** 2 / 17280 - w_3 * w_4 ** 4 * w_7 * w_8 / 5760 - w_3 * w_4 ** 4 * w_8 ** 2 / 17280 - w_3 * w_4 ** 2 * w_5 ** 4 / 17280 + w_3 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 3456 + w_3 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 1152 + w_3 * w_4 ** 2 * w_5 ** 2 * w_6 * w_8 / 1152 + w_3 * w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 3456 + w_3 * w_4 ** 2 * w_5 ** 2 * w_7 * w_8 / 1152 + w_3 * w_4 ** 2 * w_5 ** 2 * w_8 ** 2 / 3456 + w_3 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 1152 + w_3 * w_4 ** 2 * w_5 * w_6 ** 2 * w_8 / 1152 + w_3 * w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 1152 + w_3 * w_4 ** 2 * w_5 * w_6 * w_7 * w_8 / 384 + w_3 * w_4 ** 2 * w_5 * w_6 * w_8 ** 2 / 1152 + w_3 * w_4 ** 2 * w_5 * w_7 ** 2 * w_8 / 1152 + w_3 * w_4 ** 2 * w_5 * w_7 * w_8 ** 2 / 1152 - w_3 * w_4 ** 2 * w_6 ** 4 / 17280 + w_3 * w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 + w_3 * w_4 ** 2 * w_6 ** 2 * w_7 * w_8 / 1152 + w_3 * w_4 ** 2 * w_6 ** 2 * w_8 ** 2 / 3456 + w_3 * w_4 ** 2 * w_6 * w_7 ** 2 * w_8 / 1152 + w_3 * w_4 ** 2 * w_6 * w_7 * w_8 ** 2 / 1152 - w_3 * w_4 ** 2 * w_7 ** 4 / 17280 + w_3 * w_4 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_3 * w_4 ** 2 * w_8 ** 4 / 17280 - w_3 * w_4 * w_5 ** 4 * w_6 / 5760 - w_3 * w_4 * w_5 ** 4 * w_7 / 5760 - w_3 * w_4 * w_5 ** 4 * w_8 / 5760 + w_3 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 1152 + w_3 * w_4 * w_5 ** 2 * w_6 ** 2 * w_8 / 1152 + w_3 * w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 1152 + w_3 * w_4 * w_5 ** 2 * w_6 * w_7 * w_8 / 384 + w_3 * w_4 * w_5 ** 2 * w_6 * w_8 ** 2 / 1152 + w_3 * w_4 * w_5 ** 2 * w_7 ** 2 * w_8 / 1152 + w_3 * w_4 * w_5 ** 2 * w_7 * w_8 ** 2 / 1152 - w_3 * w_4 * w_5 * w_6 ** 4 / 5760 + w_3 * w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 1152 + w_3 * w_4 * w_5 * w_6 ** 2 * w_7 * w_8 / 384 + w_3 * w_4 * w_5 * w_6 ** 2 * w_8 ** 2 / 1152 + w_3 * w_4 * w_5 * w_6 * w_7 ** 2 * w_8 / 384 + w_3 * w_4 * w_5 * w_6 * w_7 * w_8 ** 2 / 384 - w_3 * w_4 * w_5 * w_7 ** 4 / 5760 + w_3 * w_4 * w_5 * w_7 ** 2 * w_8 ** 2 / 1152 - w_3 * w_4 * w_5 * w_8 ** 4 / 5760 - w_3 * w_4 * w_6 ** 4 * w_7 / 5760 - w_3 * w_4 * w_6 ** 4 * w_8 / 5760 + w_3 * w_4 * w_6 ** 2 * w_7 ** 2 * w_8 / 1152 + w_3 * w_4 * w_6 ** 2 * w_7 * w_8 ** 2 / 1152 - w_3 * w_4 * w_6 * w_7 ** 4 / 5760 + w_3 * w_4 * w_6 * w_7 ** 2 * w_8 ** 2 / 1152 - w_3 * w_4 * w_6 * w_8 ** 4 / 5760 - w_3 * w_4 * w_7 ** 4 * w_8 / 5760 - w_3 * w_4 * w_7 * w_8 ** 4 / 5760 + w_3 * w_5 ** 6 / 60480 - w_3 * w_5 ** 4 * w_6 ** 2 / 17280 - w_3 * w_5 ** 4 * w_6 * w_7 / 5760 - w_3 * w_5 ** 4 * w_6 * w_8 / 5760 - w_3 * w_5 ** 4 * w_7 ** 2 / 17280 - w_3 * w_5 ** 4 * w_7 * w_8 / 5760 - w_3 * w_5 ** 4 * w_8 ** 2 / 17280 - w_3 * w_5 ** 2 * w_6 ** 4 / 17280 + w_3 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 + w_3 * w_5 ** 2 * w_6 ** 2 * w_7 * w_8 / 1152 + w_3 * w_5 ** 2 * w_6 ** 2 * w_8 ** 2 / 3456 + w_3 * w_5 ** 2 * w_6 * w_7 ** 2 * w_8 / 1152 + w_3 * w_5 ** 2 * w_6 * w_7 * w_8 ** 2 / 1152 - w_3 * w_5 ** 2 * w_7 ** 4 / 17280 + w_3 * w_5 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_3 * w_5 ** 2 * w_8 ** 4 / 17280 - w_3 * w_5 * w_6 ** 4 * w_7 / 5760 - w_3 * w_5 * w_6 ** 4 * w_8 / 5760 + w_3 * w_5 * w_6 ** 2 * w_7 ** 2 * w_8 / 1152 + w_3 * w_5 * w_6 ** 2 * w_7 * w_8 ** 2 / 1152 - w_3 * w_5 * w_6 * w_7 ** 4 / 5760 + w_3 * w_5 * w_6 * w_7 ** 2 * w_8 ** 2 / 1152 - w_3 * w_5 * w_6 * w_8 ** 4 / 5760 - w_3 * w_5 * w_7 ** 4 * w_8 / 5760 - w_3 * w_5 * w_7 * w_8 ** 4 / 5760 + w_3 * w_6 ** 6 / 60480 - w_3 * w_6 ** 4 * w_7 ** 2 / 17280 - w_3 * w_6 ** 4 * w_7 * w_8 / 5760 - w_3 * w_6 ** 4 * w_8 ** 2 / 17280 - w_3 * w_6 ** 2 * w_7 ** 4 / 17280 + w_3 * w_6 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_3 * w_6 ** 2 * w_8 ** 4 / 17280 - w_3 * w_6 * w_7 ** 4 * w_8 / 5760 - w_3 * w_6 * w_7 * w_8 ** 4 / 5760 + w_3 * w_7 ** 6 / 60480 - w_3 * w_7 ** 4 * w_8 ** 2 / 17280 - w_3 * w_7 ** 2 * w_8 ** 4 / 17280 + w_3 * w_8 ** 6 / 60480 + w_4 ** 6 * w_5 / 60480 + w_4 ** 6 * w_6 / 60480 + w_4 ** 6 * w_7 / 60480 + w_4 ** 6 * w_8 / 60480 - w_4 ** 4 * w_5 ** 2 * w_6 / 17280 - w_4 ** 4 * w_5 ** 2 * w_7 / 17280 - w_4 ** 4 * w_5 ** 2 * w_8 / 17280 - w_4 ** 4 * w_5 * w_6 ** 2 / 17280 - w_4 ** 4 * w_5 * w_6 * w_7 / 5760 - w_4 ** 4 * w_5 * w_6 * w_8 / 5760 - w_4 ** 4 * w_5 * w_7 ** 2 / 17280 - w_4 ** 4 * w_5 * w_7 * w_8 / 5760 - w_4 ** 4 * w_5 * w_8 ** 2 / 17280 - w_4 ** 4 * w_6 ** 2 * w_7 / 17280 - w_4 ** 4 * w_6 ** 2 * w_8 / 17280 - w_4 ** 4 * w_6 * w_7 ** 2 / 17280 - w_4 ** 4 * w_6 * w_7 * w_8 / 5760 - w_4 ** 4 * w_6 * w_8 ** 2 / 17280 - w_4 ** 4 * w_7 ** 2 * w_8 / 17280 - w_4 ** 4 * w_7 * w_8 ** 2 / 17280 - w_4 ** 2 * w_5 ** 4 * w_6 / 17280 - w_4 ** 2 * w_5 ** 4 * w_7 / 17280 - w_4 ** 2 * w_5 ** 4 * w_8 / 17280 + w_4 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 3456 + w_4 ** 2 * w_5 ** 2 * w_6 ** 2 * w_8 / 3456 + w_4 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 3456 + w_4 ** 2 * w_5 ** 2 * w_6 * w_7 * w_8 / 1152 + w_4 ** 2 * w_5 ** 2 * w_6 * w_8 ** 2 / 3456 + w_4 ** 2 * w_5 ** 2 * w_7 ** 2 * w_8 / 3456 + w_4 ** 2 * w_5 ** 2 * w_7 * w_8 ** 2 / 3456 - w_4 ** 2 * w_5 * w_6 ** 4 / 17280 + w_4 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 3456 + w_4 ** 2 * w_5 * w_6 ** 2 * w_7 * w_8 / 1152 + w_4 ** 2 * w_5 * w_6 ** 2 * w_8 ** 2 / 3456 + w_4 ** 2 * w_5 * w_6 * w_7 ** 2 * w_8 / 1152 + w_4 ** 2 * w_5 * w_6 * w_7 * w_8 ** 2 / 1152 - w_4 ** 2 * w_5 * w_7 ** 4 / 17280 + w_4 ** 2 * w_5 * w_7 ** 2 * w_8 ** 2 / 3456 - w_4 ** 2 * w_5 * w_8 ** 4 / 17280 - w_4 ** 2 * w_6 ** 4 * w_7 / 17280 - w_4 ** 2 * w_6 ** 4 * w_8 / 17280 + w_4 ** 2 * w_6 ** 2 * w_7 ** 2 * w_8 / 3456 + w_4 ** 2 * w_6 ** 2 * w_7 * w_8 ** 2 / 3456 - w_4 ** 2 * w_6 * w_7 ** 4 / 17280 + w_4 ** 2 * w_6 * w_7 ** 2 * w_8 ** 2 / 3456 - w_4 ** 2 * w_6 * w_8 ** 4 / 17280 - w_4 ** 2 * w_7 ** 4 * w_8 / 17280 - w_4 ** 2 * w_7 * w_8 ** 4 / 17280 + w_4 * w_5 ** 6 / 60480 - w_4 * w_5 ** 4 * w_6 ** 2 / 17280 - w_4 * w_5 ** 4 * w_6 * w_7 / 5760 - w_4 * w_5 ** 4 * w_6 * w_8 / 5760 - w_4 * w_5 ** 4 * w_7 ** 2 / 17280 - w_4 * w_5 ** 4 * w_7 * w_8 / 5760 - w_4 * w_5 ** 4 * w_8 ** 2 / 17280 - w_4 * w_5 ** 2 * w_6 ** 4 / 17280 + w_4 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 3456 + w_4 * w_5 ** 2 * w_6 ** 2 * w_7 * w_8 / 1152 + w_4 * w_5 ** 2 * w_6 ** 2 * w_8 ** 2 / 3456 + w_4 * w_5 ** 2 * w_6 * w_7 ** 2 * w_8 / 1152 + w_4 * w_5 ** 2 * w_6 * w_7 * w_8 ** 2 / 1152 - w_4 * w_5 ** 2 * w_7 ** 4 / 17280 + w_4 * w_5 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_4 * w_5 ** 2 * w_8 ** 4 / 17280 - w_4 * w_5 * w_6 ** 4 * w_7 / 5760 - w_4 * w_5 * w_6 ** 4 * w_8 / 5760 + w_4 * w_5 * w_6 ** 2 * w_7 ** 2 * w_8 / 1152 + w_4 * w_5 * w_6 ** 2 * w_7 * w_8 ** 2 / 1152 - w_4 * w_5 * w_6 * w_7 ** 4 / 5760 + w_4 * w_5 * w_6 * w_7 ** 2 * w_8 ** 2 / 1152 - w_4 * w_5 * w_6 * w_8 ** 4 / 5760 - w_4 * w_5 * w_7 ** 4 * w_8 / 5760 - w_4 * w_5 * w_7 * w_8 ** 4 / 5760 + w_4 * w_6 ** 6 / 60480 - w_4 * w_6 ** 4 * w_7 ** 2 / 17280 - w_4 * w_6 ** 4 * w_7 * w_8 / 5760 - w_4 * w_6 ** 4 * w_8 ** 2 / 17280 - w_4 * w_6 ** 2 * w_7 ** 4 / 17280 + w_4 * w_6 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_4 * w_6 ** 2 * w_8 ** 4 / 17280 - w_4 * w_6 * w_7 ** 4 * w_8 / 5760 - w_4 * w_6 * w_7 * w_8 ** 4 / 5760 + w_4 * w_7 ** 6 / 60480 - w_4 * w_7 ** 4 * w_8 ** 2 / 17280 - w_4 * w_7 ** 2 * w_8 ** 4 / 17280 + w_4 * w_8 ** 6 / 60480 + w_5 ** 6 * w_6 / 60480 + w_5 ** 6 * w_7 / 60480 + w_5 ** 6 * w_8 / 60480 - w_5 ** 4 * w_6 ** 2 * w_7 / 17280 - w_5 ** 4 * w_6 ** 2 * w_8 / 17280 - w_5 ** 4 * w_6 * w_7 ** 2 / 17280 - w_5 ** 4 * w_6 * w_7 * w_8 / 5760 - w_5 ** 4 * w_6 * w_8 ** 2 / 17280 - w_5 ** 4 * w_7 ** 2 * w_8 / 17280 - w_5 ** 4 * w_7 * w_8 ** 2 / 17280 - w_5 ** 2 * w_6 ** 4 * w_7 / 17280 - w_5 ** 2 * w_6 ** 4 * w_8 / 17280 + w_5 ** 2 * w_6 ** 2 * w_7 ** 2 * w_8 / 3456 + w_5 ** 2 * w_6 ** 2 * w_7 * w_8 ** 2 / 3456 - w_5 ** 2 * w_6 * w_7 ** 4 / 17280 + w_5 ** 2 * w_6 * w_7 ** 2 * w_8 ** 2 / 3456 - w_5 ** 2 * w_6 * w_8 ** 4 / 17280 - w_5 ** 2 * w_7 ** 4 * w_8 / 17280 - w_5 ** 2 * w_7 * w_8 ** 4 / 17280 + w_5 * w_6 ** 6 / 60480 - w_5 * w_6 ** 4 * w_7 ** 2 / 17280 - w_5 * w_6 ** 4 * w_7 * w_8 / 5760 - w_5 * w_6 ** 4 * w_8 ** 2 / 17280 - w_5 * w_6 ** 2 * w_7 ** 4 / 17280 + w_5 * w_6 ** 2 * w_7 ** 2 * w_8 ** 2 / 3456 - w_5 * w_6 ** 2 * w_8 ** 4 / 17280 - w_5 * w_6 * w_7 ** 4 * w_8 / 5760 - w_5 * w_6 * w_7 * w_8 ** 4 / 5760 + w_5 * w_7 ** 6 / 60480 - w_5 * w_7 ** 4 * w_8 ** 2 / 17280 - w_5 * w_7 ** 2 * w_8 ** 4 / 17280 + w_5 * w_8 ** 6 / 60480 + w_6 ** 6 * w_7 / 60480 + w_6 ** 6 * w_8 / 60480 - w_6 ** 4 * w_7 ** 2 * w_8 / 17280 - w_6 ** 4 * w_7 * w_8 ** 2 / 17280 - w_6 ** 2 * w_7 ** 4 * w_8 / 17280 - w_6 ** 2 * w_7 * w_8 ** 4 / 17280 + w_6 * w_7 ** 6 / 60480 - w_6 * w_7 ** 4 * w_8 ** 2 / 17280 - w_6 * w_7 ** 2 * w_8 ** 4 / 17280 + w_6 * w_8 ** 6 / 60480 + w_7 ** 6 * w_8 / 60480 + w_7 * w_8 ** 6 / 60480
-    if s == 8 and ln == 7:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        w_7 = sym.Symbol("w_7")
-        return -w_1 ** 8 / 1209600 + w_1 ** 6 * w_2 ** 2 / 362880 + w_1 ** 6 * w_2 * w_3 / 120960 + w_1 ** 6 * w_2 * w_4 / 120960 + w_1 ** 6 * w_2 * w_5 / 120960 + w_1 ** 6 * w_2 * w_6 / 120960 + w_1 ** 6 * w_2 * w_7 / 120960 + w_1 ** 6 * w_3 ** 2 / 362880 + w_1 ** 6 * w_3 * w_4 / 120960 + w_1 ** 6 * w_3 * w_5 / 120960 + w_1 ** 6 * w_3 * w_6 / 120960 + w_1 ** 6 * w_3 * w_7 / 120960 + w_1 ** 6 * w_4 ** 2 / 362880 + w_1 ** 6 * w_4 * w_5 / 120960 + w_1 ** 6 * w_4 * w_6 / 120960 + w_1 ** 6 * w_4 * w_7 / 120960 + w_1 ** 6 * w_5 ** 2 / 362880 + w_1 ** 6 * w_5 * w_6 / 120960 + w_1 ** 6 * w_5 * w_7 / 120960 + w_1 ** 6 * w_6 ** 2 / 362880 + w_1 ** 6 * w_6 * w_7 / 120960 + w_1 ** 6 * w_7 ** 2 / 362880 + w_1 ** 4 * w_2 ** 4 / 518400 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 / 103680 - w_1 ** 4 * w_2 ** 2 * w_3 * w_4 / 34560 - w_1 ** 4 * w_2 ** 2 * w_3 * w_5 / 34560 - w_1 ** 4 * w_2 ** 2 * w_3 * w_6 / 34560 - w_1 ** 4 * w_2 ** 2 * w_3 * w_7 / 34560 - w_1 ** 4 * w_2 ** 2 * w_4 ** 2 / 103680 - w_1 ** 4 * w_2 ** 2 * w_4 * w_5 / 34560 - w_1 ** 4 * w_2 ** 2 * w_4 * w_6 / 34560 - w_1 ** 4 * w_2 ** 2 * w_4 * w_7 / 34560 - w_1 ** 4 * w_2 ** 2 * w_5 ** 2 / 103680 - w_1 ** 4 * w_2 ** 2 * w_5 * w_6 / 34560 - w_1 ** 4 * w_2 ** 2 * w_5 * w_7 / 34560 - w_1 ** 4 * w_2 ** 2 * w_6 ** 2 / 103680 - w_1 ** 4 * w_2 ** 2 * w_6 * w_7 / 34560 - w_1 ** 4 * w_2 ** 2 * w_7 ** 2 / 103680 - w_1 ** 4 * w_2 * w_3 ** 2 * w_4 / 34560 - w_1 ** 4 * w_2 * w_3 ** 2 * w_5 / 34560 - w_1 ** 4 * w_2 * w_3 ** 2 * w_6 / 34560 - w_1 ** 4 * w_2 * w_3 ** 2 * w_7 / 34560 - w_1 ** 4 * w_2 * w_3 * w_4 ** 2 / 34560 - w_1 ** 4 * w_2 * w_3 * w_4 * w_5 / 11520 - w_1 ** 4 * w_2 * w_3 * w_4 * w_6 / 11520 - w_1 ** 4 * w_2 * w_3 * w_4 * w_7 / 11520 - w_1 ** 4 * w_2 * w_3 * w_5 ** 2 / 34560 - w_1 ** 4 * w_2 * w_3 * w_5 * w_6 / 11520 - w_1 ** 4 * w_2 * w_3 * w_5 * w_7 / 11520 - w_1 ** 4 * w_2 * w_3 * w_6 ** 2 / 34560 - w_1 ** 4 * w_2 * w_3 * w_6 * w_7 / 11520 - w_1 ** 4 * w_2 * w_3 * w_7 ** 2 / 34560 - w_1 ** 4 * w_2 * w_4 ** 2 * w_5 / 34560 - w_1 ** 4 * w_2 * w_4 ** 2 * w_6 / 34560 - w_1 ** 4 * w_2 * w_4 ** 2 * w_7 / 34560 - w_1 ** 4 * w_2 * w_4 * w_5 ** 2 / 34560 - w_1 ** 4 * w_2 * w_4 * w_5 * w_6 / 11520 - w_1 ** 4 * w_2 * w_4 * w_5 * w_7 / 11520 - w_1 ** 4 * w_2 * w_4 * w_6 ** 2 / 34560 - w_1 ** 4 * w_2 * w_4 * w_6 * w_7 / 11520 - w_1 ** 4 * w_2 * w_4 * w_7 ** 2 / 34560 - w_1 ** 4 * w_2 * w_5 ** 2 * w_6 / 34560 - w_1 ** 4 * w_2 * w_5 ** 2 * w_7 / 34560 - w_1 ** 4 * w_2 * w_5 * w_6 ** 2 / 34560 - w_1 ** 4 * w_2 * w_5 * w_6 * w_7 / 11520 - w_1 ** 4 * w_2 * w_5 * w_7 ** 2 / 34560 - w_1 ** 4 * w_2 * w_6 ** 2 * w_7 / 34560 - w_1 ** 4 * w_2 * w_6 * w_7 ** 2 / 34560 + w_1 ** 4 * w_3 ** 4 / 518400 - w_1 ** 4 * w_3 ** 2 * w_4 ** 2 / 103680 - w_1 ** 4 * w_3 ** 2 * w_4 * w_5 / 34560 - w_1 ** 4 * w_3 ** 2 * w_4 * w_6 / 34560 - w_1 ** 4 * w_3 ** 2 * w_4 * w_7 / 34560 - w_1 ** 4 * w_3 ** 2 * w_5 ** 2 / 103680 - w_1 ** 4 * w_3 ** 2 * w_5 * w_6 / 34560 - w_1 ** 4 * w_3 ** 2 * w_5 * w_7 / 34560 - w_1 ** 4 * w_3 ** 2 * w_6 ** 2 / 103680 - w_1 ** 4 * w_3 ** 2 * w_6 * w_7 / 34560 - w_1 ** 4 * w_3 ** 2 * w_7 ** 2 / 103680 - w_1 ** 4 * w_3 * w_4 ** 2 * w_5 / 34560 - w_1 ** 4 * w_3 * w_4 ** 2 * w_6 / 34560 - w_1 ** 4 * w_3 * w_4 ** 2 * w_7 / 34560 - w_1 ** 4 * w_3 * w_4 * w_5 ** 2 / 34560 - w_1 ** 4 * w_3 * w_4 * w_5 * w_6 / 11520 - w_1 ** 4 * w_3 * w_4 * w_5 * w_7 / 11520 - w_1 ** 4 * w_3 * w_4 * w_6 ** 2 / 34560 - w_1 ** 4 * w_3 * w_4 * w_6 * w_7 / 11520 - w_1 ** 4 * w_3 * w_4 * w_7 ** 2 / 34560 - w_1 ** 4 * w_3 * w_5 ** 2 * w_6 / 34560 - w_1 ** 4 * w_3 * w_5 ** 2 * w_7 / 34560 - w_1 ** 4 * w_3 * w_5 * w_6 ** 2 / 34560 - w_1 ** 4 * w_3 * w_5 * w_6 * w_7 / 11520 - w_1 ** 4 * w_3 * w_5 * w_7 ** 2 / 34560 - w_1 ** 4 * w_3 * w_6 ** 2 * w_7 / 34560 - w_1 ** 4 * w_3 * w_6 * w_7 ** 2 / 34560 + w_1 ** 4 * w_4 ** 4 / 518400 - w_1 ** 4 * w_4 ** 2 * w_5 ** 2 / 103680 - w_1 ** 4 * w_4 ** 2 * w_5 * w_6 / 34560 - w_1 ** 4 * w_4 ** 2 * w_5 * w_7 / 34560 - w_1 ** 4 * w_4 ** 2 * w_6 ** 2 / 103680 - w_1 ** 4 * w_4 ** 2 * w_6 * w_7 / 34560 - w_1 ** 4 * w_4 ** 2 * w_7 ** 2 / 103680 - w_1 ** 4 * w_4 * w_5 ** 2 * w_6 / 34560 - w_1 ** 4 * w_4 * w_5 ** 2 * w_7 / 34560 - w_1 ** 4 * w_4 * w_5 * w_6 ** 2 / 34560 - w_1 ** 4 * w_4 * w_5 * w_6 * w_7 / 11520 - w_1 ** 4 * w_4 * w_5 * w_7 ** 2 / 34560 - w_1 ** 4 * w_4 * w_6 ** 2 * w_7 / 34560 - w_1 ** 4 * w_4 * w_6 * w_7 ** 2 / 34560 + w_1 ** 4 * w_5 ** 4 / 518400 - w_1 ** 4 * w_5 ** 2 * w_6 ** 2 / 103680 - w_1 ** 4 * w_5 ** 2 * w_6 * w_7 / 34560 - w_1 ** 4 * w_5 ** 2 * w_7 ** 2 / 103680 - w_1 ** 4 * w_5 * w_6 ** 2 * w_7 / 34560 - w_1 ** 4 * w_5 * w_6 * w_7 ** 2 / 34560 + w_1 ** 4 * w_6 ** 4 / 518400 - w_1 ** 4 * w_6 ** 2 * w_7 ** 2 / 103680 + w_1 ** 4 * w_7 ** 4 / 518400 + w_1 ** 2 * w_2 ** 6 / 362880 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 / 103680 - w_1 ** 2 * w_2 ** 4 * w_3 * w_4 / 34560 - w_1 ** 2 * w_2 ** 4 * w_3 * w_5 / 34560 - w_1 ** 2 * w_2 ** 4 * w_3 * w_6 / 34560 - w_1 ** 2 * w_2 ** 4 * w_3 * w_7 / 34560 - w_1 ** 2 * w_2 ** 4 * w_4 ** 2 / 103680 - w_1 ** 2 * w_2 ** 4 * w_4 * w_5 / 34560 - w_1 ** 2 * w_2 ** 4 * w_4 * w_6 / 34560 - w_1 ** 2 * w_2 ** 4 * w_4 * w_7 / 34560 - w_1 ** 2 * w_2 ** 4 * w_5 ** 2 / 103680 - w_1 ** 2 * w_2 ** 4 * w_5 * w_6 / 34560 - w_1 ** 2 * w_2 ** 4 * w_5 * w_7 / 34560 - w_1 ** 2 * w_2 ** 4 * w_6 ** 2 / 103680 - w_1 ** 2 * w_2 ** 4 * w_6 * w_7 / 34560 - w_1 ** 2 * w_2 ** 4 * w_7 ** 2 / 103680 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 / 103680 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 * w_6 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 * w_7 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 * w_6 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 * w_7 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_6 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_6 * w_7 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_7 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 * w_6 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 * w_7 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 * w_6 / 2304 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 * w_7 / 2304 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_6 ** 2 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_6 * w_7 / 2304 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_7 ** 2 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 ** 2 * w_6 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 ** 2 * w_7 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 * w_6 ** 2 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 * w_6 * w_7 / 2304 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 * w_7 ** 2 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_6 ** 2 * w_7 / 6912 + w_1 ** 2 * w_2 ** 2 * w_3 * w_6 * w_7 ** 2 / 6912 - w_1 ** 2 * w_2 ** 2 * w_4 ** 4 / 103680 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 * w_6 / 6912 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 * w_7 / 6912 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_6 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_6 * w_7 / 6912 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_7 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 ** 2 * w_6 / 6912 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 ** 2 * w_7 / 6912 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 * w_6 ** 2 / 6912 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 * w_6 * w_7 / 2304 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 * w_7 ** 2 / 6912 + w_1 ** 2 * w_2 ** 2 * w_4 * w_6 ** 2 * w_7 / 6912 + w_1 ** 2 * w_2 ** 2 * w_4 * w_6 * w_7 ** 2 / 6912 - w_1 ** 2 * w_2 ** 2 * w_5 ** 4 / 103680 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 * w_6 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 * w_6 * w_7 / 6912 + w_1 ** 2 * w_2 ** 2 * w_5 ** 2 * w_7 ** 2 / 20736 + w_1 ** 2 * w_2 ** 2 * w_5 * w_6 ** 2 * w_7 / 6912 + w_1 ** 2 * w_2 ** 2 * w_5 * w_6 * w_7 ** 2 / 6912 - w_1 ** 2 * w_2 ** 2 * w_6 ** 4 / 103680 + w_1 ** 2 * w_2 ** 2 * w_6 ** 2 * w_7 ** 2 / 20736 - w_1 ** 2 * w_2 ** 2 * w_7 ** 4 / 103680 - w_1 ** 2 * w_2 * w_3 ** 4 * w_4 / 34560 - w_1 ** 2 * w_2 * w_3 ** 4 * w_5 / 34560 - w_1 ** 2 * w_2 * w_3 ** 4 * w_6 / 34560 - w_1 ** 2 * w_2 * w_3 ** 4 * w_7 / 34560 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 * w_6 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 * w_7 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 * w_6 / 2304 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 * w_7 / 2304 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_6 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_6 * w_7 / 2304 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_7 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 ** 2 * w_6 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 ** 2 * w_7 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 * w_6 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 * w_6 * w_7 / 2304 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 * w_7 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_6 ** 2 * w_7 / 6912 + w_1 ** 2 * w_2 * w_3 ** 2 * w_6 * w_7 ** 2 / 6912 - w_1 ** 2 * w_2 * w_3 * w_4 ** 4 / 34560 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 * w_6 / 2304 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 * w_7 / 2304 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_6 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_6 * w_7 / 2304 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_7 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 ** 2 * w_6 / 2304 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 ** 2 * w_7 / 2304 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 * w_6 ** 2 / 2304 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 * w_6 * w_7 / 768 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 * w_7 ** 2 / 2304 + w_1 ** 2 * w_2 * w_3 * w_4 * w_6 ** 2 * w_7 / 2304 + w_1 ** 2 * w_2 * w_3 * w_4 * w_6 * w_7 ** 2 / 2304 - w_1 ** 2 * w_2 * w_3 * w_5 ** 4 / 34560 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 * w_6 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 * w_6 * w_7 / 2304 + w_1 ** 2 * w_2 * w_3 * w_5 ** 2 * w_7 ** 2 / 6912 + w_1 ** 2 * w_2 * w_3 * w_5 * w_6 ** 2 * w_7 / 2304 + w_1 ** 2 * w_2 * w_3 * w_5 * w_6 * w_7 ** 2 / 2304 - w_1 ** 2 * w_2 * w_3 * w_6 ** 4 / 34560 + w_1 ** 2 * w_2 * w_3 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 ** 2 * w_2 * w_3 * w_7 ** 4 / 34560 - w_1 ** 2 * w_2 * w_4 ** 4 * w_5 / 34560 - w_1 ** 2 * w_2 * w_4 ** 4 * w_6 / 34560 - w_1 ** 2 * w_2 * w_4 ** 4 * w_7 / 34560 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 ** 2 * w_6 / 6912 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 ** 2 * w_7 / 6912 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 * w_6 ** 2 / 6912 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 * w_6 * w_7 / 2304 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 * w_7 ** 2 / 6912 + w_1 ** 2 * w_2 * w_4 ** 2 * w_6 ** 2 * w_7 / 6912 + w_1 ** 2 * w_2 * w_4 ** 2 * w_6 * w_7 ** 2 / 6912 - w_1 ** 2 * w_2 * w_4 * w_5 ** 4 / 34560 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 * w_6 ** 2 / 6912 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 * w_6 * w_7 / 2304 + w_1 ** 2 * w_2 * w_4 * w_5 ** 2 * w_7 ** 2 / 6912 + w_1 ** 2 * w_2 * w_4 * w_5 * w_6 ** 2 * w_7 / 2304 + w_1 ** 2 * w_2 * w_4 * w_5 * w_6 * w_7 ** 2 / 2304 - w_1 ** 2 * w_2 * w_4 * w_6 ** 4 / 34560 + w_1 ** 2 * w_2 * w_4 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 ** 2 * w_2 * w_4 * w_7 ** 4 / 34560 - w_1 ** 2 * w_2 * w_5 ** 4 * w_6 / 34560 - w_1 ** 2 * w_2 * w_5 ** 4 * w_7 / 34560 + w_1 ** 2 * w_2 * w_5 ** 2 * w_6 ** 2 * w_7 / 6912 + w_1 ** 2 * w_2 * w_5 ** 2 * w_6 * w_7 ** 2 / 6912 - w_1 ** 2 * w_2 * w_5 * w_6 ** 4 / 34560 + w_1 ** 2 * w_2 * w_5 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 ** 2 * w_2 * w_5 * w_7 ** 4 / 34560 - w_1 ** 2 * w_2 * w_6 ** 4 * w_7 / 34560 - w_1 ** 2 * w_2 * w_6 * w_7 ** 4 / 34560 + w_1 ** 2 * w_3 ** 6 / 362880 - w_1 ** 2 * w_3 ** 4 * w_4 ** 2 / 103680 - w_1 ** 2 * w_3 ** 4 * w_4 * w_5 / 34560 - w_1 ** 2 * w_3 ** 4 * w_4 * w_6 / 34560 - w_1 ** 2 * w_3 ** 4 * w_4 * w_7 / 34560 - w_1 ** 2 * w_3 ** 4 * w_5 ** 2 / 103680 - w_1 ** 2 * w_3 ** 4 * w_5 * w_6 / 34560 - w_1 ** 2 * w_3 ** 4 * w_5 * w_7 / 34560 - w_1 ** 2 * w_3 ** 4 * w_6 ** 2 / 103680 - w_1 ** 2 * w_3 ** 4 * w_6 * w_7 / 34560 - w_1 ** 2 * w_3 ** 4 * w_7 ** 2 / 103680 - w_1 ** 2 * w_3 ** 2 * w_4 ** 4 / 103680 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 20736 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 6912 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_7 / 6912 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 20736 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 * w_7 / 6912 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_7 ** 2 / 20736 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 6912 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_7 / 6912 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 6912 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 * w_7 / 2304 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 * w_7 ** 2 / 6912 + w_1 ** 2 * w_3 ** 2 * w_4 * w_6 ** 2 * w_7 / 6912 + w_1 ** 2 * w_3 ** 2 * w_4 * w_6 * w_7 ** 2 / 6912 - w_1 ** 2 * w_3 ** 2 * w_5 ** 4 / 103680 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 20736 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 * w_7 / 6912 + w_1 ** 2 * w_3 ** 2 * w_5 ** 2 * w_7 ** 2 / 20736 + w_1 ** 2 * w_3 ** 2 * w_5 * w_6 ** 2 * w_7 / 6912 + w_1 ** 2 * w_3 ** 2 * w_5 * w_6 * w_7 ** 2 / 6912 - w_1 ** 2 * w_3 ** 2 * w_6 ** 4 / 103680 + w_1 ** 2 * w_3 ** 2 * w_6 ** 2 * w_7 ** 2 / 20736 - w_1 ** 2 * w_3 ** 2 * w_7 ** 4 / 103680 - w_1 ** 2 * w_3 * w_4 ** 4 * w_5 / 34560 - w_1 ** 2 * w_3 * w_4 ** 4 * w_6 / 34560 - w_1 ** 2 * w_3 * w_4 ** 4 * w_7 / 34560 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 6912 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_7 / 6912 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 6912 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 * w_7 / 2304 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 * w_7 ** 2 / 6912 + w_1 ** 2 * w_3 * w_4 ** 2 * w_6 ** 2 * w_7 / 6912 + w_1 ** 2 * w_3 * w_4 ** 2 * w_6 * w_7 ** 2 / 6912 - w_1 ** 2 * w_3 * w_4 * w_5 ** 4 / 34560 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 6912 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 * w_7 / 2304 + w_1 ** 2 * w_3 * w_4 * w_5 ** 2 * w_7 ** 2 / 6912 + w_1 ** 2 * w_3 * w_4 * w_5 * w_6 ** 2 * w_7 / 2304 + w_1 ** 2 * w_3 * w_4 * w_5 * w_6 * w_7 ** 2 / 2304 - w_1 ** 2 * w_3 * w_4 * w_6 ** 4 / 34560 + w_1 ** 2 * w_3 * w_4 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 ** 2 * w_3 * w_4 * w_7 ** 4 / 34560 - w_1 ** 2 * w_3 * w_5 ** 4 * w_6 / 34560 - w_1 ** 2 * w_3 * w_5 ** 4 * w_7 / 34560 + w_1 ** 2 * w_3 * w_5 ** 2 * w_6 ** 2 * w_7 / 6912 + w_1 ** 2 * w_3 * w_5 ** 2 * w_6 * w_7 ** 2 / 6912 - w_1 ** 2 * w_3 * w_5 * w_6 ** 4 / 34560 + w_1 ** 2 * w_3 * w_5 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 ** 2 * w_3 * w_5 * w_7 ** 4 / 34560 - w_1 ** 2 * w_3 * w_6 ** 4 * w_7 / 34560 - w_1 ** 2 * w_3 * w_6 * w_7 ** 4 / 34560 + w_1 ** 2 * w_4 ** 6 / 362880 - w_1 ** 2 * w_4 ** 4 * w_5 ** 2 / 103680 - w_1 ** 2 * w_4 ** 4 * w_5 * w_6 / 34560 - w_1 ** 2 * w_4 ** 4 * w_5 * w_7 / 34560 - w_1 ** 2 * w_4 ** 4 * w_6 ** 2 / 103680 - w_1 ** 2 * w_4 ** 4 * w_6 * w_7 / 34560 - w_1 ** 2 * w_4 ** 4 * w_7 ** 2 / 103680 - w_1 ** 2 * w_4 ** 2 * w_5 ** 4 / 103680 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 20736 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 6912 + w_1 ** 2 * w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 20736 + w_1 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 6912 + w_1 ** 2 * w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 6912 - w_1 ** 2 * w_4 ** 2 * w_6 ** 4 / 103680 + w_1 ** 2 * w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 20736 - w_1 ** 2 * w_4 ** 2 * w_7 ** 4 / 103680 - w_1 ** 2 * w_4 * w_5 ** 4 * w_6 / 34560 - w_1 ** 2 * w_4 * w_5 ** 4 * w_7 / 34560 + w_1 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 6912 + w_1 ** 2 * w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 6912 - w_1 ** 2 * w_4 * w_5 * w_6 ** 4 / 34560 + w_1 ** 2 * w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 ** 2 * w_4 * w_5 * w_7 ** 4 / 34560 - w_1 ** 2 * w_4 * w_6 ** 4 * w_7 / 34560 - w_1 ** 2 * w_4 * w_6 * w_7 ** 4 / 34560 + w_1 ** 2 * w_5 ** 6 / 362880 - w_1 ** 2 * w_5 ** 4 * w_6 ** 2 / 103680 - w_1 ** 2 * w_5 ** 4 * w_6 * w_7 / 34560 - w_1 ** 2 * w_5 ** 4 * w_7 ** 2 / 103680 - w_1 ** 2 * w_5 ** 2 * w_6 ** 4 / 103680 + w_1 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 20736 - w_1 ** 2 * w_5 ** 2 * w_7 ** 4 / 103680 - w_1 ** 2 * w_5 * w_6 ** 4 * w_7 / 34560 - w_1 ** 2 * w_5 * w_6 * w_7 ** 4 / 34560 + w_1 ** 2 * w_6 ** 6 / 362880 - w_1 ** 2 * w_6 ** 4 * w_7 ** 2 / 103680 - w_1 ** 2 * w_6 ** 2 * w_7 ** 4 / 103680 + w_1 ** 2 * w_7 ** 6 / 362880 + w_1 * w_2 ** 6 * w_3 / 120960 + w_1 * w_2 ** 6 * w_4 / 120960 + w_1 * w_2 ** 6 * w_5 / 120960 + w_1 * w_2 ** 6 * w_6 / 120960 + w_1 * w_2 ** 6 * w_7 / 120960 - w_1 * w_2 ** 4 * w_3 ** 2 * w_4 / 34560 - w_1 * w_2 ** 4 * w_3 ** 2 * w_5 / 34560 - w_1 * w_2 ** 4 * w_3 ** 2 * w_6 / 34560 - w_1 * w_2 ** 4 * w_3 ** 2 * w_7 / 34560 - w_1 * w_2 ** 4 * w_3 * w_4 ** 2 / 34560 - w_1 * w_2 ** 4 * w_3 * w_4 * w_5 / 11520 - w_1 * w_2 ** 4 * w_3 * w_4 * w_6 / 11520 - w_1 * w_2 ** 4 * w_3 * w_4 * w_7 / 11520 - w_1 * w_2 ** 4 * w_3 * w_5 ** 2 / 34560 - w_1 * w_2 ** 4 * w_3 * w_5 * w_6 / 11520 - w_1 * w_2 ** 4 * w_3 * w_5 * w_7 / 11520 - w_1 * w_2 ** 4 * w_3 * w_6 ** 2 / 34560 - w_1 * w_2 ** 4 * w_3 * w_6 * w_7 / 11520 - w_1 * w_2 ** 4 * w_3 * w_7 ** 2 / 34560 - w_1 * w_2 ** 4 * w_4 ** 2 * w_5 / 34560 - w_1 * w_2 ** 4 * w_4 ** 2 * w_6 / 34560 - w_1 * w_2 ** 4 * w_4 ** 2 * w_7 / 34560 - w_1 * w_2 ** 4 * w_4 * w_5 ** 2 / 34560 - w_1 * w_2 ** 4 * w_4 * w_5 * w_6 / 11520 - w_1 * w_2 ** 4 * w_4 * w_5 * w_7 / 11520 - w_1 * w_2 ** 4 * w_4 * w_6 ** 2 / 34560 - w_1 * w_2 ** 4 * w_4 * w_6 * w_7 / 11520 - w_1 * w_2 ** 4 * w_4 * w_7 ** 2 / 34560 - w_1 * w_2 ** 4 * w_5 ** 2 * w_6 / 34560 - w_1 * w_2 ** 4 * w_5 ** 2 * w_7 / 34560 - w_1 * w_2 ** 4 * w_5 * w_6 ** 2 / 34560 - w_1 * w_2 ** 4 * w_5 * w_6 * w_7 / 11520 - w_1 * w_2 ** 4 * w_5 * w_7 ** 2 / 34560 - w_1 * w_2 ** 4 * w_6 ** 2 * w_7 / 34560 - w_1 * w_2 ** 4 * w_6 * w_7 ** 2 / 34560 - w_1 * w_2 ** 2 * w_3 ** 4 * w_4 / 34560 - w_1 * w_2 ** 2 * w_3 ** 4 * w_5 / 34560 - w_1 * w_2 ** 2 * w_3 ** 4 * w_6 / 34560 - w_1 * w_2 ** 2 * w_3 ** 4 * w_7 / 34560 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_7 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 / 2304 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_7 / 2304 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_6 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_6 * w_7 / 2304 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_7 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_7 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 * w_6 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 * w_6 * w_7 / 2304 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 * w_7 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_6 ** 2 * w_7 / 6912 + w_1 * w_2 ** 2 * w_3 ** 2 * w_6 * w_7 ** 2 / 6912 - w_1 * w_2 ** 2 * w_3 * w_4 ** 4 / 34560 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 / 2304 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_7 / 2304 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_6 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_6 * w_7 / 2304 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_7 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 / 2304 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_7 / 2304 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 * w_6 ** 2 / 2304 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 * w_6 * w_7 / 768 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 * w_7 ** 2 / 2304 + w_1 * w_2 ** 2 * w_3 * w_4 * w_6 ** 2 * w_7 / 2304 + w_1 * w_2 ** 2 * w_3 * w_4 * w_6 * w_7 ** 2 / 2304 - w_1 * w_2 ** 2 * w_3 * w_5 ** 4 / 34560 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 * w_6 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 * w_6 * w_7 / 2304 + w_1 * w_2 ** 2 * w_3 * w_5 ** 2 * w_7 ** 2 / 6912 + w_1 * w_2 ** 2 * w_3 * w_5 * w_6 ** 2 * w_7 / 2304 + w_1 * w_2 ** 2 * w_3 * w_5 * w_6 * w_7 ** 2 / 2304 - w_1 * w_2 ** 2 * w_3 * w_6 ** 4 / 34560 + w_1 * w_2 ** 2 * w_3 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 * w_2 ** 2 * w_3 * w_7 ** 4 / 34560 - w_1 * w_2 ** 2 * w_4 ** 4 * w_5 / 34560 - w_1 * w_2 ** 2 * w_4 ** 4 * w_6 / 34560 - w_1 * w_2 ** 2 * w_4 ** 4 * w_7 / 34560 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 6912 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_7 / 6912 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 6912 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 * w_6 * w_7 / 2304 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 * w_7 ** 2 / 6912 + w_1 * w_2 ** 2 * w_4 ** 2 * w_6 ** 2 * w_7 / 6912 + w_1 * w_2 ** 2 * w_4 ** 2 * w_6 * w_7 ** 2 / 6912 - w_1 * w_2 ** 2 * w_4 * w_5 ** 4 / 34560 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 6912 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 * w_6 * w_7 / 2304 + w_1 * w_2 ** 2 * w_4 * w_5 ** 2 * w_7 ** 2 / 6912 + w_1 * w_2 ** 2 * w_4 * w_5 * w_6 ** 2 * w_7 / 2304 + w_1 * w_2 ** 2 * w_4 * w_5 * w_6 * w_7 ** 2 / 2304 - w_1 * w_2 ** 2 * w_4 * w_6 ** 4 / 34560 + w_1 * w_2 ** 2 * w_4 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 * w_2 ** 2 * w_4 * w_7 ** 4 / 34560 - w_1 * w_2 ** 2 * w_5 ** 4 * w_6 / 34560 - w_1 * w_2 ** 2 * w_5 ** 4 * w_7 / 34560 + w_1 * w_2 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 6912 + w_1 * w_2 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 6912 - w_1 * w_2 ** 2 * w_5 * w_6 ** 4 / 34560 + w_1 * w_2 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 * w_2 ** 2 * w_5 * w_7 ** 4 / 34560 - w_1 * w_2 ** 2 * w_6 ** 4 * w_7 / 34560 - w_1 * w_2 ** 2 * w_6 * w_7 ** 4 / 34560 + w_1 * w_2 * w_3 ** 6 / 120960 - w_1 * w_2 * w_3 ** 4 * w_4 ** 2 / 34560 - w_1 * w_2 * w_3 ** 4 * w_4 * w_5 / 11520 - w_1 * w_2 * w_3 ** 4 * w_4 * w_6 / 11520 - w_1 * w_2 * w_3 ** 4 * w_4 * w_7 / 11520 - w_1 * w_2 * w_3 ** 4 * w_5 ** 2 / 34560 - w_1 * w_2 * w_3 ** 4 * w_5 * w_6 / 11520 - w_1 * w_2 * w_3 ** 4 * w_5 * w_7 / 11520 - w_1 * w_2 * w_3 ** 4 * w_6 ** 2 / 34560 - w_1 * w_2 * w_3 ** 4 * w_6 * w_7 / 11520 - w_1 * w_2 * w_3 ** 4 * w_7 ** 2 / 34560 - w_1 * w_2 * w_3 ** 2 * w_4 ** 4 / 34560 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 6912 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 2304 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_7 / 2304 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 6912 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_6 * w_7 / 2304 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_7 ** 2 / 6912 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 2304 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_7 / 2304 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 2304 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 * w_6 * w_7 / 768 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 * w_7 ** 2 / 2304 + w_1 * w_2 * w_3 ** 2 * w_4 * w_6 ** 2 * w_7 / 2304 + w_1 * w_2 * w_3 ** 2 * w_4 * w_6 * w_7 ** 2 / 2304 - w_1 * w_2 * w_3 ** 2 * w_5 ** 4 / 34560 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 6912 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 * w_6 * w_7 / 2304 + w_1 * w_2 * w_3 ** 2 * w_5 ** 2 * w_7 ** 2 / 6912 + w_1 * w_2 * w_3 ** 2 * w_5 * w_6 ** 2 * w_7 / 2304 + w_1 * w_2 * w_3 ** 2 * w_5 * w_6 * w_7 ** 2 / 2304 - w_1 * w_2 * w_3 ** 2 * w_6 ** 4 / 34560 + w_1 * w_2 * w_3 ** 2 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 * w_2 * w_3 ** 2 * w_7 ** 4 / 34560 - w_1 * w_2 * w_3 * w_4 ** 4 * w_5 / 11520 - w_1 * w_2 * w_3 * w_4 ** 4 * w_6 / 11520 - w_1 * w_2 * w_3 * w_4 ** 4 * w_7 / 11520 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 2304 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_7 / 2304 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 2304 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 * w_6 * w_7 / 768 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 * w_7 ** 2 / 2304 + w_1 * w_2 * w_3 * w_4 ** 2 * w_6 ** 2 * w_7 / 2304 + w_1 * w_2 * w_3 * w_4 ** 2 * w_6 * w_7 ** 2 / 2304 - w_1 * w_2 * w_3 * w_4 * w_5 ** 4 / 11520 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 2304 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 * w_6 * w_7 / 768 + w_1 * w_2 * w_3 * w_4 * w_5 ** 2 * w_7 ** 2 / 2304 + w_1 * w_2 * w_3 * w_4 * w_5 * w_6 ** 2 * w_7 / 768 + w_1 * w_2 * w_3 * w_4 * w_5 * w_6 * w_7 ** 2 / 768 - w_1 * w_2 * w_3 * w_4 * w_6 ** 4 / 11520 + w_1 * w_2 * w_3 * w_4 * w_6 ** 2 * w_7 ** 2 / 2304 - w_1 * w_2 * w_3 * w_4 * w_7 ** 4 / 11520 - w_1 * w_2 * w_3 * w_5 ** 4 * w_6 / 11520 - w_1 * w_2 * w_3 * w_5 ** 4 * w_7 / 11520 + w_1 * w_2 * w_3 * w_5 ** 2 * w_6 ** 2 * w_7 / 2304 + w_1 * w_2 * w_3 * w_5 ** 2 * w_6 * w_7 ** 2 / 2304 - w_1 * w_2 * w_3 * w_5 * w_6 ** 4 / 11520 + w_1 * w_2 * w_3 * w_5 * w_6 ** 2 * w_7 ** 2 / 2304 - w_1 * w_2 * w_3 * w_5 * w_7 ** 4 / 11520 - w_1 * w_2 * w_3 * w_6 ** 4 * w_7 / 11520 - w_1 * w_2 * w_3 * w_6 * w_7 ** 4 / 11520 + w_1 * w_2 * w_4 ** 6 / 120960 - w_1 * w_2 * w_4 ** 4 * w_5 ** 2 / 34560 - w_1 * w_2 * w_4 ** 4 * w_5 * w_6 / 11520 - w_1 * w_2 * w_4 ** 4 * w_5 * w_7 / 11520 - w_1 * w_2 * w_4 ** 4 * w_6 ** 2 / 34560 - w_1 * w_2 * w_4 ** 4 * w_6 * w_7 / 11520 - w_1 * w_2 * w_4 ** 4 * w_7 ** 2 / 34560 - w_1 * w_2 * w_4 ** 2 * w_5 ** 4 / 34560 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 6912 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 2304 + w_1 * w_2 * w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 6912 + w_1 * w_2 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 2304 + w_1 * w_2 * w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 2304 - w_1 * w_2 * w_4 ** 2 * w_6 ** 4 / 34560 + w_1 * w_2 * w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 * w_2 * w_4 ** 2 * w_7 ** 4 / 34560 - w_1 * w_2 * w_4 * w_5 ** 4 * w_6 / 11520 - w_1 * w_2 * w_4 * w_5 ** 4 * w_7 / 11520 + w_1 * w_2 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 2304 + w_1 * w_2 * w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 2304 - w_1 * w_2 * w_4 * w_5 * w_6 ** 4 / 11520 + w_1 * w_2 * w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 2304 - w_1 * w_2 * w_4 * w_5 * w_7 ** 4 / 11520 - w_1 * w_2 * w_4 * w_6 ** 4 * w_7 / 11520 - w_1 * w_2 * w_4 * w_6 * w_7 ** 4 / 11520 + w_1 * w_2 * w_5 ** 6 / 120960 - w_1 * w_2 * w_5 ** 4 * w_6 ** 2 / 34560 - w_1 * w_2 * w_5 ** 4 * w_6 * w_7 / 11520 - w_1 * w_2 * w_5 ** 4 * w_7 ** 2 / 34560 - w_1 * w_2 * w_5 ** 2 * w_6 ** 4 / 34560 + w_1 * w_2 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 * w_2 * w_5 ** 2 * w_7 ** 4 / 34560 - w_1 * w_2 * w_5 * w_6 ** 4 * w_7 / 11520 - w_1 * w_2 * w_5 * w_6 * w_7 ** 4 / 11520 + w_1 * w_2 * w_6 ** 6 / 120960 - w_1 * w_2 * w_6 ** 4 * w_7 ** 2 / 34560 - w_1 * w_2 * w_6 ** 2 * w_7 ** 4 / 34560 + w_1 * w_2 * w_7 ** 6 / 120960 + w_1 * w_3 ** 6 * w_4 / 120960 + w_1 * w_3 ** 6 * w_5 / 120960 + w_1 * w_3 ** 6 * w_6 / 120960 + w_1 * w_3 ** 6 * w_7 / 120960 - w_1 * w_3 ** 4 * w_4 ** 2 * w_5 / 34560 - w_1 * w_3 ** 4 * w_4 ** 2 * w_6 / 34560 - w_1 * w_3 ** 4 * w_4 ** 2 * w_7 / 34560 - w_1 * w_3 ** 4 * w_4 * w_5 ** 2 / 34560 - w_1 * w_3 ** 4 * w_4 * w_5 * w_6 / 11520 - w_1 * w_3 ** 4 * w_4 * w_5 * w_7 / 11520 - w_1 * w_3 ** 4 * w_4 * w_6 ** 2 / 34560 - w_1 * w_3 ** 4 * w_4 * w_6 * w_7 / 11520 - w_1 * w_3 ** 4 * w_4 * w_7 ** 2 / 34560 - w_1 * w_3 ** 4 * w_5 ** 2 * w_6 / 34560 - w_1 * w_3 ** 4 * w_5 ** 2 * w_7 / 34560 - w_1 * w_3 ** 4 * w_5 * w_6 ** 2 / 34560 - w_1 * w_3 ** 4 * w_5 * w_6 * w_7 / 11520 - w_1 * w_3 ** 4 * w_5 * w_7 ** 2 / 34560 - w_1 * w_3 ** 4 * w_6 ** 2 * w_7 / 34560 - w_1 * w_3 ** 4 * w_6 * w_7 ** 2 / 34560 - w_1 * w_3 ** 2 * w_4 ** 4 * w_5 / 34560 - w_1 * w_3 ** 2 * w_4 ** 4 * w_6 / 34560 - w_1 * w_3 ** 2 * w_4 ** 4 * w_7 / 34560 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 6912 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_7 / 6912 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 6912 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 * w_7 / 2304 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 * w_7 ** 2 / 6912 + w_1 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 * w_7 / 6912 + w_1 * w_3 ** 2 * w_4 ** 2 * w_6 * w_7 ** 2 / 6912 - w_1 * w_3 ** 2 * w_4 * w_5 ** 4 / 34560 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 6912 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 * w_7 / 2304 + w_1 * w_3 ** 2 * w_4 * w_5 ** 2 * w_7 ** 2 / 6912 + w_1 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 * w_7 / 2304 + w_1 * w_3 ** 2 * w_4 * w_5 * w_6 * w_7 ** 2 / 2304 - w_1 * w_3 ** 2 * w_4 * w_6 ** 4 / 34560 + w_1 * w_3 ** 2 * w_4 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 * w_3 ** 2 * w_4 * w_7 ** 4 / 34560 - w_1 * w_3 ** 2 * w_5 ** 4 * w_6 / 34560 - w_1 * w_3 ** 2 * w_5 ** 4 * w_7 / 34560 + w_1 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 6912 + w_1 * w_3 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 6912 - w_1 * w_3 ** 2 * w_5 * w_6 ** 4 / 34560 + w_1 * w_3 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 * w_3 ** 2 * w_5 * w_7 ** 4 / 34560 - w_1 * w_3 ** 2 * w_6 ** 4 * w_7 / 34560 - w_1 * w_3 ** 2 * w_6 * w_7 ** 4 / 34560 + w_1 * w_3 * w_4 ** 6 / 120960 - w_1 * w_3 * w_4 ** 4 * w_5 ** 2 / 34560 - w_1 * w_3 * w_4 ** 4 * w_5 * w_6 / 11520 - w_1 * w_3 * w_4 ** 4 * w_5 * w_7 / 11520 - w_1 * w_3 * w_4 ** 4 * w_6 ** 2 / 34560 - w_1 * w_3 * w_4 ** 4 * w_6 * w_7 / 11520 - w_1 * w_3 * w_4 ** 4 * w_7 ** 2 / 34560 - w_1 * w_3 * w_4 ** 2 * w_5 ** 4 / 34560 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 6912 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 2304 + w_1 * w_3 * w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 6912 + w_1 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 2304 + w_1 * w_3 * w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 2304 - w_1 * w_3 * w_4 ** 2 * w_6 ** 4 / 34560 + w_1 * w_3 * w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 * w_3 * w_4 ** 2 * w_7 ** 4 / 34560 - w_1 * w_3 * w_4 * w_5 ** 4 * w_6 / 11520 - w_1 * w_3 * w_4 * w_5 ** 4 * w_7 / 11520 + w_1 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 2304 + w_1 * w_3 * w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 2304 - w_1 * w_3 * w_4 * w_5 * w_6 ** 4 / 11520 + w_1 * w_3 * w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 2304 - w_1 * w_3 * w_4 * w_5 * w_7 ** 4 / 11520 - w_1 * w_3 * w_4 * w_6 ** 4 * w_7 / 11520 - w_1 * w_3 * w_4 * w_6 * w_7 ** 4 / 11520 + w_1 * w_3 * w_5 ** 6 / 120960 - w_1 * w_3 * w_5 ** 4 * w_6 ** 2 / 34560 - w_1 * w_3 * w_5 ** 4 * w_6 * w_7 / 11520 - w_1 * w_3 * w_5 ** 4 * w_7 ** 2 / 34560 - w_1 * w_3 * w_5 ** 2 * w_6 ** 4 / 34560 + w_1 * w_3 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 * w_3 * w_5 ** 2 * w_7 ** 4 / 34560 - w_1 * w_3 * w_5 * w_6 ** 4 * w_7 / 11520 - w_1 * w_3 * w_5 * w_6 * w_7 ** 4 / 11520 + w_1 * w_3 * w_6 ** 6 / 120960 - w_1 * w_3 * w_6 ** 4 * w_7 ** 2 / 34560 - w_1 * w_3 * w_6 ** 2 * w_7 ** 4 / 34560 + w_1 * w_3 * w_7 ** 6 / 120960 + w_1 * w_4 ** 6 * w_5 / 120960 + w_1 * w_4 ** 6 * w_6 / 120960 + w_1 * w_4 ** 6 * w_7 / 120960 - w_1 * w_4 ** 4 * w_5 ** 2 * w_6 / 34560 - w_1 * w_4 ** 4 * w_5 ** 2 * w_7 / 34560 - w_1 * w_4 ** 4 * w_5 * w_6 ** 2 / 34560 - w_1 * w_4 ** 4 * w_5 * w_6 * w_7 / 11520 - w_1 * w_4 ** 4 * w_5 * w_7 ** 2 / 34560 - w_1 * w_4 ** 4 * w_6 ** 2 * w_7 / 34560 - w_1 * w_4 ** 4 * w_6 * w_7 ** 2 / 34560 - w_1 * w_4 ** 2 * w_5 ** 4 * w_6 / 34560 - w_1 * w_4 ** 2 * w_5 ** 4 * w_7 / 34560 + w_1 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 6912 + w_1 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 6912 - w_1 * w_4 ** 2 * w_5 * w_6 ** 4 / 34560 + w_1 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 * w_4 ** 2 * w_5 * w_7 ** 4 / 34560 - w_1 * w_4 ** 2 * w_6 ** 4 * w_7 / 34560 - w_1 * w_4 ** 2 * w_6 * w_7 ** 4 / 34560 + w_1 * w_4 * w_5 ** 6 / 120960 - w_1 * w_4 * w_5 ** 4 * w_6 ** 2 / 34560 - w_1 * w_4 * w_5 ** 4 * w_6 * w_7 / 11520 - w_1 * w_4 * w_5 ** 4 * w_7 ** 2 / 34560 - w_1 * w_4 * w_5 ** 2 * w_6 ** 4 / 34560 + w_1 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 6912 - w_1 * w_4 * w_5 ** 2 * w_7 ** 4 / 34560 - w_1 * w_4 * w_5 * w_6 ** 4 * w_7 / 11520 - w_1 * w_4 * w_5 * w_6 * w_7 ** 4 / 11520 + w_1 * w_4 * w_6 ** 6 / 120960 - w_1 * w_4 * w_6 ** 4 * w_7 ** 2 / 34560 - w_1 * w_4 * w_6 ** 2 * w_7 ** 4 / 34560 + w_1 * w_4 * w_7 ** 6 / 120960 + w_1 * w_5 ** 6 * w_6 / 120960 + w_1 * w_5 ** 6 * w_7 / 120960 - w_1 * w_5 ** 4 * w_6 ** 2 * w_7 / 34560 - w_1 * w_5 ** 4 * w_6 * w_7 ** 2 / 34560 - w_1 * w_5 ** 2 * w_6 ** 4 * w_7 / 34560 - w_1 * w_5 ** 2 * w_6 * w_7 ** 4 / 34560 + w_1 * w_5 * w_6 ** 6 / 120960 - w_1 * w_5 * w_6 ** 4 * w_7 ** 2 / 34560 - w_1 * w_5 * w_6 ** 2 * w_7 ** 4 / 34560 + w_1 * w_5 * w_7 ** 6 / 120960 + w_1 * w_6 ** 6 * w_7 / 120960 + w_1 * w_6 * w_7 ** 6 / 120960 - w_2 ** 8 / 1209600 + w_2 ** 6 * w_3 ** 2 / 362880 + w_2 ** 6 * w_3 * w_4 / 120960 + w_2 ** 6 * w_3 * w_5 / 120960 + w_2 ** 6 * w_3 * w_6 / 120960 + w_2 ** 6 * w_3 * w_7 / 120960 + w_2 ** 6 * w_4 ** 2 / 362880 + w_2 ** 6 * w_4 * w_5 / 120960 + w_2 ** 6 * w_4 * w_6 / 120960 + w_2 ** 6 * w_4 * w_7 / 120960 + w_2 ** 6 * w_5 ** 2 / 362880 + w_2 ** 6 * w_5 * w_6 / 120960 + w_2 ** 6 * w_5 * w_7 / 120960 + w_2 ** 6 * w_6 ** 2 / 362880 + w_2 ** 6 * w_6 * w_7 / 120960 + w_2 ** 6 * w_7 ** 2 / 362880 + w_2 ** 4 * w_3 ** 4 / 518400 - w_2 ** 4 * w_3 ** 2 * w_4 ** 2 / 103680 - w_2 ** 4 * w_3 ** 2 * w_4 * w_5 / 34560 - w_2 ** 4 * w_3 ** 2 * w_4 * w_6 / 34560 - w_2 ** 4 * w_3 ** 2 * w_4 * w_7 / 34560 - w_2 ** 4 * w_3 ** 2 * w_5 ** 2 / 103680 - w_2 ** 4 * w_3 ** 2 * w_5 * w_6 / 34560 - w_2 ** 4 * w_3 ** 2 * w_5 * w_7 / 34560 - w_2 ** 4 * w_3 ** 2 * w_6 ** 2 / 103680 - w_2 ** 4 * w_3 ** 2 * w_6 * w_7 / 34560 - w_2 ** 4 * w_3 ** 2 * w_7 ** 2 / 103680 - w_2 ** 4 * w_3 * w_4 ** 2 * w_5 / 34560 - w_2 ** 4 * w_3 * w_4 ** 2 * w_6 / 34560 - w_2 ** 4 * w_3 * w_4 ** 2 * w_7 / 34560 - w_2 ** 4 * w_3 * w_4 * w_5 ** 2 / 34560 - w_2 ** 4 * w_3 * w_4 * w_5 * w_6 / 11520 - w_2 ** 4 * w_3 * w_4 * w_5 * w_7 / 11520 - w_2 ** 4 * w_3 * w_4 * w_6 ** 2 / 34560 - w_2 ** 4 * w_3 * w_4 * w_6 * w_7 / 11520 - w_2 ** 4 * w_3 * w_4 * w_7 ** 2 / 34560 - w_2 ** 4 * w_3 * w_5 ** 2 * w_6 / 34560 - w_2 ** 4 * w_3 * w_5 ** 2 * w_7 / 34560 - w_2 ** 4 * w_3 * w_5 * w_6 ** 2 / 34560 - w_2 ** 4 * w_3 * w_5 * w_6 * w_7 / 11520 - w_2 ** 4 * w_3 * w_5 * w_7 ** 2 / 34560 - w_2 ** 4 * w_3 * w_6 ** 2 * w_7 / 34560 - w_2 ** 4 * w_3 * w_6 * w_7 ** 2 / 34560 + w_2 ** 4 * w_4 ** 4 / 518400 - w_2 ** 4 * w_4 ** 2 * w_5 ** 2 / 103680 - w_2 ** 4 * w_4 ** 2 * w_5 * w_6 / 34560 - w_2 ** 4 * w_4 ** 2 * w_5 * w_7 / 34560 - w_2 ** 4 * w_4 ** 2 * w_6 ** 2 / 103680 - w_2 ** 4 * w_4 ** 2 * w_6 * w_7 / 34560 - w_2 ** 4 * w_4 ** 2 * w_7 ** 2 / 103680 - w_2 ** 4 * w_4 * w_5 ** 2 * w_6 / 34560 - w_2 ** 4 * w_4 * w_5 ** 2 * w_7 / 34560 - w_2 ** 4 * w_4 * w_5 * w_6 ** 2 / 34560 - w_2 ** 4 * w_4 * w_5 * w_6 * w_7 / 11520 - w_2 ** 4 * w_4 * w_5 * w_7 ** 2 / 34560 - w_2 ** 4 * w_4 * w_6 ** 2 * w_7 / 34560 - w_2 ** 4 * w_4 * w_6 * w_7 ** 2 / 34560 + w_2 ** 4 * w_5 ** 4 / 518400 - w_2 ** 4 * w_5 ** 2 * w_6 ** 2 / 103680 - w_2 ** 4 * w_5 ** 2 * w_6 * w_7 / 34560 - w_2 ** 4 * w_5 ** 2 * w_7 ** 2 / 103680 - w_2 ** 4 * w_5 * w_6 ** 2 * w_7 / 34560 - w_2 ** 4 * w_5 * w_6 * w_7 ** 2 / 34560 + w_2 ** 4 * w_6 ** 4 / 518400 - w_2 ** 4 * w_6 ** 2 * w_7 ** 2 / 103680 + w_2 ** 4 * w_7 ** 4 / 518400 + w_2 ** 2 * w_3 ** 6 / 362880 - w_2 ** 2 * w_3 ** 4 * w_4 ** 2 / 103680 - w_2 ** 2 * w_3 ** 4 * w_4 * w_5 / 34560 - w_2 ** 2 * w_3 ** 4 * w_4 * w_6 / 34560 - w_2 ** 2 * w_3 ** 4 * w_4 * w_7 / 34560 - w_2 ** 2 * w_3 ** 4 * w_5 ** 2 / 103680 - w_2 ** 2 * w_3 ** 4 * w_5 * w_6 / 34560 - w_2 ** 2 * w_3 ** 4 * w_5 * w_7 / 34560 - w_2 ** 2 * w_3 ** 4 * w_6 ** 2 / 103680 - w_2 ** 2 * w_3 ** 4 * w_6 * w_7 / 34560 - w_2 ** 2 * w_3 ** 4 * w_7 ** 2 / 103680 - w_2 ** 2 * w_3 ** 2 * w_4 ** 4 / 103680 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 20736 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 6912 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_7 / 6912 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 20736 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 * w_7 / 6912 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_7 ** 2 / 20736 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 6912 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_7 / 6912 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 6912 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 * w_7 / 2304 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_7 ** 2 / 6912 + w_2 ** 2 * w_3 ** 2 * w_4 * w_6 ** 2 * w_7 / 6912 + w_2 ** 2 * w_3 ** 2 * w_4 * w_6 * w_7 ** 2 / 6912 - w_2 ** 2 * w_3 ** 2 * w_5 ** 4 / 103680 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 20736 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 * w_7 / 6912 + w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_7 ** 2 / 20736 + w_2 ** 2 * w_3 ** 2 * w_5 * w_6 ** 2 * w_7 / 6912 + w_2 ** 2 * w_3 ** 2 * w_5 * w_6 * w_7 ** 2 / 6912 - w_2 ** 2 * w_3 ** 2 * w_6 ** 4 / 103680 + w_2 ** 2 * w_3 ** 2 * w_6 ** 2 * w_7 ** 2 / 20736 - w_2 ** 2 * w_3 ** 2 * w_7 ** 4 / 103680 - w_2 ** 2 * w_3 * w_4 ** 4 * w_5 / 34560 - w_2 ** 2 * w_3 * w_4 ** 4 * w_6 / 34560 - w_2 ** 2 * w_3 * w_4 ** 4 * w_7 / 34560 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 6912 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_7 / 6912 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 6912 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 * w_7 / 2304 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_7 ** 2 / 6912 + w_2 ** 2 * w_3 * w_4 ** 2 * w_6 ** 2 * w_7 / 6912 + w_2 ** 2 * w_3 * w_4 ** 2 * w_6 * w_7 ** 2 / 6912 - w_2 ** 2 * w_3 * w_4 * w_5 ** 4 / 34560 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 6912 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 * w_7 / 2304 + w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_7 ** 2 / 6912 + w_2 ** 2 * w_3 * w_4 * w_5 * w_6 ** 2 * w_7 / 2304 + w_2 ** 2 * w_3 * w_4 * w_5 * w_6 * w_7 ** 2 / 2304 - w_2 ** 2 * w_3 * w_4 * w_6 ** 4 / 34560 + w_2 ** 2 * w_3 * w_4 * w_6 ** 2 * w_7 ** 2 / 6912 - w_2 ** 2 * w_3 * w_4 * w_7 ** 4 / 34560 - w_2 ** 2 * w_3 * w_5 ** 4 * w_6 / 34560 - w_2 ** 2 * w_3 * w_5 ** 4 * w_7 / 34560 + w_2 ** 2 * w_3 * w_5 ** 2 * w_6 ** 2 * w_7 / 6912 + w_2 ** 2 * w_3 * w_5 ** 2 * w_6 * w_7 ** 2 / 6912 - w_2 ** 2 * w_3 * w_5 * w_6 ** 4 / 34560 + w_2 ** 2 * w_3 * w_5 * w_6 ** 2 * w_7 ** 2 / 6912 - w_2 ** 2 * w_3 * w_5 * w_7 ** 4 / 34560 - w_2 ** 2 * w_3 * w_6 ** 4 * w_7 / 34560 - w_2 ** 2 * w_3 * w_6 * w_7 ** 4 / 34560 + w_2 ** 2 * w_4 ** 6 / 362880 - w_2 ** 2 * w_4 ** 4 * w_5 ** 2 / 103680 - w_2 ** 2 * w_4 ** 4 * w_5 * w_6 / 34560 - w_2 ** 2 * w_4 ** 4 * w_5 * w_7 / 34560 - w_2 ** 2 * w_4 ** 4 * w_6 ** 2 / 103680 - w_2 ** 2 * w_4 ** 4 * w_6 * w_7 / 34560 - w_2 ** 2 * w_4 ** 4 * w_7 ** 2 / 103680 - w_2 ** 2 * w_4 ** 2 * w_5 ** 4 / 103680 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 20736 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 6912 + w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 20736 + w_2 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 6912 + w_2 ** 2 * w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 6912 - w_2 ** 2 * w_4 ** 2 * w_6 ** 4 / 103680 + w_2 ** 2 * w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 20736 - w_2 ** 2 * w_4 ** 2 * w_7 ** 4 / 103680 - w_2 ** 2 * w_4 * w_5 ** 4 * w_6 / 34560 - w_2 ** 2 * w_4 * w_5 ** 4 * w_7 / 34560 + w_2 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 6912 + w_2 ** 2 * w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 6912 - w_2 ** 2 * w_4 * w_5 * w_6 ** 4 / 34560 + w_2 ** 2 * w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 6912 - w_2 ** 2 * w_4 * w_5 * w_7 ** 4 / 34560 - w_2 ** 2 * w_4 * w_6 ** 4 * w_7 / 34560 - w_2 ** 2 * w_4 * w_6 * w_7 ** 4 / 34560 + w_2 ** 2 * w_5 ** 6 / 362880 - w_2 ** 2 * w_5 ** 4 * w_6 ** 2 / 103680 - w_2 ** 2 * w_5 ** 4 * w_6 * w_7 / 34560 - w_2 ** 2 * w_5 ** 4 * w_7 ** 2 / 103680 - w_2 ** 2 * w_5 ** 2 * w_6 ** 4 / 103680 + w_2 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 20736 - w_2 ** 2 * w_5 ** 2 * w_7 ** 4 / 103680 - w_2 ** 2 * w_5 * w_6 ** 4 * w_7 / 34560 - w_2 ** 2 * w_5 * w_6 * w_7 ** 4 / 34560 + w_2 ** 2 * w_6 ** 6 / 362880 - w_2 ** 2 * w_6 ** 4 * w_7 ** 2 / 103680 - w_2 ** 2 * w_6 ** 2 * w_7 ** 4 / 103680 + w_2 ** 2 * w_7 ** 6 / 362880 + w_2 * w_3 ** 6 * w_4 / 120960 + w_2 * w_3 ** 6 * w_5 / 120960 + w_2 * w_3 ** 6 * w_6 / 120960 + w_2 * w_3 ** 6 * w_7 / 120960 - w_2 * w_3 ** 4 * w_4 ** 2 * w_5 / 34560 - w_2 * w_3 ** 4 * w_4 ** 2 * w_6 / 34560 - w_2 * w_3 ** 4 * w_4 ** 2 * w_7 / 34560 - w_2 * w_3 ** 4 * w_4 * w_5 ** 2 / 34560 - w_2 * w_3 ** 4 * w_4 * w_5 * w_6 / 11520 - w_2 * w_3 ** 4 * w_4 * w_5 * w_7 / 11520 - w_2 * w_3 ** 4 * w_4 * w_6 ** 2 / 34560 - w_2 * w_3 ** 4 * w_4 * w_6 * w_7 / 11520 - w_2 * w_3 ** 4 * w_4 * w_7 ** 2 / 34560 - w_2 * w_3 ** 4 * w_5 ** 2 * w_6 / 34560 - w_2 * w_3 ** 4 * w_5 ** 2 * w_7 / 34560 - w_2 * w_3 ** 4 * w_5 * w_6 ** 2 / 34560 - w_2 * w_3 ** 4 * w_5 * w_6 * w_7 / 11520 - w_2 * w_3 ** 4 * w_5 * w_7 ** 2 / 34560 - w_2 * w_3 ** 4 * w_6 ** 2 * w_7 / 34560 - w_2 * w_3 ** 4 * w_6 * w_7 ** 2 / 34560 - w_2 * w_3 ** 2 * w_4 ** 4 * w_5 / 34560 - w_2 * w_3 ** 2 * w_4 ** 4 * w_6 / 34560 - w_2 * w_3 ** 2 * w_4 ** 4 * w_7 / 34560 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 6912 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_7 / 6912 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 6912 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 * w_7 / 2304 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_7 ** 2 / 6912 + w_2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 * w_7 / 6912 + w_2 * w_3 ** 2 * w_4 ** 2 * w_6 * w_7 ** 2 / 6912 - w_2 * w_3 ** 2 * w_4 * w_5 ** 4 / 34560 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 6912 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 * w_7 / 2304 + w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_7 ** 2 / 6912 + w_2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 * w_7 / 2304 + w_2 * w_3 ** 2 * w_4 * w_5 * w_6 * w_7 ** 2 / 2304 - w_2 * w_3 ** 2 * w_4 * w_6 ** 4 / 34560 + w_2 * w_3 ** 2 * w_4 * w_6 ** 2 * w_7 ** 2 / 6912 - w_2 * w_3 ** 2 * w_4 * w_7 ** 4 / 34560 - w_2 * w_3 ** 2 * w_5 ** 4 * w_6 / 34560 - w_2 * w_3 ** 2 * w_5 ** 4 * w_7 / 34560 + w_2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 6912 + w_2 * w_3 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 6912 - w_2 * w_3 ** 2 * w_5 * w_6 ** 4 / 34560 + w_2 * w_3 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 6912 - w_2 * w_3 ** 2 * w_5 * w_7 ** 4 / 34560 - w_2 * w_3 ** 2 * w_6 ** 4 * w_7 / 34560 - w_2 * w_3 ** 2 * w_6 * w_7 ** 4 / 34560 + w_2 * w_3 * w_4 ** 6 / 120960 - w_2 * w_3 * w_4 ** 4 * w_5 ** 2 / 34560 - w_2 * w_3 * w_4 ** 4 * w_5 * w_6 / 11520 - w_2 * w_3 * w_4 ** 4 * w_5 * w_7 / 11520 - w_2 * w_3 * w_4 ** 4 * w_6 ** 2 / 34560 - w_2 * w_3 * w_4 ** 4 * w_6 * w_7 / 11520 - w_2 * w_3 * w_4 ** 4 * w_7 ** 2 / 34560 - w_2 * w_3 * w_4 ** 2 * w_5 ** 4 / 34560 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 6912 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 2304 + w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 6912 + w_2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 2304 + w_2 * w_3 * w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 2304 - w_2 * w_3 * w_4 ** 2 * w_6 ** 4 / 34560 + w_2 * w_3 * w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 6912 - w_2 * w_3 * w_4 ** 2 * w_7 ** 4 / 34560 - w_2 * w_3 * w_4 * w_5 ** 4 * w_6 / 11520 - w_2 * w_3 * w_4 * w_5 ** 4 * w_7 / 11520 + w_2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 2304 + w_2 * w_3 * w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 2304 - w_2 * w_3 * w_4 * w_5 * w_6 ** 4 / 11520 + w_2 * w_3 * w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 2304 - w_2 * w_3 * w_4 * w_5 * w_7 ** 4 / 11520 - w_2 * w_3 * w_4 * w_6 ** 4 * w_7 / 11520 - w_2 * w_3 * w_4 * w_6 * w_7 ** 4 / 11520 + w_2 * w_3 * w_5 ** 6 / 120960 - w_2 * w_3 * w_5 ** 4 * w_6 ** 2 / 34560 - w_2 * w_3 * w_5 ** 4 * w_6 * w_7 / 11520 - w_2 * w_3 * w_5 ** 4 * w_7 ** 2 / 34560 - w_2 * w_3 * w_5 ** 2 * w_6 ** 4 / 34560 + w_2 * w_3 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 6912 - w_2 * w_3 * w_5 ** 2 * w_7 ** 4 / 34560 - w_2 * w_3 * w_5 * w_6 ** 4 * w_7 / 11520 - w_2 * w_3 * w_5 * w_6 * w_7 ** 4 / 11520 + w_2 * w_3 * w_6 ** 6 / 120960 - w_2 * w_3 * w_6 ** 4 * w_7 ** 2 / 34560 - w_2 * w_3 * w_6 ** 2 * w_7 ** 4 / 34560 + w_2 * w_3 * w_7 ** 6 / 120960 + w_2 * w_4 ** 6 * w_5 / 120960 + w_2 * w_4 ** 6 * w_6 / 120960 + w_2 * w_4 ** 6 * w_7 / 120960 - w_2 * w_4 ** 4 * w_5 ** 2 * w_6 / 34560 - w_2 * w_4 ** 4 * w_5 ** 2 * w_7 / 34560 - w_2 * w_4 ** 4 * w_5 * w_6 ** 2 / 34560 - w_2 * w_4 ** 4 * w_5 * w_6 * w_7 / 11520 - w_2 * w_4 ** 4 * w_5 * w_7 ** 2 / 34560 - w_2 * w_4 ** 4 * w_6 ** 2 * w_7 / 34560 - w_2 * w_4 ** 4 * w_6 * w_7 ** 2 / 34560 - w_2 * w_4 ** 2 * w_5 ** 4 * w_6 / 34560 - w_2 * w_4 ** 2 * w_5 ** 4 * w_7 / 34560 + w_2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 6912 + w_2 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 6912 - w_2 * w_4 ** 2 * w_5 * w_6 ** 4 / 34560 + w_2 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 6912 - w_2 * w_4 ** 2 * w_5 * w_7 ** 4 / 34560 - w_2 * w_4 ** 2 * w_6 ** 4 * w_7 / 34560 - w_2 * w_4 ** 2 * w_6 * w_7 ** 4 / 34560 + w_2 * w_4 * w_5 ** 6 / 120960 - w_2 * w_4 * w_5 ** 4 * w_6 ** 2 / 34560 - w_2 * w_4 * w_5 ** 4 * w_6 * w_7 / 11520 - w_2 * w_4 * w_5 ** 4 * w_7 ** 2 / 34560 - w_2 * w_4 * w_5 ** 2 * w_6 ** 4 / 34560 + w_2 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 6912 - w_2 * w_4 * w_5 ** 2 * w_7 ** 4 / 34560 - w_2 * w_4 * w_5 * w_6 ** 4 * w_7 / 11520 - w_2 * w_4 * w_5 * w_6 * w_7 ** 4 / 11520 + w_2 * w_4 * w_6 ** 6 / 120960 - w_2 * w_4 * w_6 ** 4 * w_7 ** 2 / 34560 - w_2 * w_4 * w_6 ** 2 * w_7 ** 4 / 34560 + w_2 * w_4 * w_7 ** 6 / 120960 + w_2 * w_5 ** 6 * w_6 / 120960 + w_2 * w_5 ** 6 * w_7 / 120960 - w_2 * w_5 ** 4 * w_6 ** 2 * w_7 / 34560 - w_2 * w_5 ** 4 * w_6 * w_7 ** 2 / 34560 - w_2 * w_5 ** 2 * w_6 ** 4 * w_7 / 34560 - w_2 * w_5 ** 2 * w_6 * w_7 ** 4 / 34560 + w_2 * w_5 * w_6 ** 6 / 120960 - w_2 * w_5 * w_6 ** 4 * w_7 ** 2 / 34560 - w_2 * w_5 * w_6 ** 2 * w_7 ** 4 / 34560 + w_2 * w_5 * w_7 ** 6 / 120960 + w_2 * w_6 ** 6 * w_7 / 120960 + w_2 * w_6 * w_7 ** 6 / 120960 - w_3 ** 8 / 1209600 + w_3 ** 6 * w_4 ** 2 / 362880 + w_3 ** 6 * w_4 * w_5 / 120960 + w_3 ** 6 * w_4 * w_6 / 120960 + w_3 ** 6 * w_4 * w_7 / 120960 + w_3 ** 6 * w_5 ** 2 / 362880 + w_3 ** 6 * w_5 * w_6 / 120960 + w_3 ** 6 * w_5 * w_7 / 120960 + w_3 ** 6 * w_6 ** 2 / 362880 + w_3 ** 6 * w_6 * w_7 / 120960 + w_3 ** 6 * w_7 ** 2 / 362880 + w_3 ** 4 * w_4 ** 4 / 518400 - w_3 ** 4 * w_4 ** 2 * w_5 ** 2 / 103680 - w_3 ** 4 * w_4 ** 2 * w_5 * w_6 / 34560 - w_3 ** 4 * w_4 ** 2 * w_5 * w_7 / 34560 - w_3 ** 4 * w_4 ** 2 * w_6 ** 2 / 103680 - w_3 ** 4 * w_4 ** 2 * w_6 * w_7 / 34560 - w_3 ** 4 * w_4 ** 2 * w_7 ** 2 / 103680 - w_3 ** 4 * w_4 * w_5 ** 2 * w_6 / 34560 - w_3 ** 4 * w_4 * w_5 ** 2 * w_7 / 34560 - w_3 ** 4 * w_4 * w_5 * w_6 ** 2 / 34560 - w_3 ** 4 * w_4 * w_5 * w_6 * w_7 / 11520 - w_3 ** 4 * w_4 * w_5 * w_7 ** 2 / 34560 - w_3 ** 4 * w_4 * w_6 ** 2 * w_7 / 34560 - w_3 ** 4 * w_4 * w_6 * w_7 ** 2 / 34560 + w_3 ** 4 * w_5 ** 4 / 518400 - w_3 ** 4 * w_5 ** 2 * w_6 ** 2 / 103680 - w_3 ** 4 * w_5 ** 2 * w_6 * w_7 / 34560 - w_3 ** 4 * w_5 ** 2 * w_7 ** 2 / 103680 - w_3 ** 4 * w_5 * w_6 ** 2 * w_7 / 34560 - w_3 ** 4 * w_5 * w_6 * w_7 ** 2 / 34560 + w_3 ** 4 * w_6 ** 4 / 518400 - w_3 ** 4 * w_6 ** 2 * w_7 ** 2 / 103680 + w_3 ** 4 * w_7 ** 4 / 518400 + w_3 ** 2 * w_4 ** 6 / 362880 - w_3 ** 2 * w_4 ** 4 * w_5 ** 2 / 103680 - w_3 ** 2 * w_4 ** 4 * w_5 * w_6 / 34560 - w_3 ** 2 * w_4 ** 4 * w_5 * w_7 / 34560 - w_3 ** 2 * w_4 ** 4 * w_6 ** 2 / 103680 - w_3 ** 2 * w_4 ** 4 * w_6 * w_7 / 34560 - w_3 ** 2 * w_4 ** 4 * w_7 ** 2 / 103680 - w_3 ** 2 * w_4 ** 2 * w_5 ** 4 / 103680 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 20736 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 / 6912 + w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_7 ** 2 / 20736 + w_3 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 / 6912 + w_3 ** 2 * w_4 ** 2 * w_5 * w_6 * w_7 ** 2 / 6912 - w_3 ** 2 * w_4 ** 2 * w_6 ** 4 / 103680 + w_3 ** 2 * w_4 ** 2 * w_6 ** 2 * w_7 ** 2 / 20736 - w_3 ** 2 * w_4 ** 2 * w_7 ** 4 / 103680 - w_3 ** 2 * w_4 * w_5 ** 4 * w_6 / 34560 - w_3 ** 2 * w_4 * w_5 ** 4 * w_7 / 34560 + w_3 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 / 6912 + w_3 ** 2 * w_4 * w_5 ** 2 * w_6 * w_7 ** 2 / 6912 - w_3 ** 2 * w_4 * w_5 * w_6 ** 4 / 34560 + w_3 ** 2 * w_4 * w_5 * w_6 ** 2 * w_7 ** 2 / 6912 - w_3 ** 2 * w_4 * w_5 * w_7 ** 4 / 34560 - w_3 ** 2 * w_4 * w_6 ** 4 * w_7 / 34560 - w_3 ** 2 * w_4 * w_6 * w_7 ** 4 / 34560 + w_3 ** 2 * w_5 ** 6 / 362880 - w_3 ** 2 * w_5 ** 4 * w_6 ** 2 / 103680 - w_3 ** 2 * w_5 ** 4 * w_6 * w_7 / 34560 - w_3 ** 2 * w_5 ** 4 * w_7 ** 2 / 103680 - w_3 ** 2 * w_5 ** 2 * w_6 ** 4 / 103680 + w_3 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 20736 - w_3 ** 2 * w_5 ** 2 * w_7 ** 4 / 103680 - w_3 ** 2 * w_5 * w_6 ** 4 * w_7 / 34560 - w_3 ** 2 * w_5 * w_6 * w_7 ** 4 / 34560 + w_3 ** 2 * w_6 ** 6 / 362880 - w_3 ** 2 * w_6 ** 4 * w_7 ** 2 / 103680 - w_3 ** 2 * w_6 ** 2 * w_7 ** 4 / 103680 + w_3 ** 2 * w_7 ** 6 / 362880 + w_3 * w_4 ** 6 * w_5 / 120960 + w_3 * w_4 ** 6 * w_6 / 120960 + w_3 * w_4 ** 6 * w_7 / 120960 - w_3 * w_4 ** 4 * w_5 ** 2 * w_6 / 34560 - w_3 * w_4 ** 4 * w_5 ** 2 * w_7 / 34560 - w_3 * w_4 ** 4 * w_5 * w_6 ** 2 / 34560 - w_3 * w_4 ** 4 * w_5 * w_6 * w_7 / 11520 - w_3 * w_4 ** 4 * w_5 * w_7 ** 2 / 34560 - w_3 * w_4 ** 4 * w_6 ** 2 * w_7 / 34560 - w_3 * w_4 ** 4 * w_6 * w_7 ** 2 / 34560 - w_3 * w_4 ** 2 * w_5 ** 4 * w_6 / 34560 - w_3 * w_4 ** 2 * w_5 ** 4 * w_7 / 34560 + w_3 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 / 6912 + w_3 * w_4 ** 2 * w_5 ** 2 * w_6 * w_7 ** 2 / 6912 - w_3 * w_4 ** 2 * w_5 * w_6 ** 4 / 34560 + w_3 * w_4 ** 2 * w_5 * w_6 ** 2 * w_7 ** 2 / 6912 - w_3 * w_4 ** 2 * w_5 * w_7 ** 4 / 34560 - w_3 * w_4 ** 2 * w_6 ** 4 * w_7 / 34560 - w_3 * w_4 ** 2 * w_6 * w_7 ** 4 / 34560 + w_3 * w_4 * w_5 ** 6 / 120960 - w_3 * w_4 * w_5 ** 4 * w_6 ** 2 / 34560 - w_3 * w_4 * w_5 ** 4 * w_6 * w_7 / 11520 - w_3 * w_4 * w_5 ** 4 * w_7 ** 2 / 34560 - w_3 * w_4 * w_5 ** 2 * w_6 ** 4 / 34560 + w_3 * w_4 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 6912 - w_3 * w_4 * w_5 ** 2 * w_7 ** 4 / 34560 - w_3 * w_4 * w_5 * w_6 ** 4 * w_7 / 11520 - w_3 * w_4 * w_5 * w_6 * w_7 ** 4 / 11520 + w_3 * w_4 * w_6 ** 6 / 120960 - w_3 * w_4 * w_6 ** 4 * w_7 ** 2 / 34560 - w_3 * w_4 * w_6 ** 2 * w_7 ** 4 / 34560 + w_3 * w_4 * w_7 ** 6 / 120960 + w_3 * w_5 ** 6 * w_6 / 120960 + w_3 * w_5 ** 6 * w_7 / 120960 - w_3 * w_5 ** 4 * w_6 ** 2 * w_7 / 34560 - w_3 * w_5 ** 4 * w_6 * w_7 ** 2 / 34560 - w_3 * w_5 ** 2 * w_6 ** 4 * w_7 / 34560 - w_3 * w_5 ** 2 * w_6 * w_7 ** 4 / 34560 + w_3 * w_5 * w_6 ** 6 / 120960 - w_3 * w_5 * w_6 ** 4 * w_7 ** 2 / 34560 - w_3 * w_5 * w_6 ** 2 * w_7 ** 4 / 34560 + w_3 * w_5 * w_7 ** 6 / 120960 + w_3 * w_6 ** 6 * w_7 / 120960 + w_3 * w_6 * w_7 ** 6 / 120960 - w_4 ** 8 / 1209600 + w_4 ** 6 * w_5 ** 2 / 362880 + w_4 ** 6 * w_5 * w_6 / 120960 + w_4 ** 6 * w_5 * w_7 / 120960 + w_4 ** 6 * w_6 ** 2 / 362880 + w_4 ** 6 * w_6 * w_7 / 120960 + w_4 ** 6 * w_7 ** 2 / 362880 + w_4 ** 4 * w_5 ** 4 / 518400 - w_4 ** 4 * w_5 ** 2 * w_6 ** 2 / 103680 - w_4 ** 4 * w_5 ** 2 * w_6 * w_7 / 34560 - w_4 ** 4 * w_5 ** 2 * w_7 ** 2 / 103680 - w_4 ** 4 * w_5 * w_6 ** 2 * w_7 / 34560 - w_4 ** 4 * w_5 * w_6 * w_7 ** 2 / 34560 + w_4 ** 4 * w_6 ** 4 / 518400 - w_4 ** 4 * w_6 ** 2 * w_7 ** 2 / 103680 + w_4 ** 4 * w_7 ** 4 / 518400 + w_4 ** 2 * w_5 ** 6 / 362880 - w_4 ** 2 * w_5 ** 4 * w_6 ** 2 / 103680 - w_4 ** 2 * w_5 ** 4 * w_6 * w_7 / 34560 - w_4 ** 2 * w_5 ** 4 * w_7 ** 2 / 103680 - w_4 ** 2 * w_5 ** 2 * w_6 ** 4 / 103680 + w_4 ** 2 * w_5 ** 2 * w_6 ** 2 * w_7 ** 2 / 20736 - w_4 ** 2 * w_5 ** 2 * w_7 ** 4 / 103680 - w_4 ** 2 * w_5 * w_6 ** 4 * w_7 / 34560 - w_4 ** 2 * w_5 * w_6 * w_7 ** 4 / 34560 + w_4 ** 2 * w_6 ** 6 / 362880 - w_4 ** 2 * w_6 ** 4 * w_7 ** 2 / 103680 - w_4 ** 2 * w_6 ** 2 * w_7 ** 4 / 103680 + w_4 ** 2 * w_7 ** 6 / 362880 + w_4 * w_5 ** 6 * w_6 / 120960 + w_4 * w_5 ** 6 * w_7 / 120960 - w_4 * w_5 ** 4 * w_6 ** 2 * w_7 / 34560 - w_4 * w_5 ** 4 * w_6 * w_7 ** 2 / 34560 - w_4 * w_5 ** 2 * w_6 ** 4 * w_7 / 34560 - w_4 * w_5 ** 2 * w_6 * w_7 ** 4 / 34560 + w_4 * w_5 * w_6 ** 6 / 120960 - w_4 * w_5 * w_6 ** 4 * w_7 ** 2 / 34560 - w_4 * w_5 * w_6 ** 2 * w_7 ** 4 / 34560 + w_4 * w_5 * w_7 ** 6 / 120960 + w_4 * w_6 ** 6 * w_7 / 120960 + w_4 * w_6 * w_7 ** 6 / 120960 - w_5 ** 8 / 1209600 + w_5 ** 6 * w_6 ** 2 / 362880 + w_5 ** 6 * w_6 * w_7 / 120960 + w_5 ** 6 * w_7 ** 2 / 362880 + w_5 ** 4 * w_6 ** 4 / 518400 - w_5 ** 4 * w_6 ** 2 * w_7 ** 2 / 103680 + w_5 ** 4 * w_7 ** 4 / 518400 + w_5 ** 2 * w_6 ** 6 / 362880 - w_5 ** 2 * w_6 ** 4 * w_7 ** 2 / 103680 - w_5 ** 2 * w_6 ** 2 * w_7 ** 4 / 103680 + w_5 ** 2 * w_7 ** 6 / 362880 + w_5 * w_6 ** 6 * w_7 / 120960 + w_5 * w_6 * w_7 ** 6 / 120960 - w_6 ** 8 / 1209600 + w_6 ** 6 * w_7 ** 2 / 362880 + w_6 ** 4 * w_7 ** 4 / 518400 + w_6 ** 2 * w_7 ** 6 / 362880 - w_7 ** 8 / 1209600
-    if s == 9 and ln == 6:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        w_6 = sym.Symbol("w_6")
-        return -w_1 ** 8 * w_2 / 2419200 - w_1 ** 8 * w_3 / 2419200 - w_1 ** 8 * w_4 / 2419200 - w_1 ** 8 * w_5 / 2419200 - w_1 ** 8 * w_6 / 2419200 + w_1 ** 6 * w_2 ** 2 * w_3 / 725760 + w_1 ** 6 * w_2 ** 2 * w_4 / 725760 + w_1 ** 6 * w_2 ** 2 * w_5 / 725760 + w_1 ** 6 * w_2 ** 2 * w_6 / 725760 + w_1 ** 6 * w_2 * w_3 ** 2 / 725760 + w_1 ** 6 * w_2 * w_3 * w_4 / 241920 + w_1 ** 6 * w_2 * w_3 * w_5 / 241920 + w_1 ** 6 * w_2 * w_3 * w_6 / 241920 + w_1 ** 6 * w_2 * w_4 ** 2 / 725760 + w_1 ** 6 * w_2 * w_4 * w_5 / 241920 + w_1 ** 6 * w_2 * w_4 * w_6 / 241920 + w_1 ** 6 * w_2 * w_5 ** 2 / 725760 + w_1 ** 6 * w_2 * w_5 * w_6 / 241920 + w_1 ** 6 * w_2 * w_6 ** 2 / 725760 + w_1 ** 6 * w_3 ** 2 * w_4 / 725760 + w_1 ** 6 * w_3 ** 2 * w_5 / 725760 + w_1 ** 6 * w_3 ** 2 * w_6 / 725760 + w_1 ** 6 * w_3 * w_4 ** 2 / 725760 + w_1 ** 6 * w_3 * w_4 * w_5 / 241920 + w_1 ** 6 * w_3 * w_4 * w_6 / 241920 + w_1 ** 6 * w_3 * w_5 ** 2 / 725760 + w_1 ** 6 * w_3 * w_5 * w_6 / 241920 + w_1 ** 6 * w_3 * w_6 ** 2 / 725760 + w_1 ** 6 * w_4 ** 2 * w_5 / 725760 + w_1 ** 6 * w_4 ** 2 * w_6 / 725760 + w_1 ** 6 * w_4 * w_5 ** 2 / 725760 + w_1 ** 6 * w_4 * w_5 * w_6 / 241920 + w_1 ** 6 * w_4 * w_6 ** 2 / 725760 + w_1 ** 6 * w_5 ** 2 * w_6 / 725760 + w_1 ** 6 * w_5 * w_6 ** 2 / 725760 + w_1 ** 4 * w_2 ** 4 * w_3 / 1036800 + w_1 ** 4 * w_2 ** 4 * w_4 / 1036800 + w_1 ** 4 * w_2 ** 4 * w_5 / 1036800 + w_1 ** 4 * w_2 ** 4 * w_6 / 1036800 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 * w_4 / 207360 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 * w_5 / 207360 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 * w_6 / 207360 - w_1 ** 4 * w_2 ** 2 * w_3 * w_4 ** 2 / 207360 - w_1 ** 4 * w_2 ** 2 * w_3 * w_4 * w_5 / 69120 - w_1 ** 4 * w_2 ** 2 * w_3 * w_4 * w_6 / 69120 - w_1 ** 4 * w_2 ** 2 * w_3 * w_5 ** 2 / 207360 - w_1 ** 4 * w_2 ** 2 * w_3 * w_5 * w_6 / 69120 - w_1 ** 4 * w_2 ** 2 * w_3 * w_6 ** 2 / 207360 - w_1 ** 4 * w_2 ** 2 * w_4 ** 2 * w_5 / 207360 - w_1 ** 4 * w_2 ** 2 * w_4 ** 2 * w_6 / 207360 - w_1 ** 4 * w_2 ** 2 * w_4 * w_5 ** 2 / 207360 - w_1 ** 4 * w_2 ** 2 * w_4 * w_5 * w_6 / 69120 - w_1 ** 4 * w_2 ** 2 * w_4 * w_6 ** 2 / 207360 - w_1 ** 4 * w_2 ** 2 * w_5 ** 2 * w_6 / 207360 - w_1 ** 4 * w_2 ** 2 * w_5 * w_6 ** 2 / 207360 + w_1 ** 4 * w_2 * w_3 ** 4 / 1036800 - w_1 ** 4 * w_2 * w_3 ** 2 * w_4 ** 2 / 207360 - w_1 ** 4 * w_2 * w_3 ** 2 * w_4 * w_5 / 69120 - w_1 ** 4 * w_2 * w_3 ** 2 * w_4 * w_6 / 69120 - w_1 ** 4 * w_2 * w_3 ** 2 * w_5 ** 2 / 207360 - w_1 ** 4 * w_2 * w_3 ** 2 * w_5 * w_6 / 69120 - w_1 ** 4 * w_2 * w_3 ** 2 * w_6 ** 2 / 207360 - w_1 ** 4 * w_2 * w_3 * w_4 ** 2 * w_5 / 69120 - w_1 ** 4 * w_2 * w_3 * w_4 ** 2 * w_6 / 69120 - w_1 ** 4 * w_2 * w_3 * w_4 * w_5 ** 2 / 69120 - w_1 ** 4 * w_2 * w_3 * w_4 * w_5 * w_6 / 23040 - w_1 ** 4 * w_2 * w_3 * w_4 * w_6 ** 2 / 69120 - w_1 ** 4 * w_2 * w_3 * w_5 ** 2 * w_6 / 69120 - w_1 ** 4 * w_2 * w_3 * w_5 * w_6 ** 2 / 69120 + w_1 ** 4 * w_2 * w_4 ** 4 / 1036800 - w_1 ** 4 * w_2 * w_4 ** 2 * w_5 ** 2 / 207360 - w_1 ** 4 * w_2 * w_4 ** 2 * w_5 * w_6 / 69120 - w_1 ** 4 * w_2 * w_4 ** 2 * w_6 ** 2 / 207360 - w_1 ** 4 * w_2 * w_4 * w_5 ** 2 * w_6 / 69120 - w_1 ** 4 * w_2 * w_4 * w_5 * w_6 ** 2 / 69120 + w_1 ** 4 * w_2 * w_5 ** 4 / 1036800 - w_1 ** 4 * w_2 * w_5 ** 2 * w_6 ** 2 / 207360 + w_1 ** 4 * w_2 * w_6 ** 4 / 1036800 + w_1 ** 4 * w_3 ** 4 * w_4 / 1036800 + w_1 ** 4 * w_3 ** 4 * w_5 / 1036800 + w_1 ** 4 * w_3 ** 4 * w_6 / 1036800 - w_1 ** 4 * w_3 ** 2 * w_4 ** 2 * w_5 / 207360 - w_1 ** 4 * w_3 ** 2 * w_4 ** 2 * w_6 / 207360 - w_1 ** 4 * w_3 ** 2 * w_4 * w_5 ** 2 / 207360 - w_1 ** 4 * w_3 ** 2 * w_4 * w_5 * w_6 / 69120 - w_1 ** 4 * w_3 ** 2 * w_4 * w_6 ** 2 / 207360 - w_1 ** 4 * w_3 ** 2 * w_5 ** 2 * w_6 / 207360 - w_1 ** 4 * w_3 ** 2 * w_5 * w_6 ** 2 / 207360 + w_1 ** 4 * w_3 * w_4 ** 4 / 1036800 - w_1 ** 4 * w_3 * w_4 ** 2 * w_5 ** 2 / 207360 - w_1 ** 4 * w_3 * w_4 ** 2 * w_5 * w_6 / 69120 - w_1 ** 4 * w_3 * w_4 ** 2 * w_6 ** 2 / 207360 - w_1 ** 4 * w_3 * w_4 * w_5 ** 2 * w_6 / 69120 - w_1 ** 4 * w_3 * w_4 * w_5 * w_6 ** 2 / 69120 + w_1 ** 4 * w_3 * w_5 ** 4 / 1036800 - w_1 ** 4 * w_3 * w_5 ** 2 * w_6 ** 2 / 207360 + w_1 ** 4 * w_3 * w_6 ** 4 / 1036800 + w_1 ** 4 * w_4 ** 4 * w_5 / 1036800 + w_1 ** 4 * w_4 ** 4 * w_6 / 1036800 - w_1 ** 4 * w_4 ** 2 * w_5 ** 2 * w_6 / 207360 - w_1 ** 4 * w_4 ** 2 * w_5 * w_6 ** 2 / 207360 + w_1 ** 4 * w_4 * w_5 ** 4 / 1036800 - w_1 ** 4 * w_4 * w_5 ** 2 * w_6 ** 2 / 207360 + w_1 ** 4 * w_4 * w_6 ** 4 / 1036800 + w_1 ** 4 * w_5 ** 4 * w_6 / 1036800 + w_1 ** 4 * w_5 * w_6 ** 4 / 1036800 + w_1 ** 2 * w_2 ** 6 * w_3 / 725760 + w_1 ** 2 * w_2 ** 6 * w_4 / 725760 + w_1 ** 2 * w_2 ** 6 * w_5 / 725760 + w_1 ** 2 * w_2 ** 6 * w_6 / 725760 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 * w_4 / 207360 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 * w_5 / 207360 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 * w_6 / 207360 - w_1 ** 2 * w_2 ** 4 * w_3 * w_4 ** 2 / 207360 - w_1 ** 2 * w_2 ** 4 * w_3 * w_4 * w_5 / 69120 - w_1 ** 2 * w_2 ** 4 * w_3 * w_4 * w_6 / 69120 - w_1 ** 2 * w_2 ** 4 * w_3 * w_5 ** 2 / 207360 - w_1 ** 2 * w_2 ** 4 * w_3 * w_5 * w_6 / 69120 - w_1 ** 2 * w_2 ** 4 * w_3 * w_6 ** 2 / 207360 - w_1 ** 2 * w_2 ** 4 * w_4 ** 2 * w_5 / 207360 - w_1 ** 2 * w_2 ** 4 * w_4 ** 2 * w_6 / 207360 - w_1 ** 2 * w_2 ** 4 * w_4 * w_5 ** 2 / 207360 - w_1 ** 2 * w_2 ** 4 * w_4 * w_5 * w_6 / 69120 - w_1 ** 2 * w_2 ** 4 * w_4 * w_6 ** 2 / 207360 - w_1 ** 2 * w_2 ** 4 * w_5 ** 2 * w_6 / 207360 - w_1 ** 2 * w_2 ** 4 * w_5 * w_6 ** 2 / 207360 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 * w_4 / 207360 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 * w_5 / 207360 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 * w_6 / 207360 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 / 41472 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 / 41472 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 / 41472 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 / 13824 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 * w_6 ** 2 / 41472 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 / 41472 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 * w_6 ** 2 / 41472 - w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 4 / 207360 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 / 41472 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 / 13824 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 2 * w_6 ** 2 / 41472 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 / 13824 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 * w_6 ** 2 / 13824 - w_1 ** 2 * w_2 ** 2 * w_3 * w_5 ** 4 / 207360 + w_1 ** 2 * w_2 ** 2 * w_3 * w_5 ** 2 * w_6 ** 2 / 41472 - w_1 ** 2 * w_2 ** 2 * w_3 * w_6 ** 4 / 207360 - w_1 ** 2 * w_2 ** 2 * w_4 ** 4 * w_5 / 207360 - w_1 ** 2 * w_2 ** 2 * w_4 ** 4 * w_6 / 207360 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 41472 + w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 41472 - w_1 ** 2 * w_2 ** 2 * w_4 * w_5 ** 4 / 207360 + w_1 ** 2 * w_2 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 41472 - w_1 ** 2 * w_2 ** 2 * w_4 * w_6 ** 4 / 207360 - w_1 ** 2 * w_2 ** 2 * w_5 ** 4 * w_6 / 207360 - w_1 ** 2 * w_2 ** 2 * w_5 * w_6 ** 4 / 207360 + w_1 ** 2 * w_2 * w_3 ** 6 / 725760 - w_1 ** 2 * w_2 * w_3 ** 4 * w_4 ** 2 / 207360 - w_1 ** 2 * w_2 * w_3 ** 4 * w_4 * w_5 / 69120 - w_1 ** 2 * w_2 * w_3 ** 4 * w_4 * w_6 / 69120 - w_1 ** 2 * w_2 * w_3 ** 4 * w_5 ** 2 / 207360 - w_1 ** 2 * w_2 * w_3 ** 4 * w_5 * w_6 / 69120 - w_1 ** 2 * w_2 * w_3 ** 4 * w_6 ** 2 / 207360 - w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 4 / 207360 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 41472 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 13824 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 41472 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 13824 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 13824 - w_1 ** 2 * w_2 * w_3 ** 2 * w_5 ** 4 / 207360 + w_1 ** 2 * w_2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 41472 - w_1 ** 2 * w_2 * w_3 ** 2 * w_6 ** 4 / 207360 - w_1 ** 2 * w_2 * w_3 * w_4 ** 4 * w_5 / 69120 - w_1 ** 2 * w_2 * w_3 * w_4 ** 4 * w_6 / 69120 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 13824 + w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 13824 - w_1 ** 2 * w_2 * w_3 * w_4 * w_5 ** 4 / 69120 + w_1 ** 2 * w_2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 13824 - w_1 ** 2 * w_2 * w_3 * w_4 * w_6 ** 4 / 69120 - w_1 ** 2 * w_2 * w_3 * w_5 ** 4 * w_6 / 69120 - w_1 ** 2 * w_2 * w_3 * w_5 * w_6 ** 4 / 69120 + w_1 ** 2 * w_2 * w_4 ** 6 / 725760 - w_1 ** 2 * w_2 * w_4 ** 4 * w_5 ** 2 / 207360 - w_1 ** 2 * w_2 * w_4 ** 4 * w_5 * w_6 / 69120 - w_1 ** 2 * w_2 * w_4 ** 4 * w_6 ** 2 / 207360 - w_1 ** 2 * w_2 * w_4 ** 2 * w_5 ** 4 / 207360 + w_1 ** 2 * w_2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 41472 - w_1 ** 2 * w_2 * w_4 ** 2 * w_6 ** 4 / 207360 - w_1 ** 2 * w_2 * w_4 * w_5 ** 4 * w_6 / 69120 - w_1 ** 2 * w_2 * w_4 * w_5 * w_6 ** 4 / 69120 + w_1 ** 2 * w_2 * w_5 ** 6 / 725760 - w_1 ** 2 * w_2 * w_5 ** 4 * w_6 ** 2 / 207360 - w_1 ** 2 * w_2 * w_5 ** 2 * w_6 ** 4 / 207360 + w_1 ** 2 * w_2 * w_6 ** 6 / 725760 + w_1 ** 2 * w_3 ** 6 * w_4 / 725760 + w_1 ** 2 * w_3 ** 6 * w_5 / 725760 + w_1 ** 2 * w_3 ** 6 * w_6 / 725760 - w_1 ** 2 * w_3 ** 4 * w_4 ** 2 * w_5 / 207360 - w_1 ** 2 * w_3 ** 4 * w_4 ** 2 * w_6 / 207360 - w_1 ** 2 * w_3 ** 4 * w_4 * w_5 ** 2 / 207360 - w_1 ** 2 * w_3 ** 4 * w_4 * w_5 * w_6 / 69120 - w_1 ** 2 * w_3 ** 4 * w_4 * w_6 ** 2 / 207360 - w_1 ** 2 * w_3 ** 4 * w_5 ** 2 * w_6 / 207360 - w_1 ** 2 * w_3 ** 4 * w_5 * w_6 ** 2 / 207360 - w_1 ** 2 * w_3 ** 2 * w_4 ** 4 * w_5 / 207360 - w_1 ** 2 * w_3 ** 2 * w_4 ** 4 * w_6 / 207360 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 41472 + w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 41472 - w_1 ** 2 * w_3 ** 2 * w_4 * w_5 ** 4 / 207360 + w_1 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 41472 - w_1 ** 2 * w_3 ** 2 * w_4 * w_6 ** 4 / 207360 - w_1 ** 2 * w_3 ** 2 * w_5 ** 4 * w_6 / 207360 - w_1 ** 2 * w_3 ** 2 * w_5 * w_6 ** 4 / 207360 + w_1 ** 2 * w_3 * w_4 ** 6 / 725760 - w_1 ** 2 * w_3 * w_4 ** 4 * w_5 ** 2 / 207360 - w_1 ** 2 * w_3 * w_4 ** 4 * w_5 * w_6 / 69120 - w_1 ** 2 * w_3 * w_4 ** 4 * w_6 ** 2 / 207360 - w_1 ** 2 * w_3 * w_4 ** 2 * w_5 ** 4 / 207360 + w_1 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 41472 - w_1 ** 2 * w_3 * w_4 ** 2 * w_6 ** 4 / 207360 - w_1 ** 2 * w_3 * w_4 * w_5 ** 4 * w_6 / 69120 - w_1 ** 2 * w_3 * w_4 * w_5 * w_6 ** 4 / 69120 + w_1 ** 2 * w_3 * w_5 ** 6 / 725760 - w_1 ** 2 * w_3 * w_5 ** 4 * w_6 ** 2 / 207360 - w_1 ** 2 * w_3 * w_5 ** 2 * w_6 ** 4 / 207360 + w_1 ** 2 * w_3 * w_6 ** 6 / 725760 + w_1 ** 2 * w_4 ** 6 * w_5 / 725760 + w_1 ** 2 * w_4 ** 6 * w_6 / 725760 - w_1 ** 2 * w_4 ** 4 * w_5 ** 2 * w_6 / 207360 - w_1 ** 2 * w_4 ** 4 * w_5 * w_6 ** 2 / 207360 - w_1 ** 2 * w_4 ** 2 * w_5 ** 4 * w_6 / 207360 - w_1 ** 2 * w_4 ** 2 * w_5 * w_6 ** 4 / 207360 + w_1 ** 2 * w_4 * w_5 ** 6 / 725760 - w_1 ** 2 * w_4 * w_5 ** 4 * w_6 ** 2 / 207360 - w_1 ** 2 * w_4 * w_5 ** 2 * w_6 ** 4 / 207360 + w_1 ** 2 * w_4 * w_6 ** 6 / 725760 + w_1 ** 2 * w_5 ** 6 * w_6 / 725760 + w_1 ** 2 * w_5 * w_6 ** 6 / 725760 - w_1 * w_2 ** 8 / 2419200 + w_1 * w_2 ** 6 * w_3 ** 2 / 725760 + w_1 * w_2 ** 6 * w_3 * w_4 / 241920 + w_1 * w_2 ** 6 * w_3 * w_5 / 241920 + w_1 * w_2 ** 6 * w_3 * w_6 / 241920 + w_1 * w_2 ** 6 * w_4 ** 2 / 725760 + w_1 * w_2 ** 6 * w_4 * w_5 / 241920 + w_1 * w_2 ** 6 * w_4 * w_6 / 241920 + w_1 * w_2 ** 6 * w_5 ** 2 / 725760 + w_1 * w_2 ** 6 * w_5 * w_6 / 241920 + w_1 * w_2 ** 6 * w_6 ** 2 / 725760 + w_1 * w_2 ** 4 * w_3 ** 4 / 1036800 - w_1 * w_2 ** 4 * w_3 ** 2 * w_4 ** 2 / 207360 - w_1 * w_2 ** 4 * w_3 ** 2 * w_4 * w_5 / 69120 - w_1 * w_2 ** 4 * w_3 ** 2 * w_4 * w_6 / 69120 - w_1 * w_2 ** 4 * w_3 ** 2 * w_5 ** 2 / 207360 - w_1 * w_2 ** 4 * w_3 ** 2 * w_5 * w_6 / 69120 - w_1 * w_2 ** 4 * w_3 ** 2 * w_6 ** 2 / 207360 - w_1 * w_2 ** 4 * w_3 * w_4 ** 2 * w_5 / 69120 - w_1 * w_2 ** 4 * w_3 * w_4 ** 2 * w_6 / 69120 - w_1 * w_2 ** 4 * w_3 * w_4 * w_5 ** 2 / 69120 - w_1 * w_2 ** 4 * w_3 * w_4 * w_5 * w_6 / 23040 - w_1 * w_2 ** 4 * w_3 * w_4 * w_6 ** 2 / 69120 - w_1 * w_2 ** 4 * w_3 * w_5 ** 2 * w_6 / 69120 - w_1 * w_2 ** 4 * w_3 * w_5 * w_6 ** 2 / 69120 + w_1 * w_2 ** 4 * w_4 ** 4 / 1036800 - w_1 * w_2 ** 4 * w_4 ** 2 * w_5 ** 2 / 207360 - w_1 * w_2 ** 4 * w_4 ** 2 * w_5 * w_6 / 69120 - w_1 * w_2 ** 4 * w_4 ** 2 * w_6 ** 2 / 207360 - w_1 * w_2 ** 4 * w_4 * w_5 ** 2 * w_6 / 69120 - w_1 * w_2 ** 4 * w_4 * w_5 * w_6 ** 2 / 69120 + w_1 * w_2 ** 4 * w_5 ** 4 / 1036800 - w_1 * w_2 ** 4 * w_5 ** 2 * w_6 ** 2 / 207360 + w_1 * w_2 ** 4 * w_6 ** 4 / 1036800 + w_1 * w_2 ** 2 * w_3 ** 6 / 725760 - w_1 * w_2 ** 2 * w_3 ** 4 * w_4 ** 2 / 207360 - w_1 * w_2 ** 2 * w_3 ** 4 * w_4 * w_5 / 69120 - w_1 * w_2 ** 2 * w_3 ** 4 * w_4 * w_6 / 69120 - w_1 * w_2 ** 2 * w_3 ** 4 * w_5 ** 2 / 207360 - w_1 * w_2 ** 2 * w_3 ** 4 * w_5 * w_6 / 69120 - w_1 * w_2 ** 2 * w_3 ** 4 * w_6 ** 2 / 207360 - w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 4 / 207360 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 41472 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 / 13824 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 2 / 41472 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 / 13824 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 2 / 13824 - w_1 * w_2 ** 2 * w_3 ** 2 * w_5 ** 4 / 207360 + w_1 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 2 / 41472 - w_1 * w_2 ** 2 * w_3 ** 2 * w_6 ** 4 / 207360 - w_1 * w_2 ** 2 * w_3 * w_4 ** 4 * w_5 / 69120 - w_1 * w_2 ** 2 * w_3 * w_4 ** 4 * w_6 / 69120 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 / 13824 + w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 2 / 13824 - w_1 * w_2 ** 2 * w_3 * w_4 * w_5 ** 4 / 69120 + w_1 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 2 / 13824 - w_1 * w_2 ** 2 * w_3 * w_4 * w_6 ** 4 / 69120 - w_1 * w_2 ** 2 * w_3 * w_5 ** 4 * w_6 / 69120 - w_1 * w_2 ** 2 * w_3 * w_5 * w_6 ** 4 / 69120 + w_1 * w_2 ** 2 * w_4 ** 6 / 725760 - w_1 * w_2 ** 2 * w_4 ** 4 * w_5 ** 2 / 207360 - w_1 * w_2 ** 2 * w_4 ** 4 * w_5 * w_6 / 69120 - w_1 * w_2 ** 2 * w_4 ** 4 * w_6 ** 2 / 207360 - w_1 * w_2 ** 2 * w_4 ** 2 * w_5 ** 4 / 207360 + w_1 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 41472 - w_1 * w_2 ** 2 * w_4 ** 2 * w_6 ** 4 / 207360 - w_1 * w_2 ** 2 * w_4 * w_5 ** 4 * w_6 / 69120 - w_1 * w_2 ** 2 * w_4 * w_5 * w_6 ** 4 / 69120 + w_1 * w_2 ** 2 * w_5 ** 6 / 725760 - w_1 * w_2 ** 2 * w_5 ** 4 * w_6 ** 2 / 207360 - w_1 * w_2 ** 2 * w_5 ** 2 * w_6 ** 4 / 207360 + w_1 * w_2 ** 2 * w_6 ** 6 / 725760 + w_1 * w_2 * w_3 ** 6 * w_4 / 241920 + w_1 * w_2 * w_3 ** 6 * w_5 / 241920 + w_1 * w_2 * w_3 ** 6 * w_6 / 241920 - w_1 * w_2 * w_3 ** 4 * w_4 ** 2 * w_5 / 69120 - w_1 * w_2 * w_3 ** 4 * w_4 ** 2 * w_6 / 69120 - w_1 * w_2 * w_3 ** 4 * w_4 * w_5 ** 2 / 69120 - w_1 * w_2 * w_3 ** 4 * w_4 * w_5 * w_6 / 23040 - w_1 * w_2 * w_3 ** 4 * w_4 * w_6 ** 2 / 69120 - w_1 * w_2 * w_3 ** 4 * w_5 ** 2 * w_6 / 69120 - w_1 * w_2 * w_3 ** 4 * w_5 * w_6 ** 2 / 69120 - w_1 * w_2 * w_3 ** 2 * w_4 ** 4 * w_5 / 69120 - w_1 * w_2 * w_3 ** 2 * w_4 ** 4 * w_6 / 69120 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 13824 + w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 13824 - w_1 * w_2 * w_3 ** 2 * w_4 * w_5 ** 4 / 69120 + w_1 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 13824 - w_1 * w_2 * w_3 ** 2 * w_4 * w_6 ** 4 / 69120 - w_1 * w_2 * w_3 ** 2 * w_5 ** 4 * w_6 / 69120 - w_1 * w_2 * w_3 ** 2 * w_5 * w_6 ** 4 / 69120 + w_1 * w_2 * w_3 * w_4 ** 6 / 241920 - w_1 * w_2 * w_3 * w_4 ** 4 * w_5 ** 2 / 69120 - w_1 * w_2 * w_3 * w_4 ** 4 * w_5 * w_6 / 23040 - w_1 * w_2 * w_3 * w_4 ** 4 * w_6 ** 2 / 69120 - w_1 * w_2 * w_3 * w_4 ** 2 * w_5 ** 4 / 69120 + w_1 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 13824 - w_1 * w_2 * w_3 * w_4 ** 2 * w_6 ** 4 / 69120 - w_1 * w_2 * w_3 * w_4 * w_5 ** 4 * w_6 / 23040 - w_1 * w_2 * w_3 * w_4 * w_5 * w_6 ** 4 / 23040 + w_1 * w_2 * w_3 * w_5 ** 6 / 241920 - w_1 * w_2 * w_3 * w_5 ** 4 * w_6 ** 2 / 69120 - w_1 * w_2 * w_3 * w_5 ** 2 * w_6 ** 4 / 69120 + w_1 * w_2 * w_3 * w_6 ** 6 / 241920 + w_1 * w_2 * w_4 ** 6 * w_5 / 241920 + w_1 * w_2 * w_4 ** 6 * w_6 / 241920 - w_1 * w_2 * w_4 ** 4 * w_5 ** 2 * w_6 / 69120 - w_1 * w_2 * w_4 ** 4 * w_5 * w_6 ** 2 / 69120 - w_1 * w_2 * w_4 ** 2 * w_5 ** 4 * w_6 / 69120 - w_1 * w_2 * w_4 ** 2 * w_5 * w_6 ** 4 / 69120 + w_1 * w_2 * w_4 * w_5 ** 6 / 241920 - w_1 * w_2 * w_4 * w_5 ** 4 * w_6 ** 2 / 69120 - w_1 * w_2 * w_4 * w_5 ** 2 * w_6 ** 4 / 69120 + w_1 * w_2 * w_4 * w_6 ** 6 / 241920 + w_1 * w_2 * w_5 ** 6 * w_6 / 241920 + w_1 * w_2 * w_5 * w_6 ** 6 / 241920 - w_1 * w_3 ** 8 / 2419200 + w_1 * w_3 ** 6 * w_4 ** 2 / 725760 + w_1 * w_3 ** 6 * w_4 * w_5 / 241920 + w_1 * w_3 ** 6 * w_4 * w_6 / 241920 + w_1 * w_3 ** 6 * w_5 ** 2 / 725760 + w_1 * w_3 ** 6 * w_5 * w_6 / 241920 + w_1 * w_3 ** 6 * w_6 ** 2 / 725760 + w_1 * w_3 ** 4 * w_4 ** 4 / 1036800 - w_1 * w_3 ** 4 * w_4 ** 2 * w_5 ** 2 / 207360 - w_1 * w_3 ** 4 * w_4 ** 2 * w_5 * w_6 / 69120 - w_1 * w_3 ** 4 * w_4 ** 2 * w_6 ** 2 / 207360 - w_1 * w_3 ** 4 * w_4 * w_5 ** 2 * w_6 / 69120 - w_1 * w_3 ** 4 * w_4 * w_5 * w_6 ** 2 / 69120 + w_1 * w_3 ** 4 * w_5 ** 4 / 1036800 - w_1 * w_3 ** 4 * w_5 ** 2 * w_6 ** 2 / 207360 + w_1 * w_3 ** 4 * w_6 ** 4 / 1036800 + w_1 * w_3 ** 2 * w_4 ** 6 / 725760 - w_1 * w_3 ** 2 * w_4 ** 4 * w_5 ** 2 / 207360 - w_1 * w_3 ** 2 * w_4 ** 4 * w_5 * w_6 / 69120 - w_1 * w_3 ** 2 * w_4 ** 4 * w_6 ** 2 / 207360 - w_1 * w_3 ** 2 * w_4 ** 2 * w_5 ** 4 / 207360 + w_1 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 41472 - w_1 * w_3 ** 2 * w_4 ** 2 * w_6 ** 4 / 207360 - w_1 * w_3 ** 2 * w_4 * w_5 ** 4 * w_6 / 69120 - w_1 * w_3 ** 2 * w_4 * w_5 * w_6 ** 4 / 69120 + w_1 * w_3 ** 2 * w_5 ** 6 / 725760 - w_1 * w_3 ** 2 * w_5 ** 4 * w_6 ** 2 / 207360 - w_1 * w_3 ** 2 * w_5 ** 2 * w_6 ** 4 / 207360 + w_1 * w_3 ** 2 * w_6 ** 6 / 725760 + w_1 * w_3 * w_4 ** 6 * w_5 / 241920 + w_1 * w_3 * w_4 ** 6 * w_6 / 241920 - w_1 * w_3 * w_4 ** 4 * w_5 ** 2 * w_6 / 69120 - w_1 * w_3 * w_4 ** 4 * w_5 * w_6 ** 2 / 69120 - w_1 * w_3 * w_4 ** 2 * w_5 ** 4 * w_6 / 69120 - w_1 * w_3 * w_4 ** 2 * w_5 * w_6 ** 4 / 69120 + w_1 * w_3 * w_4 * w_5 ** 6 / 241920 - w_1 * w_3 * w_4 * w_5 ** 4 * w_6 ** 2 / 69120 - w_1 * w_3 * w_4 * w_5 ** 2 * w_6 ** 4 / 69120 + w_1 * w_3 * w_4 * w_6 ** 6 / 241920 + w_1 * w_3 * w_5 ** 6 * w_6 / 241920 + w_1 * w_3 * w_5 * w_6 ** 6 / 241920 - w_1 * w_4 ** 8 / 2419200 + w_1 * w_4 ** 6 * w_5 ** 2 / 725760 + w_1 * w_4 ** 6 * w_5 * w_6 / 241920 + w_1 * w_4 ** 6 * w_6 ** 2 / 725760 + w_1 * w_4 ** 4 * w_5 ** 4 / 1036800 - w_1 * w_4 ** 4 * w_5 ** 2 * w_6 ** 2 / 207360 + w_1 * w_4 ** 4 * w_6 ** 4 / 1036800 + w_1 * w_4 ** 2 * w_5 ** 6 / 725760 - w_1 * w_4 ** 2 * w_5 ** 4 * w_6 ** 2 / 207360 - w_1 * w_4 ** 2 * w_5 ** 2 * w_6 ** 4 / 207360 + w_1 * w_4 ** 2 * w_6 ** 6 / 725760 + w_1 * w_4 * w_5 ** 6 * w_6 / 241920 + w_1 * w_4 * w_5 * w_6 ** 6 / 241920 - w_1 * w_5 ** 8 / 2419200 + w_1 * w_5 ** 6 * w_6 ** 2 / 725760 + w_1 * w_5 ** 4 * w_6 ** 4 / 1036800 + w_1 * w_5 ** 2 * w_6 ** 6 / 725760 - w_1 * w_6 ** 8 / 2419200 - w_2 ** 8 * w_3 / 2419200 - w_2 ** 8 * w_4 / 2419200 - w_2 ** 8 * w_5 / 2419200 - w_2 ** 8 * w_6 / 2419200 + w_2 ** 6 * w_3 ** 2 * w_4 / 725760 + w_2 ** 6 * w_3 ** 2 * w_5 / 725760 + w_2 ** 6 * w_3 ** 2 * w_6 / 725760 + w_2 ** 6 * w_3 * w_4 ** 2 / 725760 + w_2 ** 6 * w_3 * w_4 * w_5 / 241920 + w_2 ** 6 * w_3 * w_4 * w_6 / 241920 + w_2 ** 6 * w_3 * w_5 ** 2 / 725760 + w_2 ** 6 * w_3 * w_5 * w_6 / 241920 + w_2 ** 6 * w_3 * w_6 ** 2 / 725760 + w_2 ** 6 * w_4 ** 2 * w_5 / 725760 + w_2 ** 6 * w_4 ** 2 * w_6 / 725760 + w_2 ** 6 * w_4 * w_5 ** 2 / 725760 + w_2 ** 6 * w_4 * w_5 * w_6 / 241920 + w_2 ** 6 * w_4 * w_6 ** 2 / 725760 + w_2 ** 6 * w_5 ** 2 * w_6 / 725760 + w_2 ** 6 * w_5 * w_6 ** 2 / 725760 + w_2 ** 4 * w_3 ** 4 * w_4 / 1036800 + w_2 ** 4 * w_3 ** 4 * w_5 / 1036800 + w_2 ** 4 * w_3 ** 4 * w_6 / 1036800 - w_2 ** 4 * w_3 ** 2 * w_4 ** 2 * w_5 / 207360 - w_2 ** 4 * w_3 ** 2 * w_4 ** 2 * w_6 / 207360 - w_2 ** 4 * w_3 ** 2 * w_4 * w_5 ** 2 / 207360 - w_2 ** 4 * w_3 ** 2 * w_4 * w_5 * w_6 / 69120 - w_2 ** 4 * w_3 ** 2 * w_4 * w_6 ** 2 / 207360 - w_2 ** 4 * w_3 ** 2 * w_5 ** 2 * w_6 / 207360 - w_2 ** 4 * w_3 ** 2 * w_5 * w_6 ** 2 / 207360 + w_2 ** 4 * w_3 * w_4 ** 4 / 1036800 - w_2 ** 4 * w_3 * w_4 ** 2 * w_5 ** 2 / 207360 - w_2 ** 4 * w_3 * w_4 ** 2 * w_5 * w_6 / 69120 - w_2 ** 4 * w_3 * w_4 ** 2 * w_6 ** 2 / 207360 - w_2 ** 4 * w_3 * w_4 * w_5 ** 2 * w_6 / 69120 - w_2 ** 4 * w_3 * w_4 * w_5 * w_6 ** 2 / 69120 + w_2 ** 4 * w_3 * w_5 ** 4 / 1036800 - w_2 ** 4 * w_3 * w_5 ** 2 * w_6 ** 2 / 207360 + w_2 ** 4 * w_3 * w_6 ** 4 / 1036800 + w_2 ** 4 * w_4 ** 4 * w_5 / 1036800 + w_2 ** 4 * w_4 ** 4 * w_6 / 1036800 - w_2 ** 4 * w_4 ** 2 * w_5 ** 2 * w_6 / 207360 - w_2 ** 4 * w_4 ** 2 * w_5 * w_6 ** 2 / 207360 + w_2 ** 4 * w_4 * w_5 ** 4 / 1036800 - w_2 ** 4 * w_4 * w_5 ** 2 * w_6 ** 2 / 207360 + w_2 ** 4 * w_4 * w_6 ** 4 / 1036800 + w_2 ** 4 * w_5 ** 4 * w_6 / 1036800 + w_2 ** 4 * w_5 * w_6 ** 4 / 1036800 + w_2 ** 2 * w_3 ** 6 * w_4 / 725760 + w_2 ** 2 * w_3 ** 6 * w_5 / 725760 + w_2 ** 2 * w_3 ** 6 * w_6 / 725760 - w_2 ** 2 * w_3 ** 4 * w_4 ** 2 * w_5 / 207360 - w_2 ** 2 * w_3 ** 4 * w_4 ** 2 * w_6 / 207360 - w_2 ** 2 * w_3 ** 4 * w_4 * w_5 ** 2 / 207360 - w_2 ** 2 * w_3 ** 4 * w_4 * w_5 * w_6 / 69120 - w_2 ** 2 * w_3 ** 4 * w_4 * w_6 ** 2 / 207360 - w_2 ** 2 * w_3 ** 4 * w_5 ** 2 * w_6 / 207360 - w_2 ** 2 * w_3 ** 4 * w_5 * w_6 ** 2 / 207360 - w_2 ** 2 * w_3 ** 2 * w_4 ** 4 * w_5 / 207360 - w_2 ** 2 * w_3 ** 2 * w_4 ** 4 * w_6 / 207360 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 / 41472 + w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 * w_6 ** 2 / 41472 - w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 4 / 207360 + w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 2 * w_6 ** 2 / 41472 - w_2 ** 2 * w_3 ** 2 * w_4 * w_6 ** 4 / 207360 - w_2 ** 2 * w_3 ** 2 * w_5 ** 4 * w_6 / 207360 - w_2 ** 2 * w_3 ** 2 * w_5 * w_6 ** 4 / 207360 + w_2 ** 2 * w_3 * w_4 ** 6 / 725760 - w_2 ** 2 * w_3 * w_4 ** 4 * w_5 ** 2 / 207360 - w_2 ** 2 * w_3 * w_4 ** 4 * w_5 * w_6 / 69120 - w_2 ** 2 * w_3 * w_4 ** 4 * w_6 ** 2 / 207360 - w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 4 / 207360 + w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 41472 - w_2 ** 2 * w_3 * w_4 ** 2 * w_6 ** 4 / 207360 - w_2 ** 2 * w_3 * w_4 * w_5 ** 4 * w_6 / 69120 - w_2 ** 2 * w_3 * w_4 * w_5 * w_6 ** 4 / 69120 + w_2 ** 2 * w_3 * w_5 ** 6 / 725760 - w_2 ** 2 * w_3 * w_5 ** 4 * w_6 ** 2 / 207360 - w_2 ** 2 * w_3 * w_5 ** 2 * w_6 ** 4 / 207360 + w_2 ** 2 * w_3 * w_6 ** 6 / 725760 + w_2 ** 2 * w_4 ** 6 * w_5 / 725760 + w_2 ** 2 * w_4 ** 6 * w_6 / 725760 - w_2 ** 2 * w_4 ** 4 * w_5 ** 2 * w_6 / 207360 - w_2 ** 2 * w_4 ** 4 * w_5 * w_6 ** 2 / 207360 - w_2 ** 2 * w_4 ** 2 * w_5 ** 4 * w_6 / 207360 - w_2 ** 2 * w_4 ** 2 * w_5 * w_6 ** 4 / 207360 + w_2 ** 2 * w_4 * w_5 ** 6 / 725760 - w_2 ** 2 * w_4 * w_5 ** 4 * w_6 ** 2 / 207360 - w_2 ** 2 * w_4 * w_5 ** 2 * w_6 ** 4 / 207360 + w_2 ** 2 * w_4 * w_6 ** 6 / 725760 + w_2 ** 2 * w_5 ** 6 * w_6 / 725760 + w_2 ** 2 * w_5 * w_6 ** 6 / 725760 - w_2 * w_3 ** 8 / 2419200 + w_2 * w_3 ** 6 * w_4 ** 2 / 725760 + w_2 * w_3 ** 6 * w_4 * w_5 / 241920 + w_2 * w_3 ** 6 * w_4 * w_6 / 241920 + w_2 * w_3 ** 6 * w_5 ** 2 / 725760 + w_2 * w_3 ** 6 * w_5 * w_6 / 241920 + w_2 * w_3 ** 6 * w_6 ** 2 / 725760 + w_2 * w_3 ** 4 * w_4 ** 4 / 1036800 - w_2 * w_3 ** 4 * w_4 ** 2 * w_5 ** 2 / 207360 - w_2 * w_3 ** 4 * w_4 ** 2 * w_5 * w_6 / 69120 - w_2 * w_3 ** 4 * w_4 ** 2 * w_6 ** 2 / 207360 - w_2 * w_3 ** 4 * w_4 * w_5 ** 2 * w_6 / 69120 - w_2 * w_3 ** 4 * w_4 * w_5 * w_6 ** 2 / 69120 + w_2 * w_3 ** 4 * w_5 ** 4 / 1036800 - w_2 * w_3 ** 4 * w_5 ** 2 * w_6 ** 2 / 207360 + w_2 * w_3 ** 4 * w_6 ** 4 / 1036800 + w_2 * w_3 ** 2 * w_4 ** 6 / 725760 - w_2 * w_3 ** 2 * w_4 ** 4 * w_5 ** 2 / 207360 - w_2 * w_3 ** 2 * w_4 ** 4 * w_5 * w_6 / 69120 - w_2 * w_3 ** 2 * w_4 ** 4 * w_6 ** 2 / 207360 - w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 4 / 207360 + w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 2 / 41472 - w_2 * w_3 ** 2 * w_4 ** 2 * w_6 ** 4 / 207360 - w_2 * w_3 ** 2 * w_4 * w_5 ** 4 * w_6 / 69120 - w_2 * w_3 ** 2 * w_4 * w_5 * w_6 ** 4 / 69120 + w_2 * w_3 ** 2 * w_5 ** 6 / 725760 - w_2 * w_3 ** 2 * w_5 ** 4 * w_6 ** 2 / 207360 - w_2 * w_3 ** 2 * w_5 ** 2 * w_6 ** 4 / 207360 + w_2 * w_3 ** 2 * w_6 ** 6 / 725760 + w_2 * w_3 * w_4 ** 6 * w_5 / 241920 + w_2 * w_3 * w_4 ** 6 * w_6 / 241920 - w_2 * w_3 * w_4 ** 4 * w_5 ** 2 * w_6 / 69120 - w_2 * w_3 * w_4 ** 4 * w_5 * w_6 ** 2 / 69120 - w_2 * w_3 * w_4 ** 2 * w_5 ** 4 * w_6 / 69120 - w_2 * w_3 * w_4 ** 2 * w_5 * w_6 ** 4 / 69120 + w_2 * w_3 * w_4 * w_5 ** 6 / 241920 - w_2 * w_3 * w_4 * w_5 ** 4 * w_6 ** 2 / 69120 - w_2 * w_3 * w_4 * w_5 ** 2 * w_6 ** 4 / 69120 + w_2 * w_3 * w_4 * w_6 ** 6 / 241920 + w_2 * w_3 * w_5 ** 6 * w_6 / 241920 + w_2 * w_3 * w_5 * w_6 ** 6 / 241920 - w_2 * w_4 ** 8 / 2419200 + w_2 * w_4 ** 6 * w_5 ** 2 / 725760 + w_2 * w_4 ** 6 * w_5 * w_6 / 241920 + w_2 * w_4 ** 6 * w_6 ** 2 / 725760 + w_2 * w_4 ** 4 * w_5 ** 4 / 1036800 - w_2 * w_4 ** 4 * w_5 ** 2 * w_6 ** 2 / 207360 + w_2 * w_4 ** 4 * w_6 ** 4 / 1036800 + w_2 * w_4 ** 2 * w_5 ** 6 / 725760 - w_2 * w_4 ** 2 * w_5 ** 4 * w_6 ** 2 / 207360 - w_2 * w_4 ** 2 * w_5 ** 2 * w_6 ** 4 / 207360 + w_2 * w_4 ** 2 * w_6 ** 6 / 725760 + w_2 * w_4 * w_5 ** 6 * w_6 / 241920 + w_2 * w_4 * w_5 * w_6 ** 6 / 241920 - w_2 * w_5 ** 8 / 2419200 + w_2 * w_5 ** 6 * w_6 ** 2 / 725760 + w_2 * w_5 ** 4 * w_6 ** 4 / 1036800 + w_2 * w_5 ** 2 * w_6 ** 6 / 725760 - w_2 * w_6 ** 8 / 2419200 - w_3 ** 8 * w_4 / 2419200 - w_3 ** 8 * w_5 / 2419200 - w_3 ** 8 * w_6 / 2419200 + w_3 ** 6 * w_4 ** 2 * w_5 / 725760 + w_3 ** 6 * w_4 ** 2 * w_6 / 725760 + w_3 ** 6 * w_4 * w_5 ** 2 / 725760 + w_3 ** 6 * w_4 * w_5 * w_6 / 241920 + w_3 ** 6 * w_4 * w_6 ** 2 / 725760 + w_3 ** 6 * w_5 ** 2 * w_6 / 725760 + w_3 ** 6 * w_5 * w_6 ** 2 / 725760 + w_3 ** 4 * w_4 ** 4 * w_5 / 1036800 + w_3 ** 4 * w_4 ** 4 * w_6 / 1036800 - w_3 ** 4 * w_4 ** 2 * w_5 ** 2 * w_6 / 207360 - w_3 ** 4 * w_4 ** 2 * w_5 * w_6 ** 2 / 207360 + w_3 ** 4 * w_4 * w_5 ** 4 / 1036800 - w_3 ** 4 * w_4 * w_5 ** 2 * w_6 ** 2 / 207360 + w_3 ** 4 * w_4 * w_6 ** 4 / 1036800 + w_3 ** 4 * w_5 ** 4 * w_6 / 1036800 + w_3 ** 4 * w_5 * w_6 ** 4 / 1036800 + w_3 ** 2 * w_4 ** 6 * w_5 / 725760 + w_3 ** 2 * w_4 ** 6 * w_6 / 725760 - w_3 ** 2 * w_4 ** 4 * w_5 ** 2 * w_6 / 207360 - w_3 ** 2 * w_4 ** 4 * w_5 * w_6 ** 2 / 207360 - w_3 ** 2 * w_4 ** 2 * w_5 ** 4 * w_6 / 207360 - w_3 ** 2 * w_4 ** 2 * w_5 * w_6 ** 4 / 207360 + w_3 ** 2 * w_4 * w_5 ** 6 / 725760 - w_3 ** 2 * w_4 * w_5 ** 4 * w_6 ** 2 / 207360 - w_3 ** 2 * w_4 * w_5 ** 2 * w_6 ** 4 / 207360 + w_3 ** 2 * w_4 * w_6 ** 6 / 725760 + w_3 ** 2 * w_5 ** 6 * w_6 / 725760 + w_3 ** 2 * w_5 * w_6 ** 6 / 725760 - w_3 * w_4 ** 8 / 2419200 + w_3 * w_4 ** 6 * w_5 ** 2 / 725760 + w_3 * w_4 ** 6 * w_5 * w_6 / 241920 + w_3 * w_4 ** 6 * w_6 ** 2 / 725760 + w_3 * w_4 ** 4 * w_5 ** 4 / 1036800 - w_3 * w_4 ** 4 * w_5 ** 2 * w_6 ** 2 / 207360 + w_3 * w_4 ** 4 * w_6 ** 4 / 1036800 + w_3 * w_4 ** 2 * w_5 ** 6 / 725760 - w_3 * w_4 ** 2 * w_5 ** 4 * w_6 ** 2 / 207360 - w_3 * w_4 ** 2 * w_5 ** 2 * w_6 ** 4 / 207360 + w_3 * w_4 ** 2 * w_6 ** 6 / 725760 + w_3 * w_4 * w_5 ** 6 * w_6 / 241920 + w_3 * w_4 * w_5 * w_6 ** 6 / 241920 - w_3 * w_5 ** 8 / 2419200 + w_3 * w_5 ** 6 * w_6 ** 2 / 725760 + w_3 * w_5 ** 4 * w_6 ** 4 / 1036800 + w_3 * w_5 ** 2 * w_6 ** 6 / 725760 - w_3 * w_6 ** 8 / 2419200 - w_4 ** 8 * w_5 / 2419200 - w_4 ** 8 * w_6 / 2419200 + w_4 ** 6 * w_5 ** 2 * w_6 / 725760 + w_4 ** 6 * w_5 * w_6 ** 2 / 725760 + w_4 ** 4 * w_5 ** 4 * w_6 / 1036800 + w_4 ** 4 * w_5 * w_6 ** 4 / 1036800 + w_4 ** 2 * w_5 ** 6 * w_6 / 725760 + w_4 ** 2 * w_5 * w_6 ** 6 / 725760 - w_4 * w_5 ** 8 / 2419200 + w_4 * w_5 ** 6 * w_6 ** 2 / 725760 + w_4 * w_5 ** 4 * w_6 ** 4 / 1036800 + w_4 * w_5 ** 2 * w_6 ** 6 / 725760 - w_4 * w_6 ** 8 / 2419200 - w_5 ** 8 * w_6 / 2419200 - w_5 * w_6 ** 8 / 2419200
-    if s == 10 and ln == 5:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        w_5 = sym.Symbol("w_5")
-        return w_1 ** 10 / 47900160 - w_1 ** 8 * w_2 ** 2 / 14515200 - w_1 ** 8 * w_2 * w_3 / 4838400 - w_1 ** 8 * w_2 * w_4 / 4838400 - w_1 ** 8 * w_2 * w_5 / 4838400 - w_1 ** 8 * w_3 ** 2 / 14515200 - w_1 ** 8 * w_3 * w_4 / 4838400 - w_1 ** 8 * w_3 * w_5 / 4838400 - w_1 ** 8 * w_4 ** 2 / 14515200 - w_1 ** 8 * w_4 * w_5 / 4838400 - w_1 ** 8 * w_5 ** 2 / 14515200 - w_1 ** 6 * w_2 ** 4 / 21772800 + w_1 ** 6 * w_2 ** 2 * w_3 ** 2 / 4354560 + w_1 ** 6 * w_2 ** 2 * w_3 * w_4 / 1451520 + w_1 ** 6 * w_2 ** 2 * w_3 * w_5 / 1451520 + w_1 ** 6 * w_2 ** 2 * w_4 ** 2 / 4354560 + w_1 ** 6 * w_2 ** 2 * w_4 * w_5 / 1451520 + w_1 ** 6 * w_2 ** 2 * w_5 ** 2 / 4354560 + w_1 ** 6 * w_2 * w_3 ** 2 * w_4 / 1451520 + w_1 ** 6 * w_2 * w_3 ** 2 * w_5 / 1451520 + w_1 ** 6 * w_2 * w_3 * w_4 ** 2 / 1451520 + w_1 ** 6 * w_2 * w_3 * w_4 * w_5 / 483840 + w_1 ** 6 * w_2 * w_3 * w_5 ** 2 / 1451520 + w_1 ** 6 * w_2 * w_4 ** 2 * w_5 / 1451520 + w_1 ** 6 * w_2 * w_4 * w_5 ** 2 / 1451520 - w_1 ** 6 * w_3 ** 4 / 21772800 + w_1 ** 6 * w_3 ** 2 * w_4 ** 2 / 4354560 + w_1 ** 6 * w_3 ** 2 * w_4 * w_5 / 1451520 + w_1 ** 6 * w_3 ** 2 * w_5 ** 2 / 4354560 + w_1 ** 6 * w_3 * w_4 ** 2 * w_5 / 1451520 + w_1 ** 6 * w_3 * w_4 * w_5 ** 2 / 1451520 - w_1 ** 6 * w_4 ** 4 / 21772800 + w_1 ** 6 * w_4 ** 2 * w_5 ** 2 / 4354560 - w_1 ** 6 * w_5 ** 4 / 21772800 - w_1 ** 4 * w_2 ** 6 / 21772800 + w_1 ** 4 * w_2 ** 4 * w_3 ** 2 / 6220800 + w_1 ** 4 * w_2 ** 4 * w_3 * w_4 / 2073600 + w_1 ** 4 * w_2 ** 4 * w_3 * w_5 / 2073600 + w_1 ** 4 * w_2 ** 4 * w_4 ** 2 / 6220800 + w_1 ** 4 * w_2 ** 4 * w_4 * w_5 / 2073600 + w_1 ** 4 * w_2 ** 4 * w_5 ** 2 / 6220800 + w_1 ** 4 * w_2 ** 2 * w_3 ** 4 / 6220800 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 / 1244160 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 / 414720 - w_1 ** 4 * w_2 ** 2 * w_3 ** 2 * w_5 ** 2 / 1244160 - w_1 ** 4 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 / 414720 - w_1 ** 4 * w_2 ** 2 * w_3 * w_4 * w_5 ** 2 / 414720 + w_1 ** 4 * w_2 ** 2 * w_4 ** 4 / 6220800 - w_1 ** 4 * w_2 ** 2 * w_4 ** 2 * w_5 ** 2 / 1244160 + w_1 ** 4 * w_2 ** 2 * w_5 ** 4 / 6220800 + w_1 ** 4 * w_2 * w_3 ** 4 * w_4 / 2073600 + w_1 ** 4 * w_2 * w_3 ** 4 * w_5 / 2073600 - w_1 ** 4 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 / 414720 - w_1 ** 4 * w_2 * w_3 ** 2 * w_4 * w_5 ** 2 / 414720 + w_1 ** 4 * w_2 * w_3 * w_4 ** 4 / 2073600 - w_1 ** 4 * w_2 * w_3 * w_4 ** 2 * w_5 ** 2 / 414720 + w_1 ** 4 * w_2 * w_3 * w_5 ** 4 / 2073600 + w_1 ** 4 * w_2 * w_4 ** 4 * w_5 / 2073600 + w_1 ** 4 * w_2 * w_4 * w_5 ** 4 / 2073600 - w_1 ** 4 * w_3 ** 6 / 21772800 + w_1 ** 4 * w_3 ** 4 * w_4 ** 2 / 6220800 + w_1 ** 4 * w_3 ** 4 * w_4 * w_5 / 2073600 + w_1 ** 4 * w_3 ** 4 * w_5 ** 2 / 6220800 + w_1 ** 4 * w_3 ** 2 * w_4 ** 4 / 6220800 - w_1 ** 4 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 1244160 + w_1 ** 4 * w_3 ** 2 * w_5 ** 4 / 6220800 + w_1 ** 4 * w_3 * w_4 ** 4 * w_5 / 2073600 + w_1 ** 4 * w_3 * w_4 * w_5 ** 4 / 2073600 - w_1 ** 4 * w_4 ** 6 / 21772800 + w_1 ** 4 * w_4 ** 4 * w_5 ** 2 / 6220800 + w_1 ** 4 * w_4 ** 2 * w_5 ** 4 / 6220800 - w_1 ** 4 * w_5 ** 6 / 21772800 - w_1 ** 2 * w_2 ** 8 / 14515200 + w_1 ** 2 * w_2 ** 6 * w_3 ** 2 / 4354560 + w_1 ** 2 * w_2 ** 6 * w_3 * w_4 / 1451520 + w_1 ** 2 * w_2 ** 6 * w_3 * w_5 / 1451520 + w_1 ** 2 * w_2 ** 6 * w_4 ** 2 / 4354560 + w_1 ** 2 * w_2 ** 6 * w_4 * w_5 / 1451520 + w_1 ** 2 * w_2 ** 6 * w_5 ** 2 / 4354560 + w_1 ** 2 * w_2 ** 4 * w_3 ** 4 / 6220800 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 * w_4 ** 2 / 1244160 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 * w_4 * w_5 / 414720 - w_1 ** 2 * w_2 ** 4 * w_3 ** 2 * w_5 ** 2 / 1244160 - w_1 ** 2 * w_2 ** 4 * w_3 * w_4 ** 2 * w_5 / 414720 - w_1 ** 2 * w_2 ** 4 * w_3 * w_4 * w_5 ** 2 / 414720 + w_1 ** 2 * w_2 ** 4 * w_4 ** 4 / 6220800 - w_1 ** 2 * w_2 ** 4 * w_4 ** 2 * w_5 ** 2 / 1244160 + w_1 ** 2 * w_2 ** 4 * w_5 ** 4 / 6220800 + w_1 ** 2 * w_2 ** 2 * w_3 ** 6 / 4354560 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 * w_4 ** 2 / 1244160 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 * w_4 * w_5 / 414720 - w_1 ** 2 * w_2 ** 2 * w_3 ** 4 * w_5 ** 2 / 1244160 - w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 ** 4 / 1244160 + w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 248832 - w_1 ** 2 * w_2 ** 2 * w_3 ** 2 * w_5 ** 4 / 1244160 - w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 4 * w_5 / 414720 - w_1 ** 2 * w_2 ** 2 * w_3 * w_4 * w_5 ** 4 / 414720 + w_1 ** 2 * w_2 ** 2 * w_4 ** 6 / 4354560 - w_1 ** 2 * w_2 ** 2 * w_4 ** 4 * w_5 ** 2 / 1244160 - w_1 ** 2 * w_2 ** 2 * w_4 ** 2 * w_5 ** 4 / 1244160 + w_1 ** 2 * w_2 ** 2 * w_5 ** 6 / 4354560 + w_1 ** 2 * w_2 * w_3 ** 6 * w_4 / 1451520 + w_1 ** 2 * w_2 * w_3 ** 6 * w_5 / 1451520 - w_1 ** 2 * w_2 * w_3 ** 4 * w_4 ** 2 * w_5 / 414720 - w_1 ** 2 * w_2 * w_3 ** 4 * w_4 * w_5 ** 2 / 414720 - w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 4 * w_5 / 414720 - w_1 ** 2 * w_2 * w_3 ** 2 * w_4 * w_5 ** 4 / 414720 + w_1 ** 2 * w_2 * w_3 * w_4 ** 6 / 1451520 - w_1 ** 2 * w_2 * w_3 * w_4 ** 4 * w_5 ** 2 / 414720 - w_1 ** 2 * w_2 * w_3 * w_4 ** 2 * w_5 ** 4 / 414720 + w_1 ** 2 * w_2 * w_3 * w_5 ** 6 / 1451520 + w_1 ** 2 * w_2 * w_4 ** 6 * w_5 / 1451520 + w_1 ** 2 * w_2 * w_4 * w_5 ** 6 / 1451520 - w_1 ** 2 * w_3 ** 8 / 14515200 + w_1 ** 2 * w_3 ** 6 * w_4 ** 2 / 4354560 + w_1 ** 2 * w_3 ** 6 * w_4 * w_5 / 1451520 + w_1 ** 2 * w_3 ** 6 * w_5 ** 2 / 4354560 + w_1 ** 2 * w_3 ** 4 * w_4 ** 4 / 6220800 - w_1 ** 2 * w_3 ** 4 * w_4 ** 2 * w_5 ** 2 / 1244160 + w_1 ** 2 * w_3 ** 4 * w_5 ** 4 / 6220800 + w_1 ** 2 * w_3 ** 2 * w_4 ** 6 / 4354560 - w_1 ** 2 * w_3 ** 2 * w_4 ** 4 * w_5 ** 2 / 1244160 - w_1 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 4 / 1244160 + w_1 ** 2 * w_3 ** 2 * w_5 ** 6 / 4354560 + w_1 ** 2 * w_3 * w_4 ** 6 * w_5 / 1451520 + w_1 ** 2 * w_3 * w_4 * w_5 ** 6 / 1451520 - w_1 ** 2 * w_4 ** 8 / 14515200 + w_1 ** 2 * w_4 ** 6 * w_5 ** 2 / 4354560 + w_1 ** 2 * w_4 ** 4 * w_5 ** 4 / 6220800 + w_1 ** 2 * w_4 ** 2 * w_5 ** 6 / 4354560 - w_1 ** 2 * w_5 ** 8 / 14515200 - w_1 * w_2 ** 8 * w_3 / 4838400 - w_1 * w_2 ** 8 * w_4 / 4838400 - w_1 * w_2 ** 8 * w_5 / 4838400 + w_1 * w_2 ** 6 * w_3 ** 2 * w_4 / 1451520 + w_1 * w_2 ** 6 * w_3 ** 2 * w_5 / 1451520 + w_1 * w_2 ** 6 * w_3 * w_4 ** 2 / 1451520 + w_1 * w_2 ** 6 * w_3 * w_4 * w_5 / 483840 + w_1 * w_2 ** 6 * w_3 * w_5 ** 2 / 1451520 + w_1 * w_2 ** 6 * w_4 ** 2 * w_5 / 1451520 + w_1 * w_2 ** 6 * w_4 * w_5 ** 2 / 1451520 + w_1 * w_2 ** 4 * w_3 ** 4 * w_4 / 2073600 + w_1 * w_2 ** 4 * w_3 ** 4 * w_5 / 2073600 - w_1 * w_2 ** 4 * w_3 ** 2 * w_4 ** 2 * w_5 / 414720 - w_1 * w_2 ** 4 * w_3 ** 2 * w_4 * w_5 ** 2 / 414720 + w_1 * w_2 ** 4 * w_3 * w_4 ** 4 / 2073600 - w_1 * w_2 ** 4 * w_3 * w_4 ** 2 * w_5 ** 2 / 414720 + w_1 * w_2 ** 4 * w_3 * w_5 ** 4 / 2073600 + w_1 * w_2 ** 4 * w_4 ** 4 * w_5 / 2073600 + w_1 * w_2 ** 4 * w_4 * w_5 ** 4 / 2073600 + w_1 * w_2 ** 2 * w_3 ** 6 * w_4 / 1451520 + w_1 * w_2 ** 2 * w_3 ** 6 * w_5 / 1451520 - w_1 * w_2 ** 2 * w_3 ** 4 * w_4 ** 2 * w_5 / 414720 - w_1 * w_2 ** 2 * w_3 ** 4 * w_4 * w_5 ** 2 / 414720 - w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 4 * w_5 / 414720 - w_1 * w_2 ** 2 * w_3 ** 2 * w_4 * w_5 ** 4 / 414720 + w_1 * w_2 ** 2 * w_3 * w_4 ** 6 / 1451520 - w_1 * w_2 ** 2 * w_3 * w_4 ** 4 * w_5 ** 2 / 414720 - w_1 * w_2 ** 2 * w_3 * w_4 ** 2 * w_5 ** 4 / 414720 + w_1 * w_2 ** 2 * w_3 * w_5 ** 6 / 1451520 + w_1 * w_2 ** 2 * w_4 ** 6 * w_5 / 1451520 + w_1 * w_2 ** 2 * w_4 * w_5 ** 6 / 1451520 - w_1 * w_2 * w_3 ** 8 / 4838400 + w_1 * w_2 * w_3 ** 6 * w_4 ** 2 / 1451520 + w_1 * w_2 * w_3 ** 6 * w_4 * w_5 / 483840 + w_1 * w_2 * w_3 ** 6 * w_5 ** 2 / 1451520 + w_1 * w_2 * w_3 ** 4 * w_4 ** 4 / 2073600 - w_1 * w_2 * w_3 ** 4 * w_4 ** 2 * w_5 ** 2 / 414720 + w_1 * w_2 * w_3 ** 4 * w_5 ** 4 / 2073600 + w_1 * w_2 * w_3 ** 2 * w_4 ** 6 / 1451520 - w_1 * w_2 * w_3 ** 2 * w_4 ** 4 * w_5 ** 2 / 414720 - w_1 * w_2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 4 / 414720 + w_1 * w_2 * w_3 ** 2 * w_5 ** 6 / 1451520 + w_1 * w_2 * w_3 * w_4 ** 6 * w_5 / 483840 + w_1 * w_2 * w_3 * w_4 * w_5 ** 6 / 483840 - w_1 * w_2 * w_4 ** 8 / 4838400 + w_1 * w_2 * w_4 ** 6 * w_5 ** 2 / 1451520 + w_1 * w_2 * w_4 ** 4 * w_5 ** 4 / 2073600 + w_1 * w_2 * w_4 ** 2 * w_5 ** 6 / 1451520 - w_1 * w_2 * w_5 ** 8 / 4838400 - w_1 * w_3 ** 8 * w_4 / 4838400 - w_1 * w_3 ** 8 * w_5 / 4838400 + w_1 * w_3 ** 6 * w_4 ** 2 * w_5 / 1451520 + w_1 * w_3 ** 6 * w_4 * w_5 ** 2 / 1451520 + w_1 * w_3 ** 4 * w_4 ** 4 * w_5 / 2073600 + w_1 * w_3 ** 4 * w_4 * w_5 ** 4 / 2073600 + w_1 * w_3 ** 2 * w_4 ** 6 * w_5 / 1451520 + w_1 * w_3 ** 2 * w_4 * w_5 ** 6 / 1451520 - w_1 * w_3 * w_4 ** 8 / 4838400 + w_1 * w_3 * w_4 ** 6 * w_5 ** 2 / 1451520 + w_1 * w_3 * w_4 ** 4 * w_5 ** 4 / 2073600 + w_1 * w_3 * w_4 ** 2 * w_5 ** 6 / 1451520 - w_1 * w_3 * w_5 ** 8 / 4838400 - w_1 * w_4 ** 8 * w_5 / 4838400 - w_1 * w_4 * w_5 ** 8 / 4838400 + w_2 ** 10 / 47900160 - w_2 ** 8 * w_3 ** 2 / 14515200 - w_2 ** 8 * w_3 * w_4 / 4838400 - w_2 ** 8 * w_3 * w_5 / 4838400 - w_2 ** 8 * w_4 ** 2 / 14515200 - w_2 ** 8 * w_4 * w_5 / 4838400 - w_2 ** 8 * w_5 ** 2 / 14515200 - w_2 ** 6 * w_3 ** 4 / 21772800 + w_2 ** 6 * w_3 ** 2 * w_4 ** 2 / 4354560 + w_2 ** 6 * w_3 ** 2 * w_4 * w_5 / 1451520 + w_2 ** 6 * w_3 ** 2 * w_5 ** 2 / 4354560 + w_2 ** 6 * w_3 * w_4 ** 2 * w_5 / 1451520 + w_2 ** 6 * w_3 * w_4 * w_5 ** 2 / 1451520 - w_2 ** 6 * w_4 ** 4 / 21772800 + w_2 ** 6 * w_4 ** 2 * w_5 ** 2 / 4354560 - w_2 ** 6 * w_5 ** 4 / 21772800 - w_2 ** 4 * w_3 ** 6 / 21772800 + w_2 ** 4 * w_3 ** 4 * w_4 ** 2 / 6220800 + w_2 ** 4 * w_3 ** 4 * w_4 * w_5 / 2073600 + w_2 ** 4 * w_3 ** 4 * w_5 ** 2 / 6220800 + w_2 ** 4 * w_3 ** 2 * w_4 ** 4 / 6220800 - w_2 ** 4 * w_3 ** 2 * w_4 ** 2 * w_5 ** 2 / 1244160 + w_2 ** 4 * w_3 ** 2 * w_5 ** 4 / 6220800 + w_2 ** 4 * w_3 * w_4 ** 4 * w_5 / 2073600 + w_2 ** 4 * w_3 * w_4 * w_5 ** 4 / 2073600 - w_2 ** 4 * w_4 ** 6 / 21772800 + w_2 ** 4 * w_4 ** 4 * w_5 ** 2 / 6220800 + w_2 ** 4 * w_4 ** 2 * w_5 ** 4 / 6220800 - w_2 ** 4 * w_5 ** 6 / 21772800 - w_2 ** 2 * w_3 ** 8 / 14515200 + w_2 ** 2 * w_3 ** 6 * w_4 ** 2 / 4354560 + w_2 ** 2 * w_3 ** 6 * w_4 * w_5 / 1451520 + w_2 ** 2 * w_3 ** 6 * w_5 ** 2 / 4354560 + w_2 ** 2 * w_3 ** 4 * w_4 ** 4 / 6220800 - w_2 ** 2 * w_3 ** 4 * w_4 ** 2 * w_5 ** 2 / 1244160 + w_2 ** 2 * w_3 ** 4 * w_5 ** 4 / 6220800 + w_2 ** 2 * w_3 ** 2 * w_4 ** 6 / 4354560 - w_2 ** 2 * w_3 ** 2 * w_4 ** 4 * w_5 ** 2 / 1244160 - w_2 ** 2 * w_3 ** 2 * w_4 ** 2 * w_5 ** 4 / 1244160 + w_2 ** 2 * w_3 ** 2 * w_5 ** 6 / 4354560 + w_2 ** 2 * w_3 * w_4 ** 6 * w_5 / 1451520 + w_2 ** 2 * w_3 * w_4 * w_5 ** 6 / 1451520 - w_2 ** 2 * w_4 ** 8 / 14515200 + w_2 ** 2 * w_4 ** 6 * w_5 ** 2 / 4354560 + w_2 ** 2 * w_4 ** 4 * w_5 ** 4 / 6220800 + w_2 ** 2 * w_4 ** 2 * w_5 ** 6 / 4354560 - w_2 ** 2 * w_5 ** 8 / 14515200 - w_2 * w_3 ** 8 * w_4 / 4838400 - w_2 * w_3 ** 8 * w_5 / 4838400 + w_2 * w_3 ** 6 * w_4 ** 2 * w_5 / 1451520 + w_2 * w_3 ** 6 * w_4 * w_5 ** 2 / 1451520 + w_2 * w_3 ** 4 * w_4 ** 4 * w_5 / 2073600 + w_2 * w_3 ** 4 * w_4 * w_5 ** 4 / 2073600 + w_2 * w_3 ** 2 * w_4 ** 6 * w_5 / 1451520 + w_2 * w_3 ** 2 * w_4 * w_5 ** 6 / 1451520 - w_2 * w_3 * w_4 ** 8 / 4838400 + w_2 * w_3 * w_4 ** 6 * w_5 ** 2 / 1451520 + w_2 * w_3 * w_4 ** 4 * w_5 ** 4 / 2073600 + w_2 * w_3 * w_4 ** 2 * w_5 ** 6 / 1451520 - w_2 * w_3 * w_5 ** 8 / 4838400 - w_2 * w_4 ** 8 * w_5 / 4838400 - w_2 * w_4 * w_5 ** 8 / 4838400 + w_3 ** 10 / 47900160 - w_3 ** 8 * w_4 ** 2 / 14515200 - w_3 ** 8 * w_4 * w_5 / 4838400 - w_3 ** 8 * w_5 ** 2 / 14515200 - w_3 ** 6 * w_4 ** 4 / 21772800 + w_3 ** 6 * w_4 ** 2 * w_5 ** 2 / 4354560 - w_3 ** 6 * w_5 ** 4 / 21772800 - w_3 ** 4 * w_4 ** 6 / 21772800 + w_3 ** 4 * w_4 ** 4 * w_5 ** 2 / 6220800 + w_3 ** 4 * w_4 ** 2 * w_5 ** 4 / 6220800 - w_3 ** 4 * w_5 ** 6 / 21772800 - w_3 ** 2 * w_4 ** 8 / 14515200 + w_3 ** 2 * w_4 ** 6 * w_5 ** 2 / 4354560 + w_3 ** 2 * w_4 ** 4 * w_5 ** 4 / 6220800 + w_3 ** 2 * w_4 ** 2 * w_5 ** 6 / 4354560 - w_3 ** 2 * w_5 ** 8 / 14515200 - w_3 * w_4 ** 8 * w_5 / 4838400 - w_3 * w_4 * w_5 ** 8 / 4838400 + w_4 ** 10 / 47900160 - w_4 ** 8 * w_5 ** 2 / 14515200 - w_4 ** 6 * w_5 ** 4 / 21772800 - w_4 ** 4 * w_5 ** 6 / 21772800 - w_4 ** 2 * w_5 ** 8 / 14515200 + w_5 ** 10 / 47900160
-    if s == 11 and ln == 4:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        w_4 = sym.Symbol("w_4")
-        return w_1 ** 10 * w_2 / 95800320 + w_1 ** 10 * w_3 / 95800320 + w_1 ** 10 * w_4 / 95800320 - w_1 ** 8 * w_2 ** 2 * w_3 / 29030400 - w_1 ** 8 * w_2 ** 2 * w_4 / 29030400 - w_1 ** 8 * w_2 * w_3 ** 2 / 29030400 - w_1 ** 8 * w_2 * w_3 * w_4 / 9676800 - w_1 ** 8 * w_2 * w_4 ** 2 / 29030400 - w_1 ** 8 * w_3 ** 2 * w_4 / 29030400 - w_1 ** 8 * w_3 * w_4 ** 2 / 29030400 - w_1 ** 6 * w_2 ** 4 * w_3 / 43545600 - w_1 ** 6 * w_2 ** 4 * w_4 / 43545600 + w_1 ** 6 * w_2 ** 2 * w_3 ** 2 * w_4 / 8709120 + w_1 ** 6 * w_2 ** 2 * w_3 * w_4 ** 2 / 8709120 - w_1 ** 6 * w_2 * w_3 ** 4 / 43545600 + w_1 ** 6 * w_2 * w_3 ** 2 * w_4 ** 2 / 8709120 - w_1 ** 6 * w_2 * w_4 ** 4 / 43545600 - w_1 ** 6 * w_3 ** 4 * w_4 / 43545600 - w_1 ** 6 * w_3 * w_4 ** 4 / 43545600 - w_1 ** 4 * w_2 ** 6 * w_3 / 43545600 - w_1 ** 4 * w_2 ** 6 * w_4 / 43545600 + w_1 ** 4 * w_2 ** 4 * w_3 ** 2 * w_4 / 12441600 + w_1 ** 4 * w_2 ** 4 * w_3 * w_4 ** 2 / 12441600 + w_1 ** 4 * w_2 ** 2 * w_3 ** 4 * w_4 / 12441600 + w_1 ** 4 * w_2 ** 2 * w_3 * w_4 ** 4 / 12441600 - w_1 ** 4 * w_2 * w_3 ** 6 / 43545600 + w_1 ** 4 * w_2 * w_3 ** 4 * w_4 ** 2 / 12441600 + w_1 ** 4 * w_2 * w_3 ** 2 * w_4 ** 4 / 12441600 - w_1 ** 4 * w_2 * w_4 ** 6 / 43545600 - w_1 ** 4 * w_3 ** 6 * w_4 / 43545600 - w_1 ** 4 * w_3 * w_4 ** 6 / 43545600 - w_1 ** 2 * w_2 ** 8 * w_3 / 29030400 - w_1 ** 2 * w_2 ** 8 * w_4 / 29030400 + w_1 ** 2 * w_2 ** 6 * w_3 ** 2 * w_4 / 8709120 + w_1 ** 2 * w_2 ** 6 * w_3 * w_4 ** 2 / 8709120 + w_1 ** 2 * w_2 ** 4 * w_3 ** 4 * w_4 / 12441600 + w_1 ** 2 * w_2 ** 4 * w_3 * w_4 ** 4 / 12441600 + w_1 ** 2 * w_2 ** 2 * w_3 ** 6 * w_4 / 8709120 + w_1 ** 2 * w_2 ** 2 * w_3 * w_4 ** 6 / 8709120 - w_1 ** 2 * w_2 * w_3 ** 8 / 29030400 + w_1 ** 2 * w_2 * w_3 ** 6 * w_4 ** 2 / 8709120 + w_1 ** 2 * w_2 * w_3 ** 4 * w_4 ** 4 / 12441600 + w_1 ** 2 * w_2 * w_3 ** 2 * w_4 ** 6 / 8709120 - w_1 ** 2 * w_2 * w_4 ** 8 / 29030400 - w_1 ** 2 * w_3 ** 8 * w_4 / 29030400 - w_1 ** 2 * w_3 * w_4 ** 8 / 29030400 + w_1 * w_2 ** 10 / 95800320 - w_1 * w_2 ** 8 * w_3 ** 2 / 29030400 - w_1 * w_2 ** 8 * w_3 * w_4 / 9676800 - w_1 * w_2 ** 8 * w_4 ** 2 / 29030400 - w_1 * w_2 ** 6 * w_3 ** 4 / 43545600 + w_1 * w_2 ** 6 * w_3 ** 2 * w_4 ** 2 / 8709120 - w_1 * w_2 ** 6 * w_4 ** 4 / 43545600 - w_1 * w_2 ** 4 * w_3 ** 6 / 43545600 + w_1 * w_2 ** 4 * w_3 ** 4 * w_4 ** 2 / 12441600 + w_1 * w_2 ** 4 * w_3 ** 2 * w_4 ** 4 / 12441600 - w_1 * w_2 ** 4 * w_4 ** 6 / 43545600 - w_1 * w_2 ** 2 * w_3 ** 8 / 29030400 + w_1 * w_2 ** 2 * w_3 ** 6 * w_4 ** 2 / 8709120 + w_1 * w_2 ** 2 * w_3 ** 4 * w_4 ** 4 / 12441600 + w_1 * w_2 ** 2 * w_3 ** 2 * w_4 ** 6 / 8709120 - w_1 * w_2 ** 2 * w_4 ** 8 / 29030400 - w_1 * w_2 * w_3 ** 8 * w_4 / 9676800 - w_1 * w_2 * w_3 * w_4 ** 8 / 9676800 + w_1 * w_3 ** 10 / 95800320 - w_1 * w_3 ** 8 * w_4 ** 2 / 29030400 - w_1 * w_3 ** 6 * w_4 ** 4 / 43545600 - w_1 * w_3 ** 4 * w_4 ** 6 / 43545600 - w_1 * w_3 ** 2 * w_4 ** 8 / 29030400 + w_1 * w_4 ** 10 / 95800320 + w_2 ** 10 * w_3 / 95800320 + w_2 ** 10 * w_4 / 95800320 - w_2 ** 8 * w_3 ** 2 * w_4 / 29030400 - w_2 ** 8 * w_3 * w_4 ** 2 / 29030400 - w_2 ** 6 * w_3 ** 4 * w_4 / 43545600 - w_2 ** 6 * w_3 * w_4 ** 4 / 43545600 - w_2 ** 4 * w_3 ** 6 * w_4 / 43545600 - w_2 ** 4 * w_3 * w_4 ** 6 / 43545600 - w_2 ** 2 * w_3 ** 8 * w_4 / 29030400 - w_2 ** 2 * w_3 * w_4 ** 8 / 29030400 + w_2 * w_3 ** 10 / 95800320 - w_2 * w_3 ** 8 * w_4 ** 2 / 29030400 - w_2 * w_3 ** 6 * w_4 ** 4 / 43545600 - w_2 * w_3 ** 4 * w_4 ** 6 / 43545600 - w_2 * w_3 ** 2 * w_4 ** 8 / 29030400 + w_2 * w_4 ** 10 / 95800320 + w_3 ** 10 * w_4 / 95800320 + w_3 * w_4 ** 10 / 95800320
-    if s == 12 and ln == 3:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        w_3 = sym.Symbol("w_3")
-        return -691 * w_1 ** 12 / 1307674368000 + w_1 ** 10 * w_2 ** 2 / 574801920 + w_1 ** 10 * w_2 * w_3 / 191600640 + w_1 ** 10 * w_3 ** 2 / 574801920 + w_1 ** 8 * w_2 ** 4 / 870912000 - w_1 ** 8 * w_2 ** 2 * w_3 ** 2 / 174182400 + w_1 ** 8 * w_3 ** 4 / 870912000 + w_1 ** 6 * w_2 ** 6 / 914457600 - w_1 ** 6 * w_2 ** 4 * w_3 ** 2 / 261273600 - w_1 ** 6 * w_2 ** 2 * w_3 ** 4 / 261273600 + w_1 ** 6 * w_3 ** 6 / 914457600 + w_1 ** 4 * w_2 ** 8 / 870912000 - w_1 ** 4 * w_2 ** 6 * w_3 ** 2 / 261273600 - w_1 ** 4 * w_2 ** 4 * w_3 ** 4 / 373248000 - w_1 ** 4 * w_2 ** 2 * w_3 ** 6 / 261273600 + w_1 ** 4 * w_3 ** 8 / 870912000 + w_1 ** 2 * w_2 ** 10 / 574801920 - w_1 ** 2 * w_2 ** 8 * w_3 ** 2 / 174182400 - w_1 ** 2 * w_2 ** 6 * w_3 ** 4 / 261273600 - w_1 ** 2 * w_2 ** 4 * w_3 ** 6 / 261273600 - w_1 ** 2 * w_2 ** 2 * w_3 ** 8 / 174182400 + w_1 ** 2 * w_3 ** 10 / 574801920 + w_1 * w_2 ** 10 * w_3 / 191600640 + w_1 * w_2 * w_3 ** 10 / 191600640 - 691 * w_2 ** 12 / 1307674368000 + w_2 ** 10 * w_3 ** 2 / 574801920 + w_2 ** 8 * w_3 ** 4 / 870912000 + w_2 ** 6 * w_3 ** 6 / 914457600 + w_2 ** 4 * w_3 ** 8 / 870912000 + w_2 ** 2 * w_3 ** 10 / 574801920 - 691 * w_3 ** 12 / 1307674368000
-    if s == 13 and ln == 2:
-        w_1 = sym.Symbol("w_1")
-        w_2 = sym.Symbol("w_2")
-        return -691 * w_1 ** 12 * w_2 / 2615348736000 - 691 * w_1 * w_2 ** 12 / 2615348736000
-    if s == 14 and ln == 1:
-        w_1 = sym.Symbol("w_1")
-        return w_1 ** 14 / 74724249600
+from backend import config
+
+CACHE_DIR = config.CACHE_DIR / "todd"
+
+
+def cache_path(s: int, n: int) -> Path:
+    """
+    Get file name for cached td(s, n) coefficients
+    :param s: Todd class degree
+    :param n: number of variables
+    :return: path to cache file
+    """
+    return CACHE_DIR / f"td_{s}_{n}.part"
+
+
+def load(s: int, n: int) -> Optional[dict[tuple[int, ...], Fraction]]:
+    """
+    Load td(s, n) coefficients from on-disk cache.
+    Every line of cache file is a monomial symmetric polynomial:
+    parts of its partition and a rational coefficient, separated by spaces
+    :param s: Todd class degree
+    :param n: number of variables
+    :return: partition -> coefficient, or None if not cached
+    """
+    try:
+        with open(cache_path(s, n), "r") as file:
+            lines = file.read().splitlines()
+    except OSError:
+        return None
+    res = {}
+    for line in lines:
+        *parts, coefficient = line.split()
+        res[tuple(map(int, parts))] = Fraction(coefficient)
+    return res
+
+
+def store(s: int, n: int, coefficients: dict[tuple[int, ...], Fraction]) -> None:
+    """
+    Store td(s, n) coefficients into on-disk cache, see config.atomic_write
+    :param s: Todd class degree
+    :param n: number of variables
+    :param coefficients: partition -> coefficient
+    :return: None
+    """
+    config.atomic_write(cache_path(s, n), "".join(
+        "".join(f"{part} " for part in parts) + f"{coefficient}\n"
+        for parts, coefficient in coefficients.items()
+    ))
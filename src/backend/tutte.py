@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Union
+
+import sympy
+
+from backend import config
+from backend.canonical import canonical_form, graph_form
+from backend.graph_utils import CompactGraph
+from backend.laurent import LaurentPoly, Scalar
+from backend.progress import (
+    CancellationToken,
+    Progress,
+    ProgressCallback,
+    cancellable,
+    check_cancelled,
+)
+
+x, y = sympy.symbols("x y")
+
+CACHE_VERSION = 1
+
+# Persistent entries not used for this number of seconds are removed
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+# Maximal number of memoized 2-connected blocks
+BLOCK_CACHE_SIZE = 4096
+
+Edges = list[tuple[int, int]]
+
+
+class Specialization:
+    """
+    Point, in which Tutte polynomial is evaluated. Specialization.x and
+    Specialization.y are LaurentPoly in Specialization.symbols, the engine
+    works with polynomials in these symbols only, so a univariate
+    specialization never builds the bivariate polynomial
+    """
+    __slots__ = ("name", "symbols", "one", "x", "y")
+
+    def __init__(self, name: str, symbols: list[sympy.Symbol],
+                 x_value: LaurentPoly, y_value: LaurentPoly):
+        """
+        Constructor for specialization
+        :param name: unique name, part of cache keys
+        :param symbols: variables of result
+        :param x_value: value of x
+        :param y_value: value of y
+        """
+        self.name = name
+        self.symbols = symbols
+        self.one = LaurentPoly.monomial((0,) * len(symbols))
+        self.x = x_value
+        self.y = y_value
+
+
+class Values:
+    """
+    Values of a polynomial at several specializations, one LaurentPoly
+    per specialization. Arithmetic is componentwise
+    """
+    __slots__ = ("polys",)
+
+    def __init__(self, polys: tuple[LaurentPoly, ...]):
+        self.polys = polys
+
+    def add(self, other: Values, factor: Scalar = 1) -> Values:
+        for poly, other_poly in zip(self.polys, other.polys):
+            poly.add(other_poly, factor)
+        return self
+
+    def __add__(self, other: Values) -> Values:
+        return Values(tuple(p + q for p, q in zip(self.polys, other.polys)))
+
+    def __mul__(self, other: Union[Values, Scalar]) -> Values:
+        if not isinstance(other, Values):
+            return Values(tuple(p * other for p in self.polys))
+        return Values(tuple(p * q for p, q in zip(self.polys, other.polys)))
+
+
+class JointSpecialization(Specialization):
+    """
+    Several univariate specializations evaluated in one pass of
+    deletion-contraction. Most of the work is spent on blocks and
+    canonical forms, which do not depend on the point, so evaluation
+    at all points costs about as much as at one of them.
+    Values of the engine are Values
+    """
+    __slots__ = ("specs",)
+
+    def __init__(self, specs: list[Specialization]):
+        """
+        Constructor for joint specialization
+        :param specs: univariate specializations
+        """
+        self.specs = specs
+        self.name = "+".join(spec.name for spec in specs)
+        self.symbols = None
+        self.one = Values(tuple(spec.one for spec in specs))
+        self.x = Values(tuple(spec.x for spec in specs))
+        self.y = Values(tuple(spec.y for spec in specs))
+
+
+# Tutte polynomial itself, x and y are kept
+TUTTE = Specialization(
+    "tutte", [x, y],
+    LaurentPoly.monomial((1, 0)), LaurentPoly.monomial((0, 1)),
+)
+
+# Critical configuration polynomial is T(1, x)
+CRITICAL = Specialization(
+    "critical", [x],
+    LaurentPoly.monomial((0,)), LaurentPoly.monomial((1,)),
+)
+
+# Ehrhart polynomial is T(x, 1 + 1/x)
+EHRHART = Specialization(
+    "ehrhart", [x],
+    LaurentPoly.monomial((1,)),
+    LaurentPoly.monomial((0,)) + LaurentPoly.monomial((-1,)),
+)
+
+# Critical and Ehrhart polynomials are evaluated together, as both
+# are usually requested for a graph, see evaluate
+SHARED = JointSpecialization([CRITICAL, EHRHART])
+
+# Polynomial computed by the engine: LaurentPoly, or Values for
+# a joint specialization
+Value = Union[LaurentPoly, Values]
+
+
+class TutteCache:
+    """
+    Content-addressed cache of Tutte polynomials. Entries are keyed by
+    canonical forms of graphs, so all isomorphic graphs share an entry.
+    Entries are kept in memory with LRU eviction, and, if
+    TutteCache.directory is set, also persisted to disk. Reading
+    a persistent entry renews it, see TutteCache.prune
+    """
+    def __init__(self, maxsize: int = 128, directory: Optional[Path] = None):
+        """
+        Constructor for Tutte cache
+        :param maxsize: maximal number of entries kept in memory
+        :param directory: directory for persistent entries, None to keep
+        entries in memory only
+        """
+        self.maxsize = maxsize
+        self.directory = directory
+        self.entries: OrderedDict[tuple, LaurentPoly] = OrderedDict()
+        self.lock = threading.Lock()
+
+    def path(self, key: tuple) -> Path:
+        """
+        Get file name for a persistent entry
+        :param key: specialization name and canonical form of graph
+        :return: path to entry file
+        """
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: tuple) -> Optional[LaurentPoly]:
+        """
+        Find Tutte polynomial in memory, then on disk
+        :param key: specialization name and canonical form of graph
+        :return: Tutte polynomial, or None if graph is not cached
+        """
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+        if self.directory is None:
+            return None
+        try:
+            with open(self.path(key), "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if data["key"] != repr(key):
+            return None
+        try:
+            os.utime(self.path(key))
+        except OSError:
+            pass
+        poly = LaurentPoly({
+            tuple(exps): int(c) for exps, c in data["terms"]
+        })
+        self.put(key, poly, persist=False)
+        return poly
+
+    def put(self, key: tuple, poly: LaurentPoly, persist: bool = True) -> None:
+        """
+        Store Tutte polynomial
+        :param key: specialization name and canonical form of graph
+        :param poly: evaluated Tutte polynomial
+        :param persist: also write entry to disk, if directory is set
+        :return: None
+        """
+        with self.lock:
+            self.entries[key] = poly
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        if not persist or self.directory is None:
+            return
+        config.atomic_write(self.path(key), json.dumps({
+            "key": repr(key),
+            "terms": [[list(exps), str(c)] for exps, c in poly.terms.items()],
+        }))
+
+    def prune(self, max_age: float) -> None:
+        """
+        Remove persistent entries and leftover temporary files not
+        used for max_age seconds
+        :param max_age: age in seconds
+        :return: None
+        """
+        if self.directory is None:
+            return
+        config.prune_older_than(self.directory, max_age, (".json",))
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+cache = TutteCache()
+
+
+def enable_disk_cache(directory: Optional[Path] = None,
+                      max_age: float = CACHE_MAX_AGE) -> None:
+    """
+    Persist Tutte polynomials to disk. Removes outdated entries
+    :param directory: directory for cache entries, default is
+    tutte directory in backend cache
+    :param max_age: number of seconds after the last use when
+    an entry is outdated
+    :return: None
+    """
+    cache.directory = directory if directory is not None else config.CACHE_DIR / f"tutte-v{CACHE_VERSION}"
+    cache.prune(max_age)
+
+
+def geometric(spec: Specialization, base: Value,
+              first: int, last: int) -> Value:
+    """
+    Compute base^first + ... + base^last
+    :param spec: specialization, polynomials are in its symbols
+    :param base: polynomial
+    :param first: first power
+    :param last: last power
+    :return: sum of powers, zero if last < first
+    """
+    res = spec.one * 0
+    power = spec.one
+    for i in range(last + 1):
+        if i >= first:
+            res.add(power)
+        power = power * base
+    return res
+
+
+def blocks(edges: Edges) -> list[Edges]:
+    """
+    Split a loopless multigraph into biconnected components with
+    Tarjan low-link search. A bridge is a block with a single edge
+    :param edges: edges as pairs of vertices
+    :return: list of blocks, every block is a list of edges
+    """
+    adjacency: dict[int, list[tuple[int, int]]] = {}
+    for eid, (u, v) in enumerate(edges):
+        adjacency.setdefault(u, []).append((eid, v))
+        adjacency.setdefault(v, []).append((eid, u))
+    disc: dict[int, int] = {}
+    low: dict[int, int] = {}
+    res = []
+    for root in adjacency:
+        if root in disc:
+            continue
+        disc[root] = low[root] = len(disc)
+        stack = [(root, -1, iter(adjacency[root]))]
+        edge_stack: list[int] = []
+        while stack:
+            u, parent_edge, it = stack[-1]
+            for eid, w in it:
+                if eid == parent_edge:
+                    continue
+                if w not in disc:
+                    disc[w] = low[w] = len(disc)
+                    edge_stack.append(eid)
+                    stack.append((w, eid, iter(adjacency[w])))
+                    break
+                if disc[w] < disc[u]:
+                    # Back edge, it is seen from its lower end only
+                    low[u] = min(low[u], disc[w])
+                    edge_stack.append(eid)
+            else:
+                stack.pop()
+                if not stack:
+                    continue
+                p = stack[-1][0]
+                low[p] = min(low[p], low[u])
+                if low[u] >= disc[p]:
+                    block = []
+                    while True:
+                        eid = edge_stack.pop()
+                        block.append(edges[eid])
+                        if eid == parent_edge:
+                            break
+                    res.append(block)
+    return res
+
+
+def tutte_of_edges(edges: Edges, spec: Specialization = TUTTE) -> Value:
+    """
+    Compute Tutte polynomial of a multigraph. Loops and bridges
+    are factored out (y per loop, x per bridge), and the polynomial is
+    a product over 2-connected blocks
+    :param edges: edges as pairs of vertices
+    :param spec: point of evaluation
+    :return: evaluated Tutte polynomial
+    """
+    res = spec.one
+    loops = sum(1 for u, v in edges if u == v)
+    if loops:
+        res = res * geometric(spec, spec.y, loops, loops)
+    for block in blocks([(u, v) for u, v in edges if u != v]):
+        if len(block) == 1:
+            res = res * spec.x
+        else:
+            res = res * block_tutte(block, spec)
+    return res
+
+
+def block_tutte(block: Edges, spec: Specialization) -> Value:
+    """
+    Compute Tutte polynomial of a 2-connected loopless multigraph,
+    memoized on its canonical form
+    :param block: edges as pairs of vertices
+    :param spec: point of evaluation
+    :return: evaluated Tutte polynomial
+    """
+    vertices = sorted({v for edge in block for v in edge})
+    index = {v: i for i, v in enumerate(vertices)}
+    form = canonical_form(
+        len(vertices), [(index[u], index[v]) for u, v in block]
+    )
+    return canonical_block_tutte(form.key, spec)
+
+
+@lru_cache(maxsize=BLOCK_CACHE_SIZE)
+def canonical_block_tutte(key: tuple, spec: Specialization) -> Value:
+    """
+    Compute Tutte polynomial of a 2-connected loopless multigraph,
+    given by canonical form. Parallel edges are merged into classes,
+    series paths are reduced before deletion-contraction.
+    Returned polynomials are shared and must not be modified
+    :param key: canonical form key, see canonical_form
+    :param spec: point of evaluation
+    :return: evaluated Tutte polynomial
+    """
+    check_cancelled()
+    labels, canonical_edges = key
+    n = len(labels)
+    edges = [(u, v) for u, v, _ in canonical_edges]
+    multiplicity: dict[tuple[int, int], int] = {}
+    for edge in edges:
+        multiplicity[edge] = multiplicity.get(edge, 0) + 1
+    neighbours: dict[int, list[int]] = {v: [] for v in range(n)}
+    for u, v in edges:
+        neighbours[u].append(v)
+        neighbours[v].append(u)
+
+    # k parallel edges between two vertices
+    if n == 2:
+        return spec.x + geometric(spec, spec.y, 1, len(edges) - 1)
+
+    # Cycle of length k
+    if all(len(neighbours[v]) == 2 for v in range(n)):
+        return geometric(spec, spec.x, 1, n - 1) + spec.y
+
+    # Series reduction: path u - ... - v through vertices of degree 2
+    # is replaced by a single edge, T = T(G_1) + (x + ... + x^(k-1)) T(G - path)
+    middle = next((v for v in range(n) if len(neighbours[v]) == 2), None)
+    if middle is not None:
+        path = {middle}
+        ends = []
+        for w in neighbours[middle]:
+            prev = middle
+            while len(neighbours[w]) == 2:
+                path.add(w)
+                prev, w = w, next(u for u in neighbours[w] if u != prev)
+            ends.append(w)
+        length = len(path) + 1
+        rest = [(u, v) for u, v in edges if u not in path and v not in path]
+        return (
+            tutte_of_edges(rest + [(ends[0], ends[1])], spec)
+            + geometric(spec, spec.x, 1, length - 1) * tutte_of_edges(rest, spec)
+        )
+
+    # Parallel class reduction on the largest class between u and v,
+    # T = T(G - class) + (1 + y + ... + y^(k-1)) T(G / class)
+    (u, v), k = max(multiplicity.items(), key=lambda item: item[1])
+    deleted = [edge for edge in edges if edge != (u, v)]
+    contracted = [
+        (u if a == v else a, u if b == v else b) for a, b in deleted
+    ]
+    return (
+        tutte_of_edges(deleted, spec)
+        + geometric(spec, spec.y, 0, k - 1) * tutte_of_edges(contracted, spec)
+    )
+
+
+def specialize(poly: LaurentPoly, spec: Specialization) -> LaurentPoly:
+    """
+    Evaluate bivariate Tutte polynomial at a specialization
+    :param poly: Tutte polynomial in x and y, see TUTTE
+    :param spec: point of evaluation
+    :return: evaluated Tutte polynomial
+    """
+    x_powers = [spec.one]
+    y_powers = [spec.one]
+    res = LaurentPoly()
+    for (i, j), coefficient in poly.terms.items():
+        check_cancelled()
+        while len(x_powers) <= i:
+            x_powers.append(x_powers[-1] * spec.x)
+        while len(y_powers) <= j:
+            y_powers.append(y_powers[-1] * spec.y)
+        res.add(x_powers[i] * y_powers[j], coefficient)
+    return res
+
+
+def evaluate(cg: CompactGraph, spec: Specialization,
+             token: Optional[CancellationToken] = None,
+             progress: Optional[ProgressCallback] = None) -> LaurentPoly:
+    """
+    Evaluate Tutte polynomial of a graph, shared by all polynomial
+    builders through the cache. Specializations are evaluated directly,
+    which is faster than building the bivariate polynomial, unless the
+    bivariate polynomial of the graph is already cached. Specializations
+    of SHARED are evaluated and cached together, so a request for one
+    of them after another is answered by the cache
+    :param cg: graph representation
+    :param spec: point of evaluation
+    :param token: cancellation token, checked at every step of
+    deletion-contraction. Cancelled evaluation raises
+    backend.progress.Cancelled
+    :param progress: progress callback. Size of deletion-contraction
+    is not known in advance, so only start and end are reported
+    :return: evaluated Tutte polynomial, must not be modified
+    """
+    tracker = Progress(callback=progress, token=token)
+    tracker.report()
+    form_key = graph_form(cg).key
+    key = (spec.name, form_key)
+    poly = cache.get(key)
+    if poly is None:
+        bivariate = cache.get((TUTTE.name, form_key)) if spec is not TUTTE else None
+        edges = [(edge.begin, edge.end) for edge in cg.edges]
+        with cancellable(token):
+            if bivariate is not None:
+                poly = specialize(bivariate, spec)
+            elif spec in SHARED.specs:
+                values = tutte_of_edges(edges, SHARED).polys
+                for other, value in zip(SHARED.specs, values):
+                    if other is not spec:
+                        cache.put((other.name, form_key), value)
+                poly = values[SHARED.specs.index(spec)]
+            else:
+                poly = tutte_of_edges(edges, spec)
+        cache.put(key, poly)
+    tracker.finish()
+    return poly
+
+
+def tutte_polynomial(cg: CompactGraph) -> sympy.Expr:
+    """
+    Get Tutte polynomial of a graph
+    :param cg: graph representation
+    :return: Tutte polynomial in x and y
+    """
+    return evaluate(cg, TUTTE).as_expr(TUTTE.symbols)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Iterator, Optional, TextIO
+
+from backend import critical, ehrhart, pc_polynomial, tutte
+from backend.graph_io import BINARY_SUFFIX, read_graph
+
+# Polynomial name -> (builder, result formatter)
+POLYNOMIALS: dict[str, tuple[Callable, Callable]] = {
+    "pc": (pc_polynomial.build, pc_polynomial.prepare_for_saving),
+    "critical": (critical.build, str),
+    "ehrhart": (ehrhart.build, str),
+}
+
+# Polynomials computed in one task for a graph, so that they share
+# one evaluation of the Tutte polynomial, see tutte.SHARED
+SHARED = ("critical", "ehrhart")
+
+
+def find_graphs(patterns: list[str]) -> Iterator[Path]:
+    """
+    List graph files given by directories, glob patterns or file names
+    :param patterns: directories (searched recursively for .graph and
+    binary graph files), globs or files
+    :return: paths to graph files, each path once
+    """
+    seen = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths = sorted(
+                path for path in Path(pattern).rglob("*")
+                if path.suffix in (".graph", BINARY_SUFFIX)
+            )
+        else:
+            paths = [Path(p) for p in sorted(glob.glob(pattern, recursive=True))]
+        for path in paths:
+            if path not in seen:
+                seen.add(path)
+                yield path
+
+
+def init_worker(disk_cache: bool) -> None:
+    """
+    Initializer of worker processes
+    :param disk_cache: persist Tutte polynomials to disk
+    :return: None
+    """
+    if disk_cache:
+        tutte.enable_disk_cache()
+
+
+def compute(path: Path, names: list[str],
+            profile: Optional[Path] = None) -> list[dict]:
+    """
+    Compute polynomials for one graph file, in a worker process
+    :param path: path to graph file
+    :param names: polynomial names, keys of POLYNOMIALS
+    :param profile: directory for cProfile statistics of PC polynomial
+    builds, see pc_polynomial.build_with_stats. None to not profile
+    :return: result records, one per polynomial
+    """
+    records = []
+    for name in names:
+        record = {"file": str(path), "polynomial": name}
+        start = time.perf_counter()
+        try:
+            builder, formatter = POLYNOMIALS[name]
+            if name == "pc" and profile is not None:
+                poly, stats = pc_polynomial.build_with_stats(
+                    *read_graph(path), profile=profile / f"{path.name}.pstats"
+                )
+                record["result"] = formatter(poly)
+                record["stats"] = stats.as_dict()
+            else:
+                record["result"] = formatter(builder(*read_graph(path)))
+        except Exception as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+        record["seconds"] = round(time.perf_counter() - start, 6)
+        records.append(record)
+    return records
+
+
+def group(names: list[str]) -> list[list[str]]:
+    """
+    Split polynomials into tasks for one graph, see SHARED
+    :param names: polynomial names, keys of POLYNOMIALS
+    :return: lists of names computed in one task
+    """
+    shared = [name for name in names if name in SHARED]
+    groups = [[name] for name in names if name not in SHARED]
+    if shared:
+        groups.append(shared)
+    return groups
+
+
+def run(paths: Iterator[Path], names: list[str], output: TextIO,
+        jobs: int, disk_cache: bool = True,
+        profile: Optional[Path] = None) -> int:
+    """
+    Compute polynomials for all graphs in parallel. Results are written
+    to output as JSON lines as soon as they are ready, in order
+    of completion. Tasks which crash their worker process are written
+    as failed, and the rest are computed in a new pool
+    :param paths: graph files
+    :param names: polynomial names, keys of POLYNOMIALS
+    :param output: stream for results
+    :param jobs: number of worker processes
+    :param disk_cache: persist Tutte polynomials to disk
+    :param profile: directory for profiles of PC polynomial builds,
+    see compute
+    :return: number of failed computations
+    """
+    groups = group(names)
+    tasks = ((path, task_names) for path in paths for task_names in groups)
+    failed = 0
+    # Future -> its task (path, names)
+    pending: dict[Future, tuple[Path, list[str]]] = {}
+
+    def start() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=jobs, initializer=init_worker, initargs=(disk_cache,)
+        )
+
+    def write(future: Future) -> bool:
+        nonlocal failed
+        path, names = pending.pop(future)
+        broken = False
+        try:
+            records = future.result()
+        except Exception as e:
+            broken = isinstance(e, BrokenProcessPool)
+            records = [
+                {
+                    "file": str(path), "polynomial": name,
+                    "error": f"{type(e).__name__}: {e}",
+                }
+                for name in names
+            ]
+        for record in records:
+            failed += "error" in record
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+        return broken
+
+    executor = start()
+    try:
+        exhausted = False
+        while pending or not exhausted:
+            # Keep a bounded number of tasks in flight, lists of
+            # graphs may be long
+            while not exhausted and len(pending) < 4 * jobs:
+                task = next(tasks, None)
+                if task is None:
+                    exhausted = True
+                else:
+                    pending[executor.submit(compute, *task, profile)] = task
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            if any([write(future) for future in done]):
+                # A worker process died, e.g. out of memory. All tasks in
+                # flight fail with it, as the culprit is unknown, and the
+                # rest go to a new pool
+                for future in wait(pending).done:
+                    write(future)
+                executor.shutdown(wait=False)
+                executor = start()
+    finally:
+        executor.shutdown()
+    return failed
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Подсчёт многочленов для набора графов без графического интерфейса"
+    )
+    parser.add_argument(
+        "graphs", nargs="+",
+        help="каталоги, шаблоны или файлы .graph и .bgraph",
+    )
+    parser.add_argument(
+        "-p", "--polynomials", nargs="+", choices=list(POLYNOMIALS),
+        default=list(POLYNOMIALS), help="многочлены для подсчёта",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-",
+        help="файл для результатов (JSON lines), по умолчанию stdout",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="число процессов",
+    )
+    parser.add_argument(
+        "--no-disk-cache", action="store_true",
+        help="не сохранять многочлены Тутта на диск",
+    )
+    parser.add_argument(
+        "--profile", metavar="DIR",
+        help="каталог для профилей cProfile многочленов pc (файл.pstats)",
+    )
+    args = parser.parse_args(argv)
+
+    paths = find_graphs(args.graphs)
+    profile = None
+    if args.profile:
+        profile = Path(args.profile)
+        profile.mkdir(parents=True, exist_ok=True)
+    if args.output == "-":
+        failed = run(paths, args.polynomials, sys.stdout, args.jobs,
+                     not args.no_disk_cache, profile)
+    else:
+        with open(args.output, "w", encoding="utf-8") as output:
+            failed = run(paths, args.polynomials, output, args.jobs,
+                         not args.no_disk_cache, profile)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import sympy.core.cache
+
+from backend import critical, ehrhart, graph_utils, pc_polynomial, tutte
+from backend.symplex_counting import todd, todd_precalc
+
+# Built-in example graphs
+EXAMPLES = {
+    "single_edge": graph_utils.get_single_edge,
+    "bamboo_len_2": graph_utils.get_bamboo_len_2,
+    "triangle": graph_utils.get_triangle,
+    "triangle_with_tail": graph_utils.get_triangle_with_tail,
+    "H": graph_utils.get_H,
+}
+
+# Scaling families: name -> (graph generator, parameters, quick parameters)
+FAMILIES = {
+    "multiedge": (graph_utils.get_multiedge, [(2,), (4,), (6,), (8,), (10,)], [(2,), (4,)]),
+    "path": (graph_utils.get_path, [(2,), (4,), (8,), (12,)], [(2,), (4,)]),
+    "cycle": (graph_utils.get_cycle, [(3,), (5,), (7,), (9,)], [(3,), (5,)]),
+    "wheel": (graph_utils.get_wheel, [(3,), (4,), (5,)], [(3,)]),
+    "grid": (graph_utils.get_grid, [(2, 2), (2, 3), (3, 3)], [(2, 2)]),
+}
+
+# Todd classes td(s, n): (s, n) pairs, quick pairs
+TODD = ([(4, 4), (6, 6), (8, 8), (10, 6)], [(4, 4), (6, 6)])
+
+# Slowdowns below this number of seconds are timer noise
+NOISE_SECONDS = 0.002
+
+
+@contextmanager
+def cold_caches() -> Iterator[None]:
+    """
+    Drop all in-memory caches of the backend and point the on-disk
+    cache of Todd classes to a new empty directory for the block, so
+    that a measurement starts cold
+    :return: context manager
+    """
+    reset_caches()
+    saved = todd_precalc.CACHE_DIR
+    with tempfile.TemporaryDirectory() as cache_dir:
+        todd_precalc.CACHE_DIR = Path(cache_dir)
+        try:
+            yield
+        finally:
+            todd_precalc.CACHE_DIR = saved
+
+
+def reset_caches() -> None:
+    """
+    Drop all in-memory caches of the backend and of sympy
+    :return: None
+    """
+    sympy.core.cache.clear_cache()
+    tutte.cache.clear()
+    tutte.canonical_block_tutte.cache_clear()
+    todd._coefficients.clear()
+    todd.todd_series.cache_clear()
+    todd.log_todd_series.cache_clear()
+    todd.rk_template.cache_clear()
+
+
+def cases(quick: bool) -> Iterator[tuple[str, Callable[[], object]]]:
+    """
+    List benchmark cases
+    :param quick: use small parameters only
+    :return: pairs (case name, function to measure)
+    """
+    graphs = [(name, generator()) for name, generator in EXAMPLES.items()]
+    for family, (generator, params, quick_params) in FAMILIES.items():
+        for param in quick_params if quick else params:
+            name = f"{family}({', '.join(map(str, param))})"
+            graphs.append((name, generator(*param)))
+
+    for name, (n, m, g) in graphs:
+        # Numeric PC polynomial with unit lengths, symbolic one only
+        # for the small examples
+        yield (
+            f"pc/{name}",
+            lambda n=n, m=m, g=g: pc_polynomial.build(n, m, g, lengths=[1] * m),
+        )
+        if name in EXAMPLES:
+            yield f"pc_symbolic/{name}", lambda n=n, m=m, g=g: pc_polynomial.build(n, m, g)
+        yield f"critical/{name}", lambda n=n, m=m, g=g: critical.build(n, m, g)
+        yield f"ehrhart/{name}", lambda n=n, m=m, g=g: ehrhart.build(n, m, g)
+
+    params, quick_params = TODD
+    for s, n in quick_params if quick else params:
+        yield (
+            f"todd/td({s}, {n})",
+            lambda s=s, n=n: todd.td(s, graph_utils.get_symbols(n)),
+        )
+
+
+def measure(function: Callable[[], object], repeat: int) -> dict:
+    """
+    Measure wall time and peak memory of a function. Every run starts
+    with cold caches, see cold_caches. An untimed run goes first, so that
+    imports and other one-time setup are not measured. Time is the best
+    of repeat runs, memory is measured in a separate run under tracemalloc
+    :param function: function to measure
+    :param repeat: number of timed runs
+    :return: measurement record
+    """
+    with cold_caches():
+        function()
+    times = []
+    for _ in range(repeat):
+        with cold_caches():
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+    with cold_caches():
+        tracemalloc.start()
+        try:
+            function()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {"seconds": min(times), "peak_bytes": peak}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compare results with baseline
+    :param results: case name -> measurement record
+    :param baseline: case name -> measurement record
+    :param tolerance: allowed relative slowdown, e.g. 0.2 for 20%
+    :return: names of regressed cases
+    """
+    regressions = []
+    for name, record in results.items():
+        if name not in baseline:
+            continue
+        old = baseline[name]["seconds"]
+        ratio = record["seconds"] / old if old else float("inf")
+        mark = ""
+        if ratio > 1 + tolerance and record["seconds"] - old > NOISE_SECONDS:
+            mark = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:40} {old:10.4f}s -> {record['seconds']:10.4f}s  x{ratio:.2f}{mark}")
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Замеры времени и памяти на примерах и семействах графов"
+    )
+    parser.add_argument("-o", "--output", help="файл для результатов (JSON)")
+    parser.add_argument("-b", "--baseline", help="файл с результатами для сравнения")
+    parser.add_argument(
+        "-t", "--tolerance", type=float, default=0.2,
+        help="допустимое относительное замедление",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="число запусков")
+    parser.add_argument("-k", "--filter", default="*", help="шаблон имён замеров")
+    parser.add_argument("--quick", action="store_true", help="только малые графы")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, function in cases(args.quick):
+        if not fnmatch.fnmatch(name, args.filter):
+            continue
+        results[name] = measure(function, args.repeat)
+        print(
+            f"{name:40} {results[name]['seconds']:10.4f}s "
+            f"{results[name]['peak_bytes'] / 2 ** 20:10.2f} MiB",
+            flush=True,
+        )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)["results"]
+        if compare(results, baseline, args.tolerance):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
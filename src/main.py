@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 
 from PyQt5.QtWidgets import QApplication
@@ -5,6 +6,8 @@ from PyQt5.QtWidgets import QApplication
 from ui.mainwindow import Window
 
 if __name__ == "__main__":
+    # Backend may use a process pool, which needs this in frozen builds
+    multiprocessing.freeze_support()
     App = QApplication(sys.argv)
     window = Window()
     window.show()
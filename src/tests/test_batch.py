@@ -0,0 +1,36 @@
+import json
+from pathlib import Path
+
+import batch
+
+TRIANGLE = "3 3\n0 0 a\n1 0 b\n0 1 c\na b t_0\nb c t_1\nc a t_2\n"
+
+# Edge refers to a node which is not listed
+MALFORMED = "2 1\n0 0 a\n1 1 b\na z t_0\n"
+
+
+def test_batch_writes_results_and_errors(tmp_path):
+    graphs = tmp_path / "graphs"
+    graphs.mkdir()
+    (graphs / "triangle.graph").write_text(TRIANGLE)
+    (graphs / "malformed.graph").write_text(MALFORMED)
+    output = tmp_path / "results.jsonl"
+
+    code = batch.main([
+        str(graphs), "-p", "critical", "ehrhart", "-o", str(output),
+        "-j", "2", "--no-disk-cache",
+    ])
+
+    assert code == 1
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    results = {
+        (Path(record["file"]).name, record["polynomial"]): record
+        for record in records
+    }
+    assert len(records) == len(results) == 4
+    assert results["triangle.graph", "critical"]["result"] == "x + 2"
+    assert results["triangle.graph", "ehrhart"]["result"] == "x**2 + x + 1 + 1/x"
+    for name in ("critical", "ehrhart"):
+        record = results["malformed.graph", name]
+        assert "result" not in record
+        assert record["error"] == "ValueError: edge refers to unknown node z"
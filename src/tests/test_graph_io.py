@@ -0,0 +1,75 @@
+import pytest
+
+from backend import graph_io
+
+TEXT = (
+    "3 4\n"
+    "0.0 0.0 a\n"
+    "120.5 -40.25 b\n"
+    "60.0 80.0 вершина\n"
+    "a b t_0\n"
+    "b вершина t_1\n"
+    "вершина a t_2\n"
+    "a b t_3\n"
+)
+
+NODES = [(0.0, 0.0, "a"), (120.5, -40.25, "b"), (60.0, 80.0, "вершина")]
+EDGES = [(0, 1, "t_0"), (1, 2, "t_1"), (2, 0, "t_2"), (0, 1, "t_3")]
+
+
+def test_text_round_trip():
+    nodes, edges = graph_io.parse_layout(TEXT.splitlines())
+    assert (nodes, edges) == (NODES, EDGES)
+    assert "".join(graph_io.format_layout(nodes, edges)) == TEXT
+
+
+def test_binary_round_trip():
+    data = graph_io.pack_layout(NODES, EDGES)
+    assert data.startswith(graph_io.BINARY_MAGIC)
+    assert graph_io.unpack_layout(data) == (NODES, EDGES)
+    assert graph_io.pack_layout(*graph_io.unpack_layout(data)) == data
+
+
+def test_empty_graph_round_trip():
+    assert graph_io.parse_layout(["0 0"]) == ([], [])
+    assert graph_io.unpack_layout(graph_io.pack_layout([], [])) == ([], [])
+
+
+@pytest.mark.parametrize("suffix", [".graph", graph_io.BINARY_SUFFIX])
+def test_file_round_trip(suffix, tmp_path):
+    path = tmp_path / f"example{suffix}"
+    graph_io.write_layout(path, NODES, EDGES)
+    assert path.read_bytes().startswith(graph_io.BINARY_MAGIC) == graph_io.is_binary(path)
+    assert graph_io.read_layout(path) == (NODES, EDGES)
+    n, m, g = graph_io.read_graph(path)
+    assert (n, m) == (3, 4)
+
+
+def test_text_unknown_node():
+    with pytest.raises(ValueError, match="unknown node c"):
+        graph_io.parse_layout(TEXT.replace("b вершина t_1", "b c t_1").splitlines())
+
+
+def test_text_truncated():
+    with pytest.raises(ValueError):
+        graph_io.parse_layout(TEXT.splitlines()[:-1])
+
+
+def test_binary_unknown_node():
+    data = graph_io.pack_layout(NODES, [(0, 3, "t_0")])
+    with pytest.raises(ValueError, match="unknown node"):
+        graph_io.unpack_layout(data)
+
+
+def test_binary_truncated():
+    data = graph_io.pack_layout(NODES, EDGES)
+    for length in range(len(data)):
+        with pytest.raises(ValueError):
+            graph_io.unpack_layout(data[:length])
+
+
+def test_binary_unsupported_version():
+    data = bytearray(graph_io.pack_layout(NODES, EDGES))
+    data[len(graph_io.BINARY_MAGIC)] = graph_io.BINARY_VERSION + 1
+    with pytest.raises(ValueError, match="unsupported"):
+        graph_io.unpack_layout(bytes(data))
@@ -0,0 +1,244 @@
+import pstats
+import sys
+
+import pytest
+import sympy
+
+from backend import graph_utils, pc_polynomial, progress
+from backend.checkpoint import Checkpoint
+from backend.graph_utils import CompactGraph, Edge, Graph
+from backend.progress import CancellationToken, Cancelled
+from backend.symplex_counting import todd_precalc
+
+# Example graphs: name -> graph generator
+GRAPHS = {
+    "triangle": graph_utils.get_triangle,
+    "triangle_with_tail": graph_utils.get_triangle_with_tail,
+    "multiedge(3)": lambda: graph_utils.get_multiedge(3),
+    "path(3)": lambda: graph_utils.get_path(3),
+    "cycle(4)": lambda: graph_utils.get_cycle(4),
+    "wheel(3)": lambda: graph_utils.get_wheel(3),
+    "grid(2, 2)": lambda: graph_utils.get_grid(2, 2),
+}
+
+# Values computed before the T-join pipeline, with length of edge t_i
+# equal to i + 1
+EXPECTED = {
+    "triangle": "T**2/4 + 11*T/12 - 1/6",
+    "triangle_with_tail": "T**4/1536 + T**3/120 + 125*T**2/384 + 433*T/384 + 3253/11520",
+    "multiedge(3)": "T**2/2 + 11*T/6 + 17/12",
+    "path(3)": "T**2/8 + T/12 + 41/24",
+    "cycle(4)": "5*T**3/288 + 35*T**2/192 - 5*T/9 + 811/144",
+    "wheel(3)": (
+        "7*T**5/115200 + 35*T**4/13824 + 539*T**3/13824 + 20021*T**2/69120"
+        " - 320923*T/691200 + 1914713/138240"
+    ),
+    "grid(2, 2)": "5*T**3/288 + 35*T**2/192 - 13*T/72 + 2875/576",
+}
+
+# Symbolic value computed before the T-join pipeline
+EXPECTED_TRIANGLE = (
+    "T**2*(t_0 + t_1 + t_2)/(4*t_0*t_1*t_2)"
+    " + T*(t_0*t_1 + t_0*t_2 + t_1*t_2)/(2*t_0*t_1*t_2)"
+    " + (t_0**2*t_1 - 11*t_0**2*t_2 + t_0*t_1**2 + 12*t_0*t_1*t_2"
+    " - 11*t_0*t_2**2 + t_1**2*t_2 + t_1*t_2**2)/(24*t_0*t_1*t_2)"
+)
+
+
+class Crash(Exception):
+    pass
+
+
+class CrashingCheckpoint(Checkpoint):
+    """
+    Checkpoint which saves every part and stops the build after a few
+    """
+    def __init__(self, directory, saves):
+        super().__init__(directory, interval=0)
+        self.saves = saves
+
+    def save(self, key, state, force=False):
+        super().save(key, state, force)
+        self.saves -= 1
+        if not self.saves:
+            raise Crash()
+
+
+class Stale:
+    """
+    Saved in a checkpoint, then removed, as after an update
+    """
+
+
+@pytest.fixture(autouse=True)
+def todd_cache(tmp_path_factory, monkeypatch):
+    # Symbolic builds must not touch the user cache
+    monkeypatch.setattr(todd_precalc, "CACHE_DIR", tmp_path_factory.mktemp("todd"))
+
+
+def substitutions(m):
+    return {t: i + 1 for i, t in enumerate(graph_utils.get_symbols(m))}
+
+
+def with_lengths(name):
+    """
+    Example graph with length of edge t_i equal to i + 1
+    """
+    n, m, g = GRAPHS[name]()
+    lengths = substitutions(m)
+    numeric = Graph()
+    for edges in g.edges.values():
+        edge = edges[0]
+        numeric.add_edge(Edge(edge.begin, edge.end, lengths[edge.t]))
+    return n, m, numeric
+
+
+def same(poly, expected):
+    return sympy.simplify(poly.as_expr() - sympy.sympify(expected)) == 0
+
+
+@pytest.mark.parametrize("name", list(GRAPHS))
+def test_numeric_matches_old_values(name):
+    assert same(pc_polynomial.build(*with_lengths(name)), EXPECTED[name])
+
+
+@pytest.mark.parametrize("name", list(GRAPHS))
+def test_symbolic_matches_old_values(name):
+    n, m, g = GRAPHS[name]()
+    poly = pc_polynomial.build(n, m, g).as_expr().subs(substitutions(m))
+    assert sympy.simplify(poly - sympy.sympify(EXPECTED[name])) == 0
+
+
+def test_symbolic_triangle():
+    assert same(pc_polynomial.build(*graph_utils.get_triangle()), EXPECTED_TRIANGLE)
+
+
+@pytest.mark.parametrize("name", ["cycle(4)", "wheel(3)", "grid(2, 2)"])
+def test_symmetry_and_memo_keep_result(name):
+    # Equal lengths, so that subgraph orbits are not trivial
+    n, m, g = GRAPHS[name]()
+    expected = pc_polynomial.build(n, m, g, lengths=[1] * m, memoize=False)
+    assert pc_polynomial.build(n, m, g, lengths=[1] * m) == expected
+    assert pc_polynomial.build(n, m, g, lengths=[1] * m, symmetry=True) == expected
+
+
+def test_memo_turns_off_without_hits(monkeypatch):
+    monkeypatch.setattr(pc_polynomial, "MEMO_PROBE_LOOKUPS", 8)
+    # Distinct lengths, so that subgraphs are almost never isomorphic
+    n, m, g = with_lengths("wheel(3)")
+    expected = pc_polynomial.build(n, m, g, memoize=False)
+    poly, stats = pc_polynomial.build_with_stats(n, m, g)
+    assert poly == expected
+    assert stats.counters["memo_hits"] + stats.counters["memo_misses"] == 8
+
+
+def test_explicit_lengths_match_edge_lengths():
+    n, m, g = GRAPHS["triangle"]()
+    lengths = [0.1, 1, 1]
+    numeric = Graph()
+    for edges, t in zip(g.edges.values(), lengths):
+        edge = edges[0]
+        numeric.add_edge(Edge(edge.begin, edge.end, t))
+    expected = pc_polynomial.build(n, m, numeric)
+    assert pc_polynomial.build(n, m, g, lengths=lengths) == expected
+    assert same(expected, "21*T**2/4 + 6*T + 7/8")
+
+
+@pytest.mark.parametrize("lengths", [[1, 1], [1, 1, 1, 1], [1, 1, sympy.Symbol("t")]])
+def test_invalid_explicit_lengths(lengths):
+    with pytest.raises(ValueError):
+        pc_polynomial.build(*GRAPHS["triangle"](), lengths=lengths)
+
+
+@pytest.mark.parametrize("name", ["triangle_with_tail", "wheel(3)"])
+@pytest.mark.parametrize("symbolic", [False, True])
+def test_parts_keep_result(name, symbolic, tmp_path):
+    n, m, g = GRAPHS[name]() if symbolic else with_lengths(name)
+    expected = pc_polynomial.build(n, m, g)
+    assert pc_polynomial.build(n, m, g, workers=2) == expected
+    assert pc_polynomial.build(n, m, g, checkpoint=Checkpoint(tmp_path)) == expected
+    assert not list(tmp_path.iterdir())
+
+
+def test_stale_checkpoint_is_removed(tmp_path, monkeypatch):
+    checkpoint = Checkpoint(tmp_path)
+    checkpoint.save("key", Stale(), force=True)
+    monkeypatch.delattr(sys.modules[__name__], "Stale")
+    assert checkpoint.load("key") is None
+    assert not checkpoint.path("key").exists()
+
+
+@pytest.mark.parametrize("symbolic", [False, True])
+def test_checkpoint_resume(symbolic, tmp_path):
+    n, m, g = GRAPHS["wheel(3)"]() if symbolic else with_lengths("wheel(3)")
+    expected = pc_polynomial.build(n, m, g)
+    with pytest.raises(Crash):
+        pc_polynomial.build(n, m, g, checkpoint=CrashingCheckpoint(tmp_path, 3))
+    assert len(list(tmp_path.glob("*.ckpt"))) == 1
+    assert pc_polynomial.build(n, m, g, checkpoint=Checkpoint(tmp_path)) == expected
+    assert not list(tmp_path.glob("*.ckpt"))
+
+
+@pytest.mark.parametrize("symbolic", [False, True])
+def test_cancel_from_progress(symbolic, monkeypatch):
+    monkeypatch.setattr(progress, "REPORT_INTERVAL", 0)
+    n, m, g = GRAPHS["wheel(3)"]() if symbolic else with_lengths("wheel(3)")
+    token = CancellationToken()
+    reports = []
+
+    def on_progress(fraction, remaining):
+        reports.append(fraction)
+        token.cancel()
+
+    with pytest.raises(Cancelled):
+        pc_polynomial.build(n, m, g, token=token, progress=on_progress)
+    assert len(reports) == 1
+
+
+def test_progress_reaches_total(monkeypatch):
+    monkeypatch.setattr(progress, "REPORT_INTERVAL", 0)
+    n, m, g = with_lengths("wheel(3)")
+    reports = []
+    pc_polynomial.build(
+        n, m, g, progress=lambda fraction, remaining: reports.append(fraction)
+    )
+    cg = CompactGraph.from_graph(g)
+    subgraphs = sum(1 for _ in pc_polynomial.connected_subgraphs(cg, cg.index[0]))
+    # Every subgraph is reported, the last one completes the work,
+    # then the build reports that it is finished
+    assert reports == [i / subgraphs for i in range(1, subgraphs + 1)] + [1.0]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_stats(workers, tmp_path):
+    n, m, g = with_lengths("wheel(3)")
+    cg = CompactGraph.from_graph(g)
+    subgraphs = sum(1 for _ in pc_polynomial.connected_subgraphs(cg, cg.index[0]))
+    profile = tmp_path / "build.pstats"
+    poly, stats = pc_polynomial.build_with_stats(
+        n, m, g, workers=workers, profile=profile
+    )
+    assert poly == pc_polynomial.build(n, m, g)
+    assert stats.counters["subgraphs"] == subgraphs
+    assert stats.counters["memo_hits"] + stats.counters["memo_misses"] == subgraphs
+    # Enumeration is split into parts for worker processes only
+    assert (stats.counters["parts"] > 1) == (workers > 1)
+    assert stats.counters["routes"] >= stats.counters["patterns"] > 0
+    assert stats.total >= stats.seconds["conversion"] > 0
+    assert pstats.Stats(str(profile)).total_calls > 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parts_progress_reaches_total(workers, tmp_path, monkeypatch):
+    monkeypatch.setattr(progress, "REPORT_INTERVAL", 0)
+    n, m, g = with_lengths("wheel(3)")
+    reports = []
+    poly = pc_polynomial.build(
+        n, m, g, workers=workers, checkpoint=Checkpoint(tmp_path),
+        progress=lambda fraction, remaining: reports.append(fraction),
+    )
+    assert poly == pc_polynomial.build(n, m, g)
+    # Every part is reported, then the build reports that it is finished
+    parts = len(reports) - 1
+    assert parts > 1
+    assert reports == [i / parts for i in range(1, parts + 1)] + [1.0]
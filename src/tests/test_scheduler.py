@@ -0,0 +1,105 @@
+import threading
+import time
+
+import pytest
+
+from backend import critical, graph_utils, tutte
+from backend.progress import Cancelled
+from backend.scheduler import Scheduler, job_key
+
+# Seconds to wait for a callback, worker processes start slowly
+TIMEOUT = 120
+
+
+class Request:
+    """
+    Callbacks of one request, recording what they got
+    """
+    def __init__(self):
+        self.done = threading.Event()
+        self.started = threading.Event()
+        self.ok = None
+        self.result = None
+
+    def on_result(self, ok, result):
+        self.ok, self.result = ok, result
+        self.done.set()
+
+    def on_progress(self, fraction, remaining):
+        self.started.set()
+
+    def wait(self):
+        assert self.done.wait(TIMEOUT)
+        return self.ok, self.result
+
+
+@pytest.fixture
+def scheduler(tmp_path, monkeypatch):
+    # Worker processes must not touch the user cache
+    monkeypatch.setenv("POLYNOMIALS_CACHE_DIR", str(tmp_path))
+    scheduler = Scheduler(workers=1)
+    yield scheduler
+    scheduler.shutdown(grace=0)
+
+
+def long_job(scheduler):
+    """
+    Submit a job that runs for minutes and wait until it is running
+    """
+    request = Request()
+    n, m, g = graph_utils.get_grid(7, 7)
+    subscription = scheduler.submit(
+        "critical", n, m, g, request.on_result, request.on_progress
+    )
+    assert request.started.wait(TIMEOUT)
+    return request, subscription
+
+
+def test_job_key_ignores_vertex_names():
+    _, _, triangle = graph_utils.get_triangle()
+    _, _, cycle = graph_utils.get_cycle(3)
+    assert job_key("critical", triangle) == job_key("critical", cycle)
+    assert job_key("critical", triangle) != job_key("ehrhart", triangle)
+
+
+def test_equal_requests_share_job_and_result(scheduler):
+    n, m, g = graph_utils.get_wheel(3)
+    first, second = Request(), Request()
+    scheduler.submit("critical", n, m, g, first.on_result)
+    scheduler.submit("critical", n, m, g, second.on_result)
+    expected = critical.build(n, m, g)
+    assert first.wait() == (True, expected)
+    assert second.wait() == (True, expected)
+
+    # Finished result is delivered without a job
+    third = Request()
+    scheduler.submit("critical", n, m, g, third.on_result, third.on_progress)
+    assert third.wait() == (True, expected)
+    assert third.started.is_set()
+    assert not scheduler.jobs
+
+
+def test_workers_share_tutte_cache_on_disk(scheduler, tmp_path):
+    n, m, g = graph_utils.get_wheel(4)
+    request = Request()
+    scheduler.submit("ehrhart", n, m, g, request.on_result)
+    assert request.wait()[0]
+    assert list(tmp_path.glob(f"tutte-v{tutte.CACHE_VERSION}/*.json"))
+
+
+def test_cancel(scheduler):
+    request, subscription = long_job(scheduler)
+    subscription.cancel()
+    ok, result = request.wait()
+    assert not ok and isinstance(result, Cancelled)
+    assert not scheduler.jobs
+
+
+def test_shutdown_terminates_running_jobs(scheduler):
+    request, _ = long_job(scheduler)
+    start = time.monotonic()
+    # Worker process is terminated at once, without waiting for a check
+    scheduler.shutdown(grace=0)
+    assert time.monotonic() - start < 10
+    ok, result = request.wait()
+    assert not ok and isinstance(result, Cancelled)
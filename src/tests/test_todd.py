@@ -0,0 +1,78 @@
+from fractions import Fraction
+
+import pytest
+import sympy
+
+from backend.symplex_counting import todd, todd_precalc
+
+# Values of the former hardcoded pre_calc table, td(s, n) in w_1..w_n
+EXPECTED = {
+    (0, 3): "1",
+    (1, 1): "w_1/2",
+    (2, 1): "w_1**2/12",
+    (2, 2): "w_1**2/12 + w_1*w_2/4 + w_2**2/12",
+    (3, 2): "w_1**2*w_2/24 + w_1*w_2**2/24",
+    (4, 2): "-w_1**4/720 + w_1**2*w_2**2/144 - w_2**4/720",
+    (3, 3): (
+        "w_1**2*w_2/24 + w_1**2*w_3/24 + w_1*w_2**2/24 + w_1*w_2*w_3/8"
+        " + w_1*w_3**2/24 + w_2**2*w_3/24 + w_2*w_3**2/24"
+    ),
+    (4, 3): (
+        "-w_1**4/720 + w_1**2*w_2**2/144 + w_1**2*w_2*w_3/48 + w_1**2*w_3**2/144"
+        " + w_1*w_2**2*w_3/48 + w_1*w_2*w_3**2/48 - w_2**4/720"
+        " + w_2**2*w_3**2/144 - w_3**4/720"
+    ),
+}
+
+
+def symbols(n):
+    return list(sympy.symbols(f"w_1:{n + 1}"))
+
+
+@pytest.fixture(autouse=True)
+def cold_cache(tmp_path, monkeypatch):
+    # Todd classes must not touch the user cache
+    monkeypatch.setattr(todd_precalc, "CACHE_DIR", tmp_path / "todd")
+    monkeypatch.setattr(todd, "_coefficients", {})
+    todd.rk_template.cache_clear()
+    yield
+    todd.rk_template.cache_clear()
+
+
+@pytest.mark.parametrize("s, n", list(EXPECTED))
+def test_td_matches_known_values(s, n):
+    expected = sympy.sympify(EXPECTED[s, n])
+    assert sympy.expand(todd.td(s, symbols(n)) - expected) == 0
+
+
+@pytest.mark.parametrize("s, n", list(EXPECTED))
+def test_numeric_td_matches_symbolic(s, n):
+    ws = [Fraction(i + 2, i + 1) for i in range(n)]
+    value = sympy.sympify(EXPECTED[s, n]).subs(dict(zip(symbols(n), ws)))
+    assert todd.td(s, ws) == Fraction(int(value.p), int(value.q))
+
+
+@pytest.mark.parametrize("k", [1, 2, 3])
+def test_rk_template_matches_coefficients(k):
+    ws = [Fraction(i + 2, i + 1) for i in range(k)]
+    for poly, coefficient in zip(todd.rk_template(k), todd.rk_coefficients(k, ws)):
+        value = Fraction(0)
+        for exps, c in poly.terms.items():
+            term = Fraction(c)
+            for w, e in zip(ws, exps):
+                term *= w ** e
+            value += term
+        assert value == coefficient
+
+
+def test_disk_cache_round_trip(monkeypatch):
+    expected = todd.compute_td(4, 3)
+    assert todd_precalc.load(4, 3) is None
+    assert todd.td_coefficients(4, 3) == expected
+    assert todd_precalc.cache_path(4, 3).exists()
+    assert todd_precalc.load(4, 3) == expected
+
+    # A new session reads the class from disk
+    monkeypatch.setattr(todd, "_coefficients", {})
+    monkeypatch.setattr(todd, "compute_td", None)
+    assert todd.td_coefficients(4, 3) == expected
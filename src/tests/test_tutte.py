@@ -0,0 +1,140 @@
+import os
+
+import networkx as nx
+import pytest
+import sympy
+
+from backend import critical, ehrhart, graph_utils, tutte
+from backend.graph_utils import CompactGraph
+
+x, y = tutte.x, tutte.y
+
+# Example graphs: name -> graph generator
+GRAPHS = {
+    "single_edge": graph_utils.get_single_edge,
+    "bamboo_len_2": graph_utils.get_bamboo_len_2,
+    "triangle": graph_utils.get_triangle,
+    "triangle_with_tail": graph_utils.get_triangle_with_tail,
+    "H": graph_utils.get_H,
+    "multiedge(3)": lambda: graph_utils.get_multiedge(3),
+    "multiedge(5)": lambda: graph_utils.get_multiedge(5),
+    "cycle(5)": lambda: graph_utils.get_cycle(5),
+    "wheel(4)": lambda: graph_utils.get_wheel(4),
+    "grid(2, 3)": lambda: graph_utils.get_grid(2, 3),
+}
+
+# Values computed before the Tutte engine, critical and Ehrhart polynomials
+EXPECTED = {
+    "single_edge": ("1", "x"),
+    "bamboo_len_2": ("1", "x**2"),
+    "triangle": ("x + 2", "x**2 + x + 1 + 1/x"),
+    "triangle_with_tail": ("x + 2", "x**4 + x**3 + x**2 + x"),
+    "H": ("1", "x**5"),
+}
+
+# Values which changed with the Tutte engine. Parallel edges were
+# collapsed before, so multiedge(3) got "1" and "x" of a single edge
+CORRECTED = {
+    "multiedge(3)": ("x**2 + x + 1", "x + 2 + 3/x + x**(-2)"),
+}
+
+
+def edge_list(name):
+    _, _, g = GRAPHS[name]()
+    return [(edge.begin, edge.end) for edge in CompactGraph.from_graph(g).edges]
+
+
+def reference(edges):
+    """
+    Tutte polynomial computed by networkx, parallel edges are kept
+    :param edges: edges as pairs of vertices
+    :return: Tutte polynomial in x and y
+    """
+    G = nx.MultiGraph()
+    G.add_edges_from(edges)
+    return nx.tutte_polynomial(G).subs(
+        {sympy.Symbol("x"): x, sympy.Symbol("y"): y}, simultaneous=True
+    )
+
+
+def same(a, b):
+    return sympy.simplify(sympy.expand(a - b)) == 0
+
+
+@pytest.fixture(autouse=True)
+def cold_cache():
+    tutte.cache.clear()
+    tutte.canonical_block_tutte.cache_clear()
+    yield
+
+
+@pytest.mark.parametrize("name", list(GRAPHS))
+def test_tutte_matches_networkx(name):
+    edges = edge_list(name)
+    assert same(tutte.tutte_of_edges(edges).as_expr([x, y]), reference(edges))
+
+
+@pytest.mark.parametrize("edges", [
+    [(0, 0)],
+    [(0, 1), (1, 1), (1, 1)],
+    [(0, 1), (0, 1), (1, 2), (1, 2), (2, 0)],
+    [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2), (0, 2), (1, 3)],
+    [(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 2), (4, 4)],
+])
+def test_multigraph_tutte_matches_networkx(edges):
+    assert same(tutte.tutte_of_edges(edges).as_expr([x, y]), reference(edges))
+
+
+@pytest.mark.parametrize("name", list(GRAPHS))
+def test_specializations_match_networkx(name):
+    n, m, g = GRAPHS[name]()
+    t = reference(edge_list(name))
+    assert same(critical.build(n, m, g), t.subs({x: 1, y: x}, simultaneous=True))
+    assert same(
+        ehrhart.build(n, m, g), t.subs({y: 1 + 1 / x}, simultaneous=True)
+    )
+
+
+@pytest.mark.parametrize("name", list(EXPECTED) + list(CORRECTED))
+def test_specializations_match_known_values(name):
+    n, m, g = GRAPHS[name]()
+    critical_value, ehrhart_value = {**EXPECTED, **CORRECTED}[name]
+    assert same(critical.build(n, m, g), sympy.sympify(critical_value))
+    assert same(ehrhart.build(n, m, g), sympy.sympify(ehrhart_value))
+
+
+@pytest.mark.parametrize("name", list(GRAPHS))
+def test_specialization_of_cached_tutte(name):
+    n, m, g = GRAPHS[name]()
+    direct = critical.build(n, m, g), ehrhart.build(n, m, g)
+    tutte.cache.clear()
+    tutte.tutte_polynomial(CompactGraph.from_graph(g))
+    assert (critical.build(n, m, g), ehrhart.build(n, m, g)) == direct
+
+
+def test_disk_cache_prunes_outdated_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(tutte.cache, "directory", None)
+    tutte.enable_disk_cache(tmp_path)
+    for name in ("triangle", "H"):
+        _, _, g = GRAPHS[name]()
+        tutte.tutte_polynomial(CompactGraph.from_graph(g))
+    old, recent = sorted(tmp_path.glob("*.json"))
+    os.utime(old, (0, 0))
+    tutte.enable_disk_cache(tmp_path)
+    assert list(tmp_path.glob("*.json")) == [recent]
+
+
+def test_specializations_share_evaluation(monkeypatch):
+    n, m, g = graph_utils.get_grid(3, 3)
+    calls = []
+    evaluate = tutte.tutte_of_edges
+    monkeypatch.setattr(
+        tutte, "tutte_of_edges",
+        lambda edges, spec=tutte.TUTTE: calls.append(spec) or evaluate(edges, spec),
+    )
+    critical.build(n, m, g)
+    ehrhart.build(n, m, g)
+    # One pass of deletion-contraction for both, with recursive calls,
+    # and no bivariate polynomial
+    assert calls and all(spec is tutte.SHARED for spec in calls)
+    assert sorted(key[0] for key in tutte.cache.entries) == ["critical", "ehrhart"]
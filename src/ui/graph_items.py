@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QPen, QBrush
+from PyQt5.QtWidgets import (
+    QGraphicsEllipseItem,
+    QGraphicsLineItem,
+    QGraphicsRectItem,
+    QGraphicsSimpleTextItem,
+)
+
+from ui.utils import Node, Edge
+
+
+class NodeItem(QGraphicsEllipseItem):
+    """
+    Scene item of a node: circle with node name, centered at item position
+    """
+    def __init__(self, node: Node, radius: float):
+        """
+        Constructor for node item
+        :param node: node to show
+        :param radius: circle radius in pixels
+        """
+        super().__init__(-radius, -radius, 2 * radius, 2 * radius)
+        self.node = node
+        self.setPen(QPen(QColor(Qt.black), 3, Qt.SolidLine))
+        self.setBrush(QBrush(QColor(Qt.white)))
+        # Nodes are drawn over edges
+        self.setZValue(1)
+        self.label = QGraphicsSimpleTextItem(self)
+        self.update_label()
+
+    def update_label(self):
+        """
+        Show current node name
+        :return: None
+        """
+        self.label.setText(self.node.name)
+        rect = self.label.boundingRect()
+        self.label.setPos(-rect.width() / 2, -rect.height() / 2)
+
+    def update_position(self, width: float, height: float):
+        """
+        Move item to node position
+        :param width: width of area in pixels
+        :param height: height of area in pixels
+        :return: None
+        """
+        self.setPos(self.node.x * width, self.node.y * height)
+
+    def set_selected(self, selected: bool):
+        """
+        Highlight selected node
+        :param selected: True if node is selected
+        :return: None
+        """
+        color = QColor(Qt.gray) if selected else QColor(Qt.white)
+        self.setBrush(QBrush(color))
+
+
+class EdgeItem(QGraphicsLineItem):
+    """
+    Scene item of an edge: line between nodes with a boxed label
+    "e_<name>" in the middle
+    """
+    def __init__(self, edge: Edge):
+        """
+        Constructor for edge item
+        :param edge: edge to show
+        """
+        super().__init__()
+        self.edge = edge
+        self.setPen(QPen(QColor(Qt.black), 2, Qt.SolidLine))
+        self.box = QGraphicsRectItem(self)
+        self.box.setPen(QPen(QColor(Qt.black), 1, Qt.SolidLine))
+        self.box.setBrush(QBrush(QColor(Qt.white)))
+        self.label = QGraphicsSimpleTextItem(self.box)
+
+    def update_geometry(self, width: float, height: float):
+        """
+        Move item to positions of edge ends, and show current edge name
+        :param width: width of area in pixels
+        :param height: height of area in pixels
+        :return: None
+        """
+        edge = self.edge
+        self.setLine(
+            edge.node1.x * width,
+            edge.node1.y * height,
+            edge.node2.x * width,
+            edge.node2.y * height,
+        )
+        posx = (edge.node1.x + edge.node2.x) / 2 * width
+        posy = (edge.node1.y + edge.node2.y) / 2 * height
+        name = f"e_{edge.name}"
+        box_width = len(name) * 10
+        self.box.setRect(posx - box_width // 2, posy - 10, box_width, 20)
+        self.label.setText(name)
+        rect = self.label.boundingRect()
+        self.label.setPos(posx - rect.width() / 2, posy - rect.height() / 2)
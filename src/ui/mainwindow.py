@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Optional, Callable
+from typing import Optional
 
-from PyQt5.QtCore import Qt, QPoint
-from PyQt5.QtGui import QColor, QPen, QBrush, QPainter, QMouseEvent
+from PyQt5.QtCore import Qt, QPoint, QRectF, pyqtSignal
+from PyQt5.QtGui import QColor, QBrush, QPainter, QMouseEvent
 from PyQt5.QtWidgets import (
     QMainWindow,
     QToolBar,
     QActionGroup,
     QAction,
-    QFrame,
+    QGraphicsScene,
+    QGraphicsView,
     QDialog,
     QFileDialog,
     QVBoxLayout,
@@ -19,10 +20,17 @@ from PyQt5.QtWidgets import (
     QDialogButtonBox,
 )
 
-from backend import graph_utils, pc_polynomial, critical, ehrhart
+from backend import graph_io
+from backend.scheduler import Scheduler
+from ui.graph_items import NodeItem, EdgeItem
 from ui.polynomial_show import PolynomialShowWindow
 from ui.utils import Node, Edge
 
+# Text .graph files and their compact binary variant
+GRAPH_FILES_FILTER = (
+    f"Graph files (*.graph *{graph_io.BINARY_SUFFIX});;All files (*)"
+)
+
 
 class ChangeNodeIdDialog(QDialog):
     def __init__(self, parent, node_name):
@@ -113,6 +121,8 @@ class Window(QMainWindow):
 
         self.setGeometry(100, 100, 1280, 720)
 
+        # Shared by all polynomial windows, equal requests are computed once
+        self.scheduler = Scheduler()
         self.graph_area = GraphArea(self)
 
         self.setCentralWidget(self.graph_area)
@@ -159,23 +169,18 @@ class Window(QMainWindow):
             ("Открыть", self.graph_area.load),
             (
                 "PC-многочлен",
-                lambda: self.graph_area.count_polynomial(
-                    "PC-многочлен",
-                    pc_polynomial.build
-                )
+                lambda: self.graph_area.count_polynomial("PC-многочлен", "pc"),
             ),
             (
                 "Critical configuration многочлен",
                 lambda: self.graph_area.count_polynomial(
-                    "Critical configuration многочлен",
-                    critical.build
+                    "Critical configuration многочлен", "critical"
                 ),
             ),
             (
                 "Многочлен Эрхарта",
                 lambda: self.graph_area.count_polynomial(
-                    "Многочлен Эрхарта",
-                    ehrhart.build
+                    "Многочлен Эрхарта", "ehrhart"
                 ),
             ),
         ]
@@ -192,18 +197,42 @@ class Window(QMainWindow):
             self.mode = None
         self.graph_area.on_mode_update(mode)
 
+    def closeEvent(self, event):
+        # Running jobs are cancelled and worker processes are stopped
+        self.scheduler.shutdown()
+        super().closeEvent(event)
+
 
-class GraphArea(QFrame):
+class GraphArea(QGraphicsView):
     NODE_RADIUS = 20
 
+    # New version of the graph, emitted when get_graph would return
+    # another graph. Moves and renames keep the version
+    graph_changed = pyqtSignal(int)
+
     def __init__(self, parent: QMainWindow):
         super(GraphArea, self).__init__(parent)
 
         self.nodes: list[Node] = []
         self.edges: list[Edge] = []
-        self.setStyleSheet("background-color: white")
-
-        self.selected_node: Optional[Node] = None
+        self.version = 0
+        # Retained-mode canvas: items repaint only their own regions,
+        # and the scene answers point queries with a BSP tree
+        self.graph_scene = QGraphicsScene(self)
+        self.graph_scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.setScene(self.graph_scene)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setRenderHint(QPainter.Antialiasing)
+        self.setBackgroundBrush(QBrush(QColor(Qt.white)))
+        # Items by id of node or edge, edges incident to node by id of node
+        self.node_items: dict[int, NodeItem] = {}
+        self.edge_items: dict[int, EdgeItem] = {}
+        self.incident: dict[int, list[Edge]] = {}
+
+        self._selected_node: Optional[Node] = None
         self.last_pos = QPoint()
         self.setFocusPolicy(Qt.StrongFocus)
 
@@ -211,81 +240,68 @@ class GraphArea(QFrame):
     def node_radius() -> float:
         return GraphArea.NODE_RADIUS
 
-    def draw_node(self, painter, node: Node):
-        node_radius = int(self.node_radius())
-        color = (
-            QColor(Qt.gray) if node == self.selected_node else QColor(Qt.white)
-        )
-        painter.setPen(QPen(QColor(Qt.black), 3, Qt.SolidLine))
-        painter.setBrush(QBrush(color))
-        painter.drawEllipse(
-            int(node.x * self.width() - node_radius),
-            int(node.y * self.height() - node_radius),
-            int(node_radius * 2),
-            int(node_radius * 2),
-        )
-        painter.setPen(QPen(QColor(Qt.black), 1, Qt.SolidLine))
-        painter.drawText(
-            int(node.x * self.width() - node_radius),
-            int(node.y * self.height() - node_radius),
-            int(node_radius * 2),
-            int(node_radius * 2),
-            Qt.AlignCenter,
-            node.name,
+    def graph_modified(self):
+        """
+        Bump version of the graph after a user action changed its
+        nodes or edges
+        :return: None
+        """
+        self.version += 1
+        self.graph_changed.emit(self.version)
+
+    def area_width(self) -> int:
+        return self.viewport().width()
+
+    def area_height(self) -> int:
+        return self.viewport().height()
+
+    @property
+    def selected_node(self) -> Optional[Node]:
+        return self._selected_node
+
+    @selected_node.setter
+    def selected_node(self, node: Optional[Node]):
+        if self._selected_node is not None:
+            item = self.node_items.get(id(self._selected_node))
+            if item is not None:
+                item.set_selected(False)
+        self._selected_node = node
+        if node is not None:
+            self.node_items[id(node)].set_selected(True)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.graph_scene.setSceneRect(
+            0, 0, self.area_width(), self.area_height()
         )
-
-        self.update()
-
-    def draw_edge(self, painter, edge: Edge):
-        painter.setPen(QPen(QColor(Qt.black), 2, Qt.SolidLine))
-        painter.drawLine(
-            int(edge.node1.x * self.width()),
-            int(edge.node1.y * self.height()),
-            int(edge.node2.x * self.width()),
-            int(edge.node2.y * self.height()),
-        )
-
-        painter.setPen(QPen(QColor(Qt.black), 1, Qt.SolidLine))
-        posx = (edge.node1.x + edge.node2.x) / 2
-        posy = (edge.node1.y + edge.node2.y) / 2
-        name = f"e_{edge.name}"
-        width = len(name) * 10
-        painter.setBrush(QBrush(QColor(Qt.white)))
-        painter.drawRect(
-            int(posx * self.width() - width // 2),
-            int(posy * self.height() - 10),
-            width,
-            20,
-        )
-        painter.drawText(
-            int(posx * self.width() - width // 2),
-            int(posy * self.height() - 10),
-            width,
-            20,
-            Qt.AlignCenter,
-            name,
-        )
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        for edge in self.edges:
-            self.draw_edge(painter, edge)
-        for node in self.nodes:
-            self.draw_node(painter, node)
-        self.update()
+        self.update_items(self.nodes)
+
+    def update_items(self, nodes: list[Node]):
+        """
+        Move items of nodes and their incident edges to node positions
+        :param nodes: moved nodes
+        :return: None
+        """
+        width, height = self.area_width(), self.area_height()
+        edges = {}
+        for node in nodes:
+            self.node_items[id(node)].update_position(width, height)
+            for edge in self.incident[id(node)]:
+                edges[id(edge)] = edge
+        for edge_id in edges:
+            self.edge_items[edge_id].update_geometry(width, height)
 
     def clicked_on_node(self, node, event):
         node_radius = self.node_radius()
-        return (node.x * self.width() - event.x()) ** 2 + (
-            node.y * self.height() - event.y()
+        return (node.x * self.area_width() - event.x()) ** 2 + (
+            node.y * self.area_height() - event.y()
         ) ** 2 <= node_radius ** 2
 
     def clicked_on_edge(self, edge, event):
         delta = 0.01
         x1, y1 = edge.node1.x, edge.node1.y
         x2, y2 = edge.node2.x, edge.node2.y
-        x, y = event.x() / self.width(), event.y() / self.height()
+        x, y = event.x() / self.area_width(), event.y() / self.area_height()
 
         v1x = x1 - x
         v1y = y1 - y
@@ -301,21 +317,61 @@ class GraphArea(QFrame):
         ) ** 0.5
         return abs(dist_to_line) < delta
 
+    def node_at(self, event: QMouseEvent) -> Optional[Node]:
+        """
+        Find node under cursor with the scene index
+        :param event: mouse event
+        :return: node, or None if there is no node under cursor
+        """
+        pos = self.mapToScene(event.pos())
+        r = self.node_radius()
+        for item in self.graph_scene.items(
+            QRectF(pos.x() - r, pos.y() - r, 2 * r, 2 * r)
+        ):
+            if isinstance(item, NodeItem) and self.clicked_on_node(item.node, event):
+                return item.node
+        return None
+
+    def edge_at(self, event: QMouseEvent) -> Optional[Edge]:
+        """
+        Find edge under cursor with the scene index
+        :param event: mouse event
+        :return: edge, or None if there is no edge under cursor
+        """
+        pos = self.mapToScene(event.pos())
+        # Tolerance of clicked_on_edge, in pixels along each axis
+        dx, dy = 0.01 * self.area_width(), 0.01 * self.area_height()
+        for item in self.graph_scene.items(
+            QRectF(pos.x() - dx, pos.y() - dy, 2 * dx, 2 * dy)
+        ):
+            if isinstance(item, EdgeItem) and self.clicked_on_edge(item.edge, event):
+                return item.edge
+        return None
+
     def delete_node(self, node: Node):
+        if node == self.selected_node:
+            self.selected_node = None
+        for edge in list(self.incident[id(node)]):
+            self.delete_edge(edge)
         self.nodes.remove(node)
-        self.edges = list(
-            filter(lambda x: x.node1 != node and x.node2 != node, self.edges)
-        )
+        self.graph_scene.removeItem(self.node_items.pop(id(node)))
+        del self.incident[id(node)]
+
+    def delete_edge(self, edge: Edge):
+        self.edges.remove(edge)
+        self.graph_scene.removeItem(self.edge_items.pop(id(edge)))
+        for node in {id(edge.node1): edge.node1, id(edge.node2): edge.node2}.values():
+            self.incident[id(node)].remove(edge)
 
     def get_vacant_node_name(self) -> str:
-        names = [node.name for node in self.nodes]
+        names = {node.name for node in self.nodes}
         i = 0
         while str(i) in names:
             i += 1
         return str(i)
 
     def get_vacant_edge_name(self) -> str:
-        names = [edge.name for edge in self.edges]
+        names = {edge.name for edge in self.edges}
         i = 0
         while str(i) in names:
             i += 1
@@ -326,6 +382,11 @@ class GraphArea(QFrame):
             name = self.get_vacant_node_name()
         node = Node(x, y, name)
         self.nodes.append(node)
+        self.incident[id(node)] = []
+        item = NodeItem(node, self.node_radius())
+        item.update_position(self.area_width(), self.area_height())
+        self.node_items[id(node)] = item
+        self.graph_scene.addItem(item)
         return node
 
     def add_edge(self, node1: Node, node2: Node, name: Optional[str] = None) -> Edge:
@@ -333,77 +394,89 @@ class GraphArea(QFrame):
             name = self.get_vacant_edge_name()
         edge = Edge(node1, node2, name)
         self.edges.append(edge)
+        self.incident[id(node1)].append(edge)
+        if node2 is not node1:
+            self.incident[id(node2)].append(edge)
+        item = EdgeItem(edge)
+        item.update_geometry(self.area_width(), self.area_height())
+        self.edge_items[id(edge)] = item
+        self.graph_scene.addItem(item)
         return edge
 
     def pressed_left_button(self, event: QMouseEvent):
         match self.parent().mode:
             case Window.Modes.ADD_NODE:
                 self.add_node(
-                    event.x() / self.width(), event.y() / self.height()
+                    event.x() / self.area_width(), event.y() / self.area_height()
                 )
+                self.graph_modified()
                 return
             case Window.Modes.DELETE_NODE:
-                for node in self.nodes:
-                    if self.clicked_on_node(node, event):
-                        self.delete_node(node)
-                        return
+                node = self.node_at(event)
+                if node is not None:
+                    self.delete_node(node)
+                    self.graph_modified()
             case Window.Modes.ADD_EDGE:
-                for i, node in enumerate(self.nodes):
-                    if self.clicked_on_node(node, event):
-                        if self.selected_node is not None:
-                            if node != self.selected_node:
-                                self.add_edge(self.selected_node, node)
-                            self.selected_node = None
-                        else:
-                            self.selected_node = node
-                        return
+                node = self.node_at(event)
+                if node is not None:
+                    if self.selected_node is not None:
+                        if node != self.selected_node:
+                            self.add_edge(self.selected_node, node)
+                            self.graph_modified()
+                        self.selected_node = None
+                    else:
+                        self.selected_node = node
             case Window.Modes.DELETE_EDGE:
-                for edge in self.edges:
-                    if self.clicked_on_edge(edge, event):
-                        self.edges.remove(edge)
-                        return
+                edge = self.edge_at(event)
+                if edge is not None:
+                    self.delete_edge(edge)
+                    self.graph_modified()
             case Window.Modes.MOVE:
-                for node in self.nodes:
-                    if self.clicked_on_node(node, event):
-                        self.selected_node = node
-                        return
+                node = self.node_at(event)
+                if node is not None:
+                    self.selected_node = node
                 else:
                     self.last_pos = event.pos()
 
     def rename_node(self, node: Node, name: str):
         node.name = name
+        self.node_items[id(node)].update_label()
         for other_node in self.nodes:
             if node == other_node:
                 continue
             if other_node.name == name:
                 other_node.name = self.get_vacant_node_name()
+                self.node_items[id(other_node)].update_label()
 
     def rename_edge(self, edge: Edge, name: str):
+        width, height = self.area_width(), self.area_height()
         edge.name = name
+        self.edge_items[id(edge)].update_geometry(width, height)
         for other_edge in self.edges:
             if edge == other_edge:
                 continue
             if other_edge.name == name:
                 other_edge.name = self.get_vacant_edge_name()
+                self.edge_items[id(other_edge)].update_geometry(width, height)
 
     def pressed_right_button(self, event: QMouseEvent):
-        for node in self.nodes:
-            if self.clicked_on_node(node, event):
-                dialog = ChangeNodeIdDialog(self, node.name)
-                result = dialog.exec_()
-                if result == QDialog.Accepted:
-                    new_name = dialog.get_node_name()
-                    self.rename_node(node, new_name)
-                return
-
-        for edge in self.edges:
-            if self.clicked_on_edge(edge, event):
-                dialog = ChangeEdgeIdDialog(self, edge.name)
-                result = dialog.exec_()
-                if result == QDialog.Accepted:
-                    new_name = dialog.get_edge_name()
-                    self.rename_edge(edge, new_name)
-                return
+        node = self.node_at(event)
+        if node is not None:
+            dialog = ChangeNodeIdDialog(self, node.name)
+            result = dialog.exec_()
+            if result == QDialog.Accepted:
+                new_name = dialog.get_node_name()
+                self.rename_node(node, new_name)
+            return
+
+        edge = self.edge_at(event)
+        if edge is not None:
+            dialog = ChangeEdgeIdDialog(self, edge.name)
+            result = dialog.exec_()
+            if result == QDialog.Accepted:
+                new_name = dialog.get_edge_name()
+                self.rename_edge(edge, new_name)
+            return
 
     def mousePressEvent(self, event: QMouseEvent):
         if event.button() == Qt.LeftButton:
@@ -411,102 +484,93 @@ class GraphArea(QFrame):
         if event.button() == Qt.RightButton:
             self.pressed_right_button(event)
 
-        self.update()
-
     def on_mode_update(self, _: Window.Modes):
         self.selected_node = None
 
     def mouseMoveEvent(self, event: QMouseEvent):
         if self.parent().mode == Window.Modes.MOVE:
+            width, height = self.area_width(), self.area_height()
             if self.selected_node is not None:
-                self.selected_node.x = event.x() / self.width()
-                self.selected_node.y = event.y() / self.height()
+                self.selected_node.x = event.x() / width
+                self.selected_node.y = event.y() / height
                 self.selected_node.x = min(1.0, max(0.0, self.selected_node.x))
                 self.selected_node.y = min(1.0, max(0.0, self.selected_node.y))
+                self.update_items([self.selected_node])
             else:
                 for node in self.nodes:
-                    node.x += (event.x() - self.last_pos.x()) / self.width()
-                    node.y += (event.y() - self.last_pos.y()) / self.height()
+                    node.x += (event.x() - self.last_pos.x()) / width
+                    node.y += (event.y() - self.last_pos.y()) / height
                     node.x = min(1.0, max(0.0, node.x))
                     node.y = min(1.0, max(0.0, node.y))
                 self.last_pos = event.pos()
-        self.update()
+                self.update_items(self.nodes)
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         if self.parent().mode == Window.Modes.MOVE:
             self.selected_node = None
 
+    def mouseDoubleClickEvent(self, event: QMouseEvent):
+        # Double click is two presses for the editor
+        self.mousePressEvent(event)
+
     def clear(self):
+        self.remove_all()
+        self.graph_modified()
+
+    def remove_all(self):
+        """
+        Remove all nodes and edges without bumping version of the graph,
+        for callers which put a new graph in place and bump it once
+        :return: None
+        """
+        self.selected_node = None
         self.nodes.clear()
         self.edges.clear()
-        self.update()
+        self.node_items.clear()
+        self.edge_items.clear()
+        self.incident.clear()
+        self.graph_scene.clear()
 
     def save(self):
         dialog = QFileDialog()
         dialog.setFileMode(QFileDialog.AnyFile)
         dialog.setAcceptMode(QFileDialog.AcceptSave)
         dialog.setOption(QFileDialog.DontUseNativeDialog, True)
-        dialog.setNameFilter("Graph files (*.graph);;All files (*)")
+        dialog.setNameFilter(GRAPH_FILES_FILTER)
         dialog.setDefaultSuffix("graph")
         if dialog.exec_() == QDialog.Accepted:
-            with open(dialog.selectedFiles()[0], "w") as file:
-                file.write(self.get_graph_string())
-
-    def get_graph_string(self):
-        graph_string = ""
-        graph_string += str(len(self.nodes)) + " " + str(len(self.edges)) + "\n"
-        for node in self.nodes:
-            graph_string += node.get_node_string() + "\n"
-        for edge in self.edges:
-            graph_string += edge.get_edge_string() + "\n"
-        return graph_string
+            graph_io.write_layout(dialog.selectedFiles()[0], *self.get_layout())
+
+    def get_layout(self) -> graph_io.Layout:
+        node_to_index = {id(node): i for i, node in enumerate(self.nodes)}
+        nodes = [(node.x, node.y, node.name) for node in self.nodes]
+        edges = [
+            (node_to_index[id(edge.node1)], node_to_index[id(edge.node2)], edge.name)
+            for edge in self.edges
+        ]
+        return nodes, edges
 
     def load(self):
         dialog = QFileDialog()
         dialog.setFileMode(QFileDialog.ExistingFile)
         dialog.setOption(QFileDialog.DontUseNativeDialog, True)
         dialog.setAcceptMode(QFileDialog.AcceptOpen)
-        dialog.setNameFilter("Graph files (*.graph);;All files (*)")
+        dialog.setNameFilter(GRAPH_FILES_FILTER)
         dialog.setDefaultSuffix("graph")
 
         if dialog.exec_() == QDialog.Accepted:
-            with open(dialog.selectedFiles()[0], "r") as file:
-                self.clear()
-                lines = file.readlines()
-                num_nodes, num_edges = map(int, lines[0].split())
-                for i in range(1, num_nodes + 1):
-                    node = Node.from_string(lines[i])
-                    self.nodes.append(node)
-                for i in range(num_nodes + 1, num_nodes + num_edges + 1):
-                    source, target, name = map(str, lines[i].split())
-                    source_node = next(
-                        node for node in self.nodes if node.name == source
-                    )
-                    target_node = next(
-                        node for node in self.nodes if node.name == target
-                    )
-                    self.edges.append(Edge(source_node, target_node, name))
-            self.update()
+            nodes, edges = graph_io.read_layout(dialog.selectedFiles()[0])
+            self.remove_all()
+            added = [self.add_node(x, y, name) for x, y, name in nodes]
+            for source, target, name in edges:
+                self.add_edge(added[source], added[target], name)
+            self.graph_modified()
 
     def get_graph(self):
-        n, m = len(self.nodes), len(self.edges)
-        g = graph_utils.Graph()
-        node_name_to_index = {}
-
-        for i, node in enumerate(self.nodes):
-            node_name_to_index[node.name] = i
-
-        ts = graph_utils.get_symbols(len(self.edges))
-        for edge, t in zip(self.edges, ts):
-            g.add_edge(
-                graph_utils.Edge(
-                    node_name_to_index[edge.node1.name],
-                    node_name_to_index[edge.node2.name],
-                    t,
-                )
-            )
-        return n, m, g
+        return graph_io.layout_to_graph(*self.get_layout())
 
-    def count_polynomial(self, name: str, counting_function: Callable):
-        polynomial_window = PolynomialShowWindow(self, name, counting_function)
+    def count_polynomial(self, name: str, kind: str):
+        polynomial_window = PolynomialShowWindow(
+            self, name, kind, self.parent().scheduler
+        )
         polynomial_window.show()
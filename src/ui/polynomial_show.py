@@ -1,32 +1,61 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import Any, Optional
 
+from PyQt5.QtCore import pyqtSignal
 from PyQt5.QtWidgets import (
     QMainWindow,
     QTextEdit,
     QPushButton,
     QFileDialog,
     QDialog,
+    QProgressBar,
+    QCheckBox,
 )
 
 import backend.pc_polynomial
-from ui.utils import AThread
+from backend.progress import Cancelled
+from backend.scheduler import Scheduler, Subscription
+
+# Steps of progress bar
+PROGRESS_STEPS = 1000
+
+
+def format_seconds(seconds: float) -> str:
+    """
+    Format duration for showing
+    :param seconds: number of seconds
+    :return: duration as "h:mm:ss"
+    """
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds // 60 % 60:02}:{seconds % 60:02}"
 
 
 class PolynomialShowWindow(QMainWindow):
-    def __init__(self, parent, name: str, counting_function: Callable):
+    # Fraction done and remaining seconds, emitted from scheduler threads
+    progressed = pyqtSignal(object, object)
+    # Success and result or exception, emitted from scheduler threads
+    computed = pyqtSignal(bool, object)
+
+    def __init__(self, parent, name: str, kind: str, scheduler: Scheduler):
         super().__init__(parent)
         self.polynomial = None
-        self.counting_function = counting_function
+        self.kind = kind
+        self.scheduler = scheduler
         self.name = name
+        self.subscription: Optional[Subscription] = None
+        # Version of the graph the last computation was started for
+        self.version: Optional[int] = None
+        self.progressed.connect(self.show_progress)
+        self.computed.connect(self.after_calculate)
+        parent.graph_changed.connect(self.on_graph_changed)
 
         self.initUI()
 
     def initUI(self):
         self.setWindowTitle(f"Подсчёт: {self.name}")
-        self.setGeometry(300, 300, 300, 200)
-        self.setMinimumSize(280, 200)
+        self.setGeometry(300, 300, 300, 230)
+        self.setMinimumSize(280, 230)
         self.text_edit = QTextEdit(self)
         self.text_edit.setGeometry(10, 10, 280, 100)
         self.button_calculate = QPushButton("Вычислить", self)
@@ -37,27 +66,93 @@ class PolynomialShowWindow(QMainWindow):
         self.button_save.move(120, 120)
         self.button_save.clicked.connect(self.save)
         self.button_save.setEnabled(False)
+
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setGeometry(10, 160, 170, 25)
+        self.progress_bar.setRange(0, PROGRESS_STEPS)
+        self.progress_bar.setValue(0)
+        self.button_cancel = QPushButton("Отмена", self)
+        self.button_cancel.move(190, 158)
+        self.button_cancel.clicked.connect(self.cancel)
+        self.button_cancel.setEnabled(False)
+        self.checkbox_pin = QCheckBox("Не отменять при изменении графа", self)
+        self.checkbox_pin.setGeometry(10, 195, 280, 25)
         self.show()
 
     def resizeEvent(self, event):
         h, w = self.height(), self.width()
         self.text_edit.setGeometry(10, 10, w - 20, 100)
+        self.progress_bar.setGeometry(10, 160, w - 130, 25)
+        self.button_cancel.move(w - 110, 158)
+        self.checkbox_pin.setGeometry(10, 195, w - 20, 25)
 
     def calculate(self):
         n, m, g = self.parent().get_graph()
+        self.version = self.parent().version
+        self.setWindowTitle(f"Подсчёт: {self.name}")
         self.text_edit.setText("Идёт вычисление...")
-        thread = AThread(self, self.counting_function, n, m, g)
-        thread.finished.connect(lambda: self.after_calculate(thread))
-        thread.start()
+        self.progress_bar.setRange(0, PROGRESS_STEPS)
+        self.progress_bar.setValue(0)
+        self.progress_bar.resetFormat()
+        self.button_calculate.setEnabled(False)
+        self.button_cancel.setEnabled(True)
+        try:
+            # Joins an equal computation in flight, if there is one.
+            # If the graph was computed before, the result comes at once
+            self.subscription = self.scheduler.submit(
+                self.kind, n, m, g, self.computed.emit, self.progressed.emit
+            )
+        except Exception:
+            self.after_calculate(False, None)
+
+    def cancel(self):
+        if self.subscription is not None:
+            self.text_edit.setText("Отмена вычисления...")
+            self.button_cancel.setEnabled(False)
+            self.subscription.cancel()
 
-    def after_calculate(self, thread: AThread):
-        if thread.ok:
-            self.polynomial = thread.result
+    def on_graph_changed(self, version: int):
+        if version == self.version:
+            return
+        if self.subscription is not None and not self.checkbox_pin.isChecked():
+            # Result for a graph which no longer exists is not needed
+            self.cancel()
+            self.text_edit.setText("Граф изменён, вычисление отменено")
+
+    def show_progress(self, fraction: Optional[float], remaining: Optional[float]):
+        if fraction is None:
+            # Unknown amount of work, busy indicator
+            self.progress_bar.setRange(0, 0)
+            return
+        self.progress_bar.setRange(0, PROGRESS_STEPS)
+        self.progress_bar.setValue(int(fraction * PROGRESS_STEPS))
+        if remaining is None or fraction >= 1:
+            self.progress_bar.resetFormat()
+        else:
+            self.progress_bar.setFormat(
+                f"%p% (осталось {format_seconds(remaining)})"
+            )
+
+    def after_calculate(self, ok: bool, result: Any):
+        self.subscription = None
+        self.button_calculate.setEnabled(True)
+        self.button_cancel.setEnabled(False)
+        if ok:
+            self.polynomial = result
             self.show_polynomial()
             self.button_save.setEnabled(True)
+            if self.version != self.parent().version:
+                self.setWindowTitle(f"Подсчёт: {self.name} (прежняя версия графа)")
+        elif isinstance(result, Cancelled):
+            self.show_cancelled()
         else:
             self.show_error()
 
+    def closeEvent(self, event):
+        # Closed window does not need its computation
+        self.cancel()
+        super().closeEvent(event)
+
     def show_polynomial(self):
         poly_string = backend.pc_polynomial.prepare_for_showing(self.polynomial)
         self.text_edit.setText(poly_string)
@@ -65,6 +160,12 @@ class PolynomialShowWindow(QMainWindow):
     def show_error(self):
         self.text_edit.setText("Ошибка!")
 
+    def show_cancelled(self):
+        self.progress_bar.setRange(0, PROGRESS_STEPS)
+        self.progress_bar.setValue(0)
+        self.progress_bar.resetFormat()
+        self.text_edit.setText("Вычисление отменено")
+
     def save(self):
         if not self.polynomial:
             return
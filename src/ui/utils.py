@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable, Any
-
-from PyQt5.QtCore import QThread
+from typing import Any
 
 
 class Node:
@@ -22,23 +20,6 @@ class Node:
         self.y = y
         self.name = name
 
-    def get_node_string(self) -> str:
-        """
-        Generate string for node saving
-        :return: string representing a node
-        """
-        return f"{self.x} {self.y} {self.name}"
-
-    @staticmethod
-    def from_string(string: str) -> Node:
-        """
-        Static method from node deserialization
-        :param string: string from mode deserialization
-        :return: Node
-        """
-        x, y, name = string.split()
-        return Node(float(x), float(y), name)
-
 
 class Edge:
     """
@@ -58,13 +39,6 @@ class Edge:
         self.node2 = node2
         self.name = name
 
-    def get_edge_string(self) -> str:
-        """
-        Generate string for edge saving
-        :return: string representing a edge
-        """
-        return f"{self.node1.name} {self.node2.name} {self.name}"
-
     def __eq__(self, other: Any) -> bool:
         """
         Equal operator
@@ -73,37 +47,3 @@ class Edge:
         True if ids of self and other are equal
         """
         return id(self) == id(other)
-
-
-class AThread(QThread):
-    """
-    A thread for subtask. Derived from PyQT QThread
-    """
-    def __init__(self, parent=None, function: Callable = None, *args, **kwargs):
-        """
-        Constructor for AThread. Used to set function and it's args
-        :param parent:
-        :param function: a function to calculate
-        :param args: function args
-        :param kwargs: function keyword args
-        """
-        super().__init__(parent)
-        self.function = function
-        self.args = args
-        self.kwargs = kwargs
-        self.result = None
-        self.ok = False
-
-    def run(self):
-        """
-        Start computing a function. If success, a result is stored
-        in Athread.result and Athread.ok is True. Else, exception is stored
-        in Athread.result, and Athread.ok is False.
-        :return: None
-        """
-        try:
-            self.result = self.function(*self.args, **self.kwargs)
-            self.ok = True
-        except Exception as e:
-            self.result = e
-            self.ok = False